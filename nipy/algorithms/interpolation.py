@@ -13,9 +13,12 @@ from scipy import ndimage
 class ImageInterpolator(object):
     """ Interpolate Image instance at arbitrary points in world space
     
-    The resampling is done with scipy.ndimage.
+    The resampling is done with scipy.ndimage.  The spline coefficients
+    of the image are computed once, when the interpolator is created, so
+    that the interpolator can be evaluated many times, or passed to
+    ``resample`` for each of many resamplings of the same image.
     """
-    def __init__(self, image, order=3):
+    def __init__(self, image, order=3, dtype=np.float64, spill_bytes=None):
         """
         Parameters
         ----------
@@ -24,40 +27,56 @@ class ImageInterpolator(object):
         order : int, optional
            order of spline interpolation as used in scipy.ndimage.
            Default is 3.
+        dtype : dtype, optional
+           dtype of the spline coefficients.  Default is float64;
+           float32 halves the memory used, at the cost of precision.
+        spill_bytes : None or int, optional
+           If None (the default), the coefficients are kept in memory.
+           Otherwise, coefficients larger than `spill_bytes` bytes are
+           kept in a memory mapped temporary file.
         """
         self.image = image
         self.order = order
+        self.dtype = np.dtype(dtype)
+        self.spill_bytes = spill_bytes
         self._datafile = None
         self._buildknots()
 
     def _buildknots(self):
-        if self.order > 1:
-            data = ndimage.spline_filter(
-                np.nan_to_num(np.asarray(self.image)),
-                self.order)
+        data = np.asarray(self.image)
+        # dtype of resampled images on the affine path of ``resample``
+        self.image_dtype = data.dtype.newbyteorder('=')
+        data = np.nan_to_num(data)
+        nbytes = data.size * self.dtype.itemsize
+        if self.spill_bytes is None or nbytes <= self.spill_bytes:
+            coefs = np.empty(data.shape, self.dtype)
         else:
-            data = np.nan_to_num(np.asarray(self.image))
-        if self._datafile is None:
-            _, fname = tempfile.mkstemp()
-            self._datafile = file(fname, mode='wb')
+            coefs = self._spill(data.shape)
+        if self.order > 1:
+            ndimage.spline_filter(data, self.order, output=coefs)
         else:
-            self._datafile = file(self._datafile.name, 'wb')
-        data = np.nan_to_num(data.astype(np.float64))
-        data.tofile(self._datafile)
-        datashape = data.shape
-        dtype = data.dtype
-        del(data)
-        self._datafile.close()
-        self._datafile = file(self._datafile.name)
-        self.data = np.memmap(self._datafile.name, dtype=dtype,
-                              mode='r+', shape=datashape)
+            coefs[:] = data
+        self.data = coefs
+
+    def _spill(self, shape):
+        """ Writeable memory map of a new temporary file """
+        fd, fname = tempfile.mkstemp()
+        os.close(fd)
+        data = np.memmap(fname, dtype=self.dtype, mode='w+', shape=shape)
+        # The map outlives the file name where the OS allows it, so that
+        # the file cannot be left behind
+        try:
+            os.remove(fname)
+        except OSError:
+            self._datafile = fname
+        return data
 
     def __del__(self):
         if self._datafile:
-            self._datafile.close()
+            self.data = None
             try:
-                os.remove(self._datafile.name)
-            except:
+                os.remove(self._datafile)
+            except OSError:
                 pass
 
     def evaluate(self, points):
@@ -80,9 +99,10 @@ class ImageInterpolator(object):
         cmapi = self.image.coordmap.inverse()
         voxels = cmapi(points.T).T
         V = ndimage.map_coordinates(self.data, 
-                                     voxels,
-                                     order=self.order,
-                                     prefilter=False)
+                                    voxels,
+                                    order=self.order,
+                                    prefilter=False,
+                                    output=np.float64)
         # ndimage.map_coordinates returns a flat array,
         # it needs to be reshaped to the original shape
         V.shape = output_shape
@@ -4,26 +4,79 @@
 Linear filter(s).  For the moment, only a Gaussian smoothing filter
 """
 
-import gc
-
 import numpy as np
 import numpy.fft as fft
 import numpy.linalg as npl
+from scipy import ndimage
 
 from nipy.core.api import Image, AffineTransform
-from nipy.core.reference.coordinate_map import product
+from nipy.core.reference.coordinate_map import drop_io_dim
+
+# Relative tolerance on the off-diagonal terms of the kernel's quadratic
+# form in voxel coordinates, for the kernel to be separable
+_SEPARABLE_TOL = 1.0e-10
+
+#: maximum number of bytes of kernels and kernel spectra kept in the
+#: kernel cache, shared by filters with the same geometry and kernel
+kernel_cache_bytes = 256 * 2**20
+
+_kernel_cache = {}
+# keys from least to most recently used, for dropping the oldest entries
+_kernel_keys = []
+
+
+def _entry_nbytes(entry):
+    nbytes = 0
+    for value in entry.values():
+        if isinstance(value, np.ndarray):
+            nbytes += value.nbytes
+        elif isinstance(value, list):
+            nbytes += sum([v.nbytes for v in value])
+    return nbytes
+
+
+def _kernel_cache_get(key):
+    entry = _kernel_cache[key]
+    _kernel_keys.remove(key)
+    _kernel_keys.append(key)
+    return entry
+
+
+def _kernel_cache_trim():
+    nbytes = sum([_entry_nbytes(_kernel_cache[key]) for key in _kernel_keys])
+    while _kernel_keys and nbytes > kernel_cache_bytes:
+        key = _kernel_keys.pop(0)
+        nbytes -= _entry_nbytes(_kernel_cache.pop(key))
+
+
+def _kernel_cache_set(key, entry):
+    _kernel_cache[key] = entry
+    _kernel_keys.append(key)
+    _kernel_cache_trim()
+
+
+def clear_kernel_cache():
+    """ Empty the cache of kernels and kernel spectra """
+    _kernel_cache.clear()
+    del _kernel_keys[:]
+
 
 class LinearFilter(object):
     '''
     A class to implement some FFT smoothers for Image objects.
     By default, this does a Gaussian kernel smooth. More choices
     would be better!
+
+    When the kernel is aligned with the voxel axes (an isotropic or
+    diagonal covariance, and an axis-aligned coordmap), it is the
+    product of 1D kernels, and the smoothing can be done as one 1D
+    convolution per axis instead of with a full FFT.
     '''
 
     normalization = 'l1sum'
     
     def __init__(self, coordmap, shape, fwhm=6.0, scale=1.0, location=0.0,
-                 cov=None):
+                 cov=None, axis=-1, method=None):
         """
         Parameters
         ----------
@@ -37,60 +90,192 @@ class LinearFilter(object):
            offset to apply to data after smooth and scaling, default 0
         cov : None or array, optional
            Covariance matrix
+        axis : int, optional
+           axis of the volumes of 4D images, default -1.  If `coordmap`
+           and `shape` are 4D, the kernel is defined on the other 3
+           axes.
+        method : None or {'fft', 'separable'}, optional
+           'fft' smooths with a full FFT, 'separable' with one 1D
+           convolution per axis, and needs a separable kernel.  None
+           (the default) chooses the cheaper of the two.
         """
+        if len(shape) == 4:
+            self.axis = axis % 4
+            name = coordmap.function_domain.coord_names[self.axis]
+            coordmap = drop_io_dim(coordmap, name)
+            shape = list(shape)
+            shape.pop(self.axis)
+        else:
+            self.axis = axis
         self.coordmap = coordmap
-        self.bshape = shape
+        self.bshape = tuple(shape)
         self.fwhm = fwhm
         self.scale = scale
         self.location = location
         self.cov = cov
+        if not method in (None, 'fft', 'separable'):
+            raise ValueError('method should be None, "fft" or "separable"')
+        self.method = method
         self._setup_kernel()
 
     def _setup_kernel(self):
         if not isinstance(self.coordmap, AffineTransform):
             raise ValueError('for FFT smoothing, we need a '
                              'regular (affine) coordmap')
-        # voxel indices of array implied by shape
-        voxels = np.indices(self.bshape).astype(np.float64)
+        key = self._cache_key()
+        try:
+            entry = _kernel_cache_get(key)
+        except KeyError:
+            entry = self._compute_kernel()
+            _kernel_cache_set(key, entry)
+        self._key = key
+        self._entry = entry
+        self._kernels = entry['kernels']
+        self._kernel = entry['kernel']
+        self.norms = dict(entry['norms'])
+        self.shape = _fft_shape(self.bshape, self._kernel.shape)
+        return self._kernel
+
+    def _cache_key(self):
+        """
+        Kernels are shared by filters of the same class, with the same
+        shape, affine, fwhm, covariance and method.
+        """
+        key = [self.__class__, self.bshape, self.method]
+        for value in (self.coordmap.affine, self.fwhm, self.cov):
+            if value is None:
+                key.append(None)
+            else:
+                value = np.asarray(value, dtype=np.float64)
+                key.append((value.shape, value.tostring()))
+        return tuple(key)
+
+    def _compute_kernel(self):
+        kernels = self._separable_kernels()
+        if self.method == 'separable' and kernels is None:
+            raise ValueError('kernel is not separable in voxel coordinates')
+        if not kernels is None and self.method is None:
+            # Compare rough operation counts of the two methods
+            kshape = np.array([len(k) for k in kernels])
+            fshape = _fft_shape(self.bshape, kshape)
+            n_fft = np.prod(fshape)
+            cost_fft = 5 * n_fft * np.log2(n_fft)
+            cost_sep = 2 * np.prod(self.bshape) * kshape.sum()
+            if cost_sep > cost_fft:
+                kernels = None
+        if self.method == 'fft':
+            kernels = None
+        if kernels is None:
+            kernel = self._grid_kernel()
+        else:
+            kernel = kernels[0]
+            for k in kernels[1:]:
+                kernel = np.multiply.outer(kernel, k)
+        # cached arrays are shared between filters
+        for k in [kernel] + (kernels or []):
+            k.flags.writeable = False
+        norms = {'l2':np.sqrt((kernel**2).sum()),
+                 'l1':np.fabs(kernel).sum(),
+                 'l1sum':kernel.sum()}
+        return {'kernels':kernels, 'kernel':kernel, 'norms':norms,
+                'fkernel':None}
+
+    def _grid_kernel(self):
         # coordinates of physical center.  XXX - why the 'floor' here?
         vox_center = np.floor((np.array(self.bshape) - 1) / 2.0)
         phys_center = self.coordmap(vox_center)
+        # voxel indices of the bounding box of the kernel support,
+        # within the array implied by shape
+        lo = np.zeros(len(self.bshape))
+        hi = np.array(self.bshape) - 1.
+        Q = self._voxel_form()
+        if not Q is None and npl.det(Q) > 0:
+            r = np.ceil(np.sqrt(30. * np.diag(npl.inv(Q)))) + 1
+            lo = np.maximum(vox_center - r, lo)
+            hi = np.minimum(vox_center + r, hi)
+        box = tuple((hi - lo + 1).astype(np.int))
+        voxels = np.indices(box).astype(np.float64)
         # reshape to (N coordinates, -1).  We appear to need to assign
         # to shape instead of doing a reshape, in order to avoid memory
         # copies
         voxels.shape = (voxels.shape[0], np.product(voxels.shape[1:]))
+        voxels += lo[:, None]
         # physical coordinates relative to center
         X = (self.coordmap(voxels.T) - phys_center).T
-        X.shape = (self.coordmap.ndims[0],) + tuple(self.bshape)
+        X.shape = (self.coordmap.ndims[0],) + box
         # compute kernel from these positions
         kernel = self(X, axis=0)
-        kernel = _crop(kernel)
-        self.norms = {'l2':np.sqrt((kernel**2).sum()),
-                      'l1':np.fabs(kernel).sum(),
-                      'l1sum':kernel.sum()}
-        self._kernel = kernel
-        self.shape = (np.ceil((np.asarray(self.bshape) +
-                              np.asarray(kernel.shape))/2)*2+2)
-        self.fkernel = np.zeros(self.shape)
-        slices = [slice(0, kernel.shape[i]) for i in range(len(kernel.shape))]
-        self.fkernel[slices] = kernel
-        self.fkernel = fft.rfftn(self.fkernel)
-        return kernel
+        return _crop(kernel)
 
-    def _normsq(self, X, axis=-1):
+    def _voxel_form(self):
         """
-        Compute the (periodic, i.e. on a torus) squared distance needed for
-        FFT smoothing. Assumes coordinate system is linear.
+        Quadratic form of the (squared, whitened) kernel distance in
+        voxel coordinates, or None if there are not as many physical as
+        voxel coordinates.
+        """
+        ndim = len(self.bshape)
+        M = self._whiten(self.coordmap.affine[:-1, :-1], axis=0)
+        Q = np.dot(M.T, M)
+        if Q.shape != (ndim, ndim):
+            return None
+        return Q
 
-        Parameters
-        ----------
-        X : array
-           array of points
-        axis : int, optional
-           axis containing coordinates. Default -1
+    def _separable_kernels(self):
+        """
+        1D kernels along each voxel axis, computed by the filter on
+        points along the axis, or None if the kernel is not their
+        product.  Only the Gaussian kernel of this class is known to be
+        separable: for a subclass computing another kernel, this is None
+        unless the separable method was asked for.
+        """
+        if self.method is None and not self._gaussian():
+            return None
+        ndim = len(self.bshape)
+        Q = self._voxel_form()
+        if Q is None:
+            return None
+        q = np.diag(Q)
+        if np.fabs(Q - np.diag(q)).max() > _SEPARABLE_TOL * q.max():
+            return None
+        A = self.coordmap.affine[:-1, :-1]
+        kernels = []
+        for i in range(ndim):
+            r = np.floor(np.sqrt(30. / q[i]))
+            x = np.arange(-r, r + 1)
+            # physical coordinates relative to center
+            X = np.multiply.outer(A[:, i], x)
+            kernels.append(self(X, axis=0))
+        return kernels
+
+    def _gaussian(self):
+        """ True if the kernel is the Gaussian kernel of this class """
+        cls = self.__class__
+        return (cls.__call__ == LinearFilter.__call__ and
+                cls._normsq == LinearFilter._normsq)
+
+    @property
+    def fkernel(self):
+        """ FFT of the kernel, zero-padded to `shape` """
+        entry = self._entry
+        if entry['fkernel'] is None:
+            fkernel = np.zeros(self.shape)
+            kernel = self._kernel
+            slices = [slice(0, kernel.shape[i]) for i in range(kernel.ndim)]
+            fkernel[slices] = kernel
+            fkernel = fft.rfftn(fkernel)
+            fkernel.flags.writeable = False
+            entry['fkernel'] = fkernel
+            if self._key in _kernel_cache:
+                _kernel_cache_trim()
+        return entry['fkernel']
+
+    def _whiten(self, X, axis=-1):
+        """
+        Coordinates of X in units of the kernel's standard deviation,
+        with the coordinate axis first.
         """
         # copy X
-        _X = np.array(X)
+        _X = np.array(X, dtype=np.float64)
         # roll coordinate axis to front
         _X = np.rollaxis(_X, axis)
         # convert coordinates to FWHM units
@@ -104,8 +289,22 @@ class LinearFilter(object):
         if self.cov != None:
             _chol = npl.cholesky(self.cov)
             _X = np.dot(npl.inv(_chol), _X)
+        return _X
+
+    def _normsq(self, X, axis=-1):
+        """
+        Compute the (periodic, i.e. on a torus) squared distance needed for
+        FFT smoothing. Assumes coordinate system is linear.
+
+        Parameters
+        ----------
+        X : array
+           array of points
+        axis : int, optional
+           axis containing coordinates. Default -1
+        """
         # compute squared distance
-        D2 = np.sum(_X**2, axis=0)
+        D2 = np.sum(self._whiten(X, axis)**2, axis=0)
         return D2
 
     def __call__(self, X, axis=-1):
@@ -128,7 +327,9 @@ class LinearFilter(object):
         Parameters
         ----------
         inimage : ``Image``
-           The image to be smoothed.  Should be 3D. 
+           The image to be smoothed.  Should be 3D, or 4D, in which case
+           the volumes along the filter's `axis` are smoothed one at a
+           time.
         clean : bool, optional
            Should we call ``nan_to_num`` on the data before smoothing?
         is_fft : bool, optional
@@ -139,58 +340,59 @@ class LinearFilter(object):
         s_image : `Image`
            New image, with smoothing applied
         """
-        if inimage.ndim == 4:
-            # we need to generalize which axis to iterate over.  By
-            # default it should probably be the last.
-            raise NotImplementedError('Smoothing volumes in a 4D series '
-                                      'is broken, pending a rethink')
-            _out = np.zeros(inimage.shape)
-            # iterate over the first (0) axis - this is confusing - see
-            # above
-            nslice = inimage.shape[0]
-        elif inimage.ndim == 3:
-            nslice = 1
-        else:
+        if not inimage.ndim in (3, 4):
             raise NotImplementedError('expecting either 3 or 4-d image')
-        for _slice in range(nslice):
-            if inimage.ndim == 4:
-                data = inimage[_slice]
-            elif inimage.ndim == 3:
-                data = inimage[:]
-            if clean:
-                data = np.nan_to_num(data)
+        data = inimage.get_data()
+        # one padded buffer for all the volumes
+        if is_fft or self._kernels is None:
+            buffer = np.zeros(self.shape)
+        else:
+            buffer = None
+        if inimage.ndim == 3:
+            out = self._smooth_volume(data, buffer, clean, is_fft)
+            return Image(out, coordmap=self.coordmap)
+        out = np.zeros(inimage.shape)
+        slicer = [slice(None)] * 4
+        for t in range(inimage.shape[self.axis]):
+            slicer[self.axis] = t
+            out[slicer] = self._smooth_volume(data[slicer], buffer, clean,
+                                              is_fft)
+        return Image(out, coordmap=inimage.coordmap)
+
+    def _smooth_volume(self, data, buffer, clean, is_fft):
+        if clean:
+            data = np.nan_to_num(data)
+        if is_fft or self._kernels is None:
             if not is_fft:
-                data = self._presmooth(data)
+                data = self._presmooth(data, buffer)
             data *= self.fkernel
-            data = fft.irfftn(data) / self.norms[self.normalization]
-            gc.collect()
-            _dslice = [slice(0, self.bshape[i], 1) for i in range(3)]
-            if self.scale != 1:
-                data = self.scale * data[_dslice]
-            if self.location != 0.0:
-                data += self.location
-            gc.collect()
-            # Write out data 
-            if inimage.ndim == 4:
-                _out[_slice] = data
-            else:
-                _out = data
-            _slice += 1
-        gc.collect()
-        _out = _out[[slice(self._kernel.shape[i]/2, self.bshape[i] +
-                           self._kernel.shape[i]/2) for i in range(len(self.bshape))]]
-        if inimage.ndim == 3:
-            return Image(_out, coordmap=self.coordmap)
+            data = fft.irfftn(data)
+            data = data[[slice(self._kernel.shape[i]/2,
+                               self.bshape[i] + self._kernel.shape[i]/2)
+                         for i in range(len(self.bshape))]]
         else:
-            # This does not work as written.  See above
-            concat_affine = AffineTransform.identity('concat')
-            return Image(_out, coordmap=product(self.coordmap, concat_affine))
+            data = np.array(data, dtype=np.float64)
+            for i, k in enumerate(self._kernels):
+                data = ndimage.correlate1d(data, k, axis=i, mode='constant')
+        data /= self.norms[self.normalization]
+        if self.scale != 1:
+            data *= self.scale
+        if self.location != 0.0:
+            data += self.location
+        return data
 
-    def _presmooth(self, indata):
+    def _presmooth(self, indata, buffer=None):
+        if buffer is None:
+            buffer = np.zeros(self.shape)
         slices = [slice(0, self.bshape[i], 1) for i in range(len(self.shape))]
-        _buffer = np.zeros(self.shape)
-        _buffer[slices] = indata
-        return fft.rfftn(_buffer)
+        buffer[slices] = indata
+        return fft.rfftn(buffer)
+
+
+def _fft_shape(bshape, kshape):
+    """ Shape of the zero-padded FFT buffer for image and kernel shapes """
+    return (np.ceil((np.asarray(bshape) +
+                     np.asarray(kshape))/2)*2+2)
 
 
 def fwhm2sigma(fwhm):
@@ -4,17 +4,22 @@
 """
 
 import copy
+import sys
+import threading
 
 import numpy as np
 
 from scipy.ndimage import affine_transform
 
 from .interpolation import ImageInterpolator
-from ..core.api import (Image, CoordinateMap, AffineTransform,
-                        ArrayCoordMap, compose)
+from ..core.api import Image, CoordinateMap, AffineTransform, compose
 from ..core.transforms import affines
 
-def resample_img2img(source, target, order=3):
+#: number of target voxels mapped and interpolated at a time, when the
+#: mapping to image voxels is not affine
+resample_chunk_size = 2**18
+
+def resample_img2img(source, target, order=3, interpolator=None, n_threads=1):
     """  Resample `source` image to space of `target` image
     
     This wraps the resample function to resample one image onto another.
@@ -30,6 +35,11 @@ def resample_img2img(source, target, order=3):
        have the same shape as the target, and the same coordmap
     order : ``int``, optional
        What order of interpolation to use in `scipy.ndimage`
+    interpolator : ``ImageInterpolator``, optional
+       Interpolator of `source`, to reuse its spline coefficients when
+       resampling `source` to several targets.  See ``resample``.
+    n_threads : ``int``, optional
+       Number of threads for non-affine mappings.  See ``resample``.
 
     Returns
     -------
@@ -52,11 +62,14 @@ def resample_img2img(source, target, order=3):
         raise ValueError("source coordmap output dimension not equal "
                          "to target coordmap output dimension")
     mapping = np.eye(sop+1) # this would usually be 3+1
-    resimg = resample(source, target.coordmap, mapping, target.shape, order=order)
+    resimg = resample(source, target.coordmap, mapping, target.shape,
+                      order=order, interpolator=interpolator,
+                      n_threads=n_threads)
     return resimg
 
 
-def resample(image, target, mapping, shape, order=3):
+def resample(image, target, mapping, shape, order=3, interpolator=None,
+             n_threads=1):
     """ Resample `image` to `target` CoordinateMap
 
     Use a "world-to-world" mapping `mapping` and spline interpolation of a 
@@ -82,6 +95,16 @@ def resample(image, target, mapping, shape, order=3):
        shape of output array, in target.function_domain
     order : int, optional
        what order of interpolation to use in `scipy.ndimage`
+    interpolator : ImageInterpolator, optional
+       interpolator of `image`, whose spline coefficients are used
+       instead of filtering `image` again.  The interpolation order is
+       then that of the interpolator.  The output dtype is the same
+       with or without an interpolator.
+    n_threads : int, optional
+       When the mapping from target voxels to image voxels is not
+       affine, the target grid is mapped and interpolated in slabs of
+       about `resample_chunk_size` voxels, shared between `n_threads`
+       threads.
 
     Returns
     -------
@@ -109,21 +132,77 @@ def resample(image, target, mapping, shape, order=3):
     if not isinstance(TV2IW, AffineTransform):
         # interpolator evaluates image at values image.coordmap.function_range,
         # i.e. physical coordinates rather than voxel coordinates
-        grid = ArrayCoordMap.from_shape(TV2IW, shape)
-        interp = ImageInterpolator(image, order=order)
-        idata = interp.evaluate(grid.transposed_values)
+        interp = interpolator or ImageInterpolator(image, order=order)
+        idata = _evaluate_slabs(interp, TV2IW, shape, n_threads)
         del(interp)
     else: # it is an affine transform, but, what if we compose?
         TV2IV = compose(image.coordmap.inverse(), TV2IW)
         if isinstance(TV2IV, AffineTransform): # still affine
             A, b = affines.to_matrix_vector(TV2IV.affine)
-            idata = affine_transform(np.asarray(image), A,
-                                     offset=b,
-                                     output_shape=shape,
-                                     order=order)
+            if interpolator is None:
+                idata = affine_transform(np.asarray(image), A,
+                                         offset=b,
+                                         output_shape=shape,
+                                         order=order)
+            else:
+                idata = affine_transform(interpolator.data, A,
+                                         offset=b,
+                                         output_shape=shape,
+                                         order=interpolator.order,
+                                         output=interpolator.image_dtype,
+                                         prefilter=False)
         else: # not affine anymore
-            interp = ImageInterpolator(image, order=order)
-            grid = ArrayCoordMap.from_shape(TV2IV, shape)
-            idata = interp.evaluate(grid.values)
+            interp = interpolator or ImageInterpolator(image, order=order)
+            idata = _evaluate_slabs(interp, TV2IW, shape, n_threads)
             del(interp)
     return Image(idata, copy.copy(target))
+
+
+def _evaluate_slabs(interp, mapping, shape, n_threads=1):
+    """ Evaluate `interp` at ``mapping(np.indices(shape))``, in slabs
+
+    The target grid is split along its first axis into slabs of about
+    `resample_chunk_size` voxels, so that only the coordinates of one
+    slab per thread are in memory at a time.  The slabs are shared
+    between `n_threads` threads.
+    """
+    shape = tuple(shape)
+    idata = np.zeros(shape)
+    if len(shape) == 0 or 0 in shape:
+        return idata
+    step = max(resample_chunk_size // int(np.prod(shape[1:])), 1)
+    starts = range(0, shape[0], step)
+    dtype = mapping.function_domain.coord_dtype
+    errors = []
+
+    def evaluate(starts):
+        for start in starts:
+            if errors:
+                return
+            stop = min(start + step, shape[0])
+            indices = np.indices((stop - start,) + shape[1:]).astype(dtype)
+            indices[0] += start
+            indices.shape = (len(shape), -1)
+            points = mapping(indices.T).T
+            idata[start:stop] = interp.evaluate(points).reshape(
+                (stop - start,) + shape[1:])
+
+    def run(starts):
+        try:
+            evaluate(starts)
+        except:
+            errors.append(sys.exc_info())
+
+    n_threads = min(n_threads, len(starts))
+    if n_threads <= 1:
+        evaluate(starts)
+        return idata
+    threads = [threading.Thread(target=run, args=(starts[i::n_threads],))
+               for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0][0], errors[0][1], errors[0][2]
+    return idata
@@ -4,9 +4,10 @@ import numpy as np
 from numpy.random import random_integers as randint
 
 from nipy import load_image
-from nipy.algorithms.kernel_smooth import LinearFilter
+from nipy.algorithms import kernel_smooth
+from nipy.algorithms.kernel_smooth import LinearFilter, clear_kernel_cache
 from nipy.core.api import Image
-from nipy.core.reference.coordinate_map import AffineTransform
+from nipy.core.reference.coordinate_map import AffineTransform, drop_io_dim
 
 from nipy.algorithms.kernel_smooth import sigma2fwhm, fwhm2sigma
 
@@ -25,8 +26,115 @@ def test_anat_smooth():
 def test_func_smooth():
     func = load_image(funcfile)
     smoother = LinearFilter(func.coordmap, func.shape)
-    # should work, but currently broken : sfunc = smoother.smooth(func)
-    yield assert_raises(NotImplementedError, smoother.smooth, func)
+    sfunc = smoother.smooth(func)
+    yield assert_equal(sfunc.shape, func.shape)
+    # each volume smoothed as a 3D image
+    data = func.get_data()
+    cmap3d = drop_io_dim(func.coordmap, 't')
+    smoother3d = LinearFilter(cmap3d, func.shape[:3])
+    svol = smoother3d.smooth(Image(data[..., 5], cmap3d)).get_data()
+    yield assert_true(np.allclose(sfunc.get_data()[..., 5], svol))
+    # volumes along the first axis
+    rdata = np.rollaxis(np.asarray(data), 3)
+    rcmap = AffineTransform.from_params('tijk', 'txyz', 
+                                        np.diag([2, 4, 4, 8, 1]))
+    smoother = LinearFilter(rcmap, rdata.shape, axis=0)
+    sdata = smoother.smooth(Image(rdata, rcmap)).get_data()
+    yield assert_true(np.allclose(sdata[5], svol))
+
+
+@parametric
+def test_separable():
+    # separable and FFT smoothing agree, also with scale and location
+    shape = (20, 25, 15)
+    coordmap = AffineTransform.from_start_step('ijk', 'xyz', 
+                                               [1, 2, 3], [2., 3., 4.])
+    data = np.random.standard_normal(shape)
+    for fwhm in (4., [5., 8., 6.]):
+        res = []
+        for method in ('separable', 'fft'):
+            smoother = LinearFilter(coordmap, shape, fwhm=fwhm, scale=2.,
+                                    location=1., method=method)
+            res.append(smoother.smooth(Image(data, coordmap)).get_data())
+        # the kernels only differ by their truncation
+        yield assert_true(np.allclose(res[0], res[1], atol=1e-4))
+    # small kernels use the separable path
+    smoother = LinearFilter(coordmap, shape, fwhm=4.)
+    yield assert_true(np.allclose(smoother.norms['l1sum'], 
+                       np.prod([k.sum() for k in smoother._kernels])))
+    # an isotropic kernel is separable on rotated voxel axes, an
+    # anisotropic one is not
+    rot = np.eye(4)
+    rot[:2, :2] = [[np.cos(.3), -np.sin(.3)], [np.sin(.3), np.cos(.3)]]
+    rcoordmap = AffineTransform.from_params('ijk', 'xyz', rot)
+    smoother = LinearFilter(rcoordmap, shape, fwhm=4., method='separable')
+    yield assert_equal(len(smoother._kernels), 3)
+    smoother = LinearFilter(rcoordmap, shape, fwhm=[4., 6., 6.])
+    yield assert_true(smoother._kernels is None)
+    yield assert_raises(ValueError, LinearFilter, rcoordmap, shape, 
+                        fwhm=[4., 6., 6.], method='separable')
+    # the 1D kernels are computed by the filter, and a kernel other than
+    # the Gaussian one is not taken as separable unless asked for
+    class BoxFilter(LinearFilter):
+        def __call__(self, X, axis=-1):
+            return np.less_equal(self._normsq(X, axis), 1.).astype(float)
+    smoother = BoxFilter(coordmap, shape, fwhm=8.)
+    yield assert_true(smoother._kernels is None)
+    yield assert_true(np.allclose(smoother._kernel,
+                                  BoxFilter(coordmap, shape, fwhm=8.,
+                                            method='fft')._kernel))
+    smoother = BoxFilter(coordmap, shape, fwhm=8., method='separable')
+    for k in smoother._kernels:
+        yield assert_true(np.all((k == 0) | (k == 1)))
+
+
+@parametric
+def test_grid_kernel():
+    # the kernel evaluated on its support is the kernel evaluated on
+    # the whole grid, then cropped
+    shape = (30, 35, 25)
+    aff = np.diag([2., 3., 2.5, 1.])
+    aff[:2, :2] = np.dot([[np.cos(.3), -np.sin(.3)], 
+                          [np.sin(.3), np.cos(.3)]], aff[:2, :2])
+    aff[:3, 3] = [4, -2, 7]
+    coordmap = AffineTransform.from_params('ijk', 'xyz', aff)
+    for fwhm in (5., [6., 9., 4.], 40.):
+        smoother = LinearFilter(coordmap, shape, fwhm=fwhm, method='fft')
+        X = np.indices(shape).reshape((3, -1)).T
+        center = np.floor((np.array(shape) - 1) / 2.0)
+        X = coordmap(X) - coordmap(center)
+        kernel = kernel_smooth._crop(smoother(X).reshape(shape))
+        yield assert_equal(smoother._kernel.shape, kernel.shape)
+        yield assert_true(np.allclose(smoother._kernel, kernel))
+
+
+@parametric
+def test_kernel_cache():
+    clear_kernel_cache()
+    func = load_image(funcfile)
+    smoother = LinearFilter(func.coordmap, func.shape, method='fft')
+    fkernel = smoother.fkernel
+    # same geometry, same kernel spectrum
+    smoother2 = LinearFilter(func.coordmap, func.shape, method='fft')
+    yield assert_true(smoother2._kernel is smoother._kernel)
+    yield assert_true(smoother2.fkernel is fkernel)
+    smoother3 = LinearFilter(func.coordmap, func.shape, fwhm=5., 
+                             method='fft')
+    yield assert_true(not smoother3._kernel is smoother._kernel)
+    yield assert_equal(len(kernel_smooth._kernel_cache), 2)
+    # the least recently used kernels are dropped beyond the cache size
+    cache_bytes = kernel_smooth.kernel_cache_bytes
+    try:
+        kernel_smooth.kernel_cache_bytes = fkernel.nbytes + \
+            smoother._kernel.nbytes
+        smoother3.fkernel
+        yield assert_equal(kernel_smooth._kernel_keys, [smoother3._key])
+        # evicted filters still work
+        smoother.smooth(func)
+    finally:
+        kernel_smooth.kernel_cache_bytes = cache_bytes
+        clear_kernel_cache()
+    yield assert_equal(len(kernel_smooth._kernel_cache), 0)
 
 
 @parametric
@@ -43,8 +151,11 @@ def test_kernel():
     # Verify that convolution with a delta function gives the correct
     # answer.
     tol = 0.9999
-    sdtol = 1.0e-8
+    # the separable kernel is truncated to a box rather than a ball
+    sdtols = {'fft': 1.0e-8, 'separable': 1.0e-7}
     for x in range(6):
+        method = ('fft', 'separable')[x % 2]
+        sdtol = sdtols[method]
         shape = randint(30,60,(3,))
         # pos of delta
         ii, jj, kk = randint(11,17, (3,))
@@ -58,7 +169,7 @@ def test_kernel():
         signal = Image(signal, coordmap=coordmap)
         # A filter with coordmap, shape matched to image
         kernel = LinearFilter(coordmap, shape, 
-                              fwhm=randint(50,100)/10.)
+                              fwhm=randint(50,100)/10., method=method)
         # smoothed normalized 3D array
         ssignal = kernel.smooth(signal).get_data()
         ssignal[:] *= kernel.norms[kernel.normalization]
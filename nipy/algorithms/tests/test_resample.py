@@ -1,17 +1,22 @@
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
+import os
+
 import numpy as np
 
 
-from nipy.core.api import (AffineTransform, Image,  
+from nipy.core.api import (AffineTransform, CoordinateMap, Image,  
                            ArrayCoordMap, compose)
 from nipy.core.reference import slices
+from nipy.algorithms import resample as resample_mod
 from nipy.algorithms.resample import resample, resample_img2img
+from nipy.algorithms.interpolation import ImageInterpolator
 from nipy.io.api import load_image
 
 from nose.tools import assert_true, assert_raises
 
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import (assert_array_almost_equal, assert_array_equal,
+                           assert_equal)
 from nipy.testing import funcfile, anatfile, parametric
 
 
@@ -23,6 +28,81 @@ def test_resample_img2img():
     yield assert_raises, ValueError, resample_img2img, fimg, aimg
 
 
+def test_resample_interpolator():
+    aimg = load_image(anatfile)
+    interp = ImageInterpolator(aimg)
+    yield assert_true, not isinstance(interp.data, np.memmap)
+    # the interpolator's coefficients are reused for each target
+    shift = AffineTransform(aimg.coordmap.function_range,
+                            aimg.coordmap.function_range,
+                            np.array([[1, 0, 0, 1.5],
+                                      [0, 1, 0, -2.],
+                                      [0, 0, 1, .5],
+                                      [0, 0, 0, 1]]))
+    target = compose(shift, aimg.coordmap)
+    for order in (1, 3):
+        interp = ImageInterpolator(aimg, order=order)
+        for tgt in (aimg.coordmap, target):
+            res = resample(aimg, tgt, np.eye(4), aimg.shape, order=order)
+            res2 = resample(aimg, tgt, np.eye(4), aimg.shape,
+                            interpolator=interp)
+            yield assert_equal, np.asarray(res2).dtype, np.asarray(res).dtype
+            yield assert_array_equal, res2, res
+    # float32 coefficients
+    interp32 = ImageInterpolator(aimg, dtype=np.float32)
+    points = aimg.coordmap(np.indices((5, 6, 7)).reshape((3, -1)).T + 10.3)
+    v = interp.evaluate(points.T)
+    v32 = interp32.evaluate(points.T)
+    yield assert_true, v32.dtype == np.float64
+    yield assert_array_almost_equal, v32 / abs(v).max(), v / abs(v).max(), 5
+
+
+def test_nonaffine_slabs():
+    # slabs of a few rows, in one or more threads, against the whole grid
+    # at once
+    aimg = load_image(anatfile)
+    def warp(x):
+        return x + 2 * np.sin(x / 10.)
+    shape = (30, 35, 20)
+    target = aimg.coordmap
+    interp = ImageInterpolator(aimg)
+    grid = ArrayCoordMap.from_shape(
+        compose(CoordinateMap(target.function_range, 
+                              aimg.coordmap.function_range, warp), target), 
+        shape)
+    expected = interp.evaluate(grid.transposed_values)
+    chunk_size = resample_mod.resample_chunk_size
+    try:
+        resample_mod.resample_chunk_size = 3 * 35 * 20
+        for n_threads in (1, 4):
+            res = resample(aimg, target, warp, shape, interpolator=interp,
+                           n_threads=n_threads)
+            yield assert_array_almost_equal, np.asarray(res), expected
+        # errors are raised from the threads (the mapping is checked on
+        # 10 points when it is made)
+        def bad_warp(x):
+            if len(x) > 10:
+                raise ZeroDivisionError
+            return x
+        assert_raises(ZeroDivisionError, resample, aimg, target, bad_warp,
+                      shape, 3, interp, 2)
+    finally:
+        resample_mod.resample_chunk_size = chunk_size
+
+
+def test_interpolator_spill():
+    aimg = load_image(anatfile)
+    interp = ImageInterpolator(aimg)
+    interp_spill = ImageInterpolator(aimg, spill_bytes=1000)
+    yield assert_true, isinstance(interp_spill.data, np.memmap)
+    if os.name == 'posix':
+        # no temporary file is left behind
+        yield assert_true, not os.path.exists(interp_spill.data.filename)
+    yield assert_array_almost_equal, interp_spill.data, interp.data
+    interp_mem = ImageInterpolator(aimg, spill_bytes=interp.data.nbytes)
+    yield assert_true, not isinstance(interp_mem.data, np.memmap)
+
+
 
 # Hackish flag for enabling of pylab plots of resamplingstest_2d_from_3d
 gui_review = False
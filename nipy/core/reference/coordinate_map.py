@@ -75,6 +75,10 @@ from .coordinate_system import(CoordinateSystem,
 # shorthand
 CS = CoordinateSystem
 
+# number of points mapped at a time by AffineTransform.apply into an
+# output array, bounding the size of temporaries
+_APPLY_BLOCK = 2**16
+
 
 class CoordinateMap(object):
     """A set of domain and range CoordinateSystems and a function between them.
@@ -344,13 +348,21 @@ class CoordinateMap(object):
 
     def inverse(self):
         """ New CoordinateMap with the functions reversed
+
+        The inverse is made once, and cached, as the attributes of a
+        CoordinateMap are read-only.
         """
         if self.inverse_function is None:
             return None
-        return CoordinateMap(self.function_range,
-                             self.function_domain,
-                             self.inverse_function,
-                             inverse_function=self.function)
+        try:
+            return self._inverse
+        except AttributeError:
+            pass
+        self._inverse = CoordinateMap(self.function_range,
+                                      self.function_domain,
+                                      self.inverse_function,
+                                      inverse_function=self.function)
+        return self._inverse
 
     def __call__(self, x):
         """ Return mapping evaluated at x
@@ -551,13 +563,26 @@ class AffineTransform(object):
 
     def inverse(self):
         """ Return inverse affine transform or None if not invertible
+
+        The inverse is cached, and made again only if the affine of
+        either transform has changed since.
         """
+        cached = self.__dict__.get('_inverse')
+        if not cached is None:
+            affine, inverse, inverse_affine = cached
+            if np.array_equal(affine, self.affine) and \
+                    (inverse is None or
+                     np.array_equal(inverse_affine, inverse.affine)):
+                return inverse
         try:
-            return AffineTransform(self.function_range,
-                                   self.function_domain,
-                                   np.linalg.inv(self.affine))
+            inverse = AffineTransform(self.function_range,
+                                      self.function_domain,
+                                      np.linalg.inv(self.affine))
         except np.linalg.linalg.LinAlgError:
-            return None
+            inverse = None
+        self._inverse = (self.affine.copy(), inverse,
+                         inverse and inverse.affine.copy())
+        return inverse
 
     ###################################################################
     #
@@ -873,10 +898,64 @@ class AffineTransform(object):
             out_shape = x.shape[:-1] + out_shape
         in_vals = self.function_domain._checked_values(x)
         A, b = affines.to_matrix_vector(self.affine)
-        out_vals = np.dot(in_vals, A.T) + b[np.newaxis,:]
+        out_vals = np.dot(in_vals, A.T)
+        out_vals += b
         final_vals = self.function_range._checked_values(out_vals)
         return final_vals.reshape(out_shape)
 
+    def apply(self, points, out=None):
+        """ Map `points`, without the coordinate checks of ``__call__``
+
+        Parameters
+        ----------
+        points : array
+           Values in domain coordinate system space, of shape S +
+           (self.function_domain.ndim,), where S is a tuple of int.
+        out : None or array, optional
+           Contiguous array of shape S + (self.function_range.ndim,)
+           for the result, which is computed in blocks of points, so
+           that `out` can be `points` itself to map points in place.
+
+        Returns
+        -------
+        out : array
+           Values in range coordinate system space, of shape S +
+           (self.function_range.ndim,)
+
+        Examples
+        --------
+        >>> cm = AffineTransform.from_start_step('ijk', 'xyz', [1, 2, 3], [2, 2, 2])
+        >>> points = np.array([[0., 0, 0], [1, 1, 1]])
+        >>> cm.apply(points)
+        array([[ 1.,  2.,  3.],
+               [ 3.,  4.,  5.]])
+        >>> out = cm.apply(points, out=points)
+        >>> points
+        array([[ 1.,  2.,  3.],
+               [ 3.,  4.,  5.]])
+        """
+        A, b = affines.to_matrix_vector(self.affine)
+        points = np.asarray(points)
+        if out is None:
+            out = np.dot(points, A.T)
+            out += b
+            return out
+        nin, nout = self.ndims
+        if out.shape != points.shape[:-1] + (nout,):
+            raise ValueError('out should have shape %s' %
+                             (points.shape[:-1] + (nout,),))
+        flat_out = out.view()
+        try:
+            flat_out.shape = (-1, nout)
+        except AttributeError:
+            raise ValueError('out should be contiguous')
+        flat_points = points.reshape((-1, nin))
+        for i in range(0, flat_points.shape[0], _APPLY_BLOCK):
+            block = slice(i, i + _APPLY_BLOCK)
+            flat_out[block] = np.dot(flat_points[block], A.T)
+        flat_out += b
+        return out
+
     ###################################################################
     #
     # Private methods
@@ -1012,6 +1091,7 @@ def product(*cmaps):
     else:
         warnings.warn("product of non-affine CoordinateMaps is less robust than"+
                       "the AffineTransform")
+        cmaps = _collapse_affines(cmaps, _product_affines)
         return _product_cmaps(*[_as_coordinate_map(cmap) for cmap in cmaps])
 
 
@@ -1051,6 +1131,7 @@ def compose(*cmaps):
     else:
         warnings.warn("composition of non-affine CoordinateMaps is "
                       "less robust than the AffineTransform")
+        cmaps = _collapse_affines(cmaps, _compose_affines)
         return _compose_cmaps(*[_as_coordinate_map(cmap) for cmap in cmaps])
 
 
@@ -1550,39 +1631,65 @@ def _compose_affines(*affines):
     return cur
 
 
+def _collapse_affines(cmaps, combine):
+    """ Replace runs of consecutive AffineTransforms in `cmaps` by their
+    combination with `combine` (composition or product)
+    """
+    collapsed = []
+    run = []
+    for cmap in list(cmaps) + [None]:
+        if isinstance(cmap, AffineTransform):
+            run.append(cmap)
+            continue
+        if len(run) > 1:
+            collapsed.append(combine(*run))
+        else:
+            collapsed.extend(run)
+        run = []
+        if not cmap is None:
+            collapsed.append(cmap)
+    return collapsed
+
+
+class _Chain(object):
+    """ Callable calling a sequence of functions in turn
+
+    Chains of chains are flattened, so that the functions of composed
+    CoordinateMaps are called in one loop, however deep the composition.
+    """
+    def __init__(self, functions):
+        self.functions = []
+        for function in functions:
+            if isinstance(function, _Chain):
+                self.functions.extend(function.functions)
+            else:
+                self.functions.append(function)
+
+    def __call__(self, x):
+        for function in self.functions:
+            x = function(x)
+        return x
+
+
 def _compose_cmaps(*cmaps):
     """ Compute the composition of a sequence of cmaps
     """
-
-    def _compose2(cmap1, cmap2):
-        forward = lambda input: cmap1.function(cmap2.function(input))
-        cmap1i = cmap1.inverse()
-        cmap2i = cmap2.inverse()
-        if cmap1i is not None and cmap2i is not None:
-            backward = lambda output: cmap2i.function(cmap1i.function(output))
-        else:
-            backward = None
-        return forward, backward
-
-    # the identity coordmap
-    cur = CoordinateMap(cmaps[-1].function_domain,
-                        cmaps[-1].function_domain,
-                        lambda x: x,
-                        lambda x: x)
-    for cmap in cmaps[::-1]:
-        if cmap.function_domain == cur.function_range:
-            forward, backward = _compose2(cmap, cur)
-            cur =  CoordinateMap(cur.function_domain,
-                                 cmap.function_range,
-                                 forward,
-                                 inverse_function=backward)
-        else:
+    for cmap, cur in zip(cmaps[:-1], cmaps[1:]):
+        if cmap.function_domain != cur.function_range:
             raise ValueError(
                 'domain and range coordinates do not match: '
                 'domain=%s, range=%s' %
                 (`cmap.function_domain.dtype`, `cur.function_range.dtype`))
-
-    return cur
+    forward = _Chain([cmap.function for cmap in cmaps[::-1]])
+    inverses = [cmap.inverse() for cmap in cmaps]
+    if None in inverses:
+        backward = None
+    else:
+        backward = _Chain([cmapi.function for cmapi in inverses])
+    return CoordinateMap(cmaps[-1].function_domain,
+                         cmaps[0].function_range,
+                         forward,
+                         inverse_function=backward)
 
 
 def _product_cmaps(*cmaps):
@@ -349,6 +349,66 @@ def test_affine_inverse():
     yield assert_equal, badcm.inverse(), None
 
 
+
+def test_affine_inverse_cache():
+    incs, outcs, aff = affine_v2w()
+    cm = AffineTransform(incs, outcs, aff)
+    inv = cm.inverse()
+    yield assert_true, cm.inverse() is inv
+    # changing either affine makes a new inverse
+    cm.affine[0, 3] += 1
+    inv2 = cm.inverse()
+    yield assert_false, inv2 is inv
+    yield assert_almost_equal, inv2.affine, np.linalg.inv(cm.affine)
+    inv2.affine[0, 0] = 0
+    yield assert_almost_equal, cm.inverse().affine, np.linalg.inv(cm.affine)
+
+
+def test_affine_apply():
+    incs, outcs, aff = affine_v2w()
+    cm = AffineTransform(incs, outcs, aff)
+    points = np.random.standard_normal((5, 7, 3))
+    expected = cm(points)
+    yield assert_almost_equal, cm.apply(points), expected
+    # in place, in several blocks
+    from nipy.core.reference import coordinate_map
+    block = coordinate_map._APPLY_BLOCK
+    try:
+        coordinate_map._APPLY_BLOCK = 4
+        out = cm.apply(points, out=points)
+    finally:
+        coordinate_map._APPLY_BLOCK = block
+    yield assert_true, out is points
+    yield assert_almost_equal, points, expected
+    yield assert_raises, ValueError, cm.apply, points, np.zeros((5, 3))
+    yield (assert_raises, ValueError, cm.apply, points, 
+           np.zeros((3, 7, 5)).T)
+
+
+def test_compose_collapse():
+    incs, outcs, aff = affine_v2w()
+    cm = AffineTransform(incs, outcs, aff)
+    cmi = cm.inverse()
+    shift = AffineTransform(outcs, outcs, np.array([[1, 0, 0, 2.],
+                                                    [0, 1, 0, 3.],
+                                                    [0, 0, 1, 4.],
+                                                    [0, 0, 0, 1]]))
+    warp = CoordinateMap(outcs, outcs, lambda x: x**3, 
+                         lambda x: np.sign(x) * np.abs(x)**(1/3.))
+    # the affines on each side of warp are composed into one matrix
+    c = compose(cm, cmi, shift, warp, shift, cm)
+    yield assert_equal, len(c.function.functions), 3
+    # nested compositions are flattened
+    c2 = compose(c, cmi, compose(warp, cm))
+    yield assert_equal, len(c2.function.functions), 6
+    x = np.random.standard_normal((10, 3))
+    y = shift(warp(shift(cm(x))))
+    yield assert_almost_equal, c(x), y
+    yield assert_almost_equal, c.inverse()(y), x
+    yield assert_almost_equal, c2(x), c(cmi(warp(cm(x))))
+    yield assert_true, c.inverse() is c.inverse()
+
+
 def test_affine_from_params():
     incs, outcs, aff = affine_v2w()
     cm = AffineTransform.from_params('ijk', 'xyz', aff)
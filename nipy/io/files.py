@@ -23,6 +23,7 @@ import numpy as np
 import nipy.io.imageformats as formats
 
 from nipy.core.api import Image, is_image
+from nipy.io.imageformats.memmapwriter import Nifti1MemmapWriter
 from nifti_ref import (ni_affine_pixdim_from_affine, affine_transform_from_array)
                        
                        
@@ -142,8 +143,30 @@ def save(img, filename, dtype=None):
         original_hdr = img.header
     except AttributeError:
         original_hdr = None
+    out_img = _formats_image(img.coordmap, img.shape, filename,
+                             data=img.get_data(), header=original_hdr)
+    # save to disk
+    out_img.to_filespec(filename)
+    return img
+
+
+def _formats_image(coordmap, shape, filename, data=None, header=None):
+    """ Return image formats image for saving to `filename`
+
+    Parameters
+    ----------
+    coordmap : ``AffineTransform``
+    shape : tuple
+       shape of image data
+    filename : string
+       filename implying type of image
+    data : None or array, optional
+       image data
+    header : None or header, optional
+       header to copy and update
+    """
     # Make NIFTI compatible affine_transform
-    affine_3dorless_transform, pixdim = ni_affine_pixdim_from_affine(img.coordmap)
+    affine_3dorless_transform, pixdim = ni_affine_pixdim_from_affine(coordmap)
 
 #   what are we going to do with pixdim?
 #   LPIImage will all have pixdim[3:] == 1...
@@ -151,7 +174,7 @@ def save(img, filename, dtype=None):
     aff = affine_3dorless_transform.affine 
 
     # rzs = Fimg.affine[:3,:], JT for Matthew, I changed this below is this correct?
-    rzs = img.coordmap.affine[:-1,:-1] 
+    rzs = coordmap.affine[:-1,:-1] 
     zooms = np.sqrt(np.sum(rzs * rzs, axis=0))
 
     ftype = _type_from_filename(filename)
@@ -162,10 +185,12 @@ def save(img, filename, dtype=None):
     else:
         raise ValueError('Cannot save file type "%s"' % ftype)
     # make new image
-    out_img = klass(data=img.get_data(),
+    out_img = klass(data=data,
                     affine=aff,
-                    header=original_hdr)
+                    header=header)
     hdr = out_img.get_header()
+    if data is None:
+        hdr.set_data_shape(shape)
     # work out phase, freqency, slice from coordmap names
     axisnames = affine_3dorless_transform.function_domain.coord_names
 
@@ -176,9 +201,61 @@ def save(img, filename, dtype=None):
         pass
     # Set zooms
     hdr.set_zooms(zooms)
-    # save to disk
-    out_img.to_filespec(filename)
-    return img
+    return out_img
+
+
+def memmap_writer(filename, coordmap, shape, dtype=np.float64):
+    """ Write image header, return writer for image data on disk
+
+    The writer gives a writeable memory map of the image data in the
+    file, so you can write large images a piece at a time, without
+    keeping the whole image in memory.  Call the ``close`` method of the
+    writer when done, to flush the data to disk, and write the data range
+    into the header.
+
+    Parameters
+    ----------
+    filename : string
+        filename for uncompressed NIfTI image (``.nii`` or ``.hdr``)
+    coordmap : ``AffineTransform``
+        coordinate map for image
+    shape : tuple
+        shape of image
+    dtype : dtype, optional
+        data type of image on disk
+
+    Returns
+    -------
+    writer : ``Nifti1MemmapWriter``
+        writer object; write data by indexing as for an array.
+
+    Examples
+    --------
+    >>> import os
+    >>> from tempfile import mkstemp
+    >>> from nipy.core.api import AffineTransform
+    >>> from nipy.io.api import load_image
+    >>> cmap = AffineTransform.from_params('ijk', 'xyz', np.eye(4))
+    >>> fd, fname = mkstemp(suffix='.nii')
+    >>> writer = memmap_writer(fname, cmap, (2, 3, 4))
+    >>> for i in range(2):
+    ...     writer[i] = i
+    >>> writer.close()
+    >>> img = load_image(fname)
+    >>> img.shape
+    (2, 3, 4)
+    >>> print img.get_data()[:, 0, 0]
+    [ 0.  1.]
+    >>> os.close(fd)
+    >>> os.unlink(fname)
+    """
+    ftype = _type_from_filename(filename)
+    if not ftype.startswith('nifti1'):
+        raise ValueError('Can only write NIfTI images via memmap')
+    out_img = _formats_image(coordmap, shape, filename)
+    out_img.get_header().set_data_dtype(dtype)
+    return Nifti1MemmapWriter(out_img, filename)
+
 
 def _type_from_filename(filename):
     ''' Return image type determined from filename
@@ -53,7 +53,8 @@ from nipy.io.imageformats import spm2analyze as spm2
 from nipy.io.imageformats import nifti1 as ni1
 from nipy.io.imageformats import minc
 # object imports
-from nipy.io.imageformats.loadsave import load, save
+from nipy.io.imageformats.loadsave import load, save, load_header, peek, \
+    scan_directory
 from nipy.io.imageformats.analyze import AnalyzeHeader, AnalyzeImage
 from nipy.io.imageformats.spm99analyze import Spm99AnalyzeHeader, Spm99AnalyzeImage
 from nipy.io.imageformats.spm2analyze import Spm2AnalyzeHeader, Spm2AnalyzeImage
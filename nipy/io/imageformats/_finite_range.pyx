@@ -0,0 +1,65 @@
+# -*- Mode: Python -*-  Not really, but the syntax is close enough
+"""
+Single pass range and NaN / Inf counts for floating point arrays.
+
+These are the inner loops for ``volumeutils.finite_stats``, which passes
+one-dimensional, contiguous, native byte order blocks of data.
+"""
+
+import numpy as np
+cimport numpy as np
+
+import cython
+
+cdef double INF = np.inf
+
+
+@cython.boundscheck(False)
+def stats_float64(np.ndarray[np.float64_t, ndim=1] arr,
+                  double mn, double mx):
+    """
+    mn, mx, n_nan, n_inf = stats_float64(arr, mn, mx)
+
+    Update minimum `mn` and maximum `mx` of finite values with values in
+    `arr`, and count the NaN and infinite values in `arr`.
+    """
+    cdef Py_ssize_t i, n = arr.shape[0]
+    cdef Py_ssize_t n_nan = 0, n_inf = 0
+    cdef double v
+    for i in range(n):
+        v = arr[i]
+        if v != v:
+            n_nan += 1
+        elif v == INF or v == -INF:
+            n_inf += 1
+        else:
+            if v < mn:
+                mn = v
+            if v > mx:
+                mx = v
+    return mn, mx, n_nan, n_inf
+
+
+@cython.boundscheck(False)
+def stats_float32(np.ndarray[np.float32_t, ndim=1] arr,
+                  double mn, double mx):
+    """
+    mn, mx, n_nan, n_inf = stats_float32(arr, mn, mx)
+
+    As for ``stats_float64``, for float32 arrays
+    """
+    cdef Py_ssize_t i, n = arr.shape[0]
+    cdef Py_ssize_t n_nan = 0, n_inf = 0
+    cdef double v
+    for i in range(n):
+        v = arr[i]
+        if v != v:
+            n_nan += 1
+        elif v == INF or v == -INF:
+            n_inf += 1
+        else:
+            if v < mn:
+                mn = v
+            if v > mx:
+                mx = v
+    return mn, mx, n_nan, n_inf
@@ -107,6 +107,7 @@ from nipy.io.imageformats.volumeutils import pretty_mapping, endian_codes, \
 
 from nipy.io.imageformats.header_ufuncs import read_data, write_data, \
     adapt_header, read_unscaled_data
+from nipy.io.imageformats.arrayproxy import ArrayProxy
 
 from nipy.io.imageformats import imageglobals as imageglobals
 from nipy.io.imageformats.spatialimages import SpatialImage
@@ -1077,6 +1078,35 @@ class AnalyzeImage(SpatialImage):
         self._data = read_data(self._header, allopen(fname))
         return self._data
 
+    def get_data_proxy(self):
+        ''' Return array-like proxy for the image data
+
+        If the data is already in memory, return the data array.
+        Otherwise return an ``ArrayProxy`` for the image file, that
+        applies the header scaling only to the parts of the array that
+        you index, so you can read (for example) a single volume of a 4D
+        image without loading and scaling the whole image.  Use
+        ``np.asarray(proxy)`` to get the full scaled array.
+
+        Unlike ``get_data``, this does not cache the data in the image.
+
+        Examples
+        --------
+        >>> data = np.arange(24).reshape((2, 3, 4))
+        >>> img = AnalyzeImage(data, np.eye(4))
+        >>> img.get_data_proxy() is data
+        True
+        '''
+        if not self._data is None:
+            return self._data
+        if not self._files:
+            return None
+        try:
+            fname = self._files['image']
+        except KeyError:
+            return None
+        return ArrayProxy(fname, self._header)
+
     def get_unscaled_data(self):
         """ Return image data without image scaling applied
 
@@ -0,0 +1,198 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+''' Array proxy giving lazy, scaled access to image data on disk
+
+The proxy keeps hold of the unscaled array from the image file (usually
+a read-only ``np.memmap``), and applies the header slope and intercept
+only to the parts of the array that you index.  Converting the proxy to
+an array with ``np.asarray`` gives the same result as
+``header_ufuncs.read_data``.
+
+Where the index selects a range along the last (slowest changing) axis,
+and the proxy has not yet read the whole array, we read only that part
+of the file.  For compressed files, this means that we can read (for
+example) one volume from a 4D ``.nii.gz`` file without decompressing and
+storing the whole image.
+
+Examples
+--------
+>>> from StringIO import StringIO
+>>> from nipy.io.imageformats.spm99analyze import Spm99AnalyzeHeader
+>>> from nipy.io.imageformats.header_ufuncs import write_data
+>>> hdr = Spm99AnalyzeHeader()
+>>> hdr.set_data_shape((2, 3, 4))
+>>> hdr.set_data_dtype(np.int16)
+>>> hdr.set_slope_inter(2.0, 0.0)
+>>> str_io = StringIO()
+>>> write_data(hdr, np.arange(24).reshape((2, 3, 4)), str_io)
+>>> proxy = ArrayProxy(str_io, hdr)
+>>> proxy.shape
+(2, 3, 4)
+>>> np.all(proxy[1, 2] == [40, 42, 44, 46])
+True
+>>> np.all(np.asarray(proxy)[1, 2] == [40, 42, 44, 46])
+True
+'''
+
+import numpy as np
+
+from nipy.io.imageformats.volumeutils import allopen, array_from_file
+from nipy.io.imageformats.header_ufuncs import read_unscaled_data
+
+
+class ArrayProxy(object):
+    ''' Array-like object reading scaled image data on demand
+
+    Attributes
+    ----------
+    file_like : str or file-like
+       filename or open file-like object containing the image data
+    header : header
+       analyze-like header implementing ``get_slope_inter`` and the
+       requirements for ``header_ufuncs.read_unscaled_data``.  We keep
+       a copy of the header passed at creation, so later changes to the
+       image header do not change the interpretation of the data.
+    '''
+    def __init__(self, file_like, header):
+        self.file_like = file_like
+        self.header = header.copy()
+        self._fileobj = None
+        self._unscaled = None
+
+    @property
+    def shape(self):
+        return self.header.get_data_shape()
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def _get_fileobj(self):
+        if self._fileobj is None:
+            self._fileobj = allopen(self.file_like)
+        return self._fileobj
+
+    def get_unscaled(self):
+        ''' Return unscaled array-like for the data on disk
+
+        The returned object is cached; for uncompressed files it is a
+        read-only memmap, so this does not read the data into memory.
+        '''
+        if self._unscaled is None:
+            self._unscaled = read_unscaled_data(self.header,
+                                                self._get_fileobj())
+        return self._unscaled
+
+    def _scaled(self, arr):
+        ''' Return `arr` with header scaling applied
+
+        We follow ``header_ufuncs.read_data`` in ignoring scaling when
+        the slope is None or 0, but we never scale in place, because
+        `arr` may be a view onto the cached unscaled data.
+        '''
+        slope, inter = self.header.get_slope_inter()
+        if not slope:
+            return arr
+        if slope != 1.0:
+            arr = arr * slope
+        if inter:
+            arr = arr + inter
+        return arr
+
+    def __array__(self, dtype=None):
+        arr = np.asanyarray(self._scaled(self.get_unscaled()))
+        if dtype is not None and arr.dtype != dtype:
+            arr = arr.astype(dtype)
+        return arr
+
+    def _read_slowest(self, start, stop):
+        ''' Read unscaled data for ``[..., start:stop]`` from file '''
+        hdr = self.header
+        shape = self.shape
+        dtype = hdr.get_data_dtype()
+        slab_bytes = int(np.prod(shape[:-1])) * dtype.itemsize
+        offset = hdr.get_data_offset() + start * slab_bytes
+        return array_from_file(shape[:-1] + (stop - start,),
+                               dtype,
+                               self._get_fileobj(),
+                               offset)
+
+    def __getitem__(self, slicer):
+        if self._unscaled is None:
+            split = split_slowest(slicer, self.shape)
+            if not split is None:
+                start, stop, slicer = split
+                arr = self._read_slowest(start, stop)
+                return self._scaled(arr[slicer])
+        return self._scaled(self.get_unscaled()[slicer])
+
+
+def split_slowest(slicer, shape):
+    ''' Split `slicer` into range on last axis, and slicer for that range
+
+    Parameters
+    ----------
+    slicer : object
+       object that could be used to index an array of shape `shape`
+    shape : sequence
+       shape of array
+
+    Returns
+    -------
+    split : None or tuple
+       None if `slicer` is not a simple combination of integers, slices
+       and at most one Ellipsis, or if it selects the whole of the last
+       axis.  Otherwise a tuple of ``(start, stop, new_slicer)`` where
+       ``arr[slicer]`` is the same as ``arr[..., start:stop][new_slicer]``
+
+    Examples
+    --------
+    >>> split_slowest((Ellipsis, 2), (3, 4, 5))
+    (2, 3, (slice(None, None, None), slice(None, None, None), 0))
+    >>> split_slowest((0, slice(None), slice(1, 5, 2)), (3, 4, 5))
+    (1, 4, (0, slice(None, None, None), slice(0, 3, 2)))
+    >>> split_slowest(1, (3, 4, 5)) is None
+    True
+    '''
+    if not isinstance(slicer, tuple):
+        slicer = (slicer,)
+    n_dim = len(shape)
+    if n_dim == 0:
+        return None
+    is_ellipsis = [s is Ellipsis for s in slicer]
+    n_ellipsis = is_ellipsis.count(True)
+    if n_ellipsis > 1:
+        return None
+    if n_ellipsis == 1:
+        ind = is_ellipsis.index(True)
+        n_fill = n_dim - len(slicer) + 1
+        if n_fill < 0:
+            return None
+        slicer = slicer[:ind] + (slice(None),) * n_fill + slicer[ind+1:]
+    if len(slicer) != n_dim:
+        return None
+    for s in slicer:
+        if isinstance(s, bool):
+            return None
+        if not isinstance(s, (slice, int, long, np.integer)):
+            return None
+    last = slicer[-1]
+    n = shape[-1]
+    if isinstance(last, slice):
+        start, stop, step = last.indices(n)
+        if step < 0 or stop <= start:
+            return None
+        # trim to last selected element
+        stop = start + ((stop - start - 1) // step) * step + 1
+        new_last = slice(0, stop - start, step)
+    else:
+        start = int(last)
+        if start < 0:
+            start += n
+        if start < 0 or start >= n:
+            return None
+        stop = start + 1
+        new_last = 0
+    if start == 0 and stop == n:
+        return None
+    return start, stop, slicer[:-1] + (new_last,)
@@ -52,17 +52,21 @@ def read_data(hdr, fileobj):
     data = read_unscaled_data(hdr, fileobj)
     if slope is None:
         return data
-    # The data may be from a memmap, and not writeable
+    # Scale in place if we can.  We can't if the data is from a memmap,
+    # and not writeable, or if the data is integer, and needs a new
+    # floating point array for the scaled values.
+    in_place = data.flags.writeable and data.dtype.kind in 'fc'
     if slope:
         if slope !=1.0:
-            try:
+            if in_place:
                 data *= slope
-            except ValueError:
+            else:
                 data = data * slope
+                in_place = True
         if inter:
-            try:
+            if in_place:
                 data += inter
-            except ValueError:
+            else:
                 data = data + inter
     return data
 
@@ -0,0 +1,209 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+''' Read-only gzip file with random access via an index of seek points
+
+``IndexedGzipFile`` decompresses in chunks, and can decompress directly
+into a preallocated buffer with ``readinto``, so reading an image from a
+``.gz`` file does not need a string copy of the whole decompressed data.
+
+As it decompresses, it stores a copy of the decompressor state every
+``spacing`` bytes of uncompressed data (as in the ``zran.c`` example
+from the zlib distribution).  A later ``seek`` - forwards or backwards -
+restarts decompression from the closest seek point before the target,
+rather than from the start of the file.  Seeking into a region of the
+file that has not been decompressed yet still has to decompress up to
+that point, to build the index.
+
+The file may contain several concatenated gzip members, as allowed by
+the gzip standard.
+
+Examples
+--------
+>>> import gzip
+>>> from StringIO import StringIO
+>>> str_io = StringIO()
+>>> gzf = gzip.GzipFile(mode='wb', fileobj=str_io)
+>>> gzf.writelines(['0123456789'] * 10)
+>>> gzf.close()
+>>> str_io.seek(0)
+>>> igz = IndexedGzipFile(str_io)
+>>> igz.read(4)
+'0123'
+>>> igz.seek(95)
+>>> igz.read()
+'56789'
+>>> igz.seek(2)
+>>> igz.tell()
+2
+>>> igz.read(3)
+'234'
+'''
+
+import zlib
+from bisect import bisect_right
+
+# wbits value telling zlib to expect (and check) a gzip header and trailer
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class IndexedGzipFile(object):
+    ''' Read-only file-like object for gzip files, with seek point index
+
+    Parameters
+    ----------
+    fileish : str or file-like
+       filename, or open file-like object implementing ``read``, ``seek``
+       and ``tell``, containing the compressed data starting at the
+       current position.
+    mode : str, optional
+       file mode.  Only reading is supported.
+    spacing : int, optional
+       approximate distance in bytes of uncompressed data between seek
+       points in the index.  Each seek point stores about 40K of
+       decompressor state.
+    chunk_size : int, optional
+       number of compressed bytes to read from the file at a time
+    '''
+    def __init__(self, fileish, mode='rb', spacing=4 * 1024 * 1024,
+                 chunk_size=64 * 1024):
+        if 'w' in mode or 'a' in mode or '+' in mode:
+            raise ValueError('IndexedGzipFile only supports reading')
+        if hasattr(fileish, 'read'):
+            self._fobj = fileish
+            self._own_fobj = False
+        else:
+            self._fobj = open(fileish, 'rb')
+            self._own_fobj = True
+        self.name = getattr(self._fobj, 'name', None)
+        self.mode = 'rb'
+        self.spacing = spacing
+        self.chunk_size = chunk_size
+        self._start = self._fobj.tell()
+        # seek points are (uncompressed offset, compressed offset,
+        # decompressor).  The compressed offset is the position in the
+        # file of the first byte not yet passed to the decompressor.
+        self._index = [(0, self._start, zlib.decompressobj(_GZIP_WBITS))]
+        self._index_offsets = [0]
+        self._size = None
+        self._restore(0)
+
+    def _restore(self, ind):
+        ''' Restart decompression from seek point `ind` in index '''
+        upos, cpos, dobj = self._index[ind]
+        self._fobj.seek(cpos)
+        self._cpos = cpos
+        self._upos = upos
+        self._dobj = dobj.copy()
+        self._pending = ''
+        self._member_start = False
+        self._eof = False
+
+    def _add_seek_point(self):
+        # Skip the ends of members, where there may be zero padding
+        if self._member_start:
+            return
+        last_upos = self._index_offsets[-1]
+        if self._upos - last_upos < self.spacing:
+            return
+        self._index.append((self._upos, self._cpos, self._dobj.copy()))
+        self._index_offsets.append(self._upos)
+
+    def _read_chunk(self, max_bytes):
+        ''' Return up to `max_bytes` (> 0) of decompressed data
+
+        Returns empty string only at the end of the file
+        '''
+        while not self._eof:
+            if not self._pending:
+                self._pending = self._fobj.read(self.chunk_size)
+                if not self._pending:
+                    self._eof = True
+                    break
+            if self._member_start:
+                # gzip files can be padded with zeros after a member
+                pending = self._pending.lstrip('\000')
+                self._cpos += len(self._pending) - len(pending)
+                self._pending = pending
+                if not pending:
+                    continue
+                self._member_start = False
+            n_in = len(self._pending)
+            data = self._dobj.decompress(self._pending, max_bytes)
+            unused = self._dobj.unused_data
+            if unused: # end of gzip member; start next
+                self._pending = unused
+                self._dobj = zlib.decompressobj(_GZIP_WBITS)
+                self._member_start = True
+            else:
+                self._pending = self._dobj.unconsumed_tail
+            self._cpos += n_in - len(self._pending)
+            if data:
+                self._upos += len(data)
+                self._add_seek_point()
+                return data
+        if self._size is None:
+            self._size = self._upos
+        return ''
+
+    def readinto(self, buf):
+        ''' Decompress into writeable byte buffer `buf`
+
+        Returns the number of bytes read, which will be less than the
+        size of the buffer only at the end of the file.
+        '''
+        mview = memoryview(buf)
+        if mview.itemsize != 1:
+            raise TypeError('Need byte buffer for readinto')
+        n_bytes = len(mview)
+        pos = 0
+        while pos < n_bytes:
+            data = self._read_chunk(n_bytes - pos)
+            if not data:
+                break
+            mview[pos:pos + len(data)] = data
+            pos += len(data)
+        return pos
+
+    def read(self, size=-1):
+        chunks = []
+        if size is None or size < 0:
+            while True:
+                data = self._read_chunk(self.chunk_size * 16)
+                if not data:
+                    break
+                chunks.append(data)
+            return ''.join(chunks)
+        while size > 0:
+            data = self._read_chunk(size)
+            if not data:
+                break
+            chunks.append(data)
+            size -= len(data)
+        return ''.join(chunks)
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset = self._upos + offset
+        elif whence != 0:
+            raise ValueError('Seek from end not supported')
+        if offset < 0:
+            raise IOError('Negative seek in read mode')
+        if not self._size is None:
+            offset = min(offset, self._size)
+        # Restart from closest seek point if that saves decompressing
+        ind = bisect_right(self._index_offsets, offset) - 1
+        if offset < self._upos or self._index_offsets[ind] > self._upos:
+            self._restore(ind)
+        while self._upos < offset:
+            if not self._read_chunk(min(offset - self._upos,
+                                        self.chunk_size * 16)):
+                break
+
+    def tell(self):
+        return self._upos
+
+    def close(self):
+        if self._own_fobj:
+            self._fobj.close()
+        self._index = []
+        self._index_offsets = []
@@ -1,10 +1,20 @@
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
 # module imports
+import os
+import fnmatch
+import cPickle
+
 from nipy.io.imageformats import volumeutils as vu
 from nipy.io.imageformats import spm2analyze as spm2
 from nipy.io.imageformats import nifti1
 from nipy.io.imageformats import minc
+from nipy.io.imageformats.imageglobals import logger
+
+#: file extensions of files holding image headers, and compressed
+#: versions of these
+header_extensions = ('.nii', '.hdr', '.mnc')
+compression_extensions = ('.gz', '.bz2')
 
 
 def load(filename, *args, **kwargs):
@@ -53,3 +63,255 @@ def load(filename, *args, **kwargs):
 def save(img, filename):
     ''' Save an image to file without changing format'''
     img.to_filename(filename)
+
+
+def _strip_compression(filename):
+    for ending in compression_extensions:
+        if filename.endswith(ending):
+            return filename[:-len(ending)]
+    return filename
+
+
+def load_header(filename, check=False):
+    ''' Load image header only, guessing at file type
+
+    For the Analyze-type formats, we read only the 348 bytes of the
+    header, and not the NIfTI extensions or the image data.
+
+    Parameters
+    ----------
+    filename : string or file-like
+       specification of filename or file to load header from
+    check : bool, optional
+       whether to run the header checks, as for image loading.  Default
+       is False, to save time.
+
+    Returns
+    -------
+    hdr : header
+       header of guessed type
+    '''
+    header_file = filename
+    is_nifti = False
+    if isinstance(filename, basestring):
+        fname = _strip_compression(filename)
+        if fname.endswith('.mnc'):
+            return minc.MincHeader.from_fileobj(vu.allopen(filename),
+                                                check=check)
+        is_nifti = fname.endswith('.nii')
+    if not is_nifti:
+        try:
+            files = nifti1.Nifti1Image.filespec_to_files(filename)
+        except ValueError:
+            raise RuntimeError('Cannot work out file type of "%s"' %
+                               filename)
+        header_file = files['header']
+    fileobj = vu.allopen(header_file)
+    try:
+        binaryblock = fileobj.read(nifti1.Nifti1Header._dtype.itemsize)
+    finally:
+        if not fileobj is header_file:
+            fileobj.close()
+    hdr = nifti1.Nifti1Header(binaryblock, check=False)
+    if not hdr['magic'] in ('ni1', 'n+1'):
+        return spm2.Spm2AnalyzeHeader(binaryblock, check=check)
+    if check:
+        hdr.check = True
+        hdr.check_fix()
+    return hdr
+
+
+class ImageInfo(object):
+    ''' Summary of image header information
+
+    Attributes
+    ----------
+    filename : string
+       filename of image
+    header_class : string
+       name of header class for image
+    shape : tuple
+       image data shape
+    zooms : tuple
+       voxel sizes
+    affine : (N+1, N+1) array
+       image affine from header.  For SPM Analyze images, this ignores
+       any ``.mat`` file.
+    dtype : dtype
+       data type of image on disk
+    '''
+    def __init__(self, filename, header_class, shape, zooms, affine,
+                 dtype):
+        self.filename = filename
+        self.header_class = header_class
+        self.shape = shape
+        self.zooms = zooms
+        self.affine = affine
+        self.dtype = dtype
+
+    @classmethod
+    def from_header(klass, filename, hdr):
+        return klass(filename,
+                     hdr.__class__.__name__,
+                     tuple(hdr.get_data_shape()),
+                     tuple(hdr.get_zooms()),
+                     hdr.get_best_affine(),
+                     hdr.get_data_dtype())
+
+    def __repr__(self):
+        return '%s(%r, %s, shape=%s, dtype=%s)' % (
+            self.__class__.__name__,
+            self.filename,
+            self.header_class,
+            self.shape,
+            self.dtype)
+
+
+def peek(filename, check=False):
+    ''' Return ``ImageInfo`` with shape, zooms, affine, dtype of image
+
+    Reads only the image header; see ``load_header``.
+
+    Parameters
+    ----------
+    filename : string
+       filename of image
+    check : bool, optional
+       whether to run the header checks.  Default is False.
+
+    Returns
+    -------
+    info : ``ImageInfo``
+    '''
+    return ImageInfo.from_header(filename, load_header(filename, check))
+
+
+def _is_header_file(filename):
+    return os.path.splitext(_strip_compression(filename))[1] in \
+        header_extensions
+
+
+def _read_cache(cache_file):
+    try:
+        fobj = open(cache_file, 'rb')
+    except IOError:
+        return {}
+    try:
+        try:
+            cache = cPickle.load(fobj)
+        except Exception:
+            logger.warning('Ignoring unreadable header cache "%s"'
+                           % cache_file)
+            return {}
+    finally:
+        fobj.close()
+    if not isinstance(cache, dict):
+        return {}
+    return cache
+
+
+def _write_cache(cache, cache_file):
+    # Write to temporary file and rename, so other readers see either
+    # the old cache or the new
+    tmp_file = '%s.%d.tmp' % (cache_file, os.getpid())
+    fobj = open(tmp_file, 'wb')
+    try:
+        cPickle.dump(cache, fobj, cPickle.HIGHEST_PROTOCOL)
+    finally:
+        fobj.close()
+    if os.name == 'nt' and os.path.exists(cache_file):
+        os.remove(cache_file)
+    os.rename(tmp_file, cache_file)
+
+
+def _peek_or_none(args):
+    filename, check = args
+    try:
+        return peek(filename, check)
+    except Exception, msg:
+        logger.warning('Could not read header of "%s": %s'
+                       % (filename, msg))
+        return None
+
+
+def scan_directory(path, pattern=None, cache_file=None, n_threads=None,
+                   check=False):
+    ''' Read image headers for images in directory tree `path`
+
+    Parameters
+    ----------
+    path : string
+       directory to search for images, including subdirectories
+    pattern : None or string, optional
+       glob pattern (as for ``fnmatch``) that image filenames (without
+       the directory) should match.  None (the default) matches files
+       with header extensions (``.nii``, ``.hdr``, ``.mnc``), maybe
+       compressed.
+    cache_file : None or string, optional
+       filename of cache of image information.  If the cache has an
+       entry for an image with matching file modification time and
+       size, we use the cached information instead of reading the
+       header.  We update the cache with new or changed images.  None
+       (the default) means no cache.
+    n_threads : None or int, optional
+       number of threads reading headers.  None (the default) means
+       one thread per CPU.
+    check : bool, optional
+       whether to run the header checks.  Default is False.
+
+    Returns
+    -------
+    infos : list
+       list of ``ImageInfo`` objects, sorted by filename.  We log and
+       omit files for which we could not read the header.
+    '''
+    filenames = []
+    for dirpath, dirnames, fnames in os.walk(path):
+        for fname in fnames:
+            if pattern is None:
+                if not _is_header_file(fname):
+                    continue
+            elif not fnmatch.fnmatch(fname, pattern):
+                continue
+            filenames.append(os.path.join(dirpath, fname))
+    filenames.sort()
+    cache = {}
+    if not cache_file is None:
+        cache = _read_cache(cache_file)
+    infos = {}
+    to_read = []
+    stamps = {}
+    for filename in filenames:
+        key = os.path.abspath(filename)
+        st = os.stat(filename)
+        stamps[key] = (st.st_mtime, st.st_size)
+        try:
+            mtime, size, info = cache[key]
+        except KeyError:
+            pass
+        else:
+            if (mtime, size) == stamps[key]:
+                info.filename = filename
+                infos[filename] = info
+                continue
+        to_read.append(filename)
+    if len(to_read) > 1 and n_threads != 1:
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(n_threads)
+        try:
+            read = pool.map(_peek_or_none,
+                            [(fname, check) for fname in to_read])
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        read = [_peek_or_none((fname, check)) for fname in to_read]
+    for filename, info in zip(to_read, read):
+        if info is None:
+            continue
+        infos[filename] = info
+        key = os.path.abspath(filename)
+        cache[key] = stamps[key] + (info,)
+    if to_read and not cache_file is None:
+        _write_cache(cache, cache_file)
+    return [infos[fname] for fname in filenames if fname in infos]
@@ -0,0 +1,158 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+''' Write NIfTI image data incrementally, through a memory map
+
+``Nifti1MemmapWriter`` writes the image header, and makes space in the
+file for the image data, when you create it.  You then write the data -
+for example, one slice at a time - into a writeable ``np.memmap`` of the
+data region of the file, so the whole image never needs to be in
+memory.  Closing the writer flushes the data to disk and rewrites the
+header with the display range (``cal_min``, ``cal_max``) of the values
+written.
+
+Examples
+--------
+>>> import os
+>>> import tempfile
+>>> from nipy.io.imageformats.nifti1 import Nifti1Image, load
+>>> img = Nifti1Image(None, np.eye(4))
+>>> hdr = img.get_header()
+>>> hdr.set_data_shape((2, 3, 4))
+>>> hdr.set_data_dtype(np.float32)
+>>> fd, fname = tempfile.mkstemp('.nii')
+>>> writer = Nifti1MemmapWriter(img, fname)
+>>> for i in range(4):
+...     writer[..., i] = i
+>>> writer.close()
+>>> img2 = load(fname)
+>>> print img2.get_data()[0, 0]
+[ 0.  1.  2.  3.]
+>>> print img2.get_header()['cal_max']
+3.0
+>>> os.close(fd)
+>>> os.unlink(fname)
+'''
+
+import numpy as np
+
+from nipy.io.imageformats.volumeutils import finite_stats, integer_types
+
+
+class Nifti1MemmapWriter(object):
+    ''' Write NIfTI image to disk through memory map of data region
+
+    Parameters
+    ----------
+    img : ``Nifti1Image``
+       image without data, giving the affine, and the header, with the
+       data shape and data dtype for the written image
+    filename : str
+       filename of image, implying single file (``.nii``) or file pair
+       (``.hdr``, ``.img``).  We cannot memory map compressed files.
+
+    Attributes
+    ----------
+    data : ``np.memmap``
+       writeable memory map of data region of image file, in the shape of
+       the image
+    '''
+    def __init__(self, img, filename):
+        files = img.filespec_to_files(filename)
+        for fname in files.values():
+            if fname.endswith('.gz') or fname.endswith('.bz2'):
+                raise ValueError('Cannot memory map compressed file "%s"'
+                                 % fname)
+        is_pair = files['header'] != files['image']
+        hdr = img.get_header().for_file_pair(is_pair)
+        hdr.set_slope_inter(1.0, 0.0)
+        shape = hdr.get_data_shape()
+        dtype = hdr.get_data_dtype()
+        offset = hdr.get_data_offset()
+        n_bytes = int(np.prod(shape)) * dtype.itemsize
+        hdrf = open(files['header'], 'wb')
+        try:
+            hdr.write_to(hdrf)
+            # No extensions
+            hdrf.write('\x00' * 4)
+        finally:
+            hdrf.close()
+        if is_pair:
+            imgf = open(files['image'], 'wb')
+        else:
+            imgf = open(files['image'], 'r+b')
+        try:
+            # Extend file to full size, without writing the data
+            if n_bytes:
+                imgf.seek(offset + n_bytes - 1)
+                imgf.write('\x00')
+        finally:
+            imgf.close()
+        if n_bytes:
+            self.data = np.memmap(files['image'],
+                                  dtype=dtype,
+                                  mode='r+',
+                                  offset=offset,
+                                  shape=shape,
+                                  order='F')
+        else: # cannot memory map empty region
+            self.data = np.zeros(shape, dtype)
+        self._header = hdr
+        self._files = files
+        self._mn = None
+        self._mx = None
+        self.closed = False
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    @property
+    def ndim(self):
+        return self.data.ndim
+
+    def get_header(self):
+        return self._header
+
+    def __array__(self):
+        return self.data
+
+    def __getitem__(self, item):
+        return self.data[item]
+
+    def __setitem__(self, item, value):
+        ''' Set data, keeping track of range of values written '''
+        if self.closed:
+            raise ValueError('Writer has been closed')
+        value = np.asarray(value)
+        if value.dtype.type in np.sctypes['float'] + integer_types:
+            mn, mx, n_nan, n_inf = finite_stats(value)
+            if mn != np.inf:
+                if self._mn is None:
+                    self._mn, self._mx = mn, mx
+                else:
+                    self._mn = min(mn, self._mn)
+                    self._mx = max(mx, self._mx)
+        self.data[item] = value
+
+    def close(self):
+        ''' Flush data to disk, write header with range of data written
+
+        The range only covers the values set by indexing the writer,
+        rather than values written directly into ``data``.
+        '''
+        if self.closed:
+            return
+        if isinstance(self.data, np.memmap):
+            self.data.flush()
+        self.data = None
+        hdr = self._header
+        if not self._mn is None:
+            hdr['cal_min'] = self._mn
+            hdr['cal_max'] = self._mx
+        # Rewrite header only; data is already in place
+        hdrf = open(self._files['header'], 'r+b')
+        try:
+            hdr.write_to(hdrf)
+        finally:
+            hdrf.close()
+        self.closed = True
@@ -0,0 +1,175 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+''' Write-only gzip file compressing blocks of data in parallel
+
+``ParallelGzipFile`` splits the data written to it into blocks of fixed
+size, compresses each block as a separate gzip member on a pool of
+threads, and writes the members to the file in order.  The gzip
+standard allows a file to contain several concatenated members, and the
+result decompresses to the data written, with ``gzip``, ``zcat``, and
+the NIfTI reading libraries.
+
+zlib releases the Python global interpreter lock while compressing, so
+the threads do compress in parallel.
+
+Examples
+--------
+>>> import gzip
+>>> from StringIO import StringIO
+>>> str_io = StringIO()
+>>> pgz = ParallelGzipFile(str_io, block_size=20, n_threads=2)
+>>> pgz.write('0123456789' * 10)
+>>> pgz.tell()
+100
+>>> pgz.close()
+>>> str_io.seek(0)
+>>> gzip.GzipFile(fileobj=str_io).read() == '0123456789' * 10
+True
+'''
+
+import zlib
+from collections import deque
+
+# wbits value telling zlib to write a gzip header and trailer
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def compress_block(data, compresslevel):
+    ''' Return string `data` compressed as a complete gzip member '''
+    cobj = zlib.compressobj(compresslevel, zlib.DEFLATED, _GZIP_WBITS)
+    return cobj.compress(data) + cobj.flush()
+
+
+def _cpu_count():
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except (ImportError, NotImplementedError):
+        return 1
+
+
+class ParallelGzipFile(object):
+    ''' Write-only file-like object writing blocks as gzip members
+
+    Parameters
+    ----------
+    fileish : str or file-like
+       filename, or open file-like object implementing ``write``
+    mode : str, optional
+       file mode.  Only writing is supported.
+    compresslevel : int, optional
+       zlib compression level from 1 (fastest) to 9 (smallest)
+    block_size : int, optional
+       number of bytes of uncompressed data in each gzip member.
+       Smaller blocks give more parallelism, and use less memory, but
+       compress a little less well.
+    n_threads : None or int, optional
+       number of threads to compress with.  None (the default) means
+       one thread per CPU.
+    '''
+    def __init__(self, fileish, mode='wb', compresslevel=9,
+                 block_size=4 * 1024 * 1024, n_threads=None):
+        if not 'w' in mode:
+            raise ValueError('ParallelGzipFile only supports writing')
+        if hasattr(fileish, 'write'):
+            self._fobj = fileish
+            self._own_fobj = False
+        else:
+            self._fobj = open(fileish, 'wb')
+            self._own_fobj = True
+        self.name = getattr(self._fobj, 'name', None)
+        self.mode = 'wb'
+        self.compresslevel = compresslevel
+        self.block_size = block_size
+        if n_threads is None:
+            n_threads = _cpu_count()
+        self.n_threads = n_threads
+        self._pool = None
+        self._results = deque()
+        self._chunks = []
+        self._n_buffered = 0
+        self._pos = 0
+        self.closed = False
+
+    def _submit(self, block):
+        if self.n_threads < 2:
+            self._fobj.write(compress_block(block, self.compresslevel))
+            return
+        if self._pool is None:
+            from multiprocessing.pool import ThreadPool
+            self._pool = ThreadPool(self.n_threads)
+        self._results.append(self._pool.apply_async(
+            compress_block, (block, self.compresslevel)))
+        # Bound the memory used by blocks waiting to be written
+        while len(self._results) > 2 * self.n_threads:
+            self._fobj.write(self._results.popleft().get())
+
+    def _flush_results(self):
+        while self._results:
+            self._fobj.write(self._results.popleft().get())
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError('I/O operation on closed file')
+        if not isinstance(data, str):
+            data = memoryview(data).tobytes()
+        if not data:
+            return
+        self._chunks.append(data)
+        self._n_buffered += len(data)
+        self._pos += len(data)
+        if self._n_buffered < self.block_size:
+            return
+        data = ''.join(self._chunks)
+        n_whole = len(data) - len(data) % self.block_size
+        for start in range(0, n_whole, self.block_size):
+            self._submit(data[start:start + self.block_size])
+        rest = data[n_whole:]
+        self._chunks = [rest]
+        self._n_buffered = len(rest)
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=0):
+        ''' Seek forwards by writing zeros, as for ``gzip.GzipFile`` '''
+        if whence == 1:
+            offset = self._pos + offset
+        elif whence != 0:
+            raise ValueError('Seek from end not supported')
+        if offset < self._pos:
+            raise IOError('Negative seek in write mode')
+        self.write('\x00' * (offset - self._pos))
+
+    def flush(self):
+        ''' Compress and write all buffered data
+
+        As for ``gzip.GzipFile``, flushing often will make the
+        compression worse, because each flush ends a gzip member.
+        '''
+        if self._n_buffered:
+            self._submit(''.join(self._chunks))
+            self._chunks = []
+            self._n_buffered = 0
+        self._flush_results()
+        self._fobj.flush()
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._pos == 0: # write valid gzip file for empty data
+                self._submit('')
+            self.flush()
+        finally:
+            self.closed = True
+            if not self._pool is None:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
+            if self._own_fobj:
+                self._fobj.close()
+
+    def __del__(self):
+        if not getattr(self, 'closed', True):
+            self.close()
@@ -1,13 +1,16 @@
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
 import os.path
-import numpy.core
+import numpy as np
 
 def configuration(parent_package='',top_path=None):
     from numpy.distutils.misc_util import Configuration
     config = Configuration('imageformats', parent_package, top_path)
     config.add_subpackage('testing')
 
+    config.add_extension('_finite_range', sources=['_finite_range.pyx'],
+                         include_dirs=[np.get_include()])
+
     config.add_data_dir('tests')
 
     return config
@@ -0,0 +1,77 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+''' Tests for array proxy '''
+
+import os
+import tempfile
+
+from StringIO import StringIO
+
+import numpy as np
+
+import nipy.io.imageformats.nifti1 as ni1
+from nipy.io.imageformats.arrayproxy import ArrayProxy
+from nipy.io.imageformats.header_ufuncs import write_data
+
+from numpy.testing import assert_array_equal, assert_array_almost_equal
+from nose.tools import assert_true, assert_equal
+
+
+def test_proxy_scaling():
+    shape = (2, 3, 4, 5)
+    hdr = ni1.Nifti1Header()
+    hdr.set_data_shape(shape)
+    hdr.set_data_dtype(np.int16)
+    arr = np.arange(np.prod(shape)).reshape(shape)
+    str_io = StringIO()
+    write_data(hdr, arr, str_io)
+    # no scaling, we get the unscaled data back
+    proxy = ArrayProxy(str_io, hdr)
+    yield assert_equal, proxy.shape, shape
+    yield assert_equal, proxy.ndim, 4
+    yield assert_array_equal, np.asarray(proxy), arr
+    yield assert_equal, proxy[..., 2].dtype, np.int16
+    # numpy may pass a dtype to __array__
+    cast = np.asarray(proxy, dtype=np.float32)
+    yield assert_equal, cast.dtype, np.float32
+    yield assert_array_equal, cast, arr
+    yield assert_equal, np.array(proxy, dtype=np.int16).dtype, np.int16
+    # with slope and intercept
+    hdr.set_slope_inter(2.0, 10.0)
+    proxy = ArrayProxy(str_io, hdr)
+    scaled = arr * 2.0 + 10.0
+    yield assert_array_equal, np.asarray(proxy), scaled
+    yield assert_array_equal, proxy[..., 3], scaled[..., 3]
+    yield assert_array_equal, proxy[1, :, 2], scaled[1, :, 2]
+    # The proxy copies the header, later changes do not affect it
+    hdr.set_slope_inter(1.0, 0.0)
+    yield assert_array_equal, proxy[0], scaled[0]
+    # Indexing does not change the cached unscaled data
+    yield assert_array_equal, proxy.get_unscaled(), arr
+
+
+def test_image_proxy():
+    shape = (2, 3, 4, 5)
+    data = np.random.normal(size=shape).astype(np.float32)
+    img = ni1.Nifti1Image(data, np.eye(4))
+    img.set_data_dtype(np.int16)
+    # Proxy for in-memory data is just the data
+    yield assert_true, img.get_data_proxy() is data
+    fd, fname = tempfile.mkstemp('.nii')
+    os.close(fd)
+    try:
+        img.to_filename(fname)
+        img2 = ni1.load(fname)
+        proxy = img2.get_data_proxy()
+        yield assert_true, isinstance(proxy, ArrayProxy)
+        yield assert_equal, proxy.shape, shape
+        # memmap kept unscaled
+        yield assert_equal, proxy.get_unscaled().dtype, np.int16
+        scaled = img2.get_data()
+        yield assert_array_almost_equal, data, scaled, 4
+        yield assert_array_equal, np.asarray(proxy), scaled
+        for i in range(shape[-1]):
+            yield assert_array_equal, proxy[..., i], scaled[..., i]
+        del proxy
+    finally:
+        os.remove(fname)
@@ -3,6 +3,7 @@
 ''' Tests for loader function '''
 
 import os
+import shutil
 import tempfile
 
 from StringIO import StringIO
@@ -171,3 +172,91 @@ def test_negative_load_save():
     re_img = nf.Nifti1Image.from_files(files)
     yield assert_array_almost_equal, re_img.get_data(), data, 4
 
+
+
+def test_load_header_peek():
+    shape = (2, 4, 6)
+    data = np.arange(np.prod(shape), dtype=np.int16).reshape(shape)
+    affine = np.diag([1, 2, 3, 1])
+    affine[:3,3] = [3,2,1]
+    img = ni1.Nifti1Image(data, affine)
+    tmpdir = tempfile.mkdtemp()
+    try:
+        nifn = os.path.join(tmpdir, 'image.nii.gz')
+        sifn = os.path.join(tmpdir, 'sub', 'image.img')
+        os.mkdir(os.path.dirname(sifn))
+        ni1.save(img, nifn)
+        spm2.save(img, sifn)
+        for fname, klass in ((nifn, ni1.Nifti1Header),
+                             (sifn, spm2.Spm2AnalyzeHeader),
+                             (sifn[:-4] + '.hdr', spm2.Spm2AnalyzeHeader)):
+            hdr = nils.load_header(fname)
+            yield assert_equal, hdr.__class__, klass
+            yield assert_equal, hdr.get_data_shape(), shape
+            hdr = nils.load_header(fname, check=True)
+            yield assert_equal, hdr.__class__, klass
+            info = nils.peek(fname)
+            yield assert_equal, info.filename, fname
+            yield assert_equal, info.header_class, klass.__name__
+            yield assert_equal, info.shape, shape
+            yield assert_equal, info.zooms, (1, 2, 3)
+            # affine from header; ignores SPM .mat files
+            img2 = nils.load(fname)
+            yield (assert_array_equal, info.affine,
+                   img2.get_header().get_best_affine())
+            yield assert_equal, info.dtype, img2.get_data_dtype()
+        yield assert_array_equal, nils.peek(nifn).affine, affine
+        # Scan directory tree
+        infos = nils.scan_directory(tmpdir, n_threads=2)
+        yield (assert_equal, [info.filename for info in infos],
+               [nifn, sifn[:-4] + '.hdr'])
+        infos = nils.scan_directory(tmpdir, '*.img')
+        yield assert_equal, [info.filename for info in infos], [sifn]
+        # Files we can't read are left out
+        bad_fn = os.path.join(tmpdir, 'bad.nii')
+        open(bad_fn, 'wb').write('not an image')
+        infos = nils.scan_directory(tmpdir, '*.nii*', n_threads=1)
+        yield assert_equal, [info.filename for info in infos], [nifn]
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_scan_cache():
+    shape = (2, 3, 4)
+    data = np.zeros(shape, dtype=np.float32)
+    tmpdir = tempfile.mkdtemp()
+    cache_file = os.path.join(tmpdir, 'cache.pkl')
+    real_peek = nils.peek
+    peeked = []
+    def counting_peek(filename, check=False):
+        peeked.append(filename)
+        return real_peek(filename, check)
+    try:
+        nils.peek = counting_peek
+        fnames = [os.path.join(tmpdir, 'image%d.nii' % i) for i in range(4)]
+        for fname in fnames:
+            ni1.save(ni1.Nifti1Image(data, np.eye(4)), fname)
+        infos = nils.scan_directory(tmpdir, cache_file=cache_file)
+        yield assert_equal, sorted(peeked), fnames
+        yield assert_true, os.path.isfile(cache_file)
+        # Second scan comes from cache
+        peeked[:] = []
+        infos2 = nils.scan_directory(tmpdir, cache_file=cache_file)
+        yield assert_equal, peeked, []
+        yield (assert_equal, [i.shape for i in infos2],
+               [i.shape for i in infos])
+        # Changed file gets read again
+        ni1.save(ni1.Nifti1Image(np.zeros((5, 6, 7)), np.eye(4)), fnames[2])
+        infos3 = nils.scan_directory(tmpdir, cache_file=cache_file)
+        yield assert_equal, peeked, [fnames[2]]
+        yield assert_equal, infos3[2].shape, (5, 6, 7)
+        # Corrupt cache ignored
+        open(cache_file, 'wb').write('rubbish')
+        peeked[:] = []
+        infos4 = nils.scan_directory(tmpdir, cache_file=cache_file,
+                                     n_threads=1)
+        yield assert_equal, peeked, fnames
+        yield assert_equal, len(infos4), 4
+    finally:
+        nils.peek = real_peek
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,156 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+''' Tests for indexed gzip reader '''
+
+import os
+import gzip
+import tempfile
+
+from StringIO import StringIO
+
+import numpy as np
+
+import nipy.io.imageformats.nifti1 as ni1
+from nipy.io.imageformats.indexedgzip import IndexedGzipFile
+from nipy.io.imageformats.volumeutils import allopen, array_from_file
+
+from numpy.testing import assert_array_equal
+from nose.tools import assert_true, assert_equal, assert_raises
+
+
+class CountingIO(StringIO):
+    ''' StringIO that counts the bytes read '''
+    def __init__(self, *args):
+        StringIO.__init__(self, *args)
+        self.n_read = 0
+
+    def read(self, n=-1):
+        data = StringIO.read(self, n)
+        self.n_read += len(data)
+        return data
+
+
+def _gz_string(data, n_members=1, padding=0):
+    ''' Return `data` compressed as `n_members` gzip members '''
+    str_io = StringIO()
+    n = len(data)
+    for i in range(n_members):
+        gzf = gzip.GzipFile(mode='wb', fileobj=str_io)
+        gzf.write(data[i * n // n_members:(i + 1) * n // n_members])
+        gzf.close()
+        str_io.write('\x00' * padding)
+    return str_io.getvalue()
+
+
+def _some_data(n=200000):
+    # compressible but not trivial data
+    rng = np.random.RandomState(42)
+    return rng.randint(0, 16, size=n).astype(np.uint8).tostring()
+
+
+def test_read_seek():
+    data = _some_data()
+    for n_members, padding in ((1, 0), (3, 0), (4, 10)):
+        gz_str = _gz_string(data, n_members, padding)
+        igz = IndexedGzipFile(StringIO(gz_str),
+                              spacing=10000,
+                              chunk_size=1000)
+        yield assert_equal, igz.read(), data
+        yield assert_equal, igz.read(), ''
+        yield assert_true, len(igz._index) > 10
+        rng = np.random.RandomState(0)
+        for offset in rng.randint(0, len(data), size=20):
+            igz.seek(offset)
+            yield assert_equal, igz.tell(), offset
+            yield assert_equal, igz.read(1000), data[offset:offset+1000]
+        igz.seek(100)
+        igz.seek(50, 1)
+        yield assert_equal, igz.read(10), data[150:160]
+        yield assert_raises, ValueError, igz.seek, 0, 2
+
+
+def test_seek_uses_index():
+    data = _some_data()
+    c_io = CountingIO(_gz_string(data))
+    igz = IndexedGzipFile(c_io, spacing=10000, chunk_size=1000)
+    # First seek decompresses from the start
+    igz.seek(len(data) - 10)
+    yield assert_equal, igz.read(), data[-10:]
+    n_read = c_io.n_read
+    # Going back now only needs decompression from nearest seek point
+    igz.seek(len(data) // 2)
+    yield assert_equal, igz.read(10), data[len(data)//2:len(data)//2+10]
+    yield assert_true, c_io.n_read - n_read < n_read // 4
+
+
+def test_readinto():
+    data = _some_data()
+    igz = IndexedGzipFile(StringIO(_gz_string(data, 2)))
+    buf = np.zeros((len(data) + 10,), dtype=np.uint8)
+    yield assert_equal, igz.readinto(buf), len(data)
+    yield assert_equal, buf[:len(data)].tostring(), data
+    yield assert_raises, TypeError, igz.readinto, np.zeros(10, np.int16)
+    # array_from_file reads into array, not from string
+    igz.seek(0)
+    arr = array_from_file((len(data),), np.dtype(np.uint8), igz)
+    yield assert_equal, arr.tostring(), data
+    yield assert_true, arr.flags.writeable
+
+
+def test_allopen_gz():
+    data = _some_data(1000)
+    fd, fname = tempfile.mkstemp('.gz')
+    os.close(fd)
+    try:
+        gzf = allopen(fname, 'wb')
+        gzf.write(data)
+        gzf.close()
+        fobj = allopen(fname)
+        yield assert_true, isinstance(fobj, IndexedGzipFile)
+        # file-like objects, read only ones too, pass through
+        yield assert_true, allopen(fobj) is fobj
+        yield assert_equal, fobj.read(), data
+        fobj.close()
+    finally:
+        os.remove(fname)
+
+
+def test_proxy_volume_gz():
+    shape = (4, 5, 6, 7)
+    data = np.arange(np.prod(shape), dtype=np.int16).reshape(shape)
+    img = ni1.Nifti1Image(data, np.eye(4))
+    fd, fname = tempfile.mkstemp('.nii.gz')
+    os.close(fd)
+    try:
+        img.to_filename(fname)
+        img2 = ni1.load(fname)
+        proxy = img2.get_data_proxy()
+        for i in (3, 1, 6, 0):
+            yield assert_array_equal, proxy[..., i], data[..., i]
+        yield assert_array_equal, proxy[1, :, 2, 2:5], data[1, :, 2, 2:5]
+        # we didn't need to read the whole array into the proxy
+        yield assert_true, proxy._unscaled is None
+        # but we do for negative steps
+        yield assert_array_equal, proxy[..., ::-2], data[..., ::-2]
+        yield assert_array_equal, img2.get_data(), data
+    finally:
+        os.remove(fname)
+
+
+def test_scaled_gz():
+    # Integer data read into writeable array still gets scaled to float
+    data = np.arange(24).reshape((2, 3, 4)) * 10000.5
+    img = ni1.Nifti1Image(data, np.eye(4))
+    img.set_data_dtype(np.int16)
+    fd, fname = tempfile.mkstemp('.nii.gz')
+    os.close(fd)
+    try:
+        img.to_filename(fname)
+        img2 = ni1.load(fname)
+        yield assert_equal, img2.get_data_dtype(), np.dtype(np.int16)
+        slope = img2.get_header()['scl_slope']
+        yield assert_true, slope > 1
+        yield assert_equal, img2.get_data().dtype.kind, 'f'
+        yield assert_true, np.all(np.abs(img2.get_data() - data) <= slope)
+    finally:
+        os.remove(fname)
@@ -0,0 +1,108 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+''' Tests for parallel gzip writer '''
+
+import os
+import gzip
+import tempfile
+
+from StringIO import StringIO
+
+import numpy as np
+
+import nipy.io.imageformats.nifti1 as ni1
+import nipy.io.imageformats.volumeutils as vu
+from nipy.io.imageformats.parallelgzip import ParallelGzipFile
+from nipy.io.imageformats.indexedgzip import IndexedGzipFile
+
+from numpy.testing import assert_array_equal
+from nose.tools import assert_true, assert_equal, assert_raises
+
+
+def _some_data(n=100000):
+    rng = np.random.RandomState(42)
+    return rng.randint(0, 16, size=n).astype(np.uint8).tostring()
+
+
+def test_round_trip():
+    data = _some_data()
+    for n_threads in (1, 2, 4):
+        for block_size in (1000, 12345, 200000):
+            str_io = StringIO()
+            pgz = ParallelGzipFile(str_io,
+                                   compresslevel=1,
+                                   block_size=block_size,
+                                   n_threads=n_threads)
+            # write in pieces not matching the block size
+            for start in range(0, len(data), 7000):
+                pgz.write(data[start:start + 7000])
+            yield assert_equal, pgz.tell(), len(data)
+            pgz.close()
+            gz_str = str_io.getvalue()
+            # Number of gzip members
+            n_members = gz_str.count('\x1f\x8b\x08')
+            yield assert_true, n_members >= len(data) // block_size
+            # Standard reader and our own reader
+            yield (assert_equal,
+                   gzip.GzipFile(fileobj=StringIO(gz_str)).read(),
+                   data)
+            yield assert_equal, IndexedGzipFile(StringIO(gz_str)).read(), data
+
+
+def test_seek_write():
+    str_io = StringIO()
+    pgz = ParallelGzipFile(str_io, block_size=10, n_threads=2)
+    pgz.write('abc')
+    pgz.seek(8)
+    pgz.write(np.array([1, 2], dtype=np.uint8))
+    yield assert_raises, IOError, pgz.seek, 5
+    pgz.close()
+    yield assert_raises, ValueError, pgz.write, 'more'
+    str_io.seek(0)
+    yield (assert_equal,
+           gzip.GzipFile(fileobj=str_io).read(),
+           'abc' + '\x00' * 5 + '\x01\x02')
+    # Empty file is still a valid gzip file
+    str_io = StringIO()
+    ParallelGzipFile(str_io).close()
+    str_io.seek(0)
+    yield assert_equal, gzip.GzipFile(fileobj=str_io).read(), ''
+
+
+def test_allopen_threads():
+    data = _some_data(1000)
+    fd, fname = tempfile.mkstemp('.gz')
+    os.close(fd)
+    try:
+        fobj = vu.allopen(fname, 'wb', compress_threads=2, block_size=100)
+        yield assert_true, isinstance(fobj, ParallelGzipFile)
+        yield assert_equal, fobj.compresslevel, vu.default_compresslevel
+        fobj.write(data)
+        fobj.close()
+        yield assert_true, gzip.open(fname).read() == data
+        fobj = vu.allopen(fname, 'wb')
+        yield assert_true, isinstance(fobj, gzip.GzipFile)
+        fobj.close()
+    finally:
+        os.remove(fname)
+
+
+def test_save_parallel():
+    shape = (10, 11, 12, 5)
+    data = np.random.normal(size=shape).astype(np.float32)
+    img = ni1.Nifti1Image(data, np.eye(4))
+    fd, fname = tempfile.mkstemp('.nii.gz')
+    os.close(fd)
+    threads, block_size = (vu.default_compress_threads,
+                           vu.default_compress_block_size)
+    try:
+        vu.default_compress_threads = 3
+        vu.default_compress_block_size = 5000
+        img.to_filename(fname)
+        img2 = ni1.load(fname)
+        yield assert_array_equal, img2.get_data(), data
+        yield assert_equal, gzip.open(fname).read(348)[344:], 'n+1\x00'
+    finally:
+        vu.default_compress_threads = threads
+        vu.default_compress_block_size = block_size
+        os.remove(fname)
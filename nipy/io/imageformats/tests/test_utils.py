@@ -8,6 +8,7 @@ import tempfile
 
 import numpy as np
 
+import nipy.io.imageformats.volumeutils as vu
 from nipy.io.imageformats.volumeutils import array_from_file, \
     array_to_file, calculate_scale, scale_min_max, can_cast
 
@@ -112,8 +113,67 @@ def test_array_to_file():
     # How weird?  Look at arr.astype(np.int64)
     data_back = write_return(arr, str_io, np.dtype(np.int64), nan2zero=False) 
     yield assert_array_equal, data_back, arr.astype(np.int64)
-    
-    
+    # scaling integers works in floating point
+    arr = np.array([-1000, 0, 1000, 3000], dtype=np.int32)
+    data_back = write_return(arr, str_io, np.dtype(np.int16), 1000, 20)
+    yield assert_array_equal, data_back, [-100, -50, 0, 100]
+    # thresholds of 0 still threshold
+    arr = np.array([-np.inf, -1, 0, np.inf])
+    data_back = write_return(arr, str_io, np.dtype(np.int16),
+                             0.0, 1.0, -1, 0)
+    yield assert_array_equal, data_back, [-1, -1, 0, 0]
+
+
+def test_array_to_file_blocks():
+    # Writing in small blocks gives the same as writing in one go
+    rng = np.random.RandomState(1)
+    arr = rng.normal(size=(5, 6, 7)) * 100
+    arr[1, 2, 3] = np.nan
+    arr[2, 3, 4] = np.inf
+    str_io = StringIO()
+    block_size = vu.default_write_block_size
+    try:
+        for args in ((), (-10.0, 2.0, -250.0, 250.0)):
+            for order in 'FC':
+                vu.default_write_block_size = 1000000
+                big = write_return(arr, str_io, np.dtype(np.int16),
+                                   *args, **dict(order=order))
+                for bs in (1, 100, 500):
+                    vu.default_write_block_size = bs
+                    small = write_return(arr, str_io,
+                                         np.dtype(np.int16),
+                                         *args, **dict(order=order))
+                    yield assert_array_equal, big, small
+    finally:
+        vu.default_write_block_size = block_size
+
+
+class BufferRecorder(StringIO):
+    ''' StringIO recording the type of objects written '''
+    def __init__(self):
+        StringIO.__init__(self)
+        self.written_types = []
+
+    def write(self, data):
+        self.written_types.append(type(data))
+        StringIO.write(self, data)
+
+
+def test_array_to_file_fast():
+    # We write memory directly if no scaling and order matches
+    for order in 'FC':
+        arr = np.zeros((3, 4, 5), dtype=np.float32, order=order)
+        fobj = BufferRecorder()
+        array_to_file(arr, np.float32, fobj, order=order)
+        yield assert_equal, fobj.written_types, [buffer]
+        yield assert_equal, fobj.getvalue(), arr.tostring(order)
+        # Wrong order means copy in blocks, same result
+        other = order == 'F' and 'C' or 'F'
+        fobj = BufferRecorder()
+        array_to_file(arr, np.float32, fobj, order=other)
+        yield assert_equal, fobj.getvalue(), arr.tostring(other)
+
+
 def write_return(data, fileobj, out_dtype, *args, **kwargs):
     fileobj.truncate(0)
     array_to_file(data, out_dtype, fileobj, *args, **kwargs)
@@ -121,6 +181,65 @@ def write_return(data, fileobj, out_dtype, *args, **kwargs):
     return data
 
 
+def test_finite_stats():
+    rng = np.random.RandomState(42)
+    arr = rng.normal(size=(7, 8, 9))
+    arr[1, 2, 3] = np.nan
+    arr[4, 5, :] = np.nan
+    arr[0, 0, 0] = np.inf
+    arr[6, 7, 8] = -np.inf
+    finite = arr[np.isfinite(arr)]
+    exp = (finite.min(), finite.max(), 10, 2)
+    block_size = vu.default_write_block_size
+    block_stats = vu._block_stats
+    try:
+        # small blocks to check the combining across blocks, and numpy
+        # fallback if no compiled routines
+        for vu.default_write_block_size, vu._block_stats in (
+            (block_size, block_stats),
+            (100, block_stats),
+            (100, {})):
+            for tp in (np.float32, np.float64):
+                for code in '<>':
+                    a = arr.astype(np.dtype(tp).newbyteorder(code))
+                    # memory orders, non-contiguous
+                    for b in (a, a.T, a[::2, :, 1:], a.transpose(1, 0, 2)):
+                        mn, mx, n_nan, n_inf = vu.finite_stats(b)
+                        fb = b[np.isfinite(b)]
+                        yield assert_equal, (mn, mx), (fb.min(), fb.max())
+                        yield (assert_equal, (n_nan, n_inf),
+                               (np.isnan(b).sum(), np.isinf(b).sum()))
+                    yield assert_equal, vu.finite_stats(a)[2:], exp[2:]
+            iarr = (arr * 1000).astype(np.int32)
+            iarr[3, 1, :] = 7000
+            yield (assert_equal, vu.finite_stats(iarr),
+                   (iarr.min(), iarr.max(), 0, 0))
+    finally:
+        vu.default_write_block_size = block_size
+        vu._block_stats = block_stats
+    # No finite values
+    a = np.array([np.nan, np.inf, -np.inf], dtype=np.float32)
+    yield assert_equal, vu.finite_stats(a), (np.inf, -np.inf, 1, 2)
+    yield assert_equal, vu.finite_stats(np.zeros((0,))), (np.inf, -np.inf, 0, 0)
+    yield assert_raises, TypeError, vu.finite_stats, np.zeros((2,), np.complex)
+
+
+def test_calculate_scale_thresholds():
+    # We only need to threshold when there are values out of range
+    arr = np.arange(10, dtype=np.float32).reshape(2, 5)
+    scale, inter, mn, mx = calculate_scale(arr, np.dtype(np.int16), True)
+    yield assert_equal, (mn, mx), (None, None)
+    arr[0, 1] = np.inf
+    arr[1, 1] = -np.inf
+    res = calculate_scale(arr, np.dtype(np.int16), True)
+    yield assert_equal, res[:2], (scale, inter)
+    yield assert_equal, res[2:], (0, 9)
+    data_back = write_return(arr, StringIO(), np.dtype(np.int16), inter, scale,
+                             res[2], res[3])
+    # Infs thresholded to finite range
+    yield assert_equal, (data_back[0, 1], data_back[1, 1]), (32767, -32768)
+
+
 def test_scale_min_max():
     mx_dt = np.maximum_sctype(np.float)
     for tp in np.sctypes['uint'] + np.sctypes['int']:
@@ -20,6 +20,19 @@ endian_codes = (# numpy code, aliases
 #: default compression level when writing gz and bz2 files
 default_compresslevel = 1
 
+#: default number of threads for writing gz files.  If greater than 1,
+#: we compress blocks of ``default_compress_block_size`` bytes in
+#: parallel, and write them as concatenated gzip members.  None means one
+#: thread per CPU.
+default_compress_threads = 1
+
+#: default size of blocks compressed in parallel when writing gz files
+default_compress_block_size = 4 * 1024 * 1024
+
+#: approximate maximum size in bytes of the blocks of array data that we
+#: scale, cast and write at one time, when writing arrays to file
+default_write_block_size = 8 * 1024 * 1024
+
 #: convenience variables for numpy types
 floating_point_types = (np.sctypes['complex'] +
                         np.sctypes['float'])
@@ -364,14 +377,20 @@ def array_from_file(shape, dtype, infile, offset=0, order='F'):
         datasize = int(np.prod(shape) * dtype.itemsize)
         if datasize == 0:
             return np.array([])
-        data_str = infile.read(datasize)
-        if len(data_str) != datasize:
+        if hasattr(infile, 'readinto'):
+            # read straight into array memory, avoiding string copy
+            data_buf = np.empty((datasize,), dtype=np.uint8)
+            n_read = infile.readinto(data_buf)
+        else:
+            data_buf = infile.read(datasize)
+            n_read = len(data_buf)
+        if n_read != datasize:
             msg = 'Expected %s bytes, got %s bytes from file' \
-                  % (datasize, len(data_str))
+                  % (datasize, n_read)
             raise ValueError(msg)
         arr = np.ndarray(shape,
                          dtype,
-                         buffer=data_str,
+                         buffer=data_buf,
                          order=order)
     return arr
 
@@ -381,6 +400,11 @@ def array_to_file(data, out_dtype, fileobj,
                   mn=None, mx=None, order='F', nan2zero=True):
     ''' Helper function for writing possibly scaled arrays to disk
 
+    If we do not need to scale or cast the data, and the array memory is
+    already in the order we need, we write the array memory directly.
+    Otherwise we scale, cast and write blocks of about
+    ``default_write_block_size`` bytes at a time.
+
     Parameters
     ----------
     data : array
@@ -432,37 +456,50 @@ def array_to_file(data, out_dtype, fileobj,
     True
     '''
     out_dtype = np.dtype(out_dtype)
+    data = np.asarray(data)
+    if not order in ('F', 'C'):
+        raise ValueError('Order should be one of F or C')
     nan2zero = (nan2zero and
                 data.dtype in floating_point_types and
                 out_dtype not in floating_point_types)
-    needs_copy = nan2zero or mx or mn or intercept or divslope !=1.0
-    in_dtype = data.dtype
-    if data.ndim < 2: # a little hack to allow 1D arrays in loop below
-        data = [data]
+    needs_scale = (nan2zero or not mx is None or not mn is None
+                   or intercept or divslope != 1.0)
+    if not needs_scale and data.dtype == out_dtype:
+        if ((order == 'F' and data.flags.f_contiguous) or
+            (order == 'C' and data.flags.c_contiguous)):
+            # Nothing to do; write memory buffer of array directly
+            fileobj.write(data.data)
+            return
+    if data.ndim == 0:
+        data = data.reshape((1,))
     elif order == 'F':
         data = data.T
-    elif order != 'C':
-        raise ValueError('Order should be one of F or C')
-    for dslice in data: # cycle over largest dimension to save memory
-        if needs_copy:
-            dslice = dslice.copy()
-        if nan2zero:
-            dslice[np.isnan(dslice)] = 0
-        if mx:
-            dslice[dslice > mx] = mx
-        if mn:
-            dslice[dslice < mn] = mn
-        if intercept:
-            dslice -= intercept
-        if divslope != 1.0:
-            dslice /= divslope
-        if in_dtype == out_dtype:
-            fileobj.write(dslice.tostring())
-        elif in_dtype == out_dtype.newbyteorder('S'): # just byte swapped
-            out_arr = dslice.byteswap()
-            fileobj.write(out_arr.tostring())
-        else:
-            fileobj.write(dslice.astype(out_dtype).tostring())
+    # Working type for scaling, such that integers do not overflow
+    work_dtype = data.dtype
+    if needs_scale and not work_dtype.type in floating_point_types:
+        work_dtype = np.dtype(np.float64)
+    # Write blocks of rows along slowest axis, to save memory
+    row_bytes = (int(np.prod(data.shape[1:])) *
+                 max(work_dtype.itemsize, out_dtype.itemsize))
+    n_rows = max(default_write_block_size // max(row_bytes, 1), 1)
+    for start in xrange(0, data.shape[0], n_rows):
+        block = data[start:start+n_rows]
+        if needs_scale:
+            block = np.array(block, dtype=work_dtype, order='C')
+            if nan2zero:
+                block[np.isnan(block)] = 0
+            if not mx is None:
+                np.minimum(block, mx, block)
+            if not mn is None:
+                np.maximum(block, mn, block)
+            if intercept:
+                block -= intercept
+            if divslope != 1.0:
+                block /= divslope
+        if block.dtype != out_dtype:
+            block = block.astype(out_dtype)
+        block = np.ascontiguousarray(block)
+        fileobj.write(block.data)
 
 
 def calculate_scale(data, out_dtype, allow_intercept):
@@ -484,7 +521,8 @@ def calculate_scale(data, out_dtype, allow_intercept):
        intercept to subtract from data.  None if no valid data    
     mn : None or float
        minimum of finite value in data or None if this will not
-       be used to threshold data
+       be used to threshold data.  We only threshold floating point
+       data containing NaN or Inf values.
     mx : None or float
        minimum of finite value in data, or None if this will not
        be used to threshold data
@@ -498,7 +536,8 @@ def calculate_scale(data, out_dtype, allow_intercept):
     out_type = out_dtype.type
     if out_type in floating_point_types:
         return default_ret
-    mn, mx = finite_range(data)
+    # One pass through the data for range and non-finite values
+    mn, mx, n_nan, n_inf = finite_stats(data)
     if mn == np.inf: # No valid data
         return None, None, None, None
     info = np.iinfo(out_type)
@@ -517,6 +556,9 @@ def calculate_scale(data, out_dtype, allow_intercept):
         raise TypeError('Unexpected input dtype %s' % in_dtype)
     scaling, intercept = scale_min_max(mn, mx, out_type,
                                         allow_intercept)
+    if n_nan == 0 and n_inf == 0:
+        # All values finite, so thresholding to range would do nothing
+        return scaling, intercept, None, None
     return scaling, intercept, mn, mx
 
 
@@ -649,24 +691,113 @@ def finite_range(arr):
        ...
     TypeError: Can only handle floats and (u)ints
     '''
+    mn, mx, n_nan, n_inf = finite_stats(arr)
+    return mn, mx
+
+
+def _block_stats_np(block, mn, mx):
+    ''' Numpy version of compiled float block statistics '''
+    finite = np.isfinite(block)
+    n_finite = finite.sum()
+    n_nan = np.isnan(block).sum()
+    n_inf = block.size - n_finite - n_nan
+    if n_finite:
+        if n_inf or n_nan:
+            block = block[finite]
+        mn = min(block.min(), mn)
+        mx = max(block.max(), mx)
+    return mn, mx, n_nan, n_inf
+
+
+try:
+    from nipy.io.imageformats._finite_range import stats_float32, \
+        stats_float64
+except ImportError:
+    _block_stats = {}
+else:
+    _block_stats = {np.dtype(np.float32): stats_float32,
+                    np.dtype(np.float64): stats_float64}
+
+
+def finite_stats(arr):
+    ''' Return finite range, and counts of NaN and Inf values in ``arr``
+
+    Reads the array once, in memory order, in blocks of at most about
+    ``default_write_block_size`` bytes, so that the working memory stays
+    bounded, even for large memory-mapped arrays.
+
+    Parameters
+    ----------
+    arr : array
+
+    Returns
+    -------
+    mn : scalar
+       minimum of finite values in (flattened) array.  ``inf`` if there
+       are no finite values
+    mx : scalar
+       maximum of finite values in (flattened) array.  ``-inf`` if there
+       are no finite values
+    n_nan : int
+       number of NaN values in array
+    n_inf : int
+       number of positive or negative infinite values in array
+
+    Examples
+    --------
+    >>> a = np.array([[-1, 0, 1],[np.inf, np.nan, -np.inf]])
+    >>> finite_stats(a)
+    (-1.0, 1.0, 1, 2)
+    >>> a = np.array([[-3, 0, 1],[2,-1,4]], dtype=np.int)
+    >>> finite_stats(a)
+    (-3, 4, 0, 0)
+    '''
+    arr = np.asarray(arr)
+    typ = arr.dtype.type
+    if typ in integer_types:
+        is_int = True
+    elif typ in np.sctypes['float']:
+        is_int = False
+    else:
+        raise TypeError('Can only handle floats and (u)ints')
+    if arr.size == 0:
+        if is_int:
+            return np.min(arr), np.max(arr), 0, 0
+        return np.inf, -np.inf, 0, 0
+    if arr.ndim == 0:
+        arr = arr.reshape((1,))
     # Resort array to slowest->fastest memory change indices
     stride_order = np.argsort(arr.strides)[::-1]
     sarr = arr.transpose(stride_order)
-    typ = sarr.dtype.type
-    if typ in integer_types:
-        return np.min(sarr), np.max(sarr)
-    if typ not in np.sctypes['float']:
-        raise TypeError('Can only handle floats and (u)ints')
-    # Loop to avoid big isfinite temporary
-    mx = -np.inf
-    mn = np.inf
-    for s in xrange(sarr.shape[0]):
-        tmp = sarr[s]
-        tmp = tmp[np.isfinite(tmp)]
-        if tmp.size:
-            mx = max(np.max(tmp), mx)
-            mn = min(np.min(tmp), mn)
-    return mn, mx
+    row_bytes = int(np.prod(sarr.shape[1:])) * sarr.dtype.itemsize
+    n_rows = max(default_write_block_size // max(row_bytes, 1), 1)
+    if is_int:
+        mn = None
+        for start in xrange(0, sarr.shape[0], n_rows):
+            block = sarr[start:start+n_rows]
+            b_mn, b_mx = np.min(block), np.max(block)
+            if mn is None:
+                mn, mx = b_mn, b_mx
+            else:
+                mn, mx = min(b_mn, mn), max(b_mx, mx)
+        return mn, mx, 0, 0
+    native_dt = sarr.dtype.newbyteorder('=')
+    block_stats = _block_stats.get(native_dt)
+    mn, mx, n_nan, n_inf = np.inf, -np.inf, 0, 0
+    for start in xrange(0, sarr.shape[0], n_rows):
+        block = sarr[start:start+n_rows]
+        if block_stats is None:
+            b_mn, b_mx, b_nan, b_inf = _block_stats_np(block, mn, mx)
+        else:
+            # Copies only if not contiguous or not native byte order
+            block = np.ascontiguousarray(block, dtype=native_dt)
+            b_mn, b_mx, b_nan, b_inf = block_stats(block.ravel(), mn, mx)
+        mn, mx = b_mn, b_mx
+        n_nan += b_nan
+        n_inf += b_inf
+    if mn == np.inf: # no finite values
+        return mn, mx, int(n_nan), int(n_inf)
+    return typ(mn), typ(mx), int(n_nan), int(n_inf)
 
 
 class UnsupportedDataType():
@@ -689,10 +820,18 @@ def allopen(fname, *args, **kwargs):
 
     If input ``fname`` already looks like a file, pass through.
     If ``fname`` ends with recognizable compressed types, use python
-    libraries to open as file-like objects (read or write)
-    Otherwise, use standard ``open``.
+    libraries to open as file-like objects (read or write).  We read
+    ``.gz`` files with ``IndexedGzipFile``, to allow reading directly
+    into arrays, and fast random access.  Otherwise, use standard
+    ``open``.
+
+    When writing ``.gz`` files, you can pass ``compress_threads`` and
+    ``block_size`` keyword arguments, with defaults from the
+    ``default_compress_threads`` and ``default_compress_block_size``
+    module variables.  If the number of threads is not 1, we use a
+    ``ParallelGzipFile`` to compress blocks of the data in parallel.
     '''
-    if hasattr(fname, 'write'):
+    if hasattr(fname, 'read') or hasattr(fname, 'write'):
         return fname
     if args:
         mode = args[0]
@@ -701,10 +840,24 @@ def allopen(fname, *args, **kwargs):
     else:
         mode = 'rb'
     if fname.endswith('.gz'):
+        if not ('w' in mode or 'a' in mode or '+' in mode):
+            from nipy.io.imageformats.indexedgzip import IndexedGzipFile
+            return IndexedGzipFile(fname, mode)
         if ('w' in mode and
             len(args) < 2 and
             not 'compresslevel' in kwargs):
             kwargs['compresslevel'] = default_compresslevel
+        n_threads = kwargs.pop('compress_threads',
+                               default_compress_threads)
+        block_size = kwargs.pop('block_size',
+                                default_compress_block_size)
+        if 'w' in mode and n_threads != 1:
+            from nipy.io.imageformats.parallelgzip import \
+                ParallelGzipFile
+            return ParallelGzipFile(fname, *args,
+                                    block_size=block_size,
+                                    n_threads=n_threads,
+                                    **kwargs)
         import gzip
         opener = gzip.open
     elif fname.endswith('.bz2'):
@@ -5,10 +5,11 @@ from tempfile import mkstemp
 import numpy as np
 
 from nipy.testing import assert_true, assert_false, assert_equal, \
-    assert_array_almost_equal, funcfile
+    assert_array_almost_equal, assert_raises, funcfile
 
 
 from nipy.io.api import load_image, save_image
+from nipy.io.files import memmap_writer
 from nipy.core import api
 
 class Tempfile():
@@ -82,6 +83,44 @@ def test_save2b():
     yield assert_equal, img.shape, img2.shape
     yield assert_true, np.allclose(np.asarray(img2), np.asarray(img))
 
+
+def test_memmap_writer():
+    # Writing via memmap gives the same image as saving the whole image
+    shape = (13,5,7,3)
+    step = np.array([3.45,2.3,4.5,6.93])
+    cmap = api.AffineTransform.from_start_step('ijkt', 'xyzt', [1,3,5,0], step)
+    data = np.random.standard_normal(shape)
+    save_image(api.Image(data, cmap), tmpfile.name)
+    img = load_image(tmpfile.name)
+    fd, fname = mkstemp(suffix='.nii')
+    try:
+        writer = memmap_writer(fname, cmap, shape)
+        for i in range(shape[0]):
+            writer[i] = data[i]
+        writer.close()
+        img2 = load_image(fname)
+        yield assert_true, np.allclose(img.affine, img2.affine)
+        yield assert_equal, img.shape, img2.shape
+        yield assert_true, np.allclose(np.asarray(img2), data)
+        yield assert_equal, img2.header.get_zooms(), img.header.get_zooms()
+        yield (assert_array_almost_equal,
+               [img2.header['cal_min'], img2.header['cal_max']],
+               [data.min(), data.max()])
+        # dtype
+        writer = memmap_writer(fname, cmap, shape, np.float32)
+        writer[:] = data
+        writer.close()
+        img2 = load_image(fname)
+        yield assert_equal, img2.get_data().dtype, np.dtype(np.float32)
+        yield assert_array_almost_equal, np.asarray(img2), data, 5
+    finally:
+        os.close(fd)
+        os.unlink(fname)
+    # Only uncompressed NIfTI
+    yield assert_raises, ValueError, memmap_writer, 'test.img', cmap, shape
+    yield (assert_raises, ValueError, memmap_writer, 'test.nii.gz', cmap,
+           shape)
+
 # JT: nifti_ref doesn't reorder axes anymore so these tests
 # are no longer expected to work
 #
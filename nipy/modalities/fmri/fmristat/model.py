@@ -5,18 +5,23 @@ This module defines the two default GLM passes of fmristat
 """
 
 import os.path as path
+from copy import copy
 
 import numpy as np
 from scipy.linalg import toeplitz
 
-from nipy.fixes.scipy.stats.models.regression import OLSModel, ARModel
+from nipy.fixes.scipy.stats.models.regression import OLSModel, ARModel, \
+     RegressionResults
+from nipy.fixes.scipy.stats.models.model import TContrastResults, \
+     FContrastResults
 from nipy.fixes.scipy.stats.models.utils import pos_recipr
 
 # nipy core imports
-from nipy.core.api import Image, parcels, matrix_generator, AffineTransform
+from nipy.core.api import Image, matrix_generator, AffineTransform
 
 # nipy IO imports
 from nipy.io.api import save_image
+from nipy.io.files import memmap_writer
 
 # fmri imports
 from nipy.modalities.fmri.api import FmriImageList, fmri_generator
@@ -34,21 +39,41 @@ class ModelOutputImage(object):
     The __getitem__ and __setitem__ calls are delegated to a private
     Image.  An exception is raised if trying to get/set data after the
     data has been saved to disk.
+
+    For uncompressed NIfTI filenames, the private Image writes its data
+    straight to the file on disk through a memory map, so the output
+    does not need to fit in memory, and 'save' only has to finish the
+    file header.  Other filenames get an in-memory image, written at
+    'save'.
     """
 
     def __init__(self, filename, coordmap, shape, clobber=False):
         self.filename = filename
-        self._im = Image(np.zeros(shape), coordmap)
         self.clobber = clobber
         self._flushed = False
+        self._check_clobber()
+        try:
+            self._writer = memmap_writer(filename, coordmap, shape)
+        except ValueError: # not uncompressed NIfTI
+            self._writer = None
+            self._im = Image(np.zeros(shape), coordmap)
+        else:
+            self._im = Image(self._writer, coordmap)
+
+    def _check_clobber(self):
+        if not self.clobber and path.exists(self.filename):
+            raise ValueError('trying to clobber existing file')
 
     def save(self):
         """
         Save current Image data to disk
         """
-        if not self.clobber and path.exists(self.filename):
-            raise ValueError('trying to clobber existing file')
-        save_image(self._im, self.filename)
+        if self._writer is None:
+            self._check_clobber()
+            save_image(self._im, self.filename)
+        else:
+            self._writer.close()
+            self._writer = None
         self._flushed = True
         del(self._im)
 
@@ -65,17 +90,107 @@ class ModelOutputImage(object):
         else:
             raise ValueError('trying to set value on saved'
                              'ModelOutputImage')
-        
+
+
+#: number of design matrices and models kept in the model caches
+model_cache_size = 50
+
+#: resolution to which we round AR coefficients before making ARModels.
+#: Model fits for AR coefficients that round to the same value share the
+#: same whitened design and pseudoinverse.
+ar_resolution = 0.01
+
+_design_cache = {}
+_model_cache = {}
+# keys in order of caching, for dropping the oldest entries
+_design_keys = []
+_model_keys = []
+
+
+def _cache_set(cache, keys, key, value):
+    if len(keys) >= model_cache_size:
+        for old_key in keys[:len(keys) - model_cache_size + 1]:
+            del cache[old_key]
+        del keys[:len(keys) - model_cache_size + 1]
+    cache[key] = value
+    keys.append(key)
+
+
+def clear_model_cache():
+    """ Empty the caches of design matrices and models """
+    for cache, keys in ((_design_cache, _design_keys),
+                        (_model_cache, _model_keys)):
+        cache.clear()
+        del keys[:]
+
+
+def cached_design(formula, volume_start_times):
+    """ Return design for `formula` at `volume_start_times`, maybe cached
+
+    The cache key is the formula object and the time values, so a
+    formula must not change after its design has been cached.
+    """
+    volume_start_times = np.asarray(volume_start_times)
+    key = (formula, volume_start_times.dtype.str,
+           volume_start_times.tostring())
+    try:
+        return _design_cache[key]
+    except KeyError:
+        pass
+    design = formula.design(volume_start_times)
+    _cache_set(_design_cache, _design_keys, key, design)
+    return design
+
+
+def cached_model(model_type, design, *model_args):
+    """ Return ``model_type(design, *model_args)``, maybe cached
+
+    Creating a model calculates the (whitened) design pseudoinverse, so
+    models with the same design and arguments can share these.  Fitting
+    does not change the model, but methods such as
+    ``ARModel.iterative_fit`` do, so don't use them on cached models.
+
+    For ``ARModel`` and subclasses, we round floating point AR
+    coefficients to `ar_resolution` before making the model.
+    """
+    if issubclass(model_type, ARModel):
+        model_args = tuple([_round_ar(arg) for arg in model_args])
+    arr = np.asarray(design)
+    key = (model_type, arr.dtype.str, arr.shape, arr.tostring(),
+           tuple([(type(arg), np.asarray(arg).shape,
+                   np.asarray(arg).tostring()) for arg in model_args]))
+    try:
+        return _model_cache[key]
+    except KeyError:
+        pass
+    model = model_type(design, *model_args)
+    _cache_set(_model_cache, _model_keys, key, model)
+    return model
+
+
+def _round_ar(rho):
+    if np.asarray(rho).dtype.kind != 'f': # AR order, not coefficients
+        return rho
+    return np.round(np.asarray(rho) / ar_resolution) * ar_resolution
+
 
 def model_generator(formula, data, volume_start_times, iterable=None, 
                     slicetimes=None, model_type=OLSModel, 
                     model_params = lambda x: ()):
     """
     Generator for the models for a pass of fmristat analysis.
+
+    The design and models come from caches (see ``cached_design``,
+    ``cached_model``), so that a pass makes one model, and one design
+    pseudoinverse, for each distinct set of model parameters.
+
+    ``OLS`` and ``AR1`` fit many voxels at a time with ``voxel_blocks``
+    instead.
     """
+    design = cached_design(formula, volume_start_times)
     for i, d in matrix_generator(fmri_generator(data, iterable=iterable)):
         model_args = model_params(i) # model may depend on i
-        rmodel = model_type(formula.design(volume_start_times), *model_args)
+        rmodel = cached_model(model_type, design, *model_args)
         yield i, d, rmodel
 
 
@@ -90,6 +205,185 @@ def results_generator(model_iterable):
         yield i, m.fit(d)
 
 
+#: maximum number of voxels fit together in one block by
+#: ``voxel_blocks``.  Each block needs a few (time points, block size)
+#: float64 arrays in memory.
+default_block_size = 2 ** 14
+
+
+class BatchResults(RegressionResults):
+    """
+    Regression results for a block of voxels, fit together
+
+    Contrasts share intermediate values.  The (unscaled) covariance of
+    each contrast, and its inverse for F contrasts, come from
+    `contrast_cache`, which is shared by all blocks fit with the same
+    model, and the effect of each contrast is calculated once per
+    block, whether used for T or F statistics.
+    """
+    def __init__(self, theta, Y, model, wY, wresid, dispersion,
+                 contrast_cache):
+        RegressionResults.__init__(self, theta, Y, model, wY, wresid,
+                                   cov=model.normalized_cov_beta,
+                                   dispersion=dispersion)
+        self._contrast_cache = contrast_cache
+        self._effects = {}
+
+    def _contrast_key(self, matrix):
+        return (matrix.dtype.str, matrix.shape, matrix.tostring())
+
+    def _effect(self, matrix):
+        key = self._contrast_key(matrix)
+        try:
+            return self._effects[key]
+        except KeyError:
+            pass
+        effect = np.dot(matrix, self.theta)
+        self._effects[key] = effect
+        return effect
+
+    def _vcov(self, matrix, inverse=False):
+        key = (self._contrast_key(matrix), inverse)
+        try:
+            return self._contrast_cache[key]
+        except KeyError:
+            pass
+        vcov = self.vcov(matrix=matrix, dispersion=1.0)
+        if inverse:
+            vcov = np.linalg.inv(vcov)
+        self._contrast_cache[key] = vcov
+        return vcov
+
+    def Tcontrast(self, matrix, t=True, sd=True, dispersion=None):
+        """
+        Compute a Tcontrast for a row vector matrix, as for
+        ``RegressionResults.Tcontrast``
+        """
+        matrix = np.asarray(matrix)
+        if dispersion is None:
+            dispersion = self.dispersion
+        _t = _sd = None
+        _effect = self._effect(matrix)
+        if sd:
+            _sd = np.sqrt(self._vcov(matrix) * dispersion)
+        if t:
+            _t = _effect * pos_recipr(_sd)
+        return TContrastResults(effect=_effect, t=_t, sd=_sd,
+                                df_den=self.df_resid)
+
+    def Fcontrast(self, matrix, dispersion=None, invcov=None):
+        """
+        Compute an Fcontrast for a contrast matrix, as for
+        ``RegressionResults.Fcontrast``
+        """
+        matrix = np.asarray(matrix)
+        ctheta = self._effect(matrix)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape((1, matrix.shape[0]))
+        if dispersion is None:
+            dispersion = self.dispersion
+        q = matrix.shape[0]
+        if invcov is None:
+            invcov = self._vcov(matrix, inverse=True)
+        F = np.add.reduce(np.dot(invcov, ctheta) * ctheta, 0) * \
+            pos_recipr((q * dispersion))
+        return FContrastResults(F=F, df_den=self.df_resid,
+                                df_num=invcov.shape[0])
+
+
+def fit_block(model, Y, contrast_cache=None):
+    """
+    Fit `model` to all the columns of 2D `Y` at once
+
+    This does the same calculation as ``model.fit(Y)``, but returns a
+    ``BatchResults`` instance.
+
+    Parameters
+    ----------
+    model : ``OLSModel`` instance
+    Y : array
+        data, shape (time points, voxels)
+    contrast_cache : None or dict
+        dictionary in which to cache contrast covariances, shared
+        between calls for the same model.  If None, use a new
+        dictionary.
+
+    Returns
+    -------
+    results : ``BatchResults``
+    """
+    if contrast_cache is None:
+        contrast_cache = {}
+    wY = model.whiten(Y)
+    beta = np.dot(model.calc_beta, wY)
+    wresid = wY - np.dot(model.wdesign, beta)
+    dispersion = np.sum(wresid**2, 0) / (model.wdesign.shape[0] -
+                                         model.wdesign.shape[1])
+    return BatchResults(beta, Y, model, wY, wresid, dispersion,
+                        contrast_cache)
+
+
+def voxel_blocks(data, design, groups, model_type=OLSModel,
+                 block_size=None):
+    """
+    Generator of (coordinates, results) for blocks of voxels
+
+    Each block is fit with one (whitening and) matrix product, over all
+    the voxels in the block, rather than slice by slice.
+
+    Parameters
+    ----------
+    data : array
+        data with time as the first axis, shape (T,) + volume shape
+    design : array
+        design matrix, shape (T, p)
+    groups : sequence
+        sequence of (model_args, voxels) pairs.  `voxels` is an array of
+        indices into the flattened (C order) volume, for voxels fit with
+        the model ``model_type(design, *model_args)``
+    model_type : class, optional
+        model class, ``OLSModel`` or subclass
+    block_size : None or int, optional
+        maximum number of voxels in a block.  If None, use
+        ``default_block_size``
+
+    Yields
+    ------
+    coords : tuple
+        tuple of index arrays giving voxel coordinates for the block
+    results : ``BatchResults``
+        results of fit for voxels in block, with one column per voxel
+    """
+    if block_size is None:
+        block_size = default_block_size
+    data = np.asarray(data)
+    vol_shape = data.shape[1:]
+    data = data.reshape((data.shape[0], -1))
+    contrast_caches = {}
+    for model_args, voxels in groups:
+        model = cached_model(model_type, design, *model_args)
+        contrast_cache = contrast_caches.setdefault(id(model), {})
+        voxels = np.asarray(voxels)
+        for start in range(0, voxels.shape[0], block_size):
+            block = voxels[start:start + block_size]
+            Y = data.take(block, axis=1)
+            coords = np.unravel_index(block, vol_shape)
+            yield coords, fit_block(model, Y, contrast_cache)
+
+
+def coords_reshape(i, x):
+    """
+    Output index for output values `x` at coordinates `i`
+
+    ``reshape`` function for ``generate_output`` with the results of
+    ``voxel_blocks``.  1D values are one per voxel; 2D values, such as
+    residuals, have time as the first axis.
+    """
+    if len(x.shape) == 2:
+        i = (slice(None),) + tuple(i)
+    return i, x
+
+
 class OLS(object):
     """
     First pass through fmri_image.
@@ -103,10 +397,17 @@ class OLS(object):
     formula :  :class:`nipy.modalities.fmri.formula.Formula`
     outputs :
     volume_start_times : 
+    mask : None or array, optional
+       boolean array, shape of one volume, of voxels to fit.  Outputs
+       for voxels outside the mask are not written.  If None, fit all
+       voxels.
+    block_size : None or int, optional
+       maximum number of voxels fit together.  If None, use
+       ``default_block_size``
     """
 
     def __init__(self, fmri_image, formula, outputs=[], 
-                 volume_start_times=None):
+                 volume_start_times=None, mask=None, block_size=None):
         self.fmri_image = fmri_image
         self.data = np.asarray(fmri_image)
         self.formula = formula
@@ -115,28 +416,19 @@ class OLS(object):
             self.volume_start_times = self.fmri_image.volume_start_times
         else:
             self.volume_start_times = volume_start_times
+        self.mask = mask
+        self.block_size = block_size
             
     def execute(self):
-        m = model_generator(self.formula, self.data,
-                            self.volume_start_times,
-                            model_type=OLSModel)
-        r = results_generator(m)
-
-        def reshape(i, x):
-            if len(x.shape) == 2:
-                if type(i) is type(1):
-                    x.shape = (x.shape[0],) + self.fmri_image[0].shape[1:]                        
-                if type(i) not in [type([]), type(())]:
-                    i = (i,)
-                else:
-                    i = tuple(i)
-                i = (slice(None,None,None),) + tuple(i)
-            else:
-                if type(i) is type(1):
-                    x.shape = self.fmri_image[0].shape[1:]
-            return i, x
-
-        o = generate_output(self.outputs, r, reshape=reshape)
+        design = cached_design(self.formula, self.volume_start_times)
+        if self.mask is None:
+            voxels = np.arange(np.product(self.data.shape[1:]))
+        else:
+            voxels = np.flatnonzero(np.asarray(self.mask))
+        r = voxel_blocks(self.data, design, [((), voxels)],
+                         model_type=OLSModel,
+                         block_size=self.block_size)
+        o = generate_output(self.outputs, r, reshape=coords_reshape)
 
 
 def estimateAR(resid, design, order=1):
@@ -197,16 +489,19 @@ class AR1(object):
        ``np.asarray(rho)``, and having attribute ``coordmap``
     outputs :
     volume_start_times : 
+    block_size : None or int, optional
+       maximum number of voxels fit together.  If None, use
+       ``default_block_size``
     """
 
     def __init__(self, fmri_image, formula, rho, outputs=[],
-                 volume_start_times=None):
+                 volume_start_times=None, block_size=None):
         self.fmri_image = fmri_image
         self.data = np.asarray(fmri_image)
         self.formula = formula
         self.outputs = outputs
         # Cleanup rho values, truncate them to a scale of 0.01
-        g = rho.coordmap.copy()
+        g = copy(rho.coordmap)
         rho = np.asarray(rho)
         m = np.isnan(rho)
         r = (np.clip(rho,-1,1) * 100).astype(np.int) / 100.
@@ -216,44 +511,24 @@ class AR1(object):
             self.volume_start_times = self.fmri_image.volume_start_times
         else:
             self.volume_start_times = volume_start_times
+        self.block_size = block_size
 
     def execute(self):
-
-        iterable = parcels(self.rho, exclude=[np.inf])
-        def model_params(i):
-            return (np.asarray(self.rho)[i].mean(),)
-        m = model_generator(self.formula, self.data,
-                            self.volume_start_times,
-                            iterable=iterable,
-                            model_type=ARModel,
-                            model_params=model_params)
-        r = results_generator(m)
-
-        def reshape(i, x):
-            """
-            To write output, arrays have to be reshaped --
-            this function does the appropriate reshaping for the two
-            passes of fMRIstat.
-
-            These passes are:
-              i) 'slices through the z-axis'
-              ii) 'parcels of approximately constant AR1 coefficient'
-            """
-    
-            if len(x.shape) == 2:
-                if type(i) is type(1):
-                    x.shape = (x.shape[0],) + self.fmri_image[0].shape[1:]
-                if type(i) not in [type([]), type(())]:
-                    i = (i,)
-                else:
-                    i = tuple(i)
-                i = (slice(None,None,None),) + tuple(i)
-            else:
-                if type(i) is type(1):
-                    x.shape = self.fmri_image[0].shape[1:]
-            return i, x
-
-        o = generate_output(self.outputs, r, reshape=reshape)
+        # Group voxels with the same AR coefficient, one model per group
+        design = cached_design(self.formula, self.volume_start_times)
+        rho = np.asarray(self.rho).ravel()
+        voxels = np.flatnonzero(rho != np.inf)
+        values, inverse = np.unique(rho[voxels], return_inverse=True)
+        voxels = voxels[np.argsort(inverse, kind='mergesort')]
+        groups = []
+        start = 0
+        for value, end in zip(values, np.cumsum(np.bincount(inverse))):
+            groups.append(((value,), voxels[start:end]))
+            start = end
+        r = voxel_blocks(self.data, design, groups,
+                         model_type=ARModel,
+                         block_size=self.block_size)
+        o = generate_output(self.outputs, r, reshape=coords_reshape)
 
 
 def output_T(outbase, contrast, fmri_image, effect=True, sd=True, t=True,
@@ -5,7 +5,10 @@ import warnings
 from shutil import rmtree
 from tempfile import mkstemp, mkdtemp
 
-from nipy.testing import TestCase, funcfile, dec
+import numpy as np
+
+from nipy.testing import TestCase, funcfile, dec, assert_equal, \
+    assert_raises, assert_array_almost_equal, assert_true, assert_false
 
 from nipy.io.api import load_image
 
@@ -77,3 +80,203 @@ class test_fMRIstat_model(TestCase):
         rho = load_image(self.ar1)
         ar = model.AR1(fmriims, f, rho, outputs)
         ar.execute()
+
+
+def test_model_output_image():
+    # Outputs write through memmap for uncompressed nifti, else in memory
+    from nipy.core.api import AffineTransform
+    cmap = AffineTransform.from_params('ijk', 'xyz', np.diag([2., 3, 4, 1]))
+    shape = (3, 4, 5)
+    data = np.random.standard_normal(shape)
+    out_dir = mkdtemp()
+    try:
+        for fname, memmapped in (('out1.nii', True),
+                                 ('out2.hdr', True),
+                                 ('out3.nii.gz', False),
+                                 ('out4.hdr.gz', False)):
+            fname = os.path.join(out_dir, fname)
+            im = model.ModelOutputImage(fname, cmap, shape)
+            yield assert_equal, im._writer is None, not memmapped
+            for i in range(shape[0]):
+                im[i] = data[i]
+            yield assert_array_almost_equal, np.asarray(im[1]), data[1]
+            im.save()
+            yield assert_raises, ValueError, im.__getitem__, 0
+            img = load_image(fname)
+            yield assert_array_almost_equal, np.asarray(img), data
+            yield assert_array_almost_equal, img.affine, cmap.affine
+            # No clobber, by default
+            yield (assert_raises, ValueError,
+                   model.ModelOutputImage, fname, cmap, shape)
+            im = model.ModelOutputImage(fname, cmap, shape, clobber=True)
+            im.save()
+    finally:
+        rmtree(out_dir)
+
+
+class CountingFormula(object):
+    ''' Formula-like object counting calls to ``design`` '''
+    def __init__(self):
+        self.n_calls = 0
+
+    def design(self, t):
+        self.n_calls += 1
+        return np.c_[np.ones(len(t)), t, np.asarray(t) ** 2]
+
+
+def test_model_cache():
+    model.clear_model_cache()
+    rng = np.random.RandomState(42)
+    t = np.arange(20) * 2.5
+    data = rng.normal(size=(20, 6, 7))
+    f = CountingFormula()
+    models = [m for i, d, m in model.model_generator(f, data, t)]
+    yield assert_equal, len(models), 6
+    # One design, one model, for the whole OLS pass
+    yield assert_equal, f.n_calls, 1
+    yield assert_true, all([m is models[0] for m in models])
+    # Results same as for new model
+    design = f.design(t)
+    ols = model.OLSModel(design)
+    yield (assert_array_almost_equal, models[0].fit(data[:, 3]).theta,
+           ols.fit(data[:, 3]).theta)
+    # Cached over generator calls
+    models2 = [m for i, d, m in model.model_generator(f, data, t)]
+    yield assert_equal, f.n_calls, 2
+    yield assert_true, models2[0] is models[0]
+    # AR models cached by rounded rho
+    m1 = model.cached_model(model.ARModel, design, 0.301)
+    m2 = model.cached_model(model.ARModel, design, 0.2999)
+    m3 = model.cached_model(model.ARModel, design, 0.31)
+    yield assert_true, m1 is m2
+    yield assert_false, m1 is m3
+    yield assert_array_almost_equal, m1.rho, [0.3]
+    yield (assert_array_almost_equal, m1.calc_beta,
+           model.ARModel(design, 0.3).calc_beta)
+    # AR order is not a coefficient
+    m4 = model.cached_model(model.ARModel, design, 2)
+    yield assert_equal, m4.order, 2
+    # cache size bounded
+    for i in range(model.model_cache_size + 10):
+        model.cached_model(model.ARModel, design, i / 100.)
+    yield assert_equal, len(model._model_cache), model.model_cache_size
+    yield assert_equal, len(model._model_keys), model.model_cache_size
+    model.clear_model_cache()
+    yield assert_equal, len(model._model_cache), 0
+
+
+class SimpleContrast(object):
+    def __init__(self, matrix):
+        self.matrix = np.asarray(matrix)
+
+
+class ArrayImage(object):
+    ''' Image-like wrapper for array, with ``coordmap`` for ``AR1`` '''
+    def __init__(self, data):
+        from nipy.core.api import AffineTransform
+        self.data = data
+        self.coordmap = AffineTransform.from_params('ijk', 'xyz',
+                                                    np.eye(4))
+
+    def __array__(self):
+        return self.data
+
+    def __setitem__(self, index, value):
+        self.data[index] = value
+
+
+def _outputs(vol_shape, T, c, c2):
+    from nipy.algorithms.statistics import regression
+    out_t = [np.zeros(vol_shape) for i in range(3)]
+    outputs = [regression.TOutput(c, *[ArrayImage(o) for o in out_t]),
+               regression.RegressionOutput(np.zeros(vol_shape),
+                   lambda x: regression.output_F(x, c2)),
+               regression.RegressionOutput(np.zeros((T,) + vol_shape),
+                                           regression.output_resid),
+               regression.RegressionOutput(np.zeros(vol_shape),
+                                           regression.output_AR1)]
+    return out_t, outputs
+
+
+def test_batched_fits():
+    # Batched OLS and AR1 passes against model fits for all voxels
+    rng = np.random.RandomState(20)
+    T = 30
+    vol_shape = (4, 5, 3)
+    t = np.arange(T) * 2.
+    data = rng.normal(size=(T,) + vol_shape)
+    f = CountingFormula()
+    design = f.design(t)
+    c = SimpleContrast([0, 1, 0])
+    c2 = SimpleContrast([[0, 1, 0], [0, 0, 1]])
+    Y = data.reshape((T, -1))
+    for block_size in (None, 1, 7, 1000):
+        out_t, outputs = _outputs(vol_shape, T, c, c2)
+        model.OLS(data, f, outputs, volume_start_times=t,
+                  block_size=block_size).execute()
+        res = model.OLSModel(design).fit(Y)
+        tc = res.Tcontrast(c.matrix)
+        for out, val in zip(out_t, (tc.effect, tc.sd, tc.t)):
+            yield assert_array_almost_equal, out, val.reshape(vol_shape)
+        yield (assert_array_almost_equal, outputs[1].img,
+               res.Fcontrast(c2.matrix).F.reshape(vol_shape))
+        yield assert_array_almost_equal, outputs[2].img, data - \
+            res.predicted.reshape(data.shape)
+        ar1 = outputs[3].img
+        # AR1 pass with the estimated AR coefficients, some voxels masked
+        rho = ar1.copy()
+        rho[0, 0, 0] = np.nan
+        out_t, outputs = _outputs(vol_shape, T, c, c2)
+        model.AR1(data, f, ArrayImage(rho), outputs,
+                  volume_start_times=t, block_size=block_size).execute()
+        rho = np.asarray(model.AR1(data, f, ArrayImage(rho),
+                                   volume_start_times=t).rho).ravel()
+        yield assert_equal, outputs[1].img[0, 0, 0], 0
+        for value in np.unique(rho[rho != np.inf]):
+            vox = rho == value
+            res = model.ARModel(design, value).fit(Y[:, vox])
+            tc = res.Tcontrast(c.matrix)
+            for out, val in zip(out_t, (tc.effect, tc.sd, tc.t)):
+                yield (assert_array_almost_equal,
+                       out.reshape(-1)[vox], val)
+            yield (assert_array_almost_equal, outputs[1].img.reshape(-1)[vox],
+                   res.Fcontrast(c2.matrix).F)
+            yield (assert_array_almost_equal,
+                   outputs[2].img.reshape((T, -1))[:, vox], res.resid)
+    # OLS with a mask
+    mask = np.zeros(vol_shape, bool)
+    mask[1:3, 2:] = True
+    out_t, outputs = _outputs(vol_shape, T, c, c2)
+    model.OLS(data, f, outputs, volume_start_times=t, mask=mask,
+              block_size=5).execute()
+    res = model.OLSModel(design).fit(Y)
+    effect = res.Tcontrast(c.matrix).effect.reshape(vol_shape)
+    yield assert_array_almost_equal, out_t[0][mask], effect[mask]
+    yield assert_true, np.all(out_t[0][~mask] == 0)
+
+
+def test_batch_results():
+    # Contrast intermediates are shared
+    rng = np.random.RandomState(42)
+    design = np.c_[np.ones(20), rng.normal(size=(20, 2))]
+    Y = rng.normal(size=(20, 10))
+    ols = model.OLSModel(design)
+    cache = {}
+    res = model.fit_block(ols, Y, cache)
+    res0 = ols.fit(Y)
+    yield assert_array_almost_equal, res.theta, res0.theta
+    yield assert_array_almost_equal, res.dispersion, res0.dispersion
+    c = np.array([[0, 1., -1]])
+    tc, tc0 = res.Tcontrast(c), res0.Tcontrast(c)
+    for name in ('effect', 'sd', 't'):
+        yield (assert_array_almost_equal, getattr(tc, name),
+               getattr(tc0, name))
+    fc = res.Fcontrast(c)
+    yield assert_array_almost_equal, fc.F, res0.Fcontrast(c).F
+    yield assert_true, fc.df_den == res0.Fcontrast(c).df_den
+    yield assert_true, res.Fcontrast(c).F is not fc.F
+    yield assert_true, len(cache) == 2
+    res2 = model.fit_block(ols, Y[:, :3], cache)
+    yield (assert_array_almost_equal, res2.Tcontrast(c).t,
+           tc0.t[:, :3])
+    yield assert_true, len(cache) == 2
@@ -9,21 +9,35 @@ from nipy.neurospin.utils import mahalanobis
 
 DEF_TINY = 1e-50
 DEF_DOFMAX = 1e10
+DEF_BLOCK_SIZE = 2**14
 
 models = {'spherical':['ols', 'kalman'], 
 	  'ar1':['kalman']}
 
 class glm:
     def __init__(self, Y=None, X=None, formula=None, axis=0, 
-             model='spherical', method=None, niter=2):
+             model='spherical', method=None, niter=2, n_threads=None,
+             vb_storage='full', vb_dtype=np.double, contrasts=None):
 
         # Check dimensions
         if Y == None:
             return
         else:
-            self.fit(Y, X, formula, axis, model, method, niter)
+            self.fit(Y, X, formula, axis, model, method, niter, n_threads,
+                     vb_storage, vb_dtype, contrasts)
 
-    def fit(self, Y, X, formula=None, axis=0, model='spherical', method=None, niter=2):
+    def fit(self, Y, X, formula=None, axis=0, model='spherical', method=None, niter=2,
+            n_threads=None, vb_storage='full', vb_dtype=np.double, contrasts=None):
+        """
+        n_threads is the number of threads for the Kalman filter fits
+        (see kalman.ols and kalman.ar1). If None, fit in one thread.
+
+        For the 'ar1' model, vb_storage and vb_dtype set how to store
+        the per-voxel variance matrices nvbeta: 'full', 'packed' (upper
+        triangles only) or 'none' (see kalman.ar1). contrasts is a list
+        of contrasts for which to compute the variances during the fit;
+        with vb_storage='none', these are the only contrasts available.
+        """
         
         if Y.shape[axis] != X.shape[0]:
             raise ValueError, 'Response and predictors are inconsistent'
@@ -46,6 +60,8 @@ class glm:
         # Initialize fields
         constants = []
         a = 0
+        self._vb_storage = 'full'
+        self._contrasts = []
         
         # Switch on models / methods 
         if self.model == 'spherical': 
@@ -53,10 +69,16 @@ class glm:
             if self.method == 'ols':
                 out = ols(Y, X, axis=axis)
             elif self.method == 'kalman':
-                out = kalman.ols(Y, X, axis=axis)
+                out = kalman.ols(Y, X, axis=axis, n_threads=n_threads)
         elif self.model == 'ar1':
             constants = ['a']
-            out = kalman.ar1(Y, X, axis=axis, niter=niter)
+            out = kalman.ar1(Y, X, axis=axis, niter=niter,
+                             n_threads=n_threads, vb_storage=vb_storage,
+                             vb_dtype=vb_dtype, contrasts=contrasts)
+            self._vb_storage = vb_storage
+            if contrasts is not None:
+                self._contrasts = zip([np.asarray(c) for c in contrasts],
+                                      out[5])
             a = out[4]
             out = out[0:4]
             
@@ -71,6 +93,10 @@ class glm:
     Save fit into a .npz file 
     """
     def save(self, file): 
+        declared = {}
+        for i in range(len(self._contrasts)):
+            declared['contrast_%d' % i] = self._contrasts[i][0]
+            declared['nvcon_%d' % i] = self._contrasts[i][1]
         np.savez(file, 
              beta=self.beta, 
              nvbeta=self.nvbeta, 
@@ -80,7 +106,10 @@ class glm:
              model=self.model,
              method=self.method,
              axis=self._axis, 
-             constants=self._constants)
+             constants=self._constants,
+             vb_storage=self._vb_storage,
+             n_contrasts=len(self._contrasts),
+             **declared)
 
 
         """
@@ -109,21 +138,35 @@ class glm:
         # one (output by KF_fit)
         s2 = self.s2.squeeze()
         nvbeta = self.nvbeta
-        if not 'nvbeta' in self._constants: 
-            nvbeta = np.rollaxis(nvbeta, axis, ndims+1)
-            nvbeta = np.rollaxis(nvbeta, axis, ndims+1) # X, p, p
-        if dim == 1:
-            vcon = np.inner(c, np.inner(c, nvbeta))
-            vcon = vcon.squeeze()*s2
-        else: 
-            vcon = np.dot(c, np.inner(nvbeta, c)) # q, X, q or q, q
-            if not 'nvbeta' in self._constants: 
-                vcon = np.rollaxis(vcon, ndims, 1)*s2 # q, q, X
+        nvcon = self._declared_nvcon(c)
+        if nvcon is not None:
+            vcon = nvcon * s2
+        elif self._vb_storage == 'none':
+            raise ValueError('Contrast was not declared at fit and '
+                             'variance matrices were not stored')
+        elif self._vb_storage == 'packed':
+            nvbeta = np.rollaxis(nvbeta, axis, ndims) # X, p*(p+1)/2
+            vcon = np.inner(packed_weights(c), nvbeta) # q, q, X
+            if dim == 1:
+                vcon = vcon.squeeze()*s2
             else:
-                aux = vcon.shape # q, q
-                vcon = np.resize(vcon, s2.shape+aux) # X, q, q
-                vcon = vcon.transpose().reshape(aux+(s2.size,))*s2.reshape((s2.size,)) # q, q, Xflat
-                vcon = vcon.reshape(aux+s2.shape) # q, q, X
+                vcon = vcon*s2
+        else:
+            if not 'nvbeta' in self._constants: 
+                nvbeta = np.rollaxis(nvbeta, axis, ndims+1)
+                nvbeta = np.rollaxis(nvbeta, axis, ndims+1) # X, p, p
+            if dim == 1:
+                vcon = np.inner(c, np.inner(c, nvbeta))
+                vcon = vcon.squeeze()*s2
+            else: 
+                vcon = np.dot(c, np.inner(nvbeta, c)) # q, X, q or q, q
+                if not 'nvbeta' in self._constants: 
+                    vcon = np.rollaxis(vcon, ndims, 1)*s2 # q, q, X
+                else:
+                    aux = vcon.shape # q, q
+                    vcon = np.resize(vcon, s2.shape+aux) # X, q, q
+                    vcon = vcon.transpose().reshape(aux+(s2.size,))*s2.reshape((s2.size,)) # q, q, Xflat
+                    vcon = vcon.reshape(aux+s2.shape) # q, q, X
       
         # Create contrast instance
         c = contrast(dim, type, tiny, dofmax)
@@ -132,9 +175,153 @@ class glm:
         c.dof = self.dof
 
         return c
+
+    def contrasts(self, cs, type='t', baseline=0.0, tiny=DEF_TINY,
+                  dofmax=DEF_DOFMAX, block_size=DEF_BLOCK_SIZE):
+        """
+        Evaluate a list of contrasts cs in one pass over the voxels.
+
+        Each contrast is a vector or a q x p matrix, as for contrast,
+        and type ('t', 'F' or 'tmin') applies to all of them as for
+        contrast.stat. The voxels are processed in blocks of at most
+        block_size voxels; for each block, the effects of all contrasts
+        come from a single matrix product with the parameter estimates,
+        and the variances from a single matrix product with the
+        variance matrices (or from the variances of contrasts declared
+        at fit).
+
+        Returns a structured array of shape (len(cs),)+X, with fields
+        'effect', 'variance', 'stat', 'pvalue' and 'zscore', where X is
+        the shape of the voxel grid. The effect and variance fields are
+        NaN for contrasts with q > 1; use contrast for these.
+        """
+        cs = [np.atleast_2d(np.asarray(c, dtype=np.double)) for c in cs]
+        qs = [c.shape[0] for c in cs]
+        C = np.concatenate(cs)
+        p = C.shape[1]
+        axis = self._axis
+        ndims = len(self.beta.shape)
+
+        # Voxels as rows
+        B = np.rollaxis(self.beta, axis, ndims)
+        vox_shape = B.shape[:-1]
+        nvox = int(np.prod(vox_shape))
+        B = B.reshape((nvox, p))
+        s2 = np.asarray(self.s2).reshape(nvox)
+
+        # Variances of all (row, row) pairs within contrasts, as matrix
+        # products of pair weights with the (flat) variance matrices
+        W = []
+        declared = []
+        for c in cs:
+            if self._vb_storage == 'packed' and not 'nvbeta' in self._constants:
+                W.append(packed_weights(c).reshape((-1, p*(p+1)/2)))
+            else:
+                W.append(np.array([np.outer(ca, cb).ravel()
+                                   for ca in c for cb in c]))
+            nvcon = self._declared_nvcon(c)
+            if nvcon is None and self._vb_storage == 'none':
+                raise ValueError('Contrast was not declared at fit and '
+                                 'variance matrices were not stored')
+            if nvcon is not None:
+                nvcon = nvcon.reshape((-1, nvox)).T
+            declared.append(nvcon)
+        W = np.concatenate(W).T
+        if 'nvbeta' in self._constants:
+            nvbeta = np.dot(np.ravel(self.nvbeta), W)
+        elif self._vb_storage == 'packed':
+            nvbeta = np.rollaxis(self.nvbeta, axis, ndims)
+            nvbeta = nvbeta.reshape((nvox, W.shape[0]))
+        elif self._vb_storage == 'full':
+            nvbeta = np.rollaxis(self.nvbeta, axis, ndims+1)
+            nvbeta = np.rollaxis(nvbeta, axis, ndims+1)
+            nvbeta = nvbeta.reshape((nvox, p*p))
+
+        out = np.zeros((len(cs), nvox), dtype=[('effect', np.double),
+                                                ('variance', np.double),
+                                                ('stat', np.double),
+                                                ('pvalue', np.double),
+                                                ('zscore', np.double)])
+        out['effect'][np.array(qs) > 1] = np.nan
+        out['variance'][np.array(qs) > 1] = np.nan
+        dof = np.minimum(self.dof, dofmax)
+        from nipy.neurospin.utils.zscore import zscore
+        for start in range(0, nvox, block_size):
+            stop = min(start + block_size, nvox)
+            E = np.dot(B[start:stop], C.T)
+            if 'nvbeta' in self._constants:
+                V = s2[start:stop, np.newaxis] * nvbeta
+            elif self._vb_storage != 'none':
+                V = np.dot(nvbeta[start:stop], W) * \
+                    s2[start:stop, np.newaxis]
+            row = 0
+            pair = 0
+            for i in range(len(cs)):
+                q = qs[i]
+                e = E[:, row:row+q]
+                if declared[i] is not None:
+                    v = declared[i][start:stop] * \
+                        s2[start:stop, np.newaxis]
+                else:
+                    v = V[:, pair:pair+q*q]
+                row += q
+                pair += q*q
+                if q == 1:
+                    out['effect'][i, start:stop] = e[:, 0]
+                    out['variance'][i, start:stop] = v[:, 0]
+                    t = (e[:, 0]-baseline) / np.sqrt(np.maximum(v[:, 0], tiny))
+                    if type == 'F':
+                        t = t**2
+                elif type in ('t', 'F'):
+                    v = np.maximum(v, tiny).reshape((-1, q, q))
+                    t = mahalanobis((e-baseline).T, v.transpose((1, 2, 0)))/q
+                    t = t.reshape(stop-start)
+                elif type == 'tmin':
+                    vdiag = v[:, ::q+1]
+                    t = (e-baseline) / np.sqrt(np.maximum(vdiag, tiny))
+                    t = t.min(1)
+                else:
+                    raise ValueError, 'Unknown statistic type'
+                if (type == 't' and q == 1) or type == 'tmin':
+                    pv = sps.t.sf(t, dof)
+                else:
+                    pv = sps.f.sf(t, q, dof)
+                out['stat'][i, start:stop] = t
+                out['pvalue'][i, start:stop] = pv
+                out['zscore'][i, start:stop] = zscore(pv)
+        return out.reshape((len(cs),) + vox_shape)
+
+    def _declared_nvcon(self, c):
+        """
+        Normalized variance of contrast c, if declared at fit, with
+        shape (X) for a single contrast vector, (q, q, X) otherwise
+        """
+        c = np.atleast_2d(c)
+        for con, nvcon in self._contrasts:
+            con = np.atleast_2d(con)
+            if con.shape == c.shape and np.all(con == c):
+                if c.shape[0] == 1:
+                    return nvcon.squeeze()
+                nvcon = np.rollaxis(nvcon, self._axis, 0)
+                return np.rollaxis(nvcon, self._axis+1, 1)
+        return None
                 
 
 
+def packed_weights(c):
+    """
+    Weights W such that c*V*c' = np.inner(W, v) for a symmetric p x p
+    matrix V with upper triangle v, packed as by kalman.ar1. W has shape
+    (q, q, p*(p+1)/2), where q = 1 for a contrast vector c.
+    """
+    c = np.atleast_2d(np.asarray(c, dtype=np.double))
+    i, j = np.triu_indices(c.shape[1])
+    W = c[:, np.newaxis, i] * c[np.newaxis, :, j]
+    off = i != j
+    W[:, :, off] += c[:, np.newaxis, j[off]] * c[np.newaxis, :, i[off]]
+    return W
+
+
 class contrast:
 
     def __init__(self, dim, type='t', tiny=DEF_TINY, dofmax=DEF_DOFMAX):
@@ -287,6 +474,15 @@ def load(file):
     mod.method = str(fmod['method'])
     mod._axis = int(fmod['axis'])
     mod._constants = list(fmod['constants'])
+    mod._vb_storage = 'full'
+    mod._contrasts = []
+    if 'vb_storage' in fmod.files:
+        mod._vb_storage = str(fmod['vb_storage'])
+        for i in range(int(fmod['n_contrasts'])):
+            mod._contrasts.append((fmod['contrast_%d' % i],
+                                   fmod['nvcon_%d' % i]))
+    if mod._vb_storage == 'none':
+        mod.nvbeta = None
     return mod
 
 
@@ -1,4 +1,4 @@
-/* Generated by Cython 0.12.1 on Wed May 12 21:17:32 2010 */
+/* Generated by Cython 0.12.1 on Sun Oct 18 06:51:34 2026 */
 
 #define PY_SSIZE_T_CLEAN
 #include "Python.h"
@@ -384,6 +384,20 @@ typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
 
 typedef npy_cdouble __pyx_t_5numpy_complex_t;
 
+/* "/root/package/nipy/neurospin/glm/kalman.pyx":134
+ * 
+ * # Storage of variance matrices for ar1
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     VB_FULL = 0
+ *     VB_PACKED = 1
+ */
+
+enum  {
+  __pyx_e_4nipy_9neurospin_3glm_6kalman_VB_FULL = 0,
+  __pyx_e_4nipy_9neurospin_3glm_6kalman_VB_PACKED = 1,
+  __pyx_e_4nipy_9neurospin_3glm_6kalman_VB_NONE = 2
+};
+
 #ifndef CYTHON_REFNANNY
   #define CYTHON_REFNANNY 0
 #endif
@@ -438,6 +452,100 @@ static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
 
 static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,     const char* function_name); /*proto*/
 
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
+    if (likely(PyList_CheckExact(L))) {
+        if (PyList_Append(L, x) < 0) return NULL;
+        Py_INCREF(Py_None);
+        return Py_None; /* this is just to have an accurate signature */
+    }
+    else {
+        PyObject *r, *m;
+        m = __Pyx_GetAttrString(L, "append");
+        if (!m) return NULL;
+        r = PyObject_CallFunctionObjArgs(m, x, NULL);
+        Py_DECREF(m);
+        return r;
+    }
+}
+
+
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+
+
+#define __Pyx_GetItemInt_List(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
+                                                    __Pyx_GetItemInt_List_Fast(o, i, size <= sizeof(long)) : \
+                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
+
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
+    if (likely(o != Py_None)) {
+        if (likely((0 <= i) & (i < PyList_GET_SIZE(o)))) {
+            PyObject *r = PyList_GET_ITEM(o, i);
+            Py_INCREF(r);
+            return r;
+        }
+        else if ((-PyList_GET_SIZE(o) <= i) & (i < 0)) {
+            PyObject *r = PyList_GET_ITEM(o, PyList_GET_SIZE(o) + i);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    return __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
+}
+
+#define __Pyx_GetItemInt_Tuple(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
+                                                    __Pyx_GetItemInt_Tuple_Fast(o, i, size <= sizeof(long)) : \
+                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
+
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
+    if (likely(o != Py_None)) {
+        if (likely((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, i);
+            Py_INCREF(r);
+            return r;
+        }
+        else if ((-PyTuple_GET_SIZE(o) <= i) & (i < 0)) {
+            PyObject *r = PyTuple_GET_ITEM(o, PyTuple_GET_SIZE(o) + i);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    return __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
+}
+
+
+#define __Pyx_GetItemInt(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
+                                                    __Pyx_GetItemInt_Fast(o, i, size <= sizeof(long)) : \
+                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
+
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
+    PyObject *r;
+    if (PyList_CheckExact(o) && ((0 <= i) & (i < PyList_GET_SIZE(o)))) {
+        r = PyList_GET_ITEM(o, i);
+        Py_INCREF(r);
+    }
+    else if (PyTuple_CheckExact(o) && ((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
+        r = PyTuple_GET_ITEM(o, i);
+        Py_INCREF(r);
+    }
+    else if (Py_TYPE(o)->tp_as_sequence && Py_TYPE(o)->tp_as_sequence->sq_item && (likely(i >= 0))) {
+        r = PySequence_GetItem(o, i);
+    }
+    else {
+        r = __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
+    }
+    return r;
+}
+
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
+
 #define __Pyx_SetItemInt(o, i, v, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
                                                     __Pyx_SetItemInt_Fast(o, i, v, size <= sizeof(long)) : \
                                                     __Pyx_SetItemInt_Generic(o, to_py_func(i), v))
@@ -472,7 +580,26 @@ static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void);
 static PyObject *__Pyx_UnpackItem(PyObject *, Py_ssize_t index); /*proto*/
 static int __Pyx_EndUnpack(PyObject *); /*proto*/
 
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
+#define __Pyx_DelItemInt(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
+                                                    __Pyx_DelItemInt_Fast(o, i, size <= sizeof(long)) : \
+                                                    __Pyx_DelItem_Generic(o, to_py_func(i)))
+
+static CYTHON_INLINE int __Pyx_DelItem_Generic(PyObject *o, PyObject *j) {
+    int r;
+    if (!j) return -1;
+    r = PyObject_DelItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+
+static CYTHON_INLINE int __Pyx_DelItemInt_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
+    if (Py_TYPE(o)->tp_as_sequence && Py_TYPE(o)->tp_as_sequence->sq_ass_item && likely(i >= 0))
+        return PySequence_DelItem(o, i);
+    else {
+        PyObject *j = fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i);
+        return __Pyx_DelItem_Generic(o, j);
+    }
+}
 
 static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
 
@@ -481,12 +608,28 @@ static void __Pyx_UnpackTupleError(PyObject *, Py_ssize_t index); /*proto*/
 static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
     const char *name, int exact); /*proto*/
 
+static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list); /*proto*/
 
 static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
 
+#ifndef __PYX_FORCE_INIT_THREADS
+  #if PY_VERSION_HEX < 0x02040200
+    #define __PYX_FORCE_INIT_THREADS 1
+  #else
+    #define __PYX_FORCE_INIT_THREADS 0
+  #endif
+#endif
+
 static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_npy_intp(npy_intp);
 
+static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     #define __Pyx_CREAL(z) ((z).real())
@@ -568,11 +711,6 @@ static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(do
     /*static CYTHON_INLINE double __Pyx_c_abs(__pyx_t_double_complex);*/
 #endif
 
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-
 static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
 
 static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
@@ -637,8 +775,12 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *, PyObjec
 static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *); /*proto*/
 /* Module declarations from fff */
 
+/* Module declarations from cython */
+
 /* Module declarations from nipy.neurospin.glm.kalman */
 
+static char *__pyx_f_4nipy_9neurospin_3glm_6kalman__voxel_ptr(char *, npy_intp *, npy_intp *, int, int, size_t); /*proto*/
+static CYTHON_INLINE void __pyx_f_4nipy_9neurospin_3glm_6kalman__store(char *, double, int); /*proto*/
 #define __Pyx_MODULE_NAME "nipy.neurospin.glm.kalman"
 int __pyx_module_is_main_nipy__neurospin__glm__kalman = 0;
 
@@ -646,20 +788,25 @@ int __pyx_module_is_main_nipy__neurospin__glm__kalman = 0;
 static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_RuntimeError;
-static char __pyx_k_1[] = "ndarray is not C contiguous";
-static char __pyx_k_2[] = "ndarray is not Fortran contiguous";
-static char __pyx_k_3[] = "Non-native byte order not supported";
-static char __pyx_k_4[] = "unknown dtype code in numpy.pxd (%d)";
-static char __pyx_k_5[] = "Format string allocated too short, see comment in numpy.pxd";
-static char __pyx_k_6[] = "Format string allocated too short.";
-static char __pyx_k_7[] = "\nIncremental (Kalman-like) filters for linear regression. \n\nAuthor: Alexis Roche, 2008.\n";
-static char __pyx_k_8[] = "0.1";
+static char __pyx_k_2[] = "Unknown variance storage \"%s\"";
+static char __pyx_k_3[] = "Variance type should be double or float32";
+static char __pyx_k_4[] = "Axis length is not a triangular number";
+static char __pyx_k_5[] = "ndarray is not C contiguous";
+static char __pyx_k_6[] = "ndarray is not Fortran contiguous";
+static char __pyx_k_7[] = "Non-native byte order not supported";
+static char __pyx_k_8[] = "unknown dtype code in numpy.pxd (%d)";
+static char __pyx_k_9[] = "Format string allocated too short, see comment in numpy.pxd";
+static char __pyx_k_10[] = "Format string allocated too short.";
+static char __pyx_k_11[] = "\nIncremental (Kalman-like) filters for linear regression. \n\nAuthor: Alexis Roche, 2008.\n";
+static char __pyx_k_12[] = "0.1";
+static char __pyx_k__A[] = "A";
 static char __pyx_k__B[] = "B";
 static char __pyx_k__H[] = "H";
 static char __pyx_k__I[] = "I";
 static char __pyx_k__L[] = "L";
 static char __pyx_k__O[] = "O";
 static char __pyx_k__Q[] = "Q";
+static char __pyx_k__W[] = "W";
 static char __pyx_k__X[] = "X";
 static char __pyx_k__Y[] = "Y";
 static char __pyx_k__a[] = "a";
@@ -671,6 +818,9 @@ static char __pyx_k__h[] = "h";
 static char __pyx_k__i[] = "i";
 static char __pyx_k__l[] = "l";
 static char __pyx_k__q[] = "q";
+static char __pyx_k__CV[] = "CV";
+static char __pyx_k__S2[] = "S2";
+static char __pyx_k__VB[] = "VB";
 static char __pyx_k__Vb[] = "Vb";
 static char __pyx_k__Zd[] = "Zd";
 static char __pyx_k__Zf[] = "Zf";
@@ -680,132 +830,317 @@ static char __pyx_k__s2[] = "s2";
 static char __pyx_k__buf[] = "buf";
 static char __pyx_k__dof[] = "dof";
 static char __pyx_k__obj[] = "obj";
+static char __pyx_k__sys[] = "sys";
+static char __pyx_k__args[] = "args";
 static char __pyx_k__axis[] = "axis";
 static char __pyx_k__base[] = "base";
+static char __pyx_k__copy[] = "copy";
 static char __pyx_k__data[] = "data";
+static char __pyx_k__full[] = "full";
+static char __pyx_k__join[] = "join";
 static char __pyx_k__ndim[] = "ndim";
+static char __pyx_k__none[] = "none";
+static char __pyx_k__outs[] = "outs";
 static char __pyx_k__size[] = "size";
+static char __pyx_k__sqrt[] = "sqrt";
+static char __pyx_k__stop[] = "stop";
+static char __pyx_k__array[] = "array";
 static char __pyx_k__descr[] = "descr";
 static char __pyx_k__dtype[] = "dtype";
+static char __pyx_k__flags[] = "flags";
 static char __pyx_k__index[] = "index";
 static char __pyx_k__names[] = "names";
 static char __pyx_k__niter[] = "niter";
 static char __pyx_k__numpy[] = "numpy";
+static char __pyx_k__outer[] = "outer";
+static char __pyx_k__owner[] = "owner";
 static char __pyx_k__range[] = "range";
+static char __pyx_k__ravel[] = "ravel";
 static char __pyx_k__shape[] = "shape";
 static char __pyx_k__size2[] = "size2";
+static char __pyx_k__start[] = "start";
 static char __pyx_k__zeros[] = "zeros";
+static char __pyx_k__Thread[] = "Thread";
 static char __pyx_k__double[] = "double";
+static char __pyx_k__errors[] = "errors";
 static char __pyx_k__fields[] = "fields";
 static char __pyx_k__format[] = "format";
 static char __pyx_k__insert[] = "insert";
+static char __pyx_k__packed[] = "packed";
+static char __pyx_k__stride[] = "stride";
+static char __pyx_k__target[] = "target";
 static char __pyx_k__vector[] = "vector";
+static char __pyx_k__aligned[] = "aligned";
+static char __pyx_k__asarray[] = "asarray";
+static char __pyx_k__float32[] = "float32";
+static char __pyx_k__has_key[] = "has_key";
 static char __pyx_k__reshape[] = "reshape";
 static char __pyx_k__strides[] = "strides";
 static char __pyx_k____main__[] = "__main__";
+static char __pyx_k__exc_info[] = "exc_info";
 static char __pyx_k__itemsize[] = "itemsize";
 static char __pyx_k__readonly[] = "readonly";
+static char __pyx_k__rollaxis[] = "rollaxis";
 static char __pyx_k__type_num[] = "type_num";
+static char __pyx_k__vb_dtype[] = "vb_dtype";
 static char __pyx_k__byteorder[] = "byteorder";
+static char __pyx_k__contrasts[] = "contrasts";
+static char __pyx_k__fit_range[] = "fit_range";
+static char __pyx_k__n_threads[] = "n_threads";
+static char __pyx_k__threading[] = "threading";
 static char __pyx_k__ValueError[] = "ValueError";
+static char __pyx_k___ar1_range[] = "_ar1_range";
+static char __pyx_k___ols_range[] = "_ols_range";
+static char __pyx_k___run_range[] = "_run_range";
+static char __pyx_k__atleast_2d[] = "atleast_2d";
 static char __pyx_k__suboffsets[] = "suboffsets";
+static char __pyx_k__vb_storage[] = "vb_storage";
 static char __pyx_k____version__[] = "__version__";
+static char __pyx_k__vb_storages[] = "vb_storages";
 static char __pyx_k__RuntimeError[] = "RuntimeError";
-static PyObject *__pyx_kp_u_1;
-static PyObject *__pyx_kp_u_2;
-static PyObject *__pyx_kp_u_3;
-static PyObject *__pyx_kp_u_4;
+static char __pyx_k___fit_threads[] = "_fit_threads";
+static char __pyx_k___use_threads[] = "_use_threads";
+static char __pyx_k__triu_indices[] = "triu_indices";
+static char __pyx_k___double_aligned[] = "_double_aligned";
+static PyObject *__pyx_kp_u_10;
+static PyObject *__pyx_kp_s_12;
+static PyObject *__pyx_kp_s_2;
+static PyObject *__pyx_kp_s_3;
+static PyObject *__pyx_kp_s_4;
 static PyObject *__pyx_kp_u_5;
 static PyObject *__pyx_kp_u_6;
-static PyObject *__pyx_kp_s_8;
+static PyObject *__pyx_kp_u_7;
+static PyObject *__pyx_kp_u_8;
+static PyObject *__pyx_kp_u_9;
+static PyObject *__pyx_n_s__A;
+static PyObject *__pyx_n_s__B;
+static PyObject *__pyx_n_s__CV;
 static PyObject *__pyx_n_s__RuntimeError;
+static PyObject *__pyx_n_s__S2;
+static PyObject *__pyx_n_s__Thread;
+static PyObject *__pyx_n_s__VB;
 static PyObject *__pyx_n_s__ValueError;
 static PyObject *__pyx_n_s__Vb;
+static PyObject *__pyx_n_s__W;
 static PyObject *__pyx_n_s__X;
 static PyObject *__pyx_n_s__Y;
 static PyObject *__pyx_n_s____main__;
 static PyObject *__pyx_n_s____version__;
+static PyObject *__pyx_n_s___ar1_range;
+static PyObject *__pyx_n_s___double_aligned;
+static PyObject *__pyx_n_s___fit_threads;
+static PyObject *__pyx_n_s___ols_range;
+static PyObject *__pyx_n_s___run_range;
+static PyObject *__pyx_n_s___use_threads;
 static PyObject *__pyx_n_s__a;
+static PyObject *__pyx_n_s__aligned;
+static PyObject *__pyx_n_s__args;
+static PyObject *__pyx_n_s__array;
+static PyObject *__pyx_n_s__asarray;
+static PyObject *__pyx_n_s__atleast_2d;
 static PyObject *__pyx_n_s__axis;
 static PyObject *__pyx_n_s__b;
 static PyObject *__pyx_n_s__base;
 static PyObject *__pyx_n_s__buf;
 static PyObject *__pyx_n_s__byteorder;
+static PyObject *__pyx_n_s__contrasts;
+static PyObject *__pyx_n_s__copy;
 static PyObject *__pyx_n_s__data;
 static PyObject *__pyx_n_s__descr;
 static PyObject *__pyx_n_s__dof;
 static PyObject *__pyx_n_s__double;
 static PyObject *__pyx_n_s__dtype;
+static PyObject *__pyx_n_s__errors;
+static PyObject *__pyx_n_s__exc_info;
 static PyObject *__pyx_n_s__fields;
+static PyObject *__pyx_n_s__fit_range;
+static PyObject *__pyx_n_s__flags;
+static PyObject *__pyx_n_s__float32;
 static PyObject *__pyx_n_s__format;
+static PyObject *__pyx_n_s__full;
+static PyObject *__pyx_n_s__has_key;
+static PyObject *__pyx_n_s__i;
 static PyObject *__pyx_n_s__index;
 static PyObject *__pyx_n_s__insert;
 static PyObject *__pyx_n_s__itemsize;
+static PyObject *__pyx_n_s__join;
+static PyObject *__pyx_n_s__n_threads;
 static PyObject *__pyx_n_s__names;
 static PyObject *__pyx_n_s__ndim;
 static PyObject *__pyx_n_s__niter;
+static PyObject *__pyx_n_s__none;
 static PyObject *__pyx_n_s__np;
 static PyObject *__pyx_n_s__numpy;
 static PyObject *__pyx_n_s__obj;
+static PyObject *__pyx_n_s__outer;
+static PyObject *__pyx_n_s__outs;
+static PyObject *__pyx_n_s__owner;
+static PyObject *__pyx_n_s__packed;
 static PyObject *__pyx_n_s__range;
+static PyObject *__pyx_n_s__ravel;
 static PyObject *__pyx_n_s__readonly;
 static PyObject *__pyx_n_s__reshape;
+static PyObject *__pyx_n_s__rollaxis;
 static PyObject *__pyx_n_s__s2;
 static PyObject *__pyx_n_s__shape;
 static PyObject *__pyx_n_s__size;
 static PyObject *__pyx_n_s__size2;
+static PyObject *__pyx_n_s__sqrt;
+static PyObject *__pyx_n_s__start;
+static PyObject *__pyx_n_s__stop;
+static PyObject *__pyx_n_s__stride;
 static PyObject *__pyx_n_s__strides;
 static PyObject *__pyx_n_s__suboffsets;
+static PyObject *__pyx_n_s__sys;
+static PyObject *__pyx_n_s__target;
+static PyObject *__pyx_n_s__threading;
+static PyObject *__pyx_n_s__triu_indices;
 static PyObject *__pyx_n_s__type_num;
+static PyObject *__pyx_n_s__vb_dtype;
+static PyObject *__pyx_n_s__vb_storage;
+static PyObject *__pyx_n_s__vb_storages;
 static PyObject *__pyx_n_s__vector;
 static PyObject *__pyx_n_s__zeros;
+static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_1;
+static PyObject *__pyx_int_2;
+static PyObject *__pyx_int_8;
+static PyObject *__pyx_int_neg_1;
 static PyObject *__pyx_int_15;
+static PyObject *__pyx_k_1;
 
-/* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":68
- * # Standard Kalman filter
+/* "/root/package/nipy/neurospin/glm/kalman.pyx":77
+ * 
+ * @cython.cdivision(True)
+ * cdef char* _voxel_ptr(char* data, npy_intp* dims, npy_intp* strides,             # <<<<<<<<<<<<<<
+ *                       int ndim, int axis, size_t k) nogil:
+ *     cdef int d
+ */
+
+static  char *__pyx_f_4nipy_9neurospin_3glm_6kalman__voxel_ptr(char *__pyx_v_data, npy_intp *__pyx_v_dims, npy_intp *__pyx_v_strides, int __pyx_v_ndim, int __pyx_v_axis, size_t __pyx_v_k) {
+  int __pyx_v_d;
+  char *__pyx_r;
+  int __pyx_t_1;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":80
+ *                       int ndim, int axis, size_t k) nogil:
+ *     cdef int d
+ *     for d from ndim > d >= 0:             # <<<<<<<<<<<<<<
+ *         if d == axis:
+ *             continue
+ */
+  for (__pyx_v_d = __pyx_v_ndim-1; __pyx_v_d >= 0; __pyx_v_d--) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":81
+ *     cdef int d
+ *     for d from ndim > d >= 0:
+ *         if d == axis:             # <<<<<<<<<<<<<<
+ *             continue
+ *         data = data + (k % dims[d]) * strides[d]
+ */
+    __pyx_t_1 = (__pyx_v_d == __pyx_v_axis);
+    if (__pyx_t_1) {
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":82
+ *     for d from ndim > d >= 0:
+ *         if d == axis:
+ *             continue             # <<<<<<<<<<<<<<
+ *         data = data + (k % dims[d]) * strides[d]
+ *         k = k / dims[d]
+ */
+      goto __pyx_L3_continue;
+      goto __pyx_L5;
+    }
+    __pyx_L5:;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":83
+ *         if d == axis:
+ *             continue
+ *         data = data + (k % dims[d]) * strides[d]             # <<<<<<<<<<<<<<
+ *         k = k / dims[d]
+ *     return data
+ */
+    __pyx_v_data = (__pyx_v_data + ((__pyx_v_k % (__pyx_v_dims[__pyx_v_d])) * (__pyx_v_strides[__pyx_v_d])));
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":84
+ *             continue
+ *         data = data + (k % dims[d]) * strides[d]
+ *         k = k / dims[d]             # <<<<<<<<<<<<<<
+ *     return data
+ * 
+ */
+    __pyx_v_k = (__pyx_v_k / (__pyx_v_dims[__pyx_v_d]));
+    __pyx_L3_continue:;
+  }
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":85
+ *         data = data + (k % dims[d]) * strides[d]
+ *         k = k / dims[d]
+ *     return data             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_data;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/nipy/neurospin/glm/kalman.pyx":88
+ * 
  * 
- * def ols(ndarray Y, ndarray X, int axis=0):             # <<<<<<<<<<<<<<
+ * def _ols_range(ndarray Y, ndarray X, ndarray B, ndarray S2, int axis,             # <<<<<<<<<<<<<<
+ *                size_t start, size_t stop):
  *     """
- *     (beta, norm_var_beta, s2, dof) = ols(Y, X, axis=0).
  */
 
-static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman_ols(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_4nipy_9neurospin_3glm_6kalman_ols[] = "\n    (beta, norm_var_beta, s2, dof) = ols(Y, X, axis=0).\n\n    Ordinary least-square multiple regression using the Kalman filter.\n    Fit the N-dimensional array Y along the given axis in terms of the\n    regressors in matrix X. The regressors must be stored columnwise.\n\n    OUTPUT: a four-element tuple\n    beta -- array of parameter estimates\n    norm_var_beta -- normalized variance matrix of the parameter\n    estimates (data independent)\n    s2 -- array of squared scale\n    parameters to multiply norm_var_beta for the variance matrix of\n    beta.\n    dof -- scalar degrees of freedom.\n\n    REFERENCE:  Roche et al, ISBI 2004.\n    ";
-static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman_ols(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman__ols_range(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_3glm_6kalman__ols_range[] = "\n    (norm_var_beta, dof) = _ols_range(Y, X, B, S2, axis, start, stop)\n\n    Fit voxels from `start` up to `stop` with the Kalman filter, writing\n    parameter estimates into `B` and squared scales into `S2`.  `Y` must\n    be an aligned double array.\n    ";
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman__ols_range(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_Y = 0;
   PyArrayObject *__pyx_v_X = 0;
+  PyArrayObject *__pyx_v_B = 0;
+  PyArrayObject *__pyx_v_S2 = 0;
   int __pyx_v_axis;
-  fff_vector *__pyx_v_y;
-  fff_vector *__pyx_v_b;
-  fff_vector *__pyx_v_s2;
+  size_t __pyx_v_start;
+  size_t __pyx_v_stop;
+  fff_vector __pyx_v_y;
   fff_matrix *__pyx_v_x;
   fff_glm_KF *__pyx_v_kfilt;
+  size_t __pyx_v_k;
+  size_t __pyx_v_j;
   size_t __pyx_v_p;
-  fffpy_multi_iterator *__pyx_v_multi;
+  char *__pyx_v_bk;
+  char *__pyx_v_ydata;
+  char *__pyx_v_bdata;
+  char *__pyx_v_sdata;
+  npy_intp *__pyx_v_dims;
+  npy_intp *__pyx_v_ystrides;
+  npy_intp *__pyx_v_bstrides;
+  npy_intp *__pyx_v_sstrides;
+  npy_intp __pyx_v_bstride;
+  int __pyx_v_ndim;
   double __pyx_v_dof;
-  PyObject *__pyx_v_dims;
-  PyObject *__pyx_v_B;
-  PyObject *__pyx_v_S2;
   PyObject *__pyx_v_VB;
-  PyObject *__pyx_v_i;
   PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
+  npy_intp __pyx_t_1;
+  size_t __pyx_t_2;
+  size_t __pyx_t_3;
   PyObject *__pyx_t_4 = NULL;
-  Py_ssize_t __pyx_t_5;
-  int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  int __pyx_t_9;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Y,&__pyx_n_s__X,&__pyx_n_s__axis,0};
-  __Pyx_RefNannySetupContext("ols");
+  PyObject *__pyx_t_5 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Y,&__pyx_n_s__X,&__pyx_n_s__B,&__pyx_n_s__S2,&__pyx_n_s__axis,&__pyx_n_s__start,&__pyx_n_s__stop,0};
+  __Pyx_RefNannySetupContext("_ols_range");
   __pyx_self = __pyx_self;
   if (unlikely(__pyx_kwds)) {
     Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[3] = {0,0,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
     switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
       case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -821,461 +1156,496 @@ static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman_ols(PyObject *__pyx_self
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__X);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("ols", 0, 2, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_ols_range", 1, 7, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
-      if (kw_args > 0) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__axis);
-        if (unlikely(value)) { values[2] = value; kw_args--; }
+      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__B);
+      if (likely(values[2])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ols_range", 1, 7, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  3:
+      values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__S2);
+      if (likely(values[3])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ols_range", 1, 7, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  4:
+      values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__axis);
+      if (likely(values[4])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ols_range", 1, 7, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  5:
+      values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__start);
+      if (likely(values[5])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ols_range", 1, 7, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  6:
+      values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__stop);
+      if (likely(values[6])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ols_range", 1, 7, 7, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "ols") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_ols_range") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_Y = ((PyArrayObject *)values[0]);
     __pyx_v_X = ((PyArrayObject *)values[1]);
-    if (values[2]) {
-      __pyx_v_axis = __Pyx_PyInt_AsInt(values[2]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_axis = ((int)0);
-    }
+    __pyx_v_B = ((PyArrayObject *)values[2]);
+    __pyx_v_S2 = ((PyArrayObject *)values[3]);
+    __pyx_v_axis = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_start = __Pyx_PyInt_AsSize_t(values[5]); if (unlikely((__pyx_v_start == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stop = __Pyx_PyInt_AsSize_t(values[6]); if (unlikely((__pyx_v_stop == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
+    goto __pyx_L5_argtuple_error;
   } else {
-    __pyx_v_axis = ((int)0);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  3:
-      __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  2:
-      __pyx_v_X = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
-      __pyx_v_Y = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-      break;
-      default: goto __pyx_L5_argtuple_error;
-    }
+    __pyx_v_Y = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
+    __pyx_v_X = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
+    __pyx_v_B = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 2));
+    __pyx_v_S2 = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 3));
+    __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_start = __Pyx_PyInt_AsSize_t(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely((__pyx_v_start == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stop = __Pyx_PyInt_AsSize_t(PyTuple_GET_ITEM(__pyx_args, 6)); if (unlikely((__pyx_v_stop == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("ols", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("_ols_range", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nipy.neurospin.glm.kalman.ols");
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman._ols_range");
   return NULL;
   __pyx_L4_argument_unpacking_done:;
   __Pyx_INCREF((PyObject *)__pyx_v_Y);
   __Pyx_INCREF((PyObject *)__pyx_v_X);
-  __pyx_v_dims = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_B = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_S2 = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_INCREF((PyObject *)__pyx_v_B);
+  __Pyx_INCREF((PyObject *)__pyx_v_S2);
   __pyx_v_VB = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_X), __pyx_ptype_5numpy_ndarray, 1, "X", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":95
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_X), __pyx_ptype_5numpy_ndarray, 1, "X", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_B), __pyx_ptype_5numpy_ndarray, 1, "B", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_S2), __pyx_ptype_5numpy_ndarray, 1, "S2", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":102
+ *     cdef size_t k, j, p
+ *     cdef char *bk
+ *     cdef char *ydata = Y.data, *bdata = B.data, *sdata = S2.data             # <<<<<<<<<<<<<<
+ *     cdef npy_intp *dims = Y.shape
+ *     cdef npy_intp *ystrides = Y.strides, *bstrides = B.strides
+ */
+  __pyx_v_ydata = __pyx_v_Y->data;
+  __pyx_v_bdata = __pyx_v_B->data;
+  __pyx_v_sdata = __pyx_v_S2->data;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":103
+ *     cdef char *bk
+ *     cdef char *ydata = Y.data, *bdata = B.data, *sdata = S2.data
+ *     cdef npy_intp *dims = Y.shape             # <<<<<<<<<<<<<<
+ *     cdef npy_intp *ystrides = Y.strides, *bstrides = B.strides
+ *     cdef npy_intp *sstrides = S2.strides
+ */
+  __pyx_v_dims = __pyx_v_Y->dimensions;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":104
+ *     cdef char *ydata = Y.data, *bdata = B.data, *sdata = S2.data
+ *     cdef npy_intp *dims = Y.shape
+ *     cdef npy_intp *ystrides = Y.strides, *bstrides = B.strides             # <<<<<<<<<<<<<<
+ *     cdef npy_intp *sstrides = S2.strides
+ *     cdef npy_intp bstride = B.strides[axis]
+ */
+  __pyx_v_ystrides = __pyx_v_Y->strides;
+  __pyx_v_bstrides = __pyx_v_B->strides;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":105
+ *     cdef npy_intp *dims = Y.shape
+ *     cdef npy_intp *ystrides = Y.strides, *bstrides = B.strides
+ *     cdef npy_intp *sstrides = S2.strides             # <<<<<<<<<<<<<<
+ *     cdef npy_intp bstride = B.strides[axis]
+ *     cdef int ndim = Y.ndim
+ */
+  __pyx_v_sstrides = __pyx_v_S2->strides;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":106
+ *     cdef npy_intp *ystrides = Y.strides, *bstrides = B.strides
+ *     cdef npy_intp *sstrides = S2.strides
+ *     cdef npy_intp bstride = B.strides[axis]             # <<<<<<<<<<<<<<
+ *     cdef int ndim = Y.ndim
+ *     cdef double dof
+ */
+  __pyx_v_bstride = (__pyx_v_B->strides[__pyx_v_axis]);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":107
+ *     cdef npy_intp *sstrides = S2.strides
+ *     cdef npy_intp bstride = B.strides[axis]
+ *     cdef int ndim = Y.ndim             # <<<<<<<<<<<<<<
+ *     cdef double dof
+ * 
+ */
+  __pyx_v_ndim = __pyx_v_Y->nd;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":110
+ *     cdef double dof
  * 
- *     # View on design matrix
  *     x = fff_matrix_fromPyArray(X)             # <<<<<<<<<<<<<<
- * 
- *     # Number of regressors
+ *     p = x.size2
+ *     kfilt = fff_glm_KF_new(p)
  */
   __pyx_v_x = fff_matrix_fromPyArray(__pyx_v_X);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":98
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":111
  * 
- *     # Number of regressors
+ *     x = fff_matrix_fromPyArray(X)
  *     p = x.size2             # <<<<<<<<<<<<<<
- * 
- *     # Allocate output arrays B and S2
+ *     kfilt = fff_glm_KF_new(p)
+ *     y.size = Y.shape[axis]
  */
   __pyx_v_p = __pyx_v_x->size2;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":105
- *     # type; see:
- *     # http://codespeak.net/pipermail/cython-dev/2009-April/005229.html
- *     dims = [Y.shape[i] for i in range(Y.ndim)]             # <<<<<<<<<<<<<<
- *     dims[axis] = p
- *     B = np.zeros(dims, dtype=np.double)
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":112
+ *     x = fff_matrix_fromPyArray(X)
+ *     p = x.size2
+ *     kfilt = fff_glm_KF_new(p)             # <<<<<<<<<<<<<<
+ *     y.size = Y.shape[axis]
+ *     y.stride = Y.strides[axis] / sizeof(double)
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_3 = PyInt_FromLong(__pyx_v_Y->nd); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_Call(__pyx_builtin_range, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
-    __pyx_t_2 = 0; __pyx_t_4 = __pyx_t_3; __Pyx_INCREF(__pyx_t_4);
-  } else {
-    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_4))) {
-      if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_4)) break;
-      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
-      if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
-      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++;
-    } else {
-      __pyx_t_3 = PyIter_Next(__pyx_t_4);
-      if (!__pyx_t_3) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_3);
-    }
-    __Pyx_DECREF(__pyx_v_i);
-    __pyx_v_i = __pyx_t_3;
-    __pyx_t_3 = 0;
-    __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_3 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_Y->dimensions[__pyx_t_5])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_3); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_INCREF(((PyObject *)__pyx_t_1));
-  __Pyx_DECREF(__pyx_v_dims);
-  __pyx_v_dims = ((PyObject *)__pyx_t_1);
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+  __pyx_v_kfilt = fff_glm_KF_new(__pyx_v_p);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":106
- *     # http://codespeak.net/pipermail/cython-dev/2009-April/005229.html
- *     dims = [Y.shape[i] for i in range(Y.ndim)]
- *     dims[axis] = p             # <<<<<<<<<<<<<<
- *     B = np.zeros(dims, dtype=np.double)
- *     dims[axis] = 1
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":113
+ *     p = x.size2
+ *     kfilt = fff_glm_KF_new(p)
+ *     y.size = Y.shape[axis]             # <<<<<<<<<<<<<<
+ *     y.stride = Y.strides[axis] / sizeof(double)
+ *     y.owner = 0
  */
-  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_p); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_t_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_y.size = (__pyx_v_Y->dimensions[__pyx_v_axis]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":107
- *     dims = [Y.shape[i] for i in range(Y.ndim)]
- *     dims[axis] = p
- *     B = np.zeros(dims, dtype=np.double)             # <<<<<<<<<<<<<<
- *     dims[axis] = 1
- *     S2 = np.zeros(dims, dtype=np.double)
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":114
+ *     kfilt = fff_glm_KF_new(p)
+ *     y.size = Y.shape[axis]
+ *     y.stride = Y.strides[axis] / sizeof(double)             # <<<<<<<<<<<<<<
+ *     y.owner = 0
+ * 
  */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_dims);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_dims);
-  __Pyx_GIVEREF(__pyx_v_dims);
-  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-  __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_8 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__double); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  if (PyDict_SetItem(__pyx_t_3, ((PyObject *)__pyx_n_s__dtype), __pyx_t_8) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = PyEval_CallObjectWithKeywords(__pyx_t_4, __pyx_t_1, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_v_B);
-  __pyx_v_B = __pyx_t_8;
-  __pyx_t_8 = 0;
+  __pyx_t_1 = (__pyx_v_Y->strides[__pyx_v_axis]);
+  __pyx_t_2 = (sizeof(double));
+  if (unlikely(__pyx_t_2 == 0)) {
+    PyErr_Format(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_v_y.stride = (__pyx_t_1 / __pyx_t_2);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":108
- *     dims[axis] = p
- *     B = np.zeros(dims, dtype=np.double)
- *     dims[axis] = 1             # <<<<<<<<<<<<<<
- *     S2 = np.zeros(dims, dtype=np.double)
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":115
+ *     y.size = Y.shape[axis]
+ *     y.stride = Y.strides[axis] / sizeof(double)
+ *     y.owner = 0             # <<<<<<<<<<<<<<
  * 
+ *     with nogil:
  */
-  if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_int_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_y.owner = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":109
- *     B = np.zeros(dims, dtype=np.double)
- *     dims[axis] = 1
- *     S2 = np.zeros(dims, dtype=np.double)             # <<<<<<<<<<<<<<
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":117
+ *     y.owner = 0
  * 
- *     # Allocate local structure
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for k from start <= k < stop:
+ *             y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)
  */
-  __pyx_t_8 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_8, __pyx_n_s__zeros); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_INCREF(__pyx_v_dims);
-  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_dims);
-  __Pyx_GIVEREF(__pyx_v_dims);
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_7 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__double); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__dtype), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = PyEval_CallObjectWithKeywords(__pyx_t_3, __pyx_t_8, ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_v_S2);
-  __pyx_v_S2 = __pyx_t_7;
-  __pyx_t_7 = 0;
+  { PyThreadState *_save;
+    Py_UNBLOCK_THREADS
+    /*try:*/ {
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":112
- * 
- *     # Allocate local structure
- *     kfilt = fff_glm_KF_new(p)             # <<<<<<<<<<<<<<
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":118
  * 
- *     # Create a new array iterator
+ *     with nogil:
+ *         for k from start <= k < stop:             # <<<<<<<<<<<<<<
+ *             y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)
+ *             fff_glm_KF_fit(kfilt, &y, x)
  */
-  __pyx_v_kfilt = fff_glm_KF_new(__pyx_v_p);
+      __pyx_t_2 = __pyx_v_stop;
+      for (__pyx_v_k = __pyx_v_start; __pyx_v_k < __pyx_t_2; __pyx_v_k++) {
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":115
- * 
- *     # Create a new array iterator
- *     multi = fffpy_multi_iterator_new(3, axis, <void*>Y, <void*>B, <void*>S2)             # <<<<<<<<<<<<<<
- * 
- *     # Create views
+        /* "/root/package/nipy/neurospin/glm/kalman.pyx":119
+ *     with nogil:
+ *         for k from start <= k < stop:
+ *             y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)             # <<<<<<<<<<<<<<
+ *             fff_glm_KF_fit(kfilt, &y, x)
+ *             bk = _voxel_ptr(bdata, dims, bstrides, ndim, axis, k)
  */
-  __pyx_v_multi = fffpy_multi_iterator_new(3, __pyx_v_axis, ((void *)__pyx_v_Y), ((void *)__pyx_v_B), ((void *)__pyx_v_S2));
+        __pyx_v_y.data = ((double *)__pyx_f_4nipy_9neurospin_3glm_6kalman__voxel_ptr(__pyx_v_ydata, __pyx_v_dims, __pyx_v_ystrides, __pyx_v_ndim, __pyx_v_axis, __pyx_v_k));
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":118
- * 
- *     # Create views
- *     y = multi.vector[0]             # <<<<<<<<<<<<<<
- *     b = multi.vector[1]
- *     s2 = multi.vector[2]
+        /* "/root/package/nipy/neurospin/glm/kalman.pyx":120
+ *         for k from start <= k < stop:
+ *             y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)
+ *             fff_glm_KF_fit(kfilt, &y, x)             # <<<<<<<<<<<<<<
+ *             bk = _voxel_ptr(bdata, dims, bstrides, ndim, axis, k)
+ *             for j from 0 <= j < p:
  */
-  __pyx_v_y = (__pyx_v_multi->vector[0]);
+        fff_glm_KF_fit(__pyx_v_kfilt, (&__pyx_v_y), __pyx_v_x);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":119
- *     # Create views
- *     y = multi.vector[0]
- *     b = multi.vector[1]             # <<<<<<<<<<<<<<
- *     s2 = multi.vector[2]
- * 
+        /* "/root/package/nipy/neurospin/glm/kalman.pyx":121
+ *             y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)
+ *             fff_glm_KF_fit(kfilt, &y, x)
+ *             bk = _voxel_ptr(bdata, dims, bstrides, ndim, axis, k)             # <<<<<<<<<<<<<<
+ *             for j from 0 <= j < p:
+ *                 (<double*>(bk + j * bstride))[0] = kfilt.b.data[j * kfilt.b.stride]
  */
-  __pyx_v_b = (__pyx_v_multi->vector[1]);
+        __pyx_v_bk = __pyx_f_4nipy_9neurospin_3glm_6kalman__voxel_ptr(__pyx_v_bdata, __pyx_v_dims, __pyx_v_bstrides, __pyx_v_ndim, __pyx_v_axis, __pyx_v_k);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":120
- *     y = multi.vector[0]
- *     b = multi.vector[1]
- *     s2 = multi.vector[2]             # <<<<<<<<<<<<<<
- * 
- *     # Loop
+        /* "/root/package/nipy/neurospin/glm/kalman.pyx":122
+ *             fff_glm_KF_fit(kfilt, &y, x)
+ *             bk = _voxel_ptr(bdata, dims, bstrides, ndim, axis, k)
+ *             for j from 0 <= j < p:             # <<<<<<<<<<<<<<
+ *                 (<double*>(bk + j * bstride))[0] = kfilt.b.data[j * kfilt.b.stride]
+ *             (<double*>_voxel_ptr(sdata, dims, sstrides, ndim, axis, k))[0] = kfilt.s2
  */
-  __pyx_v_s2 = (__pyx_v_multi->vector[2]);
+        __pyx_t_3 = __pyx_v_p;
+        for (__pyx_v_j = 0; __pyx_v_j < __pyx_t_3; __pyx_v_j++) {
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":123
+          /* "/root/package/nipy/neurospin/glm/kalman.pyx":123
+ *             bk = _voxel_ptr(bdata, dims, bstrides, ndim, axis, k)
+ *             for j from 0 <= j < p:
+ *                 (<double*>(bk + j * bstride))[0] = kfilt.b.data[j * kfilt.b.stride]             # <<<<<<<<<<<<<<
+ *             (<double*>_voxel_ptr(sdata, dims, sstrides, ndim, axis, k))[0] = kfilt.s2
  * 
- *     # Loop
- *     while(multi.index < multi.size):             # <<<<<<<<<<<<<<
- *         fff_glm_KF_fit(kfilt, y, x)
- *         fff_vector_memcpy(b, kfilt.b)
- */
-  while (1) {
-    __pyx_t_9 = (__pyx_v_multi->index < __pyx_v_multi->size);
-    if (!__pyx_t_9) break;
-
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":124
- *     # Loop
- *     while(multi.index < multi.size):
- *         fff_glm_KF_fit(kfilt, y, x)             # <<<<<<<<<<<<<<
- *         fff_vector_memcpy(b, kfilt.b)
- *         s2.data[0] = kfilt.s2
- */
-    fff_glm_KF_fit(__pyx_v_kfilt, __pyx_v_y, __pyx_v_x);
-
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":125
- *     while(multi.index < multi.size):
- *         fff_glm_KF_fit(kfilt, y, x)
- *         fff_vector_memcpy(b, kfilt.b)             # <<<<<<<<<<<<<<
- *         s2.data[0] = kfilt.s2
- *         fffpy_multi_iterator_update(multi)
  */
-    fff_vector_memcpy(__pyx_v_b, __pyx_v_kfilt->b);
+          (((double *)(__pyx_v_bk + (__pyx_v_j * __pyx_v_bstride)))[0]) = (__pyx_v_kfilt->b->data[(__pyx_v_j * __pyx_v_kfilt->b->stride)]);
+        }
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":126
- *         fff_glm_KF_fit(kfilt, y, x)
- *         fff_vector_memcpy(b, kfilt.b)
- *         s2.data[0] = kfilt.s2             # <<<<<<<<<<<<<<
- *         fffpy_multi_iterator_update(multi)
+        /* "/root/package/nipy/neurospin/glm/kalman.pyx":124
+ *             for j from 0 <= j < p:
+ *                 (<double*>(bk + j * bstride))[0] = kfilt.b.data[j * kfilt.b.stride]
+ *             (<double*>_voxel_ptr(sdata, dims, sstrides, ndim, axis, k))[0] = kfilt.s2             # <<<<<<<<<<<<<<
  * 
+ *     VB = fff_matrix_const_toPyArray(kfilt.Vb)
  */
-    (__pyx_v_s2->data[0]) = __pyx_v_kfilt->s2;
+        (((double *)__pyx_f_4nipy_9neurospin_3glm_6kalman__voxel_ptr(__pyx_v_sdata, __pyx_v_dims, __pyx_v_sstrides, __pyx_v_ndim, __pyx_v_axis, __pyx_v_k))[0]) = __pyx_v_kfilt->s2;
+      }
+    }
+    /*finally:*/ {
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":127
- *         fff_vector_memcpy(b, kfilt.b)
- *         s2.data[0] = kfilt.s2
- *         fffpy_multi_iterator_update(multi)             # <<<<<<<<<<<<<<
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":117
+ *     y.owner = 0
  * 
- *     # Normalized variance (computed from the last item)
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for k from start <= k < stop:
+ *             y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)
  */
-    fffpy_multi_iterator_update(__pyx_v_multi);
+      Py_BLOCK_THREADS
+    }
   }
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":130
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":126
+ *             (<double*>_voxel_ptr(sdata, dims, sstrides, ndim, axis, k))[0] = kfilt.s2
  * 
- *     # Normalized variance (computed from the last item)
- *     VB = fff_matrix_const_toPyArray(kfilt.Vb);             # <<<<<<<<<<<<<<
+ *     VB = fff_matrix_const_toPyArray(kfilt.Vb)             # <<<<<<<<<<<<<<
  *     dof = kfilt.dof
- * 
+ *     fff_matrix_delete(x)
  */
-  __pyx_t_7 = ((PyObject *)fff_matrix_const_toPyArray(__pyx_v_kfilt->Vb)); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_4 = ((PyObject *)fff_matrix_const_toPyArray(__pyx_v_kfilt->Vb)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_v_VB);
-  __pyx_v_VB = __pyx_t_7;
-  __pyx_t_7 = 0;
+  __pyx_v_VB = __pyx_t_4;
+  __pyx_t_4 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":131
- *     # Normalized variance (computed from the last item)
- *     VB = fff_matrix_const_toPyArray(kfilt.Vb);
- *     dof = kfilt.dof             # <<<<<<<<<<<<<<
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":127
  * 
- *     # Free memory
+ *     VB = fff_matrix_const_toPyArray(kfilt.Vb)
+ *     dof = kfilt.dof             # <<<<<<<<<<<<<<
+ *     fff_matrix_delete(x)
+ *     fff_glm_KF_delete(kfilt)
  */
   __pyx_v_dof = __pyx_v_kfilt->dof;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":134
- * 
- *     # Free memory
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":128
+ *     VB = fff_matrix_const_toPyArray(kfilt.Vb)
+ *     dof = kfilt.dof
  *     fff_matrix_delete(x)             # <<<<<<<<<<<<<<
  *     fff_glm_KF_delete(kfilt)
- *     fffpy_multi_iterator_delete(multi)
+ *     return VB, dof
  */
   fff_matrix_delete(__pyx_v_x);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":135
- *     # Free memory
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":129
+ *     dof = kfilt.dof
  *     fff_matrix_delete(x)
  *     fff_glm_KF_delete(kfilt)             # <<<<<<<<<<<<<<
- *     fffpy_multi_iterator_delete(multi)
+ *     return VB, dof
  * 
  */
   fff_glm_KF_delete(__pyx_v_kfilt);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":136
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":130
  *     fff_matrix_delete(x)
  *     fff_glm_KF_delete(kfilt)
- *     fffpy_multi_iterator_delete(multi)             # <<<<<<<<<<<<<<
- * 
- *     # Return
- */
-  fffpy_multi_iterator_delete(__pyx_v_multi);
-
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":139
- * 
- *     # Return
- *     return B, VB, S2, dof             # <<<<<<<<<<<<<<
+ *     return VB, dof             # <<<<<<<<<<<<<<
  * 
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_dof); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_1 = PyTuple_New(4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_B);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_B);
-  __Pyx_GIVEREF(__pyx_v_B);
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_dof); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
   __Pyx_INCREF(__pyx_v_VB);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_VB);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_VB);
   __Pyx_GIVEREF(__pyx_v_VB);
-  __Pyx_INCREF(__pyx_v_S2);
-  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_S2);
-  __Pyx_GIVEREF(__pyx_v_S2);
-  PyTuple_SET_ITEM(__pyx_t_1, 3, __pyx_t_7);
-  __Pyx_GIVEREF(__pyx_t_7);
-  __pyx_t_7 = 0;
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
   goto __pyx_L0;
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("nipy.neurospin.glm.kalman.ols");
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman._ols_range");
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_dims);
-  __Pyx_DECREF(__pyx_v_B);
-  __Pyx_DECREF(__pyx_v_S2);
   __Pyx_DECREF(__pyx_v_VB);
-  __Pyx_DECREF(__pyx_v_i);
   __Pyx_DECREF((PyObject *)__pyx_v_Y);
   __Pyx_DECREF((PyObject *)__pyx_v_X);
+  __Pyx_DECREF((PyObject *)__pyx_v_B);
+  __Pyx_DECREF((PyObject *)__pyx_v_S2);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":142
+/* "/root/package/nipy/neurospin/glm/kalman.pyx":142
  * 
  * 
- * def ar1(ndarray Y, ndarray X, int niter=2, int axis=0):             # <<<<<<<<<<<<<<
- *     """
- *     (beta, norm_var_beta, s2, dof, a) = ar1(Y, X, niter=2, axis=0)
+ * cdef inline void _store(char* ptr, double v, int single) nogil:             # <<<<<<<<<<<<<<
+ *     if single:
+ *         (<float*>ptr)[0] = <float>v
  */
 
-static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman_ar1(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_4nipy_9neurospin_3glm_6kalman_ar1[] = "\n    (beta, norm_var_beta, s2, dof, a) = ar1(Y, X, niter=2, axis=0)\n\n    Refined Kalman filter -- enhanced Kalman filter to account for\n    noise autocorrelation using an AR(1) model. Pseudo-likelihood\n    multiple regression using the refined Kalman filter, a Kalman\n    variant based on a AR(1) error model.  Fit the N-dimensional array\n    Y along the given axis in terms of the regressors in matrix X. The\n    regressors must be stored columnwise.\n\n    OUTPUT: a five-element tuple\n    beta -- array of parameter estimates\n    norm_var_beta -- array of normalized variance matrices (which are data dependent\n    unlike in standard OLS regression)\n    s2 -- array of squared scale parameters to multiply norm_var_beta for the variance matrix of beta.\n    dof -- scalar degrees of freedom\n    a -- array of error autocorrelation estimates\n\n    REFERENCE:\n    Roche et al, MICCAI 2004.\n    ";
-static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman_ar1(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static CYTHON_INLINE void __pyx_f_4nipy_9neurospin_3glm_6kalman__store(char *__pyx_v_ptr, double __pyx_v_v, int __pyx_v_single) {
+  int __pyx_t_1;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":143
+ * 
+ * cdef inline void _store(char* ptr, double v, int single) nogil:
+ *     if single:             # <<<<<<<<<<<<<<
+ *         (<float*>ptr)[0] = <float>v
+ *     else:
+ */
+  __pyx_t_1 = __pyx_v_single;
+  if (__pyx_t_1) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":144
+ * cdef inline void _store(char* ptr, double v, int single) nogil:
+ *     if single:
+ *         (<float*>ptr)[0] = <float>v             # <<<<<<<<<<<<<<
+ *     else:
+ *         (<double*>ptr)[0] = v
+ */
+    (((float *)__pyx_v_ptr)[0]) = ((float)__pyx_v_v);
+    goto __pyx_L3;
+  }
+  /*else*/ {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":146
+ *         (<float*>ptr)[0] = <float>v
+ *     else:
+ *         (<double*>ptr)[0] = v             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    (((double *)__pyx_v_ptr)[0]) = __pyx_v_v;
+  }
+  __pyx_L3:;
+
+}
+
+/* "/root/package/nipy/neurospin/glm/kalman.pyx":149
+ * 
+ * 
+ * def _ar1_range(ndarray Y, ndarray X, ndarray B, ndarray VB, ndarray S2,             # <<<<<<<<<<<<<<
+ *                ndarray A, ndarray CV, ndarray W, int niter, int axis,
+ *                int vb_storage, size_t start, size_t stop):
+ */
+
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman__ar1_range(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_3glm_6kalman__ar1_range[] = "\n    dof = _ar1_range(Y, X, B, VB, S2, A, CV, W, niter, axis, vb_storage,\n                     start, stop)\n\n    Fit voxels from `start` up to `stop` with the refined Kalman filter,\n    writing into `B`, `VB`, `S2` and `A`.  `Y` must be an aligned\n    double array.  `VB` is a double or float32 array, with the flat\n    variance matrices, packed upper triangles, or None, depending on\n    `vb_storage`.  If `CV` is not None, it gets the dot products of the\n    rows of `W` with the flat variance matrix.\n    ";
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman__ar1_range(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_Y = 0;
   PyArrayObject *__pyx_v_X = 0;
+  PyArrayObject *__pyx_v_B = 0;
+  PyArrayObject *__pyx_v_VB = 0;
+  PyArrayObject *__pyx_v_S2 = 0;
+  PyArrayObject *__pyx_v_A = 0;
+  PyArrayObject *__pyx_v_CV = 0;
+  PyArrayObject *__pyx_v_W = 0;
   int __pyx_v_niter;
   int __pyx_v_axis;
-  fff_vector *__pyx_v_y;
-  fff_vector *__pyx_v_b;
-  fff_vector *__pyx_v_vb;
-  fff_vector *__pyx_v_s2;
-  fff_vector *__pyx_v_a;
-  fff_vector __pyx_v_Vb_flat;
+  int __pyx_v_vb_storage;
+  size_t __pyx_v_start;
+  size_t __pyx_v_stop;
+  fff_vector __pyx_v_y;
   fff_matrix *__pyx_v_x;
   fff_glm_RKF *__pyx_v_rkfilt;
+  size_t __pyx_v_k;
+  size_t __pyx_v_i;
+  size_t __pyx_v_j;
+  size_t __pyx_v_e;
   size_t __pyx_v_p;
   size_t __pyx_v_p2;
-  fffpy_multi_iterator *__pyx_v_multi;
+  size_t __pyx_v_n_cv;
+  char *__pyx_v_bk;
+  char *__pyx_v_vbk;
+  char *__pyx_v_cvk;
+  char *__pyx_v_ydata;
+  char *__pyx_v_bdata;
+  char *__pyx_v_sdata;
+  char *__pyx_v_adata;
+  char *__pyx_v_vbdata;
+  char *__pyx_v_cvdata;
+  npy_intp *__pyx_v_dims;
+  npy_intp *__pyx_v_ystrides;
+  npy_intp *__pyx_v_bstrides;
+  npy_intp *__pyx_v_sstrides;
+  npy_intp *__pyx_v_astrides;
+  npy_intp *__pyx_v_vbstrides;
+  npy_intp *__pyx_v_cvstrides;
+  npy_intp __pyx_v_bstride;
+  npy_intp __pyx_v_vbstride;
+  npy_intp __pyx_v_cvstride;
+  int __pyx_v_ndim;
+  int __pyx_v_vb_single;
+  unsigned int __pyx_v_nloop;
+  double *__pyx_v_w;
+  double __pyx_v_v;
   double __pyx_v_dof;
-  PyObject *__pyx_v_dims;
-  PyObject *__pyx_v_B;
-  PyObject *__pyx_v_VB;
-  PyObject *__pyx_v_S2;
-  PyObject *__pyx_v_A;
-  PyObject *__pyx_v_i;
   PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  Py_ssize_t __pyx_t_5;
-  int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  int __pyx_t_9;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Y,&__pyx_n_s__X,&__pyx_n_s__niter,&__pyx_n_s__axis,0};
-  __Pyx_RefNannySetupContext("ar1");
+  int __pyx_t_5;
+  npy_intp __pyx_t_6;
+  size_t __pyx_t_7;
+  size_t __pyx_t_8;
+  size_t __pyx_t_9;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Y,&__pyx_n_s__X,&__pyx_n_s__B,&__pyx_n_s__VB,&__pyx_n_s__S2,&__pyx_n_s__A,&__pyx_n_s__CV,&__pyx_n_s__W,&__pyx_n_s__niter,&__pyx_n_s__axis,&__pyx_n_s__vb_storage,&__pyx_n_s__start,&__pyx_n_s__stop,0};
+  __Pyx_RefNannySetupContext("_ar1_range");
   __pyx_self = __pyx_self;
   if (unlikely(__pyx_kwds)) {
     Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[4] = {0,0,0,0};
+    PyObject* values[13] = {0,0,0,0,0,0,0,0,0,0,0,0,0};
     switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case 13: values[12] = PyTuple_GET_ITEM(__pyx_args, 12);
+      case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+      case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+      case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+      case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
       case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
       case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
@@ -1292,614 +1662,4980 @@ static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman_ar1(PyObject *__pyx_self
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__X);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("ar1", 0, 2, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_ar1_range", 1, 13, 13, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
-      if (kw_args > 0) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__niter);
-        if (unlikely(value)) { values[2] = value; kw_args--; }
+      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__B);
+      if (likely(values[2])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ar1_range", 1, 13, 13, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  3:
-      if (kw_args > 0) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__axis);
-        if (unlikely(value)) { values[3] = value; kw_args--; }
+      values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__VB);
+      if (likely(values[3])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ar1_range", 1, 13, 13, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  4:
+      values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__S2);
+      if (likely(values[4])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ar1_range", 1, 13, 13, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  5:
+      values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__A);
+      if (likely(values[5])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ar1_range", 1, 13, 13, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  6:
+      values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__CV);
+      if (likely(values[6])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ar1_range", 1, 13, 13, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  7:
+      values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__W);
+      if (likely(values[7])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ar1_range", 1, 13, 13, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  8:
+      values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__niter);
+      if (likely(values[8])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ar1_range", 1, 13, 13, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  9:
+      values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__axis);
+      if (likely(values[9])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ar1_range", 1, 13, 13, 9); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case 10:
+      values[10] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__vb_storage);
+      if (likely(values[10])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ar1_range", 1, 13, 13, 10); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case 11:
+      values[11] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__start);
+      if (likely(values[11])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ar1_range", 1, 13, 13, 11); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case 12:
+      values[12] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__stop);
+      if (likely(values[12])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_ar1_range", 1, 13, 13, 12); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "ar1") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_ar1_range") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_Y = ((PyArrayObject *)values[0]);
     __pyx_v_X = ((PyArrayObject *)values[1]);
-    if (values[2]) {
-      __pyx_v_niter = __Pyx_PyInt_AsInt(values[2]); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_niter = ((int)2);
-    }
-    if (values[3]) {
-      __pyx_v_axis = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_axis = ((int)0);
-    }
+    __pyx_v_B = ((PyArrayObject *)values[2]);
+    __pyx_v_VB = ((PyArrayObject *)values[3]);
+    __pyx_v_S2 = ((PyArrayObject *)values[4]);
+    __pyx_v_A = ((PyArrayObject *)values[5]);
+    __pyx_v_CV = ((PyArrayObject *)values[6]);
+    __pyx_v_W = ((PyArrayObject *)values[7]);
+    __pyx_v_niter = __Pyx_PyInt_AsInt(values[8]); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_axis = __Pyx_PyInt_AsInt(values[9]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_vb_storage = __Pyx_PyInt_AsInt(values[10]); if (unlikely((__pyx_v_vb_storage == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 151; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_start = __Pyx_PyInt_AsSize_t(values[11]); if (unlikely((__pyx_v_start == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 151; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stop = __Pyx_PyInt_AsSize_t(values[12]); if (unlikely((__pyx_v_stop == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 151; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 13) {
+    goto __pyx_L5_argtuple_error;
   } else {
-    __pyx_v_niter = ((int)2);
-    __pyx_v_axis = ((int)0);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  4:
-      __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  3:
-      __pyx_v_niter = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  2:
-      __pyx_v_X = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
-      __pyx_v_Y = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-      break;
-      default: goto __pyx_L5_argtuple_error;
-    }
+    __pyx_v_Y = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
+    __pyx_v_X = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
+    __pyx_v_B = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 2));
+    __pyx_v_VB = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 3));
+    __pyx_v_S2 = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 4));
+    __pyx_v_A = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 5));
+    __pyx_v_CV = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 6));
+    __pyx_v_W = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 7));
+    __pyx_v_niter = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 8)); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 9)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_vb_storage = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 10)); if (unlikely((__pyx_v_vb_storage == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 151; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_start = __Pyx_PyInt_AsSize_t(PyTuple_GET_ITEM(__pyx_args, 11)); if (unlikely((__pyx_v_start == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 151; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stop = __Pyx_PyInt_AsSize_t(PyTuple_GET_ITEM(__pyx_args, 12)); if (unlikely((__pyx_v_stop == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 151; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("ar1", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("_ar1_range", 1, 13, 13, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nipy.neurospin.glm.kalman.ar1");
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman._ar1_range");
   return NULL;
   __pyx_L4_argument_unpacking_done:;
   __Pyx_INCREF((PyObject *)__pyx_v_Y);
   __Pyx_INCREF((PyObject *)__pyx_v_X);
-  __pyx_v_dims = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_B = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_VB = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_S2 = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_A = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_X), __pyx_ptype_5numpy_ndarray, 1, "X", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_INCREF((PyObject *)__pyx_v_B);
+  __Pyx_INCREF((PyObject *)__pyx_v_VB);
+  __Pyx_INCREF((PyObject *)__pyx_v_S2);
+  __Pyx_INCREF((PyObject *)__pyx_v_A);
+  __Pyx_INCREF((PyObject *)__pyx_v_CV);
+  __Pyx_INCREF((PyObject *)__pyx_v_W);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_X), __pyx_ptype_5numpy_ndarray, 1, "X", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_B), __pyx_ptype_5numpy_ndarray, 1, "B", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_VB), __pyx_ptype_5numpy_ndarray, 1, "VB", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_S2), __pyx_ptype_5numpy_ndarray, 1, "S2", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_A), __pyx_ptype_5numpy_ndarray, 1, "A", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_CV), __pyx_ptype_5numpy_ndarray, 1, "CV", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_W), __pyx_ptype_5numpy_ndarray, 1, "W", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":166
+ *     cdef fff_matrix *x
+ *     cdef fff_glm_RKF *rkfilt
+ *     cdef size_t k, i, j, e, p, p2, n_cv = 0             # <<<<<<<<<<<<<<
+ *     cdef char *bk, *vbk, *cvk
+ *     cdef char *ydata = Y.data, *bdata = B.data
+ */
+  __pyx_v_n_cv = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":168
+ *     cdef size_t k, i, j, e, p, p2, n_cv = 0
+ *     cdef char *bk, *vbk, *cvk
+ *     cdef char *ydata = Y.data, *bdata = B.data             # <<<<<<<<<<<<<<
+ *     cdef char *sdata = S2.data, *adata = A.data
+ *     cdef char *vbdata = NULL, *cvdata = NULL
+ */
+  __pyx_v_ydata = __pyx_v_Y->data;
+  __pyx_v_bdata = __pyx_v_B->data;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":169
+ *     cdef char *bk, *vbk, *cvk
+ *     cdef char *ydata = Y.data, *bdata = B.data
+ *     cdef char *sdata = S2.data, *adata = A.data             # <<<<<<<<<<<<<<
+ *     cdef char *vbdata = NULL, *cvdata = NULL
+ *     cdef npy_intp *dims = Y.shape
+ */
+  __pyx_v_sdata = __pyx_v_S2->data;
+  __pyx_v_adata = __pyx_v_A->data;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":170
+ *     cdef char *ydata = Y.data, *bdata = B.data
+ *     cdef char *sdata = S2.data, *adata = A.data
+ *     cdef char *vbdata = NULL, *cvdata = NULL             # <<<<<<<<<<<<<<
+ *     cdef npy_intp *dims = Y.shape
+ *     cdef npy_intp *ystrides = Y.strides, *bstrides = B.strides
+ */
+  __pyx_v_vbdata = NULL;
+  __pyx_v_cvdata = NULL;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":171
+ *     cdef char *sdata = S2.data, *adata = A.data
+ *     cdef char *vbdata = NULL, *cvdata = NULL
+ *     cdef npy_intp *dims = Y.shape             # <<<<<<<<<<<<<<
+ *     cdef npy_intp *ystrides = Y.strides, *bstrides = B.strides
+ *     cdef npy_intp *sstrides = S2.strides, *astrides = A.strides
+ */
+  __pyx_v_dims = __pyx_v_Y->dimensions;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":172
+ *     cdef char *vbdata = NULL, *cvdata = NULL
+ *     cdef npy_intp *dims = Y.shape
+ *     cdef npy_intp *ystrides = Y.strides, *bstrides = B.strides             # <<<<<<<<<<<<<<
+ *     cdef npy_intp *sstrides = S2.strides, *astrides = A.strides
+ *     cdef npy_intp *vbstrides = NULL, *cvstrides = NULL
+ */
+  __pyx_v_ystrides = __pyx_v_Y->strides;
+  __pyx_v_bstrides = __pyx_v_B->strides;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":173
+ *     cdef npy_intp *dims = Y.shape
+ *     cdef npy_intp *ystrides = Y.strides, *bstrides = B.strides
+ *     cdef npy_intp *sstrides = S2.strides, *astrides = A.strides             # <<<<<<<<<<<<<<
+ *     cdef npy_intp *vbstrides = NULL, *cvstrides = NULL
+ *     cdef npy_intp bstride = B.strides[axis], vbstride = 0, cvstride = 0
+ */
+  __pyx_v_sstrides = __pyx_v_S2->strides;
+  __pyx_v_astrides = __pyx_v_A->strides;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":174
+ *     cdef npy_intp *ystrides = Y.strides, *bstrides = B.strides
+ *     cdef npy_intp *sstrides = S2.strides, *astrides = A.strides
+ *     cdef npy_intp *vbstrides = NULL, *cvstrides = NULL             # <<<<<<<<<<<<<<
+ *     cdef npy_intp bstride = B.strides[axis], vbstride = 0, cvstride = 0
+ *     cdef int ndim = Y.ndim, vb_single = 0
+ */
+  __pyx_v_vbstrides = NULL;
+  __pyx_v_cvstrides = NULL;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":175
+ *     cdef npy_intp *sstrides = S2.strides, *astrides = A.strides
+ *     cdef npy_intp *vbstrides = NULL, *cvstrides = NULL
+ *     cdef npy_intp bstride = B.strides[axis], vbstride = 0, cvstride = 0             # <<<<<<<<<<<<<<
+ *     cdef int ndim = Y.ndim, vb_single = 0
+ *     cdef unsigned int nloop = niter
+ */
+  __pyx_v_bstride = (__pyx_v_B->strides[__pyx_v_axis]);
+  __pyx_v_vbstride = 0;
+  __pyx_v_cvstride = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":176
+ *     cdef npy_intp *vbstrides = NULL, *cvstrides = NULL
+ *     cdef npy_intp bstride = B.strides[axis], vbstride = 0, cvstride = 0
+ *     cdef int ndim = Y.ndim, vb_single = 0             # <<<<<<<<<<<<<<
+ *     cdef unsigned int nloop = niter
+ *     cdef double *w = NULL
+ */
+  __pyx_v_ndim = __pyx_v_Y->nd;
+  __pyx_v_vb_single = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":177
+ *     cdef npy_intp bstride = B.strides[axis], vbstride = 0, cvstride = 0
+ *     cdef int ndim = Y.ndim, vb_single = 0
+ *     cdef unsigned int nloop = niter             # <<<<<<<<<<<<<<
+ *     cdef double *w = NULL
+ *     cdef double v, dof
+ */
+  __pyx_v_nloop = __pyx_v_niter;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":178
+ *     cdef int ndim = Y.ndim, vb_single = 0
+ *     cdef unsigned int nloop = niter
+ *     cdef double *w = NULL             # <<<<<<<<<<<<<<
+ *     cdef double v, dof
+ * 
+ */
+  __pyx_v_w = NULL;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":181
+ *     cdef double v, dof
+ * 
+ *     if vb_storage != VB_NONE:             # <<<<<<<<<<<<<<
+ *         vbdata = VB.data
+ *         vbstrides = VB.strides
+ */
+  __pyx_t_1 = (__pyx_v_vb_storage != __pyx_e_4nipy_9neurospin_3glm_6kalman_VB_NONE);
+  if (__pyx_t_1) {
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":173
- * 
- *     # View on design matrix
- *     x = fff_matrix_fromPyArray(X)             # <<<<<<<<<<<<<<
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":182
  * 
- *     # Number of regressors
+ *     if vb_storage != VB_NONE:
+ *         vbdata = VB.data             # <<<<<<<<<<<<<<
+ *         vbstrides = VB.strides
+ *         vbstride = VB.strides[axis]
  */
-  __pyx_v_x = fff_matrix_fromPyArray(__pyx_v_X);
+    __pyx_v_vbdata = __pyx_v_VB->data;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":176
- * 
- *     # Number of regressors
- *     p = x.size2             # <<<<<<<<<<<<<<
- *     p2 = p*p
- * 
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":183
+ *     if vb_storage != VB_NONE:
+ *         vbdata = VB.data
+ *         vbstrides = VB.strides             # <<<<<<<<<<<<<<
+ *         vbstride = VB.strides[axis]
+ *         vb_single = VB.dtype == np.float32
  */
-  __pyx_v_p = __pyx_v_x->size2;
+    __pyx_v_vbstrides = __pyx_v_VB->strides;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":177
- *     # Number of regressors
- *     p = x.size2
- *     p2 = p*p             # <<<<<<<<<<<<<<
- * 
- *     # Allocate output arrays B and S2.
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":184
+ *         vbdata = VB.data
+ *         vbstrides = VB.strides
+ *         vbstride = VB.strides[axis]             # <<<<<<<<<<<<<<
+ *         vb_single = VB.dtype == np.float32
+ *     if CV is not None:
  */
-  __pyx_v_p2 = (__pyx_v_p * __pyx_v_p);
+    __pyx_v_vbstride = (__pyx_v_VB->strides[__pyx_v_axis]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":184
- *     # type; see:
- *     # http://codespeak.net/pipermail/cython-dev/2009-April/005229.html
- *     dims = [Y.shape[i] for i in range(Y.ndim)]             # <<<<<<<<<<<<<<
- *     dims[axis] = p
- *     B = np.zeros(dims, dtype=np.double)
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":185
+ *         vbstrides = VB.strides
+ *         vbstride = VB.strides[axis]
+ *         vb_single = VB.dtype == np.float32             # <<<<<<<<<<<<<<
+ *     if CV is not None:
+ *         cvdata = CV.data
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_3 = PyInt_FromLong(__pyx_v_Y->nd); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_Call(__pyx_builtin_range, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
-    __pyx_t_2 = 0; __pyx_t_4 = __pyx_t_3; __Pyx_INCREF(__pyx_t_4);
-  } else {
-    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_VB), __pyx_n_s__dtype); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__float32); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_4))) {
-      if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_4)) break;
-      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
-      if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
-      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++;
-    } else {
-      __pyx_t_3 = PyIter_Next(__pyx_t_4);
-      if (!__pyx_t_3) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_3);
-    }
-    __Pyx_DECREF(__pyx_v_i);
-    __pyx_v_i = __pyx_t_3;
-    __pyx_t_3 = 0;
-    __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_3 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_Y->dimensions[__pyx_t_5])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyObject_RichCompare(__pyx_t_2, __pyx_t_4, Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_3); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_5 = __Pyx_PyInt_AsInt(__pyx_t_3); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_v_vb_single = __pyx_t_5;
+    goto __pyx_L6;
   }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_INCREF(((PyObject *)__pyx_t_1));
-  __Pyx_DECREF(__pyx_v_dims);
-  __pyx_v_dims = ((PyObject *)__pyx_t_1);
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+  __pyx_L6:;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":185
- *     # http://codespeak.net/pipermail/cython-dev/2009-April/005229.html
- *     dims = [Y.shape[i] for i in range(Y.ndim)]
- *     dims[axis] = p             # <<<<<<<<<<<<<<
- *     B = np.zeros(dims, dtype=np.double)
- *     dims[axis] = p2
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":186
+ *         vbstride = VB.strides[axis]
+ *         vb_single = VB.dtype == np.float32
+ *     if CV is not None:             # <<<<<<<<<<<<<<
+ *         cvdata = CV.data
+ *         cvstrides = CV.strides
  */
-  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_p); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_t_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = (((PyObject *)__pyx_v_CV) != Py_None);
+  if (__pyx_t_1) {
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":186
- *     dims = [Y.shape[i] for i in range(Y.ndim)]
- *     dims[axis] = p
- *     B = np.zeros(dims, dtype=np.double)             # <<<<<<<<<<<<<<
- *     dims[axis] = p2
- *     VB = np.zeros(dims, dtype=np.double)
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":187
+ *         vb_single = VB.dtype == np.float32
+ *     if CV is not None:
+ *         cvdata = CV.data             # <<<<<<<<<<<<<<
+ *         cvstrides = CV.strides
+ *         cvstride = CV.strides[axis]
  */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_dims);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_dims);
-  __Pyx_GIVEREF(__pyx_v_dims);
-  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-  __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_8 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__double); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  if (PyDict_SetItem(__pyx_t_3, ((PyObject *)__pyx_n_s__dtype), __pyx_t_8) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = PyEval_CallObjectWithKeywords(__pyx_t_4, __pyx_t_1, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_v_B);
-  __pyx_v_B = __pyx_t_8;
-  __pyx_t_8 = 0;
+    __pyx_v_cvdata = __pyx_v_CV->data;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":187
- *     dims[axis] = p
- *     B = np.zeros(dims, dtype=np.double)
- *     dims[axis] = p2             # <<<<<<<<<<<<<<
- *     VB = np.zeros(dims, dtype=np.double)
- *     dims[axis] = 1
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":188
+ *     if CV is not None:
+ *         cvdata = CV.data
+ *         cvstrides = CV.strides             # <<<<<<<<<<<<<<
+ *         cvstride = CV.strides[axis]
+ *         n_cv = W.shape[0]
  */
-  __pyx_t_8 = __Pyx_PyInt_FromSize_t(__pyx_v_p2); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_t_8, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_v_cvstrides = __pyx_v_CV->strides;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":188
- *     B = np.zeros(dims, dtype=np.double)
- *     dims[axis] = p2
- *     VB = np.zeros(dims, dtype=np.double)             # <<<<<<<<<<<<<<
- *     dims[axis] = 1
- *     S2 = np.zeros(dims, dtype=np.double)
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":189
+ *         cvdata = CV.data
+ *         cvstrides = CV.strides
+ *         cvstride = CV.strides[axis]             # <<<<<<<<<<<<<<
+ *         n_cv = W.shape[0]
+ *         w = <double*>W.data
  */
-  __pyx_t_8 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_8, __pyx_n_s__zeros); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_INCREF(__pyx_v_dims);
-  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_dims);
-  __Pyx_GIVEREF(__pyx_v_dims);
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_7 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__double); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__dtype), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = PyEval_CallObjectWithKeywords(__pyx_t_3, __pyx_t_8, ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_v_VB);
-  __pyx_v_VB = __pyx_t_7;
-  __pyx_t_7 = 0;
+    __pyx_v_cvstride = (__pyx_v_CV->strides[__pyx_v_axis]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":189
- *     dims[axis] = p2
- *     VB = np.zeros(dims, dtype=np.double)
- *     dims[axis] = 1             # <<<<<<<<<<<<<<
- *     S2 = np.zeros(dims, dtype=np.double)
- *     A = np.zeros(dims, dtype=np.double)
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":190
+ *         cvstrides = CV.strides
+ *         cvstride = CV.strides[axis]
+ *         n_cv = W.shape[0]             # <<<<<<<<<<<<<<
+ *         w = <double*>W.data
+ * 
  */
-  if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_int_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_n_cv = (__pyx_v_W->dimensions[0]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":190
- *     VB = np.zeros(dims, dtype=np.double)
- *     dims[axis] = 1
- *     S2 = np.zeros(dims, dtype=np.double)             # <<<<<<<<<<<<<<
- *     A = np.zeros(dims, dtype=np.double)
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":191
+ *         cvstride = CV.strides[axis]
+ *         n_cv = W.shape[0]
+ *         w = <double*>W.data             # <<<<<<<<<<<<<<
  * 
+ *     x = fff_matrix_fromPyArray(X)
  */
-  __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__zeros); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_INCREF(__pyx_v_dims);
-  PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_dims);
-  __Pyx_GIVEREF(__pyx_v_dims);
-  __pyx_t_8 = PyDict_New(); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_8));
-  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__double); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_8, ((PyObject *)__pyx_n_s__dtype), __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyEval_CallObjectWithKeywords(__pyx_t_1, __pyx_t_7, ((PyObject *)__pyx_t_8)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_8)); __pyx_t_8 = 0;
-  __Pyx_DECREF(__pyx_v_S2);
-  __pyx_v_S2 = __pyx_t_4;
-  __pyx_t_4 = 0;
+    __pyx_v_w = ((double *)__pyx_v_W->data);
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":191
- *     dims[axis] = 1
- *     S2 = np.zeros(dims, dtype=np.double)
- *     A = np.zeros(dims, dtype=np.double)             # <<<<<<<<<<<<<<
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":193
+ *         w = <double*>W.data
  * 
- *     # Allocate local structure
+ *     x = fff_matrix_fromPyArray(X)             # <<<<<<<<<<<<<<
+ *     p = x.size2
+ *     p2 = p*p
  */
-  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_8 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__zeros); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_INCREF(__pyx_v_dims);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_dims);
-  __Pyx_GIVEREF(__pyx_v_dims);
-  __pyx_t_7 = PyDict_New(); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_7));
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__double); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_n_s__dtype), __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyEval_CallObjectWithKeywords(__pyx_t_8, __pyx_t_4, ((PyObject *)__pyx_t_7)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_7)); __pyx_t_7 = 0;
-  __Pyx_DECREF(__pyx_v_A);
-  __pyx_v_A = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_v_x = fff_matrix_fromPyArray(__pyx_v_X);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":194
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":194
  * 
- *     # Allocate local structure
+ *     x = fff_matrix_fromPyArray(X)
+ *     p = x.size2             # <<<<<<<<<<<<<<
+ *     p2 = p*p
+ *     rkfilt = fff_glm_RKF_new(p)
+ */
+  __pyx_v_p = __pyx_v_x->size2;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":195
+ *     x = fff_matrix_fromPyArray(X)
+ *     p = x.size2
+ *     p2 = p*p             # <<<<<<<<<<<<<<
+ *     rkfilt = fff_glm_RKF_new(p)
+ *     y.size = Y.shape[axis]
+ */
+  __pyx_v_p2 = (__pyx_v_p * __pyx_v_p);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":196
+ *     p = x.size2
+ *     p2 = p*p
  *     rkfilt = fff_glm_RKF_new(p)             # <<<<<<<<<<<<<<
- * 
- *     # Create a new array iterator
+ *     y.size = Y.shape[axis]
+ *     y.stride = Y.strides[axis] / sizeof(double)
  */
   __pyx_v_rkfilt = fff_glm_RKF_new(__pyx_v_p);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":197
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":197
+ *     p2 = p*p
+ *     rkfilt = fff_glm_RKF_new(p)
+ *     y.size = Y.shape[axis]             # <<<<<<<<<<<<<<
+ *     y.stride = Y.strides[axis] / sizeof(double)
+ *     y.owner = 0
+ */
+  __pyx_v_y.size = (__pyx_v_Y->dimensions[__pyx_v_axis]);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":198
+ *     rkfilt = fff_glm_RKF_new(p)
+ *     y.size = Y.shape[axis]
+ *     y.stride = Y.strides[axis] / sizeof(double)             # <<<<<<<<<<<<<<
+ *     y.owner = 0
  * 
- *     # Create a new array iterator
- *     multi = fffpy_multi_iterator_new(5, axis, <void*>Y, <void*>B, <void*>VB, <void*>S2, <void*>A)             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_6 = (__pyx_v_Y->strides[__pyx_v_axis]);
+  __pyx_t_7 = (sizeof(double));
+  if (unlikely(__pyx_t_7 == 0)) {
+    PyErr_Format(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_v_y.stride = (__pyx_t_6 / __pyx_t_7);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":199
+ *     y.size = Y.shape[axis]
+ *     y.stride = Y.strides[axis] / sizeof(double)
+ *     y.owner = 0             # <<<<<<<<<<<<<<
  * 
- *     # Create views
+ *     with nogil:
  */
-  __pyx_v_multi = fffpy_multi_iterator_new(5, __pyx_v_axis, ((void *)__pyx_v_Y), ((void *)__pyx_v_B), ((void *)__pyx_v_VB), ((void *)__pyx_v_S2), ((void *)__pyx_v_A));
+  __pyx_v_y.owner = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":200
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":201
+ *     y.owner = 0
  * 
- *     # Create views
- *     y = multi.vector[0]             # <<<<<<<<<<<<<<
- *     b = multi.vector[1]
- *     vb = multi.vector[2]
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for k from start <= k < stop:
+ *             y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)
  */
-  __pyx_v_y = (__pyx_v_multi->vector[0]);
+  { PyThreadState *_save;
+    Py_UNBLOCK_THREADS
+    /*try:*/ {
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":201
- *     # Create views
- *     y = multi.vector[0]
- *     b = multi.vector[1]             # <<<<<<<<<<<<<<
- *     vb = multi.vector[2]
- *     s2 = multi.vector[3]
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":202
+ * 
+ *     with nogil:
+ *         for k from start <= k < stop:             # <<<<<<<<<<<<<<
+ *             y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)
+ *             fff_glm_RKF_fit(rkfilt, nloop, &y, x)
  */
-  __pyx_v_b = (__pyx_v_multi->vector[1]);
+      __pyx_t_7 = __pyx_v_stop;
+      for (__pyx_v_k = __pyx_v_start; __pyx_v_k < __pyx_t_7; __pyx_v_k++) {
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":202
- *     y = multi.vector[0]
- *     b = multi.vector[1]
- *     vb = multi.vector[2]             # <<<<<<<<<<<<<<
- *     s2 = multi.vector[3]
- *     a = multi.vector[4]
+        /* "/root/package/nipy/neurospin/glm/kalman.pyx":203
+ *     with nogil:
+ *         for k from start <= k < stop:
+ *             y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)             # <<<<<<<<<<<<<<
+ *             fff_glm_RKF_fit(rkfilt, nloop, &y, x)
+ *             bk = _voxel_ptr(bdata, dims, bstrides, ndim, axis, k)
  */
-  __pyx_v_vb = (__pyx_v_multi->vector[2]);
+        __pyx_v_y.data = ((double *)__pyx_f_4nipy_9neurospin_3glm_6kalman__voxel_ptr(__pyx_v_ydata, __pyx_v_dims, __pyx_v_ystrides, __pyx_v_ndim, __pyx_v_axis, __pyx_v_k));
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":203
- *     b = multi.vector[1]
- *     vb = multi.vector[2]
- *     s2 = multi.vector[3]             # <<<<<<<<<<<<<<
- *     a = multi.vector[4]
- * 
+        /* "/root/package/nipy/neurospin/glm/kalman.pyx":204
+ *         for k from start <= k < stop:
+ *             y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)
+ *             fff_glm_RKF_fit(rkfilt, nloop, &y, x)             # <<<<<<<<<<<<<<
+ *             bk = _voxel_ptr(bdata, dims, bstrides, ndim, axis, k)
+ *             for j from 0 <= j < p:
  */
-  __pyx_v_s2 = (__pyx_v_multi->vector[3]);
+        fff_glm_RKF_fit(__pyx_v_rkfilt, __pyx_v_nloop, (&__pyx_v_y), __pyx_v_x);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":204
- *     vb = multi.vector[2]
- *     s2 = multi.vector[3]
- *     a = multi.vector[4]             # <<<<<<<<<<<<<<
- * 
- *     # Loop
+        /* "/root/package/nipy/neurospin/glm/kalman.pyx":205
+ *             y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)
+ *             fff_glm_RKF_fit(rkfilt, nloop, &y, x)
+ *             bk = _voxel_ptr(bdata, dims, bstrides, ndim, axis, k)             # <<<<<<<<<<<<<<
+ *             for j from 0 <= j < p:
+ *                 (<double*>(bk + j * bstride))[0] = rkfilt.b.data[j * rkfilt.b.stride]
  */
-  __pyx_v_a = (__pyx_v_multi->vector[4]);
+        __pyx_v_bk = __pyx_f_4nipy_9neurospin_3glm_6kalman__voxel_ptr(__pyx_v_bdata, __pyx_v_dims, __pyx_v_bstrides, __pyx_v_ndim, __pyx_v_axis, __pyx_v_k);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":207
- * 
- *     # Loop
- *     while(multi.index < multi.size):             # <<<<<<<<<<<<<<
- *         fff_glm_RKF_fit(rkfilt, niter, y, x)
- *         fff_vector_memcpy(b, rkfilt.b)
+        /* "/root/package/nipy/neurospin/glm/kalman.pyx":206
+ *             fff_glm_RKF_fit(rkfilt, nloop, &y, x)
+ *             bk = _voxel_ptr(bdata, dims, bstrides, ndim, axis, k)
+ *             for j from 0 <= j < p:             # <<<<<<<<<<<<<<
+ *                 (<double*>(bk + j * bstride))[0] = rkfilt.b.data[j * rkfilt.b.stride]
+ *             # rkfilt.Vb contiguous by construction
  */
-  while (1) {
-    __pyx_t_9 = (__pyx_v_multi->index < __pyx_v_multi->size);
-    if (!__pyx_t_9) break;
+        __pyx_t_8 = __pyx_v_p;
+        for (__pyx_v_j = 0; __pyx_v_j < __pyx_t_8; __pyx_v_j++) {
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":208
- *     # Loop
- *     while(multi.index < multi.size):
- *         fff_glm_RKF_fit(rkfilt, niter, y, x)             # <<<<<<<<<<<<<<
- *         fff_vector_memcpy(b, rkfilt.b)
- *         Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction
+          /* "/root/package/nipy/neurospin/glm/kalman.pyx":207
+ *             bk = _voxel_ptr(bdata, dims, bstrides, ndim, axis, k)
+ *             for j from 0 <= j < p:
+ *                 (<double*>(bk + j * bstride))[0] = rkfilt.b.data[j * rkfilt.b.stride]             # <<<<<<<<<<<<<<
+ *             # rkfilt.Vb contiguous by construction
+ *             if vb_storage == VB_FULL:
  */
-    fff_glm_RKF_fit(__pyx_v_rkfilt, __pyx_v_niter, __pyx_v_y, __pyx_v_x);
+          (((double *)(__pyx_v_bk + (__pyx_v_j * __pyx_v_bstride)))[0]) = (__pyx_v_rkfilt->b->data[(__pyx_v_j * __pyx_v_rkfilt->b->stride)]);
+        }
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":209
- *     while(multi.index < multi.size):
- *         fff_glm_RKF_fit(rkfilt, niter, y, x)
- *         fff_vector_memcpy(b, rkfilt.b)             # <<<<<<<<<<<<<<
- *         Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction
- *         fff_vector_memcpy(vb, &Vb_flat)
- */
-    fff_vector_memcpy(__pyx_v_b, __pyx_v_rkfilt->b);
-
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":210
- *         fff_glm_RKF_fit(rkfilt, niter, y, x)
- *         fff_vector_memcpy(b, rkfilt.b)
- *         Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction             # <<<<<<<<<<<<<<
- *         fff_vector_memcpy(vb, &Vb_flat)
- *         s2.data[0] = rkfilt.s2
- */
-    __pyx_v_Vb_flat = fff_vector_view(__pyx_v_rkfilt->Vb->data, __pyx_v_p2, 1);
-
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":211
- *         fff_vector_memcpy(b, rkfilt.b)
- *         Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction
- *         fff_vector_memcpy(vb, &Vb_flat)             # <<<<<<<<<<<<<<
- *         s2.data[0] = rkfilt.s2
- *         a.data[0] = rkfilt.a
- */
-    fff_vector_memcpy(__pyx_v_vb, (&__pyx_v_Vb_flat));
-
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":212
- *         Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction
- *         fff_vector_memcpy(vb, &Vb_flat)
- *         s2.data[0] = rkfilt.s2             # <<<<<<<<<<<<<<
- *         a.data[0] = rkfilt.a
- *         fffpy_multi_iterator_update(multi)
+        /* "/root/package/nipy/neurospin/glm/kalman.pyx":209
+ *                 (<double*>(bk + j * bstride))[0] = rkfilt.b.data[j * rkfilt.b.stride]
+ *             # rkfilt.Vb contiguous by construction
+ *             if vb_storage == VB_FULL:             # <<<<<<<<<<<<<<
+ *                 vbk = _voxel_ptr(vbdata, dims, vbstrides, ndim, axis, k)
+ *                 for j from 0 <= j < p2:
+ */
+        switch (__pyx_v_vb_storage) {
+          case __pyx_e_4nipy_9neurospin_3glm_6kalman_VB_FULL:
+
+          /* "/root/package/nipy/neurospin/glm/kalman.pyx":210
+ *             # rkfilt.Vb contiguous by construction
+ *             if vb_storage == VB_FULL:
+ *                 vbk = _voxel_ptr(vbdata, dims, vbstrides, ndim, axis, k)             # <<<<<<<<<<<<<<
+ *                 for j from 0 <= j < p2:
+ *                     _store(vbk + j * vbstride, rkfilt.Vb.data[j], vb_single)
+ */
+          __pyx_v_vbk = __pyx_f_4nipy_9neurospin_3glm_6kalman__voxel_ptr(__pyx_v_vbdata, __pyx_v_dims, __pyx_v_vbstrides, __pyx_v_ndim, __pyx_v_axis, __pyx_v_k);
+
+          /* "/root/package/nipy/neurospin/glm/kalman.pyx":211
+ *             if vb_storage == VB_FULL:
+ *                 vbk = _voxel_ptr(vbdata, dims, vbstrides, ndim, axis, k)
+ *                 for j from 0 <= j < p2:             # <<<<<<<<<<<<<<
+ *                     _store(vbk + j * vbstride, rkfilt.Vb.data[j], vb_single)
+ *             elif vb_storage == VB_PACKED:
+ */
+          __pyx_t_8 = __pyx_v_p2;
+          for (__pyx_v_j = 0; __pyx_v_j < __pyx_t_8; __pyx_v_j++) {
+
+            /* "/root/package/nipy/neurospin/glm/kalman.pyx":212
+ *                 vbk = _voxel_ptr(vbdata, dims, vbstrides, ndim, axis, k)
+ *                 for j from 0 <= j < p2:
+ *                     _store(vbk + j * vbstride, rkfilt.Vb.data[j], vb_single)             # <<<<<<<<<<<<<<
+ *             elif vb_storage == VB_PACKED:
+ *                 vbk = _voxel_ptr(vbdata, dims, vbstrides, ndim, axis, k)
+ */
+            __pyx_f_4nipy_9neurospin_3glm_6kalman__store((__pyx_v_vbk + (__pyx_v_j * __pyx_v_vbstride)), (__pyx_v_rkfilt->Vb->data[__pyx_v_j]), __pyx_v_vb_single);
+          }
+          break;
+
+          /* "/root/package/nipy/neurospin/glm/kalman.pyx":213
+ *                 for j from 0 <= j < p2:
+ *                     _store(vbk + j * vbstride, rkfilt.Vb.data[j], vb_single)
+ *             elif vb_storage == VB_PACKED:             # <<<<<<<<<<<<<<
+ *                 vbk = _voxel_ptr(vbdata, dims, vbstrides, ndim, axis, k)
+ *                 e = 0
+ */
+          case __pyx_e_4nipy_9neurospin_3glm_6kalman_VB_PACKED:
+
+          /* "/root/package/nipy/neurospin/glm/kalman.pyx":214
+ *                     _store(vbk + j * vbstride, rkfilt.Vb.data[j], vb_single)
+ *             elif vb_storage == VB_PACKED:
+ *                 vbk = _voxel_ptr(vbdata, dims, vbstrides, ndim, axis, k)             # <<<<<<<<<<<<<<
+ *                 e = 0
+ *                 for i from 0 <= i < p:
+ */
+          __pyx_v_vbk = __pyx_f_4nipy_9neurospin_3glm_6kalman__voxel_ptr(__pyx_v_vbdata, __pyx_v_dims, __pyx_v_vbstrides, __pyx_v_ndim, __pyx_v_axis, __pyx_v_k);
+
+          /* "/root/package/nipy/neurospin/glm/kalman.pyx":215
+ *             elif vb_storage == VB_PACKED:
+ *                 vbk = _voxel_ptr(vbdata, dims, vbstrides, ndim, axis, k)
+ *                 e = 0             # <<<<<<<<<<<<<<
+ *                 for i from 0 <= i < p:
+ *                     for j from i <= j < p:
+ */
+          __pyx_v_e = 0;
+
+          /* "/root/package/nipy/neurospin/glm/kalman.pyx":216
+ *                 vbk = _voxel_ptr(vbdata, dims, vbstrides, ndim, axis, k)
+ *                 e = 0
+ *                 for i from 0 <= i < p:             # <<<<<<<<<<<<<<
+ *                     for j from i <= j < p:
+ *                         _store(vbk + e * vbstride, rkfilt.Vb.data[i*p + j],
+ */
+          __pyx_t_8 = __pyx_v_p;
+          for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_8; __pyx_v_i++) {
+
+            /* "/root/package/nipy/neurospin/glm/kalman.pyx":217
+ *                 e = 0
+ *                 for i from 0 <= i < p:
+ *                     for j from i <= j < p:             # <<<<<<<<<<<<<<
+ *                         _store(vbk + e * vbstride, rkfilt.Vb.data[i*p + j],
+ *                                vb_single)
+ */
+            __pyx_t_9 = __pyx_v_p;
+            for (__pyx_v_j = __pyx_v_i; __pyx_v_j < __pyx_t_9; __pyx_v_j++) {
+
+              /* "/root/package/nipy/neurospin/glm/kalman.pyx":219
+ *                     for j from i <= j < p:
+ *                         _store(vbk + e * vbstride, rkfilt.Vb.data[i*p + j],
+ *                                vb_single)             # <<<<<<<<<<<<<<
+ *                         e = e + 1
+ *             if n_cv > 0:
+ */
+              __pyx_f_4nipy_9neurospin_3glm_6kalman__store((__pyx_v_vbk + (__pyx_v_e * __pyx_v_vbstride)), (__pyx_v_rkfilt->Vb->data[((__pyx_v_i * __pyx_v_p) + __pyx_v_j)]), __pyx_v_vb_single);
+
+              /* "/root/package/nipy/neurospin/glm/kalman.pyx":220
+ *                         _store(vbk + e * vbstride, rkfilt.Vb.data[i*p + j],
+ *                                vb_single)
+ *                         e = e + 1             # <<<<<<<<<<<<<<
+ *             if n_cv > 0:
+ *                 cvk = _voxel_ptr(cvdata, dims, cvstrides, ndim, axis, k)
+ */
+              __pyx_v_e = (__pyx_v_e + 1);
+            }
+          }
+          break;
+        }
+
+        /* "/root/package/nipy/neurospin/glm/kalman.pyx":221
+ *                                vb_single)
+ *                         e = e + 1
+ *             if n_cv > 0:             # <<<<<<<<<<<<<<
+ *                 cvk = _voxel_ptr(cvdata, dims, cvstrides, ndim, axis, k)
+ *                 for e from 0 <= e < n_cv:
+ */
+        __pyx_t_1 = (__pyx_v_n_cv > 0);
+        if (__pyx_t_1) {
+
+          /* "/root/package/nipy/neurospin/glm/kalman.pyx":222
+ *                         e = e + 1
+ *             if n_cv > 0:
+ *                 cvk = _voxel_ptr(cvdata, dims, cvstrides, ndim, axis, k)             # <<<<<<<<<<<<<<
+ *                 for e from 0 <= e < n_cv:
+ *                     v = 0
+ */
+          __pyx_v_cvk = __pyx_f_4nipy_9neurospin_3glm_6kalman__voxel_ptr(__pyx_v_cvdata, __pyx_v_dims, __pyx_v_cvstrides, __pyx_v_ndim, __pyx_v_axis, __pyx_v_k);
+
+          /* "/root/package/nipy/neurospin/glm/kalman.pyx":223
+ *             if n_cv > 0:
+ *                 cvk = _voxel_ptr(cvdata, dims, cvstrides, ndim, axis, k)
+ *                 for e from 0 <= e < n_cv:             # <<<<<<<<<<<<<<
+ *                     v = 0
+ *                     for j from 0 <= j < p2:
+ */
+          __pyx_t_8 = __pyx_v_n_cv;
+          for (__pyx_v_e = 0; __pyx_v_e < __pyx_t_8; __pyx_v_e++) {
+
+            /* "/root/package/nipy/neurospin/glm/kalman.pyx":224
+ *                 cvk = _voxel_ptr(cvdata, dims, cvstrides, ndim, axis, k)
+ *                 for e from 0 <= e < n_cv:
+ *                     v = 0             # <<<<<<<<<<<<<<
+ *                     for j from 0 <= j < p2:
+ *                         v = v + w[e*p2 + j] * rkfilt.Vb.data[j]
+ */
+            __pyx_v_v = 0;
+
+            /* "/root/package/nipy/neurospin/glm/kalman.pyx":225
+ *                 for e from 0 <= e < n_cv:
+ *                     v = 0
+ *                     for j from 0 <= j < p2:             # <<<<<<<<<<<<<<
+ *                         v = v + w[e*p2 + j] * rkfilt.Vb.data[j]
+ *                     (<double*>(cvk + e * cvstride))[0] = v
+ */
+            __pyx_t_9 = __pyx_v_p2;
+            for (__pyx_v_j = 0; __pyx_v_j < __pyx_t_9; __pyx_v_j++) {
+
+              /* "/root/package/nipy/neurospin/glm/kalman.pyx":226
+ *                     v = 0
+ *                     for j from 0 <= j < p2:
+ *                         v = v + w[e*p2 + j] * rkfilt.Vb.data[j]             # <<<<<<<<<<<<<<
+ *                     (<double*>(cvk + e * cvstride))[0] = v
+ *             (<double*>_voxel_ptr(sdata, dims, sstrides, ndim, axis, k))[0] = rkfilt.s2
+ */
+              __pyx_v_v = (__pyx_v_v + ((__pyx_v_w[((__pyx_v_e * __pyx_v_p2) + __pyx_v_j)]) * (__pyx_v_rkfilt->Vb->data[__pyx_v_j])));
+            }
+
+            /* "/root/package/nipy/neurospin/glm/kalman.pyx":227
+ *                     for j from 0 <= j < p2:
+ *                         v = v + w[e*p2 + j] * rkfilt.Vb.data[j]
+ *                     (<double*>(cvk + e * cvstride))[0] = v             # <<<<<<<<<<<<<<
+ *             (<double*>_voxel_ptr(sdata, dims, sstrides, ndim, axis, k))[0] = rkfilt.s2
+ *             (<double*>_voxel_ptr(adata, dims, astrides, ndim, axis, k))[0] = rkfilt.a
  */
-    (__pyx_v_s2->data[0]) = __pyx_v_rkfilt->s2;
+            (((double *)(__pyx_v_cvk + (__pyx_v_e * __pyx_v_cvstride)))[0]) = __pyx_v_v;
+          }
+          goto __pyx_L21;
+        }
+        __pyx_L21:;
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":213
- *         fff_vector_memcpy(vb, &Vb_flat)
- *         s2.data[0] = rkfilt.s2
- *         a.data[0] = rkfilt.a             # <<<<<<<<<<<<<<
- *         fffpy_multi_iterator_update(multi)
+        /* "/root/package/nipy/neurospin/glm/kalman.pyx":228
+ *                         v = v + w[e*p2 + j] * rkfilt.Vb.data[j]
+ *                     (<double*>(cvk + e * cvstride))[0] = v
+ *             (<double*>_voxel_ptr(sdata, dims, sstrides, ndim, axis, k))[0] = rkfilt.s2             # <<<<<<<<<<<<<<
+ *             (<double*>_voxel_ptr(adata, dims, astrides, ndim, axis, k))[0] = rkfilt.a
  * 
  */
-    (__pyx_v_a->data[0]) = __pyx_v_rkfilt->a;
+        (((double *)__pyx_f_4nipy_9neurospin_3glm_6kalman__voxel_ptr(__pyx_v_sdata, __pyx_v_dims, __pyx_v_sstrides, __pyx_v_ndim, __pyx_v_axis, __pyx_v_k))[0]) = __pyx_v_rkfilt->s2;
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":214
- *         s2.data[0] = rkfilt.s2
- *         a.data[0] = rkfilt.a
- *         fffpy_multi_iterator_update(multi)             # <<<<<<<<<<<<<<
+        /* "/root/package/nipy/neurospin/glm/kalman.pyx":229
+ *                     (<double*>(cvk + e * cvstride))[0] = v
+ *             (<double*>_voxel_ptr(sdata, dims, sstrides, ndim, axis, k))[0] = rkfilt.s2
+ *             (<double*>_voxel_ptr(adata, dims, astrides, ndim, axis, k))[0] = rkfilt.a             # <<<<<<<<<<<<<<
  * 
- *     # Dof
+ *     dof = rkfilt.dof
  */
-    fffpy_multi_iterator_update(__pyx_v_multi);
+        (((double *)__pyx_f_4nipy_9neurospin_3glm_6kalman__voxel_ptr(__pyx_v_adata, __pyx_v_dims, __pyx_v_astrides, __pyx_v_ndim, __pyx_v_axis, __pyx_v_k))[0]) = __pyx_v_rkfilt->a;
+      }
+    }
+    /*finally:*/ {
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":201
+ *     y.owner = 0
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for k from start <= k < stop:
+ *             y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)
+ */
+      Py_BLOCK_THREADS
+    }
   }
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":217
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":231
+ *             (<double*>_voxel_ptr(adata, dims, astrides, ndim, axis, k))[0] = rkfilt.a
  * 
- *     # Dof
  *     dof = rkfilt.dof             # <<<<<<<<<<<<<<
- * 
- *     # Free memory
+ *     fff_matrix_delete(x)
+ *     fff_glm_RKF_delete(rkfilt)
  */
   __pyx_v_dof = __pyx_v_rkfilt->dof;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":220
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":232
  * 
- *     # Free memory
+ *     dof = rkfilt.dof
  *     fff_matrix_delete(x)             # <<<<<<<<<<<<<<
  *     fff_glm_RKF_delete(rkfilt)
- *     fffpy_multi_iterator_delete(multi)
+ *     return dof
  */
   fff_matrix_delete(__pyx_v_x);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":221
- *     # Free memory
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":233
+ *     dof = rkfilt.dof
  *     fff_matrix_delete(x)
  *     fff_glm_RKF_delete(rkfilt)             # <<<<<<<<<<<<<<
- *     fffpy_multi_iterator_delete(multi)
+ *     return dof
  * 
  */
   fff_glm_RKF_delete(__pyx_v_rkfilt);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":222
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":234
  *     fff_matrix_delete(x)
  *     fff_glm_RKF_delete(rkfilt)
- *     fffpy_multi_iterator_delete(multi)             # <<<<<<<<<<<<<<
- * 
- *     # Reshape variance array
- */
-  fffpy_multi_iterator_delete(__pyx_v_multi);
-
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":225
+ *     return dof             # <<<<<<<<<<<<<<
  * 
- *     # Reshape variance array
- *     dims[axis] = p             # <<<<<<<<<<<<<<
- *     dims.insert(axis+1, p)
- *     VB = VB.reshape(dims)
- */
-  __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_p); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_t_3, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":226
- *     # Reshape variance array
- *     dims[axis] = p
- *     dims.insert(axis+1, p)             # <<<<<<<<<<<<<<
- *     VB = VB.reshape(dims)
  * 
  */
-  __pyx_t_3 = PyObject_GetAttr(__pyx_v_dims, __pyx_n_s__insert); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_dof); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_7 = PyInt_FromLong((__pyx_v_axis + 1)); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_4 = __Pyx_PyInt_FromSize_t(__pyx_v_p); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7);
-  __Pyx_GIVEREF(__pyx_t_7);
-  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_4);
-  __pyx_t_7 = 0;
-  __pyx_t_4 = 0;
-  __pyx_t_4 = PyObject_Call(__pyx_t_3, __pyx_t_8, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":227
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman._ar1_range");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_Y);
+  __Pyx_DECREF((PyObject *)__pyx_v_X);
+  __Pyx_DECREF((PyObject *)__pyx_v_B);
+  __Pyx_DECREF((PyObject *)__pyx_v_VB);
+  __Pyx_DECREF((PyObject *)__pyx_v_S2);
+  __Pyx_DECREF((PyObject *)__pyx_v_A);
+  __Pyx_DECREF((PyObject *)__pyx_v_CV);
+  __Pyx_DECREF((PyObject *)__pyx_v_W);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/nipy/neurospin/glm/kalman.pyx":237
+ * 
+ * 
+ * def _fit_threads(fit_range, ndarray Y, args, int axis, int n_threads):             # <<<<<<<<<<<<<<
+ *     """
+ *     Run ``fit_range(Y, *(args + (start, stop)))`` over `n_threads`
+ */
+
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman__fit_threads(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_3glm_6kalman__fit_threads[] = "\n    Run ``fit_range(Y, *(args + (start, stop)))`` over `n_threads`\n    threads, splitting the voxels of `Y` into contiguous ranges.\n\n    Return the output of the call for the range with the last voxel.\n    An exception raised in any of the threads is raised again here.\n    ";
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman__fit_threads(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_fit_range = 0;
+  PyArrayObject *__pyx_v_Y = 0;
+  PyObject *__pyx_v_args = 0;
+  int __pyx_v_axis;
+  int __pyx_v_n_threads;
+  size_t __pyx_v_n_vox;
+  PyObject *__pyx_v_bounds;
+  PyObject *__pyx_v_outs;
+  PyObject *__pyx_v_errors;
+  PyObject *__pyx_v_threads;
+  PyObject *__pyx_v_i;
+  PyObject *__pyx_v_thread;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  size_t __pyx_t_4;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__fit_range,&__pyx_n_s__Y,&__pyx_n_s__args,&__pyx_n_s__axis,&__pyx_n_s__n_threads,0};
+  __Pyx_RefNannySetupContext("_fit_threads");
+  __pyx_self = __pyx_self;
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[5] = {0,0,0,0,0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__fit_range);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Y);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_fit_threads", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  2:
+      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__args);
+      if (likely(values[2])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_fit_threads", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  3:
+      values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__axis);
+      if (likely(values[3])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_fit_threads", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  4:
+      values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n_threads);
+      if (likely(values[4])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_fit_threads", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_fit_threads") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_fit_range = values[0];
+    __pyx_v_Y = ((PyArrayObject *)values[1]);
+    __pyx_v_args = values[2];
+    __pyx_v_axis = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_n_threads = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_fit_range = PyTuple_GET_ITEM(__pyx_args, 0);
+    __pyx_v_Y = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
+    __pyx_v_args = PyTuple_GET_ITEM(__pyx_args, 2);
+    __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_n_threads = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_fit_threads", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman._fit_threads");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF(__pyx_v_fit_range);
+  __Pyx_INCREF((PyObject *)__pyx_v_Y);
+  __Pyx_INCREF(__pyx_v_args);
+  __pyx_v_bounds = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_outs = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_errors = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_threads = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_thread = Py_None; __Pyx_INCREF(Py_None);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":245
+ *     An exception raised in any of the threads is raised again here.
+ *     """
+ *     cdef size_t n_vox = Y.size / Y.shape[axis]             # <<<<<<<<<<<<<<
+ *     if n_threads == 1:
+ *         return fit_range(*((Y,) + args + (0, n_vox)))
+ */
+  __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_Y), __pyx_n_s__size); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_Y->dimensions[__pyx_v_axis])); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyNumber_Divide(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = __Pyx_PyInt_AsSize_t(__pyx_t_3); if (unlikely((__pyx_t_4 == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_n_vox = __pyx_t_4;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":246
+ *     """
+ *     cdef size_t n_vox = Y.size / Y.shape[axis]
+ *     if n_threads == 1:             # <<<<<<<<<<<<<<
+ *         return fit_range(*((Y,) + args + (0, n_vox)))
+ *     bounds = [n_vox * i / n_threads for i in range(n_threads + 1)]
+ */
+  __pyx_t_5 = (__pyx_v_n_threads == 1);
+  if (__pyx_t_5) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":247
+ *     cdef size_t n_vox = Y.size / Y.shape[axis]
+ *     if n_threads == 1:
+ *         return fit_range(*((Y,) + args + (0, n_vox)))             # <<<<<<<<<<<<<<
+ *     bounds = [n_vox * i / n_threads for i in range(n_threads + 1)]
+ *     outs = [None] * n_threads
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)__pyx_v_Y));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_v_Y));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_Y));
+    __pyx_t_2 = PyNumber_Add(__pyx_t_3, __pyx_v_args); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_n_vox); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_int_0);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_int_0);
+    __Pyx_GIVEREF(__pyx_int_0);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Add(__pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PySequence_Tuple(__pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyObject_Call(__pyx_v_fit_range, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":248
+ *     if n_threads == 1:
+ *         return fit_range(*((Y,) + args + (0, n_vox)))
+ *     bounds = [n_vox * i / n_threads for i in range(n_threads + 1)]             # <<<<<<<<<<<<<<
+ *     outs = [None] * n_threads
+ *     errors = []
+ */
+  __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  __pyx_t_1 = PyInt_FromLong((__pyx_v_n_threads + 1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_Call(__pyx_builtin_range, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyList_CheckExact(__pyx_t_1) || PyTuple_CheckExact(__pyx_t_1)) {
+    __pyx_t_6 = 0; __pyx_t_2 = __pyx_t_1; __Pyx_INCREF(__pyx_t_2);
+  } else {
+    __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++;
+    } else {
+      __pyx_t_1 = PyIter_Next(__pyx_t_2);
+      if (!__pyx_t_1) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_DECREF(__pyx_v_i);
+    __pyx_v_i = __pyx_t_1;
+    __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_n_vox); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_7 = PyNumber_Multiply(__pyx_t_1, __pyx_v_i); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyInt_FromLong(__pyx_v_n_threads); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_8 = __Pyx_PyNumber_Divide(__pyx_t_7, __pyx_t_1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_9 = PyList_Append(__pyx_t_3, (PyObject*)__pyx_t_8); if (unlikely(__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_INCREF(((PyObject *)__pyx_t_3));
+  __Pyx_DECREF(__pyx_v_bounds);
+  __pyx_v_bounds = ((PyObject *)__pyx_t_3);
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":249
+ *         return fit_range(*((Y,) + args + (0, n_vox)))
+ *     bounds = [n_vox * i / n_threads for i in range(n_threads + 1)]
+ *     outs = [None] * n_threads             # <<<<<<<<<<<<<<
+ *     errors = []
+ *     threads = []
+ */
+  __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  __Pyx_INCREF(Py_None);
+  PyList_SET_ITEM(__pyx_t_3, 0, Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __pyx_t_2 = PyInt_FromLong(__pyx_v_n_threads); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_8 = PyNumber_Multiply(((PyObject *)__pyx_t_3), __pyx_t_2); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_v_outs);
+  __pyx_v_outs = __pyx_t_8;
+  __pyx_t_8 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":250
+ *     bounds = [n_vox * i / n_threads for i in range(n_threads + 1)]
+ *     outs = [None] * n_threads
+ *     errors = []             # <<<<<<<<<<<<<<
+ *     threads = []
+ *     for i in range(n_threads):
+ */
+  __pyx_t_8 = PyList_New(0); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_8));
+  __Pyx_DECREF(__pyx_v_errors);
+  __pyx_v_errors = ((PyObject *)__pyx_t_8);
+  __pyx_t_8 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":251
+ *     outs = [None] * n_threads
+ *     errors = []
+ *     threads = []             # <<<<<<<<<<<<<<
+ *     for i in range(n_threads):
+ *         thread = threading.Thread(
+ */
+  __pyx_t_8 = PyList_New(0); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_8));
+  __Pyx_DECREF(__pyx_v_threads);
+  __pyx_v_threads = ((PyObject *)__pyx_t_8);
+  __pyx_t_8 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":252
+ *     errors = []
+ *     threads = []
+ *     for i in range(n_threads):             # <<<<<<<<<<<<<<
+ *         thread = threading.Thread(
+ *             target=_run_range,
+ */
+  __pyx_t_8 = PyInt_FromLong(__pyx_v_n_threads); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 252; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 252; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_8);
+  __pyx_t_8 = 0;
+  __pyx_t_8 = PyObject_Call(__pyx_builtin_range, __pyx_t_2, NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 252; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyList_CheckExact(__pyx_t_8) || PyTuple_CheckExact(__pyx_t_8)) {
+    __pyx_t_6 = 0; __pyx_t_2 = __pyx_t_8; __Pyx_INCREF(__pyx_t_2);
+  } else {
+    __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_8); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 252; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_8 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_8); __pyx_t_6++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_8); __pyx_t_6++;
+    } else {
+      __pyx_t_8 = PyIter_Next(__pyx_t_2);
+      if (!__pyx_t_8) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 252; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_8);
+    }
+    __Pyx_DECREF(__pyx_v_i);
+    __pyx_v_i = __pyx_t_8;
+    __pyx_t_8 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":253
+ *     threads = []
+ *     for i in range(n_threads):
+ *         thread = threading.Thread(             # <<<<<<<<<<<<<<
+ *             target=_run_range,
+ *             args=(outs, errors, i, fit_range,
+ */
+    __pyx_t_8 = __Pyx_GetName(__pyx_m, __pyx_n_s__threading); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_8, __pyx_n_s__Thread); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = PyDict_New(); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_8));
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":254
+ *     for i in range(n_threads):
+ *         thread = threading.Thread(
+ *             target=_run_range,             # <<<<<<<<<<<<<<
+ *             args=(outs, errors, i, fit_range,
+ *                   (Y,) + args + (bounds[i], bounds[i+1])))
+ */
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s___run_range); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    if (PyDict_SetItem(__pyx_t_8, ((PyObject *)__pyx_n_s__target), __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":256
+ *             target=_run_range,
+ *             args=(outs, errors, i, fit_range,
+ *                   (Y,) + args + (bounds[i], bounds[i+1])))             # <<<<<<<<<<<<<<
+ *         thread.start()
+ *         threads.append(thread)
+ */
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(((PyObject *)__pyx_v_Y));
+    PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_v_Y));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_Y));
+    __pyx_t_7 = PyNumber_Add(__pyx_t_1, __pyx_v_args); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyObject_GetItem(__pyx_v_bounds, __pyx_v_i); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_10 = PyNumber_Add(__pyx_v_i, __pyx_int_1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_11 = PyObject_GetItem(__pyx_v_bounds, __pyx_t_10); if (!__pyx_t_11) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_10 = PyTuple_New(2); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_t_11);
+    __Pyx_GIVEREF(__pyx_t_11);
+    __pyx_t_1 = 0;
+    __pyx_t_11 = 0;
+    __pyx_t_11 = PyNumber_Add(__pyx_t_7, __pyx_t_10); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_10 = PyTuple_New(5); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_INCREF(__pyx_v_outs);
+    PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_v_outs);
+    __Pyx_GIVEREF(__pyx_v_outs);
+    __Pyx_INCREF(__pyx_v_errors);
+    PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_v_errors);
+    __Pyx_GIVEREF(__pyx_v_errors);
+    __Pyx_INCREF(__pyx_v_i);
+    PyTuple_SET_ITEM(__pyx_t_10, 2, __pyx_v_i);
+    __Pyx_GIVEREF(__pyx_v_i);
+    __Pyx_INCREF(__pyx_v_fit_range);
+    PyTuple_SET_ITEM(__pyx_t_10, 3, __pyx_v_fit_range);
+    __Pyx_GIVEREF(__pyx_v_fit_range);
+    PyTuple_SET_ITEM(__pyx_t_10, 4, __pyx_t_11);
+    __Pyx_GIVEREF(__pyx_t_11);
+    __pyx_t_11 = 0;
+    if (PyDict_SetItem(__pyx_t_8, ((PyObject *)__pyx_n_s__args), __pyx_t_10) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_10 = PyEval_CallObjectWithKeywords(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_8)); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_8)); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_v_thread);
+    __pyx_v_thread = __pyx_t_10;
+    __pyx_t_10 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":257
+ *             args=(outs, errors, i, fit_range,
+ *                   (Y,) + args + (bounds[i], bounds[i+1])))
+ *         thread.start()             # <<<<<<<<<<<<<<
+ *         threads.append(thread)
+ *     for thread in threads:
+ */
+    __pyx_t_10 = PyObject_GetAttr(__pyx_v_thread, __pyx_n_s__start); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 257; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_8 = PyObject_Call(__pyx_t_10, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 257; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":258
+ *                   (Y,) + args + (bounds[i], bounds[i+1])))
+ *         thread.start()
+ *         threads.append(thread)             # <<<<<<<<<<<<<<
+ *     for thread in threads:
+ *         thread.join()
+ */
+    __pyx_t_8 = __Pyx_PyObject_Append(__pyx_v_threads, __pyx_v_thread); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":259
+ *         thread.start()
+ *         threads.append(thread)
+ *     for thread in threads:             # <<<<<<<<<<<<<<
+ *         thread.join()
+ *     if errors:
+ */
+  if (PyList_CheckExact(__pyx_v_threads) || PyTuple_CheckExact(__pyx_v_threads)) {
+    __pyx_t_6 = 0; __pyx_t_2 = __pyx_v_threads; __Pyx_INCREF(__pyx_t_2);
+  } else {
+    __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_threads); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_8 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_8); __pyx_t_6++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
+      if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+      __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_8); __pyx_t_6++;
+    } else {
+      __pyx_t_8 = PyIter_Next(__pyx_t_2);
+      if (!__pyx_t_8) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_8);
+    }
+    __Pyx_DECREF(__pyx_v_thread);
+    __pyx_v_thread = __pyx_t_8;
+    __pyx_t_8 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":260
+ *         threads.append(thread)
+ *     for thread in threads:
+ *         thread.join()             # <<<<<<<<<<<<<<
+ *     if errors:
+ *         raise errors[0][0], errors[0][1], errors[0][2]
+ */
+    __pyx_t_8 = PyObject_GetAttr(__pyx_v_thread, __pyx_n_s__join); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 260; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_10 = PyObject_Call(__pyx_t_8, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 260; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":261
+ *     for thread in threads:
+ *         thread.join()
+ *     if errors:             # <<<<<<<<<<<<<<
+ *         raise errors[0][0], errors[0][1], errors[0][2]
+ *     return outs[-1]
+ */
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_errors); if (unlikely(__pyx_t_5 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 261; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_5) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":262
+ *         thread.join()
+ *     if errors:
+ *         raise errors[0][0], errors[0][1], errors[0][2]             # <<<<<<<<<<<<<<
+ *     return outs[-1]
+ * 
+ */
+    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_errors, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_10 = __Pyx_GetItemInt(__pyx_t_2, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_10) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_errors, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_2, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_8) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_errors, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_2, 2, sizeof(long), PyInt_FromLong); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_Raise(__pyx_t_10, __pyx_t_8, __pyx_t_3);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L13;
+  }
+  __pyx_L13:;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":263
+ *     if errors:
+ *         raise errors[0][0], errors[0][1], errors[0][2]
+ *     return outs[-1]             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_outs, -1, sizeof(long), PyInt_FromLong); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 263; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman._fit_threads");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_bounds);
+  __Pyx_DECREF(__pyx_v_outs);
+  __Pyx_DECREF(__pyx_v_errors);
+  __Pyx_DECREF(__pyx_v_threads);
+  __Pyx_DECREF(__pyx_v_i);
+  __Pyx_DECREF(__pyx_v_thread);
+  __Pyx_DECREF(__pyx_v_fit_range);
+  __Pyx_DECREF((PyObject *)__pyx_v_Y);
+  __Pyx_DECREF(__pyx_v_args);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/nipy/neurospin/glm/kalman.pyx":266
+ * 
+ * 
+ * def _run_range(outs, errors, i, fit_range, args):             # <<<<<<<<<<<<<<
+ *     try:
+ *         outs[i] = fit_range(*args)
+ */
+
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman__run_range(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman__run_range(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_outs = 0;
+  PyObject *__pyx_v_errors = 0;
+  PyObject *__pyx_v_i = 0;
+  PyObject *__pyx_v_fit_range = 0;
+  PyObject *__pyx_v_args = 0;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__outs,&__pyx_n_s__errors,&__pyx_n_s__i,&__pyx_n_s__fit_range,&__pyx_n_s__args,0};
+  __Pyx_RefNannySetupContext("_run_range");
+  __pyx_self = __pyx_self;
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[5] = {0,0,0,0,0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__outs);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__errors);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_run_range", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  2:
+      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__i);
+      if (likely(values[2])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_run_range", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  3:
+      values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__fit_range);
+      if (likely(values[3])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_run_range", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  4:
+      values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__args);
+      if (likely(values[4])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_run_range", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_run_range") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_outs = values[0];
+    __pyx_v_errors = values[1];
+    __pyx_v_i = values[2];
+    __pyx_v_fit_range = values[3];
+    __pyx_v_args = values[4];
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_outs = PyTuple_GET_ITEM(__pyx_args, 0);
+    __pyx_v_errors = PyTuple_GET_ITEM(__pyx_args, 1);
+    __pyx_v_i = PyTuple_GET_ITEM(__pyx_args, 2);
+    __pyx_v_fit_range = PyTuple_GET_ITEM(__pyx_args, 3);
+    __pyx_v_args = PyTuple_GET_ITEM(__pyx_args, 4);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_run_range", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman._run_range");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF(__pyx_v_outs);
+  __Pyx_INCREF(__pyx_v_errors);
+  __Pyx_INCREF(__pyx_v_i);
+  __Pyx_INCREF(__pyx_v_fit_range);
+  __Pyx_INCREF(__pyx_v_args);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":267
+ * 
+ * def _run_range(outs, errors, i, fit_range, args):
+ *     try:             # <<<<<<<<<<<<<<
+ *         outs[i] = fit_range(*args)
+ *     except:
+ */
+  {
+    PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
+    __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
+    __Pyx_XGOTREF(__pyx_save_exc_type);
+    __Pyx_XGOTREF(__pyx_save_exc_value);
+    __Pyx_XGOTREF(__pyx_save_exc_tb);
+    /*try:*/ {
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":268
+ * def _run_range(outs, errors, i, fit_range, args):
+ *     try:
+ *         outs[i] = fit_range(*args)             # <<<<<<<<<<<<<<
+ *     except:
+ *         errors.append(sys.exc_info())
+ */
+      __pyx_t_1 = PySequence_Tuple(__pyx_v_args); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+      __pyx_t_2 = PyObject_Call(__pyx_v_fit_range, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+      if (PyObject_SetItem(__pyx_v_outs, __pyx_v_i, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    }
+    __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
+    __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
+    __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
+    goto __pyx_L13_try_end;
+    __pyx_L6_error:;
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":269
+ *     try:
+ *         outs[i] = fit_range(*args)
+ *     except:             # <<<<<<<<<<<<<<
+ *         errors.append(sys.exc_info())
+ * 
+ */
+    /*except:*/ {
+      __Pyx_AddTraceback("nipy.neurospin.glm.kalman._run_range");
+      if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_1, &__pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; __pyx_clineno = __LINE__; goto __pyx_L8_except_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_GOTREF(__pyx_t_3);
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":270
+ *         outs[i] = fit_range(*args)
+ *     except:
+ *         errors.append(sys.exc_info())             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__sys); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; __pyx_clineno = __LINE__; goto __pyx_L8_except_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__exc_info); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; __pyx_clineno = __LINE__; goto __pyx_L8_except_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = PyObject_Call(__pyx_t_5, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; __pyx_clineno = __LINE__; goto __pyx_L8_except_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = __Pyx_PyObject_Append(__pyx_v_errors, __pyx_t_4); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; __pyx_clineno = __LINE__; goto __pyx_L8_except_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      goto __pyx_L7_exception_handled;
+    }
+    __pyx_L8_except_error:;
+    __Pyx_XGIVEREF(__pyx_save_exc_type);
+    __Pyx_XGIVEREF(__pyx_save_exc_value);
+    __Pyx_XGIVEREF(__pyx_save_exc_tb);
+    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+    goto __pyx_L1_error;
+    __pyx_L7_exception_handled:;
+    __Pyx_XGIVEREF(__pyx_save_exc_type);
+    __Pyx_XGIVEREF(__pyx_save_exc_value);
+    __Pyx_XGIVEREF(__pyx_save_exc_tb);
+    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
+    __pyx_L13_try_end:;
+  }
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman._run_range");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_outs);
+  __Pyx_DECREF(__pyx_v_errors);
+  __Pyx_DECREF(__pyx_v_i);
+  __Pyx_DECREF(__pyx_v_fit_range);
+  __Pyx_DECREF(__pyx_v_args);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/nipy/neurospin/glm/kalman.pyx":273
+ * 
+ * 
+ * def _use_threads(ndarray Y, int axis, n_threads):             # <<<<<<<<<<<<<<
+ *     """ True if we should fit `Y` over more than one thread """
+ *     if n_threads is None or n_threads < 2:
+ */
+
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman__use_threads(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_3glm_6kalman__use_threads[] = " True if we should fit `Y` over more than one thread ";
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman__use_threads(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_Y = 0;
+  int __pyx_v_axis;
+  PyObject *__pyx_v_n_threads = 0;
+  PyObject *__pyx_r = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Y,&__pyx_n_s__axis,&__pyx_n_s__n_threads,0};
+  __Pyx_RefNannySetupContext("_use_threads");
+  __pyx_self = __pyx_self;
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[3] = {0,0,0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Y);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__axis);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_use_threads", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  2:
+      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n_threads);
+      if (likely(values[2])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_use_threads", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_use_threads") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_Y = ((PyArrayObject *)values[0]);
+    __pyx_v_axis = __Pyx_PyInt_AsInt(values[1]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_n_threads = values[2];
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_Y = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
+    __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_n_threads = PyTuple_GET_ITEM(__pyx_args, 2);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_use_threads", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman._use_threads");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_Y);
+  __Pyx_INCREF(__pyx_v_n_threads);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":275
+ * def _use_threads(ndarray Y, int axis, n_threads):
+ *     """ True if we should fit `Y` over more than one thread """
+ *     if n_threads is None or n_threads < 2:             # <<<<<<<<<<<<<<
+ *         return False
+ *     return Y.size / Y.shape[axis] >= n_threads
+ */
+  __pyx_t_1 = (__pyx_v_n_threads == Py_None);
+  if (!__pyx_t_1) {
+    __pyx_t_2 = PyObject_RichCompare(__pyx_v_n_threads, __pyx_int_2, Py_LT); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_4 = __pyx_t_3;
+  } else {
+    __pyx_t_4 = __pyx_t_1;
+  }
+  if (__pyx_t_4) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":276
+ *     """ True if we should fit `Y` over more than one thread """
+ *     if n_threads is None or n_threads < 2:
+ *         return False             # <<<<<<<<<<<<<<
+ *     return Y.size / Y.shape[axis] >= n_threads
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":277
+ *     if n_threads is None or n_threads < 2:
+ *         return False
+ *     return Y.size / Y.shape[axis] >= n_threads             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_Y), __pyx_n_s__size); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_Y->dimensions[__pyx_v_axis])); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyNumber_Divide(__pyx_t_2, __pyx_t_5); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_6, __pyx_v_n_threads, Py_GE); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman._use_threads");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_Y);
+  __Pyx_DECREF(__pyx_v_n_threads);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/nipy/neurospin/glm/kalman.pyx":280
+ * 
+ * 
+ * def _double_aligned(ndarray Y):             # <<<<<<<<<<<<<<
+ *     """ `Y` as aligned, native double array, copying if needed """
+ *     Y = np.asarray(Y, dtype=np.double)
+ */
+
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman__double_aligned(PyObject *__pyx_self, PyObject *__pyx_v_Y); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_3glm_6kalman__double_aligned[] = " `Y` as aligned, native double array, copying if needed ";
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman__double_aligned(PyObject *__pyx_self, PyObject *__pyx_v_Y) {
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  __Pyx_RefNannySetupContext("_double_aligned");
+  __pyx_self = __pyx_self;
+  __Pyx_INCREF((PyObject *)__pyx_v_Y);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 280; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":282
+ * def _double_aligned(ndarray Y):
+ *     """ `Y` as aligned, native double array, copying if needed """
+ *     Y = np.asarray(Y, dtype=np.double)             # <<<<<<<<<<<<<<
+ *     if not Y.flags.aligned:
+ *         Y = Y.copy()
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__asarray); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_Y);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_Y);
+  __Pyx_GIVEREF(__pyx_v_Y);
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__double); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_3, ((PyObject *)__pyx_n_s__dtype), __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyEval_CallObjectWithKeywords(__pyx_t_2, __pyx_t_1, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_v_Y);
+  __pyx_v_Y = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":283
+ *     """ `Y` as aligned, native double array, copying if needed """
+ *     Y = np.asarray(Y, dtype=np.double)
+ *     if not Y.flags.aligned:             # <<<<<<<<<<<<<<
+ *         Y = Y.copy()
+ *     return Y
+ */
+  __pyx_t_5 = PyObject_GetAttr(__pyx_v_Y, __pyx_n_s__flags); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_5, __pyx_n_s__aligned); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_7 = (!__pyx_t_6);
+  if (__pyx_t_7) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":284
+ *     Y = np.asarray(Y, dtype=np.double)
+ *     if not Y.flags.aligned:
+ *         Y = Y.copy()             # <<<<<<<<<<<<<<
+ *     return Y
+ * 
+ */
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_Y, __pyx_n_s__copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_v_Y);
+    __pyx_v_Y = __pyx_t_5;
+    __pyx_t_5 = 0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":285
+ *     if not Y.flags.aligned:
+ *         Y = Y.copy()
+ *     return Y             # <<<<<<<<<<<<<<
+ * 
+ * # Standard Kalman filter
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_Y);
+  __pyx_r = __pyx_v_Y;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman._double_aligned");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_Y);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/nipy/neurospin/glm/kalman.pyx":289
+ * # Standard Kalman filter
+ * 
+ * def ols(ndarray Y, ndarray X, int axis=0, n_threads=None):             # <<<<<<<<<<<<<<
+ *     """
+ *     (beta, norm_var_beta, s2, dof) = ols(Y, X, axis=0, n_threads=None).
+ */
+
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman_ols(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_3glm_6kalman_ols[] = "\n    (beta, norm_var_beta, s2, dof) = ols(Y, X, axis=0, n_threads=None).\n\n    Ordinary least-square multiple regression using the Kalman filter.\n    Fit the N-dimensional array Y along the given axis in terms of the\n    regressors in matrix X. The regressors must be stored columnwise.\n\n    OUTPUT: a four-element tuple\n    beta -- array of parameter estimates\n    norm_var_beta -- normalized variance matrix of the parameter\n    estimates (data independent)\n    s2 -- array of squared scale\n    parameters to multiply norm_var_beta for the variance matrix of\n    beta.\n    dof -- scalar degrees of freedom.\n\n    If `n_threads` is greater than one, the voxels are split into\n    `n_threads` ranges, fit in parallel threads. The results are the\n    same as for the serial fit.\n\n    REFERENCE:  Roche et al, ISBI 2004.\n    ";
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman_ols(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_Y = 0;
+  PyArrayObject *__pyx_v_X = 0;
+  int __pyx_v_axis;
+  PyObject *__pyx_v_n_threads = 0;
+  fff_vector *__pyx_v_y;
+  fff_vector *__pyx_v_b;
+  fff_vector *__pyx_v_s2;
+  fff_matrix *__pyx_v_x;
+  fff_glm_KF *__pyx_v_kfilt;
+  size_t __pyx_v_p;
+  fffpy_multi_iterator *__pyx_v_multi;
+  double __pyx_v_dof;
+  PyObject *__pyx_v_dims;
+  PyObject *__pyx_v_B;
+  PyObject *__pyx_v_S2;
+  PyObject *__pyx_v_VB;
+  PyObject *__pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  double __pyx_t_11;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Y,&__pyx_n_s__X,&__pyx_n_s__axis,&__pyx_n_s__n_threads,0};
+  __Pyx_RefNannySetupContext("ols");
+  __pyx_self = __pyx_self;
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[4] = {0,0,0,0};
+    values[3] = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Y);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__X);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("ols", 0, 2, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  2:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__axis);
+        if (unlikely(value)) { values[2] = value; kw_args--; }
+      }
+      case  3:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n_threads);
+        if (unlikely(value)) { values[3] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "ols") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_Y = ((PyArrayObject *)values[0]);
+    __pyx_v_X = ((PyArrayObject *)values[1]);
+    if (values[2]) {
+      __pyx_v_axis = __Pyx_PyInt_AsInt(values[2]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_axis = ((int)0);
+    }
+    __pyx_v_n_threads = values[3];
+  } else {
+    __pyx_v_axis = ((int)0);
+    __pyx_v_n_threads = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  4:
+      __pyx_v_n_threads = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3:
+      __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  2:
+      __pyx_v_X = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
+      __pyx_v_Y = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("ols", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman.ols");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_Y);
+  __Pyx_INCREF((PyObject *)__pyx_v_X);
+  __Pyx_INCREF(__pyx_v_n_threads);
+  __pyx_v_dims = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_B = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_S2 = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_VB = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_X), __pyx_ptype_5numpy_ndarray, 1, "X", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":320
+ * 
+ *     # View on design matrix
+ *     x = fff_matrix_fromPyArray(X)             # <<<<<<<<<<<<<<
+ * 
+ *     # Number of regressors
+ */
+  __pyx_v_x = fff_matrix_fromPyArray(__pyx_v_X);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":323
+ * 
+ *     # Number of regressors
+ *     p = x.size2             # <<<<<<<<<<<<<<
+ * 
+ *     # Allocate output arrays B and S2
+ */
+  __pyx_v_p = __pyx_v_x->size2;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":330
+ *     # type; see:
+ *     # http://codespeak.net/pipermail/cython-dev/2009-April/005229.html
+ *     dims = [Y.shape[i] for i in range(Y.ndim)]             # <<<<<<<<<<<<<<
+ *     dims[axis] = p
+ *     B = np.zeros(dims, dtype=np.double)
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __pyx_t_3 = PyInt_FromLong(__pyx_v_Y->nd); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_Call(__pyx_builtin_range, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
+    __pyx_t_2 = 0; __pyx_t_4 = __pyx_t_3; __Pyx_INCREF(__pyx_t_4);
+  } else {
+    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_4))) {
+      if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_4)) break;
+      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
+      if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++;
+    } else {
+      __pyx_t_3 = PyIter_Next(__pyx_t_4);
+      if (!__pyx_t_3) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_3);
+    }
+    __Pyx_DECREF(__pyx_v_i);
+    __pyx_v_i = __pyx_t_3;
+    __pyx_t_3 = 0;
+    __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_Y->dimensions[__pyx_t_5])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_3); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_INCREF(((PyObject *)__pyx_t_1));
+  __Pyx_DECREF(__pyx_v_dims);
+  __pyx_v_dims = ((PyObject *)__pyx_t_1);
+  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":331
+ *     # http://codespeak.net/pipermail/cython-dev/2009-April/005229.html
+ *     dims = [Y.shape[i] for i in range(Y.ndim)]
+ *     dims[axis] = p             # <<<<<<<<<<<<<<
+ *     B = np.zeros(dims, dtype=np.double)
+ *     dims[axis] = 1
+ */
+  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_p); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_t_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":332
+ *     dims = [Y.shape[i] for i in range(Y.ndim)]
+ *     dims[axis] = p
+ *     B = np.zeros(dims, dtype=np.double)             # <<<<<<<<<<<<<<
+ *     dims[axis] = 1
+ *     S2 = np.zeros(dims, dtype=np.double)
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_dims);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_dims);
+  __Pyx_GIVEREF(__pyx_v_dims);
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+  __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__double); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (PyDict_SetItem(__pyx_t_3, ((PyObject *)__pyx_n_s__dtype), __pyx_t_8) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_8 = PyEval_CallObjectWithKeywords(__pyx_t_4, __pyx_t_1, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_B);
+  __pyx_v_B = __pyx_t_8;
+  __pyx_t_8 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":333
+ *     dims[axis] = p
+ *     B = np.zeros(dims, dtype=np.double)
+ *     dims[axis] = 1             # <<<<<<<<<<<<<<
+ *     S2 = np.zeros(dims, dtype=np.double)
+ * 
+ */
+  if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_int_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":334
+ *     B = np.zeros(dims, dtype=np.double)
+ *     dims[axis] = 1
+ *     S2 = np.zeros(dims, dtype=np.double)             # <<<<<<<<<<<<<<
+ * 
+ *     # Threaded fit
+ */
+  __pyx_t_8 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_8, __pyx_n_s__zeros); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_INCREF(__pyx_v_dims);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_dims);
+  __Pyx_GIVEREF(__pyx_v_dims);
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_7 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__double); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__dtype), __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyEval_CallObjectWithKeywords(__pyx_t_3, __pyx_t_8, ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_v_S2);
+  __pyx_v_S2 = __pyx_t_7;
+  __pyx_t_7 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":337
+ * 
+ *     # Threaded fit
+ *     if _use_threads(Y, axis, n_threads):             # <<<<<<<<<<<<<<
+ *         fff_matrix_delete(x)
+ *         VB, dof = _fit_threads(_ols_range, _double_aligned(Y),
+ */
+  __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s___use_threads); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_1 = PyInt_FromLong(__pyx_v_axis); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_8 = PyTuple_New(3); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_INCREF(((PyObject *)__pyx_v_Y));
+  PyTuple_SET_ITEM(__pyx_t_8, 0, ((PyObject *)__pyx_v_Y));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_Y));
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_n_threads);
+  PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_v_n_threads);
+  __Pyx_GIVEREF(__pyx_v_n_threads);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_Call(__pyx_t_7, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_9 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_9) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":338
+ *     # Threaded fit
+ *     if _use_threads(Y, axis, n_threads):
+ *         fff_matrix_delete(x)             # <<<<<<<<<<<<<<
+ *         VB, dof = _fit_threads(_ols_range, _double_aligned(Y),
+ *                                (X, B, S2, axis), axis, n_threads)
+ */
+    fff_matrix_delete(__pyx_v_x);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":339
+ *     if _use_threads(Y, axis, n_threads):
+ *         fff_matrix_delete(x)
+ *         VB, dof = _fit_threads(_ols_range, _double_aligned(Y),             # <<<<<<<<<<<<<<
+ *                                (X, B, S2, axis), axis, n_threads)
+ *         return B, VB, S2, dof
+ */
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s___fit_threads); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_8 = __Pyx_GetName(__pyx_m, __pyx_n_s___ols_range); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s___double_aligned); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)__pyx_v_Y));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_v_Y));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_Y));
+    __pyx_t_4 = PyObject_Call(__pyx_t_7, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":340
+ *         fff_matrix_delete(x)
+ *         VB, dof = _fit_threads(_ols_range, _double_aligned(Y),
+ *                                (X, B, S2, axis), axis, n_threads)             # <<<<<<<<<<<<<<
+ *         return B, VB, S2, dof
+ * 
+ */
+    __pyx_t_3 = PyInt_FromLong(__pyx_v_axis); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_7 = PyTuple_New(4); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_INCREF(((PyObject *)__pyx_v_X));
+    PyTuple_SET_ITEM(__pyx_t_7, 0, ((PyObject *)__pyx_v_X));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_X));
+    __Pyx_INCREF(__pyx_v_B);
+    PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_v_B);
+    __Pyx_GIVEREF(__pyx_v_B);
+    __Pyx_INCREF(__pyx_v_S2);
+    PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_v_S2);
+    __Pyx_GIVEREF(__pyx_v_S2);
+    PyTuple_SET_ITEM(__pyx_t_7, 3, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    __pyx_t_3 = 0;
+    __pyx_t_3 = PyInt_FromLong(__pyx_v_axis); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_10 = PyTuple_New(5); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_8);
+    PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_10, 2, __pyx_t_7);
+    __Pyx_GIVEREF(__pyx_t_7);
+    PyTuple_SET_ITEM(__pyx_t_10, 3, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v_n_threads);
+    PyTuple_SET_ITEM(__pyx_t_10, 4, __pyx_v_n_threads);
+    __Pyx_GIVEREF(__pyx_v_n_threads);
+    __pyx_t_8 = 0;
+    __pyx_t_4 = 0;
+    __pyx_t_7 = 0;
+    __pyx_t_3 = 0;
+    __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_10, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    if (PyTuple_CheckExact(__pyx_t_3) && likely(PyTuple_GET_SIZE(__pyx_t_3) == 2)) {
+      PyObject* tuple = __pyx_t_3;
+      __pyx_t_10 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_10);
+      __pyx_t_1 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_1);
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":339
+ *     if _use_threads(Y, axis, n_threads):
+ *         fff_matrix_delete(x)
+ *         VB, dof = _fit_threads(_ols_range, _double_aligned(Y),             # <<<<<<<<<<<<<<
+ *                                (X, B, S2, axis), axis, n_threads)
+ *         return B, VB, S2, dof
+ */
+      __pyx_t_11 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_11 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_v_VB);
+      __pyx_v_VB = __pyx_t_10;
+      __pyx_t_10 = 0;
+      __pyx_v_dof = __pyx_t_11;
+    } else {
+      __pyx_t_7 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_10 = __Pyx_UnpackItem(__pyx_t_7, 0); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_10);
+      __pyx_t_1 = __Pyx_UnpackItem(__pyx_t_7, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_11 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_11 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (__Pyx_EndUnpack(__pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_v_VB);
+      __pyx_v_VB = __pyx_t_10;
+      __pyx_t_10 = 0;
+      __pyx_v_dof = __pyx_t_11;
+    }
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":341
+ *         VB, dof = _fit_threads(_ols_range, _double_aligned(Y),
+ *                                (X, B, S2, axis), axis, n_threads)
+ *         return B, VB, S2, dof             # <<<<<<<<<<<<<<
+ * 
+ *     # Allocate local structure
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = PyFloat_FromDouble(__pyx_v_dof); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PyTuple_New(4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v_B);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_B);
+    __Pyx_GIVEREF(__pyx_v_B);
+    __Pyx_INCREF(__pyx_v_VB);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_VB);
+    __Pyx_GIVEREF(__pyx_v_VB);
+    __Pyx_INCREF(__pyx_v_S2);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_S2);
+    __Pyx_GIVEREF(__pyx_v_S2);
+    PyTuple_SET_ITEM(__pyx_t_1, 3, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+    goto __pyx_L8;
+  }
+  __pyx_L8:;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":344
+ * 
+ *     # Allocate local structure
+ *     kfilt = fff_glm_KF_new(p)             # <<<<<<<<<<<<<<
+ * 
+ *     # Create a new array iterator
+ */
+  __pyx_v_kfilt = fff_glm_KF_new(__pyx_v_p);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":347
+ * 
+ *     # Create a new array iterator
+ *     multi = fffpy_multi_iterator_new(3, axis, <void*>Y, <void*>B, <void*>S2)             # <<<<<<<<<<<<<<
+ * 
+ *     # Create views
+ */
+  __pyx_v_multi = fffpy_multi_iterator_new(3, __pyx_v_axis, ((void *)__pyx_v_Y), ((void *)__pyx_v_B), ((void *)__pyx_v_S2));
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":350
+ * 
+ *     # Create views
+ *     y = multi.vector[0]             # <<<<<<<<<<<<<<
+ *     b = multi.vector[1]
+ *     s2 = multi.vector[2]
+ */
+  __pyx_v_y = (__pyx_v_multi->vector[0]);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":351
+ *     # Create views
+ *     y = multi.vector[0]
+ *     b = multi.vector[1]             # <<<<<<<<<<<<<<
+ *     s2 = multi.vector[2]
+ * 
+ */
+  __pyx_v_b = (__pyx_v_multi->vector[1]);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":352
+ *     y = multi.vector[0]
+ *     b = multi.vector[1]
+ *     s2 = multi.vector[2]             # <<<<<<<<<<<<<<
+ * 
+ *     # Loop
+ */
+  __pyx_v_s2 = (__pyx_v_multi->vector[2]);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":355
+ * 
+ *     # Loop
+ *     while(multi.index < multi.size):             # <<<<<<<<<<<<<<
+ *         fff_glm_KF_fit(kfilt, y, x)
+ *         fff_vector_memcpy(b, kfilt.b)
+ */
+  while (1) {
+    __pyx_t_9 = (__pyx_v_multi->index < __pyx_v_multi->size);
+    if (!__pyx_t_9) break;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":356
+ *     # Loop
+ *     while(multi.index < multi.size):
+ *         fff_glm_KF_fit(kfilt, y, x)             # <<<<<<<<<<<<<<
+ *         fff_vector_memcpy(b, kfilt.b)
+ *         s2.data[0] = kfilt.s2
+ */
+    fff_glm_KF_fit(__pyx_v_kfilt, __pyx_v_y, __pyx_v_x);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":357
+ *     while(multi.index < multi.size):
+ *         fff_glm_KF_fit(kfilt, y, x)
+ *         fff_vector_memcpy(b, kfilt.b)             # <<<<<<<<<<<<<<
+ *         s2.data[0] = kfilt.s2
+ *         fffpy_multi_iterator_update(multi)
+ */
+    fff_vector_memcpy(__pyx_v_b, __pyx_v_kfilt->b);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":358
+ *         fff_glm_KF_fit(kfilt, y, x)
+ *         fff_vector_memcpy(b, kfilt.b)
+ *         s2.data[0] = kfilt.s2             # <<<<<<<<<<<<<<
+ *         fffpy_multi_iterator_update(multi)
+ * 
+ */
+    (__pyx_v_s2->data[0]) = __pyx_v_kfilt->s2;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":359
+ *         fff_vector_memcpy(b, kfilt.b)
+ *         s2.data[0] = kfilt.s2
+ *         fffpy_multi_iterator_update(multi)             # <<<<<<<<<<<<<<
+ * 
+ *     # Normalized variance (computed from the last item)
+ */
+    fffpy_multi_iterator_update(__pyx_v_multi);
+  }
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":362
+ * 
+ *     # Normalized variance (computed from the last item)
+ *     VB = fff_matrix_const_toPyArray(kfilt.Vb);             # <<<<<<<<<<<<<<
+ *     dof = kfilt.dof
+ * 
+ */
+  __pyx_t_1 = ((PyObject *)fff_matrix_const_toPyArray(__pyx_v_kfilt->Vb)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 362; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_v_VB);
+  __pyx_v_VB = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":363
+ *     # Normalized variance (computed from the last item)
+ *     VB = fff_matrix_const_toPyArray(kfilt.Vb);
+ *     dof = kfilt.dof             # <<<<<<<<<<<<<<
+ * 
+ *     # Free memory
+ */
+  __pyx_v_dof = __pyx_v_kfilt->dof;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":366
+ * 
+ *     # Free memory
+ *     fff_matrix_delete(x)             # <<<<<<<<<<<<<<
+ *     fff_glm_KF_delete(kfilt)
+ *     fffpy_multi_iterator_delete(multi)
+ */
+  fff_matrix_delete(__pyx_v_x);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":367
+ *     # Free memory
+ *     fff_matrix_delete(x)
+ *     fff_glm_KF_delete(kfilt)             # <<<<<<<<<<<<<<
+ *     fffpy_multi_iterator_delete(multi)
+ * 
+ */
+  fff_glm_KF_delete(__pyx_v_kfilt);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":368
+ *     fff_matrix_delete(x)
+ *     fff_glm_KF_delete(kfilt)
+ *     fffpy_multi_iterator_delete(multi)             # <<<<<<<<<<<<<<
+ * 
+ *     # Return
+ */
+  fffpy_multi_iterator_delete(__pyx_v_multi);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":371
+ * 
+ *     # Return
+ *     return B, VB, S2, dof             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_dof); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyTuple_New(4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_B);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_B);
+  __Pyx_GIVEREF(__pyx_v_B);
+  __Pyx_INCREF(__pyx_v_VB);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_VB);
+  __Pyx_GIVEREF(__pyx_v_VB);
+  __Pyx_INCREF(__pyx_v_S2);
+  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_S2);
+  __Pyx_GIVEREF(__pyx_v_S2);
+  PyTuple_SET_ITEM(__pyx_t_3, 3, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman.ols");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_dims);
+  __Pyx_DECREF(__pyx_v_B);
+  __Pyx_DECREF(__pyx_v_S2);
+  __Pyx_DECREF(__pyx_v_VB);
+  __Pyx_DECREF(__pyx_v_i);
+  __Pyx_DECREF((PyObject *)__pyx_v_Y);
+  __Pyx_DECREF((PyObject *)__pyx_v_X);
+  __Pyx_DECREF(__pyx_v_n_threads);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/nipy/neurospin/glm/kalman.pyx":374
+ * 
+ * 
+ * def ar1(ndarray Y, ndarray X, int niter=2, int axis=0, n_threads=None,             # <<<<<<<<<<<<<<
+ *         vb_storage='full', vb_dtype=np.double, contrasts=None):
+ *     """
+ */
+
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman_ar1(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_3glm_6kalman_ar1[] = "\n    (beta, norm_var_beta, s2, dof, a) = ar1(Y, X, niter=2, axis=0, n_threads=None,\n                                            vb_storage='full', vb_dtype=np.double,\n                                            contrasts=None)\n\n    Refined Kalman filter -- enhanced Kalman filter to account for\n    noise autocorrelation using an AR(1) model. Pseudo-likelihood\n    multiple regression using the refined Kalman filter, a Kalman\n    variant based on a AR(1) error model.  Fit the N-dimensional array\n    Y along the given axis in terms of the regressors in matrix X. The\n    regressors must be stored columnwise.\n\n    OUTPUT: a five-element tuple\n    beta -- array of parameter estimates\n    norm_var_beta -- array of normalized variance matrices (which are data dependent\n    unlike in standard OLS regression)\n    s2 -- array of squared scale parameters to multiply norm_var_beta for the variance matrix of beta.\n    dof -- scalar degrees of freedom\n    a -- array of error autocorrelation estimates\n\n    If `n_threads` is greater than one, the voxels are split into\n    `n_threads` ranges, fit in parallel threads. The results are the\n    same as for the serial fit.\n\n    The p x p normalized variance matrices take most of the output\n    memory. `vb_storage` sets how to store them:\n    'full' -- p x p matrices, at `axis` and `axis`+1 of norm_var_beta\n    'packed' -- upper triangles, row by row, p*(p+1)/2 values at `axis`\n    of norm_var_beta; see `unpack`\n    'none' -- do not store; norm_var_beta is None\n    `vb_dtype` (np.double or np.float32) is the type of the stored\n    values.\n\n    If `contrasts` is a sequence of contrast vectors and (q x p)\n    matrices, we calculate the normalized variances of the contrasts,\n    c*norm_var_beta*c', during the fit, and return them as a sixth\n    output, a list with one array per contrast, with the q x q variance\n    at `axis` (and `axis`+1 if q > 1).\n\n    REFERENCE:\n    Roche et al, MICCAI 2004.\n    ";
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman_ar1(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_Y = 0;
+  PyArrayObject *__pyx_v_X = 0;
+  int __pyx_v_niter;
+  int __pyx_v_axis;
+  PyObject *__pyx_v_n_threads = 0;
+  PyObject *__pyx_v_vb_storage = 0;
+  PyObject *__pyx_v_vb_dtype = 0;
+  PyObject *__pyx_v_contrasts = 0;
+  fff_vector *__pyx_v_y;
+  fff_vector *__pyx_v_b;
+  fff_vector *__pyx_v_vb;
+  fff_vector *__pyx_v_s2;
+  fff_vector *__pyx_v_a;
+  fff_vector __pyx_v_Vb_flat;
+  fff_matrix *__pyx_v_x;
+  fff_glm_RKF *__pyx_v_rkfilt;
+  size_t __pyx_v_p;
+  size_t __pyx_v_p2;
+  fffpy_multi_iterator *__pyx_v_multi;
+  double __pyx_v_dof;
+  PyObject *__pyx_v_dims;
+  PyObject *__pyx_v_B;
+  PyObject *__pyx_v_VB;
+  PyObject *__pyx_v_S2;
+  PyObject *__pyx_v_A;
+  PyObject *__pyx_v_CV;
+  PyObject *__pyx_v_W;
+  PyObject *__pyx_v_cons;
+  PyObject *__pyx_v_threaded;
+  PyObject *__pyx_v_CVs;
+  PyObject *__pyx_v_start;
+  PyObject *__pyx_v_c;
+  PyObject *__pyx_v_q;
+  PyObject *__pyx_v_cv;
+  PyObject *__pyx_v_i;
+  PyObject *__pyx_v_ca;
+  PyObject *__pyx_v_cb;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  Py_ssize_t __pyx_t_15;
+  int __pyx_t_16;
+  int __pyx_t_17;
+  double __pyx_t_18;
+  long __pyx_t_19;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Y,&__pyx_n_s__X,&__pyx_n_s__niter,&__pyx_n_s__axis,&__pyx_n_s__n_threads,&__pyx_n_s__vb_storage,&__pyx_n_s__vb_dtype,&__pyx_n_s__contrasts,0};
+  __Pyx_RefNannySetupContext("ar1");
+  __pyx_self = __pyx_self;
+  if (unlikely(__pyx_kwds)) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":375
+ * 
+ * def ar1(ndarray Y, ndarray X, int niter=2, int axis=0, n_threads=None,
+ *         vb_storage='full', vb_dtype=np.double, contrasts=None):             # <<<<<<<<<<<<<<
+ *     """
+ *     (beta, norm_var_beta, s2, dof, a) = ar1(Y, X, niter=2, axis=0, n_threads=None,
+ */
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    values[4] = ((PyObject *)Py_None);
+    values[5] = ((PyObject *)__pyx_n_s__full);
+    values[6] = __pyx_k_1;
+    values[7] = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Y);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__X);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("ar1", 0, 2, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  2:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__niter);
+        if (unlikely(value)) { values[2] = value; kw_args--; }
+      }
+      case  3:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__axis);
+        if (unlikely(value)) { values[3] = value; kw_args--; }
+      }
+      case  4:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n_threads);
+        if (unlikely(value)) { values[4] = value; kw_args--; }
+      }
+      case  5:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__vb_storage);
+        if (unlikely(value)) { values[5] = value; kw_args--; }
+      }
+      case  6:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__vb_dtype);
+        if (unlikely(value)) { values[6] = value; kw_args--; }
+      }
+      case  7:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__contrasts);
+        if (unlikely(value)) { values[7] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "ar1") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_Y = ((PyArrayObject *)values[0]);
+    __pyx_v_X = ((PyArrayObject *)values[1]);
+    if (values[2]) {
+      __pyx_v_niter = __Pyx_PyInt_AsInt(values[2]); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_niter = ((int)2);
+    }
+    if (values[3]) {
+      __pyx_v_axis = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_axis = ((int)0);
+    }
+    __pyx_v_n_threads = values[4];
+    __pyx_v_vb_storage = values[5];
+    __pyx_v_vb_dtype = values[6];
+    __pyx_v_contrasts = values[7];
+  } else {
+    __pyx_v_niter = ((int)2);
+    __pyx_v_axis = ((int)0);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":374
+ * 
+ * 
+ * def ar1(ndarray Y, ndarray X, int niter=2, int axis=0, n_threads=None,             # <<<<<<<<<<<<<<
+ *         vb_storage='full', vb_dtype=np.double, contrasts=None):
+ *     """
+ */
+    __pyx_v_n_threads = ((PyObject *)Py_None);
+    __pyx_v_vb_storage = ((PyObject *)__pyx_n_s__full);
+    __pyx_v_vb_dtype = __pyx_k_1;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":375
+ * 
+ * def ar1(ndarray Y, ndarray X, int niter=2, int axis=0, n_threads=None,
+ *         vb_storage='full', vb_dtype=np.double, contrasts=None):             # <<<<<<<<<<<<<<
+ *     """
+ *     (beta, norm_var_beta, s2, dof, a) = ar1(Y, X, niter=2, axis=0, n_threads=None,
+ */
+    __pyx_v_contrasts = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  8:
+      __pyx_v_contrasts = PyTuple_GET_ITEM(__pyx_args, 7);
+      case  7:
+      __pyx_v_vb_dtype = PyTuple_GET_ITEM(__pyx_args, 6);
+      case  6:
+      __pyx_v_vb_storage = PyTuple_GET_ITEM(__pyx_args, 5);
+      case  5:
+      __pyx_v_n_threads = PyTuple_GET_ITEM(__pyx_args, 4);
+      case  4:
+      __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  3:
+      __pyx_v_niter = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  2:
+      __pyx_v_X = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
+      __pyx_v_Y = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("ar1", 0, 2, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman.ar1");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_Y);
+  __Pyx_INCREF((PyObject *)__pyx_v_X);
+  __Pyx_INCREF(__pyx_v_n_threads);
+  __Pyx_INCREF(__pyx_v_vb_storage);
+  __Pyx_INCREF(__pyx_v_vb_dtype);
+  __Pyx_INCREF(__pyx_v_contrasts);
+  __pyx_v_dims = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_B = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_VB = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_S2 = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_A = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_CV = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_W = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_cons = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_threaded = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_CVs = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_start = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_c = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_q = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_cv = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_ca = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_cb = Py_None; __Pyx_INCREF(Py_None);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_X), __pyx_ptype_5numpy_ndarray, 1, "X", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":427
+ * 
+ *     # View on design matrix
+ *     x = fff_matrix_fromPyArray(X)             # <<<<<<<<<<<<<<
+ * 
+ *     # Number of regressors
+ */
+  __pyx_v_x = fff_matrix_fromPyArray(__pyx_v_X);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":430
+ * 
+ *     # Number of regressors
+ *     p = x.size2             # <<<<<<<<<<<<<<
+ *     p2 = p*p
+ * 
+ */
+  __pyx_v_p = __pyx_v_x->size2;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":431
+ *     # Number of regressors
+ *     p = x.size2
+ *     p2 = p*p             # <<<<<<<<<<<<<<
+ * 
+ *     # Allocate output arrays B and S2.
+ */
+  __pyx_v_p2 = (__pyx_v_p * __pyx_v_p);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":438
+ *     # type; see:
+ *     # http://codespeak.net/pipermail/cython-dev/2009-April/005229.html
+ *     dims = [Y.shape[i] for i in range(Y.ndim)]             # <<<<<<<<<<<<<<
+ *     if not vb_storages.has_key(vb_storage):
+ *         fff_matrix_delete(x)
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __pyx_t_3 = PyInt_FromLong(__pyx_v_Y->nd); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_Call(__pyx_builtin_range, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
+    __pyx_t_2 = 0; __pyx_t_4 = __pyx_t_3; __Pyx_INCREF(__pyx_t_4);
+  } else {
+    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_4))) {
+      if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_4)) break;
+      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
+      if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++;
+    } else {
+      __pyx_t_3 = PyIter_Next(__pyx_t_4);
+      if (!__pyx_t_3) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_3);
+    }
+    __Pyx_DECREF(__pyx_v_i);
+    __pyx_v_i = __pyx_t_3;
+    __pyx_t_3 = 0;
+    __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_Y->dimensions[__pyx_t_5])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_3); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_INCREF(((PyObject *)__pyx_t_1));
+  __Pyx_DECREF(__pyx_v_dims);
+  __pyx_v_dims = ((PyObject *)__pyx_t_1);
+  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":439
+ *     # http://codespeak.net/pipermail/cython-dev/2009-April/005229.html
+ *     dims = [Y.shape[i] for i in range(Y.ndim)]
+ *     if not vb_storages.has_key(vb_storage):             # <<<<<<<<<<<<<<
+ *         fff_matrix_delete(x)
+ *         raise ValueError('Unknown variance storage "%s"' % vb_storage)
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__vb_storages); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__has_key); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_vb_storage);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_vb_storage);
+  __Pyx_GIVEREF(__pyx_v_vb_storage);
+  __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_8 = (!__pyx_t_7);
+  if (__pyx_t_8) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":440
+ *     dims = [Y.shape[i] for i in range(Y.ndim)]
+ *     if not vb_storages.has_key(vb_storage):
+ *         fff_matrix_delete(x)             # <<<<<<<<<<<<<<
+ *         raise ValueError('Unknown variance storage "%s"' % vb_storage)
+ *     vb_dtype = np.dtype(vb_dtype)
+ */
+    fff_matrix_delete(__pyx_v_x);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":441
+ *     if not vb_storages.has_key(vb_storage):
+ *         fff_matrix_delete(x)
+ *         raise ValueError('Unknown variance storage "%s"' % vb_storage)             # <<<<<<<<<<<<<<
+ *     vb_dtype = np.dtype(vb_dtype)
+ *     if not vb_dtype in (np.dtype(np.double), np.dtype(np.float32)):
+ */
+    __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_2), __pyx_v_vb_storage); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    __pyx_t_3 = 0;
+    __pyx_t_3 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L8;
+  }
+  __pyx_L8:;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":442
+ *         fff_matrix_delete(x)
+ *         raise ValueError('Unknown variance storage "%s"' % vb_storage)
+ *     vb_dtype = np.dtype(vb_dtype)             # <<<<<<<<<<<<<<
+ *     if not vb_dtype in (np.dtype(np.double), np.dtype(np.float32)):
+ *         fff_matrix_delete(x)
+ */
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__dtype); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_vb_dtype);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_vb_dtype);
+  __Pyx_GIVEREF(__pyx_v_vb_dtype);
+  __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_vb_dtype);
+  __pyx_v_vb_dtype = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":443
+ *         raise ValueError('Unknown variance storage "%s"' % vb_storage)
+ *     vb_dtype = np.dtype(vb_dtype)
+ *     if not vb_dtype in (np.dtype(np.double), np.dtype(np.float32)):             # <<<<<<<<<<<<<<
+ *         fff_matrix_delete(x)
+ *         raise ValueError('Variance type should be double or float32')
+ */
+  __Pyx_INCREF(__pyx_v_vb_dtype);
+  __pyx_t_4 = __pyx_v_vb_dtype;
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__dtype); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_9 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__double); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_9);
+  __Pyx_GIVEREF(__pyx_t_9);
+  __pyx_t_9 = 0;
+  __pyx_t_9 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_4, __pyx_t_9, Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_8 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_7 = ((int)__pyx_t_8);
+  if (!__pyx_t_7) {
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_9 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__dtype); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__float32); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = PyObject_Call(__pyx_t_9, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyObject_RichCompare(__pyx_t_4, __pyx_t_1, Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_8 == (int)-1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_10 = ((int)__pyx_t_8);
+    __pyx_t_8 = __pyx_t_10;
+  } else {
+    __pyx_t_8 = __pyx_t_7;
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_7 = (!__pyx_t_8);
+  if (__pyx_t_7) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":444
+ *     vb_dtype = np.dtype(vb_dtype)
+ *     if not vb_dtype in (np.dtype(np.double), np.dtype(np.float32)):
+ *         fff_matrix_delete(x)             # <<<<<<<<<<<<<<
+ *         raise ValueError('Variance type should be double or float32')
+ *     dims[axis] = p
+ */
+    fff_matrix_delete(__pyx_v_x);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":445
+ *     if not vb_dtype in (np.dtype(np.double), np.dtype(np.float32)):
+ *         fff_matrix_delete(x)
+ *         raise ValueError('Variance type should be double or float32')             # <<<<<<<<<<<<<<
+ *     dims[axis] = p
+ *     B = np.zeros(dims, dtype=np.double)
+ */
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_3));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_3));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_3));
+    __pyx_t_3 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L9;
+  }
+  __pyx_L9:;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":446
+ *         fff_matrix_delete(x)
+ *         raise ValueError('Variance type should be double or float32')
+ *     dims[axis] = p             # <<<<<<<<<<<<<<
+ *     B = np.zeros(dims, dtype=np.double)
+ *     VB = None
+ */
+  __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_p); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 446; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_t_3, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 446; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":447
+ *         raise ValueError('Variance type should be double or float32')
+ *     dims[axis] = p
+ *     B = np.zeros(dims, dtype=np.double)             # <<<<<<<<<<<<<<
+ *     VB = None
+ *     if vb_storage == 'full':
+ */
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__zeros); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_dims);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_dims);
+  __Pyx_GIVEREF(__pyx_v_dims);
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __pyx_t_9 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_11 = PyObject_GetAttr(__pyx_t_9, __pyx_n_s__double); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__dtype), __pyx_t_11) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_t_11 = PyEval_CallObjectWithKeywords(__pyx_t_4, __pyx_t_3, ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_v_B);
+  __pyx_v_B = __pyx_t_11;
+  __pyx_t_11 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":448
  *     dims[axis] = p
- *     dims.insert(axis+1, p)
- *     VB = VB.reshape(dims)             # <<<<<<<<<<<<<<
+ *     B = np.zeros(dims, dtype=np.double)
+ *     VB = None             # <<<<<<<<<<<<<<
+ *     if vb_storage == 'full':
+ *         dims[axis] = p2
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_DECREF(__pyx_v_VB);
+  __pyx_v_VB = Py_None;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":449
+ *     B = np.zeros(dims, dtype=np.double)
+ *     VB = None
+ *     if vb_storage == 'full':             # <<<<<<<<<<<<<<
+ *         dims[axis] = p2
+ *         VB = np.zeros(dims, dtype=vb_dtype)
+ */
+  __pyx_t_11 = PyObject_RichCompare(__pyx_v_vb_storage, ((PyObject *)__pyx_n_s__full), Py_EQ); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_11); if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (__pyx_t_7) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":450
+ *     VB = None
+ *     if vb_storage == 'full':
+ *         dims[axis] = p2             # <<<<<<<<<<<<<<
+ *         VB = np.zeros(dims, dtype=vb_dtype)
+ *     elif vb_storage == 'packed':
+ */
+    __pyx_t_11 = __Pyx_PyInt_FromSize_t(__pyx_v_p2); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_11);
+    if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_t_11, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":451
+ *     if vb_storage == 'full':
+ *         dims[axis] = p2
+ *         VB = np.zeros(dims, dtype=vb_dtype)             # <<<<<<<<<<<<<<
+ *     elif vb_storage == 'packed':
+ *         dims[axis] = p*(p+1)/2
+ */
+    __pyx_t_11 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 451; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_t_1 = PyObject_GetAttr(__pyx_t_11, __pyx_n_s__zeros); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 451; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __pyx_t_11 = PyTuple_New(1); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 451; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_INCREF(__pyx_v_dims);
+    PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_v_dims);
+    __Pyx_GIVEREF(__pyx_v_dims);
+    __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 451; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+    if (PyDict_SetItem(__pyx_t_3, ((PyObject *)__pyx_n_s__dtype), __pyx_v_vb_dtype) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 451; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyEval_CallObjectWithKeywords(__pyx_t_1, __pyx_t_11, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 451; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_v_VB);
+    __pyx_v_VB = __pyx_t_4;
+    __pyx_t_4 = 0;
+    goto __pyx_L10;
+  }
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":452
+ *         dims[axis] = p2
+ *         VB = np.zeros(dims, dtype=vb_dtype)
+ *     elif vb_storage == 'packed':             # <<<<<<<<<<<<<<
+ *         dims[axis] = p*(p+1)/2
+ *         VB = np.zeros(dims, dtype=vb_dtype)
+ */
+  __pyx_t_4 = PyObject_RichCompare(__pyx_v_vb_storage, ((PyObject *)__pyx_n_s__packed), Py_EQ); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 452; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 452; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_7) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":453
+ *         VB = np.zeros(dims, dtype=vb_dtype)
+ *     elif vb_storage == 'packed':
+ *         dims[axis] = p*(p+1)/2             # <<<<<<<<<<<<<<
+ *         VB = np.zeros(dims, dtype=vb_dtype)
+ *     dims[axis] = 1
+ */
+    __pyx_t_4 = __Pyx_PyInt_FromSize_t(((__pyx_v_p * (__pyx_v_p + 1)) / 2)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_t_4, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":454
+ *     elif vb_storage == 'packed':
+ *         dims[axis] = p*(p+1)/2
+ *         VB = np.zeros(dims, dtype=vb_dtype)             # <<<<<<<<<<<<<<
+ *     dims[axis] = 1
+ *     S2 = np.zeros(dims, dtype=np.double)
+ */
+    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 454; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__zeros); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 454; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 454; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_dims);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_dims);
+    __Pyx_GIVEREF(__pyx_v_dims);
+    __pyx_t_11 = PyDict_New(); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 454; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_11));
+    if (PyDict_SetItem(__pyx_t_11, ((PyObject *)__pyx_n_s__dtype), __pyx_v_vb_dtype) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 454; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyEval_CallObjectWithKeywords(__pyx_t_3, __pyx_t_4, ((PyObject *)__pyx_t_11)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 454; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_11)); __pyx_t_11 = 0;
+    __Pyx_DECREF(__pyx_v_VB);
+    __pyx_v_VB = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L10;
+  }
+  __pyx_L10:;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":455
+ *         dims[axis] = p*(p+1)/2
+ *         VB = np.zeros(dims, dtype=vb_dtype)
+ *     dims[axis] = 1             # <<<<<<<<<<<<<<
+ *     S2 = np.zeros(dims, dtype=np.double)
+ *     A = np.zeros(dims, dtype=np.double)
+ */
+  if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_int_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":456
+ *         VB = np.zeros(dims, dtype=vb_dtype)
+ *     dims[axis] = 1
+ *     S2 = np.zeros(dims, dtype=np.double)             # <<<<<<<<<<<<<<
+ *     A = np.zeros(dims, dtype=np.double)
+ * 
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_11 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_dims);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_dims);
+  __Pyx_GIVEREF(__pyx_v_dims);
+  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_9 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__double); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_4, ((PyObject *)__pyx_n_s__dtype), __pyx_t_9) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = PyEval_CallObjectWithKeywords(__pyx_t_11, __pyx_t_1, ((PyObject *)__pyx_t_4)); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_v_S2);
+  __pyx_v_S2 = __pyx_t_9;
+  __pyx_t_9 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":457
+ *     dims[axis] = 1
+ *     S2 = np.zeros(dims, dtype=np.double)
+ *     A = np.zeros(dims, dtype=np.double)             # <<<<<<<<<<<<<<
+ * 
+ *     # Contrast variances as dot products with flat variance matrix
+ */
+  __pyx_t_9 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 457; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_9, __pyx_n_s__zeros); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 457; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 457; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_INCREF(__pyx_v_dims);
+  PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_v_dims);
+  __Pyx_GIVEREF(__pyx_v_dims);
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 457; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __pyx_t_11 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 457; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_11, __pyx_n_s__double); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 457; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__dtype), __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 457; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyEval_CallObjectWithKeywords(__pyx_t_4, __pyx_t_9, ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 457; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_v_A);
+  __pyx_v_A = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":460
+ * 
+ *     # Contrast variances as dot products with flat variance matrix
+ *     CV = None             # <<<<<<<<<<<<<<
+ *     W = None
+ *     if not contrasts is None:
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_DECREF(__pyx_v_CV);
+  __pyx_v_CV = Py_None;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":461
+ *     # Contrast variances as dot products with flat variance matrix
+ *     CV = None
+ *     W = None             # <<<<<<<<<<<<<<
+ *     if not contrasts is None:
+ *         cons = [np.atleast_2d(np.asarray(c, dtype=np.double))
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_DECREF(__pyx_v_W);
+  __pyx_v_W = Py_None;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":462
+ *     CV = None
+ *     W = None
+ *     if not contrasts is None:             # <<<<<<<<<<<<<<
+ *         cons = [np.atleast_2d(np.asarray(c, dtype=np.double))
+ *                 for c in contrasts]
+ */
+  __pyx_t_7 = (__pyx_v_contrasts == Py_None);
+  __pyx_t_8 = (!__pyx_t_7);
+  if (__pyx_t_8) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":463
+ *     W = None
+ *     if not contrasts is None:
+ *         cons = [np.atleast_2d(np.asarray(c, dtype=np.double))             # <<<<<<<<<<<<<<
+ *                 for c in contrasts]
+ *         W = [np.outer(ca, cb).ravel() for c in cons for ca in c for cb in c]
+ */
+    __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":464
+ *     if not contrasts is None:
+ *         cons = [np.atleast_2d(np.asarray(c, dtype=np.double))
+ *                 for c in contrasts]             # <<<<<<<<<<<<<<
+ *         W = [np.outer(ca, cb).ravel() for c in cons for ca in c for cb in c]
+ *         W = np.array(W, dtype=np.double).reshape((-1, p2))
+ */
+    if (PyList_CheckExact(__pyx_v_contrasts) || PyTuple_CheckExact(__pyx_v_contrasts)) {
+      __pyx_t_2 = 0; __pyx_t_1 = __pyx_v_contrasts; __Pyx_INCREF(__pyx_t_1);
+    } else {
+      __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_contrasts); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 464; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    for (;;) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        __pyx_t_9 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_9); __pyx_t_2++;
+      } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_9); __pyx_t_2++;
+      } else {
+        __pyx_t_9 = PyIter_Next(__pyx_t_1);
+        if (!__pyx_t_9) {
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 464; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_9);
+      }
+      __Pyx_DECREF(__pyx_v_c);
+      __pyx_v_c = __pyx_t_9;
+      __pyx_t_9 = 0;
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":463
+ *     W = None
+ *     if not contrasts is None:
+ *         cons = [np.atleast_2d(np.asarray(c, dtype=np.double))             # <<<<<<<<<<<<<<
+ *                 for c in contrasts]
+ *         W = [np.outer(ca, cb).ravel() for c in cons for ca in c for cb in c]
+ */
+      __pyx_t_9 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_4 = PyObject_GetAttr(__pyx_t_9, __pyx_n_s__atleast_2d); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_11 = PyObject_GetAttr(__pyx_t_9, __pyx_n_s__asarray); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_INCREF(__pyx_v_c);
+      PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_v_c);
+      __Pyx_GIVEREF(__pyx_v_c);
+      __pyx_t_12 = PyDict_New(); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_12));
+      __pyx_t_13 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_14 = PyObject_GetAttr(__pyx_t_13, __pyx_n_s__double); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      if (PyDict_SetItem(__pyx_t_12, ((PyObject *)__pyx_n_s__dtype), __pyx_t_14) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __pyx_t_14 = PyEval_CallObjectWithKeywords(__pyx_t_11, __pyx_t_9, ((PyObject *)__pyx_t_12)); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(((PyObject *)__pyx_t_12)); __pyx_t_12 = 0;
+      __pyx_t_12 = PyTuple_New(1); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_12);
+      PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_14);
+      __Pyx_GIVEREF(__pyx_t_14);
+      __pyx_t_14 = 0;
+      __pyx_t_14 = PyObject_Call(__pyx_t_4, __pyx_t_12, NULL); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      __pyx_t_6 = PyList_Append(__pyx_t_3, (PyObject*)__pyx_t_14); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(((PyObject *)__pyx_t_3));
+    __Pyx_DECREF(__pyx_v_cons);
+    __pyx_v_cons = ((PyObject *)__pyx_t_3);
+    __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":465
+ *         cons = [np.atleast_2d(np.asarray(c, dtype=np.double))
+ *                 for c in contrasts]
+ *         W = [np.outer(ca, cb).ravel() for c in cons for ca in c for cb in c]             # <<<<<<<<<<<<<<
+ *         W = np.array(W, dtype=np.double).reshape((-1, p2))
+ *         dims[axis] = W.shape[0]
+ */
+    __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+    if (PyList_CheckExact(__pyx_v_cons) || PyTuple_CheckExact(__pyx_v_cons)) {
+      __pyx_t_2 = 0; __pyx_t_1 = __pyx_v_cons; __Pyx_INCREF(__pyx_t_1);
+    } else {
+      __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_cons); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    for (;;) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        __pyx_t_14 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_14); __pyx_t_2++;
+      } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        __pyx_t_14 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_14); __pyx_t_2++;
+      } else {
+        __pyx_t_14 = PyIter_Next(__pyx_t_1);
+        if (!__pyx_t_14) {
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_14);
+      }
+      __Pyx_DECREF(__pyx_v_c);
+      __pyx_v_c = __pyx_t_14;
+      __pyx_t_14 = 0;
+      if (PyList_CheckExact(__pyx_v_c) || PyTuple_CheckExact(__pyx_v_c)) {
+        __pyx_t_5 = 0; __pyx_t_14 = __pyx_v_c; __Pyx_INCREF(__pyx_t_14);
+      } else {
+        __pyx_t_5 = -1; __pyx_t_14 = PyObject_GetIter(__pyx_v_c); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_14);
+      }
+      for (;;) {
+        if (likely(PyList_CheckExact(__pyx_t_14))) {
+          if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_14)) break;
+          __pyx_t_12 = PyList_GET_ITEM(__pyx_t_14, __pyx_t_5); __Pyx_INCREF(__pyx_t_12); __pyx_t_5++;
+        } else if (likely(PyTuple_CheckExact(__pyx_t_14))) {
+          if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_14)) break;
+          __pyx_t_12 = PyTuple_GET_ITEM(__pyx_t_14, __pyx_t_5); __Pyx_INCREF(__pyx_t_12); __pyx_t_5++;
+        } else {
+          __pyx_t_12 = PyIter_Next(__pyx_t_14);
+          if (!__pyx_t_12) {
+            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_12);
+        }
+        __Pyx_DECREF(__pyx_v_ca);
+        __pyx_v_ca = __pyx_t_12;
+        __pyx_t_12 = 0;
+        if (PyList_CheckExact(__pyx_v_c) || PyTuple_CheckExact(__pyx_v_c)) {
+          __pyx_t_15 = 0; __pyx_t_12 = __pyx_v_c; __Pyx_INCREF(__pyx_t_12);
+        } else {
+          __pyx_t_15 = -1; __pyx_t_12 = PyObject_GetIter(__pyx_v_c); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_12);
+        }
+        for (;;) {
+          if (likely(PyList_CheckExact(__pyx_t_12))) {
+            if (__pyx_t_15 >= PyList_GET_SIZE(__pyx_t_12)) break;
+            __pyx_t_4 = PyList_GET_ITEM(__pyx_t_12, __pyx_t_15); __Pyx_INCREF(__pyx_t_4); __pyx_t_15++;
+          } else if (likely(PyTuple_CheckExact(__pyx_t_12))) {
+            if (__pyx_t_15 >= PyTuple_GET_SIZE(__pyx_t_12)) break;
+            __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_12, __pyx_t_15); __Pyx_INCREF(__pyx_t_4); __pyx_t_15++;
+          } else {
+            __pyx_t_4 = PyIter_Next(__pyx_t_12);
+            if (!__pyx_t_4) {
+              if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+              break;
+            }
+            __Pyx_GOTREF(__pyx_t_4);
+          }
+          __Pyx_DECREF(__pyx_v_cb);
+          __pyx_v_cb = __pyx_t_4;
+          __pyx_t_4 = 0;
+          __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_9 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__outer); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_INCREF(__pyx_v_ca);
+          PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_ca);
+          __Pyx_GIVEREF(__pyx_v_ca);
+          __Pyx_INCREF(__pyx_v_cb);
+          PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_cb);
+          __Pyx_GIVEREF(__pyx_v_cb);
+          __pyx_t_11 = PyObject_Call(__pyx_t_9, __pyx_t_4, NULL); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_11);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __pyx_t_4 = PyObject_GetAttr(__pyx_t_11, __pyx_n_s__ravel); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          __pyx_t_11 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_GOTREF(__pyx_t_11);
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __pyx_t_6 = PyList_Append(__pyx_t_3, (PyObject*)__pyx_t_11); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 465; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(((PyObject *)__pyx_t_3));
+    __Pyx_DECREF(__pyx_v_W);
+    __pyx_v_W = ((PyObject *)__pyx_t_3);
+    __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":466
+ *                 for c in contrasts]
+ *         W = [np.outer(ca, cb).ravel() for c in cons for ca in c for cb in c]
+ *         W = np.array(W, dtype=np.double).reshape((-1, p2))             # <<<<<<<<<<<<<<
+ *         dims[axis] = W.shape[0]
+ *         CV = np.zeros(dims, dtype=np.double)
+ */
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__array); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v_W);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_W);
+    __Pyx_GIVEREF(__pyx_v_W);
+    __pyx_t_14 = PyDict_New(); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_14));
+    __pyx_t_12 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_12);
+    __pyx_t_11 = PyObject_GetAttr(__pyx_t_12, __pyx_n_s__double); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    if (PyDict_SetItem(__pyx_t_14, ((PyObject *)__pyx_n_s__dtype), __pyx_t_11) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __pyx_t_11 = PyEval_CallObjectWithKeywords(__pyx_t_1, __pyx_t_3, ((PyObject *)__pyx_t_14)); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_14)); __pyx_t_14 = 0;
+    __pyx_t_14 = PyObject_GetAttr(__pyx_t_11, __pyx_n_s__reshape); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __pyx_t_11 = __Pyx_PyInt_FromSize_t(__pyx_v_p2); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_int_neg_1);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_int_neg_1);
+    __Pyx_GIVEREF(__pyx_int_neg_1);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_11);
+    __Pyx_GIVEREF(__pyx_t_11);
+    __pyx_t_11 = 0;
+    __pyx_t_11 = PyTuple_New(1); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_11);
+    PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    __pyx_t_3 = 0;
+    __pyx_t_3 = PyObject_Call(__pyx_t_14, __pyx_t_11, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_DECREF(__pyx_v_W);
+    __pyx_v_W = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":467
+ *         W = [np.outer(ca, cb).ravel() for c in cons for ca in c for cb in c]
+ *         W = np.array(W, dtype=np.double).reshape((-1, p2))
+ *         dims[axis] = W.shape[0]             # <<<<<<<<<<<<<<
+ *         CV = np.zeros(dims, dtype=np.double)
+ *         dims[axis] = 1
+ */
+    __pyx_t_3 = PyObject_GetAttr(__pyx_v_W, __pyx_n_s__shape); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 467; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_11 = __Pyx_GetItemInt(__pyx_t_3, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_11) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 467; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_t_11, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 467; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":468
+ *         W = np.array(W, dtype=np.double).reshape((-1, p2))
+ *         dims[axis] = W.shape[0]
+ *         CV = np.zeros(dims, dtype=np.double)             # <<<<<<<<<<<<<<
+ *         dims[axis] = 1
+ * 
+ */
+    __pyx_t_11 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_11, __pyx_n_s__zeros); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __pyx_t_11 = PyTuple_New(1); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_INCREF(__pyx_v_dims);
+    PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_v_dims);
+    __Pyx_GIVEREF(__pyx_v_dims);
+    __pyx_t_14 = PyDict_New(); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_14));
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_12 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__double); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (PyDict_SetItem(__pyx_t_14, ((PyObject *)__pyx_n_s__dtype), __pyx_t_12) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __pyx_t_12 = PyEval_CallObjectWithKeywords(__pyx_t_3, __pyx_t_11, ((PyObject *)__pyx_t_14)); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_14)); __pyx_t_14 = 0;
+    __Pyx_DECREF(__pyx_v_CV);
+    __pyx_v_CV = __pyx_t_12;
+    __pyx_t_12 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":469
+ *         dims[axis] = W.shape[0]
+ *         CV = np.zeros(dims, dtype=np.double)
+ *         dims[axis] = 1             # <<<<<<<<<<<<<<
+ * 
+ *     # Threaded fit, or storage needing range fit
+ */
+    if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_int_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 469; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L11;
+  }
+  __pyx_L11:;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":472
+ * 
+ *     # Threaded fit, or storage needing range fit
+ *     threaded = _use_threads(Y, axis, n_threads)             # <<<<<<<<<<<<<<
+ *     if threaded or vb_storage != 'full' or vb_dtype != np.double \
+ *             or not CV is None:
+ */
+  __pyx_t_12 = __Pyx_GetName(__pyx_m, __pyx_n_s___use_threads); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_14 = PyInt_FromLong(__pyx_v_axis); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_11 = PyTuple_New(3); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_INCREF(((PyObject *)__pyx_v_Y));
+  PyTuple_SET_ITEM(__pyx_t_11, 0, ((PyObject *)__pyx_v_Y));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_Y));
+  PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_14);
+  __Pyx_GIVEREF(__pyx_t_14);
+  __Pyx_INCREF(__pyx_v_n_threads);
+  PyTuple_SET_ITEM(__pyx_t_11, 2, __pyx_v_n_threads);
+  __Pyx_GIVEREF(__pyx_v_n_threads);
+  __pyx_t_14 = 0;
+  __pyx_t_14 = PyObject_Call(__pyx_t_12, __pyx_t_11, NULL); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __Pyx_DECREF(__pyx_v_threaded);
+  __pyx_v_threaded = __pyx_t_14;
+  __pyx_t_14 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":473
+ *     # Threaded fit, or storage needing range fit
+ *     threaded = _use_threads(Y, axis, n_threads)
+ *     if threaded or vb_storage != 'full' or vb_dtype != np.double \             # <<<<<<<<<<<<<<
+ *             or not CV is None:
+ *         if not threaded:
+ */
+  __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_v_threaded); if (unlikely(__pyx_t_8 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!__pyx_t_8) {
+    __pyx_t_14 = PyObject_RichCompare(__pyx_v_vb_storage, ((PyObject *)__pyx_n_s__full), Py_NE); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_14);
+    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_14); if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    if (!__pyx_t_7) {
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":474
+ *     threaded = _use_threads(Y, axis, n_threads)
+ *     if threaded or vb_storage != 'full' or vb_dtype != np.double \
+ *             or not CV is None:             # <<<<<<<<<<<<<<
+ *         if not threaded:
+ *             n_threads = 1
+ */
+      __pyx_t_14 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_14);
+      __pyx_t_11 = PyObject_GetAttr(__pyx_t_14, __pyx_n_s__double); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __pyx_t_14 = PyObject_RichCompare(__pyx_v_vb_dtype, __pyx_t_11, Py_NE); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_14); if (unlikely(__pyx_t_10 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      if (!__pyx_t_10) {
+        __pyx_t_16 = (__pyx_v_CV == Py_None);
+        __pyx_t_17 = (!__pyx_t_16);
+        __pyx_t_16 = __pyx_t_17;
+      } else {
+        __pyx_t_16 = __pyx_t_10;
+      }
+      __pyx_t_10 = __pyx_t_16;
+    } else {
+      __pyx_t_10 = __pyx_t_7;
+    }
+    __pyx_t_7 = __pyx_t_10;
+  } else {
+    __pyx_t_7 = __pyx_t_8;
+  }
+  if (__pyx_t_7) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":475
+ *     if threaded or vb_storage != 'full' or vb_dtype != np.double \
+ *             or not CV is None:
+ *         if not threaded:             # <<<<<<<<<<<<<<
+ *             n_threads = 1
+ *         fff_matrix_delete(x)
+ */
+    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_v_threaded); if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 475; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = (!__pyx_t_7);
+    if (__pyx_t_8) {
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":476
+ *             or not CV is None:
+ *         if not threaded:
+ *             n_threads = 1             # <<<<<<<<<<<<<<
+ *         fff_matrix_delete(x)
+ *         dof = _fit_threads(_ar1_range, _double_aligned(Y),
+ */
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_DECREF(__pyx_v_n_threads);
+      __pyx_v_n_threads = __pyx_int_1;
+      goto __pyx_L21;
+    }
+    __pyx_L21:;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":477
+ *         if not threaded:
+ *             n_threads = 1
+ *         fff_matrix_delete(x)             # <<<<<<<<<<<<<<
+ *         dof = _fit_threads(_ar1_range, _double_aligned(Y),
+ *                            (X, B, VB, S2, A, CV, W, niter, axis,
+ */
+    fff_matrix_delete(__pyx_v_x);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":478
+ *             n_threads = 1
+ *         fff_matrix_delete(x)
+ *         dof = _fit_threads(_ar1_range, _double_aligned(Y),             # <<<<<<<<<<<<<<
+ *                            (X, B, VB, S2, A, CV, W, niter, axis,
+ *                             vb_storages[vb_storage]),
+ */
+    __pyx_t_14 = __Pyx_GetName(__pyx_m, __pyx_n_s___fit_threads); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 478; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_14);
+    __pyx_t_11 = __Pyx_GetName(__pyx_m, __pyx_n_s___ar1_range); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 478; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_t_12 = __Pyx_GetName(__pyx_m, __pyx_n_s___double_aligned); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 478; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_12);
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 478; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)__pyx_v_Y));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_v_Y));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_Y));
+    __pyx_t_1 = PyObject_Call(__pyx_t_12, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 478; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":479
+ *         fff_matrix_delete(x)
+ *         dof = _fit_threads(_ar1_range, _double_aligned(Y),
+ *                            (X, B, VB, S2, A, CV, W, niter, axis,             # <<<<<<<<<<<<<<
+ *                             vb_storages[vb_storage]),
+ *                            axis, n_threads)
+ */
+    __pyx_t_3 = PyInt_FromLong(__pyx_v_niter); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_12 = PyInt_FromLong(__pyx_v_axis); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_12);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":480
+ *         dof = _fit_threads(_ar1_range, _double_aligned(Y),
+ *                            (X, B, VB, S2, A, CV, W, niter, axis,
+ *                             vb_storages[vb_storage]),             # <<<<<<<<<<<<<<
+ *                            axis, n_threads)
+ * 
+ */
+    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__vb_storages); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 480; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_9 = PyObject_GetItem(__pyx_t_4, __pyx_v_vb_storage); if (!__pyx_t_9) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 480; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyTuple_New(10); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(((PyObject *)__pyx_v_X));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_X));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_X));
+    __Pyx_INCREF(__pyx_v_B);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_B);
+    __Pyx_GIVEREF(__pyx_v_B);
+    __Pyx_INCREF(__pyx_v_VB);
+    PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_VB);
+    __Pyx_GIVEREF(__pyx_v_VB);
+    __Pyx_INCREF(__pyx_v_S2);
+    PyTuple_SET_ITEM(__pyx_t_4, 3, __pyx_v_S2);
+    __Pyx_GIVEREF(__pyx_v_S2);
+    __Pyx_INCREF(__pyx_v_A);
+    PyTuple_SET_ITEM(__pyx_t_4, 4, __pyx_v_A);
+    __Pyx_GIVEREF(__pyx_v_A);
+    __Pyx_INCREF(__pyx_v_CV);
+    PyTuple_SET_ITEM(__pyx_t_4, 5, __pyx_v_CV);
+    __Pyx_GIVEREF(__pyx_v_CV);
+    __Pyx_INCREF(__pyx_v_W);
+    PyTuple_SET_ITEM(__pyx_t_4, 6, __pyx_v_W);
+    __Pyx_GIVEREF(__pyx_v_W);
+    PyTuple_SET_ITEM(__pyx_t_4, 7, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_4, 8, __pyx_t_12);
+    __Pyx_GIVEREF(__pyx_t_12);
+    PyTuple_SET_ITEM(__pyx_t_4, 9, __pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_9);
+    __pyx_t_3 = 0;
+    __pyx_t_12 = 0;
+    __pyx_t_9 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":481
+ *                            (X, B, VB, S2, A, CV, W, niter, axis,
+ *                             vb_storages[vb_storage]),
+ *                            axis, n_threads)             # <<<<<<<<<<<<<<
+ * 
+ *     else:
+ */
+    __pyx_t_9 = PyInt_FromLong(__pyx_v_axis); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 481; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_12 = PyTuple_New(5); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 478; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_12);
+    PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_11);
+    __Pyx_GIVEREF(__pyx_t_11);
+    PyTuple_SET_ITEM(__pyx_t_12, 1, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_12, 2, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_12, 3, __pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_9);
+    __Pyx_INCREF(__pyx_v_n_threads);
+    PyTuple_SET_ITEM(__pyx_t_12, 4, __pyx_v_n_threads);
+    __Pyx_GIVEREF(__pyx_v_n_threads);
+    __pyx_t_11 = 0;
+    __pyx_t_1 = 0;
+    __pyx_t_4 = 0;
+    __pyx_t_9 = 0;
+    __pyx_t_9 = PyObject_Call(__pyx_t_14, __pyx_t_12, NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 478; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __pyx_t_18 = __pyx_PyFloat_AsDouble(__pyx_t_9); if (unlikely((__pyx_t_18 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 478; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_v_dof = __pyx_t_18;
+    goto __pyx_L20;
+  }
+  /*else*/ {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":485
+ *     else:
+ *         # Allocate local structure
+ *         rkfilt = fff_glm_RKF_new(p)             # <<<<<<<<<<<<<<
+ * 
+ *         # Create a new array iterator
+ */
+    __pyx_v_rkfilt = fff_glm_RKF_new(__pyx_v_p);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":488
+ * 
+ *         # Create a new array iterator
+ *         multi = fffpy_multi_iterator_new(5, axis, <void*>Y, <void*>B, <void*>VB, <void*>S2, <void*>A)             # <<<<<<<<<<<<<<
+ * 
+ *         # Create views
+ */
+    __pyx_v_multi = fffpy_multi_iterator_new(5, __pyx_v_axis, ((void *)__pyx_v_Y), ((void *)__pyx_v_B), ((void *)__pyx_v_VB), ((void *)__pyx_v_S2), ((void *)__pyx_v_A));
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":491
+ * 
+ *         # Create views
+ *         y = multi.vector[0]             # <<<<<<<<<<<<<<
+ *         b = multi.vector[1]
+ *         vb = multi.vector[2]
+ */
+    __pyx_v_y = (__pyx_v_multi->vector[0]);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":492
+ *         # Create views
+ *         y = multi.vector[0]
+ *         b = multi.vector[1]             # <<<<<<<<<<<<<<
+ *         vb = multi.vector[2]
+ *         s2 = multi.vector[3]
+ */
+    __pyx_v_b = (__pyx_v_multi->vector[1]);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":493
+ *         y = multi.vector[0]
+ *         b = multi.vector[1]
+ *         vb = multi.vector[2]             # <<<<<<<<<<<<<<
+ *         s2 = multi.vector[3]
+ *         a = multi.vector[4]
+ */
+    __pyx_v_vb = (__pyx_v_multi->vector[2]);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":494
+ *         b = multi.vector[1]
+ *         vb = multi.vector[2]
+ *         s2 = multi.vector[3]             # <<<<<<<<<<<<<<
+ *         a = multi.vector[4]
+ * 
+ */
+    __pyx_v_s2 = (__pyx_v_multi->vector[3]);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":495
+ *         vb = multi.vector[2]
+ *         s2 = multi.vector[3]
+ *         a = multi.vector[4]             # <<<<<<<<<<<<<<
+ * 
+ *         # Loop
+ */
+    __pyx_v_a = (__pyx_v_multi->vector[4]);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":498
+ * 
+ *         # Loop
+ *         while(multi.index < multi.size):             # <<<<<<<<<<<<<<
+ *             fff_glm_RKF_fit(rkfilt, niter, y, x)
+ *             fff_vector_memcpy(b, rkfilt.b)
+ */
+    while (1) {
+      __pyx_t_8 = (__pyx_v_multi->index < __pyx_v_multi->size);
+      if (!__pyx_t_8) break;
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":499
+ *         # Loop
+ *         while(multi.index < multi.size):
+ *             fff_glm_RKF_fit(rkfilt, niter, y, x)             # <<<<<<<<<<<<<<
+ *             fff_vector_memcpy(b, rkfilt.b)
+ *             Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction
+ */
+      fff_glm_RKF_fit(__pyx_v_rkfilt, __pyx_v_niter, __pyx_v_y, __pyx_v_x);
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":500
+ *         while(multi.index < multi.size):
+ *             fff_glm_RKF_fit(rkfilt, niter, y, x)
+ *             fff_vector_memcpy(b, rkfilt.b)             # <<<<<<<<<<<<<<
+ *             Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction
+ *             fff_vector_memcpy(vb, &Vb_flat)
+ */
+      fff_vector_memcpy(__pyx_v_b, __pyx_v_rkfilt->b);
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":501
+ *             fff_glm_RKF_fit(rkfilt, niter, y, x)
+ *             fff_vector_memcpy(b, rkfilt.b)
+ *             Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction             # <<<<<<<<<<<<<<
+ *             fff_vector_memcpy(vb, &Vb_flat)
+ *             s2.data[0] = rkfilt.s2
+ */
+      __pyx_v_Vb_flat = fff_vector_view(__pyx_v_rkfilt->Vb->data, __pyx_v_p2, 1);
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":502
+ *             fff_vector_memcpy(b, rkfilt.b)
+ *             Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction
+ *             fff_vector_memcpy(vb, &Vb_flat)             # <<<<<<<<<<<<<<
+ *             s2.data[0] = rkfilt.s2
+ *             a.data[0] = rkfilt.a
+ */
+      fff_vector_memcpy(__pyx_v_vb, (&__pyx_v_Vb_flat));
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":503
+ *             Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction
+ *             fff_vector_memcpy(vb, &Vb_flat)
+ *             s2.data[0] = rkfilt.s2             # <<<<<<<<<<<<<<
+ *             a.data[0] = rkfilt.a
+ *             fffpy_multi_iterator_update(multi)
+ */
+      (__pyx_v_s2->data[0]) = __pyx_v_rkfilt->s2;
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":504
+ *             fff_vector_memcpy(vb, &Vb_flat)
+ *             s2.data[0] = rkfilt.s2
+ *             a.data[0] = rkfilt.a             # <<<<<<<<<<<<<<
+ *             fffpy_multi_iterator_update(multi)
+ * 
+ */
+      (__pyx_v_a->data[0]) = __pyx_v_rkfilt->a;
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":505
+ *             s2.data[0] = rkfilt.s2
+ *             a.data[0] = rkfilt.a
+ *             fffpy_multi_iterator_update(multi)             # <<<<<<<<<<<<<<
+ * 
+ *         # Dof
+ */
+      fffpy_multi_iterator_update(__pyx_v_multi);
+    }
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":508
+ * 
+ *         # Dof
+ *         dof = rkfilt.dof             # <<<<<<<<<<<<<<
+ * 
+ *         # Free memory
+ */
+    __pyx_v_dof = __pyx_v_rkfilt->dof;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":511
+ * 
+ *         # Free memory
+ *         fff_matrix_delete(x)             # <<<<<<<<<<<<<<
+ *         fff_glm_RKF_delete(rkfilt)
+ *         fffpy_multi_iterator_delete(multi)
+ */
+    fff_matrix_delete(__pyx_v_x);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":512
+ *         # Free memory
+ *         fff_matrix_delete(x)
+ *         fff_glm_RKF_delete(rkfilt)             # <<<<<<<<<<<<<<
+ *         fffpy_multi_iterator_delete(multi)
+ * 
+ */
+    fff_glm_RKF_delete(__pyx_v_rkfilt);
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":513
+ *         fff_matrix_delete(x)
+ *         fff_glm_RKF_delete(rkfilt)
+ *         fffpy_multi_iterator_delete(multi)             # <<<<<<<<<<<<<<
+ * 
+ *     # Reshape variance array
+ */
+    fffpy_multi_iterator_delete(__pyx_v_multi);
+  }
+  __pyx_L20:;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":516
+ * 
+ *     # Reshape variance array
+ *     if vb_storage == 'full':             # <<<<<<<<<<<<<<
+ *         dims[axis] = p
+ *         dims.insert(axis+1, p)
+ */
+  __pyx_t_9 = PyObject_RichCompare(__pyx_v_vb_storage, ((PyObject *)__pyx_n_s__full), Py_EQ); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 516; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely(__pyx_t_8 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 516; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  if (__pyx_t_8) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":517
+ *     # Reshape variance array
+ *     if vb_storage == 'full':
+ *         dims[axis] = p             # <<<<<<<<<<<<<<
+ *         dims.insert(axis+1, p)
+ *         VB = VB.reshape(dims)
+ */
+    __pyx_t_9 = __Pyx_PyInt_FromSize_t(__pyx_v_p); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_t_9, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":518
+ *     if vb_storage == 'full':
+ *         dims[axis] = p
+ *         dims.insert(axis+1, p)             # <<<<<<<<<<<<<<
+ *         VB = VB.reshape(dims)
+ *         dims[axis] = 1
+ */
+    __pyx_t_9 = PyObject_GetAttr(__pyx_v_dims, __pyx_n_s__insert); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 518; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_12 = PyInt_FromLong((__pyx_v_axis + 1)); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 518; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_12);
+    __pyx_t_14 = __Pyx_PyInt_FromSize_t(__pyx_v_p); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 518; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_14);
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 518; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_12);
+    __Pyx_GIVEREF(__pyx_t_12);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_14);
+    __Pyx_GIVEREF(__pyx_t_14);
+    __pyx_t_12 = 0;
+    __pyx_t_14 = 0;
+    __pyx_t_14 = PyObject_Call(__pyx_t_9, __pyx_t_4, NULL); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 518; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":519
+ *         dims[axis] = p
+ *         dims.insert(axis+1, p)
+ *         VB = VB.reshape(dims)             # <<<<<<<<<<<<<<
+ *         dims[axis] = 1
+ *         del dims[axis+1]
+ */
+    __pyx_t_14 = PyObject_GetAttr(__pyx_v_VB, __pyx_n_s__reshape); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 519; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_14);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 519; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_dims);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_dims);
+    __Pyx_GIVEREF(__pyx_v_dims);
+    __pyx_t_9 = PyObject_Call(__pyx_t_14, __pyx_t_4, NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 519; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_v_VB);
+    __pyx_v_VB = __pyx_t_9;
+    __pyx_t_9 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":520
+ *         dims.insert(axis+1, p)
+ *         VB = VB.reshape(dims)
+ *         dims[axis] = 1             # <<<<<<<<<<<<<<
+ *         del dims[axis+1]
+ * 
+ */
+    if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_int_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 520; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":521
+ *         VB = VB.reshape(dims)
+ *         dims[axis] = 1
+ *         del dims[axis+1]             # <<<<<<<<<<<<<<
  * 
  *     # Return
  */
-  __pyx_t_4 = PyObject_GetAttr(__pyx_v_VB, __pyx_n_s__reshape); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_INCREF(__pyx_v_dims);
-  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_dims);
-  __Pyx_GIVEREF(__pyx_v_dims);
-  __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_8, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __Pyx_DECREF(__pyx_v_VB);
-  __pyx_v_VB = __pyx_t_3;
-  __pyx_t_3 = 0;
+    __pyx_t_19 = (__pyx_v_axis + 1);
+    if (__Pyx_DelItemInt(__pyx_v_dims, __pyx_t_19, sizeof(long), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 521; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L24;
+  }
+  __pyx_L24:;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":230
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":524
  * 
  *     # Return
- *     return B, VB, S2, dof, A             # <<<<<<<<<<<<<<
+ *     if CV is None:             # <<<<<<<<<<<<<<
+ *         return B, VB, S2, dof, A
+ *     CVs = []
+ */
+  __pyx_t_8 = (__pyx_v_CV == Py_None);
+  if (__pyx_t_8) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":525
+ *     # Return
+ *     if CV is None:
+ *         return B, VB, S2, dof, A             # <<<<<<<<<<<<<<
+ *     CVs = []
+ *     start = 0
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_9 = PyFloat_FromDouble(__pyx_v_dof); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 525; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_4 = PyTuple_New(5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 525; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_B);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_B);
+    __Pyx_GIVEREF(__pyx_v_B);
+    __Pyx_INCREF(__pyx_v_VB);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_VB);
+    __Pyx_GIVEREF(__pyx_v_VB);
+    __Pyx_INCREF(__pyx_v_S2);
+    PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_S2);
+    __Pyx_GIVEREF(__pyx_v_S2);
+    PyTuple_SET_ITEM(__pyx_t_4, 3, __pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_9);
+    __Pyx_INCREF(__pyx_v_A);
+    PyTuple_SET_ITEM(__pyx_t_4, 4, __pyx_v_A);
+    __Pyx_GIVEREF(__pyx_v_A);
+    __pyx_t_9 = 0;
+    __pyx_r = __pyx_t_4;
+    __pyx_t_4 = 0;
+    goto __pyx_L0;
+    goto __pyx_L25;
+  }
+  __pyx_L25:;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":526
+ *     if CV is None:
+ *         return B, VB, S2, dof, A
+ *     CVs = []             # <<<<<<<<<<<<<<
+ *     start = 0
+ *     for c in cons:
+ */
+  __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+  __Pyx_DECREF(__pyx_v_CVs);
+  __pyx_v_CVs = ((PyObject *)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":527
+ *         return B, VB, S2, dof, A
+ *     CVs = []
+ *     start = 0             # <<<<<<<<<<<<<<
+ *     for c in cons:
+ *         q = c.shape[0]
+ */
+  __Pyx_INCREF(__pyx_int_0);
+  __Pyx_DECREF(__pyx_v_start);
+  __pyx_v_start = __pyx_int_0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":528
+ *     CVs = []
+ *     start = 0
+ *     for c in cons:             # <<<<<<<<<<<<<<
+ *         q = c.shape[0]
+ *         cv = CV[(slice(None),) * axis + (slice(start, start + q*q),)]
+ */
+  if (PyList_CheckExact(__pyx_v_cons) || PyTuple_CheckExact(__pyx_v_cons)) {
+    __pyx_t_2 = 0; __pyx_t_4 = __pyx_v_cons; __Pyx_INCREF(__pyx_t_4);
+  } else {
+    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_cons); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 528; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+  }
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_4))) {
+      if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_4)) break;
+      __pyx_t_9 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_9); __pyx_t_2++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
+      if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+      __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_9); __pyx_t_2++;
+    } else {
+      __pyx_t_9 = PyIter_Next(__pyx_t_4);
+      if (!__pyx_t_9) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 528; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_9);
+    }
+    __Pyx_DECREF(__pyx_v_c);
+    __pyx_v_c = __pyx_t_9;
+    __pyx_t_9 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":529
+ *     start = 0
+ *     for c in cons:
+ *         q = c.shape[0]             # <<<<<<<<<<<<<<
+ *         cv = CV[(slice(None),) * axis + (slice(start, start + q*q),)]
+ *         if q > 1:
+ */
+    __pyx_t_9 = PyObject_GetAttr(__pyx_v_c, __pyx_n_s__shape); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 529; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_9, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_14) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 529; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_v_q);
+    __pyx_v_q = __pyx_t_14;
+    __pyx_t_14 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":530
+ *     for c in cons:
+ *         q = c.shape[0]
+ *         cv = CV[(slice(None),) * axis + (slice(start, start + q*q),)]             # <<<<<<<<<<<<<<
+ *         if q > 1:
+ *             dims[axis] = q
+ */
+    __pyx_t_14 = PyTuple_New(1); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_INCREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_14, 0, Py_None);
+    __Pyx_GIVEREF(Py_None);
+    __pyx_t_9 = PyObject_Call(((PyObject *)((PyObject*)&PySlice_Type)), __pyx_t_14, NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    __pyx_t_14 = PyTuple_New(1); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_14);
+    PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_9);
+    __pyx_t_9 = 0;
+    __pyx_t_9 = PyInt_FromLong(__pyx_v_axis); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_12 = PyNumber_Multiply(__pyx_t_14, __pyx_t_9); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = PyNumber_Multiply(__pyx_v_q, __pyx_v_q); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_14 = PyNumber_Add(__pyx_v_start, __pyx_t_9); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_INCREF(__pyx_v_start);
+    PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_v_start);
+    __Pyx_GIVEREF(__pyx_v_start);
+    PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_t_14);
+    __Pyx_GIVEREF(__pyx_t_14);
+    __pyx_t_14 = 0;
+    __pyx_t_14 = PyObject_Call(((PyObject *)((PyObject*)&PySlice_Type)), __pyx_t_9, NULL); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_14);
+    __Pyx_GIVEREF(__pyx_t_14);
+    __pyx_t_14 = 0;
+    __pyx_t_14 = PyNumber_Add(__pyx_t_12, __pyx_t_9); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = PyObject_GetItem(__pyx_v_CV, __pyx_t_14); if (!__pyx_t_9) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    __Pyx_DECREF(__pyx_v_cv);
+    __pyx_v_cv = __pyx_t_9;
+    __pyx_t_9 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":531
+ *         q = c.shape[0]
+ *         cv = CV[(slice(None),) * axis + (slice(start, start + q*q),)]
+ *         if q > 1:             # <<<<<<<<<<<<<<
+ *             dims[axis] = q
+ *             dims.insert(axis+1, q)
+ */
+    __pyx_t_9 = PyObject_RichCompare(__pyx_v_q, __pyx_int_1, Py_GT); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely(__pyx_t_8 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (__pyx_t_8) {
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":532
+ *         cv = CV[(slice(None),) * axis + (slice(start, start + q*q),)]
+ *         if q > 1:
+ *             dims[axis] = q             # <<<<<<<<<<<<<<
+ *             dims.insert(axis+1, q)
+ *             cv = cv.reshape(dims)
+ */
+      if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_v_q, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 532; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":533
+ *         if q > 1:
+ *             dims[axis] = q
+ *             dims.insert(axis+1, q)             # <<<<<<<<<<<<<<
+ *             cv = cv.reshape(dims)
+ *             dims[axis] = 1
+ */
+      __pyx_t_9 = PyObject_GetAttr(__pyx_v_dims, __pyx_n_s__insert); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 533; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_14 = PyInt_FromLong((__pyx_v_axis + 1)); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 533; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_14);
+      __pyx_t_12 = PyTuple_New(2); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 533; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_12);
+      PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_14);
+      __Pyx_GIVEREF(__pyx_t_14);
+      __Pyx_INCREF(__pyx_v_q);
+      PyTuple_SET_ITEM(__pyx_t_12, 1, __pyx_v_q);
+      __Pyx_GIVEREF(__pyx_v_q);
+      __pyx_t_14 = 0;
+      __pyx_t_14 = PyObject_Call(__pyx_t_9, __pyx_t_12, NULL); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 533; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":534
+ *             dims[axis] = q
+ *             dims.insert(axis+1, q)
+ *             cv = cv.reshape(dims)             # <<<<<<<<<<<<<<
+ *             dims[axis] = 1
+ *             del dims[axis+1]
+ */
+      __pyx_t_14 = PyObject_GetAttr(__pyx_v_cv, __pyx_n_s__reshape); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_14);
+      __pyx_t_12 = PyTuple_New(1); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_12);
+      __Pyx_INCREF(__pyx_v_dims);
+      PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_v_dims);
+      __Pyx_GIVEREF(__pyx_v_dims);
+      __pyx_t_9 = PyObject_Call(__pyx_t_14, __pyx_t_12, NULL); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      __Pyx_DECREF(__pyx_v_cv);
+      __pyx_v_cv = __pyx_t_9;
+      __pyx_t_9 = 0;
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":535
+ *             dims.insert(axis+1, q)
+ *             cv = cv.reshape(dims)
+ *             dims[axis] = 1             # <<<<<<<<<<<<<<
+ *             del dims[axis+1]
+ *         CVs.append(cv)
+ */
+      if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_int_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+      /* "/root/package/nipy/neurospin/glm/kalman.pyx":536
+ *             cv = cv.reshape(dims)
+ *             dims[axis] = 1
+ *             del dims[axis+1]             # <<<<<<<<<<<<<<
+ *         CVs.append(cv)
+ *         start += q*q
+ */
+      __pyx_t_19 = (__pyx_v_axis + 1);
+      if (__Pyx_DelItemInt(__pyx_v_dims, __pyx_t_19, sizeof(long), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L28;
+    }
+    __pyx_L28:;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":537
+ *             dims[axis] = 1
+ *             del dims[axis+1]
+ *         CVs.append(cv)             # <<<<<<<<<<<<<<
+ *         start += q*q
+ *     return B, VB, S2, dof, A, CVs
+ */
+    __pyx_t_9 = __Pyx_PyObject_Append(__pyx_v_CVs, __pyx_v_cv); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":538
+ *             del dims[axis+1]
+ *         CVs.append(cv)
+ *         start += q*q             # <<<<<<<<<<<<<<
+ *     return B, VB, S2, dof, A, CVs
+ * 
+ */
+    __pyx_t_9 = PyNumber_Multiply(__pyx_v_q, __pyx_v_q); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 538; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_12 = PyNumber_InPlaceAdd(__pyx_v_start, __pyx_t_9); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 538; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_v_start);
+    __pyx_v_start = __pyx_t_12;
+    __pyx_t_12 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":539
+ *         CVs.append(cv)
+ *         start += q*q
+ *     return B, VB, S2, dof, A, CVs             # <<<<<<<<<<<<<<
  * 
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_dof); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_8 = PyTuple_New(5); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_dof); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 539; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_12 = PyTuple_New(6); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 539; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
   __Pyx_INCREF(__pyx_v_B);
-  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_B);
+  PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_v_B);
   __Pyx_GIVEREF(__pyx_v_B);
   __Pyx_INCREF(__pyx_v_VB);
-  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_VB);
+  PyTuple_SET_ITEM(__pyx_t_12, 1, __pyx_v_VB);
   __Pyx_GIVEREF(__pyx_v_VB);
   __Pyx_INCREF(__pyx_v_S2);
-  PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_v_S2);
+  PyTuple_SET_ITEM(__pyx_t_12, 2, __pyx_v_S2);
   __Pyx_GIVEREF(__pyx_v_S2);
-  PyTuple_SET_ITEM(__pyx_t_8, 3, __pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_12, 3, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
   __Pyx_INCREF(__pyx_v_A);
-  PyTuple_SET_ITEM(__pyx_t_8, 4, __pyx_v_A);
+  PyTuple_SET_ITEM(__pyx_t_12, 4, __pyx_v_A);
   __Pyx_GIVEREF(__pyx_v_A);
+  __Pyx_INCREF(__pyx_v_CVs);
+  PyTuple_SET_ITEM(__pyx_t_12, 5, __pyx_v_CVs);
+  __Pyx_GIVEREF(__pyx_v_CVs);
+  __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_12;
+  __pyx_t_12 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman.ar1");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_dims);
+  __Pyx_DECREF(__pyx_v_B);
+  __Pyx_DECREF(__pyx_v_VB);
+  __Pyx_DECREF(__pyx_v_S2);
+  __Pyx_DECREF(__pyx_v_A);
+  __Pyx_DECREF(__pyx_v_CV);
+  __Pyx_DECREF(__pyx_v_W);
+  __Pyx_DECREF(__pyx_v_cons);
+  __Pyx_DECREF(__pyx_v_threaded);
+  __Pyx_DECREF(__pyx_v_CVs);
+  __Pyx_DECREF(__pyx_v_start);
+  __Pyx_DECREF(__pyx_v_c);
+  __Pyx_DECREF(__pyx_v_q);
+  __Pyx_DECREF(__pyx_v_cv);
+  __Pyx_DECREF(__pyx_v_i);
+  __Pyx_DECREF(__pyx_v_ca);
+  __Pyx_DECREF(__pyx_v_cb);
+  __Pyx_DECREF((PyObject *)__pyx_v_Y);
+  __Pyx_DECREF((PyObject *)__pyx_v_X);
+  __Pyx_DECREF(__pyx_v_n_threads);
+  __Pyx_DECREF(__pyx_v_vb_storage);
+  __Pyx_DECREF(__pyx_v_vb_dtype);
+  __Pyx_DECREF(__pyx_v_contrasts);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/nipy/neurospin/glm/kalman.pyx":542
+ * 
+ * 
+ * def unpack(VB, int axis=0):             # <<<<<<<<<<<<<<
+ *     """
+ *     VB_full = unpack(VB, axis=0)
+ */
+
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman_unpack(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_3glm_6kalman_unpack[] = "\n    VB_full = unpack(VB, axis=0)\n\n    Unpack the p*(p+1)/2 upper triangle values at `axis` of `VB`, as\n    stored by ar1 with vb_storage='packed', to full symmetric p x p\n    matrices at `axis` and `axis`+1.\n    ";
+static PyObject *__pyx_pf_4nipy_9neurospin_3glm_6kalman_unpack(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_VB = 0;
+  int __pyx_v_axis;
+  PyObject *__pyx_v_n;
+  PyObject *__pyx_v_p;
+  PyObject *__pyx_v_i;
+  PyObject *__pyx_v_j;
+  PyObject *__pyx_v_full;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__VB,&__pyx_n_s__axis,0};
+  __Pyx_RefNannySetupContext("unpack");
+  __pyx_self = __pyx_self;
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[2] = {0,0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__VB);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__axis);
+        if (unlikely(value)) { values[1] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "unpack") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 542; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_VB = values[0];
+    if (values[1]) {
+      __pyx_v_axis = __Pyx_PyInt_AsInt(values[1]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 542; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_axis = ((int)0);
+    }
+  } else {
+    __pyx_v_axis = ((int)0);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 542; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  1: __pyx_v_VB = PyTuple_GET_ITEM(__pyx_args, 0);
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("unpack", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 542; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman.unpack");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF(__pyx_v_VB);
+  __pyx_v_n = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_p = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_j = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_full = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":550
+ *     matrices at `axis` and `axis`+1.
+ *     """
+ *     VB = np.asarray(VB)             # <<<<<<<<<<<<<<
+ *     n = VB.shape[axis]
+ *     p = int((np.sqrt(8*n + 1) - 1) / 2)
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 550; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__asarray); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 550; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 550; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_VB);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_VB);
+  __Pyx_GIVEREF(__pyx_v_VB);
+  __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 550; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_v_VB);
+  __pyx_v_VB = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":551
+ *     """
+ *     VB = np.asarray(VB)
+ *     n = VB.shape[axis]             # <<<<<<<<<<<<<<
+ *     p = int((np.sqrt(8*n + 1) - 1) / 2)
+ *     if p*(p+1)/2 != n:
+ */
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_VB, __pyx_n_s__shape); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 551; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_axis, sizeof(int), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 551; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_v_n);
+  __pyx_v_n = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":552
+ *     VB = np.asarray(VB)
+ *     n = VB.shape[axis]
+ *     p = int((np.sqrt(8*n + 1) - 1) / 2)             # <<<<<<<<<<<<<<
+ *     if p*(p+1)/2 != n:
+ *         raise ValueError('Axis length is not a triangular number')
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__sqrt); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyNumber_Multiply(__pyx_int_8, __pyx_v_n); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_int_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyNumber_Subtract(__pyx_t_2, __pyx_int_1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_t_1, __pyx_int_2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)&PyInt_Type)), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_v_p);
+  __pyx_v_p = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":553
+ *     n = VB.shape[axis]
+ *     p = int((np.sqrt(8*n + 1) - 1) / 2)
+ *     if p*(p+1)/2 != n:             # <<<<<<<<<<<<<<
+ *         raise ValueError('Axis length is not a triangular number')
+ *     VB = np.rollaxis(VB, axis, VB.ndim)
+ */
+  __pyx_t_2 = PyNumber_Add(__pyx_v_p, __pyx_int_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = PyNumber_Multiply(__pyx_v_p, __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_t_1, __pyx_int_2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_RichCompare(__pyx_t_2, __pyx_v_n, Py_NE); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_4) {
+
+    /* "/root/package/nipy/neurospin/glm/kalman.pyx":554
+ *     p = int((np.sqrt(8*n + 1) - 1) / 2)
+ *     if p*(p+1)/2 != n:
+ *         raise ValueError('Axis length is not a triangular number')             # <<<<<<<<<<<<<<
+ *     VB = np.rollaxis(VB, axis, VB.ndim)
+ *     i, j = np.triu_indices(p)
+ */
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
+    PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_kp_s_4));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
+    __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":555
+ *     if p*(p+1)/2 != n:
+ *         raise ValueError('Axis length is not a triangular number')
+ *     VB = np.rollaxis(VB, axis, VB.ndim)             # <<<<<<<<<<<<<<
+ *     i, j = np.triu_indices(p)
+ *     full = np.zeros(VB.shape[:-1] + (p, p), dtype=VB.dtype)
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__rollaxis); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyInt_FromLong(__pyx_v_axis); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_VB, __pyx_n_s__ndim); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_INCREF(__pyx_v_VB);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_VB);
+  __Pyx_GIVEREF(__pyx_v_VB);
+  PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_5, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_v_VB);
+  __pyx_v_VB = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":556
+ *         raise ValueError('Axis length is not a triangular number')
+ *     VB = np.rollaxis(VB, axis, VB.ndim)
+ *     i, j = np.triu_indices(p)             # <<<<<<<<<<<<<<
+ *     full = np.zeros(VB.shape[:-1] + (p, p), dtype=VB.dtype)
+ *     full[..., i, j] = VB
+ */
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__triu_indices); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_p);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_p);
+  __Pyx_GIVEREF(__pyx_v_p);
+  __pyx_t_1 = PyObject_Call(__pyx_t_5, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyTuple_CheckExact(__pyx_t_1) && likely(PyTuple_GET_SIZE(__pyx_t_1) == 2)) {
+    PyObject* tuple = __pyx_t_1;
+    __pyx_t_3 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_3);
+    __pyx_t_5 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_v_i);
+    __pyx_v_i = __pyx_t_3;
+    __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_v_j);
+    __pyx_v_j = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_3 = __Pyx_UnpackItem(__pyx_t_2, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = __Pyx_UnpackItem(__pyx_t_2, 1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__Pyx_EndUnpack(__pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_v_i);
+    __pyx_v_i = __pyx_t_3;
+    __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_v_j);
+    __pyx_v_j = __pyx_t_5;
+    __pyx_t_5 = 0;
+  }
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":557
+ *     VB = np.rollaxis(VB, axis, VB.ndim)
+ *     i, j = np.triu_indices(p)
+ *     full = np.zeros(VB.shape[:-1] + (p, p), dtype=VB.dtype)             # <<<<<<<<<<<<<<
+ *     full[..., i, j] = VB
+ *     full[..., j, i] = VB
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_VB, __pyx_n_s__shape); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PySequence_GetSlice(__pyx_t_1, 0, -1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_p);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_p);
+  __Pyx_GIVEREF(__pyx_v_p);
+  __Pyx_INCREF(__pyx_v_p);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_p);
+  __Pyx_GIVEREF(__pyx_v_p);
+  __pyx_t_2 = PyNumber_Add(__pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_VB, __pyx_n_s__dtype); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_2, ((PyObject *)__pyx_n_s__dtype), __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyEval_CallObjectWithKeywords(__pyx_t_5, __pyx_t_1, ((PyObject *)__pyx_t_2)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_v_full);
+  __pyx_v_full = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":558
+ *     i, j = np.triu_indices(p)
+ *     full = np.zeros(VB.shape[:-1] + (p, p), dtype=VB.dtype)
+ *     full[..., i, j] = VB             # <<<<<<<<<<<<<<
+ *     full[..., j, i] = VB
+ *     full = np.rollaxis(full, full.ndim - 2, axis)
+ */
+  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(Py_Ellipsis);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, Py_Ellipsis);
+  __Pyx_GIVEREF(Py_Ellipsis);
+  __Pyx_INCREF(__pyx_v_i);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_i);
+  __Pyx_GIVEREF(__pyx_v_i);
+  __Pyx_INCREF(__pyx_v_j);
+  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_j);
+  __Pyx_GIVEREF(__pyx_v_j);
+  if (PyObject_SetItem(__pyx_v_full, __pyx_t_3, __pyx_v_VB) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":559
+ *     full = np.zeros(VB.shape[:-1] + (p, p), dtype=VB.dtype)
+ *     full[..., i, j] = VB
+ *     full[..., j, i] = VB             # <<<<<<<<<<<<<<
+ *     full = np.rollaxis(full, full.ndim - 2, axis)
+ *     return np.rollaxis(full, full.ndim - 1, axis + 1)
+ */
+  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 559; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(Py_Ellipsis);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, Py_Ellipsis);
+  __Pyx_GIVEREF(Py_Ellipsis);
+  __Pyx_INCREF(__pyx_v_j);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_j);
+  __Pyx_GIVEREF(__pyx_v_j);
+  __Pyx_INCREF(__pyx_v_i);
+  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_i);
+  __Pyx_GIVEREF(__pyx_v_i);
+  if (PyObject_SetItem(__pyx_v_full, __pyx_t_3, __pyx_v_VB) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 559; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":560
+ *     full[..., i, j] = VB
+ *     full[..., j, i] = VB
+ *     full = np.rollaxis(full, full.ndim - 2, axis)             # <<<<<<<<<<<<<<
+ *     return np.rollaxis(full, full.ndim - 1, axis + 1)
+ * 
+ */
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__rollaxis); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_full, __pyx_n_s__ndim); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = PyNumber_Subtract(__pyx_t_3, __pyx_int_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyInt_FromLong(__pyx_v_axis); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_INCREF(__pyx_v_full);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_full);
+  __Pyx_GIVEREF(__pyx_v_full);
+  PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_1 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_v_full);
+  __pyx_v_full = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":561
+ *     full[..., j, i] = VB
+ *     full = np.rollaxis(full, full.ndim - 2, axis)
+ *     return np.rollaxis(full, full.ndim - 1, axis + 1)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__rollaxis); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_full, __pyx_n_s__ndim); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyNumber_Subtract(__pyx_t_3, __pyx_int_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyInt_FromLong((__pyx_v_axis + 1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_full);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_full);
+  __Pyx_GIVEREF(__pyx_v_full);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_Call(__pyx_t_5, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
-  __pyx_r = __pyx_t_8;
-  __pyx_t_8 = 0;
   goto __pyx_L0;
 
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("nipy.neurospin.glm.kalman.ar1");
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("nipy.neurospin.glm.kalman.unpack");
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_dims);
-  __Pyx_DECREF(__pyx_v_B);
-  __Pyx_DECREF(__pyx_v_VB);
-  __Pyx_DECREF(__pyx_v_S2);
-  __Pyx_DECREF(__pyx_v_A);
+  __Pyx_DECREF(__pyx_v_n);
+  __Pyx_DECREF(__pyx_v_p);
   __Pyx_DECREF(__pyx_v_i);
-  __Pyx_DECREF((PyObject *)__pyx_v_Y);
-  __Pyx_DECREF((PyObject *)__pyx_v_X);
+  __Pyx_DECREF(__pyx_v_j);
+  __Pyx_DECREF(__pyx_v_full);
+  __Pyx_DECREF(__pyx_v_VB);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":187
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":187
  *         # experimental exception made for __getbuffer__ and __releasebuffer__
  *         # -- the details of this may change.
  *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
@@ -1935,7 +6671,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __Pyx_GIVEREF(__pyx_v_info->obj);
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":193
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":193
  *             # of flags
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -1944,7 +6680,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_endian_detector = 1;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":194
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":194
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -1953,7 +6689,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":196
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":196
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
  * 
  *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
@@ -1962,7 +6698,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_ndim = PyArray_NDIM(((PyArrayObject *)__pyx_v_self));
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":198
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":198
  *             ndim = PyArray_NDIM(self)
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -1972,7 +6708,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_1 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":199
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":199
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 copy_shape = 1             # <<<<<<<<<<<<<<
@@ -1984,7 +6720,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":201
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":201
  *                 copy_shape = 1
  *             else:
  *                 copy_shape = 0             # <<<<<<<<<<<<<<
@@ -1995,7 +6731,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L5:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":203
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":203
  *                 copy_shape = 0
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -2005,7 +6741,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_1 = ((__pyx_v_flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS);
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":204
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":204
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -2019,7 +6755,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_t_3) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":205
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":205
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
@@ -2028,9 +6764,9 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_u_1));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_u_1));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_1));
+    __Pyx_INCREF(((PyObject *)__pyx_kp_u_5));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_u_5));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_5));
     __pyx_t_5 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -2041,7 +6777,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L6:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":207
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":207
  *                 raise ValueError(u"ndarray is not C contiguous")
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -2051,7 +6787,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_3 = ((__pyx_v_flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS);
   if (__pyx_t_3) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":208
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":208
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -2065,7 +6801,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_t_2) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":209
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":209
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
@@ -2074,9 +6810,9 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_u_2));
-    PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_u_2));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_2));
+    __Pyx_INCREF(((PyObject *)__pyx_kp_u_6));
+    PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_u_6));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_6));
     __pyx_t_4 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -2087,7 +6823,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L7:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":211
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":211
  *                 raise ValueError(u"ndarray is not Fortran contiguous")
  * 
  *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
@@ -2096,7 +6832,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->buf = PyArray_DATA(((PyArrayObject *)__pyx_v_self));
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":212
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":212
  * 
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim             # <<<<<<<<<<<<<<
@@ -2105,7 +6841,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->ndim = __pyx_v_ndim;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":213
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":213
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim
  *             if copy_shape:             # <<<<<<<<<<<<<<
@@ -2115,7 +6851,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_6 = __pyx_v_copy_shape;
   if (__pyx_t_6) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":216
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":216
  *                 # Allocate new buffer for strides and shape info. This is allocated
  *                 # as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)             # <<<<<<<<<<<<<<
@@ -2124,7 +6860,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->strides = ((Py_ssize_t *)malloc((((sizeof(Py_ssize_t)) * __pyx_v_ndim) * 2)));
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":217
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":217
  *                 # as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)
  *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
@@ -2133,7 +6869,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":218
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":218
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):             # <<<<<<<<<<<<<<
@@ -2144,7 +6880,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
       __pyx_v_i = __pyx_t_7;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":219
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":219
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
@@ -2153,7 +6889,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
       (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(((PyArrayObject *)__pyx_v_self))[__pyx_v_i]);
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":220
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":220
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]
  *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
@@ -2166,7 +6902,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":222
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":222
  *                     info.shape[i] = PyArray_DIMS(self)[i]
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
@@ -2175,7 +6911,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(((PyArrayObject *)__pyx_v_self)));
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":223
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":223
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
@@ -2186,7 +6922,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L8:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":224
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":224
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
@@ -2195,7 +6931,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->suboffsets = NULL;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":225
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":225
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
@@ -2204,7 +6940,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->itemsize = PyArray_ITEMSIZE(((PyArrayObject *)__pyx_v_self));
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":226
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":226
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)
  *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
@@ -2213,7 +6949,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->readonly = (!PyArray_ISWRITEABLE(((PyArrayObject *)__pyx_v_self)));
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":229
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":229
  * 
  *             cdef int t
  *             cdef char* f = NULL             # <<<<<<<<<<<<<<
@@ -2222,7 +6958,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_f = NULL;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":230
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":230
  *             cdef int t
  *             cdef char* f = NULL
  *             cdef dtype descr = self.descr             # <<<<<<<<<<<<<<
@@ -2232,7 +6968,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __Pyx_INCREF(((PyObject *)((PyArrayObject *)__pyx_v_self)->descr));
   __pyx_v_descr = ((PyArrayObject *)__pyx_v_self)->descr;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":234
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":234
  *             cdef int offset
  * 
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)             # <<<<<<<<<<<<<<
@@ -2241,7 +6977,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_hasfields = PyDataType_HASFIELDS(__pyx_v_descr);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":236
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":236
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)
  * 
  *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
@@ -2257,7 +6993,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":238
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":238
  *             if not hasfields and not copy_shape:
  *                 # do not call releasebuffer
  *                 info.obj = None             # <<<<<<<<<<<<<<
@@ -2273,7 +7009,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":241
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":241
  *             else:
  *                 # need to call releasebuffer
  *                 info.obj = self             # <<<<<<<<<<<<<<
@@ -2288,7 +7024,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L11:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":243
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":243
  *                 info.obj = self
  * 
  *             if not hasfields:             # <<<<<<<<<<<<<<
@@ -2298,7 +7034,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_1 = (!__pyx_v_hasfields);
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":244
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":244
  * 
  *             if not hasfields:
  *                 t = descr.type_num             # <<<<<<<<<<<<<<
@@ -2307,7 +7043,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_t = __pyx_v_descr->type_num;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":245
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":245
  *             if not hasfields:
  *                 t = descr.type_num
  *                 if ((descr.byteorder == '>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -2322,7 +7058,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     if (!__pyx_t_2) {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":246
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":246
  *                 t = descr.type_num
  *                 if ((descr.byteorder == '>' and little_endian) or
  *                     (descr.byteorder == '<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -2342,7 +7078,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     if (__pyx_t_1) {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":247
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":247
  *                 if ((descr.byteorder == '>' and little_endian) or
  *                     (descr.byteorder == '<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -2351,9 +7087,9 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
       __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_u_3));
-      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_u_3));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_3));
+      __Pyx_INCREF(((PyObject *)__pyx_kp_u_7));
+      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_u_7));
+      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_7));
       __pyx_t_5 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -2364,7 +7100,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     __pyx_L13:;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":248
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":248
  *                     (descr.byteorder == '<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
@@ -2377,7 +7113,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":249
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":249
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
@@ -2390,7 +7126,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":250
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":250
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
@@ -2403,7 +7139,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":251
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":251
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
@@ -2416,7 +7152,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":252
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":252
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
@@ -2429,7 +7165,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":253
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":253
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
@@ -2442,7 +7178,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":254
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":254
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
@@ -2455,7 +7191,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":255
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":255
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
@@ -2468,7 +7204,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":256
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":256
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
@@ -2481,7 +7217,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":257
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":257
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
@@ -2494,7 +7230,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":258
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":258
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
@@ -2507,7 +7243,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":259
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":259
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
@@ -2520,7 +7256,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":260
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":260
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
@@ -2533,7 +7269,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":261
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":261
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
@@ -2546,7 +7282,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":262
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":262
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
@@ -2559,7 +7295,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":263
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":263
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
@@ -2572,7 +7308,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":264
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":264
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
  *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
@@ -2586,7 +7322,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     /*else*/ {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":266
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":266
  *                 elif t == NPY_OBJECT:      f = "O"
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
@@ -2595,7 +7331,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
       __pyx_t_5 = PyInt_FromLong(__pyx_v_t); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_4), __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_8), __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
@@ -2612,7 +7348,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     __pyx_L14:;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":267
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":267
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f             # <<<<<<<<<<<<<<
@@ -2621,7 +7357,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->format = __pyx_v_f;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":268
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":268
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f
  *                 return             # <<<<<<<<<<<<<<
@@ -2634,7 +7370,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":270
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":270
  *                 return
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)             # <<<<<<<<<<<<<<
@@ -2643,7 +7379,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->format = ((char *)malloc(255));
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":271
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":271
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = '^' # Native data types, manual alignment             # <<<<<<<<<<<<<<
@@ -2652,7 +7388,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     (__pyx_v_info->format[0]) = '^';
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":272
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":272
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = '^' # Native data types, manual alignment
  *                 offset = 0             # <<<<<<<<<<<<<<
@@ -2661,7 +7397,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_offset = 0;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":275
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":275
  *                 f = _util_dtypestring(descr, info.format + 1,
  *                                       info.format + _buffer_format_string_len,
  *                                       &offset)             # <<<<<<<<<<<<<<
@@ -2671,7 +7407,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     __pyx_t_9 = __pyx_f_5numpy__util_dtypestring(__pyx_v_descr, (__pyx_v_info->format + 1), (__pyx_v_info->format + 255), (&__pyx_v_offset)); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_v_f = __pyx_t_9;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":276
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":276
  *                                       info.format + _buffer_format_string_len,
  *                                       &offset)
  *                 f[0] = 0 # Terminate format string             # <<<<<<<<<<<<<<
@@ -2704,7 +7440,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":278
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":278
  *                 f[0] = 0 # Terminate format string
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
@@ -2718,7 +7454,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __Pyx_RefNannySetupContext("__releasebuffer__");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":279
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":279
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
@@ -2728,7 +7464,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __pyx_t_1 = PyArray_HASFIELDS(((PyArrayObject *)__pyx_v_self));
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":280
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":280
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)             # <<<<<<<<<<<<<<
@@ -2740,7 +7476,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   }
   __pyx_L5:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":281
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":281
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -2750,7 +7486,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __pyx_t_1 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":282
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":282
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 stdlib.free(info.strides)             # <<<<<<<<<<<<<<
@@ -2766,7 +7502,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __Pyx_RefNannyFinishContext();
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":755
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":755
  * ctypedef npy_cdouble     complex_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -2779,7 +7515,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew1");
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":756
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":756
  * 
  * cdef inline object PyArray_MultiIterNew1(a):
  *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
@@ -2805,7 +7541,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":758
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":758
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -2818,7 +7554,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew2");
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":759
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":759
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
@@ -2844,7 +7580,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":761
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":761
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -2857,7 +7593,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew3");
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":762
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":762
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
@@ -2883,7 +7619,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":764
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":764
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -2896,7 +7632,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew4");
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":765
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":765
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
@@ -2922,7 +7658,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":767
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":767
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -2935,7 +7671,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew5");
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":768
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":768
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
@@ -2961,7 +7697,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":770
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":770
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
@@ -2996,7 +7732,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   __pyx_v_new_offset = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_t = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":777
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":777
  *     cdef int delta_offset
  *     cdef tuple i
  *     cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -3005,7 +7741,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_endian_detector = 1;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":778
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":778
  *     cdef tuple i
  *     cdef int endian_detector = 1
  *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -3014,7 +7750,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":781
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":781
  *     cdef tuple fields
  * 
  *     for childname in descr.names:             # <<<<<<<<<<<<<<
@@ -3033,7 +7769,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_v_childname = __pyx_t_3;
     __pyx_t_3 = 0;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":782
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":782
  * 
  *     for childname in descr.names:
  *         fields = descr.fields[childname]             # <<<<<<<<<<<<<<
@@ -3047,7 +7783,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_v_fields = ((PyObject *)__pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":783
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":783
  *     for childname in descr.names:
  *         fields = descr.fields[childname]
  *         child, new_offset = fields             # <<<<<<<<<<<<<<
@@ -3070,7 +7806,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       {__pyx_filename = __pyx_f[1]; __pyx_lineno = 783; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":785
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":785
  *         child, new_offset = fields
  * 
  *         if (end - f) - (new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
@@ -3095,7 +7831,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     if (__pyx_t_6) {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":786
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":786
  * 
  *         if (end - f) - (new_offset - offset[0]) < 15:
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
@@ -3104,9 +7840,9 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_u_5));
-      PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_u_5));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_5));
+      __Pyx_INCREF(((PyObject *)__pyx_kp_u_9));
+      PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_u_9));
+      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_9));
       __pyx_t_3 = PyObject_Call(__pyx_builtin_RuntimeError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -3117,7 +7853,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L5:;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":788
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":788
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == '>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -3132,7 +7868,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     if (!__pyx_t_7) {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":789
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":789
  * 
  *         if ((child.byteorder == '>' and little_endian) or
  *             (child.byteorder == '<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -3152,7 +7888,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     if (__pyx_t_6) {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":790
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":790
  *         if ((child.byteorder == '>' and little_endian) or
  *             (child.byteorder == '<' and not little_endian)):
  *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -3161,9 +7897,9 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 790; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_u_3));
-      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_u_3));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_3));
+      __Pyx_INCREF(((PyObject *)__pyx_kp_u_7));
+      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_u_7));
+      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_7));
       __pyx_t_5 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 790; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -3174,7 +7910,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L6:;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":800
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":800
  * 
  *         # Output padding bytes
  *         while offset[0] < new_offset:             # <<<<<<<<<<<<<<
@@ -3191,7 +7927,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (!__pyx_t_6) break;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":801
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":801
  *         # Output padding bytes
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte             # <<<<<<<<<<<<<<
@@ -3200,7 +7936,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       (__pyx_v_f[0]) = 120;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":802
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":802
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte
  *             f += 1             # <<<<<<<<<<<<<<
@@ -3209,7 +7945,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_v_f += 1;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":803
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":803
  *             f[0] = 120 # "x"; pad byte
  *             f += 1
  *             offset[0] += 1             # <<<<<<<<<<<<<<
@@ -3219,7 +7955,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       (__pyx_v_offset[0]) += 1;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":805
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":805
  *             offset[0] += 1
  * 
  *         offset[0] += child.itemsize             # <<<<<<<<<<<<<<
@@ -3228,7 +7964,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     (__pyx_v_offset[0]) += __pyx_v_child->elsize;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":807
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":807
  *         offset[0] += child.itemsize
  * 
  *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
@@ -3238,7 +7974,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = (!PyDataType_HASFIELDS(__pyx_v_child));
     if (__pyx_t_6) {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":808
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":808
  * 
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num             # <<<<<<<<<<<<<<
@@ -3251,7 +7987,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __pyx_v_t = __pyx_t_3;
       __pyx_t_3 = 0;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":809
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":809
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num
  *             if end - f < 5:             # <<<<<<<<<<<<<<
@@ -3261,7 +7997,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __pyx_t_6 = ((__pyx_v_end - __pyx_v_f) < 5);
       if (__pyx_t_6) {
 
-        /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":810
+        /* "/tmp/cy012/Cython/Includes/numpy.pxd":810
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
@@ -3270,9 +8006,9 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
         __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 810; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_INCREF(((PyObject *)__pyx_kp_u_6));
-        PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_u_6));
-        __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_6));
+        __Pyx_INCREF(((PyObject *)__pyx_kp_u_10));
+        PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_u_10));
+        __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_10));
         __pyx_t_5 = PyObject_Call(__pyx_builtin_RuntimeError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 810; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -3283,7 +8019,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       __pyx_L10:;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":813
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":813
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"             # <<<<<<<<<<<<<<
@@ -3302,7 +8038,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":814
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":814
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"             # <<<<<<<<<<<<<<
@@ -3321,7 +8057,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":815
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":815
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"             # <<<<<<<<<<<<<<
@@ -3340,7 +8076,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":816
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":816
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"             # <<<<<<<<<<<<<<
@@ -3359,7 +8095,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":817
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":817
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"             # <<<<<<<<<<<<<<
@@ -3378,7 +8114,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":818
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":818
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"             # <<<<<<<<<<<<<<
@@ -3397,7 +8133,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":819
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":819
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"             # <<<<<<<<<<<<<<
@@ -3416,7 +8152,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":820
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":820
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"             # <<<<<<<<<<<<<<
@@ -3435,7 +8171,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":821
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":821
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"             # <<<<<<<<<<<<<<
@@ -3454,7 +8190,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":822
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":822
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"             # <<<<<<<<<<<<<<
@@ -3473,7 +8209,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":823
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":823
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"             # <<<<<<<<<<<<<<
@@ -3492,7 +8228,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":824
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":824
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"             # <<<<<<<<<<<<<<
@@ -3511,7 +8247,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":825
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":825
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"             # <<<<<<<<<<<<<<
@@ -3530,7 +8266,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":826
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":826
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf             # <<<<<<<<<<<<<<
@@ -3551,7 +8287,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":827
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":827
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd             # <<<<<<<<<<<<<<
@@ -3572,7 +8308,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":828
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":828
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg             # <<<<<<<<<<<<<<
@@ -3593,7 +8329,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":829
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":829
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"             # <<<<<<<<<<<<<<
@@ -3613,14 +8349,14 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       /*else*/ {
 
-        /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":831
+        /* "/tmp/cy012/Cython/Includes/numpy.pxd":831
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
  *             f += 1
  *         else:
  */
-        __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_4), __pyx_v_t); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_8), __pyx_v_t); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_3);
         __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_5);
@@ -3636,7 +8372,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       __pyx_L11:;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":832
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":832
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *             f += 1             # <<<<<<<<<<<<<<
@@ -3648,7 +8384,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     /*else*/ {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":836
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":836
  *             # Cython ignores struct boundary information ("T{...}"),
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)             # <<<<<<<<<<<<<<
@@ -3662,7 +8398,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":837
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":837
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)
  *     return f             # <<<<<<<<<<<<<<
@@ -3692,7 +8428,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":952
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":952
  * 
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -3707,7 +8443,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_INCREF((PyObject *)__pyx_v_arr);
   __Pyx_INCREF(__pyx_v_base);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":954
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":954
  * cdef inline void set_array_base(ndarray arr, object base):
  *      cdef PyObject* baseptr
  *      if base is None:             # <<<<<<<<<<<<<<
@@ -3717,7 +8453,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __pyx_t_1 = (__pyx_v_base == Py_None);
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":955
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":955
  *      cdef PyObject* baseptr
  *      if base is None:
  *          baseptr = NULL             # <<<<<<<<<<<<<<
@@ -3729,7 +8465,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   }
   /*else*/ {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":957
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":957
  *          baseptr = NULL
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!             # <<<<<<<<<<<<<<
@@ -3738,7 +8474,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
     Py_INCREF(__pyx_v_base);
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":958
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":958
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base             # <<<<<<<<<<<<<<
@@ -3749,7 +8485,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   }
   __pyx_L3:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":959
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":959
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)             # <<<<<<<<<<<<<<
@@ -3758,7 +8494,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   Py_XDECREF(__pyx_v_arr->base);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":960
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":960
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)
  *      arr.base = baseptr             # <<<<<<<<<<<<<<
@@ -3772,7 +8508,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_RefNannyFinishContext();
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":962
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":962
  *      arr.base = baseptr
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -3786,7 +8522,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __Pyx_RefNannySetupContext("get_array_base");
   __Pyx_INCREF((PyObject *)__pyx_v_arr);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":963
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":963
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:             # <<<<<<<<<<<<<<
@@ -3796,7 +8532,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_t_1 = (__pyx_v_arr->base == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":964
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":964
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:
  *         return None             # <<<<<<<<<<<<<<
@@ -3811,7 +8547,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   }
   /*else*/ {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":966
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":966
  *         return None
  *     else:
  *         return <object>arr.base             # <<<<<<<<<<<<<<
@@ -3832,8 +8568,15 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
 }
 
 static struct PyMethodDef __pyx_methods[] = {
+  {__Pyx_NAMESTR("_ols_range"), (PyCFunction)__pyx_pf_4nipy_9neurospin_3glm_6kalman__ols_range, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_3glm_6kalman__ols_range)},
+  {__Pyx_NAMESTR("_ar1_range"), (PyCFunction)__pyx_pf_4nipy_9neurospin_3glm_6kalman__ar1_range, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_3glm_6kalman__ar1_range)},
+  {__Pyx_NAMESTR("_fit_threads"), (PyCFunction)__pyx_pf_4nipy_9neurospin_3glm_6kalman__fit_threads, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_3glm_6kalman__fit_threads)},
+  {__Pyx_NAMESTR("_run_range"), (PyCFunction)__pyx_pf_4nipy_9neurospin_3glm_6kalman__run_range, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("_use_threads"), (PyCFunction)__pyx_pf_4nipy_9neurospin_3glm_6kalman__use_threads, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_3glm_6kalman__use_threads)},
+  {__Pyx_NAMESTR("_double_aligned"), (PyCFunction)__pyx_pf_4nipy_9neurospin_3glm_6kalman__double_aligned, METH_O, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_3glm_6kalman__double_aligned)},
   {__Pyx_NAMESTR("ols"), (PyCFunction)__pyx_pf_4nipy_9neurospin_3glm_6kalman_ols, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_3glm_6kalman_ols)},
   {__Pyx_NAMESTR("ar1"), (PyCFunction)__pyx_pf_4nipy_9neurospin_3glm_6kalman_ar1, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_3glm_6kalman_ar1)},
+  {__Pyx_NAMESTR("unpack"), (PyCFunction)__pyx_pf_4nipy_9neurospin_3glm_6kalman_unpack, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_3glm_6kalman_unpack)},
   {0, 0, 0, 0}
 };
 
@@ -3843,7 +8586,7 @@ static void __pyx_init_filenames(void); /*proto*/
 static struct PyModuleDef __pyx_moduledef = {
     PyModuleDef_HEAD_INIT,
     __Pyx_NAMESTR("kalman"),
-    __Pyx_DOCSTR(__pyx_k_7), /* m_doc */
+    __Pyx_DOCSTR(__pyx_k_11), /* m_doc */
     -1, /* m_size */
     __pyx_methods /* m_methods */,
     NULL, /* m_reload */
@@ -3854,59 +8597,110 @@ static struct PyModuleDef __pyx_moduledef = {
 #endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_u_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 1, 0, 0},
-  {&__pyx_kp_u_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 1, 0, 0},
-  {&__pyx_kp_u_3, __pyx_k_3, sizeof(__pyx_k_3), 0, 1, 0, 0},
-  {&__pyx_kp_u_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 1, 0, 0},
+  {&__pyx_kp_u_10, __pyx_k_10, sizeof(__pyx_k_10), 0, 1, 0, 0},
+  {&__pyx_kp_s_12, __pyx_k_12, sizeof(__pyx_k_12), 0, 0, 1, 0},
+  {&__pyx_kp_s_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 0, 1, 0},
+  {&__pyx_kp_s_3, __pyx_k_3, sizeof(__pyx_k_3), 0, 0, 1, 0},
+  {&__pyx_kp_s_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 0, 1, 0},
   {&__pyx_kp_u_5, __pyx_k_5, sizeof(__pyx_k_5), 0, 1, 0, 0},
   {&__pyx_kp_u_6, __pyx_k_6, sizeof(__pyx_k_6), 0, 1, 0, 0},
-  {&__pyx_kp_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 0},
+  {&__pyx_kp_u_7, __pyx_k_7, sizeof(__pyx_k_7), 0, 1, 0, 0},
+  {&__pyx_kp_u_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 1, 0, 0},
+  {&__pyx_kp_u_9, __pyx_k_9, sizeof(__pyx_k_9), 0, 1, 0, 0},
+  {&__pyx_n_s__A, __pyx_k__A, sizeof(__pyx_k__A), 0, 0, 1, 1},
+  {&__pyx_n_s__B, __pyx_k__B, sizeof(__pyx_k__B), 0, 0, 1, 1},
+  {&__pyx_n_s__CV, __pyx_k__CV, sizeof(__pyx_k__CV), 0, 0, 1, 1},
   {&__pyx_n_s__RuntimeError, __pyx_k__RuntimeError, sizeof(__pyx_k__RuntimeError), 0, 0, 1, 1},
+  {&__pyx_n_s__S2, __pyx_k__S2, sizeof(__pyx_k__S2), 0, 0, 1, 1},
+  {&__pyx_n_s__Thread, __pyx_k__Thread, sizeof(__pyx_k__Thread), 0, 0, 1, 1},
+  {&__pyx_n_s__VB, __pyx_k__VB, sizeof(__pyx_k__VB), 0, 0, 1, 1},
   {&__pyx_n_s__ValueError, __pyx_k__ValueError, sizeof(__pyx_k__ValueError), 0, 0, 1, 1},
   {&__pyx_n_s__Vb, __pyx_k__Vb, sizeof(__pyx_k__Vb), 0, 0, 1, 1},
+  {&__pyx_n_s__W, __pyx_k__W, sizeof(__pyx_k__W), 0, 0, 1, 1},
   {&__pyx_n_s__X, __pyx_k__X, sizeof(__pyx_k__X), 0, 0, 1, 1},
   {&__pyx_n_s__Y, __pyx_k__Y, sizeof(__pyx_k__Y), 0, 0, 1, 1},
   {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
   {&__pyx_n_s____version__, __pyx_k____version__, sizeof(__pyx_k____version__), 0, 0, 1, 1},
+  {&__pyx_n_s___ar1_range, __pyx_k___ar1_range, sizeof(__pyx_k___ar1_range), 0, 0, 1, 1},
+  {&__pyx_n_s___double_aligned, __pyx_k___double_aligned, sizeof(__pyx_k___double_aligned), 0, 0, 1, 1},
+  {&__pyx_n_s___fit_threads, __pyx_k___fit_threads, sizeof(__pyx_k___fit_threads), 0, 0, 1, 1},
+  {&__pyx_n_s___ols_range, __pyx_k___ols_range, sizeof(__pyx_k___ols_range), 0, 0, 1, 1},
+  {&__pyx_n_s___run_range, __pyx_k___run_range, sizeof(__pyx_k___run_range), 0, 0, 1, 1},
+  {&__pyx_n_s___use_threads, __pyx_k___use_threads, sizeof(__pyx_k___use_threads), 0, 0, 1, 1},
   {&__pyx_n_s__a, __pyx_k__a, sizeof(__pyx_k__a), 0, 0, 1, 1},
+  {&__pyx_n_s__aligned, __pyx_k__aligned, sizeof(__pyx_k__aligned), 0, 0, 1, 1},
+  {&__pyx_n_s__args, __pyx_k__args, sizeof(__pyx_k__args), 0, 0, 1, 1},
+  {&__pyx_n_s__array, __pyx_k__array, sizeof(__pyx_k__array), 0, 0, 1, 1},
+  {&__pyx_n_s__asarray, __pyx_k__asarray, sizeof(__pyx_k__asarray), 0, 0, 1, 1},
+  {&__pyx_n_s__atleast_2d, __pyx_k__atleast_2d, sizeof(__pyx_k__atleast_2d), 0, 0, 1, 1},
   {&__pyx_n_s__axis, __pyx_k__axis, sizeof(__pyx_k__axis), 0, 0, 1, 1},
   {&__pyx_n_s__b, __pyx_k__b, sizeof(__pyx_k__b), 0, 0, 1, 1},
   {&__pyx_n_s__base, __pyx_k__base, sizeof(__pyx_k__base), 0, 0, 1, 1},
   {&__pyx_n_s__buf, __pyx_k__buf, sizeof(__pyx_k__buf), 0, 0, 1, 1},
   {&__pyx_n_s__byteorder, __pyx_k__byteorder, sizeof(__pyx_k__byteorder), 0, 0, 1, 1},
+  {&__pyx_n_s__contrasts, __pyx_k__contrasts, sizeof(__pyx_k__contrasts), 0, 0, 1, 1},
+  {&__pyx_n_s__copy, __pyx_k__copy, sizeof(__pyx_k__copy), 0, 0, 1, 1},
   {&__pyx_n_s__data, __pyx_k__data, sizeof(__pyx_k__data), 0, 0, 1, 1},
   {&__pyx_n_s__descr, __pyx_k__descr, sizeof(__pyx_k__descr), 0, 0, 1, 1},
   {&__pyx_n_s__dof, __pyx_k__dof, sizeof(__pyx_k__dof), 0, 0, 1, 1},
   {&__pyx_n_s__double, __pyx_k__double, sizeof(__pyx_k__double), 0, 0, 1, 1},
   {&__pyx_n_s__dtype, __pyx_k__dtype, sizeof(__pyx_k__dtype), 0, 0, 1, 1},
+  {&__pyx_n_s__errors, __pyx_k__errors, sizeof(__pyx_k__errors), 0, 0, 1, 1},
+  {&__pyx_n_s__exc_info, __pyx_k__exc_info, sizeof(__pyx_k__exc_info), 0, 0, 1, 1},
   {&__pyx_n_s__fields, __pyx_k__fields, sizeof(__pyx_k__fields), 0, 0, 1, 1},
+  {&__pyx_n_s__fit_range, __pyx_k__fit_range, sizeof(__pyx_k__fit_range), 0, 0, 1, 1},
+  {&__pyx_n_s__flags, __pyx_k__flags, sizeof(__pyx_k__flags), 0, 0, 1, 1},
+  {&__pyx_n_s__float32, __pyx_k__float32, sizeof(__pyx_k__float32), 0, 0, 1, 1},
   {&__pyx_n_s__format, __pyx_k__format, sizeof(__pyx_k__format), 0, 0, 1, 1},
+  {&__pyx_n_s__full, __pyx_k__full, sizeof(__pyx_k__full), 0, 0, 1, 1},
+  {&__pyx_n_s__has_key, __pyx_k__has_key, sizeof(__pyx_k__has_key), 0, 0, 1, 1},
+  {&__pyx_n_s__i, __pyx_k__i, sizeof(__pyx_k__i), 0, 0, 1, 1},
   {&__pyx_n_s__index, __pyx_k__index, sizeof(__pyx_k__index), 0, 0, 1, 1},
   {&__pyx_n_s__insert, __pyx_k__insert, sizeof(__pyx_k__insert), 0, 0, 1, 1},
   {&__pyx_n_s__itemsize, __pyx_k__itemsize, sizeof(__pyx_k__itemsize), 0, 0, 1, 1},
+  {&__pyx_n_s__join, __pyx_k__join, sizeof(__pyx_k__join), 0, 0, 1, 1},
+  {&__pyx_n_s__n_threads, __pyx_k__n_threads, sizeof(__pyx_k__n_threads), 0, 0, 1, 1},
   {&__pyx_n_s__names, __pyx_k__names, sizeof(__pyx_k__names), 0, 0, 1, 1},
   {&__pyx_n_s__ndim, __pyx_k__ndim, sizeof(__pyx_k__ndim), 0, 0, 1, 1},
   {&__pyx_n_s__niter, __pyx_k__niter, sizeof(__pyx_k__niter), 0, 0, 1, 1},
+  {&__pyx_n_s__none, __pyx_k__none, sizeof(__pyx_k__none), 0, 0, 1, 1},
   {&__pyx_n_s__np, __pyx_k__np, sizeof(__pyx_k__np), 0, 0, 1, 1},
   {&__pyx_n_s__numpy, __pyx_k__numpy, sizeof(__pyx_k__numpy), 0, 0, 1, 1},
   {&__pyx_n_s__obj, __pyx_k__obj, sizeof(__pyx_k__obj), 0, 0, 1, 1},
+  {&__pyx_n_s__outer, __pyx_k__outer, sizeof(__pyx_k__outer), 0, 0, 1, 1},
+  {&__pyx_n_s__outs, __pyx_k__outs, sizeof(__pyx_k__outs), 0, 0, 1, 1},
+  {&__pyx_n_s__owner, __pyx_k__owner, sizeof(__pyx_k__owner), 0, 0, 1, 1},
+  {&__pyx_n_s__packed, __pyx_k__packed, sizeof(__pyx_k__packed), 0, 0, 1, 1},
   {&__pyx_n_s__range, __pyx_k__range, sizeof(__pyx_k__range), 0, 0, 1, 1},
+  {&__pyx_n_s__ravel, __pyx_k__ravel, sizeof(__pyx_k__ravel), 0, 0, 1, 1},
   {&__pyx_n_s__readonly, __pyx_k__readonly, sizeof(__pyx_k__readonly), 0, 0, 1, 1},
   {&__pyx_n_s__reshape, __pyx_k__reshape, sizeof(__pyx_k__reshape), 0, 0, 1, 1},
+  {&__pyx_n_s__rollaxis, __pyx_k__rollaxis, sizeof(__pyx_k__rollaxis), 0, 0, 1, 1},
   {&__pyx_n_s__s2, __pyx_k__s2, sizeof(__pyx_k__s2), 0, 0, 1, 1},
   {&__pyx_n_s__shape, __pyx_k__shape, sizeof(__pyx_k__shape), 0, 0, 1, 1},
   {&__pyx_n_s__size, __pyx_k__size, sizeof(__pyx_k__size), 0, 0, 1, 1},
   {&__pyx_n_s__size2, __pyx_k__size2, sizeof(__pyx_k__size2), 0, 0, 1, 1},
+  {&__pyx_n_s__sqrt, __pyx_k__sqrt, sizeof(__pyx_k__sqrt), 0, 0, 1, 1},
+  {&__pyx_n_s__start, __pyx_k__start, sizeof(__pyx_k__start), 0, 0, 1, 1},
+  {&__pyx_n_s__stop, __pyx_k__stop, sizeof(__pyx_k__stop), 0, 0, 1, 1},
+  {&__pyx_n_s__stride, __pyx_k__stride, sizeof(__pyx_k__stride), 0, 0, 1, 1},
   {&__pyx_n_s__strides, __pyx_k__strides, sizeof(__pyx_k__strides), 0, 0, 1, 1},
   {&__pyx_n_s__suboffsets, __pyx_k__suboffsets, sizeof(__pyx_k__suboffsets), 0, 0, 1, 1},
+  {&__pyx_n_s__sys, __pyx_k__sys, sizeof(__pyx_k__sys), 0, 0, 1, 1},
+  {&__pyx_n_s__target, __pyx_k__target, sizeof(__pyx_k__target), 0, 0, 1, 1},
+  {&__pyx_n_s__threading, __pyx_k__threading, sizeof(__pyx_k__threading), 0, 0, 1, 1},
+  {&__pyx_n_s__triu_indices, __pyx_k__triu_indices, sizeof(__pyx_k__triu_indices), 0, 0, 1, 1},
   {&__pyx_n_s__type_num, __pyx_k__type_num, sizeof(__pyx_k__type_num), 0, 0, 1, 1},
+  {&__pyx_n_s__vb_dtype, __pyx_k__vb_dtype, sizeof(__pyx_k__vb_dtype), 0, 0, 1, 1},
+  {&__pyx_n_s__vb_storage, __pyx_k__vb_storage, sizeof(__pyx_k__vb_storage), 0, 0, 1, 1},
+  {&__pyx_n_s__vb_storages, __pyx_k__vb_storages, sizeof(__pyx_k__vb_storages), 0, 0, 1, 1},
   {&__pyx_n_s__vector, __pyx_k__vector, sizeof(__pyx_k__vector), 0, 0, 1, 1},
   {&__pyx_n_s__zeros, __pyx_k__zeros, sizeof(__pyx_k__zeros), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetName(__pyx_b, __pyx_n_s__range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_range = __Pyx_GetName(__pyx_b, __pyx_n_s__range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_builtin_RuntimeError = __Pyx_GetName(__pyx_b, __pyx_n_s__RuntimeError); if (!__pyx_builtin_RuntimeError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   return 0;
   __pyx_L1_error:;
@@ -3915,7 +8709,11 @@ static int __Pyx_InitCachedBuiltins(void) {
 
 static int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
   __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_8 = PyInt_FromLong(8); if (unlikely(!__pyx_int_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
   __pyx_int_15 = PyInt_FromLong(15); if (unlikely(!__pyx_int_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
   return 0;
   __pyx_L1_error:;
@@ -3931,6 +8729,7 @@ PyMODINIT_FUNC PyInit_kalman(void)
 #endif
 {
   PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
   #if CYTHON_REFNANNY
   void* __pyx_refnanny = NULL;
   __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
@@ -3958,7 +8757,7 @@ PyMODINIT_FUNC PyInit_kalman(void)
   #endif
   /*--- Module creation code ---*/
   #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("kalman"), __pyx_methods, __Pyx_DOCSTR(__pyx_k_7), 0, PYTHON_API_VERSION);
+  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("kalman"), __pyx_methods, __Pyx_DOCSTR(__pyx_k_11), 0, PYTHON_API_VERSION);
   #else
   __pyx_m = PyModule_Create(&__pyx_moduledef);
   #endif
@@ -3988,16 +8787,16 @@ PyMODINIT_FUNC PyInit_kalman(void)
   /*--- Function import code ---*/
   /*--- Execution code ---*/
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":10
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":10
  * """
  * 
  * __version__ = '0.1'             # <<<<<<<<<<<<<<
  * 
  * # Includes
  */
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____version__, ((PyObject *)__pyx_kp_s_8)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 10; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____version__, ((PyObject *)__pyx_kp_s_12)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 10; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":62
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":62
  * 
  * # Initialize numpy
  * fffpy_import_array()             # <<<<<<<<<<<<<<
@@ -4006,28 +8805,92 @@ PyMODINIT_FUNC PyInit_kalman(void)
  */
   fffpy_import_array();
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":63
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":63
  * # Initialize numpy
  * fffpy_import_array()
  * import_array()             # <<<<<<<<<<<<<<
  * import numpy as np
- * 
+ * import sys
  */
   import_array();
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/glm/kalman.pyx":64
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":64
  * fffpy_import_array()
  * import_array()
  * import numpy as np             # <<<<<<<<<<<<<<
- * 
- * # Standard Kalman filter
+ * import sys
+ * import threading
  */
   __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__numpy), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   if (PyObject_SetAttr(__pyx_m, __pyx_n_s__np, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/python_ref.pxd":1
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":65
+ * import_array()
+ * import numpy as np
+ * import sys             # <<<<<<<<<<<<<<
+ * import threading
+ * cimport cython
+ */
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__sys), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__sys, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":66
+ * import numpy as np
+ * import sys
+ * import threading             # <<<<<<<<<<<<<<
+ * cimport cython
+ * 
+ */
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__threading), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__threading, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":139
+ *     VB_NONE = 2
+ * 
+ * vb_storages = {'full': VB_FULL, 'packed': VB_PACKED, 'none': VB_NONE}             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_3glm_6kalman_VB_FULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__full), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_3glm_6kalman_VB_PACKED); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__packed), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_3glm_6kalman_VB_NONE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__none), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__vb_storages, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/glm/kalman.pyx":375
+ * 
+ * def ar1(ndarray Y, ndarray X, int niter=2, int axis=0, n_threads=None,
+ *         vb_storage='full', vb_dtype=np.double, contrasts=None):             # <<<<<<<<<<<<<<
+ *     """
+ *     (beta, norm_var_beta, s2, dof, a) = ar1(Y, X, niter=2, axis=0, n_threads=None,
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__double); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_k_1 = __pyx_t_2;
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "/tmp/cy012/Cython/Includes/python_ref.pxd":1
  * cdef extern from "Python.h":             # <<<<<<<<<<<<<<
  *     ctypedef struct PyTypeObject
  *     ctypedef struct PyObject:
@@ -4035,6 +8898,7 @@ PyMODINIT_FUNC PyInit_kalman(void)
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   if (__pyx_m) {
     __Pyx_AddTraceback("init nipy.neurospin.glm.kalman");
     Py_DECREF(__pyx_m); __pyx_m = 0;
@@ -4184,6 +9048,65 @@ bad:
 }
 
 
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *local_type, *local_value, *local_tb;
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyThreadState *tstate = PyThreadState_GET();
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+    if (unlikely(tstate->curexc_type))
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+        goto bad;
+    #endif
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+    Py_INCREF(local_type);
+    Py_INCREF(local_value);
+    Py_INCREF(local_tb);
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    /* Make sure tstate is in a consistent state when we XDECREF
+       these objects (XDECREF may run arbitrary code). */
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_Format(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(PyObject_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+
 static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
     PyErr_Format(PyExc_ValueError,
         #if PY_VERSION_HEX < 0x02050000
@@ -4221,17 +9144,6 @@ static int __Pyx_EndUnpack(PyObject *iter) {
         return -1;
 }
 
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
-    if (unlikely(!type)) {
-        PyErr_Format(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (likely(PyObject_TypeCheck(obj, type)))
-        return 1;
-    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
-                 Py_TYPE(obj)->tp_name, type->tp_name);
-    return 0;
-}
 
 static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
@@ -4245,86 +9157,247 @@ static void __Pyx_UnpackTupleError(PyObject *t, Py_ssize_t index) {
     } else {
       __Pyx_RaiseTooManyValuesError();
     }
-}
+}
+
+static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
+    const char *name, int exact)
+{
+    if (!type) {
+        PyErr_Format(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (none_allowed && obj == Py_None) return 1;
+    else if (exact) {
+        if (Py_TYPE(obj) == type) return 1;
+    }
+    else {
+        if (PyObject_TypeCheck(obj, type)) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%s' has incorrect type (expected %s, got %s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb) {
+    PyThreadState *tstate = PyThreadState_GET();
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+
+static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyThreadState *tstate = PyThreadState_GET();
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list) {
+    PyObject *__import__ = 0;
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    __import__ = __Pyx_GetAttrString(__pyx_b, "__import__");
+    if (!__import__)
+        goto bad;
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    module = PyObject_CallFunctionObjArgs(__import__,
+        name, global_dict, empty_dict, list, NULL);
+bad:
+    Py_XDECREF(empty_list);
+    Py_XDECREF(__import__);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
+    PyObject *result;
+    result = PyObject_GetAttr(dict, name);
+    if (!result)
+        PyErr_SetObject(PyExc_NameError, name);
+    return result;
+}
+
+static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_npy_intp(npy_intp val) {
+    const npy_intp neg_one = (npy_intp)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(npy_intp) <  sizeof(long)) {
+        return PyInt_FromLong((long)val);
+    } else if (sizeof(npy_intp) == sizeof(long)) {
+        if (is_unsigned)
+            return PyLong_FromUnsignedLong((unsigned long)val);
+        else
+            return PyInt_FromLong((long)val);
+    } else { /* (sizeof(npy_intp) > sizeof(long)) */
+        if (is_unsigned)
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG)val);
+        else
+            return PyLong_FromLongLong((PY_LONG_LONG)val);
+    }
+}
+
+static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyThreadState *tstate = PyThreadState_GET();
+
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+
+static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
+    PyThreadState *tstate = PyThreadState_GET();
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+
+
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
+    Py_XINCREF(type);
+    Py_XINCREF(value);
+    Py_XINCREF(tb);
+    /* First, check the traceback argument, replacing None with NULL. */
+    if (tb == Py_None) {
+        Py_DECREF(tb);
+        tb = 0;
+    }
+    else if (tb != NULL && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto raise_error;
+    }
+    /* Next, replace a missing value with None */
+    if (value == NULL) {
+        value = Py_None;
+        Py_INCREF(value);
+    }
+    #if PY_VERSION_HEX < 0x02050000
+    if (!PyClass_Check(type))
+    #else
+    if (!PyType_Check(type))
+    #endif
+    {
+        /* Raising an instance.  The value should be a dummy. */
+        if (value != Py_None) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        /* Normalize to raise <class>, <instance> */
+        Py_DECREF(value);
+        value = type;
+        #if PY_VERSION_HEX < 0x02050000
+            if (PyInstance_Check(type)) {
+                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
+                Py_INCREF(type);
+            }
+            else {
+                type = 0;
+                PyErr_SetString(PyExc_TypeError,
+                    "raise: exception must be an old-style class or instance");
+                goto raise_error;
+            }
+        #else
+            type = (PyObject*) Py_TYPE(type);
+            Py_INCREF(type);
+            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+                PyErr_SetString(PyExc_TypeError,
+                    "raise: exception class must be a subclass of BaseException");
+                goto raise_error;
+            }
+        #endif
+    }
 
-static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact)
-{
-    if (!type) {
-        PyErr_Format(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (none_allowed && obj == Py_None) return 1;
-    else if (exact) {
-        if (Py_TYPE(obj) == type) return 1;
-    }
-    else {
-        if (PyObject_TypeCheck(obj, type)) return 1;
-    }
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%s' has incorrect type (expected %s, got %s)",
-        name, type->tp_name, Py_TYPE(obj)->tp_name);
-    return 0;
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
 }
 
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list) {
-    PyObject *__import__ = 0;
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    __import__ = __Pyx_GetAttrString(__pyx_b, "__import__");
-    if (!__import__)
+#else /* Python 3+ */
+
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
         goto bad;
-    if (from_list)
-        list = from_list;
-    else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
-            goto bad;
-        list = empty_list;
     }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
+    if (value == Py_None)
+        value = 0;
+
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (!PyExceptionClass_Check(type)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
         goto bad;
-    module = PyObject_CallFunctionObjArgs(__import__,
-        name, global_dict, empty_dict, list, NULL);
-bad:
-    Py_XDECREF(empty_list);
-    Py_XDECREF(__import__);
-    Py_XDECREF(empty_dict);
-    return module;
-}
+    }
 
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
-    PyObject *result;
-    result = PyObject_GetAttr(dict, name);
-    if (!result)
-        PyErr_SetObject(PyExc_NameError, name);
-    return result;
-}
+    PyErr_SetObject(type, value);
 
-static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_npy_intp(npy_intp val) {
-    const npy_intp neg_one = (npy_intp)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(npy_intp) <  sizeof(long)) {
-        return PyInt_FromLong((long)val);
-    } else if (sizeof(npy_intp) == sizeof(long)) {
-        if (is_unsigned)
-            return PyLong_FromUnsignedLong((unsigned long)val);
-        else
-            return PyInt_FromLong((long)val);
-    } else { /* (sizeof(npy_intp) > sizeof(long)) */
-        if (is_unsigned)
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG)val);
-        else
-            return PyLong_FromLongLong((PY_LONG_LONG)val);
+    if (tb) {
+        PyThreadState *tstate = PyThreadState_GET();
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
     }
+
+bad:
+    return;
 }
+#endif
 
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
@@ -4476,143 +9549,6 @@ static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_npy_intp(npy_intp val) {
 */
 #endif
 
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-}
-
-
-#if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    Py_XINCREF(type);
-    Py_XINCREF(value);
-    Py_XINCREF(tb);
-    /* First, check the traceback argument, replacing None with NULL. */
-    if (tb == Py_None) {
-        Py_DECREF(tb);
-        tb = 0;
-    }
-    else if (tb != NULL && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto raise_error;
-    }
-    /* Next, replace a missing value with None */
-    if (value == NULL) {
-        value = Py_None;
-        Py_INCREF(value);
-    }
-    #if PY_VERSION_HEX < 0x02050000
-    if (!PyClass_Check(type))
-    #else
-    if (!PyType_Check(type))
-    #endif
-    {
-        /* Raising an instance.  The value should be a dummy. */
-        if (value != Py_None) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        /* Normalize to raise <class>, <instance> */
-        Py_DECREF(value);
-        value = type;
-        #if PY_VERSION_HEX < 0x02050000
-            if (PyInstance_Check(type)) {
-                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
-                Py_INCREF(type);
-            }
-            else {
-                type = 0;
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception must be an old-style class or instance");
-                goto raise_error;
-            }
-        #else
-            type = (PyObject*) Py_TYPE(type);
-            Py_INCREF(type);
-            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception class must be a subclass of BaseException");
-                goto raise_error;
-            }
-        #endif
-    }
-
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
-}
-
-#else /* Python 3+ */
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (!PyExceptionClass_Check(type)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-
-    PyErr_SetObject(type, value);
-
-    if (tb) {
-        PyThreadState *tstate = PyThreadState_GET();
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-    }
-
-bad:
-    return;
-}
-#endif
-
 static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
     const unsigned char neg_one = (unsigned char)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
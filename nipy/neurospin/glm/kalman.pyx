@@ -53,21 +53,242 @@ cdef extern from "fff_glm_kalman.h":
     void fff_glm_RKF_iterate(fff_glm_RKF* thisone, unsigned int nloop, 
                              double y, fff_vector* x, 
                              double yy, fff_vector* xx)
-    void fff_glm_KF_fit(fff_glm_KF* thisone, fff_vector* y, fff_matrix* X)
+    void fff_glm_KF_fit(fff_glm_KF* thisone, fff_vector* y, fff_matrix* X) nogil
     void fff_glm_RKF_fit(fff_glm_RKF* thisone, unsigned int nloop, 
-                         fff_vector* y, fff_matrix* X)
+                         fff_vector* y, fff_matrix* X) nogil
 
 
 # Initialize numpy
 fffpy_import_array()
 import_array()
 import numpy as np
+import sys
+import threading
+cimport cython
+
+
+# Voxel-range fits for threads.  These release the GIL around the loop
+# over voxels, so they need to address the data directly rather than
+# through a fffpy_multi_iterator.  Voxel k is the k-th position, in C
+# order, over all axes but the fitting axis; fffpy_multi_iterator visits
+# voxels in the same order.
+
+@cython.cdivision(True)
+cdef char* _voxel_ptr(char* data, npy_intp* dims, npy_intp* strides,
+                      int ndim, int axis, size_t k) nogil:
+    cdef int d
+    for d from ndim > d >= 0:
+        if d == axis:
+            continue
+        data = data + (k % dims[d]) * strides[d]
+        k = k / dims[d]
+    return data
+
+
+def _ols_range(ndarray Y, ndarray X, ndarray B, ndarray S2, int axis,
+               size_t start, size_t stop):
+    """
+    (norm_var_beta, dof) = _ols_range(Y, X, B, S2, axis, start, stop)
+
+    Fit voxels from `start` up to `stop` with the Kalman filter, writing
+    parameter estimates into `B` and squared scales into `S2`.  `Y` must
+    be an aligned double array.
+    """
+    cdef fff_vector y
+    cdef fff_matrix *x
+    cdef fff_glm_KF *kfilt
+    cdef size_t k, j, p
+    cdef char *bk
+    cdef char *ydata = Y.data, *bdata = B.data, *sdata = S2.data
+    cdef npy_intp *dims = Y.shape
+    cdef npy_intp *ystrides = Y.strides, *bstrides = B.strides
+    cdef npy_intp *sstrides = S2.strides
+    cdef npy_intp bstride = B.strides[axis]
+    cdef int ndim = Y.ndim
+    cdef double dof
+
+    x = fff_matrix_fromPyArray(X)
+    p = x.size2
+    kfilt = fff_glm_KF_new(p)
+    y.size = Y.shape[axis]
+    y.stride = Y.strides[axis] / sizeof(double)
+    y.owner = 0
+
+    with nogil:
+        for k from start <= k < stop:
+            y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)
+            fff_glm_KF_fit(kfilt, &y, x)
+            bk = _voxel_ptr(bdata, dims, bstrides, ndim, axis, k)
+            for j from 0 <= j < p:
+                (<double*>(bk + j * bstride))[0] = kfilt.b.data[j * kfilt.b.stride]
+            (<double*>_voxel_ptr(sdata, dims, sstrides, ndim, axis, k))[0] = kfilt.s2
+
+    VB = fff_matrix_const_toPyArray(kfilt.Vb)
+    dof = kfilt.dof
+    fff_matrix_delete(x)
+    fff_glm_KF_delete(kfilt)
+    return VB, dof
+
+
+# Storage of variance matrices for ar1
+cdef enum:
+    VB_FULL = 0
+    VB_PACKED = 1
+    VB_NONE = 2
+
+vb_storages = {'full': VB_FULL, 'packed': VB_PACKED, 'none': VB_NONE}
+
+
+cdef inline void _store(char* ptr, double v, int single) nogil:
+    if single:
+        (<float*>ptr)[0] = <float>v
+    else:
+        (<double*>ptr)[0] = v
+
+
+def _ar1_range(ndarray Y, ndarray X, ndarray B, ndarray VB, ndarray S2,
+               ndarray A, ndarray CV, ndarray W, int niter, int axis,
+               int vb_storage, size_t start, size_t stop):
+    """
+    dof = _ar1_range(Y, X, B, VB, S2, A, CV, W, niter, axis, vb_storage,
+                     start, stop)
+
+    Fit voxels from `start` up to `stop` with the refined Kalman filter,
+    writing into `B`, `VB`, `S2` and `A`.  `Y` must be an aligned
+    double array.  `VB` is a double or float32 array, with the flat
+    variance matrices, packed upper triangles, or None, depending on
+    `vb_storage`.  If `CV` is not None, it gets the dot products of the
+    rows of `W` with the flat variance matrix.
+    """
+    cdef fff_vector y
+    cdef fff_matrix *x
+    cdef fff_glm_RKF *rkfilt
+    cdef size_t k, i, j, e, p, p2, n_cv = 0
+    cdef char *bk, *vbk, *cvk
+    cdef char *ydata = Y.data, *bdata = B.data
+    cdef char *sdata = S2.data, *adata = A.data
+    cdef char *vbdata = NULL, *cvdata = NULL
+    cdef npy_intp *dims = Y.shape
+    cdef npy_intp *ystrides = Y.strides, *bstrides = B.strides
+    cdef npy_intp *sstrides = S2.strides, *astrides = A.strides
+    cdef npy_intp *vbstrides = NULL, *cvstrides = NULL
+    cdef npy_intp bstride = B.strides[axis], vbstride = 0, cvstride = 0
+    cdef int ndim = Y.ndim, vb_single = 0
+    cdef unsigned int nloop = niter
+    cdef double *w = NULL
+    cdef double v, dof
+
+    if vb_storage != VB_NONE:
+        vbdata = VB.data
+        vbstrides = VB.strides
+        vbstride = VB.strides[axis]
+        vb_single = VB.dtype == np.float32
+    if CV is not None:
+        cvdata = CV.data
+        cvstrides = CV.strides
+        cvstride = CV.strides[axis]
+        n_cv = W.shape[0]
+        w = <double*>W.data
+
+    x = fff_matrix_fromPyArray(X)
+    p = x.size2
+    p2 = p*p
+    rkfilt = fff_glm_RKF_new(p)
+    y.size = Y.shape[axis]
+    y.stride = Y.strides[axis] / sizeof(double)
+    y.owner = 0
+
+    with nogil:
+        for k from start <= k < stop:
+            y.data = <double*>_voxel_ptr(ydata, dims, ystrides, ndim, axis, k)
+            fff_glm_RKF_fit(rkfilt, nloop, &y, x)
+            bk = _voxel_ptr(bdata, dims, bstrides, ndim, axis, k)
+            for j from 0 <= j < p:
+                (<double*>(bk + j * bstride))[0] = rkfilt.b.data[j * rkfilt.b.stride]
+            # rkfilt.Vb contiguous by construction
+            if vb_storage == VB_FULL:
+                vbk = _voxel_ptr(vbdata, dims, vbstrides, ndim, axis, k)
+                for j from 0 <= j < p2:
+                    _store(vbk + j * vbstride, rkfilt.Vb.data[j], vb_single)
+            elif vb_storage == VB_PACKED:
+                vbk = _voxel_ptr(vbdata, dims, vbstrides, ndim, axis, k)
+                e = 0
+                for i from 0 <= i < p:
+                    for j from i <= j < p:
+                        _store(vbk + e * vbstride, rkfilt.Vb.data[i*p + j],
+                               vb_single)
+                        e = e + 1
+            if n_cv > 0:
+                cvk = _voxel_ptr(cvdata, dims, cvstrides, ndim, axis, k)
+                for e from 0 <= e < n_cv:
+                    v = 0
+                    for j from 0 <= j < p2:
+                        v = v + w[e*p2 + j] * rkfilt.Vb.data[j]
+                    (<double*>(cvk + e * cvstride))[0] = v
+            (<double*>_voxel_ptr(sdata, dims, sstrides, ndim, axis, k))[0] = rkfilt.s2
+            (<double*>_voxel_ptr(adata, dims, astrides, ndim, axis, k))[0] = rkfilt.a
+
+    dof = rkfilt.dof
+    fff_matrix_delete(x)
+    fff_glm_RKF_delete(rkfilt)
+    return dof
+
+
+def _fit_threads(fit_range, ndarray Y, args, int axis, int n_threads):
+    """
+    Run ``fit_range(Y, *(args + (start, stop)))`` over `n_threads`
+    threads, splitting the voxels of `Y` into contiguous ranges.
+
+    Return the output of the call for the range with the last voxel.
+    An exception raised in any of the threads is raised again here.
+    """
+    cdef size_t n_vox = Y.size / Y.shape[axis]
+    if n_threads == 1:
+        return fit_range(*((Y,) + args + (0, n_vox)))
+    bounds = [n_vox * i / n_threads for i in range(n_threads + 1)]
+    outs = [None] * n_threads
+    errors = []
+    threads = []
+    for i in range(n_threads):
+        thread = threading.Thread(
+            target=_run_range,
+            args=(outs, errors, i, fit_range,
+                  (Y,) + args + (bounds[i], bounds[i+1])))
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0][0], errors[0][1], errors[0][2]
+    return outs[-1]
+
+
+def _run_range(outs, errors, i, fit_range, args):
+    try:
+        outs[i] = fit_range(*args)
+    except:
+        errors.append(sys.exc_info())
+
+
+def _use_threads(ndarray Y, int axis, n_threads):
+    """ True if we should fit `Y` over more than one thread """
+    if n_threads is None or n_threads < 2:
+        return False
+    return Y.size / Y.shape[axis] >= n_threads
+
+
+def _double_aligned(ndarray Y):
+    """ `Y` as aligned, native double array, copying if needed """
+    Y = np.asarray(Y, dtype=np.double)
+    if not Y.flags.aligned:
+        Y = Y.copy()
+    return Y
 
 # Standard Kalman filter
 
-def ols(ndarray Y, ndarray X, int axis=0): 
+def ols(ndarray Y, ndarray X, int axis=0, n_threads=None): 
     """
-    (beta, norm_var_beta, s2, dof) = ols(Y, X, axis=0).
+    (beta, norm_var_beta, s2, dof) = ols(Y, X, axis=0, n_threads=None).
 
     Ordinary least-square multiple regression using the Kalman filter.
     Fit the N-dimensional array Y along the given axis in terms of the
@@ -82,6 +303,10 @@ def ols(ndarray Y, ndarray X, int axis=0):
     beta.
     dof -- scalar degrees of freedom.
 
+    If `n_threads` is greater than one, the voxels are split into
+    `n_threads` ranges, fit in parallel threads. The results are the
+    same as for the serial fit.
+
     REFERENCE:  Roche et al, ISBI 2004.
     """
     cdef fff_vector *y, *b, *s2
@@ -108,6 +333,13 @@ def ols(ndarray Y, ndarray X, int axis=0):
     dims[axis] = 1
     S2 = np.zeros(dims, dtype=np.double)
 
+    # Threaded fit
+    if _use_threads(Y, axis, n_threads):
+        fff_matrix_delete(x)
+        VB, dof = _fit_threads(_ols_range, _double_aligned(Y),
+                               (X, B, S2, axis), axis, n_threads)
+        return B, VB, S2, dof
+
     # Allocate local structure
     kfilt = fff_glm_KF_new(p)
 
@@ -139,9 +371,12 @@ def ols(ndarray Y, ndarray X, int axis=0):
     return B, VB, S2, dof
     
 
-def ar1(ndarray Y, ndarray X, int niter=2, int axis=0):
+def ar1(ndarray Y, ndarray X, int niter=2, int axis=0, n_threads=None,
+        vb_storage='full', vb_dtype=np.double, contrasts=None):
     """
-    (beta, norm_var_beta, s2, dof, a) = ar1(Y, X, niter=2, axis=0)
+    (beta, norm_var_beta, s2, dof, a) = ar1(Y, X, niter=2, axis=0, n_threads=None,
+                                            vb_storage='full', vb_dtype=np.double,
+                                            contrasts=None)
 
     Refined Kalman filter -- enhanced Kalman filter to account for
     noise autocorrelation using an AR(1) model. Pseudo-likelihood
@@ -158,6 +393,25 @@ def ar1(ndarray Y, ndarray X, int niter=2, int axis=0):
     dof -- scalar degrees of freedom
     a -- array of error autocorrelation estimates
 
+    If `n_threads` is greater than one, the voxels are split into
+    `n_threads` ranges, fit in parallel threads. The results are the
+    same as for the serial fit.
+
+    The p x p normalized variance matrices take most of the output
+    memory. `vb_storage` sets how to store them:
+    'full' -- p x p matrices, at `axis` and `axis`+1 of norm_var_beta
+    'packed' -- upper triangles, row by row, p*(p+1)/2 values at `axis`
+    of norm_var_beta; see `unpack`
+    'none' -- do not store; norm_var_beta is None
+    `vb_dtype` (np.double or np.float32) is the type of the stored
+    values.
+
+    If `contrasts` is a sequence of contrast vectors and (q x p)
+    matrices, we calculate the normalized variances of the contrasts,
+    c*norm_var_beta*c', during the fit, and return them as a sixth
+    output, a list with one array per contrast, with the q x q variance
+    at `axis` (and `axis`+1 if q > 1).
+
     REFERENCE:
     Roche et al, MICCAI 2004.
     """
@@ -182,52 +436,129 @@ def ar1(ndarray Y, ndarray X, int niter=2, int axis=0):
     # type; see:
     # http://codespeak.net/pipermail/cython-dev/2009-April/005229.html
     dims = [Y.shape[i] for i in range(Y.ndim)]
+    if not vb_storages.has_key(vb_storage):
+        fff_matrix_delete(x)
+        raise ValueError('Unknown variance storage "%s"' % vb_storage)
+    vb_dtype = np.dtype(vb_dtype)
+    if not vb_dtype in (np.dtype(np.double), np.dtype(np.float32)):
+        fff_matrix_delete(x)
+        raise ValueError('Variance type should be double or float32')
     dims[axis] = p
     B = np.zeros(dims, dtype=np.double)
-    dims[axis] = p2
-    VB = np.zeros(dims, dtype=np.double)
+    VB = None
+    if vb_storage == 'full':
+        dims[axis] = p2
+        VB = np.zeros(dims, dtype=vb_dtype)
+    elif vb_storage == 'packed':
+        dims[axis] = p*(p+1)/2
+        VB = np.zeros(dims, dtype=vb_dtype)
     dims[axis] = 1
     S2 = np.zeros(dims, dtype=np.double)
     A = np.zeros(dims, dtype=np.double)
- 
-    # Allocate local structure
-    rkfilt = fff_glm_RKF_new(p)
-
-    # Create a new array iterator 
-    multi = fffpy_multi_iterator_new(5, axis, <void*>Y, <void*>B, <void*>VB, <void*>S2, <void*>A)
-
-    # Create views
-    y = multi.vector[0]
-    b = multi.vector[1]
-    vb = multi.vector[2]
-    s2 = multi.vector[3]
-    a = multi.vector[4]
-
-    # Loop 
-    while(multi.index < multi.size):
-        fff_glm_RKF_fit(rkfilt, niter, y, x)
-        fff_vector_memcpy(b, rkfilt.b)
-        Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction
-        fff_vector_memcpy(vb, &Vb_flat)
-        s2.data[0] = rkfilt.s2
-        a.data[0] = rkfilt.a
-        fffpy_multi_iterator_update(multi)
 
-    # Dof 
-    dof = rkfilt.dof
-    
-    # Free memory
-    fff_matrix_delete(x)
-    fff_glm_RKF_delete(rkfilt) 
-    fffpy_multi_iterator_delete(multi)
+    # Contrast variances as dot products with flat variance matrix
+    CV = None
+    W = None
+    if not contrasts is None:
+        cons = [np.atleast_2d(np.asarray(c, dtype=np.double))
+                for c in contrasts]
+        W = [np.outer(ca, cb).ravel() for c in cons for ca in c for cb in c]
+        W = np.array(W, dtype=np.double).reshape((-1, p2))
+        dims[axis] = W.shape[0]
+        CV = np.zeros(dims, dtype=np.double)
+        dims[axis] = 1
+
+    # Threaded fit, or storage needing range fit
+    threaded = _use_threads(Y, axis, n_threads)
+    if threaded or vb_storage != 'full' or vb_dtype != np.double \
+            or not CV is None:
+        if not threaded:
+            n_threads = 1
+        fff_matrix_delete(x)
+        dof = _fit_threads(_ar1_range, _double_aligned(Y),
+                           (X, B, VB, S2, A, CV, W, niter, axis,
+                            vb_storages[vb_storage]),
+                           axis, n_threads)
+
+    else:
+        # Allocate local structure
+        rkfilt = fff_glm_RKF_new(p)
+
+        # Create a new array iterator 
+        multi = fffpy_multi_iterator_new(5, axis, <void*>Y, <void*>B, <void*>VB, <void*>S2, <void*>A)
+
+        # Create views
+        y = multi.vector[0]
+        b = multi.vector[1]
+        vb = multi.vector[2]
+        s2 = multi.vector[3]
+        a = multi.vector[4]
+
+        # Loop 
+        while(multi.index < multi.size):
+            fff_glm_RKF_fit(rkfilt, niter, y, x)
+            fff_vector_memcpy(b, rkfilt.b)
+            Vb_flat = fff_vector_view(rkfilt.Vb.data, p2, 1) # rkfilt.Vb contiguous by construction
+            fff_vector_memcpy(vb, &Vb_flat)
+            s2.data[0] = rkfilt.s2
+            a.data[0] = rkfilt.a
+            fffpy_multi_iterator_update(multi)
+
+        # Dof 
+        dof = rkfilt.dof
+
+        # Free memory
+        fff_matrix_delete(x)
+        fff_glm_RKF_delete(rkfilt) 
+        fffpy_multi_iterator_delete(multi)
     
     # Reshape variance array
-    dims[axis] = p
-    dims.insert(axis+1, p)
-    VB = VB.reshape(dims)
+    if vb_storage == 'full':
+        dims[axis] = p
+        dims.insert(axis+1, p)
+        VB = VB.reshape(dims)
+        dims[axis] = 1
+        del dims[axis+1]
 
     # Return
-    return B, VB, S2, dof, A
+    if CV is None:
+        return B, VB, S2, dof, A
+    CVs = []
+    start = 0
+    for c in cons:
+        q = c.shape[0]
+        cv = CV[(slice(None),) * axis + (slice(start, start + q*q),)]
+        if q > 1:
+            dims[axis] = q
+            dims.insert(axis+1, q)
+            cv = cv.reshape(dims)
+            dims[axis] = 1
+            del dims[axis+1]
+        CVs.append(cv)
+        start += q*q
+    return B, VB, S2, dof, A, CVs
+
+
+def unpack(VB, int axis=0):
+    """
+    VB_full = unpack(VB, axis=0)
+
+    Unpack the p*(p+1)/2 upper triangle values at `axis` of `VB`, as
+    stored by ar1 with vb_storage='packed', to full symmetric p x p
+    matrices at `axis` and `axis`+1.
+    """
+    VB = np.asarray(VB)
+    n = VB.shape[axis]
+    p = int((np.sqrt(8*n + 1) - 1) / 2)
+    if p*(p+1)/2 != n:
+        raise ValueError('Axis length is not a triangular number')
+    VB = np.rollaxis(VB, axis, VB.ndim)
+    i, j = np.triu_indices(p)
+    full = np.zeros(VB.shape[:-1] + (p, p), dtype=VB.dtype)
+    full[..., i, j] = VB
+    full[..., j, i] = VB
+    full = np.rollaxis(full, full.ndim - 2, axis)
+    return np.rollaxis(full, full.ndim - 1, axis + 1)
     
 
 
@@ -1,8 +1,14 @@
 #!/usr/bin/env python
 
-from numpy.testing import assert_almost_equal, TestCase
+import os
+from tempfile import mktemp
+
+from numpy.testing import assert_almost_equal, assert_array_equal, \
+    assert_equal, assert_allclose, TestCase
+from nose.tools import assert_true
 import numpy as np
-from nipy.neurospin.glm.glm import glm
+from nipy.neurospin.glm.glm import glm, load
+from nipy.neurospin.glm import kalman
 
 class TestFitting(TestCase):
 
@@ -45,6 +51,115 @@ class TestFitting(TestCase):
     def test_ols_axis3(self):
         self.make_data()
         self.ols(3)
+
+    def threads(self, axis):
+        y = np.rollaxis(self.y, 0, axis+1)
+        X = self.X
+        for model, method in (('spherical', 'kalman'), ('ar1', 'kalman')):
+            m = glm(y, X, axis=axis, model=model, method=method)
+            m1 = glm(y, X, axis=axis, model=model, method=method, n_threads=3)
+            for name in ('beta', 'nvbeta', 's2', 'dof', 'a'):
+                assert_array_equal(getattr(m, name), getattr(m1, name))
+
+    def test_threads_axis0(self):
+        self.make_data()
+        self.threads(0)
+
+    def test_threads_axis2(self):
+        self.make_data()
+        self.threads(2)
+
+    def test_threads_error(self):
+        # An error in any range thread, not only the last one, is raised
+        # by the threaded fit
+        def fit_range(Y, start, stop):
+            if start == 0:
+                raise ZeroDivisionError
+            return stop
+        Y = np.zeros((5, 6))
+        self.assertRaises(ZeroDivisionError, kalman._fit_threads, fit_range,
+                          Y, (), 0, 3)
+        self.assertEqual(kalman._fit_threads(lambda Y, start, stop: stop,
+                                             Y, (), 0, 3), 6)
+
+    def vb_storage(self, axis):
+        y = np.rollaxis(self.y, 0, axis+1)
+        X = self.X
+        c1 = np.array([0, 1])
+        c2 = np.eye(2)
+        m = glm(y, X, axis=axis, model='ar1')
+        t1, F2 = m.contrast(c1).stat(), m.contrast(c2).stat()
+        for storage, dtype, decimal in (('packed', np.double, 6),
+                                        ('packed', np.float32, 3),
+                                        ('none', np.double, 6)):
+            m1 = glm(y, X, axis=axis, model='ar1', vb_storage=storage,
+                     vb_dtype=dtype, contrasts=[c1, c2])
+            assert_array_equal(m.beta, m1.beta)
+            fname = mktemp('.npz')
+            try:
+                m1.save(fname)
+                m2 = load(fname)
+            finally:
+                os.remove(fname)
+            for mod in (m1, m2):
+                assert_almost_equal(mod.contrast(c1).stat(), t1, decimal)
+                assert_almost_equal(mod.contrast(c2).stat(), F2, decimal)
+                if storage == 'packed':
+                    assert_equal(mod.nvbeta.dtype, dtype)
+                    # Undeclared contrast from packed variances
+                    assert_almost_equal(mod.contrast([1, 0]).stat(),
+                                        m.contrast([1, 0]).stat(), decimal)
+                else:
+                    assert_equal(mod.nvbeta, None)
+                    self.assertRaises(ValueError, mod.contrast, [1, 0])
+        
+    def contrasts(self, axis):
+        y = np.rollaxis(self.y, 0, axis+1)
+        X = np.c_[self.X, np.random.randn(self.X.shape[0])]
+        cs = [np.array([0, 1, 0]), np.array([[1, 0, 0]]),
+              np.array([[0, 1, 0], [0, 0, 1]]), np.eye(3)]
+        for kwargs in ({}, {'method': 'kalman'}, {'model': 'ar1'},
+                       {'model': 'ar1', 'vb_storage': 'packed'},
+                       {'model': 'ar1', 'vb_storage': 'none',
+                        'contrasts': cs}):
+            m = glm(y, X, axis=axis, **kwargs)
+            for type in ('t', 'F', 'tmin'):
+                out = m.contrasts(cs, type=type, baseline=0.1,
+                                  block_size=500)
+                assert_equal(out.shape, (len(cs),) + m.s2.shape)
+                for i in range(len(cs)):
+                    con = m.contrast(cs[i], type=type)
+                    z = con.zscore(0.1)
+                    if con.dim == 1:
+                        assert_allclose(out['effect'][i],
+                                        con.effect.squeeze())
+                        assert_allclose(out['variance'][i],
+                                        con.variance.squeeze())
+                    else:
+                        assert_true(np.all(np.isnan(out['effect'][i])))
+                    assert_allclose(out['stat'][i],
+                                    con.stat(0.1).squeeze(), rtol=1e-6)
+                    assert_allclose(out['pvalue'][i],
+                                    con.pvalue(0.1).squeeze(),
+                                    rtol=1e-6, atol=1e-12)
+                    assert_allclose(out['zscore'][i], z.squeeze(),
+                                    rtol=1e-6, atol=1e-12)
+
+    def test_contrasts_axis0(self):
+        self.make_data()
+        self.contrasts(0)
+
+    def test_contrasts_axis2(self):
+        self.make_data()
+        self.contrasts(2)
+
+    def test_vb_storage_axis0(self):
+        self.make_data()
+        self.vb_storage(0)
+
+    def test_vb_storage_axis3(self):
+        self.make_data()
+        self.vb_storage(3)
     
     
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+# -*- Mode: Python -*-  Not really, but the syntax is close enough
+"""
+Union-find labelling of the connected components of thresholded maps
+on a graph in compressed sparse row (CSR) format.
+"""
+
+import numpy as np
+cimport numpy as np
+
+
+cdef inline long _find(long* parent, long i):
+    # Root of vertex i, with path halving
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def threshold_labels(np.ndarray values, np.ndarray indptr,
+                     np.ndarray indices, np.ndarray thresholds):
+    """
+    labels = threshold_labels(values, indptr, indices, thresholds)
+
+    Label the connected components of the vertices such that values
+    >= threshold, for each threshold in turn.  The thresholds are
+    processed in descending order, merging the components of the
+    previous threshold with the newly added vertices.
+
+    values and thresholds are contiguous double arrays, indptr and
+    indices contiguous long arrays giving the neighbours of vertex i
+    as indices[indptr[i]:indptr[i+1]].  Returns a (len(thresholds),
+    len(values)) long array, where components are numbered from 0 in
+    the order of their first vertex, and other vertices have label -1.
+    """
+    cdef long n = values.shape[0], nth = thresholds.shape[0]
+    cdef long i, j, e, r, ri, rj, pos, t, nlab
+    cdef double th
+    cdef double* val = <double*>values.data
+    cdef double* ths = <double*>thresholds.data
+    cdef long* ptr = <long*>indptr.data
+    cdef long* idx = <long*>indices.data
+    cdef long *parent, *size, *stamp, *rootlab, *lab, *order, *th_order
+    cdef char* active
+    cdef np.ndarray Parent, Size, Stamp, Rootlab, Active, Order, Th_order, Labels
+
+    Labels = -np.ones((nth, n), dtype=np.int)
+    Parent = np.arange(n, dtype=np.int)
+    Size = np.ones(n, dtype=np.int)
+    Stamp = -np.ones(n, dtype=np.int)
+    Rootlab = np.zeros(n, dtype=np.int)
+    Active = np.zeros(n, dtype=np.int8)
+    # Vertices and thresholds by decreasing values (NaNs last)
+    Order = np.argsort(-values, kind='mergesort').astype(np.int)
+    Th_order = np.argsort(-thresholds, kind='mergesort').astype(np.int)
+    parent = <long*>Parent.data
+    size = <long*>Size.data
+    stamp = <long*>Stamp.data
+    rootlab = <long*>Rootlab.data
+    active = <char*>Active.data
+    order = <long*>Order.data
+    th_order = <long*>Th_order.data
+
+    pos = 0
+    for t from 0 <= t < nth:
+        th = ths[th_order[t]]
+        # Add the vertices above threshold, merging with their active
+        # neighbours
+        while pos < n:
+            i = order[pos]
+            if not val[i] >= th:
+                break
+            active[i] = 1
+            for e from ptr[i] <= e < ptr[i+1]:
+                j = idx[e]
+                if active[j]:
+                    ri = _find(parent, i)
+                    rj = _find(parent, j)
+                    if ri != rj:
+                        if size[ri] < size[rj]:
+                            ri, rj = rj, ri
+                        parent[rj] = ri
+                        size[ri] = size[ri] + size[rj]
+            pos = pos + 1
+        # Number the components in the order of their first vertex
+        lab = <long*>Labels.data + th_order[t]*n
+        nlab = 0
+        for i from 0 <= i < n:
+            if active[i]:
+                r = _find(parent, i)
+                if stamp[r] != t:
+                    stamp[r] = t
+                    rootlab[r] = nlab
+                    nlab = nlab + 1
+                lab[i] = rootlab[r]
+    return Labels
@@ -0,0 +1,113 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+"""
+Cluster labelling of thresholded maps on a fixed neighbourhood graph.
+
+The graph is stored once in compressed sparse row (CSR) format, and the
+suprathreshold components are labelled by union-find in compiled code,
+so that labelling the map of each permutation of a permutation test
+does not rebuild the graph.
+"""
+
+import numpy as np
+
+from _clusters import threshold_labels
+
+
+def grid_offsets(k=18):
+    """
+    Offsets of the k neighbours of a voxel in a 3D grid (k = 6, 18 or 26)
+    """
+    if k not in (6, 18, 26):
+        raise ValueError('k should be 6, 18 or 26')
+    d = np.array(np.where(np.ones((3, 3, 3)))).T - 1
+    dist = np.abs(d).sum(1)
+    if k == 6:
+        keep = dist == 1
+    elif k == 18:
+        keep = (dist > 0) & (dist < 3)
+    else:
+        keep = dist > 0
+    return d[keep]
+
+
+class CSRGraph(object):
+    """
+    Unweighted graph in compressed sparse row format: the neighbours of
+    vertex i are indices[indptr[i]:indptr[i+1]].
+    """
+
+    def __init__(self, indptr, indices):
+        self.indptr = np.ascontiguousarray(indptr, dtype=np.int)
+        self.indices = np.ascontiguousarray(indices, dtype=np.int)
+        self.V = len(self.indptr) - 1
+
+    @classmethod
+    def from_edges(cls, V, edges):
+        """
+        Graph with V vertices and the (E, 2) array of edges, as in the
+        edges attribute of nipy.neurospin.graph.WeightedGraph. The
+        edges are made symmetric, without duplicates.
+        """
+        # 64 bit pairs, as V**2 overflows a 32 bit C long for whole-brain
+        # graphs
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        # Sorted unique (source, target) pairs, in both directions
+        pairs = np.unique(np.concatenate((edges[:, 0] * V + edges[:, 1],
+                                          edges[:, 1] * V + edges[:, 0])))
+        counts = np.bincount(pairs // V, minlength=V)
+        indptr = np.concatenate(([0], np.cumsum(counts)))
+        return cls(indptr, pairs % V)
+
+    @classmethod
+    def from_3d_grid(cls, xyz, k=18):
+        """
+        Topological neighbours graph of the (V, 3) voxel coordinates xyz,
+        in the k-connectivity scheme (6, 18 or 26)
+        """
+        xyz = np.asarray(xyz, dtype=np.int)
+        V = xyz.shape[0]
+        if V == 0:
+            return cls(np.zeros(1), np.zeros(0))
+        # Index volume of the bounding box, with a one voxel border
+        c = xyz - xyz.min(0) + 1
+        volume = -np.ones(c.max(0) + 2, dtype=np.int)
+        volume[c[:, 0], c[:, 1], c[:, 2]] = np.arange(V)
+        sources, targets = [], []
+        for d in grid_offsets(k):
+            nbr = volume[c[:, 0] + d[0], c[:, 1] + d[1], c[:, 2] + d[2]]
+            found = np.where(nbr >= 0)[0]
+            sources.append(found)
+            targets.append(nbr[found])
+        edges = np.array([np.concatenate(sources), np.concatenate(targets)])
+        return cls.from_edges(V, edges.T)
+
+    def threshold_labels(self, values, thresholds):
+        """
+        Connected components of the vertices with values >= threshold
+
+        Parameters
+        ----------
+        values : array of shape (V,)
+        thresholds : float or sequence of floats
+            All thresholds are processed in a single pass, in descending
+            order, merging components as the threshold decreases.
+
+        Returns
+        -------
+        labels : array of shape (V,), or (len(thresholds), V) for a
+            sequence of thresholds. Components are numbered from 0 in
+            the order of their first vertex, and vertices below
+            threshold are labelled -1.
+        """
+        values = np.ascontiguousarray(values, dtype=np.double)
+        if values.shape != (self.V,):
+            raise ValueError('values should have shape (%d,)' % self.V)
+        scalar = np.isscalar(thresholds)
+        thresholds = np.ascontiguousarray(np.atleast_1d(thresholds),
+                                          dtype=np.double)
+        labels = threshold_labels(values, self.indptr, self.indices,
+                                  thresholds)
+        if scalar:
+            return labels[0]
+        return labels
@@ -28,6 +28,10 @@ def configuration(parent_package='',top_path=None):
                 libraries=['cstat'],
                 extra_info=lapack_info,
                 )
+    config.add_extension(
+                '_clusters',
+                sources=['_clusters.pyx'],
+                )
     
     return config
     
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+import numpy as np
+from numpy.testing import assert_array_equal
+from nose.tools import assert_equal
+
+import nipy.neurospin.graph as fg
+from nipy.neurospin.graph.clusters import CSRGraph
+
+
+def random_mask(shape=(10, 11, 12), density=.6):
+    rng = np.random.RandomState(0)
+    return np.array(np.where(rng.rand(*shape) < density)).T
+
+
+def test_grid_degrees():
+    xyz = np.array(np.where(np.ones((3, 3, 3)))).T
+    for k in (6, 18, 26):
+        G = CSRGraph.from_3d_grid(xyz, k)
+        # the central voxel has all its neighbours
+        assert_equal(np.diff(G.indptr)[13], k)
+        # same edges as graph_3d_grid, without the self-edges
+        A, B, D = fg.graph_3d_grid(xyz, k)
+        assert_equal(len(G.indices), np.sum(A != B))
+
+
+def test_threshold_labels():
+    xyz = random_mask()
+    rng = np.random.RandomState(1)
+    values = rng.randn(len(xyz))
+    thresholds = [0.5, 2., -1.]
+    for k in (6, 18, 26):
+        G = CSRGraph.from_3d_grid(xyz, k)
+        labels = G.threshold_labels(values, thresholds)
+        for th, L in zip(thresholds, labels):
+            I = np.where(values >= th)[0]
+            A, B, D = fg.graph_3d_grid(xyz[I], k)
+            assert_array_equal(L[I], fg.graph_cc(A, B, D, len(I)))
+            assert_array_equal(L[values < th], -1)
+            assert_array_equal(G.threshold_labels(values, th), L)
+
+
+def test_from_edges():
+    xyz = random_mask()
+    G = CSRGraph.from_3d_grid(xyz)
+    # one direction per edge is enough
+    sources = np.repeat(np.arange(G.V), np.diff(G.indptr))
+    edges = np.array([sources, G.indices]).T
+    G2 = CSRGraph.from_edges(G.V, edges[sources < G.indices])
+    assert_array_equal(G2.indptr, G.indptr)
+    assert_array_equal(G2.indices, G.indices)
+
+
+def test_from_edges_large():
+    # the (source, target) pairs of V**2 > 2**32 do not overflow
+    V = 100000
+    edges = np.array([[V - 1, V - 2], [0, V - 1], [V - 2, V - 1]], np.int32)
+    G = CSRGraph.from_edges(V, edges)
+    assert_equal(G.V, V)
+    assert_array_equal(G.indices[G.indptr[0]:G.indptr[1]], [V - 1])
+    assert_array_equal(G.indices[G.indptr[V - 2]:G.indptr[V - 1]], [V - 1])
+    assert_array_equal(G.indices[G.indptr[V - 1]:], [0, V - 2])
+
+
+if __name__ == '__main__':
+    import nose
+    nose.run(argv=['', __file__])
@@ -1,4 +1,4 @@
-/* Generated by Cython 0.12.1 on Wed May 12 21:17:33 2010 */
+/* Generated by Cython 0.12.1 on Sun Oct 18 05:40:01 2026 */
 
 #define PY_SSIZE_T_CLEAN
 #include "Python.h"
@@ -465,6 +465,8 @@ static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObje
     }
 }
 
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
+
 static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
 
 static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void);
@@ -472,8 +474,6 @@ static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void);
 static PyObject *__Pyx_UnpackItem(PyObject *, Py_ssize_t index); /*proto*/
 static int __Pyx_EndUnpack(PyObject *); /*proto*/
 
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
-
 static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
 
 static void __Pyx_UnpackTupleError(PyObject *, Py_ssize_t index); /*proto*/
@@ -660,6 +660,7 @@ static char __pyx_k__I[] = "I";
 static char __pyx_k__L[] = "L";
 static char __pyx_k__O[] = "O";
 static char __pyx_k__Q[] = "Q";
+static char __pyx_k__T[] = "T";
 static char __pyx_k__V[] = "V";
 static char __pyx_k__Y[] = "Y";
 static char __pyx_k__b[] = "b";
@@ -677,15 +678,18 @@ static char __pyx_k__id[] = "id";
 static char __pyx_k__np[] = "np";
 static char __pyx_k__buf[] = "buf";
 static char __pyx_k__elr[] = "elr";
+static char __pyx_k__inf[] = "inf";
 static char __pyx_k__obj[] = "obj";
 static char __pyx_k__axis[] = "axis";
 static char __pyx_k__base[] = "base";
 static char __pyx_k__data[] = "data";
+static char __pyx_k__fill[] = "fill";
 static char __pyx_k__mean[] = "mean";
 static char __pyx_k__ndim[] = "ndim";
 static char __pyx_k__sign[] = "sign";
 static char __pyx_k__size[] = "size";
 static char __pyx_k__descr[] = "descr";
+static char __pyx_k__dtype[] = "dtype";
 static char __pyx_k__grubb[] = "grubb";
 static char __pyx_k__index[] = "index";
 static char __pyx_k__names[] = "names";
@@ -697,13 +701,16 @@ static char __pyx_k__stats[] = "stats";
 static char __pyx_k__tukey[] = "tukey";
 static char __pyx_k__zeros[] = "zeros";
 static char __pyx_k__Magics[] = "Magics";
+static char __pyx_k__double[] = "double";
 static char __pyx_k__fields[] = "fields";
 static char __pyx_k__format[] = "format";
 static char __pyx_k__median[] = "median";
 static char __pyx_k__stride[] = "stride";
 static char __pyx_k__vector[] = "vector";
+static char __pyx_k__asarray[] = "asarray";
 static char __pyx_k__elr_mfx[] = "elr_mfx";
 static char __pyx_k__laplace[] = "laplace";
+static char __pyx_k__reshape[] = "reshape";
 static char __pyx_k__strides[] = "strides";
 static char __pyx_k__student[] = "student";
 static char __pyx_k____main__[] = "__main__";
@@ -732,11 +739,13 @@ static PyObject *__pyx_kp_u_6;
 static PyObject *__pyx_kp_s_8;
 static PyObject *__pyx_n_s__Magics;
 static PyObject *__pyx_n_s__RuntimeError;
+static PyObject *__pyx_n_s__T;
 static PyObject *__pyx_n_s__V;
 static PyObject *__pyx_n_s__ValueError;
 static PyObject *__pyx_n_s__Y;
 static PyObject *__pyx_n_s____main__;
 static PyObject *__pyx_n_s____version__;
+static PyObject *__pyx_n_s__asarray;
 static PyObject *__pyx_n_s__axis;
 static PyObject *__pyx_n_s__base;
 static PyObject *__pyx_n_s__buf;
@@ -744,13 +753,17 @@ static PyObject *__pyx_n_s__byteorder;
 static PyObject *__pyx_n_s__constraint;
 static PyObject *__pyx_n_s__data;
 static PyObject *__pyx_n_s__descr;
+static PyObject *__pyx_n_s__double;
+static PyObject *__pyx_n_s__dtype;
 static PyObject *__pyx_n_s__elr;
 static PyObject *__pyx_n_s__elr_mfx;
 static PyObject *__pyx_n_s__fields;
+static PyObject *__pyx_n_s__fill;
 static PyObject *__pyx_n_s__format;
 static PyObject *__pyx_n_s__grubb;
 static PyObject *__pyx_n_s__id;
 static PyObject *__pyx_n_s__index;
+static PyObject *__pyx_n_s__inf;
 static PyObject *__pyx_n_s__itemsize;
 static PyObject *__pyx_n_s__laplace;
 static PyObject *__pyx_n_s__mean;
@@ -766,6 +779,7 @@ static PyObject *__pyx_n_s__numpy;
 static PyObject *__pyx_n_s__obj;
 static PyObject *__pyx_n_s__range;
 static PyObject *__pyx_n_s__readonly;
+static PyObject *__pyx_n_s__reshape;
 static PyObject *__pyx_n_s__shape;
 static PyObject *__pyx_n_s__sign;
 static PyObject *__pyx_n_s__sign_mfx;
@@ -785,7 +799,7 @@ static PyObject *__pyx_n_s__zeros;
 static PyObject *__pyx_int_1;
 static PyObject *__pyx_int_15;
 
-/* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":88
+/* "/root/package/nipy/neurospin/group/onesample.pyx":88
  * 
  * # Test stat without mixed-effect correction
  * def stat(ndarray Y, id='student', double base=0.0,             # <<<<<<<<<<<<<<
@@ -831,7 +845,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
   __pyx_self = __pyx_self;
   if (unlikely(__pyx_kwds)) {
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":89
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":89
  * # Test stat without mixed-effect correction
  * def stat(ndarray Y, id='student', double base=0.0,
  *          int axis=0, ndarray Magics=None):             # <<<<<<<<<<<<<<
@@ -886,7 +900,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
       __pyx_v_base = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_base == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
 
-      /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":88
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":88
  * 
  * # Test stat without mixed-effect correction
  * def stat(ndarray Y, id='student', double base=0.0,             # <<<<<<<<<<<<<<
@@ -906,7 +920,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
     __pyx_v_base = ((double)0.0);
     __pyx_v_axis = ((int)0);
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":89
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":89
  * # Test stat without mixed-effect correction
  * def stat(ndarray Y, id='student', double base=0.0,
  *          int axis=0, ndarray Magics=None):             # <<<<<<<<<<<<<<
@@ -940,7 +954,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
   if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Magics), __pyx_ptype_5numpy_ndarray, 1, "Magics", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":98
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":98
  *   cdef fff_vector *y, *t, *magics, *yp
  *   cdef fff_onesample_stat* stat
  *   cdef fff_onesample_stat_flag flag_stat = stats[id]             # <<<<<<<<<<<<<<
@@ -956,7 +970,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_flag_stat = __pyx_t_3;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":105
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":105
  * 
  *   # Get number of observations
  *   n = <unsigned int>Y.shape[axis]             # <<<<<<<<<<<<<<
@@ -965,7 +979,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
   __pyx_v_n = ((unsigned int)(__pyx_v_Y->dimensions[__pyx_v_axis]));
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":108
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":108
  * 
  *   # Read out magic numbers
  *   if Magics == None:             # <<<<<<<<<<<<<<
@@ -978,7 +992,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   if (__pyx_t_4) {
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":109
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":109
  *   # Read out magic numbers
  *   if Magics == None:
  *     magics = fff_vector_new(1)             # <<<<<<<<<<<<<<
@@ -987,7 +1001,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
     __pyx_v_magics = fff_vector_new(1);
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":110
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":110
  *   if Magics == None:
  *     magics = fff_vector_new(1)
  *     magics.data[0] = 0 ## Just to make sure             # <<<<<<<<<<<<<<
@@ -999,7 +1013,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
   }
   /*else*/ {
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":112
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":112
  *     magics.data[0] = 0 ## Just to make sure
  *   else:
  *     magics = fff_vector_fromPyArray(Magics)             # <<<<<<<<<<<<<<
@@ -1010,7 +1024,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
   }
   __pyx_L6:;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":115
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":115
  * 
  *   # Create output array
  *   nsimu = magics.size             # <<<<<<<<<<<<<<
@@ -1019,7 +1033,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
   __pyx_v_nsimu = __pyx_v_magics->size;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":116
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":116
  *   # Create output array
  *   nsimu = magics.size
  *   dims = [Y.shape[i] for i in range(Y.ndim)]             # <<<<<<<<<<<<<<
@@ -1075,7 +1089,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
   __pyx_v_dims = ((PyObject *)__pyx_t_2);
   __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":117
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":117
  *   nsimu = magics.size
  *   dims = [Y.shape[i] for i in range(Y.ndim)]
  *   dims[axis] = nsimu             # <<<<<<<<<<<<<<
@@ -1087,7 +1101,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
   if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_t_2, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":118
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":118
  *   dims = [Y.shape[i] for i in range(Y.ndim)]
  *   dims[axis] = nsimu
  *   T = np.zeros(dims)             # <<<<<<<<<<<<<<
@@ -1112,7 +1126,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
   __pyx_v_T = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":121
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":121
  * 
  *   # Create local structure
  *   stat = fff_onesample_stat_new(n, flag_stat, base)             # <<<<<<<<<<<<<<
@@ -1121,7 +1135,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
   __pyx_v_stat = fff_onesample_stat_new(__pyx_v_n, __pyx_v_flag_stat, __pyx_v_base);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":122
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":122
  *   # Create local structure
  *   stat = fff_onesample_stat_new(n, flag_stat, base)
  *   yp = fff_vector_new(n)             # <<<<<<<<<<<<<<
@@ -1130,7 +1144,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
   __pyx_v_yp = fff_vector_new(__pyx_v_n);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":125
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":125
  * 
  *   # Multi-iterator
  *   multi = fffpy_multi_iterator_new(2, axis, <void*>Y, <void*>T)             # <<<<<<<<<<<<<<
@@ -1139,7 +1153,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
   __pyx_v_multi = fffpy_multi_iterator_new(2, __pyx_v_axis, ((void *)__pyx_v_Y), ((void *)__pyx_v_T));
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":128
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":128
  * 
  *   # Vector views
  *   y = multi.vector[0]             # <<<<<<<<<<<<<<
@@ -1148,7 +1162,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
   __pyx_v_y = (__pyx_v_multi->vector[0]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":129
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":129
  *   # Vector views
  *   y = multi.vector[0]
  *   t = multi.vector[1]             # <<<<<<<<<<<<<<
@@ -1157,7 +1171,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
   __pyx_v_t = (__pyx_v_multi->vector[1]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":132
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":132
  * 
  *   # Loop
  *   for simu from 0 <= simu < nsimu:             # <<<<<<<<<<<<<<
@@ -1167,7 +1181,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
   __pyx_t_9 = __pyx_v_nsimu;
   for (__pyx_v_simu = 0; __pyx_v_simu < __pyx_t_9; __pyx_v_simu++) {
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":135
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":135
  * 
  *     # Set the magic number
  *     magic = magics.data[simu*magics.stride]             # <<<<<<<<<<<<<<
@@ -1176,7 +1190,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
     __pyx_v_magic = (__pyx_v_magics->data[(__pyx_v_simu * __pyx_v_magics->stride)]);
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":138
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":138
  * 
  *     # Reset the multi-iterator
  *     fffpy_multi_iterator_reset(multi);             # <<<<<<<<<<<<<<
@@ -1185,7 +1199,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
     fffpy_multi_iterator_reset(__pyx_v_multi);
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":141
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":141
  * 
  *     # Perform the loop
  *     idx = simu*t.stride             # <<<<<<<<<<<<<<
@@ -1194,7 +1208,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
     __pyx_v_idx = (__pyx_v_simu * __pyx_v_t->stride);
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":142
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":142
  *     # Perform the loop
  *     idx = simu*t.stride
  *     while(multi.index < multi.size):             # <<<<<<<<<<<<<<
@@ -1205,7 +1219,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
       __pyx_t_4 = (__pyx_v_multi->index < __pyx_v_multi->size);
       if (!__pyx_t_4) break;
 
-      /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":143
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":143
  *     idx = simu*t.stride
  *     while(multi.index < multi.size):
  *       fff_onesample_permute_signs(yp, y, magic)             # <<<<<<<<<<<<<<
@@ -1214,7 +1228,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
       fff_onesample_permute_signs(__pyx_v_yp, __pyx_v_y, __pyx_v_magic);
 
-      /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":144
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":144
  *     while(multi.index < multi.size):
  *       fff_onesample_permute_signs(yp, y, magic)
  *       t.data[idx] = fff_onesample_stat_eval(stat, yp)             # <<<<<<<<<<<<<<
@@ -1223,7 +1237,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
       (__pyx_v_t->data[__pyx_v_idx]) = fff_onesample_stat_eval(__pyx_v_stat, __pyx_v_yp);
 
-      /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":145
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":145
  *       fff_onesample_permute_signs(yp, y, magic)
  *       t.data[idx] = fff_onesample_stat_eval(stat, yp)
  *       fffpy_multi_iterator_update(multi)             # <<<<<<<<<<<<<<
@@ -1234,7 +1248,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
     }
   }
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":148
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":148
  * 
  *   # Free memory
  *   fffpy_multi_iterator_delete(multi)             # <<<<<<<<<<<<<<
@@ -1243,7 +1257,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
   fffpy_multi_iterator_delete(__pyx_v_multi);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":149
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":149
  *   # Free memory
  *   fffpy_multi_iterator_delete(multi)
  *   fff_vector_delete(yp)             # <<<<<<<<<<<<<<
@@ -1252,7 +1266,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
   fff_vector_delete(__pyx_v_yp);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":150
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":150
  *   fffpy_multi_iterator_delete(multi)
  *   fff_vector_delete(yp)
  *   fff_vector_delete(magics)             # <<<<<<<<<<<<<<
@@ -1261,7 +1275,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
   fff_vector_delete(__pyx_v_magics);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":151
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":151
  *   fff_vector_delete(yp)
  *   fff_vector_delete(magics)
  *   fff_onesample_stat_delete(stat)             # <<<<<<<<<<<<<<
@@ -1270,7 +1284,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
  */
   fff_onesample_stat_delete(__pyx_v_stat);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":154
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":154
  * 
  *   # Return
  *   return T             # <<<<<<<<<<<<<<
@@ -1302,7 +1316,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat(PyObject *__py
   return __pyx_r;
 }
 
-/* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":157
+/* "/root/package/nipy/neurospin/group/onesample.pyx":157
  * 
  * 
  * def stat_mfx(ndarray Y, ndarray V, id='student_mfx', double base=0.0,             # <<<<<<<<<<<<<<
@@ -1351,7 +1365,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
   __pyx_self = __pyx_self;
   if (unlikely(__pyx_kwds)) {
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":158
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":158
  * 
  * def stat_mfx(ndarray Y, ndarray V, id='student_mfx', double base=0.0,
  *              int axis=0, ndarray Magics=None, unsigned int niter=5):             # <<<<<<<<<<<<<<
@@ -1420,7 +1434,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
       __pyx_v_base = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_base == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
 
-      /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":157
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":157
  * 
  * 
  * def stat_mfx(ndarray Y, ndarray V, id='student_mfx', double base=0.0,             # <<<<<<<<<<<<<<
@@ -1445,7 +1459,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
     __pyx_v_base = ((double)0.0);
     __pyx_v_axis = ((int)0);
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":158
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":158
  * 
  * def stat_mfx(ndarray Y, ndarray V, id='student_mfx', double base=0.0,
  *              int axis=0, ndarray Magics=None, unsigned int niter=5):             # <<<<<<<<<<<<<<
@@ -1491,7 +1505,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
   if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_V), __pyx_ptype_5numpy_ndarray, 1, "V", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Magics), __pyx_ptype_5numpy_ndarray, 1, "Magics", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":167
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":167
  *   cdef fff_vector *y, *v, *t, *magics, *yp
  *   cdef fff_onesample_stat_mfx* stat
  *   cdef fff_onesample_stat_flag flag_stat = stats[id]             # <<<<<<<<<<<<<<
@@ -1507,7 +1521,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_flag_stat = __pyx_t_3;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":174
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":174
  * 
  *   # Get number of observations
  *   n = <int>Y.shape[axis]             # <<<<<<<<<<<<<<
@@ -1516,7 +1530,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
   __pyx_v_n = ((int)(__pyx_v_Y->dimensions[__pyx_v_axis]));
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":177
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":177
  * 
  *   # Read out magic numbers
  *   if Magics == None:             # <<<<<<<<<<<<<<
@@ -1529,7 +1543,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   if (__pyx_t_4) {
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":178
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":178
  *   # Read out magic numbers
  *   if Magics == None:
  *     magics = fff_vector_new(1)             # <<<<<<<<<<<<<<
@@ -1538,7 +1552,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
     __pyx_v_magics = fff_vector_new(1);
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":179
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":179
  *   if Magics == None:
  *     magics = fff_vector_new(1)
  *     magics.data[0] = 0 ## Just to make sure             # <<<<<<<<<<<<<<
@@ -1550,7 +1564,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
   }
   /*else*/ {
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":181
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":181
  *     magics.data[0] = 0 ## Just to make sure
  *   else:
  *     magics = fff_vector_fromPyArray(Magics)             # <<<<<<<<<<<<<<
@@ -1561,7 +1575,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
   }
   __pyx_L6:;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":184
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":184
  * 
  *   # Create output array
  *   nsimu = magics.size             # <<<<<<<<<<<<<<
@@ -1574,7 +1588,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
   __pyx_v_nsimu = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":185
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":185
  *   # Create output array
  *   nsimu = magics.size
  *   dims = [Y.shape[i] for i in range(Y.ndim)]             # <<<<<<<<<<<<<<
@@ -1630,7 +1644,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
   __pyx_v_dims = ((PyObject *)__pyx_t_2);
   __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":186
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":186
  *   nsimu = magics.size
  *   dims = [Y.shape[i] for i in range(Y.ndim)]
  *   dims[axis] = nsimu             # <<<<<<<<<<<<<<
@@ -1639,7 +1653,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
   if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_v_nsimu, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":187
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":187
  *   dims = [Y.shape[i] for i in range(Y.ndim)]
  *   dims[axis] = nsimu
  *   T = np.zeros(dims)             # <<<<<<<<<<<<<<
@@ -1664,7 +1678,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
   __pyx_v_T = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":190
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":190
  * 
  *   # Create local structure
  *   stat = fff_onesample_stat_mfx_new(n, flag_stat, base)             # <<<<<<<<<<<<<<
@@ -1673,7 +1687,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
   __pyx_v_stat = fff_onesample_stat_mfx_new(__pyx_v_n, __pyx_v_flag_stat, __pyx_v_base);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":191
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":191
  *   # Create local structure
  *   stat = fff_onesample_stat_mfx_new(n, flag_stat, base)
  *   stat.niter = niter             # <<<<<<<<<<<<<<
@@ -1682,7 +1696,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
   __pyx_v_stat->niter = __pyx_v_niter;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":192
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":192
  *   stat = fff_onesample_stat_mfx_new(n, flag_stat, base)
  *   stat.niter = niter
  *   yp = fff_vector_new(n)             # <<<<<<<<<<<<<<
@@ -1691,7 +1705,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
   __pyx_v_yp = fff_vector_new(__pyx_v_n);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":195
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":195
  * 
  *   # Multi-iterator
  *   multi = fffpy_multi_iterator_new(3, axis, <void*>Y, <void*>V, <void*>T)             # <<<<<<<<<<<<<<
@@ -1700,7 +1714,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
   __pyx_v_multi = fffpy_multi_iterator_new(3, __pyx_v_axis, ((void *)__pyx_v_Y), ((void *)__pyx_v_V), ((void *)__pyx_v_T));
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":198
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":198
  * 
  *   # Vector views
  *   y = multi.vector[0]             # <<<<<<<<<<<<<<
@@ -1709,7 +1723,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
   __pyx_v_y = (__pyx_v_multi->vector[0]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":199
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":199
  *   # Vector views
  *   y = multi.vector[0]
  *   v = multi.vector[1]             # <<<<<<<<<<<<<<
@@ -1718,7 +1732,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
   __pyx_v_v = (__pyx_v_multi->vector[1]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":200
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":200
  *   y = multi.vector[0]
  *   v = multi.vector[1]
  *   t = multi.vector[2]             # <<<<<<<<<<<<<<
@@ -1727,7 +1741,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
   __pyx_v_t = (__pyx_v_multi->vector[2]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":203
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":203
  * 
  *   # Loop
  *   for simu from 0 <= simu < nsimu:             # <<<<<<<<<<<<<<
@@ -1737,7 +1751,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
   __pyx_t_9 = __Pyx_PyInt_AsUnsignedLong(__pyx_v_nsimu); if (unlikely((__pyx_t_9 == (unsigned long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   for (__pyx_v_simu = 0; __pyx_v_simu < __pyx_t_9; __pyx_v_simu++) {
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":206
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":206
  * 
  *     # Set the magic number
  *     magic = magics.data[simu*magics.stride]             # <<<<<<<<<<<<<<
@@ -1746,7 +1760,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
     __pyx_v_magic = (__pyx_v_magics->data[(__pyx_v_simu * __pyx_v_magics->stride)]);
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":209
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":209
  * 
  *     # Reset the multi-iterator
  *     fffpy_multi_iterator_reset(multi)             # <<<<<<<<<<<<<<
@@ -1755,7 +1769,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
     fffpy_multi_iterator_reset(__pyx_v_multi);
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":212
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":212
  * 
  *     # Perform the loop
  *     idx = simu*t.stride             # <<<<<<<<<<<<<<
@@ -1764,7 +1778,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
     __pyx_v_idx = (__pyx_v_simu * __pyx_v_t->stride);
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":213
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":213
  *     # Perform the loop
  *     idx = simu*t.stride
  *     while(multi.index < multi.size):             # <<<<<<<<<<<<<<
@@ -1775,7 +1789,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
       __pyx_t_4 = (__pyx_v_multi->index < __pyx_v_multi->size);
       if (!__pyx_t_4) break;
 
-      /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":214
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":214
  *     idx = simu*t.stride
  *     while(multi.index < multi.size):
  *       fff_onesample_permute_signs(yp, y, magic)             # <<<<<<<<<<<<<<
@@ -1784,7 +1798,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
       fff_onesample_permute_signs(__pyx_v_yp, __pyx_v_y, __pyx_v_magic);
 
-      /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":215
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":215
  *     while(multi.index < multi.size):
  *       fff_onesample_permute_signs(yp, y, magic)
  *       t.data[idx] = fff_onesample_stat_mfx_eval(stat, yp, v)             # <<<<<<<<<<<<<<
@@ -1793,7 +1807,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
       (__pyx_v_t->data[__pyx_v_idx]) = fff_onesample_stat_mfx_eval(__pyx_v_stat, __pyx_v_yp, __pyx_v_v);
 
-      /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":216
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":216
  *       fff_onesample_permute_signs(yp, y, magic)
  *       t.data[idx] = fff_onesample_stat_mfx_eval(stat, yp, v)
  *       fffpy_multi_iterator_update(multi)             # <<<<<<<<<<<<<<
@@ -1804,7 +1818,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
     }
   }
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":220
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":220
  * 
  *   # Free memory
  *   fffpy_multi_iterator_delete(multi)             # <<<<<<<<<<<<<<
@@ -1813,7 +1827,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
   fffpy_multi_iterator_delete(__pyx_v_multi);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":221
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":221
  *   # Free memory
  *   fffpy_multi_iterator_delete(multi)
  *   fff_vector_delete(yp)             # <<<<<<<<<<<<<<
@@ -1822,7 +1836,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
   fff_vector_delete(__pyx_v_yp);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":222
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":222
  *   fffpy_multi_iterator_delete(multi)
  *   fff_vector_delete(yp)
  *   fff_vector_delete(magics)             # <<<<<<<<<<<<<<
@@ -1831,7 +1845,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
   fff_vector_delete(__pyx_v_magics);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":223
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":223
  *   fff_vector_delete(yp)
  *   fff_vector_delete(magics)
  *   fff_onesample_stat_mfx_delete(stat)             # <<<<<<<<<<<<<<
@@ -1840,7 +1854,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
  */
   fff_onesample_stat_mfx_delete(__pyx_v_stat);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":226
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":226
  * 
  *   # Return
  *   return T             # <<<<<<<<<<<<<<
@@ -1874,7 +1888,1004 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx(PyObject *
   return __pyx_r;
 }
 
-/* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":230
+/* "/root/package/nipy/neurospin/group/onesample.pyx":230
+ * 
+ * 
+ * def stat_permutations(ndarray Y, ndarray Magics, id='student',             # <<<<<<<<<<<<<<
+ *                       double base=0.0, int axis=0, ndarray V=None,
+ *                       unsigned int niter=5, ndarray T=None):
+ */
+
+static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_permutations(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_5group_9onesample_stat_permutations[] = "\n  P = stat_permutations(Y, Magics, id='student', base=0.0, axis=0, V=None, niter=5, T=None).\n\n  Compute a one-sample test statistic over the sign permutations\n  given by magic numbers, looping over the permutations for each\n  voxel in turn rather than over the voxels for each permutation as\n  in stat and stat_mfx, so that the voxel data stays in cache.\n\n  If V is not None, it contains the variances of a mixed-effect\n  statistic. If T is None, the statistic values are returned with\n  the permutations along axis. Otherwise, T contains the values of\n  the statistic without permutation, and a tuple (MaxT, C) is\n  returned, where MaxT is the maximum of each permutation statistic\n  over voxels, and C counts the permutations in which the voxel\n  statistic is larger than or equal to T.\n  ";
+static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_permutations(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_Y = 0;
+  PyArrayObject *__pyx_v_Magics = 0;
+  PyObject *__pyx_v_id = 0;
+  double __pyx_v_base;
+  int __pyx_v_axis;
+  PyArrayObject *__pyx_v_V = 0;
+  unsigned int __pyx_v_niter;
+  PyArrayObject *__pyx_v_T = 0;
+  fff_vector *__pyx_v_y;
+  fff_vector *__pyx_v_v;
+  fff_vector *__pyx_v_t;
+  fff_vector *__pyx_v_c;
+  fff_vector *__pyx_v_magics;
+  fff_vector *__pyx_v_yp;
+  fff_onesample_stat *__pyx_v_rstat;
+  fff_onesample_stat_mfx *__pyx_v_mstat;
+  fff_onesample_stat_flag __pyx_v_flag_stat;
+  unsigned int __pyx_v_n;
+  int __pyx_v_mfx;
+  int __pyx_v_reduce;
+  unsigned long __pyx_v_simu;
+  unsigned long __pyx_v_nsimu;
+  double __pyx_v_tp;
+  double __pyx_v_tobs;
+  double __pyx_v_count;
+  double *__pyx_v_maxt;
+  PyArrayObject *__pyx_v_MaxT;
+  fffpy_multi_iterator *__pyx_v_multi;
+  PyObject *__pyx_v_dims;
+  PyObject *__pyx_v_P;
+  PyObject *__pyx_v_C;
+  PyObject *__pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  fff_onesample_stat_flag __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  Py_ssize_t __pyx_t_8;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  unsigned long __pyx_t_11;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Y,&__pyx_n_s__Magics,&__pyx_n_s__id,&__pyx_n_s__base,&__pyx_n_s__axis,&__pyx_n_s__V,&__pyx_n_s__niter,&__pyx_n_s__T,0};
+  __Pyx_RefNannySetupContext("stat_permutations");
+  __pyx_self = __pyx_self;
+  if (unlikely(__pyx_kwds)) {
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":232
+ * def stat_permutations(ndarray Y, ndarray Magics, id='student',
+ *                       double base=0.0, int axis=0, ndarray V=None,
+ *                       unsigned int niter=5, ndarray T=None):             # <<<<<<<<<<<<<<
+ *   """
+ *   P = stat_permutations(Y, Magics, id='student', base=0.0, axis=0, V=None, niter=5, T=None).
+ */
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    values[2] = ((PyObject *)__pyx_n_s__student);
+    values[5] = (PyObject*)((PyArrayObject *)Py_None);
+    values[7] = (PyObject*)((PyArrayObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Y);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Magics);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("stat_permutations", 0, 2, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  2:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__id);
+        if (unlikely(value)) { values[2] = value; kw_args--; }
+      }
+      case  3:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__base);
+        if (unlikely(value)) { values[3] = value; kw_args--; }
+      }
+      case  4:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__axis);
+        if (unlikely(value)) { values[4] = value; kw_args--; }
+      }
+      case  5:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__V);
+        if (unlikely(value)) { values[5] = value; kw_args--; }
+      }
+      case  6:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__niter);
+        if (unlikely(value)) { values[6] = value; kw_args--; }
+      }
+      case  7:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__T);
+        if (unlikely(value)) { values[7] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "stat_permutations") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_Y = ((PyArrayObject *)values[0]);
+    __pyx_v_Magics = ((PyArrayObject *)values[1]);
+    __pyx_v_id = values[2];
+    if (values[3]) {
+      __pyx_v_base = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_base == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 231; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":231
+ * 
+ * def stat_permutations(ndarray Y, ndarray Magics, id='student',
+ *                       double base=0.0, int axis=0, ndarray V=None,             # <<<<<<<<<<<<<<
+ *                       unsigned int niter=5, ndarray T=None):
+ *   """
+ */
+      __pyx_v_base = ((double)0.0);
+    }
+    if (values[4]) {
+      __pyx_v_axis = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 231; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_axis = ((int)0);
+    }
+    __pyx_v_V = ((PyArrayObject *)values[5]);
+    if (values[6]) {
+      __pyx_v_niter = __Pyx_PyInt_AsUnsignedInt(values[6]); if (unlikely((__pyx_v_niter == (unsigned int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_niter = ((unsigned int)5);
+    }
+    __pyx_v_T = ((PyArrayObject *)values[7]);
+  } else {
+    __pyx_v_id = ((PyObject *)__pyx_n_s__student);
+    __pyx_v_base = ((double)0.0);
+    __pyx_v_axis = ((int)0);
+    __pyx_v_V = ((PyArrayObject *)Py_None);
+    __pyx_v_niter = ((unsigned int)5);
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":232
+ * def stat_permutations(ndarray Y, ndarray Magics, id='student',
+ *                       double base=0.0, int axis=0, ndarray V=None,
+ *                       unsigned int niter=5, ndarray T=None):             # <<<<<<<<<<<<<<
+ *   """
+ *   P = stat_permutations(Y, Magics, id='student', base=0.0, axis=0, V=None, niter=5, T=None).
+ */
+    __pyx_v_T = ((PyArrayObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  8:
+      __pyx_v_T = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 7));
+      case  7:
+      __pyx_v_niter = __Pyx_PyInt_AsUnsignedInt(PyTuple_GET_ITEM(__pyx_args, 6)); if (unlikely((__pyx_v_niter == (unsigned int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  6:
+      __pyx_v_V = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 5));
+      case  5:
+      __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 231; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  4:
+      __pyx_v_base = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_base == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 231; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  3:
+      __pyx_v_id = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2:
+      __pyx_v_Magics = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
+      __pyx_v_Y = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("stat_permutations", 0, 2, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nipy.neurospin.group.onesample.stat_permutations");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_Y);
+  __Pyx_INCREF((PyObject *)__pyx_v_Magics);
+  __Pyx_INCREF(__pyx_v_id);
+  __Pyx_INCREF((PyObject *)__pyx_v_V);
+  __Pyx_INCREF((PyObject *)__pyx_v_T);
+  __pyx_v_MaxT = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None);
+  __pyx_v_dims = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_P = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_C = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Magics), __pyx_ptype_5numpy_ndarray, 1, "Magics", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_V), __pyx_ptype_5numpy_ndarray, 1, "V", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 231; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_T), __pyx_ptype_5numpy_ndarray, 1, "T", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":252
+ *   cdef fff_onesample_stat* rstat
+ *   cdef fff_onesample_stat_mfx* mstat
+ *   cdef fff_onesample_stat_flag flag_stat = stats[id]             # <<<<<<<<<<<<<<
+ *   cdef unsigned int n
+ *   cdef int mfx = 0, reduce = 0
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__stats); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 252; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetItem(__pyx_t_1, __pyx_v_id); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 252; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = ((fff_onesample_stat_flag)PyInt_AsLong(__pyx_t_2)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 252; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_flag_stat = __pyx_t_3;
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":254
+ *   cdef fff_onesample_stat_flag flag_stat = stats[id]
+ *   cdef unsigned int n
+ *   cdef int mfx = 0, reduce = 0             # <<<<<<<<<<<<<<
+ *   cdef unsigned long int simu, nsimu
+ *   cdef double tp, tobs, count
+ */
+  __pyx_v_mfx = 0;
+  __pyx_v_reduce = 0;
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":262
+ * 
+ *   # Get number of observations
+ *   n = <unsigned int>Y.shape[axis]             # <<<<<<<<<<<<<<
+ *   if not V == None:
+ *     mfx = 1
+ */
+  __pyx_v_n = ((unsigned int)(__pyx_v_Y->dimensions[__pyx_v_axis]));
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":263
+ *   # Get number of observations
+ *   n = <unsigned int>Y.shape[axis]
+ *   if not V == None:             # <<<<<<<<<<<<<<
+ *     mfx = 1
+ *   else:
+ */
+  __pyx_t_2 = PyObject_RichCompare(((PyObject *)__pyx_v_V), Py_None, Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 263; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 263; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_5 = (!__pyx_t_4);
+  if (__pyx_t_5) {
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":264
+ *   n = <unsigned int>Y.shape[axis]
+ *   if not V == None:
+ *     mfx = 1             # <<<<<<<<<<<<<<
+ *   else:
+ *     V = Y
+ */
+    __pyx_v_mfx = 1;
+    goto __pyx_L6;
+  }
+  /*else*/ {
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":266
+ *     mfx = 1
+ *   else:
+ *     V = Y             # <<<<<<<<<<<<<<
+ * 
+ *   # Read out magic numbers
+ */
+    __Pyx_INCREF(((PyObject *)__pyx_v_Y));
+    __Pyx_DECREF(((PyObject *)__pyx_v_V));
+    __pyx_v_V = __pyx_v_Y;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":269
+ * 
+ *   # Read out magic numbers
+ *   magics = fff_vector_fromPyArray(Magics)             # <<<<<<<<<<<<<<
+ *   nsimu = magics.size
+ * 
+ */
+  __pyx_v_magics = fff_vector_fromPyArray(__pyx_v_Magics);
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":270
+ *   # Read out magic numbers
+ *   magics = fff_vector_fromPyArray(Magics)
+ *   nsimu = magics.size             # <<<<<<<<<<<<<<
+ * 
+ *   # Create output arrays
+ */
+  __pyx_v_nsimu = __pyx_v_magics->size;
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":273
+ * 
+ *   # Create output arrays
+ *   dims = [Y.shape[i] for i in range(Y.ndim)]             # <<<<<<<<<<<<<<
+ *   if T == None:
+ *     dims[axis] = nsimu
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+  __pyx_t_1 = PyInt_FromLong(__pyx_v_Y->nd); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_Call(__pyx_builtin_range, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (PyList_CheckExact(__pyx_t_1) || PyTuple_CheckExact(__pyx_t_1)) {
+    __pyx_t_6 = 0; __pyx_t_7 = __pyx_t_1; __Pyx_INCREF(__pyx_t_7);
+  } else {
+    __pyx_t_6 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_7))) {
+      if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_7)) break;
+      __pyx_t_1 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_7))) {
+      if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
+      __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++;
+    } else {
+      __pyx_t_1 = PyIter_Next(__pyx_t_7);
+      if (!__pyx_t_1) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_DECREF(__pyx_v_i);
+    __pyx_v_i = __pyx_t_1;
+    __pyx_t_1 = 0;
+    __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_Y->dimensions[__pyx_t_8])); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_9 = PyList_Append(__pyx_t_2, (PyObject*)__pyx_t_1); if (unlikely(__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_INCREF(((PyObject *)__pyx_t_2));
+  __Pyx_DECREF(__pyx_v_dims);
+  __pyx_v_dims = ((PyObject *)__pyx_t_2);
+  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":274
+ *   # Create output arrays
+ *   dims = [Y.shape[i] for i in range(Y.ndim)]
+ *   if T == None:             # <<<<<<<<<<<<<<
+ *     dims[axis] = nsimu
+ *     P = np.zeros(dims)
+ */
+  __pyx_t_2 = PyObject_RichCompare(((PyObject *)__pyx_v_T), Py_None, Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_5 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_5) {
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":275
+ *   dims = [Y.shape[i] for i in range(Y.ndim)]
+ *   if T == None:
+ *     dims[axis] = nsimu             # <<<<<<<<<<<<<<
+ *     P = np.zeros(dims)
+ *     multi = fffpy_multi_iterator_new(3, axis, <void*>Y, <void*>V, <void*>P)
+ */
+    __pyx_t_2 = PyLong_FromUnsignedLong(__pyx_v_nsimu); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_t_2, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":276
+ *   if T == None:
+ *     dims[axis] = nsimu
+ *     P = np.zeros(dims)             # <<<<<<<<<<<<<<
+ *     multi = fffpy_multi_iterator_new(3, axis, <void*>Y, <void*>V, <void*>P)
+ *   else:
+ */
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_7 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__zeros); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v_dims);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_dims);
+    __Pyx_GIVEREF(__pyx_v_dims);
+    __pyx_t_1 = PyObject_Call(__pyx_t_7, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_v_P);
+    __pyx_v_P = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":277
+ *     dims[axis] = nsimu
+ *     P = np.zeros(dims)
+ *     multi = fffpy_multi_iterator_new(3, axis, <void*>Y, <void*>V, <void*>P)             # <<<<<<<<<<<<<<
+ *   else:
+ *     reduce = 1
+ */
+    __pyx_v_multi = fffpy_multi_iterator_new(3, __pyx_v_axis, ((void *)__pyx_v_Y), ((void *)__pyx_v_V), ((void *)__pyx_v_P));
+    goto __pyx_L9;
+  }
+  /*else*/ {
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":279
+ *     multi = fffpy_multi_iterator_new(3, axis, <void*>Y, <void*>V, <void*>P)
+ *   else:
+ *     reduce = 1             # <<<<<<<<<<<<<<
+ *     dims[axis] = 1
+ *     T = np.asarray(T, dtype='double').reshape(dims)
+ */
+    __pyx_v_reduce = 1;
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":280
+ *   else:
+ *     reduce = 1
+ *     dims[axis] = 1             # <<<<<<<<<<<<<<
+ *     T = np.asarray(T, dtype='double').reshape(dims)
+ *     C = np.zeros(dims)
+ */
+    if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_int_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 280; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":281
+ *     reduce = 1
+ *     dims[axis] = 1
+ *     T = np.asarray(T, dtype='double').reshape(dims)             # <<<<<<<<<<<<<<
+ *     C = np.zeros(dims)
+ *     MaxT = np.zeros(nsimu)
+ */
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__asarray); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(((PyObject *)__pyx_v_T));
+    PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_v_T));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_T));
+    __pyx_t_7 = PyDict_New(); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_7));
+    if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_n_s__dtype), ((PyObject *)__pyx_n_s__double)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_10 = PyEval_CallObjectWithKeywords(__pyx_t_2, __pyx_t_1, ((PyObject *)__pyx_t_7)); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_7)); __pyx_t_7 = 0;
+    __pyx_t_7 = PyObject_GetAttr(__pyx_t_10, __pyx_n_s__reshape); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_10 = PyTuple_New(1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_INCREF(__pyx_v_dims);
+    PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_v_dims);
+    __Pyx_GIVEREF(__pyx_v_dims);
+    __pyx_t_1 = PyObject_Call(__pyx_t_7, __pyx_t_10, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(((PyObject *)__pyx_v_T));
+    __pyx_v_T = ((PyArrayObject *)__pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":282
+ *     dims[axis] = 1
+ *     T = np.asarray(T, dtype='double').reshape(dims)
+ *     C = np.zeros(dims)             # <<<<<<<<<<<<<<
+ *     MaxT = np.zeros(nsimu)
+ *     MaxT.fill(-np.inf)
+ */
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_10 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v_dims);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_dims);
+    __Pyx_GIVEREF(__pyx_v_dims);
+    __pyx_t_7 = PyObject_Call(__pyx_t_10, __pyx_t_1, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_v_C);
+    __pyx_v_C = __pyx_t_7;
+    __pyx_t_7 = 0;
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":283
+ *     T = np.asarray(T, dtype='double').reshape(dims)
+ *     C = np.zeros(dims)
+ *     MaxT = np.zeros(nsimu)             # <<<<<<<<<<<<<<
+ *     MaxT.fill(-np.inf)
+ *     maxt = <double*>MaxT.data
+ */
+    __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_1 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__zeros); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_7 = PyLong_FromUnsignedLong(__pyx_v_nsimu); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_10 = PyTuple_New(1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_7);
+    __Pyx_GIVEREF(__pyx_t_7);
+    __pyx_t_7 = 0;
+    __pyx_t_7 = PyObject_Call(__pyx_t_1, __pyx_t_10, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    if (!(likely(((__pyx_t_7) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_7, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(((PyObject *)__pyx_v_MaxT));
+    __pyx_v_MaxT = ((PyArrayObject *)__pyx_t_7);
+    __pyx_t_7 = 0;
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":284
+ *     C = np.zeros(dims)
+ *     MaxT = np.zeros(nsimu)
+ *     MaxT.fill(-np.inf)             # <<<<<<<<<<<<<<
+ *     maxt = <double*>MaxT.data
+ *     multi = fffpy_multi_iterator_new(4, axis, <void*>Y, <void*>V, <void*>T, <void*>C)
+ */
+    __pyx_t_7 = PyObject_GetAttr(((PyObject *)__pyx_v_MaxT), __pyx_n_s__fill); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_10 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_1 = PyObject_GetAttr(__pyx_t_10, __pyx_n_s__inf); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_10 = PyNumber_Negative(__pyx_t_1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_10);
+    __Pyx_GIVEREF(__pyx_t_10);
+    __pyx_t_10 = 0;
+    __pyx_t_10 = PyObject_Call(__pyx_t_7, __pyx_t_1, NULL); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":285
+ *     MaxT = np.zeros(nsimu)
+ *     MaxT.fill(-np.inf)
+ *     maxt = <double*>MaxT.data             # <<<<<<<<<<<<<<
+ *     multi = fffpy_multi_iterator_new(4, axis, <void*>Y, <void*>V, <void*>T, <void*>C)
+ *     c = multi.vector[3]
+ */
+    __pyx_v_maxt = ((double *)__pyx_v_MaxT->data);
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":286
+ *     MaxT.fill(-np.inf)
+ *     maxt = <double*>MaxT.data
+ *     multi = fffpy_multi_iterator_new(4, axis, <void*>Y, <void*>V, <void*>T, <void*>C)             # <<<<<<<<<<<<<<
+ *     c = multi.vector[3]
+ * 
+ */
+    __pyx_v_multi = fffpy_multi_iterator_new(4, __pyx_v_axis, ((void *)__pyx_v_Y), ((void *)__pyx_v_V), ((void *)__pyx_v_T), ((void *)__pyx_v_C));
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":287
+ *     maxt = <double*>MaxT.data
+ *     multi = fffpy_multi_iterator_new(4, axis, <void*>Y, <void*>V, <void*>T, <void*>C)
+ *     c = multi.vector[3]             # <<<<<<<<<<<<<<
+ * 
+ *   # Create local structure
+ */
+    __pyx_v_c = (__pyx_v_multi->vector[3]);
+  }
+  __pyx_L9:;
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":290
+ * 
+ *   # Create local structure
+ *   if mfx:             # <<<<<<<<<<<<<<
+ *     mstat = fff_onesample_stat_mfx_new(n, flag_stat, base)
+ *     mstat.niter = niter
+ */
+  __pyx_t_9 = __pyx_v_mfx;
+  if (__pyx_t_9) {
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":291
+ *   # Create local structure
+ *   if mfx:
+ *     mstat = fff_onesample_stat_mfx_new(n, flag_stat, base)             # <<<<<<<<<<<<<<
+ *     mstat.niter = niter
+ *   else:
+ */
+    __pyx_v_mstat = fff_onesample_stat_mfx_new(__pyx_v_n, __pyx_v_flag_stat, __pyx_v_base);
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":292
+ *   if mfx:
+ *     mstat = fff_onesample_stat_mfx_new(n, flag_stat, base)
+ *     mstat.niter = niter             # <<<<<<<<<<<<<<
+ *   else:
+ *     rstat = fff_onesample_stat_new(n, flag_stat, base)
+ */
+    __pyx_v_mstat->niter = __pyx_v_niter;
+    goto __pyx_L10;
+  }
+  /*else*/ {
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":294
+ *     mstat.niter = niter
+ *   else:
+ *     rstat = fff_onesample_stat_new(n, flag_stat, base)             # <<<<<<<<<<<<<<
+ *   yp = fff_vector_new(n)
+ * 
+ */
+    __pyx_v_rstat = fff_onesample_stat_new(__pyx_v_n, __pyx_v_flag_stat, __pyx_v_base);
+  }
+  __pyx_L10:;
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":295
+ *   else:
+ *     rstat = fff_onesample_stat_new(n, flag_stat, base)
+ *   yp = fff_vector_new(n)             # <<<<<<<<<<<<<<
+ * 
+ *   # Vector views
+ */
+  __pyx_v_yp = fff_vector_new(__pyx_v_n);
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":298
+ * 
+ *   # Vector views
+ *   y = multi.vector[0]             # <<<<<<<<<<<<<<
+ *   v = multi.vector[1]
+ *   t = multi.vector[2]
+ */
+  __pyx_v_y = (__pyx_v_multi->vector[0]);
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":299
+ *   # Vector views
+ *   y = multi.vector[0]
+ *   v = multi.vector[1]             # <<<<<<<<<<<<<<
+ *   t = multi.vector[2]
+ * 
+ */
+  __pyx_v_v = (__pyx_v_multi->vector[1]);
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":300
+ *   y = multi.vector[0]
+ *   v = multi.vector[1]
+ *   t = multi.vector[2]             # <<<<<<<<<<<<<<
+ * 
+ *   # Loop
+ */
+  __pyx_v_t = (__pyx_v_multi->vector[2]);
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":303
+ * 
+ *   # Loop
+ *   while(multi.index < multi.size):             # <<<<<<<<<<<<<<
+ *     if reduce:
+ *       tobs = t.data[0]
+ */
+  while (1) {
+    __pyx_t_5 = (__pyx_v_multi->index < __pyx_v_multi->size);
+    if (!__pyx_t_5) break;
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":304
+ *   # Loop
+ *   while(multi.index < multi.size):
+ *     if reduce:             # <<<<<<<<<<<<<<
+ *       tobs = t.data[0]
+ *       count = 0
+ */
+    __pyx_t_9 = __pyx_v_reduce;
+    if (__pyx_t_9) {
+
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":305
+ *   while(multi.index < multi.size):
+ *     if reduce:
+ *       tobs = t.data[0]             # <<<<<<<<<<<<<<
+ *       count = 0
+ *     for simu from 0 <= simu < nsimu:
+ */
+      __pyx_v_tobs = (__pyx_v_t->data[0]);
+
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":306
+ *     if reduce:
+ *       tobs = t.data[0]
+ *       count = 0             # <<<<<<<<<<<<<<
+ *     for simu from 0 <= simu < nsimu:
+ *       fff_onesample_permute_signs(yp, y, magics.data[simu*magics.stride])
+ */
+      __pyx_v_count = 0;
+      goto __pyx_L13;
+    }
+    __pyx_L13:;
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":307
+ *       tobs = t.data[0]
+ *       count = 0
+ *     for simu from 0 <= simu < nsimu:             # <<<<<<<<<<<<<<
+ *       fff_onesample_permute_signs(yp, y, magics.data[simu*magics.stride])
+ *       if mfx:
+ */
+    __pyx_t_11 = __pyx_v_nsimu;
+    for (__pyx_v_simu = 0; __pyx_v_simu < __pyx_t_11; __pyx_v_simu++) {
+
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":308
+ *       count = 0
+ *     for simu from 0 <= simu < nsimu:
+ *       fff_onesample_permute_signs(yp, y, magics.data[simu*magics.stride])             # <<<<<<<<<<<<<<
+ *       if mfx:
+ *         tp = fff_onesample_stat_mfx_eval(mstat, yp, v)
+ */
+      fff_onesample_permute_signs(__pyx_v_yp, __pyx_v_y, (__pyx_v_magics->data[(__pyx_v_simu * __pyx_v_magics->stride)]));
+
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":309
+ *     for simu from 0 <= simu < nsimu:
+ *       fff_onesample_permute_signs(yp, y, magics.data[simu*magics.stride])
+ *       if mfx:             # <<<<<<<<<<<<<<
+ *         tp = fff_onesample_stat_mfx_eval(mstat, yp, v)
+ *       else:
+ */
+      __pyx_t_9 = __pyx_v_mfx;
+      if (__pyx_t_9) {
+
+        /* "/root/package/nipy/neurospin/group/onesample.pyx":310
+ *       fff_onesample_permute_signs(yp, y, magics.data[simu*magics.stride])
+ *       if mfx:
+ *         tp = fff_onesample_stat_mfx_eval(mstat, yp, v)             # <<<<<<<<<<<<<<
+ *       else:
+ *         tp = fff_onesample_stat_eval(rstat, yp)
+ */
+        __pyx_v_tp = fff_onesample_stat_mfx_eval(__pyx_v_mstat, __pyx_v_yp, __pyx_v_v);
+        goto __pyx_L16;
+      }
+      /*else*/ {
+
+        /* "/root/package/nipy/neurospin/group/onesample.pyx":312
+ *         tp = fff_onesample_stat_mfx_eval(mstat, yp, v)
+ *       else:
+ *         tp = fff_onesample_stat_eval(rstat, yp)             # <<<<<<<<<<<<<<
+ *       if reduce:
+ *         if tp > maxt[simu]:
+ */
+        __pyx_v_tp = fff_onesample_stat_eval(__pyx_v_rstat, __pyx_v_yp);
+      }
+      __pyx_L16:;
+
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":313
+ *       else:
+ *         tp = fff_onesample_stat_eval(rstat, yp)
+ *       if reduce:             # <<<<<<<<<<<<<<
+ *         if tp > maxt[simu]:
+ *           maxt[simu] = tp
+ */
+      __pyx_t_9 = __pyx_v_reduce;
+      if (__pyx_t_9) {
+
+        /* "/root/package/nipy/neurospin/group/onesample.pyx":314
+ *         tp = fff_onesample_stat_eval(rstat, yp)
+ *       if reduce:
+ *         if tp > maxt[simu]:             # <<<<<<<<<<<<<<
+ *           maxt[simu] = tp
+ *         if tp >= tobs:
+ */
+        __pyx_t_5 = (__pyx_v_tp > (__pyx_v_maxt[__pyx_v_simu]));
+        if (__pyx_t_5) {
+
+          /* "/root/package/nipy/neurospin/group/onesample.pyx":315
+ *       if reduce:
+ *         if tp > maxt[simu]:
+ *           maxt[simu] = tp             # <<<<<<<<<<<<<<
+ *         if tp >= tobs:
+ *           count = count + 1
+ */
+          (__pyx_v_maxt[__pyx_v_simu]) = __pyx_v_tp;
+          goto __pyx_L18;
+        }
+        __pyx_L18:;
+
+        /* "/root/package/nipy/neurospin/group/onesample.pyx":316
+ *         if tp > maxt[simu]:
+ *           maxt[simu] = tp
+ *         if tp >= tobs:             # <<<<<<<<<<<<<<
+ *           count = count + 1
+ *       else:
+ */
+        __pyx_t_5 = (__pyx_v_tp >= __pyx_v_tobs);
+        if (__pyx_t_5) {
+
+          /* "/root/package/nipy/neurospin/group/onesample.pyx":317
+ *           maxt[simu] = tp
+ *         if tp >= tobs:
+ *           count = count + 1             # <<<<<<<<<<<<<<
+ *       else:
+ *         t.data[simu*t.stride] = tp
+ */
+          __pyx_v_count = (__pyx_v_count + 1);
+          goto __pyx_L19;
+        }
+        __pyx_L19:;
+        goto __pyx_L17;
+      }
+      /*else*/ {
+
+        /* "/root/package/nipy/neurospin/group/onesample.pyx":319
+ *           count = count + 1
+ *       else:
+ *         t.data[simu*t.stride] = tp             # <<<<<<<<<<<<<<
+ *     if reduce:
+ *       c.data[0] = count
+ */
+        (__pyx_v_t->data[(__pyx_v_simu * __pyx_v_t->stride)]) = __pyx_v_tp;
+      }
+      __pyx_L17:;
+    }
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":320
+ *       else:
+ *         t.data[simu*t.stride] = tp
+ *     if reduce:             # <<<<<<<<<<<<<<
+ *       c.data[0] = count
+ *     fffpy_multi_iterator_update(multi)
+ */
+    __pyx_t_9 = __pyx_v_reduce;
+    if (__pyx_t_9) {
+
+      /* "/root/package/nipy/neurospin/group/onesample.pyx":321
+ *         t.data[simu*t.stride] = tp
+ *     if reduce:
+ *       c.data[0] = count             # <<<<<<<<<<<<<<
+ *     fffpy_multi_iterator_update(multi)
+ * 
+ */
+      (__pyx_v_c->data[0]) = __pyx_v_count;
+      goto __pyx_L20;
+    }
+    __pyx_L20:;
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":322
+ *     if reduce:
+ *       c.data[0] = count
+ *     fffpy_multi_iterator_update(multi)             # <<<<<<<<<<<<<<
+ * 
+ *   # Free memory
+ */
+    fffpy_multi_iterator_update(__pyx_v_multi);
+  }
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":325
+ * 
+ *   # Free memory
+ *   fffpy_multi_iterator_delete(multi)             # <<<<<<<<<<<<<<
+ *   fff_vector_delete(yp)
+ *   fff_vector_delete(magics)
+ */
+  fffpy_multi_iterator_delete(__pyx_v_multi);
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":326
+ *   # Free memory
+ *   fffpy_multi_iterator_delete(multi)
+ *   fff_vector_delete(yp)             # <<<<<<<<<<<<<<
+ *   fff_vector_delete(magics)
+ *   if mfx:
+ */
+  fff_vector_delete(__pyx_v_yp);
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":327
+ *   fffpy_multi_iterator_delete(multi)
+ *   fff_vector_delete(yp)
+ *   fff_vector_delete(magics)             # <<<<<<<<<<<<<<
+ *   if mfx:
+ *     fff_onesample_stat_mfx_delete(mstat)
+ */
+  fff_vector_delete(__pyx_v_magics);
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":328
+ *   fff_vector_delete(yp)
+ *   fff_vector_delete(magics)
+ *   if mfx:             # <<<<<<<<<<<<<<
+ *     fff_onesample_stat_mfx_delete(mstat)
+ *   else:
+ */
+  __pyx_t_9 = __pyx_v_mfx;
+  if (__pyx_t_9) {
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":329
+ *   fff_vector_delete(magics)
+ *   if mfx:
+ *     fff_onesample_stat_mfx_delete(mstat)             # <<<<<<<<<<<<<<
+ *   else:
+ *     fff_onesample_stat_delete(rstat)
+ */
+    fff_onesample_stat_mfx_delete(__pyx_v_mstat);
+    goto __pyx_L21;
+  }
+  /*else*/ {
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":331
+ *     fff_onesample_stat_mfx_delete(mstat)
+ *   else:
+ *     fff_onesample_stat_delete(rstat)             # <<<<<<<<<<<<<<
+ * 
+ *   # Return
+ */
+    fff_onesample_stat_delete(__pyx_v_rstat);
+  }
+  __pyx_L21:;
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":334
+ * 
+ *   # Return
+ *   if reduce:             # <<<<<<<<<<<<<<
+ *     return MaxT, C
+ *   return P
+ */
+  __pyx_t_9 = __pyx_v_reduce;
+  if (__pyx_t_9) {
+
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":335
+ *   # Return
+ *   if reduce:
+ *     return MaxT, C             # <<<<<<<<<<<<<<
+ *   return P
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_10 = PyTuple_New(2); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 335; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_INCREF(((PyObject *)__pyx_v_MaxT));
+    PyTuple_SET_ITEM(__pyx_t_10, 0, ((PyObject *)__pyx_v_MaxT));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_MaxT));
+    __Pyx_INCREF(__pyx_v_C);
+    PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_v_C);
+    __Pyx_GIVEREF(__pyx_v_C);
+    __pyx_r = __pyx_t_10;
+    __pyx_t_10 = 0;
+    goto __pyx_L0;
+    goto __pyx_L22;
+  }
+  __pyx_L22:;
+
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":336
+ *   if reduce:
+ *     return MaxT, C
+ *   return P             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_P);
+  __pyx_r = __pyx_v_P;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("nipy.neurospin.group.onesample.stat_permutations");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_MaxT);
+  __Pyx_DECREF(__pyx_v_dims);
+  __Pyx_DECREF(__pyx_v_P);
+  __Pyx_DECREF(__pyx_v_C);
+  __Pyx_DECREF(__pyx_v_i);
+  __Pyx_DECREF((PyObject *)__pyx_v_Y);
+  __Pyx_DECREF((PyObject *)__pyx_v_Magics);
+  __Pyx_DECREF(__pyx_v_id);
+  __Pyx_DECREF((PyObject *)__pyx_v_V);
+  __Pyx_DECREF((PyObject *)__pyx_v_T);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/nipy/neurospin/group/onesample.pyx":340
  * 
  * 
  * def pdf_fit_mfx(ndarray Y, ndarray V, int axis=0, int niter=5, int constraint=0, double base=0.0):             # <<<<<<<<<<<<<<
@@ -1935,7 +2946,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__V);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("pdf_fit_mfx", 0, 2, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("pdf_fit_mfx", 0, 2, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       if (kw_args > 0) {
@@ -1959,27 +2970,27 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "pdf_fit_mfx") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "pdf_fit_mfx") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_Y = ((PyArrayObject *)values[0]);
     __pyx_v_V = ((PyArrayObject *)values[1]);
     if (values[2]) {
-      __pyx_v_axis = __Pyx_PyInt_AsInt(values[2]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_axis = __Pyx_PyInt_AsInt(values[2]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_axis = ((int)0);
     }
     if (values[3]) {
-      __pyx_v_niter = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_niter = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_niter = ((int)5);
     }
     if (values[4]) {
-      __pyx_v_constraint = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_constraint == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_constraint = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_constraint == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_constraint = ((int)0);
     }
     if (values[5]) {
-      __pyx_v_base = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_base == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_base = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_base == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_base = ((double)0.0);
     }
@@ -1990,13 +3001,13 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
     __pyx_v_base = ((double)0.0);
     switch (PyTuple_GET_SIZE(__pyx_args)) {
       case  6:
-      __pyx_v_base = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely((__pyx_v_base == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_base = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely((__pyx_v_base == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case  5:
-      __pyx_v_constraint = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_constraint == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_constraint = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_constraint == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case  4:
-      __pyx_v_niter = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_niter = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case  3:
-      __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case  2:
       __pyx_v_V = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
       __pyx_v_Y = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
@@ -2006,7 +3017,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pdf_fit_mfx", 0, 2, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("pdf_fit_mfx", 0, 2, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nipy.neurospin.group.onesample.pdf_fit_mfx");
   return NULL;
@@ -2017,10 +3028,10 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
   __pyx_v_W = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_Z = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_V), __pyx_ptype_5numpy_ndarray, 1, "V", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_V), __pyx_ptype_5numpy_ndarray, 1, "V", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":239
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":349
  *   cdef fff_onesample_stat_mfx* stat
  *   cdef fffpy_multi_iterator* multi
  *   cdef int n = Y.shape[axis]             # <<<<<<<<<<<<<<
@@ -2029,29 +3040,29 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
  */
   __pyx_v_n = (__pyx_v_Y->dimensions[__pyx_v_axis]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":242
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":352
  * 
  *   # Create output array
  *   dims = [Y.shape[i] for i in range(Y.ndim)]             # <<<<<<<<<<<<<<
  *   W = np.zeros(dims)
  *   Z = np.zeros(dims)
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_3 = PyInt_FromLong(__pyx_v_Y->nd); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromLong(__pyx_v_Y->nd); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_3);
   __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_Call(__pyx_builtin_range, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_builtin_range, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
     __pyx_t_2 = 0; __pyx_t_4 = __pyx_t_3; __Pyx_INCREF(__pyx_t_4);
   } else {
-    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2065,7 +3076,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
     } else {
       __pyx_t_3 = PyIter_Next(__pyx_t_4);
       if (!__pyx_t_3) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         break;
       }
       __Pyx_GOTREF(__pyx_t_3);
@@ -2073,10 +3084,10 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
     __Pyx_DECREF(__pyx_v_i);
     __pyx_v_i = __pyx_t_3;
     __pyx_t_3 = 0;
-    __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_3 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_Y->dimensions[__pyx_t_5])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_Y->dimensions[__pyx_t_5])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_3); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_3); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -2085,24 +3096,24 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
   __pyx_v_dims = ((PyObject *)__pyx_t_1);
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":243
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":353
  *   # Create output array
  *   dims = [Y.shape[i] for i in range(Y.ndim)]
  *   W = np.zeros(dims)             # <<<<<<<<<<<<<<
  *   Z = np.zeros(dims)
  * 
  */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 243; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 243; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 243; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_v_dims);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_dims);
   __Pyx_GIVEREF(__pyx_v_dims);
-  __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 243; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -2110,24 +3121,24 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
   __pyx_v_W = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":244
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":354
  *   dims = [Y.shape[i] for i in range(Y.ndim)]
  *   W = np.zeros(dims)
  *   Z = np.zeros(dims)             # <<<<<<<<<<<<<<
  * 
  *   # Create local structure
  */
-  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__zeros); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__zeros); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(__pyx_v_dims);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_dims);
   __Pyx_GIVEREF(__pyx_v_dims);
-  __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2135,7 +3146,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
   __pyx_v_Z = __pyx_t_4;
   __pyx_t_4 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":247
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":357
  * 
  *   # Create local structure
  *   stat = fff_onesample_stat_mfx_new(n, FFF_ONESAMPLE_EMPIRICAL_MEAN_MFX, base)             # <<<<<<<<<<<<<<
@@ -2144,7 +3155,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
  */
   __pyx_v_stat = fff_onesample_stat_mfx_new(__pyx_v_n, FFF_ONESAMPLE_EMPIRICAL_MEAN_MFX, __pyx_v_base);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":248
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":358
  *   # Create local structure
  *   stat = fff_onesample_stat_mfx_new(n, FFF_ONESAMPLE_EMPIRICAL_MEAN_MFX, base)
  *   stat.niter = niter             # <<<<<<<<<<<<<<
@@ -2153,7 +3164,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
  */
   __pyx_v_stat->niter = __pyx_v_niter;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":249
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":359
  *   stat = fff_onesample_stat_mfx_new(n, FFF_ONESAMPLE_EMPIRICAL_MEAN_MFX, base)
  *   stat.niter = niter
  *   stat.constraint = constraint             # <<<<<<<<<<<<<<
@@ -2162,7 +3173,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
  */
   __pyx_v_stat->constraint = __pyx_v_constraint;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":252
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":362
  * 
  *   # Multi-iterator
  *   multi = fffpy_multi_iterator_new(4, axis, <void*>Y, <void*>V, <void*>W, <void*>Z)             # <<<<<<<<<<<<<<
@@ -2171,7 +3182,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
  */
   __pyx_v_multi = fffpy_multi_iterator_new(4, __pyx_v_axis, ((void *)__pyx_v_Y), ((void *)__pyx_v_V), ((void *)__pyx_v_W), ((void *)__pyx_v_Z));
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":255
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":365
  * 
  *   # Create views on nd-arrays
  *   y = multi.vector[0]             # <<<<<<<<<<<<<<
@@ -2180,7 +3191,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
  */
   __pyx_v_y = (__pyx_v_multi->vector[0]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":256
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":366
  *   # Create views on nd-arrays
  *   y = multi.vector[0]
  *   v = multi.vector[1]             # <<<<<<<<<<<<<<
@@ -2189,7 +3200,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
  */
   __pyx_v_v = (__pyx_v_multi->vector[1]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":257
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":367
  *   y = multi.vector[0]
  *   v = multi.vector[1]
  *   w = multi.vector[2]             # <<<<<<<<<<<<<<
@@ -2198,7 +3209,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
  */
   __pyx_v_w = (__pyx_v_multi->vector[2]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":258
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":368
  *   v = multi.vector[1]
  *   w = multi.vector[2]
  *   z = multi.vector[3]             # <<<<<<<<<<<<<<
@@ -2207,7 +3218,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
  */
   __pyx_v_z = (__pyx_v_multi->vector[3]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":261
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":371
  * 
  *   # Loop
  *   while(multi.index < multi.size):             # <<<<<<<<<<<<<<
@@ -2218,7 +3229,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
     __pyx_t_7 = (__pyx_v_multi->index < __pyx_v_multi->size);
     if (!__pyx_t_7) break;
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":262
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":372
  *   # Loop
  *   while(multi.index < multi.size):
  *     fff_onesample_stat_mfx_pdf_fit(w, z, stat, y, v)             # <<<<<<<<<<<<<<
@@ -2227,7 +3238,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
  */
     fff_onesample_stat_mfx_pdf_fit(__pyx_v_w, __pyx_v_z, __pyx_v_stat, __pyx_v_y, __pyx_v_v);
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":263
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":373
  *   while(multi.index < multi.size):
  *     fff_onesample_stat_mfx_pdf_fit(w, z, stat, y, v)
  *     fffpy_multi_iterator_update(multi)             # <<<<<<<<<<<<<<
@@ -2237,7 +3248,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
     fffpy_multi_iterator_update(__pyx_v_multi);
   }
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":267
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":377
  * 
  *   # Delete local structures
  *   fffpy_multi_iterator_delete(multi)             # <<<<<<<<<<<<<<
@@ -2246,7 +3257,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
  */
   fffpy_multi_iterator_delete(__pyx_v_multi);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":268
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":378
  *   # Delete local structures
  *   fffpy_multi_iterator_delete(multi)
  *   fff_onesample_stat_mfx_delete(stat)             # <<<<<<<<<<<<<<
@@ -2255,7 +3266,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
  */
   fff_onesample_stat_mfx_delete(__pyx_v_stat);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":271
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":381
  * 
  *   # Return
  *   return W, Z             # <<<<<<<<<<<<<<
@@ -2263,7 +3274,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 271; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 381; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_INCREF(__pyx_v_W);
   PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_W);
@@ -2295,7 +3306,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx(PyObjec
   return __pyx_r;
 }
 
-/* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":274
+/* "/root/package/nipy/neurospin/group/onesample.pyx":384
  * 
  * 
  * def pdf_fit_gmfx(ndarray Y, ndarray V, int axis=0, int niter=5, int constraint=0, double base=0.0):             # <<<<<<<<<<<<<<
@@ -2356,7 +3367,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__V);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("pdf_fit_gmfx", 0, 2, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("pdf_fit_gmfx", 0, 2, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       if (kw_args > 0) {
@@ -2380,27 +3391,27 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "pdf_fit_gmfx") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "pdf_fit_gmfx") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_Y = ((PyArrayObject *)values[0]);
     __pyx_v_V = ((PyArrayObject *)values[1]);
     if (values[2]) {
-      __pyx_v_axis = __Pyx_PyInt_AsInt(values[2]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_axis = __Pyx_PyInt_AsInt(values[2]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_axis = ((int)0);
     }
     if (values[3]) {
-      __pyx_v_niter = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_niter = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_niter = ((int)5);
     }
     if (values[4]) {
-      __pyx_v_constraint = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_constraint == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_constraint = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_constraint == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_constraint = ((int)0);
     }
     if (values[5]) {
-      __pyx_v_base = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_base == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_base = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_base == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_base = ((double)0.0);
     }
@@ -2411,13 +3422,13 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
     __pyx_v_base = ((double)0.0);
     switch (PyTuple_GET_SIZE(__pyx_args)) {
       case  6:
-      __pyx_v_base = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely((__pyx_v_base == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_base = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely((__pyx_v_base == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case  5:
-      __pyx_v_constraint = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_constraint == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_constraint = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_constraint == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case  4:
-      __pyx_v_niter = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_niter = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_niter == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case  3:
-      __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case  2:
       __pyx_v_V = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
       __pyx_v_Y = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
@@ -2427,7 +3438,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pdf_fit_gmfx", 0, 2, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("pdf_fit_gmfx", 0, 2, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nipy.neurospin.group.onesample.pdf_fit_gmfx");
   return NULL;
@@ -2438,10 +3449,10 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
   __pyx_v_MU = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_S2 = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_V), __pyx_ptype_5numpy_ndarray, 1, "V", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Y), __pyx_ptype_5numpy_ndarray, 1, "Y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_V), __pyx_ptype_5numpy_ndarray, 1, "V", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":283
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":393
  *   cdef fff_onesample_stat_mfx* stat
  *   cdef fffpy_multi_iterator* multi
  *   cdef int n = Y.shape[axis]             # <<<<<<<<<<<<<<
@@ -2450,29 +3461,29 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
  */
   __pyx_v_n = (__pyx_v_Y->dimensions[__pyx_v_axis]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":286
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":396
  * 
  *   # Create output array
  *   dims = [Y.shape[i] for i in range(Y.ndim)]             # <<<<<<<<<<<<<<
  *   dims[axis] = 1
  *   MU = np.zeros(dims)
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 286; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_3 = PyInt_FromLong(__pyx_v_Y->nd); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 286; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromLong(__pyx_v_Y->nd); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 286; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_3);
   __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_Call(__pyx_builtin_range, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 286; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_builtin_range, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
     __pyx_t_2 = 0; __pyx_t_4 = __pyx_t_3; __Pyx_INCREF(__pyx_t_4);
   } else {
-    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 286; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2486,7 +3497,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
     } else {
       __pyx_t_3 = PyIter_Next(__pyx_t_4);
       if (!__pyx_t_3) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 286; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         break;
       }
       __Pyx_GOTREF(__pyx_t_3);
@@ -2494,10 +3505,10 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
     __Pyx_DECREF(__pyx_v_i);
     __pyx_v_i = __pyx_t_3;
     __pyx_t_3 = 0;
-    __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 286; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_3 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_Y->dimensions[__pyx_t_5])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 286; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_Y->dimensions[__pyx_t_5])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_3); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 286; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_3); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -2506,33 +3517,33 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
   __pyx_v_dims = ((PyObject *)__pyx_t_1);
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":287
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":397
  *   # Create output array
  *   dims = [Y.shape[i] for i in range(Y.ndim)]
  *   dims[axis] = 1             # <<<<<<<<<<<<<<
  *   MU = np.zeros(dims)
  *   S2 = np.zeros(dims)
  */
-  if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_int_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetItemInt(__pyx_v_dims, __pyx_v_axis, __pyx_int_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 397; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":288
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":398
  *   dims = [Y.shape[i] for i in range(Y.ndim)]
  *   dims[axis] = 1
  *   MU = np.zeros(dims)             # <<<<<<<<<<<<<<
  *   S2 = np.zeros(dims)
  * 
  */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 288; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 288; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 288; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_v_dims);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_dims);
   __Pyx_GIVEREF(__pyx_v_dims);
-  __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 288; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -2540,24 +3551,24 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
   __pyx_v_MU = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":289
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":399
  *   dims[axis] = 1
  *   MU = np.zeros(dims)
  *   S2 = np.zeros(dims)             # <<<<<<<<<<<<<<
  * 
  *   # Create local structure
  */
-  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__zeros); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__zeros); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(__pyx_v_dims);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_dims);
   __Pyx_GIVEREF(__pyx_v_dims);
-  __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2565,7 +3576,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
   __pyx_v_S2 = __pyx_t_4;
   __pyx_t_4 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":292
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":402
  * 
  *   # Create local structure
  *   stat = fff_onesample_stat_mfx_new(n, FFF_ONESAMPLE_STUDENT_MFX, base)             # <<<<<<<<<<<<<<
@@ -2574,7 +3585,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
  */
   __pyx_v_stat = fff_onesample_stat_mfx_new(__pyx_v_n, FFF_ONESAMPLE_STUDENT_MFX, __pyx_v_base);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":293
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":403
  *   # Create local structure
  *   stat = fff_onesample_stat_mfx_new(n, FFF_ONESAMPLE_STUDENT_MFX, base)
  *   stat.niter = niter             # <<<<<<<<<<<<<<
@@ -2583,7 +3594,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
  */
   __pyx_v_stat->niter = __pyx_v_niter;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":294
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":404
  *   stat = fff_onesample_stat_mfx_new(n, FFF_ONESAMPLE_STUDENT_MFX, base)
  *   stat.niter = niter
  *   stat.constraint = constraint             # <<<<<<<<<<<<<<
@@ -2592,7 +3603,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
  */
   __pyx_v_stat->constraint = __pyx_v_constraint;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":297
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":407
  * 
  *   # Multi-iterator
  *   multi = fffpy_multi_iterator_new(4, axis, <void*>Y, <void*>V, <void*>MU, <void*>S2)             # <<<<<<<<<<<<<<
@@ -2601,7 +3612,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
  */
   __pyx_v_multi = fffpy_multi_iterator_new(4, __pyx_v_axis, ((void *)__pyx_v_Y), ((void *)__pyx_v_V), ((void *)__pyx_v_MU), ((void *)__pyx_v_S2));
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":300
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":410
  * 
  *   # Create views on nd-arrays
  *   y = multi.vector[0]             # <<<<<<<<<<<<<<
@@ -2610,7 +3621,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
  */
   __pyx_v_y = (__pyx_v_multi->vector[0]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":301
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":411
  *   # Create views on nd-arrays
  *   y = multi.vector[0]
  *   v = multi.vector[1]             # <<<<<<<<<<<<<<
@@ -2619,7 +3630,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
  */
   __pyx_v_v = (__pyx_v_multi->vector[1]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":302
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":412
  *   y = multi.vector[0]
  *   v = multi.vector[1]
  *   mu = multi.vector[2]             # <<<<<<<<<<<<<<
@@ -2628,7 +3639,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
  */
   __pyx_v_mu = (__pyx_v_multi->vector[2]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":303
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":413
  *   v = multi.vector[1]
  *   mu = multi.vector[2]
  *   s2 = multi.vector[3]             # <<<<<<<<<<<<<<
@@ -2637,7 +3648,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
  */
   __pyx_v_s2 = (__pyx_v_multi->vector[3]);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":306
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":416
  * 
  *   # Loop
  *   while(multi.index < multi.size):             # <<<<<<<<<<<<<<
@@ -2648,7 +3659,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
     __pyx_t_7 = (__pyx_v_multi->index < __pyx_v_multi->size);
     if (!__pyx_t_7) break;
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":307
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":417
  *   # Loop
  *   while(multi.index < multi.size):
  *     fff_onesample_stat_gmfx_pdf_fit(mu.data, s2.data, stat, y, v)             # <<<<<<<<<<<<<<
@@ -2657,7 +3668,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
  */
     fff_onesample_stat_gmfx_pdf_fit(__pyx_v_mu->data, __pyx_v_s2->data, __pyx_v_stat, __pyx_v_y, __pyx_v_v);
 
-    /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":308
+    /* "/root/package/nipy/neurospin/group/onesample.pyx":418
  *   while(multi.index < multi.size):
  *     fff_onesample_stat_gmfx_pdf_fit(mu.data, s2.data, stat, y, v)
  *     fffpy_multi_iterator_update(multi)             # <<<<<<<<<<<<<<
@@ -2667,7 +3678,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
     fffpy_multi_iterator_update(__pyx_v_multi);
   }
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":312
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":422
  * 
  *   # Delete local structures
  *   fffpy_multi_iterator_delete(multi)             # <<<<<<<<<<<<<<
@@ -2676,7 +3687,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
  */
   fffpy_multi_iterator_delete(__pyx_v_multi);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":313
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":423
  *   # Delete local structures
  *   fffpy_multi_iterator_delete(multi)
  *   fff_onesample_stat_mfx_delete(stat)             # <<<<<<<<<<<<<<
@@ -2685,7 +3696,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
  */
   fff_onesample_stat_mfx_delete(__pyx_v_stat);
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":316
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":426
  * 
  *   # Return
  *   return MU, S2             # <<<<<<<<<<<<<<
@@ -2693,7 +3704,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_INCREF(__pyx_v_MU);
   PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_MU);
@@ -2725,7 +3736,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx(PyObje
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":187
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":187
  *         # experimental exception made for __getbuffer__ and __releasebuffer__
  *         # -- the details of this may change.
  *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
@@ -2761,7 +3772,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __Pyx_GIVEREF(__pyx_v_info->obj);
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":193
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":193
  *             # of flags
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -2770,7 +3781,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_endian_detector = 1;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":194
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":194
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -2779,7 +3790,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":196
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":196
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
  * 
  *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
@@ -2788,7 +3799,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_ndim = PyArray_NDIM(((PyArrayObject *)__pyx_v_self));
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":198
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":198
  *             ndim = PyArray_NDIM(self)
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -2798,7 +3809,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_1 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":199
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":199
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 copy_shape = 1             # <<<<<<<<<<<<<<
@@ -2810,7 +3821,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":201
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":201
  *                 copy_shape = 1
  *             else:
  *                 copy_shape = 0             # <<<<<<<<<<<<<<
@@ -2821,7 +3832,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L5:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":203
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":203
  *                 copy_shape = 0
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -2831,7 +3842,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_1 = ((__pyx_v_flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS);
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":204
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":204
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -2845,7 +3856,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_t_3) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":205
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":205
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
@@ -2867,7 +3878,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L6:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":207
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":207
  *                 raise ValueError(u"ndarray is not C contiguous")
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -2877,7 +3888,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_3 = ((__pyx_v_flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS);
   if (__pyx_t_3) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":208
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":208
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -2891,7 +3902,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_t_2) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":209
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":209
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
@@ -2913,7 +3924,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L7:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":211
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":211
  *                 raise ValueError(u"ndarray is not Fortran contiguous")
  * 
  *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
@@ -2922,7 +3933,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->buf = PyArray_DATA(((PyArrayObject *)__pyx_v_self));
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":212
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":212
  * 
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim             # <<<<<<<<<<<<<<
@@ -2931,7 +3942,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->ndim = __pyx_v_ndim;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":213
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":213
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim
  *             if copy_shape:             # <<<<<<<<<<<<<<
@@ -2941,7 +3952,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_6 = __pyx_v_copy_shape;
   if (__pyx_t_6) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":216
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":216
  *                 # Allocate new buffer for strides and shape info. This is allocated
  *                 # as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)             # <<<<<<<<<<<<<<
@@ -2950,7 +3961,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->strides = ((Py_ssize_t *)malloc((((sizeof(Py_ssize_t)) * __pyx_v_ndim) * 2)));
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":217
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":217
  *                 # as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)
  *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
@@ -2959,7 +3970,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":218
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":218
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):             # <<<<<<<<<<<<<<
@@ -2970,7 +3981,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
       __pyx_v_i = __pyx_t_7;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":219
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":219
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
@@ -2979,7 +3990,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
       (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(((PyArrayObject *)__pyx_v_self))[__pyx_v_i]);
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":220
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":220
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]
  *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
@@ -2992,7 +4003,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":222
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":222
  *                     info.shape[i] = PyArray_DIMS(self)[i]
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
@@ -3001,7 +4012,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(((PyArrayObject *)__pyx_v_self)));
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":223
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":223
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
@@ -3012,7 +4023,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L8:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":224
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":224
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
@@ -3021,7 +4032,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->suboffsets = NULL;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":225
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":225
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
@@ -3030,7 +4041,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->itemsize = PyArray_ITEMSIZE(((PyArrayObject *)__pyx_v_self));
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":226
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":226
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)
  *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
@@ -3039,7 +4050,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->readonly = (!PyArray_ISWRITEABLE(((PyArrayObject *)__pyx_v_self)));
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":229
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":229
  * 
  *             cdef int t
  *             cdef char* f = NULL             # <<<<<<<<<<<<<<
@@ -3048,7 +4059,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_f = NULL;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":230
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":230
  *             cdef int t
  *             cdef char* f = NULL
  *             cdef dtype descr = self.descr             # <<<<<<<<<<<<<<
@@ -3058,7 +4069,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __Pyx_INCREF(((PyObject *)((PyArrayObject *)__pyx_v_self)->descr));
   __pyx_v_descr = ((PyArrayObject *)__pyx_v_self)->descr;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":234
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":234
  *             cdef int offset
  * 
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)             # <<<<<<<<<<<<<<
@@ -3067,7 +4078,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_hasfields = PyDataType_HASFIELDS(__pyx_v_descr);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":236
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":236
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)
  * 
  *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
@@ -3083,7 +4094,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":238
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":238
  *             if not hasfields and not copy_shape:
  *                 # do not call releasebuffer
  *                 info.obj = None             # <<<<<<<<<<<<<<
@@ -3099,7 +4110,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":241
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":241
  *             else:
  *                 # need to call releasebuffer
  *                 info.obj = self             # <<<<<<<<<<<<<<
@@ -3114,7 +4125,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L11:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":243
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":243
  *                 info.obj = self
  * 
  *             if not hasfields:             # <<<<<<<<<<<<<<
@@ -3124,7 +4135,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_1 = (!__pyx_v_hasfields);
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":244
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":244
  * 
  *             if not hasfields:
  *                 t = descr.type_num             # <<<<<<<<<<<<<<
@@ -3133,7 +4144,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_t = __pyx_v_descr->type_num;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":245
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":245
  *             if not hasfields:
  *                 t = descr.type_num
  *                 if ((descr.byteorder == '>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -3148,7 +4159,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     if (!__pyx_t_2) {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":246
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":246
  *                 t = descr.type_num
  *                 if ((descr.byteorder == '>' and little_endian) or
  *                     (descr.byteorder == '<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -3168,7 +4179,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     if (__pyx_t_1) {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":247
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":247
  *                 if ((descr.byteorder == '>' and little_endian) or
  *                     (descr.byteorder == '<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -3190,7 +4201,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     __pyx_L13:;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":248
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":248
  *                     (descr.byteorder == '<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
@@ -3203,7 +4214,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":249
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":249
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
@@ -3216,7 +4227,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":250
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":250
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
@@ -3229,7 +4240,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":251
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":251
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
@@ -3242,7 +4253,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":252
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":252
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
@@ -3255,7 +4266,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":253
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":253
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
@@ -3268,7 +4279,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":254
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":254
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
@@ -3281,7 +4292,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":255
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":255
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
@@ -3294,7 +4305,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":256
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":256
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
@@ -3307,7 +4318,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":257
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":257
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
@@ -3320,7 +4331,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":258
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":258
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
@@ -3333,7 +4344,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":259
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":259
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
@@ -3346,7 +4357,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":260
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":260
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
@@ -3359,7 +4370,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":261
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":261
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
@@ -3372,7 +4383,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":262
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":262
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
@@ -3385,7 +4396,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":263
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":263
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
@@ -3398,7 +4409,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":264
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":264
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
  *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
@@ -3412,7 +4423,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     /*else*/ {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":266
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":266
  *                 elif t == NPY_OBJECT:      f = "O"
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
@@ -3438,7 +4449,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     __pyx_L14:;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":267
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":267
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f             # <<<<<<<<<<<<<<
@@ -3447,7 +4458,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->format = __pyx_v_f;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":268
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":268
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f
  *                 return             # <<<<<<<<<<<<<<
@@ -3460,7 +4471,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":270
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":270
  *                 return
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)             # <<<<<<<<<<<<<<
@@ -3469,7 +4480,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->format = ((char *)malloc(255));
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":271
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":271
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = '^' # Native data types, manual alignment             # <<<<<<<<<<<<<<
@@ -3478,7 +4489,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     (__pyx_v_info->format[0]) = '^';
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":272
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":272
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = '^' # Native data types, manual alignment
  *                 offset = 0             # <<<<<<<<<<<<<<
@@ -3487,7 +4498,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_offset = 0;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":275
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":275
  *                 f = _util_dtypestring(descr, info.format + 1,
  *                                       info.format + _buffer_format_string_len,
  *                                       &offset)             # <<<<<<<<<<<<<<
@@ -3497,7 +4508,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     __pyx_t_9 = __pyx_f_5numpy__util_dtypestring(__pyx_v_descr, (__pyx_v_info->format + 1), (__pyx_v_info->format + 255), (&__pyx_v_offset)); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_v_f = __pyx_t_9;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":276
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":276
  *                                       info.format + _buffer_format_string_len,
  *                                       &offset)
  *                 f[0] = 0 # Terminate format string             # <<<<<<<<<<<<<<
@@ -3530,7 +4541,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":278
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":278
  *                 f[0] = 0 # Terminate format string
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
@@ -3544,7 +4555,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __Pyx_RefNannySetupContext("__releasebuffer__");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":279
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":279
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
@@ -3554,7 +4565,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __pyx_t_1 = PyArray_HASFIELDS(((PyArrayObject *)__pyx_v_self));
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":280
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":280
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)             # <<<<<<<<<<<<<<
@@ -3566,7 +4577,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   }
   __pyx_L5:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":281
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":281
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -3576,7 +4587,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __pyx_t_1 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":282
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":282
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 stdlib.free(info.strides)             # <<<<<<<<<<<<<<
@@ -3592,7 +4603,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __Pyx_RefNannyFinishContext();
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":755
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":755
  * ctypedef npy_cdouble     complex_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -3605,7 +4616,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew1");
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":756
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":756
  * 
  * cdef inline object PyArray_MultiIterNew1(a):
  *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
@@ -3631,7 +4642,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":758
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":758
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -3644,7 +4655,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew2");
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":759
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":759
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
@@ -3670,7 +4681,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":761
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":761
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -3683,7 +4694,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew3");
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":762
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":762
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
@@ -3709,7 +4720,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":764
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":764
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -3722,7 +4733,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew4");
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":765
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":765
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
@@ -3748,7 +4759,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":767
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":767
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -3761,7 +4772,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew5");
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":768
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":768
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
@@ -3787,7 +4798,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":770
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":770
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
@@ -3822,7 +4833,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   __pyx_v_new_offset = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_t = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":777
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":777
  *     cdef int delta_offset
  *     cdef tuple i
  *     cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -3831,7 +4842,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_endian_detector = 1;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":778
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":778
  *     cdef tuple i
  *     cdef int endian_detector = 1
  *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -3840,7 +4851,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":781
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":781
  *     cdef tuple fields
  * 
  *     for childname in descr.names:             # <<<<<<<<<<<<<<
@@ -3859,7 +4870,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_v_childname = __pyx_t_3;
     __pyx_t_3 = 0;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":782
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":782
  * 
  *     for childname in descr.names:
  *         fields = descr.fields[childname]             # <<<<<<<<<<<<<<
@@ -3873,7 +4884,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_v_fields = ((PyObject *)__pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":783
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":783
  *     for childname in descr.names:
  *         fields = descr.fields[childname]
  *         child, new_offset = fields             # <<<<<<<<<<<<<<
@@ -3896,7 +4907,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       {__pyx_filename = __pyx_f[1]; __pyx_lineno = 783; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":785
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":785
  *         child, new_offset = fields
  * 
  *         if (end - f) - (new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
@@ -3921,7 +4932,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     if (__pyx_t_6) {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":786
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":786
  * 
  *         if (end - f) - (new_offset - offset[0]) < 15:
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
@@ -3943,7 +4954,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L5:;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":788
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":788
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == '>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -3958,7 +4969,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     if (!__pyx_t_7) {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":789
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":789
  * 
  *         if ((child.byteorder == '>' and little_endian) or
  *             (child.byteorder == '<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -3978,7 +4989,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     if (__pyx_t_6) {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":790
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":790
  *         if ((child.byteorder == '>' and little_endian) or
  *             (child.byteorder == '<' and not little_endian)):
  *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -4000,7 +5011,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L6:;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":800
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":800
  * 
  *         # Output padding bytes
  *         while offset[0] < new_offset:             # <<<<<<<<<<<<<<
@@ -4017,7 +5028,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (!__pyx_t_6) break;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":801
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":801
  *         # Output padding bytes
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte             # <<<<<<<<<<<<<<
@@ -4026,7 +5037,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       (__pyx_v_f[0]) = 120;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":802
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":802
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte
  *             f += 1             # <<<<<<<<<<<<<<
@@ -4035,7 +5046,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_v_f += 1;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":803
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":803
  *             f[0] = 120 # "x"; pad byte
  *             f += 1
  *             offset[0] += 1             # <<<<<<<<<<<<<<
@@ -4045,7 +5056,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       (__pyx_v_offset[0]) += 1;
     }
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":805
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":805
  *             offset[0] += 1
  * 
  *         offset[0] += child.itemsize             # <<<<<<<<<<<<<<
@@ -4054,7 +5065,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     (__pyx_v_offset[0]) += __pyx_v_child->elsize;
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":807
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":807
  *         offset[0] += child.itemsize
  * 
  *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
@@ -4064,7 +5075,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = (!PyDataType_HASFIELDS(__pyx_v_child));
     if (__pyx_t_6) {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":808
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":808
  * 
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num             # <<<<<<<<<<<<<<
@@ -4077,7 +5088,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __pyx_v_t = __pyx_t_3;
       __pyx_t_3 = 0;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":809
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":809
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num
  *             if end - f < 5:             # <<<<<<<<<<<<<<
@@ -4087,7 +5098,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __pyx_t_6 = ((__pyx_v_end - __pyx_v_f) < 5);
       if (__pyx_t_6) {
 
-        /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":810
+        /* "/tmp/cy012/Cython/Includes/numpy.pxd":810
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
@@ -4109,7 +5120,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       __pyx_L10:;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":813
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":813
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"             # <<<<<<<<<<<<<<
@@ -4128,7 +5139,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":814
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":814
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"             # <<<<<<<<<<<<<<
@@ -4147,7 +5158,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":815
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":815
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"             # <<<<<<<<<<<<<<
@@ -4166,7 +5177,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":816
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":816
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"             # <<<<<<<<<<<<<<
@@ -4185,7 +5196,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":817
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":817
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"             # <<<<<<<<<<<<<<
@@ -4204,7 +5215,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":818
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":818
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"             # <<<<<<<<<<<<<<
@@ -4223,7 +5234,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":819
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":819
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"             # <<<<<<<<<<<<<<
@@ -4242,7 +5253,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":820
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":820
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"             # <<<<<<<<<<<<<<
@@ -4261,7 +5272,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":821
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":821
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"             # <<<<<<<<<<<<<<
@@ -4280,7 +5291,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":822
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":822
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"             # <<<<<<<<<<<<<<
@@ -4299,7 +5310,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":823
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":823
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"             # <<<<<<<<<<<<<<
@@ -4318,7 +5329,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":824
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":824
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"             # <<<<<<<<<<<<<<
@@ -4337,7 +5348,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":825
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":825
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"             # <<<<<<<<<<<<<<
@@ -4356,7 +5367,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":826
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":826
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf             # <<<<<<<<<<<<<<
@@ -4377,7 +5388,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":827
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":827
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd             # <<<<<<<<<<<<<<
@@ -4398,7 +5409,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":828
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":828
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg             # <<<<<<<<<<<<<<
@@ -4419,7 +5430,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":829
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":829
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"             # <<<<<<<<<<<<<<
@@ -4439,7 +5450,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       /*else*/ {
 
-        /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":831
+        /* "/tmp/cy012/Cython/Includes/numpy.pxd":831
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
@@ -4462,7 +5473,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       __pyx_L11:;
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":832
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":832
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *             f += 1             # <<<<<<<<<<<<<<
@@ -4474,7 +5485,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     /*else*/ {
 
-      /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":836
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":836
  *             # Cython ignores struct boundary information ("T{...}"),
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)             # <<<<<<<<<<<<<<
@@ -4488,7 +5499,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":837
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":837
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)
  *     return f             # <<<<<<<<<<<<<<
@@ -4518,7 +5529,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   return __pyx_r;
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":952
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":952
  * 
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -4533,7 +5544,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_INCREF((PyObject *)__pyx_v_arr);
   __Pyx_INCREF(__pyx_v_base);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":954
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":954
  * cdef inline void set_array_base(ndarray arr, object base):
  *      cdef PyObject* baseptr
  *      if base is None:             # <<<<<<<<<<<<<<
@@ -4543,7 +5554,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __pyx_t_1 = (__pyx_v_base == Py_None);
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":955
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":955
  *      cdef PyObject* baseptr
  *      if base is None:
  *          baseptr = NULL             # <<<<<<<<<<<<<<
@@ -4555,7 +5566,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   }
   /*else*/ {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":957
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":957
  *          baseptr = NULL
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!             # <<<<<<<<<<<<<<
@@ -4564,7 +5575,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
     Py_INCREF(__pyx_v_base);
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":958
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":958
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base             # <<<<<<<<<<<<<<
@@ -4575,7 +5586,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   }
   __pyx_L3:;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":959
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":959
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)             # <<<<<<<<<<<<<<
@@ -4584,7 +5595,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   Py_XDECREF(__pyx_v_arr->base);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":960
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":960
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)
  *      arr.base = baseptr             # <<<<<<<<<<<<<<
@@ -4598,7 +5609,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_RefNannyFinishContext();
 }
 
-/* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":962
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":962
  *      arr.base = baseptr
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -4612,7 +5623,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __Pyx_RefNannySetupContext("get_array_base");
   __Pyx_INCREF((PyObject *)__pyx_v_arr);
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":963
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":963
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:             # <<<<<<<<<<<<<<
@@ -4622,7 +5633,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_t_1 = (__pyx_v_arr->base == NULL);
   if (__pyx_t_1) {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":964
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":964
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:
  *         return None             # <<<<<<<<<<<<<<
@@ -4637,7 +5648,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   }
   /*else*/ {
 
-    /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/numpy.pxd":966
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":966
  *         return None
  *     else:
  *         return <object>arr.base             # <<<<<<<<<<<<<<
@@ -4660,6 +5671,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
 static struct PyMethodDef __pyx_methods[] = {
   {__Pyx_NAMESTR("stat"), (PyCFunction)__pyx_pf_4nipy_9neurospin_5group_9onesample_stat, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_5group_9onesample_stat)},
   {__Pyx_NAMESTR("stat_mfx"), (PyCFunction)__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_mfx, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_5group_9onesample_stat_mfx)},
+  {__Pyx_NAMESTR("stat_permutations"), (PyCFunction)__pyx_pf_4nipy_9neurospin_5group_9onesample_stat_permutations, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_5group_9onesample_stat_permutations)},
   {__Pyx_NAMESTR("pdf_fit_mfx"), (PyCFunction)__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_5group_9onesample_pdf_fit_mfx)},
   {__Pyx_NAMESTR("pdf_fit_gmfx"), (PyCFunction)__pyx_pf_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_5group_9onesample_pdf_fit_gmfx)},
   {0, 0, 0, 0}
@@ -4691,11 +5703,13 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 0},
   {&__pyx_n_s__Magics, __pyx_k__Magics, sizeof(__pyx_k__Magics), 0, 0, 1, 1},
   {&__pyx_n_s__RuntimeError, __pyx_k__RuntimeError, sizeof(__pyx_k__RuntimeError), 0, 0, 1, 1},
+  {&__pyx_n_s__T, __pyx_k__T, sizeof(__pyx_k__T), 0, 0, 1, 1},
   {&__pyx_n_s__V, __pyx_k__V, sizeof(__pyx_k__V), 0, 0, 1, 1},
   {&__pyx_n_s__ValueError, __pyx_k__ValueError, sizeof(__pyx_k__ValueError), 0, 0, 1, 1},
   {&__pyx_n_s__Y, __pyx_k__Y, sizeof(__pyx_k__Y), 0, 0, 1, 1},
   {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
   {&__pyx_n_s____version__, __pyx_k____version__, sizeof(__pyx_k____version__), 0, 0, 1, 1},
+  {&__pyx_n_s__asarray, __pyx_k__asarray, sizeof(__pyx_k__asarray), 0, 0, 1, 1},
   {&__pyx_n_s__axis, __pyx_k__axis, sizeof(__pyx_k__axis), 0, 0, 1, 1},
   {&__pyx_n_s__base, __pyx_k__base, sizeof(__pyx_k__base), 0, 0, 1, 1},
   {&__pyx_n_s__buf, __pyx_k__buf, sizeof(__pyx_k__buf), 0, 0, 1, 1},
@@ -4703,13 +5717,17 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s__constraint, __pyx_k__constraint, sizeof(__pyx_k__constraint), 0, 0, 1, 1},
   {&__pyx_n_s__data, __pyx_k__data, sizeof(__pyx_k__data), 0, 0, 1, 1},
   {&__pyx_n_s__descr, __pyx_k__descr, sizeof(__pyx_k__descr), 0, 0, 1, 1},
+  {&__pyx_n_s__double, __pyx_k__double, sizeof(__pyx_k__double), 0, 0, 1, 1},
+  {&__pyx_n_s__dtype, __pyx_k__dtype, sizeof(__pyx_k__dtype), 0, 0, 1, 1},
   {&__pyx_n_s__elr, __pyx_k__elr, sizeof(__pyx_k__elr), 0, 0, 1, 1},
   {&__pyx_n_s__elr_mfx, __pyx_k__elr_mfx, sizeof(__pyx_k__elr_mfx), 0, 0, 1, 1},
   {&__pyx_n_s__fields, __pyx_k__fields, sizeof(__pyx_k__fields), 0, 0, 1, 1},
+  {&__pyx_n_s__fill, __pyx_k__fill, sizeof(__pyx_k__fill), 0, 0, 1, 1},
   {&__pyx_n_s__format, __pyx_k__format, sizeof(__pyx_k__format), 0, 0, 1, 1},
   {&__pyx_n_s__grubb, __pyx_k__grubb, sizeof(__pyx_k__grubb), 0, 0, 1, 1},
   {&__pyx_n_s__id, __pyx_k__id, sizeof(__pyx_k__id), 0, 0, 1, 1},
   {&__pyx_n_s__index, __pyx_k__index, sizeof(__pyx_k__index), 0, 0, 1, 1},
+  {&__pyx_n_s__inf, __pyx_k__inf, sizeof(__pyx_k__inf), 0, 0, 1, 1},
   {&__pyx_n_s__itemsize, __pyx_k__itemsize, sizeof(__pyx_k__itemsize), 0, 0, 1, 1},
   {&__pyx_n_s__laplace, __pyx_k__laplace, sizeof(__pyx_k__laplace), 0, 0, 1, 1},
   {&__pyx_n_s__mean, __pyx_k__mean, sizeof(__pyx_k__mean), 0, 0, 1, 1},
@@ -4725,6 +5743,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s__obj, __pyx_k__obj, sizeof(__pyx_k__obj), 0, 0, 1, 1},
   {&__pyx_n_s__range, __pyx_k__range, sizeof(__pyx_k__range), 0, 0, 1, 1},
   {&__pyx_n_s__readonly, __pyx_k__readonly, sizeof(__pyx_k__readonly), 0, 0, 1, 1},
+  {&__pyx_n_s__reshape, __pyx_k__reshape, sizeof(__pyx_k__reshape), 0, 0, 1, 1},
   {&__pyx_n_s__shape, __pyx_k__shape, sizeof(__pyx_k__shape), 0, 0, 1, 1},
   {&__pyx_n_s__sign, __pyx_k__sign, sizeof(__pyx_k__sign), 0, 0, 1, 1},
   {&__pyx_n_s__sign_mfx, __pyx_k__sign_mfx, sizeof(__pyx_k__sign_mfx), 0, 0, 1, 1},
@@ -4828,7 +5847,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   /*--- Function import code ---*/
   /*--- Execution code ---*/
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":10
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":10
  * """
  * 
  * __version__ = '0.1'             # <<<<<<<<<<<<<<
@@ -4837,7 +5856,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
  */
   if (PyObject_SetAttr(__pyx_m, __pyx_n_s____version__, ((PyObject *)__pyx_kp_s_8)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 10; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":63
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":63
  * 
  * # Initialize numpy
  * fffpy_import_array()             # <<<<<<<<<<<<<<
@@ -4846,7 +5865,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
  */
   fffpy_import_array();
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":64
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":64
  * # Initialize numpy
  * fffpy_import_array()
  * import_array()             # <<<<<<<<<<<<<<
@@ -4855,7 +5874,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
  */
   import_array();
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":65
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":65
  * fffpy_import_array()
  * import_array()
  * import numpy as np             # <<<<<<<<<<<<<<
@@ -4867,7 +5886,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyObject_SetAttr(__pyx_m, __pyx_n_s__np, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":69
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":69
  * 
  * # Stat dictionary
  * stats = {'mean': FFF_ONESAMPLE_EMPIRICAL_MEAN,             # <<<<<<<<<<<<<<
@@ -4881,7 +5900,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__mean), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":70
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":70
  * # Stat dictionary
  * stats = {'mean': FFF_ONESAMPLE_EMPIRICAL_MEAN,
  *          'median': FFF_ONESAMPLE_EMPIRICAL_MEDIAN,             # <<<<<<<<<<<<<<
@@ -4893,7 +5912,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__median), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":71
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":71
  * stats = {'mean': FFF_ONESAMPLE_EMPIRICAL_MEAN,
  *          'median': FFF_ONESAMPLE_EMPIRICAL_MEDIAN,
  *          'student': FFF_ONESAMPLE_STUDENT,             # <<<<<<<<<<<<<<
@@ -4905,7 +5924,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__student), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":72
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":72
  *          'median': FFF_ONESAMPLE_EMPIRICAL_MEDIAN,
  *          'student': FFF_ONESAMPLE_STUDENT,
  *          'laplace': FFF_ONESAMPLE_LAPLACE,             # <<<<<<<<<<<<<<
@@ -4917,7 +5936,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__laplace), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":73
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":73
  *          'student': FFF_ONESAMPLE_STUDENT,
  *          'laplace': FFF_ONESAMPLE_LAPLACE,
  *          'tukey': FFF_ONESAMPLE_TUKEY,             # <<<<<<<<<<<<<<
@@ -4929,7 +5948,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__tukey), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":74
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":74
  *          'laplace': FFF_ONESAMPLE_LAPLACE,
  *          'tukey': FFF_ONESAMPLE_TUKEY,
  *          'sign': FFF_ONESAMPLE_SIGN_STAT,             # <<<<<<<<<<<<<<
@@ -4941,7 +5960,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__sign), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":75
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":75
  *          'tukey': FFF_ONESAMPLE_TUKEY,
  *          'sign': FFF_ONESAMPLE_SIGN_STAT,
  *          'wilcoxon': FFF_ONESAMPLE_WILCOXON,             # <<<<<<<<<<<<<<
@@ -4953,7 +5972,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__wilcoxon), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":76
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":76
  *          'sign': FFF_ONESAMPLE_SIGN_STAT,
  *          'wilcoxon': FFF_ONESAMPLE_WILCOXON,
  *          'elr': FFF_ONESAMPLE_ELR,             # <<<<<<<<<<<<<<
@@ -4965,7 +5984,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__elr), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":77
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":77
  *          'wilcoxon': FFF_ONESAMPLE_WILCOXON,
  *          'elr': FFF_ONESAMPLE_ELR,
  *          'grubb': FFF_ONESAMPLE_GRUBB,             # <<<<<<<<<<<<<<
@@ -4977,7 +5996,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__grubb), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":78
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":78
  *          'elr': FFF_ONESAMPLE_ELR,
  *          'grubb': FFF_ONESAMPLE_GRUBB,
  *          'mean_mfx': FFF_ONESAMPLE_EMPIRICAL_MEAN_MFX,             # <<<<<<<<<<<<<<
@@ -4989,7 +6008,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__mean_mfx), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":79
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":79
  *          'grubb': FFF_ONESAMPLE_GRUBB,
  *          'mean_mfx': FFF_ONESAMPLE_EMPIRICAL_MEAN_MFX,
  *          'median_mfx': FFF_ONESAMPLE_EMPIRICAL_MEDIAN_MFX,             # <<<<<<<<<<<<<<
@@ -5001,7 +6020,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__median_mfx), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":80
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":80
  *          'mean_mfx': FFF_ONESAMPLE_EMPIRICAL_MEAN_MFX,
  *          'median_mfx': FFF_ONESAMPLE_EMPIRICAL_MEDIAN_MFX,
  *          'mean_gauss_mfx': FFF_ONESAMPLE_GAUSSIAN_MEAN_MFX,             # <<<<<<<<<<<<<<
@@ -5013,7 +6032,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__mean_gauss_mfx), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":81
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":81
  *          'median_mfx': FFF_ONESAMPLE_EMPIRICAL_MEDIAN_MFX,
  *          'mean_gauss_mfx': FFF_ONESAMPLE_GAUSSIAN_MEAN_MFX,
  *          'student_mfx': FFF_ONESAMPLE_STUDENT_MFX,             # <<<<<<<<<<<<<<
@@ -5025,7 +6044,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__student_mfx), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":82
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":82
  *          'mean_gauss_mfx': FFF_ONESAMPLE_GAUSSIAN_MEAN_MFX,
  *          'student_mfx': FFF_ONESAMPLE_STUDENT_MFX,
  *          'sign_mfx': FFF_ONESAMPLE_SIGN_STAT_MFX,             # <<<<<<<<<<<<<<
@@ -5037,7 +6056,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__sign_mfx), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":83
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":83
  *          'student_mfx': FFF_ONESAMPLE_STUDENT_MFX,
  *          'sign_mfx': FFF_ONESAMPLE_SIGN_STAT_MFX,
  *          'wilcoxon_mfx': FFF_ONESAMPLE_WILCOXON_MFX,             # <<<<<<<<<<<<<<
@@ -5049,7 +6068,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__wilcoxon_mfx), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Users/mb312/dev_trees/nipy/nipy/neurospin/group/onesample.pyx":84
+  /* "/root/package/nipy/neurospin/group/onesample.pyx":84
  *          'sign_mfx': FFF_ONESAMPLE_SIGN_STAT_MFX,
  *          'wilcoxon_mfx': FFF_ONESAMPLE_WILCOXON_MFX,
  *          'elr_mfx': FFF_ONESAMPLE_ELR_MFX}             # <<<<<<<<<<<<<<
@@ -5063,7 +6082,7 @@ PyMODINIT_FUNC PyInit_onesample(void)
   if (PyObject_SetAttr(__pyx_m, __pyx_n_s__stats, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
 
-  /* "/Users/mb312/usr/local/lib/python2.6/site-packages/Cython/Includes/python_ref.pxd":1
+  /* "/tmp/cy012/Cython/Includes/python_ref.pxd":1
  * cdef extern from "Python.h":             # <<<<<<<<<<<<<<
  *     ctypedef struct PyTypeObject
  *     ctypedef struct PyObject:
@@ -5221,6 +6240,18 @@ bad:
 }
 
 
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_Format(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(PyObject_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
 static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
     PyErr_Format(PyExc_ValueError,
         #if PY_VERSION_HEX < 0x02050000
@@ -5258,18 +6289,6 @@ static int __Pyx_EndUnpack(PyObject *iter) {
         return -1;
 }
 
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
-    if (unlikely(!type)) {
-        PyErr_Format(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (likely(PyObject_TypeCheck(obj, type)))
-        return 1;
-    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
-                 Py_TYPE(obj)->tp_name, type->tp_name);
-    return 0;
-}
-
 static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
 }
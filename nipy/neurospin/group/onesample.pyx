@@ -227,6 +227,116 @@ def stat_mfx(ndarray Y, ndarray V, id='student_mfx', double base=0.0,
 
 
 
+def stat_permutations(ndarray Y, ndarray Magics, id='student',
+                      double base=0.0, int axis=0, ndarray V=None,
+                      unsigned int niter=5, ndarray T=None):
+  """
+  P = stat_permutations(Y, Magics, id='student', base=0.0, axis=0, V=None, niter=5, T=None).
+
+  Compute a one-sample test statistic over the sign permutations
+  given by magic numbers, looping over the permutations for each
+  voxel in turn rather than over the voxels for each permutation as
+  in stat and stat_mfx, so that the voxel data stays in cache.
+
+  If V is not None, it contains the variances of a mixed-effect
+  statistic. If T is None, the statistic values are returned with
+  the permutations along axis. Otherwise, T contains the values of
+  the statistic without permutation, and a tuple (MaxT, C) is
+  returned, where MaxT is the maximum of each permutation statistic
+  over voxels, and C counts the permutations in which the voxel
+  statistic is larger than or equal to T.
+  """
+  cdef fff_vector *y, *v, *t, *c, *magics, *yp
+  cdef fff_onesample_stat* rstat
+  cdef fff_onesample_stat_mfx* mstat
+  cdef fff_onesample_stat_flag flag_stat = stats[id]
+  cdef unsigned int n
+  cdef int mfx = 0, reduce = 0
+  cdef unsigned long int simu, nsimu
+  cdef double tp, tobs, count
+  cdef double* maxt
+  cdef ndarray MaxT
+  cdef fffpy_multi_iterator* multi
+
+  # Get number of observations
+  n = <unsigned int>Y.shape[axis]
+  if not V == None:
+    mfx = 1
+  else:
+    V = Y
+
+  # Read out magic numbers
+  magics = fff_vector_fromPyArray(Magics)
+  nsimu = magics.size
+
+  # Create output arrays
+  dims = [Y.shape[i] for i in range(Y.ndim)]
+  if T == None:
+    dims[axis] = nsimu
+    P = np.zeros(dims)
+    multi = fffpy_multi_iterator_new(3, axis, <void*>Y, <void*>V, <void*>P)
+  else:
+    reduce = 1
+    dims[axis] = 1
+    T = np.asarray(T, dtype='double').reshape(dims)
+    C = np.zeros(dims)
+    MaxT = np.zeros(nsimu)
+    MaxT.fill(-np.inf)
+    maxt = <double*>MaxT.data
+    multi = fffpy_multi_iterator_new(4, axis, <void*>Y, <void*>V, <void*>T, <void*>C)
+    c = multi.vector[3]
+
+  # Create local structure
+  if mfx:
+    mstat = fff_onesample_stat_mfx_new(n, flag_stat, base)
+    mstat.niter = niter
+  else:
+    rstat = fff_onesample_stat_new(n, flag_stat, base)
+  yp = fff_vector_new(n)
+
+  # Vector views
+  y = multi.vector[0]
+  v = multi.vector[1]
+  t = multi.vector[2]
+
+  # Loop
+  while(multi.index < multi.size):
+    if reduce:
+      tobs = t.data[0]
+      count = 0
+    for simu from 0 <= simu < nsimu:
+      fff_onesample_permute_signs(yp, y, magics.data[simu*magics.stride])
+      if mfx:
+        tp = fff_onesample_stat_mfx_eval(mstat, yp, v)
+      else:
+        tp = fff_onesample_stat_eval(rstat, yp)
+      if reduce:
+        if tp > maxt[simu]:
+          maxt[simu] = tp
+        if tp >= tobs:
+          count = count + 1
+      else:
+        t.data[simu*t.stride] = tp
+    if reduce:
+      c.data[0] = count
+    fffpy_multi_iterator_update(multi)
+
+  # Free memory
+  fffpy_multi_iterator_delete(multi)
+  fff_vector_delete(yp)
+  fff_vector_delete(magics)
+  if mfx:
+    fff_onesample_stat_mfx_delete(mstat)
+  else:
+    fff_onesample_stat_delete(rstat)
+
+  # Return
+  if reduce:
+    return MaxT, C
+  return P
+
+
+
 def pdf_fit_mfx(ndarray Y, ndarray V, int axis=0, int niter=5, int constraint=0, double base=0.0):
   """
   (W, Z) = pdf_fit_mfx(data=Y, vardata=V, axis=0, niter=5, constraint=False, base=0.0).
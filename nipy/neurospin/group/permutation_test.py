@@ -2,6 +2,9 @@
 # vi: set ft=python sts=4 ts=4 sw=4 et:
 """One and two sample permutation tests.
 """
+# Standard library imports
+import os
+
 # Third-party imports
 import numpy as np
 import scipy.misc as sm
@@ -9,7 +12,9 @@ import scipy.misc as sm
 # Our own imports
 from nipy.neurospin.graph import graph_3d_grid, graph_cc
 from nipy.neurospin.graph.field import Field
-from onesample import stat as os_stat, stat_mfx as os_stat_mfx
+from nipy.neurospin.graph.clusters import CSRGraph
+from onesample import stat as os_stat, stat_mfx as os_stat_mfx, \
+     stat_permutations as os_stat_permutations
 from twosample import stat as ts_stat, stat_mfx as ts_stat_mfx
 
 
@@ -19,6 +24,11 @@ DEF_NPERMS = int(1e4)
 DEF_NITER = 5
 DEF_STAT_ONESAMPLE = 'student'
 DEF_STAT_TWOSAMPLE = 'student'
+# Number of permutations evaluated together
+DEF_PERM_BLOCK = 32
+# Largest number of subjects whose sign flips are exactly encoded by a
+# floating point magic number
+MAX_MAGIC_BITS = 52
 
 
 #===========================================
@@ -70,7 +80,7 @@ def max_dist(XYZ,I,J):
 
 
 
-def extract_clusters_from_diam(T,XYZ,th,diam,k=18):
+def extract_clusters_from_diam(T,XYZ,th,diam,k=18,CClabels=None):
     """
     Extract clusters from a statistical map
     under diameter constraint
@@ -80,9 +90,12 @@ def extract_clusters_from_diam(T,XYZ,th,diam,k=18):
          th     <float> minimum threshold
          diam   <int>   maximal diameter (in voxels)
          k      <int>   the number of neighbours considered. (6,18 or 26)
+         CClabels (p)   optional connected components above threshold,
+                        as returned by extract_clusters_from_thresh
     Out: labels (p)     cluster labels
     """
-    CClabels = extract_clusters_from_thresh(T,XYZ,th,k)
+    if CClabels is None:
+        CClabels = extract_clusters_from_thresh(T,XYZ,th,k)
     nCC = CClabels.max() + 1
     labels = -np.ones(len(CClabels),int)
     clust_label = 0
@@ -193,6 +206,15 @@ def onesample_stat(Y, V, stat_id, base=0.0, axis=0, Magics=None, niter=DEF_NITER
     else:
         return os_stat_mfx(Y, V, stat_id, base, axis, Magics, niter)
 
+def onesample_stat_permutations(Y, V, stat_id, Magics, base=0.0, axis=0,
+                                niter=DEF_NITER, T=None):
+    """
+    Wrapper for os_stat_permutations
+    """
+    if stat_id.find('_mfx')<0:
+        V = None
+    return os_stat_permutations(Y, Magics, stat_id, base, axis, V, niter, T)
+
 def twosample_stat(Y1, V1, Y2, V2, stat_id, axis=0, Magics=None, niter=DEF_NITER):
     """
     Wrapper for ts_stat and ts_stat_mfx
@@ -239,12 +261,13 @@ def compute_cluster_stats(Tvalues, labels, random_Tvalues, cluster_stats=["size"
             pseudo_p_values = 1 - np.searchsorted(random_Tvalues,Tvalues)/float(ndraws)
         else:
             Fisher_values = None
-    for i in xrange(nclust):
-        I = np.where(labels==i)[0]
+    if nclust > 0:
+        # Sum over the voxels of each cluster
+        I = np.where(labels >= 0)[0]
         if "size" in cluster_stats:
-            size_values[i] = len(I)
+            size_values[:] = np.bincount(labels[I], minlength=nclust)
         if "Fisher" in cluster_stats:
-            Fisher_values[i] = -np.sum(np.log(pseudo_p_values[I]))
+            Fisher_values[:] = -np.bincount(labels[I], np.log(pseudo_p_values[I]), nclust)
     return size_values, Fisher_values
 
 
@@ -273,6 +296,63 @@ def peak_XYZ(XYZ, Tvalues, labels, label_values):
         C[:, i] = XYZ[:, I[np.argmax(Tvalues[I])]]
     return C
 
+#======================================
+#======================================
+# Parallel calibration helpers
+#======================================
+#======================================
+
+# (instance, arguments) of the calibration in progress, set in each worker
+# process of ``permutation_test.calibrate`` by _calibrate_init
+_calibrate_state = None
+
+
+def _calibrate_init(test, args):
+    """
+    Worker process initializer: keep the calibration in progress
+    """
+    global _calibrate_state
+    _calibrate_state = (test, args)
+
+
+def _calibrate_worker(bounds):
+    """
+    Run permutations bounds[0] to bounds[1]-1 of the calibration in progress
+    """
+    test, args = _calibrate_state
+    return test._calibrate_range(bounds[0], bounds[1], *args)
+
+
+def _merge_ranges(parts, nclusters, nregions):
+    """
+    Merge the partial results of consecutive permutation ranges, as
+    returned by permutation_test._calibrate_range, in permutation order.
+    Per-permutation values are concatenated and counts summed, so the
+    merged result does not depend on how the permutations were split.
+    """
+    merged = {'p_counts': np.sum([part['p_counts'] for part in parts], 0),
+              'maxT': np.concatenate([part['maxT'] for part in parts])}
+    merged['clusters'] = []
+    for i in xrange(nclusters):
+        cparts = [part['clusters'][i] for part in parts]
+        cmerged = {}
+        for key in cparts[0].keys():
+            if key in ('size', 'Fisher'):
+                # pooled cluster values of all permutations
+                cmerged[key] = sum([cpart[key] for cpart in cparts], [])
+            else:
+                cmerged[key] = np.concatenate([cpart[key] for cpart in cparts])
+        merged['clusters'].append(cmerged)
+    merged['regions'] = []
+    for i in xrange(nregions):
+        rparts = [part['regions'][i] for part in parts]
+        if rparts[0] is None:
+            merged['regions'].append(None)
+        else:
+            merged['regions'].append(np.concatenate(rparts, 1))
+    return merged
+
+
 #======================================
 #======================================
 # Generic permutation test class
@@ -290,7 +370,8 @@ class permutation_test:
     #=======================================================
     def calibrate(self, nperms=DEF_NPERMS, clusters=None, 
                   cluster_stats=["size","Fisher"], regions=None, 
-                  region_stats=["Fisher"], verbose=False):
+                  region_stats=["Fisher"], verbose=False, n_jobs=1,
+                  seed=None):
         """
         Calibrate cluster and region summary statistics using permutation test
 
@@ -321,6 +402,17 @@ class permutation_test:
         verbose : boolean, optional
             "Chatterbox" mode switch
 
+        n_jobs : int, optional
+            Number of worker processes the permutations are shared
+            between.  If None, use one process per CPU.  The results do
+            not depend on the number of processes.  Worker processes are
+            forked, so where fork is not available (Windows) the
+            permutations are run in this process.
+
+        seed : None or int, optional
+            Seed of the random generator drawing the permutations.  If
+            None, the global numpy random generator is used.
+
         Returns
         -------
         voxel_results : dict 
@@ -343,6 +435,10 @@ class permutation_test:
             id "S": "size_values", "size_p_values", "perm_size_values", 
             "perm_maxsize_values"
         """
+        if seed is None:
+            rng = np.random
+        else:
+            rng = np.random.RandomState(seed)
         # Permutation indices
         if self.nsamples ==1:
             n, p = self.data.shape[self.axis], self.data.shape[1-self.axis]
@@ -351,43 +447,44 @@ class permutation_test:
             n1,p = self.data1.shape[self.axis], self.data1.shape[1-self.axis]
             n2 = self.data2.shape[self.axis]
             max_nperms = sm.comb(n1+n2,n1,exact=1)
-            data = np.concatenate((self.data1,self.data2), self.axis)
-            if self.vardata1 != None:
-                vardata = np.concatenate((self.vardata1,self.vardata2), self.axis)
+        signs = None
         if nperms == None or nperms >= max_nperms:
             magic_numbers = np.arange(max_nperms)
+        elif self.nsamples == 1:
+            # Random sign flips, drawn here so that each permutation is
+            # the same whichever process computes it
+            flips = rng.randint(2,size=(nperms,n))
+            if n <= MAX_MAGIC_BITS:
+                # Bit i of the magic number flips the sign of subject i
+                magic_numbers = np.dot(flips, 2.0**np.arange(n))
+            else:
+                magic_numbers = np.zeros(nperms)
+                signs = 1-2*flips
         else:
             #magic_numbers = np.random.randint(max_nperms,size=nperms)
             # np.random.randint does not handle longint!
             # So we use the following hack instead:
-            magic_numbers = np.random.uniform(max_nperms,size=nperms)
+            magic_numbers = rng.uniform(max_nperms,size=nperms)
+        nmagic = len(magic_numbers)
         # Initialize cluster_results
         cluster_results = []
+        graph = None
         if clusters != None:
-            for (thresh,diam) in clusters:
-                if diam == None:
-                    if self.XYZ == None:
-                        labels = extract_clusters_from_graph(self.Tvalues,self.G,thresh)
-                    else:
-                        labels = extract_clusters_from_thresh(self.Tvalues,self.XYZ,thresh)
-                else:
-                    labels = extract_clusters_from_diam(self.Tvalues,self.XYZ,thresh,diam)
+            graph = self._cluster_graph()
+            all_labels = self._extract_clusters(self.Tvalues,clusters,graph)
+            for (thresh,diam), labels in zip(clusters,all_labels):
                 results = {"thresh" : thresh, "diam" : diam, "labels" : labels}
                 size_values, Fisher_values = compute_cluster_stats(self.Tvalues, labels, self.random_Tvalues, cluster_stats)
                 nclust = labels.max() + 1
-                results["expected_voxels_per_thresh"] = 0.0
-                results["expected_number_of_clusters"] = 0.0
                 if self.XYZ != None:
                     results["peak_XYZ"] = peak_XYZ(self.XYZ, self.Tvalues, labels, np.arange(nclust))
                 if "size" in cluster_stats:
                     results["size_values"] = size_values
-                    results["perm_size_values"] = []
-                    results["perm_maxsize_values"] = np.zeros(len(magic_numbers),int)
                 if "Fisher" in cluster_stats:
                     results["Fisher_values"] = Fisher_values
-                    results["perm_Fisher_values"] = []
-                    results["perm_maxFisher_values"] = np.zeros(len(magic_numbers),float)
                 cluster_results.append( results )
+        else:
+            clusters = []
         # Initialize region_results
         region_results = []
         if regions != None:
@@ -399,112 +496,200 @@ class permutation_test:
                     results["peak_XYZ"] = peak_XYZ(self.XYZ, self.Tvalues, labels, label_values)
                 if "Fisher" in region_stats:
                     results["Fisher_values"] = compute_region_stat(self.Tvalues, labels, label_values, self.random_Tvalues)
-                    results["perm_Fisher_values"] = np.zeros((nregions,len(magic_numbers)),float)
                     results["Fisher_p_values"] = np.zeros(nregions,float)
                     results["Fisher_Corr_p_values"] = np.zeros(nregions,float)
                 region_results.append( results )
+        else:
+            regions = []
         # Permutation test
-        p_values = np.zeros(p,float)
-        Corr_p_values = np.zeros(p,float)
+        args = (magic_numbers, signs, clusters, graph, cluster_stats, regions,
+                [results["label_values"] for results in region_results],
+                region_stats, verbose)
+        if n_jobs is None:
+            import multiprocessing
+            n_jobs = multiprocessing.cpu_count()
+        n_jobs = min(n_jobs, nmagic)
+        if not hasattr(os, 'fork'):
+            n_jobs = 1
+        if n_jobs <= 1:
+            perm = self._calibrate_range(0, nmagic, *args)
+        else:
+            import multiprocessing
+            # Several ranges per process to balance the load
+            bounds = np.linspace(0, nmagic, min(4*n_jobs, nmagic)+1).astype(int)
+            pool = multiprocessing.Pool(n_jobs, _calibrate_init, (self, args))
+            try:
+                parts = pool.map(_calibrate_worker, zip(bounds[:-1], bounds[1:]))
+            finally:
+                pool.terminate()
+                pool.join()
+            perm = _merge_ranges(parts, len(clusters), len(regions))
+        perm_maxT_values = perm['maxT']
+        p_values = perm['p_counts']
+        Corr_p_values = nmagic - np.searchsorted(np.sort(perm_maxT_values), self.Tvalues)
+        # Compute p-values for clusters summary statistics
+        for i in xrange(len(clusters)):
+            cperm = perm['clusters'][i]
+            cluster_results[i]["expected_voxels_per_thresh"] = cperm["voxels"].sum()/float(nmagic)
+            cluster_results[i]["expected_number_of_clusters"] = cperm["nclust"].sum()/float(nmagic)
+            nperm_clust = float(cperm["nclust"].sum())
+            if "size" in cluster_stats:
+                cluster_results[i]["perm_size_values"] = np.array(cperm["size"])
+                cluster_results[i]["perm_size_values"].sort()
+                cluster_results[i]["perm_maxsize_values"] = np.sort(cperm["maxsize"])
+                cluster_results[i]["size_p_values"] = 1 - np.searchsorted(cluster_results[i]["perm_size_values"], cluster_results[i]["size_values"])/nperm_clust
+                cluster_results[i]["size_Corr_p_values"] = 1 - np.searchsorted(cluster_results[i]["perm_maxsize_values"], cluster_results[i]["size_values"])/float(nmagic)
+            if "Fisher" in cluster_stats:
+                cluster_results[i]["perm_Fisher_values"] = np.array(cperm["Fisher"])
+                cluster_results[i]["perm_Fisher_values"].sort()
+                cluster_results[i]["perm_maxFisher_values"] = np.sort(cperm["maxFisher"])
+                cluster_results[i]["Fisher_p_values"] = 1 - np.searchsorted(cluster_results[i]["perm_Fisher_values"], cluster_results[i]["Fisher_values"])/nperm_clust
+                cluster_results[i]["Fisher_Corr_p_values"] = 1 - np.searchsorted(cluster_results[i]["perm_maxFisher_values"], cluster_results[i]["Fisher_values"])/float(nmagic)
+        # Compute p-values for regions summary statistics
+        for i in xrange(len(regions)):
+            if "Fisher" in region_stats:
+                region_results[i]["perm_Fisher_values"] = perm['regions'][i]
+                sorted_perm_Fisher_values = np.sort(region_results[i]["perm_Fisher_values"],axis=1)
+                label_values = region_results[i]["label_values"]
+                nregions = len(label_values)
+                # Compute uncorrected p-values
+                for j in xrange(nregions):
+                    region_results[i]["Fisher_p_values"][j] = 1 - np.searchsorted(sorted_perm_Fisher_values[j],region_results[i]["Fisher_values"][j])/float(nmagic)
+                #Compute corrected p-values
+                perm_Fisher_p_values = np.zeros((nregions,nmagic),float)
+                for j in xrange(nregions):
+                    I = np.argsort(region_results[i]["perm_Fisher_values"][j])
+                    perm_Fisher_p_values[j][I] = 1 - np.arange(1,nmagic+1)/float(nmagic)
+                perm_min_Fisher_p_values = np.sort(perm_Fisher_p_values.min(axis=0))
+                region_results[i]["Fisher_Corr_p_values"] = 1 - np.searchsorted(-perm_min_Fisher_p_values,-region_results[i]["Fisher_p_values"])/float(nmagic)
+        voxel_results = {'p_values':p_values/float(nmagic), 
+                         'Corr_p_values':Corr_p_values/float(nmagic),
+                         'perm_maxT_values':perm_maxT_values}
+        return voxel_results, cluster_results, region_results
+
+
+    def _cluster_graph(self):
+        """
+        Neighbourhood graph of the voxels used for cluster extraction
+        """
+        if self.XYZ is None:
+            return CSRGraph.from_edges(self.G.V, self.G.edges)
+        return CSRGraph.from_3d_grid(self.XYZ.transpose())
+
+
+    def _extract_clusters(self, Tvalues, clusters, graph):
+        """
+        Cluster labels of the statistical map Tvalues for each cluster
+        extraction pair (thresh, diam) in clusters. The connected
+        components above all thresholds are labelled in one pass over
+        the neighbourhood graph.
+        """
+        CClabels = graph.threshold_labels(Tvalues,[thresh for thresh, diam in clusters])
+        labels = []
+        for (thresh, diam), CC in zip(clusters, CClabels):
+            if diam == None:
+                labels.append(CC)
+            else:
+                labels.append(extract_clusters_from_diam(Tvalues,self.XYZ,thresh,diam,CClabels=CC))
+        return labels
+
+
+    def _permutation_Tvalues(self, magic_numbers, signs, start, stop):
+        """
+        Statistic values under permutations start to stop-1, as a
+        (stop-start, p) array. The sign flips of a one sample test are
+        given by signs if not None, and by the magic numbers otherwise.
+        """
+        if self.nsamples == 1 and signs is not None:
+            shape = [1,1]
+            shape[self.axis] = signs.shape[1]
+            Tvalues = []
+            for j in xrange(start, stop):
+                rand_sign = signs[j].reshape(shape)
+                rand_data = rand_sign*self.data
+                # Variances are not sign flipped
+                Tvalues.append(onesample_stat(rand_data, self.vardata, self.stat_id, self.base, self.axis, None, self.niter).ravel())
+            return np.array(Tvalues)
+        if self.nsamples == 1:
+            Tvalues = onesample_stat_permutations(self.data, self.vardata, self.stat_id, magic_numbers[start:stop], self.base, self.axis, self.niter)
+        else:
+            Tvalues = twosample_stat(self.data1, self.vardata1, self.data2, self.vardata2, self.stat_id, self.axis, magic_numbers[start:stop], self.niter)
+        if self.axis == 1:
+            Tvalues = Tvalues.T
+        return Tvalues
+
+
+    def _calibrate_range(self, start, stop, magic_numbers, signs, clusters,
+                         graph, cluster_stats, regions, region_label_values,
+                         region_stats, verbose):
+        """
+        Run permutations start to stop-1 of a calibration, and reduce them
+        to voxel exceedance counts and per-permutation values of the
+        maximum statistic and of the cluster and region statistics.
+        See _merge_ranges for the merging of consecutive ranges.
+        """
         nmagic = len(magic_numbers)
-        perm_maxT_values = np.zeros(nmagic, float)
-        for j in xrange(nmagic):
-            m = magic_numbers[j]
+        if len(clusters) == 0 and len(regions) == 0 and \
+               self.nsamples == 1 and signs is None:
+            # Only the voxel statistics are needed: reduce them in the
+            # permutation loop of each voxel
+            if verbose:
+                print "Permutations", start+1, "to", stop, "out of", nmagic
+            maxT, p_counts = onesample_stat_permutations(self.data, self.vardata, self.stat_id, magic_numbers[start:stop], self.base, self.axis, self.niter, self.Tvalues)
+            return {'p_counts': p_counts.squeeze(), 'maxT': maxT,
+                    'clusters': [], 'regions': []}
+        nperm = stop - start
+        p_counts = np.zeros(len(self.Tvalues),float)
+        maxT = np.zeros(nperm,float)
+        cluster_parts = []
+        for i in xrange(len(clusters)):
+            part = {"voxels" : np.zeros(nperm,float),
+                    "nclust" : np.zeros(nperm,int)}
+            if "size" in cluster_stats:
+                part["size"] = []
+                part["maxsize"] = np.zeros(nperm,int)
+            if "Fisher" in cluster_stats:
+                part["Fisher"] = []
+                part["maxFisher"] = np.zeros(nperm,float)
+            cluster_parts.append(part)
+        region_parts = []
+        for label_values in region_label_values:
+            if "Fisher" in region_stats:
+                region_parts.append(np.zeros((len(label_values),nperm),float))
+            else:
+                region_parts.append(None)
+        for j in xrange(start, stop):
+            k = j - start
             if verbose:
                 print "Permutation", j+1, "out of", nmagic
-            # T values under permutation
-            if self.nsamples == 1:
-                #perm_Tvalues = onesample_stat(self.data, self.vardata, self.stat_id, self.base, self.axis, np.array([m]), self.niter).squeeze()
-                rand_sign = (np.random.randint(2,size=n)*2-1).reshape(n,1)
-                rand_data = rand_sign*self.data
-                if self.vardata == None:
-                    rand_vardata = None
-                else:
-                    rand_vardata = rand_sign*self.vardata
-                perm_Tvalues = onesample_stat(rand_data, rand_vardata, self.stat_id, self.base, self.axis, None, self.niter).squeeze()
-            elif self.nsamples == 2:
-                perm_Tvalues = twosample_stat(self.data1, self.vardata1, self.data2, self.vardata2, self.stat_id, self.axis, np.array([m]), self.niter).squeeze()
-                rand_perm = np.random.permutation(np.arange(n1+n2))
-                rand_data1 = data[:n1]
-                rand_data2 = data[n1:]
-                if self.vardata1 == None:
-                    rand_vardata1 = None
-                    rand_vardata2 = None
-                else:
-                    rand_vardata1 = vardata[:n1]
-                    rand_vardata2 = vardata[n1:]
-            # update p values
-            p_values += perm_Tvalues >= self.Tvalues
-            Corr_p_values += max(perm_Tvalues) >= self.Tvalues
-            perm_maxT_values[j] = max(perm_Tvalues)
-            # Update cluster_results
-            if clusters != None:
-                for i in xrange(len(clusters)):
-                    thresh, diam = clusters[i]
-                    if diam == None:
-                        if self.XYZ == None:
-                            perm_labels = extract_clusters_from_graph(perm_Tvalues,self.G,thresh)
-                        else:
-                            perm_labels = extract_clusters_from_thresh(perm_Tvalues,self.XYZ,thresh)
-                    else:
-                        perm_labels = extract_clusters_from_diam(perm_Tvalues,self.XYZ,thresh,diam)
-                    perm_size_values, perm_Fisher_values = compute_cluster_stats(perm_Tvalues, perm_labels, self.random_Tvalues, cluster_stats)
-                    perm_nclust = labels.max() + 1
-                    cluster_results[i]["expected_voxels_per_thresh"] += perm_size_values.sum()/float(nclust)
-                    cluster_results[i]["expected_number_of_clusters"] += nclust
-                    if "size" in cluster_stats:
-                        cluster_results[i]["perm_size_values"][:0] = perm_size_values
-                        cluster_results[i]["perm_maxsize_values"][j] = max(perm_size_values)
-                    if "Fisher" in cluster_stats:
-                        cluster_results[i]["perm_Fisher_values"][:0] = perm_Fisher_values
-                        cluster_results[i]["perm_maxFisher_values"][j] = max(perm_Fisher_values)
-            # Update region_results
-            if regions != None:
-                for i in xrange(len(regions)):
-                    labels = regions[i]
-                    label_values = region_results[i]["label_values"]
-                    nregions = len(label_values)
-                    if "Fisher" in region_stats:
-                        perm_Fisher_values = compute_region_stat(perm_Tvalues, labels, label_values, self.random_Tvalues)
-                        region_results[i]["perm_Fisher_values"][:,j] = perm_Fisher_values
-        # Compute p-values for clusters summary statistics
-        if clusters != None:
+            # T values under permutation, computed by blocks
+            if k % DEF_PERM_BLOCK == 0:
+                block_Tvalues = self._permutation_Tvalues(magic_numbers, signs, j, min(j+DEF_PERM_BLOCK, stop))
+                p_counts += np.sum(block_Tvalues >= self.Tvalues, 0)
+                maxT[k:k+len(block_Tvalues)] = block_Tvalues.max(1)
+            perm_Tvalues = block_Tvalues[k % DEF_PERM_BLOCK]
+            # Update cluster statistics
+            if len(clusters) > 0:
+                all_perm_labels = self._extract_clusters(perm_Tvalues,clusters,graph)
             for i in xrange(len(clusters)):
+                perm_labels = all_perm_labels[i]
+                perm_size_values, perm_Fisher_values = compute_cluster_stats(perm_Tvalues, perm_labels, self.random_Tvalues, cluster_stats)
+                perm_nclust = perm_labels.max() + 1
+                part = cluster_parts[i]
+                part["voxels"][k] = (perm_labels >= 0).sum()
+                part["nclust"][k] = perm_nclust
                 if "size" in cluster_stats:
-                    cluster_results[i]["perm_size_values"] = np.array(cluster_results[i]["perm_size_values"])
-                    cluster_results[i]["perm_size_values"].sort()
-                    cluster_results[i]["perm_maxsize_values"].sort()
-                    cluster_results[i]["size_p_values"] = 1 - np.searchsorted(cluster_results[i]["perm_size_values"], cluster_results[i]["size_values"])/float(cluster_results[i]["expected_number_of_clusters"])
-                    cluster_results[i]["size_Corr_p_values"] = 1 - np.searchsorted(cluster_results[i]["perm_maxsize_values"], cluster_results[i]["size_values"])/float(nmagic)
+                    part["size"].extend(perm_size_values)
+                    part["maxsize"][k] = max(perm_size_values)
                 if "Fisher" in cluster_stats:
-                    cluster_results[i]["perm_Fisher_values"] = np.array(cluster_results[i]["perm_Fisher_values"])
-                    cluster_results[i]["perm_Fisher_values"].sort()
-                    cluster_results[i]["perm_maxFisher_values"].sort()
-                    cluster_results[i]["Fisher_p_values"] = 1 - np.searchsorted(cluster_results[i]["perm_Fisher_values"], cluster_results[i]["Fisher_values"])/float(cluster_results[i]["expected_number_of_clusters"])
-                    cluster_results[i]["Fisher_Corr_p_values"] = 1 - np.searchsorted(cluster_results[i]["perm_maxFisher_values"], cluster_results[i]["Fisher_values"])/float(nmagic)
-                cluster_results[i]["expected_voxels_per_thresh"] /= float(nmagic)
-                cluster_results[i]["expected_number_of_clusters"] /= float(nmagic)
-        # Compute p-values for regions summary statistics
-        if regions != None:
+                    part["Fisher"].extend(perm_Fisher_values)
+                    part["maxFisher"][k] = max(perm_Fisher_values)
+            # Update region statistics
             for i in xrange(len(regions)):
                 if "Fisher" in region_stats:
-                    sorted_perm_Fisher_values = np.sort(region_results[i]["perm_Fisher_values"],axis=1)
-                    label_values = region_results[i]["label_values"]
-                    nregions = len(label_values)
-                    # Compute uncorrected p-values
-                    for j in xrange(nregions):
-                        region_results[i]["Fisher_p_values"][j] = 1 - np.searchsorted(sorted_perm_Fisher_values[j],region_results[i]["Fisher_values"][j])/float(nmagic)
-                    #Compute corrected p-values
-                    perm_Fisher_p_values = np.zeros((nregions,nmagic),float)
-                    for j in xrange(nregions):
-                        I = np.argsort(region_results[i]["perm_Fisher_values"][j])
-                        perm_Fisher_p_values[j][I] = 1 - np.arange(1,nmagic+1)/float(nmagic)
-                    perm_min_Fisher_p_values = np.sort(perm_Fisher_p_values.min(axis=0))
-                    region_results[i]["Fisher_Corr_p_values"] = 1 - np.searchsorted(-perm_min_Fisher_p_values,-region_results[i]["Fisher_p_values"])/float(nmagic)
-        voxel_results = {'p_values':p_values/float(nmagic), 
-                         'Corr_p_values':Corr_p_values/float(nmagic),
-                         'perm_maxT_values':perm_maxT_values}
-        return voxel_results, cluster_results, region_results
+                    region_parts[i][:,k] = compute_region_stat(perm_Tvalues, regions[i], region_label_values[i], self.random_Tvalues)
+        return {'p_counts': p_counts, 'maxT': maxT,
+                'clusters': cluster_parts, 'regions': region_parts}
 
 
 
@@ -3,6 +3,7 @@
 import unittest
 
 import numpy as np
+from numpy.testing import assert_array_equal, assert_array_almost_equal
 
 from nipy.neurospin.group import permutation_test as PT
 import nipy.neurospin.graph as fg
@@ -66,5 +67,68 @@ class test_permutation_test(unittest.TestCase):
         P = PT.permutation_test_twosample(data1, data2, XYZ, vardata1=vardata1, vardata2=vardata2, stat_id="student_mfx", ndraws=ndraws)
         p_values, cluster_results, region_results = P.calibrate(nperms=nperms, clusters=c, regions=r)
 
+    def test_calibrate_n_jobs(self):
+        data, vardata, XYZ = make_data(mask_shape=(6,6,6))
+        P1 = PT.permutation_test_onesample(data, XYZ, ndraws=ndraws)
+        P2 = PT.permutation_test_twosample(data[:5], data[5:], XYZ,
+                                           ndraws=ndraws)
+        for P in (P1, P2):
+            c = [(P.random_Tvalues[P.ndraws*(0.5)],None)]
+            r = [np.arange(data.shape[1]) % 3]
+            results = [P.calibrate(nperms=7, clusters=c, regions=r,
+                                   n_jobs=n_jobs, seed=0)
+                       for n_jobs in (1, 1, 3)]
+            for voxel, cluster, region in results[1:]:
+                for key, value in results[0][0].items():
+                    assert_array_equal(value, voxel[key])
+                for key, value in results[0][1][0].items():
+                    assert_array_equal(value, cluster[0][key])
+                for key, value in results[0][2][0].items():
+                    assert_array_equal(value, region[0][key])
+
+    def test_calibrate_signs(self):
+        # Sign flips given as signs (the fallback for groups too large
+        # for magic numbers) match the magic number path
+        data, vardata, XYZ = make_data(mask_shape=(5,5,5))
+        for stat_id, vdata in (("student", None), ("student_mfx", vardata)):
+            P = PT.permutation_test_onesample(data, XYZ, vardata=vdata,
+                                              stat_id=stat_id, ndraws=ndraws)
+            c = [(P.random_Tvalues[P.ndraws*(0.5)],None)]
+            r = [np.arange(data.shape[1]) % 3]
+            results = []
+            max_magic_bits = PT.MAX_MAGIC_BITS
+            for bits in (max_magic_bits, 0):
+                PT.MAX_MAGIC_BITS = bits
+                try:
+                    results.append(P.calibrate(nperms=7, clusters=c,
+                                               regions=r, seed=0))
+                finally:
+                    PT.MAX_MAGIC_BITS = max_magic_bits
+            for res, res_signs in zip(results[0], results[1]):
+                if not isinstance(res, dict):
+                    res, res_signs = res[0], res_signs[0]
+                for key, value in res.items():
+                    if value is None:
+                        self.assertEqual(res_signs[key], None)
+                    else:
+                        assert_array_almost_equal(value, res_signs[key])
+
+    def test_expected_voxels(self):
+        # Mean number of suprathreshold voxels under permutation, whatever
+        # the cluster statistics
+        data, vardata, XYZ = make_data(n=5, mask_shape=(6,6,6))
+        P = PT.permutation_test_onesample(data, XYZ, ndraws=ndraws)
+        thresh = 1.0
+        nmagic = 2**data.shape[0]
+        perm_Tvalues = P._permutation_Tvalues(np.arange(nmagic), None,
+                                              0, nmagic)
+        expected = (perm_Tvalues >= thresh).sum()/float(nmagic)
+        for cluster_stats in (["size"], ["Fisher"]):
+            voxel, cluster, region = P.calibrate(
+                clusters=[(thresh, None)], cluster_stats=cluster_stats)
+            self.assertAlmostEqual(cluster[0]["expected_voxels_per_thresh"],
+                                   expected)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -57,6 +57,32 @@ def test_onesample_stat():
     xT = x.T.copy()
     y = onesample.stat(xT, axis=0).reshape(nvox)
     assert_equal(y, y_target)
+
+
+def test_onesample_stat_permutations():
+    Y = np.random.randn(10, 3, 4)
+    V = np.random.rand(10, 3, 4)
+    magics = np.arange(7) * 131.
+    for id, VY in (('student', None), ('wilcoxon', None),
+                   ('student_mfx', V)):
+        if VY == None:
+            T = onesample.stat(Y, id, 0.0, 0, magics)
+        else:
+            T = onesample.stat_mfx(Y, V, id, 0.0, 0, magics)
+        assert_equal(onesample.stat_permutations(Y, magics, id, V=VY), T)
+        # Same, along the last axis
+        if VY == None:
+            VT = None
+        else:
+            VT = np.rollaxis(VY, 0, 3)
+        P = onesample.stat_permutations(np.rollaxis(Y, 0, 3), magics, id,
+                                        axis=2, V=VT)
+        assert_equal(P, np.rollaxis(T, 0, 3))
+        # Maxima and exceedance counts
+        T0 = T[:1]
+        maxT, C = onesample.stat_permutations(Y, magics, id, V=VY, T=T0)
+        assert_equal(maxT, T.reshape(7, -1).max(1))
+        assert_equal(C, np.sum(T >= T0, 0)[None])
     
 
     
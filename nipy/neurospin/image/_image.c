@@ -1,4 +1,4 @@
-/* Generated by Cython 0.12.1 on Mon Jul 19 16:49:49 2010 */
+/* Generated by Cython 0.12.1 on Sun Oct 18 06:04:59 2026 */
 
 #define PY_SSIZE_T_CLEAN
 #include "Python.h"
@@ -452,6 +452,11 @@ static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
 
 static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_npy_intp(npy_intp);
 
+static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     #define __Pyx_CREAL(z) ((z).real())
@@ -533,11 +538,6 @@ static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(do
     /*static CYTHON_INLINE double __Pyx_c_abs(__pyx_t_double_complex);*/
 #endif
 
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-
 static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
 
 static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
@@ -610,16 +610,22 @@ int __pyx_module_is_main_nipy__neurospin__image___image = 0;
 static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_RuntimeError;
-static char __pyx_k_1[] = "ndarray is not C contiguous";
-static char __pyx_k_2[] = "ndarray is not Fortran contiguous";
-static char __pyx_k_3[] = "Non-native byte order not supported";
-static char __pyx_k_4[] = "unknown dtype code in numpy.pxd (%d)";
-static char __pyx_k_5[] = "Format string allocated too short, see comment in numpy.pxd";
-static char __pyx_k_6[] = "Format string allocated too short.";
-static char __pyx_k_7[] = "\nImage processing routines: \n  * cubic spline sampling \n";
-static char __pyx_k_8[] = "0.2";
-static char __pyx_k_9[] = "cspline_sample4d (line 85)";
-static char __pyx_k_10[] = "cspline_resample3d (line 109)";
+static char __pyx_k_1[] = "Array dtype must be double";
+static char __pyx_k_2[] = "Invalid axis";
+static char __pyx_k_3[] = "ndarray is not C contiguous";
+static char __pyx_k_4[] = "ndarray is not Fortran contiguous";
+static char __pyx_k_5[] = "Non-native byte order not supported";
+static char __pyx_k_6[] = "unknown dtype code in numpy.pxd (%d)";
+static char __pyx_k_7[] = "Format string allocated too short, see comment in numpy.pxd";
+static char __pyx_k_8[] = "Format string allocated too short.";
+static char __pyx_k_9[] = "\nImage processing routines: \n  * cubic spline sampling \n";
+static char __pyx_k_10[] = "0.2";
+static char __pyx_k_11[] = "cspline_transform_axis (line 41)";
+static char __pyx_k_12[] = "cspline_transform_axis";
+static char __pyx_k_13[] = "cspline_sample4d (line 103)";
+static char __pyx_k_14[] = "cspline_sample4d_grad (line 127)";
+static char __pyx_k_15[] = "cspline_sample4d_grad";
+static char __pyx_k_16[] = "cspline_resample3d (line 161)";
 static char __pyx_k__B[] = "B";
 static char __pyx_k__C[] = "C";
 static char __pyx_k__H[] = "H";
@@ -633,6 +639,7 @@ static char __pyx_k__X[] = "X";
 static char __pyx_k__Y[] = "Y";
 static char __pyx_k__Z[] = "Z";
 static char __pyx_k__b[] = "b";
+static char __pyx_k__c[] = "c";
 static char __pyx_k__d[] = "d";
 static char __pyx_k__f[] = "f";
 static char __pyx_k__g[] = "g";
@@ -640,6 +647,10 @@ static char __pyx_k__h[] = "h";
 static char __pyx_k__i[] = "i";
 static char __pyx_k__l[] = "l";
 static char __pyx_k__q[] = "q";
+static char __pyx_k__DT[] = "DT";
+static char __pyx_k__DX[] = "DX";
+static char __pyx_k__DY[] = "DY";
+static char __pyx_k__DZ[] = "DZ";
 static char __pyx_k__Zd[] = "Zd";
 static char __pyx_k__Zf[] = "Zf";
 static char __pyx_k__Zg[] = "Zg";
@@ -648,6 +659,7 @@ static char __pyx_k__np[] = "np";
 static char __pyx_k__buf[] = "buf";
 static char __pyx_k__obj[] = "obj";
 static char __pyx_k__Tvox[] = "Tvox";
+static char __pyx_k__axis[] = "axis";
 static char __pyx_k__base[] = "base";
 static char __pyx_k__data[] = "data";
 static char __pyx_k__dims[] = "dims";
@@ -684,16 +696,26 @@ static char __pyx_k____version__[] = "__version__";
 static char __pyx_k__RuntimeError[] = "RuntimeError";
 static char __pyx_k__cspline_sample4d[] = "cspline_sample4d";
 static char __pyx_k__cspline_resample3d[] = "cspline_resample3d";
-static PyObject *__pyx_kp_u_1;
-static PyObject *__pyx_kp_u_10;
-static PyObject *__pyx_kp_u_2;
+static PyObject *__pyx_kp_s_1;
+static PyObject *__pyx_kp_s_10;
+static PyObject *__pyx_kp_u_11;
+static PyObject *__pyx_n_s_12;
+static PyObject *__pyx_kp_u_13;
+static PyObject *__pyx_kp_u_14;
+static PyObject *__pyx_n_s_15;
+static PyObject *__pyx_kp_u_16;
+static PyObject *__pyx_kp_s_2;
 static PyObject *__pyx_kp_u_3;
 static PyObject *__pyx_kp_u_4;
 static PyObject *__pyx_kp_u_5;
 static PyObject *__pyx_kp_u_6;
-static PyObject *__pyx_kp_s_8;
-static PyObject *__pyx_kp_u_9;
+static PyObject *__pyx_kp_u_7;
+static PyObject *__pyx_kp_u_8;
 static PyObject *__pyx_n_s__C;
+static PyObject *__pyx_n_s__DT;
+static PyObject *__pyx_n_s__DX;
+static PyObject *__pyx_n_s__DY;
+static PyObject *__pyx_n_s__DZ;
 static PyObject *__pyx_n_s__R;
 static PyObject *__pyx_n_s__RuntimeError;
 static PyObject *__pyx_n_s__T;
@@ -707,9 +729,11 @@ static PyObject *__pyx_n_s____test__;
 static PyObject *__pyx_n_s____version__;
 static PyObject *__pyx_n_s__asarray;
 static PyObject *__pyx_n_s__astype;
+static PyObject *__pyx_n_s__axis;
 static PyObject *__pyx_n_s__base;
 static PyObject *__pyx_n_s__buf;
 static PyObject *__pyx_n_s__byteorder;
+static PyObject *__pyx_n_s__c;
 static PyObject *__pyx_n_s__cspline_resample3d;
 static PyObject *__pyx_n_s__cspline_sample4d;
 static PyObject *__pyx_n_s__data;
@@ -743,7 +767,7 @@ static PyObject *__pyx_n_s__zeros;
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_15;
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":33
+/* "/root/package/nipy/neurospin/image/_image.pyx":36
  * 
  * 
  * def cspline_transform(ndarray x):             # <<<<<<<<<<<<<<
@@ -768,36 +792,36 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_transform(PyOb
   __pyx_self = __pyx_self;
   __pyx_v_c = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":34
+  /* "/root/package/nipy/neurospin/image/_image.pyx":37
  * 
  * def cspline_transform(ndarray x):
  *     c = np.zeros([x.shape[i] for i in range(x.ndim)], dtype=np.double)             # <<<<<<<<<<<<<<
  *     cubic_spline_transform(c, x)
  *     return c
  */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_4 = PyInt_FromLong(((PyArrayObject *)__pyx_v_x)->nd); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyInt_FromLong(((PyArrayObject *)__pyx_v_x)->nd); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
   __Pyx_GIVEREF(__pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = PyObject_Call(__pyx_builtin_range, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_Call(__pyx_builtin_range, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   if (PyList_CheckExact(__pyx_t_4) || PyTuple_CheckExact(__pyx_t_4)) {
     __pyx_t_3 = 0; __pyx_t_5 = __pyx_t_4; __Pyx_INCREF(__pyx_t_5);
   } else {
-    __pyx_t_3 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -811,7 +835,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_transform(PyOb
     } else {
       __pyx_t_4 = PyIter_Next(__pyx_t_5);
       if (!__pyx_t_4) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         break;
       }
       __Pyx_GOTREF(__pyx_t_4);
@@ -819,29 +843,29 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_transform(PyOb
     __Pyx_DECREF(__pyx_v_i);
     __pyx_v_i = __pyx_t_4;
     __pyx_t_4 = 0;
-    __pyx_t_6 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_6 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_4 = __Pyx_PyInt_to_py_npy_intp((((PyArrayObject *)__pyx_v_x)->dimensions[__pyx_t_6])); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_6 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_PyInt_to_py_npy_intp((((PyArrayObject *)__pyx_v_x)->dimensions[__pyx_t_6])); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_7 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_4); if (unlikely(__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_4); if (unlikely(__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   }
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_INCREF(((PyObject *)__pyx_t_1));
   PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_t_1));
   __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_8 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__double); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__double); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__dtype), __pyx_t_8) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__dtype), __pyx_t_8) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = PyEval_CallObjectWithKeywords(__pyx_t_2, __pyx_t_5, ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = PyEval_CallObjectWithKeywords(__pyx_t_2, __pyx_t_5, ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -850,22 +874,22 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_transform(PyOb
   __pyx_v_c = __pyx_t_8;
   __pyx_t_8 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":35
+  /* "/root/package/nipy/neurospin/image/_image.pyx":38
  * def cspline_transform(ndarray x):
  *     c = np.zeros([x.shape[i] for i in range(x.ndim)], dtype=np.double)
  *     cubic_spline_transform(c, x)             # <<<<<<<<<<<<<<
  *     return c
  * 
  */
-  if (!(likely(((__pyx_v_c) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_c, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 35; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_v_c) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_c, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   cubic_spline_transform(((PyArrayObject *)__pyx_v_c), ((PyArrayObject *)__pyx_v_x));
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":36
+  /* "/root/package/nipy/neurospin/image/_image.pyx":39
  *     c = np.zeros([x.shape[i] for i in range(x.ndim)], dtype=np.double)
  *     cubic_spline_transform(c, x)
  *     return c             # <<<<<<<<<<<<<<
  * 
- * cdef ndarray _reshaped_double(object in_arr, ndarray sh_arr):
+ * def cspline_transform_axis(ndarray c, int axis):
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_c);
@@ -890,7 +914,191 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_transform(PyOb
   return __pyx_r;
 }
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":38
+/* "/root/package/nipy/neurospin/image/_image.pyx":41
+ *     return c
+ * 
+ * def cspline_transform_axis(ndarray c, int axis):             # <<<<<<<<<<<<<<
+ *     """
+ *     cspline_transform_axis(c, axis)
+ */
+
+static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_transform_axis(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_5image_6_image_cspline_transform_axis[] = "\n    cspline_transform_axis(c, axis)\n\n    In-place cubic spline transform of the double array c along one\n    axis. Transforming along every axis in turn is equivalent to\n    cspline_transform. \n    ";
+static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_transform_axis(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_c = 0;
+  int __pyx_v_axis;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__c,&__pyx_n_s__axis,0};
+  __Pyx_RefNannySetupContext("cspline_transform_axis");
+  __pyx_self = __pyx_self;
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[2] = {0,0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__c);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__axis);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("cspline_transform_axis", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "cspline_transform_axis") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_c = ((PyArrayObject *)values[0]);
+    __pyx_v_axis = __Pyx_PyInt_AsInt(values[1]); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_c = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
+    __pyx_v_axis = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_axis == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("cspline_transform_axis", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nipy.neurospin.image._image.cspline_transform_axis");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_c);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_c), __pyx_ptype_5numpy_ndarray, 1, "c", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/image/_image.pyx":49
+ *     cspline_transform.
+ *     """
+ *     if not c.dtype == np.double:             # <<<<<<<<<<<<<<
+ *         raise ValueError('Array dtype must be double')
+ *     if axis < 0 or axis >= c.ndim:
+ */
+  __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_c), __pyx_n_s__dtype); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__double); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_RichCompare(__pyx_t_1, __pyx_t_3, Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_5 = (!__pyx_t_4);
+  if (__pyx_t_5) {
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":50
+ *     """
+ *     if not c.dtype == np.double:
+ *         raise ValueError('Array dtype must be double')             # <<<<<<<<<<<<<<
+ *     if axis < 0 or axis >= c.ndim:
+ *         raise ValueError('Invalid axis')
+ */
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_1));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
+    __pyx_t_3 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/nipy/neurospin/image/_image.pyx":51
+ *     if not c.dtype == np.double:
+ *         raise ValueError('Array dtype must be double')
+ *     if axis < 0 or axis >= c.ndim:             # <<<<<<<<<<<<<<
+ *         raise ValueError('Invalid axis')
+ *     cubic_spline_transform_axis(c, axis)
+ */
+  __pyx_t_5 = (__pyx_v_axis < 0);
+  if (!__pyx_t_5) {
+    __pyx_t_4 = (__pyx_v_axis >= __pyx_v_c->nd);
+    __pyx_t_6 = __pyx_t_4;
+  } else {
+    __pyx_t_6 = __pyx_t_5;
+  }
+  if (__pyx_t_6) {
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":52
+ *         raise ValueError('Array dtype must be double')
+ *     if axis < 0 or axis >= c.ndim:
+ *         raise ValueError('Invalid axis')             # <<<<<<<<<<<<<<
+ *     cubic_spline_transform_axis(c, axis)
+ *     return c
+ */
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)__pyx_kp_s_2));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_s_2));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_2));
+    __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
+
+  /* "/root/package/nipy/neurospin/image/_image.pyx":53
+ *     if axis < 0 or axis >= c.ndim:
+ *         raise ValueError('Invalid axis')
+ *     cubic_spline_transform_axis(c, axis)             # <<<<<<<<<<<<<<
+ *     return c
+ * 
+ */
+  cubic_spline_transform_axis(__pyx_v_c, __pyx_v_axis);
+
+  /* "/root/package/nipy/neurospin/image/_image.pyx":54
+ *         raise ValueError('Invalid axis')
+ *     cubic_spline_transform_axis(c, axis)
+ *     return c             # <<<<<<<<<<<<<<
+ * 
+ * cdef ndarray _reshaped_double(object in_arr, ndarray sh_arr):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_c));
+  __pyx_r = ((PyObject *)__pyx_v_c);
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("nipy.neurospin.image._image.cspline_transform_axis");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_c);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/nipy/neurospin/image/_image.pyx":56
  *     return c
  * 
  * cdef ndarray _reshaped_double(object in_arr, ndarray sh_arr):             # <<<<<<<<<<<<<<
@@ -912,29 +1120,29 @@ static  PyArrayObject *__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(
   __pyx_v_shape = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":39
+  /* "/root/package/nipy/neurospin/image/_image.pyx":57
  * 
  * cdef ndarray _reshaped_double(object in_arr, ndarray sh_arr):
  *     shape = [sh_arr.shape[i] for i in range(sh_arr.ndim)]             # <<<<<<<<<<<<<<
  *     return np.reshape(in_arr, shape).astype(np.double)
  * 
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_3 = PyInt_FromLong(__pyx_v_sh_arr->nd); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromLong(__pyx_v_sh_arr->nd); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_3);
   __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_Call(__pyx_builtin_range, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_builtin_range, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
     __pyx_t_2 = 0; __pyx_t_4 = __pyx_t_3; __Pyx_INCREF(__pyx_t_4);
   } else {
-    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -948,7 +1156,7 @@ static  PyArrayObject *__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(
     } else {
       __pyx_t_3 = PyIter_Next(__pyx_t_4);
       if (!__pyx_t_3) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         break;
       }
       __Pyx_GOTREF(__pyx_t_3);
@@ -956,10 +1164,10 @@ static  PyArrayObject *__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(
     __Pyx_DECREF(__pyx_v_i);
     __pyx_v_i = __pyx_t_3;
     __pyx_t_3 = 0;
-    __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_3 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_sh_arr->dimensions[__pyx_t_5])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_5 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_sh_arr->dimensions[__pyx_t_5])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_3); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_3); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -968,7 +1176,7 @@ static  PyArrayObject *__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(
   __pyx_v_shape = ((PyObject *)__pyx_t_1);
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":40
+  /* "/root/package/nipy/neurospin/image/_image.pyx":58
  * cdef ndarray _reshaped_double(object in_arr, ndarray sh_arr):
  *     shape = [sh_arr.shape[i] for i in range(sh_arr.ndim)]
  *     return np.reshape(in_arr, shape).astype(np.double)             # <<<<<<<<<<<<<<
@@ -976,12 +1184,12 @@ static  PyArrayObject *__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(
  * def cspline_sample1d(ndarray R, ndarray C, X=0):
  */
   __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__reshape); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__reshape); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_v_in_arr);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_in_arr);
@@ -989,28 +1197,28 @@ static  PyArrayObject *__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(
   __Pyx_INCREF(__pyx_v_shape);
   PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_shape);
   __Pyx_GIVEREF(__pyx_v_shape);
-  __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__astype); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__astype); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__double); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__double); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
   __Pyx_GIVEREF(__pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = ((PyArrayObject *)__pyx_t_4);
   __pyx_t_4 = 0;
   goto __pyx_L0;
@@ -1031,7 +1239,7 @@ static  PyArrayObject *__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(
   return __pyx_r;
 }
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":42
+/* "/root/package/nipy/neurospin/image/_image.pyx":60
  *     return np.reshape(in_arr, shape).astype(np.double)
  * 
  * def cspline_sample1d(ndarray R, ndarray C, X=0):             # <<<<<<<<<<<<<<
@@ -1076,7 +1284,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample1d(PyObj
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__C);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("cspline_sample1d", 0, 2, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("cspline_sample1d", 0, 2, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       if (kw_args > 0) {
@@ -1085,7 +1293,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample1d(PyObj
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "cspline_sample1d") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "cspline_sample1d") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_R = ((PyArrayObject *)values[0]);
     __pyx_v_C = ((PyArrayObject *)values[1]);
@@ -1104,7 +1312,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample1d(PyObj
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("cspline_sample1d", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("cspline_sample1d", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nipy.neurospin.image._image.cspline_sample1d");
   return NULL;
@@ -1114,37 +1322,37 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample1d(PyObj
   __Pyx_INCREF(__pyx_v_X);
   __pyx_v_multi = ((PyArrayMultiIterObject *)Py_None); __Pyx_INCREF(Py_None);
   __pyx_v_Xa = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_R), __pyx_ptype_5numpy_ndarray, 1, "R", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_C), __pyx_ptype_5numpy_ndarray, 1, "C", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_R), __pyx_ptype_5numpy_ndarray, 1, "R", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_C), __pyx_ptype_5numpy_ndarray, 1, "C", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":45
+  /* "/root/package/nipy/neurospin/image/_image.pyx":63
  *     cdef double *r, *x
  *     cdef broadcast multi
  *     Xa = _reshaped_double(X, R)             # <<<<<<<<<<<<<<
  *     multi = PyArray_MultiIterNew(2, <void*>R, <void*>Xa)
  *     while(multi.index < multi.size):
  */
-  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_X, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_X, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_v_Xa);
   __pyx_v_Xa = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":46
+  /* "/root/package/nipy/neurospin/image/_image.pyx":64
  *     cdef broadcast multi
  *     Xa = _reshaped_double(X, R)
  *     multi = PyArray_MultiIterNew(2, <void*>R, <void*>Xa)             # <<<<<<<<<<<<<<
  *     while(multi.index < multi.size):
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
  */
-  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_R), ((void *)__pyx_v_Xa)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_R), ((void *)__pyx_v_Xa)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_broadcast))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_broadcast))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_v_multi));
   __pyx_v_multi = ((PyArrayMultiIterObject *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":47
+  /* "/root/package/nipy/neurospin/image/_image.pyx":65
  *     Xa = _reshaped_double(X, R)
  *     multi = PyArray_MultiIterNew(2, <void*>R, <void*>Xa)
  *     while(multi.index < multi.size):             # <<<<<<<<<<<<<<
@@ -1152,19 +1360,19 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample1d(PyObj
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
  */
   while (1) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__index); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__index); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__size); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__size); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_t_2, Py_LT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_t_2, Py_LT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     if (!__pyx_t_4) break;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":48
+    /* "/root/package/nipy/neurospin/image/_image.pyx":66
  *     multi = PyArray_MultiIterNew(2, <void*>R, <void*>Xa)
  *     while(multi.index < multi.size):
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)             # <<<<<<<<<<<<<<
@@ -1173,7 +1381,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample1d(PyObj
  */
     __pyx_v_r = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 0));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":49
+    /* "/root/package/nipy/neurospin/image/_image.pyx":67
  *     while(multi.index < multi.size):
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)             # <<<<<<<<<<<<<<
@@ -1182,7 +1390,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample1d(PyObj
  */
     __pyx_v_x = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 1));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":50
+    /* "/root/package/nipy/neurospin/image/_image.pyx":68
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
  *         r[0] = cubic_spline_sample1d(x[0], C)             # <<<<<<<<<<<<<<
@@ -1191,7 +1399,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample1d(PyObj
  */
     (__pyx_v_r[0]) = cubic_spline_sample1d((__pyx_v_x[0]), __pyx_v_C);
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":51
+    /* "/root/package/nipy/neurospin/image/_image.pyx":69
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
  *         r[0] = cubic_spline_sample1d(x[0], C)
  *         PyArray_MultiIter_NEXT(multi)             # <<<<<<<<<<<<<<
@@ -1201,7 +1409,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample1d(PyObj
     PyArray_MultiIter_NEXT(__pyx_v_multi);
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":52
+  /* "/root/package/nipy/neurospin/image/_image.pyx":70
  *         r[0] = cubic_spline_sample1d(x[0], C)
  *         PyArray_MultiIter_NEXT(multi)
  *     return R             # <<<<<<<<<<<<<<
@@ -1232,7 +1440,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample1d(PyObj
   return __pyx_r;
 }
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":54
+/* "/root/package/nipy/neurospin/image/_image.pyx":72
  *     return R
  * 
  * def cspline_sample2d(ndarray R, ndarray C, X=0, Y=0):             # <<<<<<<<<<<<<<
@@ -1282,7 +1490,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample2d(PyObj
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__C);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("cspline_sample2d", 0, 2, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("cspline_sample2d", 0, 2, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       if (kw_args > 0) {
@@ -1296,7 +1504,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample2d(PyObj
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "cspline_sample2d") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "cspline_sample2d") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_R = ((PyArrayObject *)values[0]);
     __pyx_v_C = ((PyArrayObject *)values[1]);
@@ -1319,7 +1527,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample2d(PyObj
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("cspline_sample2d", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("cspline_sample2d", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nipy.neurospin.image._image.cspline_sample2d");
   return NULL;
@@ -1331,50 +1539,50 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample2d(PyObj
   __pyx_v_multi = ((PyArrayMultiIterObject *)Py_None); __Pyx_INCREF(Py_None);
   __pyx_v_Xa = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_Ya = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_R), __pyx_ptype_5numpy_ndarray, 1, "R", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_C), __pyx_ptype_5numpy_ndarray, 1, "C", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_R), __pyx_ptype_5numpy_ndarray, 1, "R", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_C), __pyx_ptype_5numpy_ndarray, 1, "C", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":57
+  /* "/root/package/nipy/neurospin/image/_image.pyx":75
  *     cdef double *r, *x, *y
  *     cdef broadcast multi
  *     Xa = _reshaped_double(X, R)             # <<<<<<<<<<<<<<
  *     Ya = _reshaped_double(Y, R)
  *     multi = PyArray_MultiIterNew(3, <void*>R, <void*>Xa, <void*>Ya)
  */
-  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_X, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_X, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_v_Xa);
   __pyx_v_Xa = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":58
+  /* "/root/package/nipy/neurospin/image/_image.pyx":76
  *     cdef broadcast multi
  *     Xa = _reshaped_double(X, R)
  *     Ya = _reshaped_double(Y, R)             # <<<<<<<<<<<<<<
  *     multi = PyArray_MultiIterNew(3, <void*>R, <void*>Xa, <void*>Ya)
  *     while(multi.index < multi.size):
  */
-  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_Y, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_Y, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_v_Ya);
   __pyx_v_Ya = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":59
+  /* "/root/package/nipy/neurospin/image/_image.pyx":77
  *     Xa = _reshaped_double(X, R)
  *     Ya = _reshaped_double(Y, R)
  *     multi = PyArray_MultiIterNew(3, <void*>R, <void*>Xa, <void*>Ya)             # <<<<<<<<<<<<<<
  *     while(multi.index < multi.size):
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
  */
-  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_R), ((void *)__pyx_v_Xa), ((void *)__pyx_v_Ya)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_R), ((void *)__pyx_v_Xa), ((void *)__pyx_v_Ya)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_broadcast))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_broadcast))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_v_multi));
   __pyx_v_multi = ((PyArrayMultiIterObject *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":60
+  /* "/root/package/nipy/neurospin/image/_image.pyx":78
  *     Ya = _reshaped_double(Y, R)
  *     multi = PyArray_MultiIterNew(3, <void*>R, <void*>Xa, <void*>Ya)
  *     while(multi.index < multi.size):             # <<<<<<<<<<<<<<
@@ -1382,19 +1590,19 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample2d(PyObj
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
  */
   while (1) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__index); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__index); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__size); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__size); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_t_2, Py_LT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_t_2, Py_LT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     if (!__pyx_t_4) break;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":61
+    /* "/root/package/nipy/neurospin/image/_image.pyx":79
  *     multi = PyArray_MultiIterNew(3, <void*>R, <void*>Xa, <void*>Ya)
  *     while(multi.index < multi.size):
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)             # <<<<<<<<<<<<<<
@@ -1403,7 +1611,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample2d(PyObj
  */
     __pyx_v_r = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 0));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":62
+    /* "/root/package/nipy/neurospin/image/_image.pyx":80
  *     while(multi.index < multi.size):
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)             # <<<<<<<<<<<<<<
@@ -1412,7 +1620,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample2d(PyObj
  */
     __pyx_v_x = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 1));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":63
+    /* "/root/package/nipy/neurospin/image/_image.pyx":81
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
  *         y = <double*>PyArray_MultiIter_DATA(multi, 2)             # <<<<<<<<<<<<<<
@@ -1421,7 +1629,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample2d(PyObj
  */
     __pyx_v_y = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 2));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":64
+    /* "/root/package/nipy/neurospin/image/_image.pyx":82
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
  *         y = <double*>PyArray_MultiIter_DATA(multi, 2)
  *         r[0] = cubic_spline_sample2d(x[0], y[0], C)             # <<<<<<<<<<<<<<
@@ -1430,7 +1638,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample2d(PyObj
  */
     (__pyx_v_r[0]) = cubic_spline_sample2d((__pyx_v_x[0]), (__pyx_v_y[0]), __pyx_v_C);
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":65
+    /* "/root/package/nipy/neurospin/image/_image.pyx":83
  *         y = <double*>PyArray_MultiIter_DATA(multi, 2)
  *         r[0] = cubic_spline_sample2d(x[0], y[0], C)
  *         PyArray_MultiIter_NEXT(multi)             # <<<<<<<<<<<<<<
@@ -1440,7 +1648,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample2d(PyObj
     PyArray_MultiIter_NEXT(__pyx_v_multi);
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":66
+  /* "/root/package/nipy/neurospin/image/_image.pyx":84
  *         r[0] = cubic_spline_sample2d(x[0], y[0], C)
  *         PyArray_MultiIter_NEXT(multi)
  *     return R             # <<<<<<<<<<<<<<
@@ -1473,7 +1681,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample2d(PyObj
   return __pyx_r;
 }
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":68
+/* "/root/package/nipy/neurospin/image/_image.pyx":86
  *     return R
  * 
  * def cspline_sample3d(ndarray R, ndarray C, X=0, Y=0, Z=0):             # <<<<<<<<<<<<<<
@@ -1528,7 +1736,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample3d(PyObj
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__C);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("cspline_sample3d", 0, 2, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("cspline_sample3d", 0, 2, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       if (kw_args > 0) {
@@ -1547,7 +1755,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample3d(PyObj
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "cspline_sample3d") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "cspline_sample3d") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_R = ((PyArrayObject *)values[0]);
     __pyx_v_C = ((PyArrayObject *)values[1]);
@@ -1574,7 +1782,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample3d(PyObj
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("cspline_sample3d", 0, 2, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("cspline_sample3d", 0, 2, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nipy.neurospin.image._image.cspline_sample3d");
   return NULL;
@@ -1588,63 +1796,63 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample3d(PyObj
   __pyx_v_Xa = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_Ya = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_Za = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_R), __pyx_ptype_5numpy_ndarray, 1, "R", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_C), __pyx_ptype_5numpy_ndarray, 1, "C", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_R), __pyx_ptype_5numpy_ndarray, 1, "R", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_C), __pyx_ptype_5numpy_ndarray, 1, "C", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":71
+  /* "/root/package/nipy/neurospin/image/_image.pyx":89
  *     cdef double *r, *x, *y, *z
  *     cdef broadcast multi
  *     Xa = _reshaped_double(X, R)             # <<<<<<<<<<<<<<
  *     Ya = _reshaped_double(Y, R)
  *     Za = _reshaped_double(Z, R)
  */
-  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_X, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_X, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_v_Xa);
   __pyx_v_Xa = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":72
+  /* "/root/package/nipy/neurospin/image/_image.pyx":90
  *     cdef broadcast multi
  *     Xa = _reshaped_double(X, R)
  *     Ya = _reshaped_double(Y, R)             # <<<<<<<<<<<<<<
  *     Za = _reshaped_double(Z, R)
  *     multi = PyArray_MultiIterNew(4, <void*>R, <void*>Xa, <void*>Ya, <void*>Za)
  */
-  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_Y, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_Y, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_v_Ya);
   __pyx_v_Ya = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":73
+  /* "/root/package/nipy/neurospin/image/_image.pyx":91
  *     Xa = _reshaped_double(X, R)
  *     Ya = _reshaped_double(Y, R)
  *     Za = _reshaped_double(Z, R)             # <<<<<<<<<<<<<<
  *     multi = PyArray_MultiIterNew(4, <void*>R, <void*>Xa, <void*>Ya, <void*>Za)
  *     while(multi.index < multi.size):
  */
-  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_Z, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_Z, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_v_Za);
   __pyx_v_Za = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":74
+  /* "/root/package/nipy/neurospin/image/_image.pyx":92
  *     Ya = _reshaped_double(Y, R)
  *     Za = _reshaped_double(Z, R)
  *     multi = PyArray_MultiIterNew(4, <void*>R, <void*>Xa, <void*>Ya, <void*>Za)             # <<<<<<<<<<<<<<
  *     while(multi.index < multi.size):
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
  */
-  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_R), ((void *)__pyx_v_Xa), ((void *)__pyx_v_Ya), ((void *)__pyx_v_Za)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_R), ((void *)__pyx_v_Xa), ((void *)__pyx_v_Ya), ((void *)__pyx_v_Za)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_broadcast))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_broadcast))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_v_multi));
   __pyx_v_multi = ((PyArrayMultiIterObject *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":75
+  /* "/root/package/nipy/neurospin/image/_image.pyx":93
  *     Za = _reshaped_double(Z, R)
  *     multi = PyArray_MultiIterNew(4, <void*>R, <void*>Xa, <void*>Ya, <void*>Za)
  *     while(multi.index < multi.size):             # <<<<<<<<<<<<<<
@@ -1652,19 +1860,19 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample3d(PyObj
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
  */
   while (1) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__index); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__index); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__size); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__size); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_t_2, Py_LT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_t_2, Py_LT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     if (!__pyx_t_4) break;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":76
+    /* "/root/package/nipy/neurospin/image/_image.pyx":94
  *     multi = PyArray_MultiIterNew(4, <void*>R, <void*>Xa, <void*>Ya, <void*>Za)
  *     while(multi.index < multi.size):
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)             # <<<<<<<<<<<<<<
@@ -1673,7 +1881,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample3d(PyObj
  */
     __pyx_v_r = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 0));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":77
+    /* "/root/package/nipy/neurospin/image/_image.pyx":95
  *     while(multi.index < multi.size):
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)             # <<<<<<<<<<<<<<
@@ -1682,7 +1890,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample3d(PyObj
  */
     __pyx_v_x = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 1));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":78
+    /* "/root/package/nipy/neurospin/image/_image.pyx":96
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
  *         y = <double*>PyArray_MultiIter_DATA(multi, 2)             # <<<<<<<<<<<<<<
@@ -1691,7 +1899,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample3d(PyObj
  */
     __pyx_v_y = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 2));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":79
+    /* "/root/package/nipy/neurospin/image/_image.pyx":97
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
  *         y = <double*>PyArray_MultiIter_DATA(multi, 2)
  *         z = <double*>PyArray_MultiIter_DATA(multi, 3)             # <<<<<<<<<<<<<<
@@ -1700,7 +1908,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample3d(PyObj
  */
     __pyx_v_z = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 3));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":80
+    /* "/root/package/nipy/neurospin/image/_image.pyx":98
  *         y = <double*>PyArray_MultiIter_DATA(multi, 2)
  *         z = <double*>PyArray_MultiIter_DATA(multi, 3)
  *         r[0] = cubic_spline_sample3d(x[0], y[0], z[0], C)             # <<<<<<<<<<<<<<
@@ -1709,7 +1917,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample3d(PyObj
  */
     (__pyx_v_r[0]) = cubic_spline_sample3d((__pyx_v_x[0]), (__pyx_v_y[0]), (__pyx_v_z[0]), __pyx_v_C);
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":81
+    /* "/root/package/nipy/neurospin/image/_image.pyx":99
  *         z = <double*>PyArray_MultiIter_DATA(multi, 3)
  *         r[0] = cubic_spline_sample3d(x[0], y[0], z[0], C)
  *         PyArray_MultiIter_NEXT(multi)             # <<<<<<<<<<<<<<
@@ -1719,7 +1927,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample3d(PyObj
     PyArray_MultiIter_NEXT(__pyx_v_multi);
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":82
+  /* "/root/package/nipy/neurospin/image/_image.pyx":100
  *         r[0] = cubic_spline_sample3d(x[0], y[0], z[0], C)
  *         PyArray_MultiIter_NEXT(multi)
  *     return R             # <<<<<<<<<<<<<<
@@ -1754,7 +1962,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample3d(PyObj
   return __pyx_r;
 }
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":85
+/* "/root/package/nipy/neurospin/image/_image.pyx":103
  * 
  * 
  * def cspline_sample4d(ndarray R, ndarray C, X=0, Y=0, Z=0, T=0):             # <<<<<<<<<<<<<<
@@ -1815,7 +2023,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d(PyObj
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__C);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("cspline_sample4d", 0, 2, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 85; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("cspline_sample4d", 0, 2, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       if (kw_args > 0) {
@@ -1839,7 +2047,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d(PyObj
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "cspline_sample4d") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 85; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "cspline_sample4d") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_R = ((PyArrayObject *)values[0]);
     __pyx_v_C = ((PyArrayObject *)values[1]);
@@ -1870,7 +2078,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d(PyObj
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("cspline_sample4d", 0, 2, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 85; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("cspline_sample4d", 0, 2, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nipy.neurospin.image._image.cspline_sample4d");
   return NULL;
@@ -1886,76 +2094,76 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d(PyObj
   __pyx_v_Ya = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_Za = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_Ta = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_R), __pyx_ptype_5numpy_ndarray, 1, "R", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 85; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_C), __pyx_ptype_5numpy_ndarray, 1, "C", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 85; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_R), __pyx_ptype_5numpy_ndarray, 1, "R", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_C), __pyx_ptype_5numpy_ndarray, 1, "C", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":93
+  /* "/root/package/nipy/neurospin/image/_image.pyx":111
  *     cdef double *r, *x, *y, *z, *t
  *     cdef broadcast multi
  *     Xa = _reshaped_double(X, R)             # <<<<<<<<<<<<<<
  *     Ya = _reshaped_double(Y, R)
  *     Za = _reshaped_double(Z, R)
  */
-  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_X, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_X, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_v_Xa);
   __pyx_v_Xa = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":94
+  /* "/root/package/nipy/neurospin/image/_image.pyx":112
  *     cdef broadcast multi
  *     Xa = _reshaped_double(X, R)
  *     Ya = _reshaped_double(Y, R)             # <<<<<<<<<<<<<<
  *     Za = _reshaped_double(Z, R)
  *     Ta = _reshaped_double(T, R)
  */
-  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_Y, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 94; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_Y, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_v_Ya);
   __pyx_v_Ya = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":95
+  /* "/root/package/nipy/neurospin/image/_image.pyx":113
  *     Xa = _reshaped_double(X, R)
  *     Ya = _reshaped_double(Y, R)
  *     Za = _reshaped_double(Z, R)             # <<<<<<<<<<<<<<
  *     Ta = _reshaped_double(T, R)
  *     multi = PyArray_MultiIterNew(5, <void*>R, <void*>Xa, <void*>Ya, <void*>Za, <void*>Ta)
  */
-  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_Z, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_Z, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_v_Za);
   __pyx_v_Za = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":96
+  /* "/root/package/nipy/neurospin/image/_image.pyx":114
  *     Ya = _reshaped_double(Y, R)
  *     Za = _reshaped_double(Z, R)
  *     Ta = _reshaped_double(T, R)             # <<<<<<<<<<<<<<
  *     multi = PyArray_MultiIterNew(5, <void*>R, <void*>Xa, <void*>Ya, <void*>Za, <void*>Ta)
  *     while(multi.index < multi.size):
  */
-  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_T, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 96; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_T, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_v_Ta);
   __pyx_v_Ta = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":97
+  /* "/root/package/nipy/neurospin/image/_image.pyx":115
  *     Za = _reshaped_double(Z, R)
  *     Ta = _reshaped_double(T, R)
  *     multi = PyArray_MultiIterNew(5, <void*>R, <void*>Xa, <void*>Ya, <void*>Za, <void*>Ta)             # <<<<<<<<<<<<<<
  *     while(multi.index < multi.size):
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
  */
-  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_R), ((void *)__pyx_v_Xa), ((void *)__pyx_v_Ya), ((void *)__pyx_v_Za), ((void *)__pyx_v_Ta)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_R), ((void *)__pyx_v_Xa), ((void *)__pyx_v_Ya), ((void *)__pyx_v_Za), ((void *)__pyx_v_Ta)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_broadcast))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_broadcast))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_v_multi));
   __pyx_v_multi = ((PyArrayMultiIterObject *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":98
+  /* "/root/package/nipy/neurospin/image/_image.pyx":116
  *     Ta = _reshaped_double(T, R)
  *     multi = PyArray_MultiIterNew(5, <void*>R, <void*>Xa, <void*>Ya, <void*>Za, <void*>Ta)
  *     while(multi.index < multi.size):             # <<<<<<<<<<<<<<
@@ -1963,19 +2171,19 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d(PyObj
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
  */
   while (1) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__index); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 98; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__index); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__size); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 98; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__size); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_t_2, Py_LT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 98; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_t_2, Py_LT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 98; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     if (!__pyx_t_4) break;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":99
+    /* "/root/package/nipy/neurospin/image/_image.pyx":117
  *     multi = PyArray_MultiIterNew(5, <void*>R, <void*>Xa, <void*>Ya, <void*>Za, <void*>Ta)
  *     while(multi.index < multi.size):
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)             # <<<<<<<<<<<<<<
@@ -1984,7 +2192,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d(PyObj
  */
     __pyx_v_r = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 0));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":100
+    /* "/root/package/nipy/neurospin/image/_image.pyx":118
  *     while(multi.index < multi.size):
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)             # <<<<<<<<<<<<<<
@@ -1993,7 +2201,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d(PyObj
  */
     __pyx_v_x = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 1));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":101
+    /* "/root/package/nipy/neurospin/image/_image.pyx":119
  *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
  *         y = <double*>PyArray_MultiIter_DATA(multi, 2)             # <<<<<<<<<<<<<<
@@ -2002,7 +2210,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d(PyObj
  */
     __pyx_v_y = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 2));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":102
+    /* "/root/package/nipy/neurospin/image/_image.pyx":120
  *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
  *         y = <double*>PyArray_MultiIter_DATA(multi, 2)
  *         z = <double*>PyArray_MultiIter_DATA(multi, 3)             # <<<<<<<<<<<<<<
@@ -2011,7 +2219,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d(PyObj
  */
     __pyx_v_z = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 3));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":103
+    /* "/root/package/nipy/neurospin/image/_image.pyx":121
  *         y = <double*>PyArray_MultiIter_DATA(multi, 2)
  *         z = <double*>PyArray_MultiIter_DATA(multi, 3)
  *         t = <double*>PyArray_MultiIter_DATA(multi, 4)             # <<<<<<<<<<<<<<
@@ -2020,7 +2228,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d(PyObj
  */
     __pyx_v_t = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 4));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":104
+    /* "/root/package/nipy/neurospin/image/_image.pyx":122
  *         z = <double*>PyArray_MultiIter_DATA(multi, 3)
  *         t = <double*>PyArray_MultiIter_DATA(multi, 4)
  *         r[0] = cubic_spline_sample4d(x[0], y[0], z[0], t[0], C)             # <<<<<<<<<<<<<<
@@ -2029,7 +2237,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d(PyObj
  */
     (__pyx_v_r[0]) = cubic_spline_sample4d((__pyx_v_x[0]), (__pyx_v_y[0]), (__pyx_v_z[0]), (__pyx_v_t[0]), __pyx_v_C);
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":105
+    /* "/root/package/nipy/neurospin/image/_image.pyx":123
  *         t = <double*>PyArray_MultiIter_DATA(multi, 4)
  *         r[0] = cubic_spline_sample4d(x[0], y[0], z[0], t[0], C)
  *         PyArray_MultiIter_NEXT(multi)             # <<<<<<<<<<<<<<
@@ -2039,7 +2247,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d(PyObj
     PyArray_MultiIter_NEXT(__pyx_v_multi);
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":106
+  /* "/root/package/nipy/neurospin/image/_image.pyx":124
  *         r[0] = cubic_spline_sample4d(x[0], y[0], z[0], t[0], C)
  *         PyArray_MultiIter_NEXT(multi)
  *     return R             # <<<<<<<<<<<<<<
@@ -2076,39 +2284,60 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d(PyObj
   return __pyx_r;
 }
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":109
+/* "/root/package/nipy/neurospin/image/_image.pyx":127
  * 
  * 
- * def cspline_resample3d(ndarray im, dims, ndarray Tvox, dtype=None):             # <<<<<<<<<<<<<<
+ * def cspline_sample4d_grad(ndarray R, ndarray DX, ndarray DY, ndarray DZ, ndarray DT,             # <<<<<<<<<<<<<<
+ *                           ndarray C, X=0, Y=0, Z=0, T=0):
  *     """
- *     cspline_resample3d(im, dims, Tvox, dtype=None)
  */
 
-static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_resample3d(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_4nipy_9neurospin_5image_6_image_cspline_resample3d[] = "\n    cspline_resample3d(im, dims, Tvox, dtype=None)\n\n    Note that the input transformation Tvox will be re-ordered in C\n    convention if needed.\n    ";
-static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_resample3d(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyArrayObject *__pyx_v_im = 0;
-  PyObject *__pyx_v_dims = 0;
-  PyArrayObject *__pyx_v_Tvox = 0;
-  PyObject *__pyx_v_dtype = 0;
-  double *__pyx_v_tvox;
-  int __pyx_v_cast_integer;
-  PyObject *__pyx_v_im_resampled;
+static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d_grad(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_5image_6_image_cspline_sample4d_grad[] = "\n    cubic_spline_sample4d_grad(R, DX, DY, DZ, DT, C, X=0, Y=0, Z=0, T=0):\n\n    In-place cubic spline sampling, also storing the partial\n    derivatives of the signal with respect to X, Y, Z and T in DX, DY,\n    DZ and DT. R and the derivative arrays must have the same shape and\n    dtype 'double'.\n    ";
+static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d_grad(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_R = 0;
+  PyArrayObject *__pyx_v_DX = 0;
+  PyArrayObject *__pyx_v_DY = 0;
+  PyArrayObject *__pyx_v_DZ = 0;
+  PyArrayObject *__pyx_v_DT = 0;
+  PyArrayObject *__pyx_v_C = 0;
+  PyObject *__pyx_v_X = 0;
+  PyObject *__pyx_v_Y = 0;
+  PyObject *__pyx_v_Z = 0;
+  PyObject *__pyx_v_T = 0;
+  double *__pyx_v_r;
+  double *__pyx_v_x;
+  double *__pyx_v_y;
+  double *__pyx_v_z;
+  double *__pyx_v_t;
+  double __pyx_v_grad[4];
+  PyArrayMultiIterObject *__pyx_v_multi;
+  PyObject *__pyx_v_Xa;
+  PyObject *__pyx_v_Ya;
+  PyObject *__pyx_v_Za;
+  PyObject *__pyx_v_Ta;
   PyObject *__pyx_r = NULL;
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
+  PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__im,&__pyx_n_s__dims,&__pyx_n_s__Tvox,&__pyx_n_s__dtype,0};
-  __Pyx_RefNannySetupContext("cspline_resample3d");
+  int __pyx_t_4;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__R,&__pyx_n_s__DX,&__pyx_n_s__DY,&__pyx_n_s__DZ,&__pyx_n_s__DT,&__pyx_n_s__C,&__pyx_n_s__X,&__pyx_n_s__Y,&__pyx_n_s__Z,&__pyx_n_s__T,0};
+  __Pyx_RefNannySetupContext("cspline_sample4d_grad");
   __pyx_self = __pyx_self;
   if (unlikely(__pyx_kwds)) {
     Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[4] = {0,0,0,0};
-    values[3] = ((PyObject *)Py_None);
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    values[6] = ((PyObject *)__pyx_int_0);
+    values[7] = ((PyObject *)__pyx_int_0);
+    values[8] = ((PyObject *)__pyx_int_0);
+    values[9] = ((PyObject *)__pyx_int_0);
     switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+      case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
       case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
       case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
@@ -2118,120 +2347,510 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_resample3d(PyO
     }
     switch (PyTuple_GET_SIZE(__pyx_args)) {
       case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__im);
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__R);
       if (likely(values[0])) kw_args--;
       else goto __pyx_L5_argtuple_error;
       case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__dims);
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__DX);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("cspline_resample3d", 0, 3, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("cspline_sample4d_grad", 0, 6, 10, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
-      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Tvox);
+      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__DY);
       if (likely(values[2])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("cspline_resample3d", 0, 3, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("cspline_sample4d_grad", 0, 6, 10, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  3:
+      values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__DZ);
+      if (likely(values[3])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("cspline_sample4d_grad", 0, 6, 10, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  4:
+      values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__DT);
+      if (likely(values[4])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("cspline_sample4d_grad", 0, 6, 10, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  5:
+      values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__C);
+      if (likely(values[5])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("cspline_sample4d_grad", 0, 6, 10, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  6:
       if (kw_args > 0) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__dtype);
-        if (unlikely(value)) { values[3] = value; kw_args--; }
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__X);
+        if (unlikely(value)) { values[6] = value; kw_args--; }
+      }
+      case  7:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Y);
+        if (unlikely(value)) { values[7] = value; kw_args--; }
+      }
+      case  8:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Z);
+        if (unlikely(value)) { values[8] = value; kw_args--; }
+      }
+      case  9:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__T);
+        if (unlikely(value)) { values[9] = value; kw_args--; }
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "cspline_resample3d") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "cspline_sample4d_grad") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
-    __pyx_v_im = ((PyArrayObject *)values[0]);
-    __pyx_v_dims = values[1];
-    __pyx_v_Tvox = ((PyArrayObject *)values[2]);
-    __pyx_v_dtype = values[3];
+    __pyx_v_R = ((PyArrayObject *)values[0]);
+    __pyx_v_DX = ((PyArrayObject *)values[1]);
+    __pyx_v_DY = ((PyArrayObject *)values[2]);
+    __pyx_v_DZ = ((PyArrayObject *)values[3]);
+    __pyx_v_DT = ((PyArrayObject *)values[4]);
+    __pyx_v_C = ((PyArrayObject *)values[5]);
+    __pyx_v_X = values[6];
+    __pyx_v_Y = values[7];
+    __pyx_v_Z = values[8];
+    __pyx_v_T = values[9];
   } else {
-    __pyx_v_dtype = ((PyObject *)Py_None);
+    __pyx_v_X = ((PyObject *)__pyx_int_0);
+    __pyx_v_Y = ((PyObject *)__pyx_int_0);
+    __pyx_v_Z = ((PyObject *)__pyx_int_0);
+    __pyx_v_T = ((PyObject *)__pyx_int_0);
     switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  4:
-      __pyx_v_dtype = PyTuple_GET_ITEM(__pyx_args, 3);
-      case  3:
-      __pyx_v_Tvox = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 2));
-      __pyx_v_dims = PyTuple_GET_ITEM(__pyx_args, 1);
-      __pyx_v_im = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
+      case 10:
+      __pyx_v_T = PyTuple_GET_ITEM(__pyx_args, 9);
+      case  9:
+      __pyx_v_Z = PyTuple_GET_ITEM(__pyx_args, 8);
+      case  8:
+      __pyx_v_Y = PyTuple_GET_ITEM(__pyx_args, 7);
+      case  7:
+      __pyx_v_X = PyTuple_GET_ITEM(__pyx_args, 6);
+      case  6:
+      __pyx_v_C = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 5));
+      __pyx_v_DT = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 4));
+      __pyx_v_DZ = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 3));
+      __pyx_v_DY = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 2));
+      __pyx_v_DX = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
+      __pyx_v_R = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
       break;
       default: goto __pyx_L5_argtuple_error;
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("cspline_resample3d", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("cspline_sample4d_grad", 0, 6, 10, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nipy.neurospin.image._image.cspline_resample3d");
+  __Pyx_AddTraceback("nipy.neurospin.image._image.cspline_sample4d_grad");
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_im);
-  __Pyx_INCREF(__pyx_v_dims);
-  __Pyx_INCREF((PyObject *)__pyx_v_Tvox);
-  __Pyx_INCREF(__pyx_v_dtype);
-  __pyx_v_im_resampled = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_im), __pyx_ptype_5numpy_ndarray, 1, "im", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Tvox), __pyx_ptype_5numpy_ndarray, 1, "Tvox", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":120
- * 
- *     # Create output array
- *     if dtype == None:             # <<<<<<<<<<<<<<
- *         dtype = im.dtype
- *     im_resampled = np.zeros(tuple(dims), dtype=dtype)
+  __Pyx_INCREF((PyObject *)__pyx_v_R);
+  __Pyx_INCREF((PyObject *)__pyx_v_DX);
+  __Pyx_INCREF((PyObject *)__pyx_v_DY);
+  __Pyx_INCREF((PyObject *)__pyx_v_DZ);
+  __Pyx_INCREF((PyObject *)__pyx_v_DT);
+  __Pyx_INCREF((PyObject *)__pyx_v_C);
+  __Pyx_INCREF(__pyx_v_X);
+  __Pyx_INCREF(__pyx_v_Y);
+  __Pyx_INCREF(__pyx_v_Z);
+  __Pyx_INCREF(__pyx_v_T);
+  __pyx_v_multi = ((PyArrayMultiIterObject *)Py_None); __Pyx_INCREF(Py_None);
+  __pyx_v_Xa = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_Ya = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_Za = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_Ta = Py_None; __Pyx_INCREF(Py_None);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_R), __pyx_ptype_5numpy_ndarray, 1, "R", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_DX), __pyx_ptype_5numpy_ndarray, 1, "DX", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_DY), __pyx_ptype_5numpy_ndarray, 1, "DY", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_DZ), __pyx_ptype_5numpy_ndarray, 1, "DZ", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_DT), __pyx_ptype_5numpy_ndarray, 1, "DT", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_C), __pyx_ptype_5numpy_ndarray, 1, "C", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/image/_image.pyx":140
+ *     cdef double grad[4]
+ *     cdef broadcast multi
+ *     Xa = _reshaped_double(X, R)             # <<<<<<<<<<<<<<
+ *     Ya = _reshaped_double(Y, R)
+ *     Za = _reshaped_double(Z, R)
  */
-  __pyx_t_1 = PyObject_RichCompare(__pyx_v_dtype, Py_None, Py_EQ); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_X, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 140; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_2) {
+  __Pyx_DECREF(__pyx_v_Xa);
+  __pyx_v_Xa = __pyx_t_1;
+  __pyx_t_1 = 0;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":121
- *     # Create output array
- *     if dtype == None:
- *         dtype = im.dtype             # <<<<<<<<<<<<<<
- *     im_resampled = np.zeros(tuple(dims), dtype=dtype)
- * 
+  /* "/root/package/nipy/neurospin/image/_image.pyx":141
+ *     cdef broadcast multi
+ *     Xa = _reshaped_double(X, R)
+ *     Ya = _reshaped_double(Y, R)             # <<<<<<<<<<<<<<
+ *     Za = _reshaped_double(Z, R)
+ *     Ta = _reshaped_double(T, R)
  */
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_im), __pyx_n_s__dtype); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_v_dtype);
-    __pyx_v_dtype = __pyx_t_1;
-    __pyx_t_1 = 0;
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_Y, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 141; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_v_Ya);
+  __pyx_v_Ya = __pyx_t_1;
+  __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":122
- *     if dtype == None:
- *         dtype = im.dtype
- *     im_resampled = np.zeros(tuple(dims), dtype=dtype)             # <<<<<<<<<<<<<<
- * 
- *     # Ensure that the Tvox array is C-contiguous (required by the
+  /* "/root/package/nipy/neurospin/image/_image.pyx":142
+ *     Xa = _reshaped_double(X, R)
+ *     Ya = _reshaped_double(Y, R)
+ *     Za = _reshaped_double(Z, R)             # <<<<<<<<<<<<<<
+ *     Ta = _reshaped_double(T, R)
+ *     multi = PyArray_MultiIterNew(9, <void*>R, <void*>Xa, <void*>Ya, <void*>Za, <void*>Ta,
  */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_Z, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_v_Za);
+  __pyx_v_Za = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/image/_image.pyx":143
+ *     Ya = _reshaped_double(Y, R)
+ *     Za = _reshaped_double(Z, R)
+ *     Ta = _reshaped_double(T, R)             # <<<<<<<<<<<<<<
+ *     multi = PyArray_MultiIterNew(9, <void*>R, <void*>Xa, <void*>Ya, <void*>Za, <void*>Ta,
+ *                                  <void*>DX, <void*>DY, <void*>DZ, <void*>DT)
+ */
+  __pyx_t_1 = ((PyObject *)__pyx_f_4nipy_9neurospin_5image_6_image__reshaped_double(__pyx_v_T, __pyx_v_R)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_v_Ta);
+  __pyx_v_Ta = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/image/_image.pyx":145
+ *     Ta = _reshaped_double(T, R)
+ *     multi = PyArray_MultiIterNew(9, <void*>R, <void*>Xa, <void*>Ya, <void*>Za, <void*>Ta,
+ *                                  <void*>DX, <void*>DY, <void*>DZ, <void*>DT)             # <<<<<<<<<<<<<<
+ *     while(multi.index < multi.size):
+ *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
+ */
+  __pyx_t_1 = PyArray_MultiIterNew(9, ((void *)__pyx_v_R), ((void *)__pyx_v_Xa), ((void *)__pyx_v_Ya), ((void *)__pyx_v_Za), ((void *)__pyx_v_Ta), ((void *)__pyx_v_DX), ((void *)__pyx_v_DY), ((void *)__pyx_v_DZ), ((void *)__pyx_v_DT)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_broadcast))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(((PyObject *)__pyx_v_multi));
+  __pyx_v_multi = ((PyArrayMultiIterObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/image/_image.pyx":146
+ *     multi = PyArray_MultiIterNew(9, <void*>R, <void*>Xa, <void*>Ya, <void*>Za, <void*>Ta,
+ *                                  <void*>DX, <void*>DY, <void*>DZ, <void*>DT)
+ *     while(multi.index < multi.size):             # <<<<<<<<<<<<<<
+ *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
+ *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
+ */
+  while (1) {
+    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__index); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__size); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_t_2, Py_LT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (!__pyx_t_4) break;
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":147
+ *                                  <void*>DX, <void*>DY, <void*>DZ, <void*>DT)
+ *     while(multi.index < multi.size):
+ *         r = <double*>PyArray_MultiIter_DATA(multi, 0)             # <<<<<<<<<<<<<<
+ *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
+ *         y = <double*>PyArray_MultiIter_DATA(multi, 2)
+ */
+    __pyx_v_r = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 0));
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":148
+ *     while(multi.index < multi.size):
+ *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
+ *         x = <double*>PyArray_MultiIter_DATA(multi, 1)             # <<<<<<<<<<<<<<
+ *         y = <double*>PyArray_MultiIter_DATA(multi, 2)
+ *         z = <double*>PyArray_MultiIter_DATA(multi, 3)
+ */
+    __pyx_v_x = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 1));
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":149
+ *         r = <double*>PyArray_MultiIter_DATA(multi, 0)
+ *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
+ *         y = <double*>PyArray_MultiIter_DATA(multi, 2)             # <<<<<<<<<<<<<<
+ *         z = <double*>PyArray_MultiIter_DATA(multi, 3)
+ *         t = <double*>PyArray_MultiIter_DATA(multi, 4)
+ */
+    __pyx_v_y = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 2));
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":150
+ *         x = <double*>PyArray_MultiIter_DATA(multi, 1)
+ *         y = <double*>PyArray_MultiIter_DATA(multi, 2)
+ *         z = <double*>PyArray_MultiIter_DATA(multi, 3)             # <<<<<<<<<<<<<<
+ *         t = <double*>PyArray_MultiIter_DATA(multi, 4)
+ *         r[0] = cubic_spline_sample4d_grad(x[0], y[0], z[0], t[0], C, grad)
+ */
+    __pyx_v_z = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 3));
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":151
+ *         y = <double*>PyArray_MultiIter_DATA(multi, 2)
+ *         z = <double*>PyArray_MultiIter_DATA(multi, 3)
+ *         t = <double*>PyArray_MultiIter_DATA(multi, 4)             # <<<<<<<<<<<<<<
+ *         r[0] = cubic_spline_sample4d_grad(x[0], y[0], z[0], t[0], C, grad)
+ *         (<double*>PyArray_MultiIter_DATA(multi, 5))[0] = grad[0]
+ */
+    __pyx_v_t = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 4));
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":152
+ *         z = <double*>PyArray_MultiIter_DATA(multi, 3)
+ *         t = <double*>PyArray_MultiIter_DATA(multi, 4)
+ *         r[0] = cubic_spline_sample4d_grad(x[0], y[0], z[0], t[0], C, grad)             # <<<<<<<<<<<<<<
+ *         (<double*>PyArray_MultiIter_DATA(multi, 5))[0] = grad[0]
+ *         (<double*>PyArray_MultiIter_DATA(multi, 6))[0] = grad[1]
+ */
+    (__pyx_v_r[0]) = cubic_spline_sample4d_grad((__pyx_v_x[0]), (__pyx_v_y[0]), (__pyx_v_z[0]), (__pyx_v_t[0]), __pyx_v_C, __pyx_v_grad);
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":153
+ *         t = <double*>PyArray_MultiIter_DATA(multi, 4)
+ *         r[0] = cubic_spline_sample4d_grad(x[0], y[0], z[0], t[0], C, grad)
+ *         (<double*>PyArray_MultiIter_DATA(multi, 5))[0] = grad[0]             # <<<<<<<<<<<<<<
+ *         (<double*>PyArray_MultiIter_DATA(multi, 6))[0] = grad[1]
+ *         (<double*>PyArray_MultiIter_DATA(multi, 7))[0] = grad[2]
+ */
+    (((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 5))[0]) = (__pyx_v_grad[0]);
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":154
+ *         r[0] = cubic_spline_sample4d_grad(x[0], y[0], z[0], t[0], C, grad)
+ *         (<double*>PyArray_MultiIter_DATA(multi, 5))[0] = grad[0]
+ *         (<double*>PyArray_MultiIter_DATA(multi, 6))[0] = grad[1]             # <<<<<<<<<<<<<<
+ *         (<double*>PyArray_MultiIter_DATA(multi, 7))[0] = grad[2]
+ *         (<double*>PyArray_MultiIter_DATA(multi, 8))[0] = grad[3]
+ */
+    (((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 6))[0]) = (__pyx_v_grad[1]);
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":155
+ *         (<double*>PyArray_MultiIter_DATA(multi, 5))[0] = grad[0]
+ *         (<double*>PyArray_MultiIter_DATA(multi, 6))[0] = grad[1]
+ *         (<double*>PyArray_MultiIter_DATA(multi, 7))[0] = grad[2]             # <<<<<<<<<<<<<<
+ *         (<double*>PyArray_MultiIter_DATA(multi, 8))[0] = grad[3]
+ *         PyArray_MultiIter_NEXT(multi)
+ */
+    (((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 7))[0]) = (__pyx_v_grad[2]);
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":156
+ *         (<double*>PyArray_MultiIter_DATA(multi, 6))[0] = grad[1]
+ *         (<double*>PyArray_MultiIter_DATA(multi, 7))[0] = grad[2]
+ *         (<double*>PyArray_MultiIter_DATA(multi, 8))[0] = grad[3]             # <<<<<<<<<<<<<<
+ *         PyArray_MultiIter_NEXT(multi)
+ *     return R
+ */
+    (((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 8))[0]) = (__pyx_v_grad[3]);
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":157
+ *         (<double*>PyArray_MultiIter_DATA(multi, 7))[0] = grad[2]
+ *         (<double*>PyArray_MultiIter_DATA(multi, 8))[0] = grad[3]
+ *         PyArray_MultiIter_NEXT(multi)             # <<<<<<<<<<<<<<
+ *     return R
+ * 
+ */
+    PyArray_MultiIter_NEXT(__pyx_v_multi);
+  }
+
+  /* "/root/package/nipy/neurospin/image/_image.pyx":158
+ *         (<double*>PyArray_MultiIter_DATA(multi, 8))[0] = grad[3]
+ *         PyArray_MultiIter_NEXT(multi)
+ *     return R             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_R));
+  __pyx_r = ((PyObject *)__pyx_v_R);
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("nipy.neurospin.image._image.cspline_sample4d_grad");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_multi);
+  __Pyx_DECREF(__pyx_v_Xa);
+  __Pyx_DECREF(__pyx_v_Ya);
+  __Pyx_DECREF(__pyx_v_Za);
+  __Pyx_DECREF(__pyx_v_Ta);
+  __Pyx_DECREF((PyObject *)__pyx_v_R);
+  __Pyx_DECREF((PyObject *)__pyx_v_DX);
+  __Pyx_DECREF((PyObject *)__pyx_v_DY);
+  __Pyx_DECREF((PyObject *)__pyx_v_DZ);
+  __Pyx_DECREF((PyObject *)__pyx_v_DT);
+  __Pyx_DECREF((PyObject *)__pyx_v_C);
+  __Pyx_DECREF(__pyx_v_X);
+  __Pyx_DECREF(__pyx_v_Y);
+  __Pyx_DECREF(__pyx_v_Z);
+  __Pyx_DECREF(__pyx_v_T);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/nipy/neurospin/image/_image.pyx":161
+ * 
+ * 
+ * def cspline_resample3d(ndarray im, dims, ndarray Tvox, dtype=None):             # <<<<<<<<<<<<<<
+ *     """
+ *     cspline_resample3d(im, dims, Tvox, dtype=None)
+ */
+
+static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_resample3d(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_5image_6_image_cspline_resample3d[] = "\n    cspline_resample3d(im, dims, Tvox, dtype=None)\n\n    Note that the input transformation Tvox will be re-ordered in C\n    convention if needed.\n    ";
+static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_resample3d(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_im = 0;
+  PyObject *__pyx_v_dims = 0;
+  PyArrayObject *__pyx_v_Tvox = 0;
+  PyObject *__pyx_v_dtype = 0;
+  double *__pyx_v_tvox;
+  int __pyx_v_cast_integer;
+  PyObject *__pyx_v_im_resampled;
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__im,&__pyx_n_s__dims,&__pyx_n_s__Tvox,&__pyx_n_s__dtype,0};
+  __Pyx_RefNannySetupContext("cspline_resample3d");
+  __pyx_self = __pyx_self;
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[4] = {0,0,0,0};
+    values[3] = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__im);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__dims);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("cspline_resample3d", 0, 3, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  2:
+      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Tvox);
+      if (likely(values[2])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("cspline_resample3d", 0, 3, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  3:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__dtype);
+        if (unlikely(value)) { values[3] = value; kw_args--; }
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "cspline_resample3d") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_im = ((PyArrayObject *)values[0]);
+    __pyx_v_dims = values[1];
+    __pyx_v_Tvox = ((PyArrayObject *)values[2]);
+    __pyx_v_dtype = values[3];
+  } else {
+    __pyx_v_dtype = ((PyObject *)Py_None);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  4:
+      __pyx_v_dtype = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3:
+      __pyx_v_Tvox = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 2));
+      __pyx_v_dims = PyTuple_GET_ITEM(__pyx_args, 1);
+      __pyx_v_im = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("cspline_resample3d", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nipy.neurospin.image._image.cspline_resample3d");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_im);
+  __Pyx_INCREF(__pyx_v_dims);
+  __Pyx_INCREF((PyObject *)__pyx_v_Tvox);
+  __Pyx_INCREF(__pyx_v_dtype);
+  __pyx_v_im_resampled = Py_None; __Pyx_INCREF(Py_None);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_im), __pyx_ptype_5numpy_ndarray, 1, "im", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Tvox), __pyx_ptype_5numpy_ndarray, 1, "Tvox", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/image/_image.pyx":172
+ * 
+ *     # Create output array
+ *     if dtype == None:             # <<<<<<<<<<<<<<
+ *         dtype = im.dtype
+ *     im_resampled = np.zeros(tuple(dims), dtype=dtype)
+ */
+  __pyx_t_1 = PyObject_RichCompare(__pyx_v_dtype, Py_None, Py_EQ); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 172; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 172; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_2) {
+
+    /* "/root/package/nipy/neurospin/image/_image.pyx":173
+ *     # Create output array
+ *     if dtype == None:
+ *         dtype = im.dtype             # <<<<<<<<<<<<<<
+ *     im_resampled = np.zeros(tuple(dims), dtype=dtype)
+ * 
+ */
+    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_im), __pyx_n_s__dtype); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 173; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_v_dtype);
+    __pyx_v_dtype = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/nipy/neurospin/image/_image.pyx":174
+ *     if dtype == None:
+ *         dtype = im.dtype
+ *     im_resampled = np.zeros(tuple(dims), dtype=dtype)             # <<<<<<<<<<<<<<
+ * 
+ *     # Ensure that the Tvox array is C-contiguous (required by the
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_v_dims);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_dims);
   __Pyx_GIVEREF(__pyx_v_dims);
-  __pyx_t_4 = PyObject_Call(((PyObject *)((PyObject*)&PyTuple_Type)), __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_Call(((PyObject *)((PyObject*)&PyTuple_Type)), __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4);
   __Pyx_GIVEREF(__pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_4));
-  if (PyDict_SetItem(__pyx_t_4, ((PyObject *)__pyx_n_s__dtype), __pyx_v_dtype) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = PyEval_CallObjectWithKeywords(__pyx_t_3, __pyx_t_1, ((PyObject *)__pyx_t_4)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_4, ((PyObject *)__pyx_n_s__dtype), __pyx_v_dtype) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = PyEval_CallObjectWithKeywords(__pyx_t_3, __pyx_t_1, ((PyObject *)__pyx_t_4)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -2240,37 +2859,37 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_resample3d(PyO
   __pyx_v_im_resampled = __pyx_t_5;
   __pyx_t_5 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":126
+  /* "/root/package/nipy/neurospin/image/_image.pyx":178
  *     # Ensure that the Tvox array is C-contiguous (required by the
  *     # underlying C routine)
  *     Tvox = np.asarray(Tvox, order='C')             # <<<<<<<<<<<<<<
  *     tvox = <double*>Tvox.data
  * 
  */
-  __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = PyObject_GetAttr(__pyx_t_5, __pyx_n_s__asarray); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_5, __pyx_n_s__asarray); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_INCREF(((PyObject *)__pyx_v_Tvox));
   PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_v_Tvox));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_Tvox));
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__order), ((PyObject *)__pyx_n_s__C)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = PyEval_CallObjectWithKeywords(__pyx_t_4, __pyx_t_5, ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__order), ((PyObject *)__pyx_n_s__C)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyEval_CallObjectWithKeywords(__pyx_t_4, __pyx_t_5, ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_v_Tvox));
   __pyx_v_Tvox = ((PyArrayObject *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":127
+  /* "/root/package/nipy/neurospin/image/_image.pyx":179
  *     # underlying C routine)
  *     Tvox = np.asarray(Tvox, order='C')
  *     tvox = <double*>Tvox.data             # <<<<<<<<<<<<<<
@@ -2279,26 +2898,26 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_resample3d(PyO
  */
   __pyx_v_tvox = ((double *)__pyx_v_Tvox->data);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":130
+  /* "/root/package/nipy/neurospin/image/_image.pyx":182
  * 
  *     # Actual resampling
  *     cast_integer = np.issubclass(dtype.type, np.integer)             # <<<<<<<<<<<<<<
  *     cubic_spline_resample3d(im_resampled, im, tvox, cast_integer)
  * 
  */
-  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__issubclass); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__issubclass); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_GetAttr(__pyx_v_dtype, __pyx_n_s__type); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_GetAttr(__pyx_v_dtype, __pyx_n_s__type); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = PyObject_GetAttr(__pyx_t_5, __pyx_n_s__integer); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_GetAttr(__pyx_t_5, __pyx_n_s__integer); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_3);
@@ -2306,25 +2925,25 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_resample3d(PyO
   __Pyx_GIVEREF(__pyx_t_4);
   __pyx_t_3 = 0;
   __pyx_t_4 = 0;
-  __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_4); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_4); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_v_cast_integer = __pyx_t_6;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":131
+  /* "/root/package/nipy/neurospin/image/_image.pyx":183
  *     # Actual resampling
  *     cast_integer = np.issubclass(dtype.type, np.integer)
  *     cubic_spline_resample3d(im_resampled, im, tvox, cast_integer)             # <<<<<<<<<<<<<<
  * 
  *     return im_resampled
  */
-  if (!(likely(((__pyx_v_im_resampled) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_im_resampled, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_v_im_resampled) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_im_resampled, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   cubic_spline_resample3d(((PyArrayObject *)__pyx_v_im_resampled), __pyx_v_im, __pyx_v_tvox, __pyx_v_cast_integer);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":133
+  /* "/root/package/nipy/neurospin/image/_image.pyx":185
  *     cubic_spline_resample3d(im_resampled, im, tvox, cast_integer)
  * 
  *     return im_resampled             # <<<<<<<<<<<<<<
@@ -2356,7 +2975,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_resample3d(PyO
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":187
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":187
  *         # experimental exception made for __getbuffer__ and __releasebuffer__
  *         # -- the details of this may change.
  *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
@@ -2392,7 +3011,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __Pyx_GIVEREF(__pyx_v_info->obj);
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":193
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":193
  *             # of flags
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -2401,7 +3020,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_endian_detector = 1;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":194
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":194
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -2410,7 +3029,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":196
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":196
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
  * 
  *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
@@ -2419,7 +3038,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_ndim = PyArray_NDIM(((PyArrayObject *)__pyx_v_self));
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":198
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":198
  *             ndim = PyArray_NDIM(self)
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -2429,7 +3048,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_1 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":199
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":199
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 copy_shape = 1             # <<<<<<<<<<<<<<
@@ -2441,7 +3060,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":201
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":201
  *                 copy_shape = 1
  *             else:
  *                 copy_shape = 0             # <<<<<<<<<<<<<<
@@ -2452,7 +3071,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L5:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":203
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":203
  *                 copy_shape = 0
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -2462,7 +3081,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_1 = ((__pyx_v_flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS);
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":204
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":204
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -2476,7 +3095,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_t_3) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":205
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":205
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
@@ -2485,9 +3104,9 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_u_1));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_u_1));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_1));
+    __Pyx_INCREF(((PyObject *)__pyx_kp_u_3));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_u_3));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_3));
     __pyx_t_5 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -2498,7 +3117,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L6:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":207
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":207
  *                 raise ValueError(u"ndarray is not C contiguous")
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -2508,7 +3127,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_3 = ((__pyx_v_flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS);
   if (__pyx_t_3) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":208
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":208
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -2522,7 +3141,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_t_2) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":209
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":209
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
@@ -2531,9 +3150,9 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_u_2));
-    PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_u_2));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_2));
+    __Pyx_INCREF(((PyObject *)__pyx_kp_u_4));
+    PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_u_4));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_4));
     __pyx_t_4 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -2544,7 +3163,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L7:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":211
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":211
  *                 raise ValueError(u"ndarray is not Fortran contiguous")
  * 
  *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
@@ -2553,7 +3172,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->buf = PyArray_DATA(((PyArrayObject *)__pyx_v_self));
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":212
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":212
  * 
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim             # <<<<<<<<<<<<<<
@@ -2562,7 +3181,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->ndim = __pyx_v_ndim;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":213
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":213
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim
  *             if copy_shape:             # <<<<<<<<<<<<<<
@@ -2572,7 +3191,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_6 = __pyx_v_copy_shape;
   if (__pyx_t_6) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":216
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":216
  *                 # Allocate new buffer for strides and shape info. This is allocated
  *                 # as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)             # <<<<<<<<<<<<<<
@@ -2581,7 +3200,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->strides = ((Py_ssize_t *)malloc((((sizeof(Py_ssize_t)) * __pyx_v_ndim) * 2)));
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":217
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":217
  *                 # as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)
  *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
@@ -2590,7 +3209,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":218
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":218
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):             # <<<<<<<<<<<<<<
@@ -2601,7 +3220,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
       __pyx_v_i = __pyx_t_7;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":219
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":219
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
@@ -2610,7 +3229,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
       (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(((PyArrayObject *)__pyx_v_self))[__pyx_v_i]);
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":220
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":220
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]
  *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
@@ -2623,7 +3242,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":222
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":222
  *                     info.shape[i] = PyArray_DIMS(self)[i]
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
@@ -2632,7 +3251,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(((PyArrayObject *)__pyx_v_self)));
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":223
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":223
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
@@ -2643,7 +3262,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L8:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":224
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":224
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
@@ -2652,7 +3271,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->suboffsets = NULL;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":225
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":225
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
@@ -2661,7 +3280,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->itemsize = PyArray_ITEMSIZE(((PyArrayObject *)__pyx_v_self));
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":226
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":226
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)
  *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
@@ -2670,7 +3289,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->readonly = (!PyArray_ISWRITEABLE(((PyArrayObject *)__pyx_v_self)));
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":229
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":229
  * 
  *             cdef int t
  *             cdef char* f = NULL             # <<<<<<<<<<<<<<
@@ -2679,7 +3298,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_f = NULL;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":230
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":230
  *             cdef int t
  *             cdef char* f = NULL
  *             cdef dtype descr = self.descr             # <<<<<<<<<<<<<<
@@ -2689,7 +3308,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __Pyx_INCREF(((PyObject *)((PyArrayObject *)__pyx_v_self)->descr));
   __pyx_v_descr = ((PyArrayObject *)__pyx_v_self)->descr;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":234
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":234
  *             cdef int offset
  * 
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)             # <<<<<<<<<<<<<<
@@ -2698,7 +3317,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_hasfields = PyDataType_HASFIELDS(__pyx_v_descr);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":236
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":236
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)
  * 
  *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
@@ -2714,7 +3333,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":238
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":238
  *             if not hasfields and not copy_shape:
  *                 # do not call releasebuffer
  *                 info.obj = None             # <<<<<<<<<<<<<<
@@ -2730,7 +3349,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":241
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":241
  *             else:
  *                 # need to call releasebuffer
  *                 info.obj = self             # <<<<<<<<<<<<<<
@@ -2745,7 +3364,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L11:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":243
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":243
  *                 info.obj = self
  * 
  *             if not hasfields:             # <<<<<<<<<<<<<<
@@ -2755,7 +3374,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_1 = (!__pyx_v_hasfields);
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":244
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":244
  * 
  *             if not hasfields:
  *                 t = descr.type_num             # <<<<<<<<<<<<<<
@@ -2764,7 +3383,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_t = __pyx_v_descr->type_num;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":245
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":245
  *             if not hasfields:
  *                 t = descr.type_num
  *                 if ((descr.byteorder == '>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -2779,7 +3398,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     if (!__pyx_t_2) {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":246
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":246
  *                 t = descr.type_num
  *                 if ((descr.byteorder == '>' and little_endian) or
  *                     (descr.byteorder == '<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -2799,7 +3418,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     if (__pyx_t_1) {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":247
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":247
  *                 if ((descr.byteorder == '>' and little_endian) or
  *                     (descr.byteorder == '<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -2808,9 +3427,9 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
       __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_u_3));
-      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_u_3));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_3));
+      __Pyx_INCREF(((PyObject *)__pyx_kp_u_5));
+      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_u_5));
+      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_5));
       __pyx_t_5 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -2821,7 +3440,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     __pyx_L13:;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":248
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":248
  *                     (descr.byteorder == '<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
@@ -2834,7 +3453,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":249
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":249
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
@@ -2847,7 +3466,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":250
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":250
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
@@ -2860,7 +3479,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":251
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":251
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
@@ -2873,7 +3492,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":252
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":252
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
@@ -2886,7 +3505,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":253
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":253
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
@@ -2899,7 +3518,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":254
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":254
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
@@ -2912,7 +3531,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":255
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":255
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
@@ -2925,7 +3544,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":256
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":256
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
@@ -2938,7 +3557,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":257
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":257
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
@@ -2951,7 +3570,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":258
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":258
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
@@ -2964,7 +3583,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":259
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":259
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
@@ -2977,7 +3596,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":260
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":260
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
@@ -2990,7 +3609,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":261
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":261
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
@@ -3003,7 +3622,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":262
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":262
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
@@ -3016,7 +3635,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":263
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":263
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
@@ -3029,7 +3648,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":264
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":264
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
  *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
@@ -3043,7 +3662,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     /*else*/ {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":266
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":266
  *                 elif t == NPY_OBJECT:      f = "O"
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
@@ -3052,7 +3671,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
       __pyx_t_5 = PyInt_FromLong(__pyx_v_t); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_4), __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_6), __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
@@ -3069,7 +3688,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     __pyx_L14:;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":267
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":267
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f             # <<<<<<<<<<<<<<
@@ -3078,7 +3697,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->format = __pyx_v_f;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":268
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":268
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f
  *                 return             # <<<<<<<<<<<<<<
@@ -3091,7 +3710,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":270
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":270
  *                 return
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)             # <<<<<<<<<<<<<<
@@ -3100,7 +3719,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->format = ((char *)malloc(255));
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":271
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":271
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = '^' # Native data types, manual alignment             # <<<<<<<<<<<<<<
@@ -3109,7 +3728,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     (__pyx_v_info->format[0]) = '^';
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":272
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":272
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = '^' # Native data types, manual alignment
  *                 offset = 0             # <<<<<<<<<<<<<<
@@ -3118,7 +3737,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_offset = 0;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":275
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":275
  *                 f = _util_dtypestring(descr, info.format + 1,
  *                                       info.format + _buffer_format_string_len,
  *                                       &offset)             # <<<<<<<<<<<<<<
@@ -3128,7 +3747,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     __pyx_t_9 = __pyx_f_5numpy__util_dtypestring(__pyx_v_descr, (__pyx_v_info->format + 1), (__pyx_v_info->format + 255), (&__pyx_v_offset)); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_v_f = __pyx_t_9;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":276
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":276
  *                                       info.format + _buffer_format_string_len,
  *                                       &offset)
  *                 f[0] = 0 # Terminate format string             # <<<<<<<<<<<<<<
@@ -3161,7 +3780,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":278
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":278
  *                 f[0] = 0 # Terminate format string
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
@@ -3175,7 +3794,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __Pyx_RefNannySetupContext("__releasebuffer__");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":279
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":279
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
@@ -3185,7 +3804,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __pyx_t_1 = PyArray_HASFIELDS(((PyArrayObject *)__pyx_v_self));
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":280
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":280
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)             # <<<<<<<<<<<<<<
@@ -3197,7 +3816,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   }
   __pyx_L5:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":281
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":281
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -3207,7 +3826,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __pyx_t_1 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":282
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":282
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 stdlib.free(info.strides)             # <<<<<<<<<<<<<<
@@ -3223,7 +3842,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __Pyx_RefNannyFinishContext();
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":755
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":755
  * ctypedef npy_cdouble     complex_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -3236,7 +3855,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew1");
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":756
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":756
  * 
  * cdef inline object PyArray_MultiIterNew1(a):
  *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
@@ -3262,7 +3881,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":758
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":758
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -3275,7 +3894,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew2");
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":759
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":759
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
@@ -3301,7 +3920,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":761
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":761
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -3314,7 +3933,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew3");
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":762
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":762
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
@@ -3340,7 +3959,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":764
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":764
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -3353,7 +3972,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew4");
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":765
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":765
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
@@ -3379,7 +3998,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":767
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":767
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -3392,7 +4011,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew5");
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":768
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":768
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
@@ -3418,7 +4037,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":770
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":770
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
@@ -3453,7 +4072,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   __pyx_v_new_offset = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_t = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":777
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":777
  *     cdef int delta_offset
  *     cdef tuple i
  *     cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -3462,7 +4081,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_endian_detector = 1;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":778
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":778
  *     cdef tuple i
  *     cdef int endian_detector = 1
  *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -3471,7 +4090,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":781
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":781
  *     cdef tuple fields
  * 
  *     for childname in descr.names:             # <<<<<<<<<<<<<<
@@ -3490,7 +4109,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_v_childname = __pyx_t_3;
     __pyx_t_3 = 0;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":782
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":782
  * 
  *     for childname in descr.names:
  *         fields = descr.fields[childname]             # <<<<<<<<<<<<<<
@@ -3504,7 +4123,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_v_fields = ((PyObject *)__pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":783
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":783
  *     for childname in descr.names:
  *         fields = descr.fields[childname]
  *         child, new_offset = fields             # <<<<<<<<<<<<<<
@@ -3527,7 +4146,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       {__pyx_filename = __pyx_f[1]; __pyx_lineno = 783; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":785
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":785
  *         child, new_offset = fields
  * 
  *         if (end - f) - (new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
@@ -3552,7 +4171,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     if (__pyx_t_6) {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":786
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":786
  * 
  *         if (end - f) - (new_offset - offset[0]) < 15:
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
@@ -3561,9 +4180,9 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_u_5));
-      PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_u_5));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_5));
+      __Pyx_INCREF(((PyObject *)__pyx_kp_u_7));
+      PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_u_7));
+      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_7));
       __pyx_t_3 = PyObject_Call(__pyx_builtin_RuntimeError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -3574,7 +4193,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L5:;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":788
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":788
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == '>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -3589,7 +4208,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     if (!__pyx_t_7) {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":789
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":789
  * 
  *         if ((child.byteorder == '>' and little_endian) or
  *             (child.byteorder == '<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -3609,7 +4228,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     if (__pyx_t_6) {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":790
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":790
  *         if ((child.byteorder == '>' and little_endian) or
  *             (child.byteorder == '<' and not little_endian)):
  *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -3618,9 +4237,9 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 790; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_u_3));
-      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_u_3));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_3));
+      __Pyx_INCREF(((PyObject *)__pyx_kp_u_5));
+      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_u_5));
+      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_5));
       __pyx_t_5 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 790; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -3631,7 +4250,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L6:;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":800
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":800
  * 
  *         # Output padding bytes
  *         while offset[0] < new_offset:             # <<<<<<<<<<<<<<
@@ -3648,7 +4267,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (!__pyx_t_6) break;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":801
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":801
  *         # Output padding bytes
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte             # <<<<<<<<<<<<<<
@@ -3657,7 +4276,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       (__pyx_v_f[0]) = 120;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":802
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":802
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte
  *             f += 1             # <<<<<<<<<<<<<<
@@ -3666,7 +4285,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_v_f += 1;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":803
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":803
  *             f[0] = 120 # "x"; pad byte
  *             f += 1
  *             offset[0] += 1             # <<<<<<<<<<<<<<
@@ -3676,7 +4295,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       (__pyx_v_offset[0]) += 1;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":805
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":805
  *             offset[0] += 1
  * 
  *         offset[0] += child.itemsize             # <<<<<<<<<<<<<<
@@ -3685,7 +4304,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     (__pyx_v_offset[0]) += __pyx_v_child->elsize;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":807
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":807
  *         offset[0] += child.itemsize
  * 
  *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
@@ -3695,7 +4314,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = (!PyDataType_HASFIELDS(__pyx_v_child));
     if (__pyx_t_6) {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":808
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":808
  * 
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num             # <<<<<<<<<<<<<<
@@ -3708,7 +4327,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __pyx_v_t = __pyx_t_3;
       __pyx_t_3 = 0;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":809
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":809
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num
  *             if end - f < 5:             # <<<<<<<<<<<<<<
@@ -3718,7 +4337,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __pyx_t_6 = ((__pyx_v_end - __pyx_v_f) < 5);
       if (__pyx_t_6) {
 
-        /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":810
+        /* "/tmp/cy012/Cython/Includes/numpy.pxd":810
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
@@ -3727,9 +4346,9 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
         __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 810; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_INCREF(((PyObject *)__pyx_kp_u_6));
-        PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_u_6));
-        __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_6));
+        __Pyx_INCREF(((PyObject *)__pyx_kp_u_8));
+        PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_u_8));
+        __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_8));
         __pyx_t_5 = PyObject_Call(__pyx_builtin_RuntimeError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 810; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -3740,7 +4359,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       __pyx_L10:;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":813
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":813
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"             # <<<<<<<<<<<<<<
@@ -3759,7 +4378,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":814
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":814
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"             # <<<<<<<<<<<<<<
@@ -3778,7 +4397,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":815
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":815
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"             # <<<<<<<<<<<<<<
@@ -3797,7 +4416,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":816
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":816
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"             # <<<<<<<<<<<<<<
@@ -3816,7 +4435,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":817
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":817
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"             # <<<<<<<<<<<<<<
@@ -3835,7 +4454,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":818
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":818
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"             # <<<<<<<<<<<<<<
@@ -3854,7 +4473,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":819
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":819
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"             # <<<<<<<<<<<<<<
@@ -3873,7 +4492,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":820
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":820
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"             # <<<<<<<<<<<<<<
@@ -3892,7 +4511,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":821
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":821
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"             # <<<<<<<<<<<<<<
@@ -3911,7 +4530,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":822
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":822
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"             # <<<<<<<<<<<<<<
@@ -3930,7 +4549,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":823
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":823
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"             # <<<<<<<<<<<<<<
@@ -3949,7 +4568,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":824
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":824
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"             # <<<<<<<<<<<<<<
@@ -3968,7 +4587,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":825
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":825
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"             # <<<<<<<<<<<<<<
@@ -3987,7 +4606,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":826
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":826
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf             # <<<<<<<<<<<<<<
@@ -4008,7 +4627,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":827
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":827
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd             # <<<<<<<<<<<<<<
@@ -4029,7 +4648,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":828
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":828
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg             # <<<<<<<<<<<<<<
@@ -4050,7 +4669,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":829
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":829
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"             # <<<<<<<<<<<<<<
@@ -4070,14 +4689,14 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       /*else*/ {
 
-        /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":831
+        /* "/tmp/cy012/Cython/Includes/numpy.pxd":831
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
  *             f += 1
  *         else:
  */
-        __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_4), __pyx_v_t); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_6), __pyx_v_t); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_3);
         __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_5);
@@ -4093,7 +4712,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       __pyx_L11:;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":832
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":832
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *             f += 1             # <<<<<<<<<<<<<<
@@ -4105,7 +4724,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     /*else*/ {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":836
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":836
  *             # Cython ignores struct boundary information ("T{...}"),
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)             # <<<<<<<<<<<<<<
@@ -4119,7 +4738,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":837
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":837
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)
  *     return f             # <<<<<<<<<<<<<<
@@ -4149,7 +4768,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":952
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":952
  * 
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -4164,7 +4783,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_INCREF((PyObject *)__pyx_v_arr);
   __Pyx_INCREF(__pyx_v_base);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":954
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":954
  * cdef inline void set_array_base(ndarray arr, object base):
  *      cdef PyObject* baseptr
  *      if base is None:             # <<<<<<<<<<<<<<
@@ -4174,7 +4793,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __pyx_t_1 = (__pyx_v_base == Py_None);
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":955
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":955
  *      cdef PyObject* baseptr
  *      if base is None:
  *          baseptr = NULL             # <<<<<<<<<<<<<<
@@ -4186,7 +4805,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   }
   /*else*/ {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":957
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":957
  *          baseptr = NULL
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!             # <<<<<<<<<<<<<<
@@ -4195,7 +4814,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
     Py_INCREF(__pyx_v_base);
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":958
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":958
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base             # <<<<<<<<<<<<<<
@@ -4206,7 +4825,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   }
   __pyx_L3:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":959
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":959
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)             # <<<<<<<<<<<<<<
@@ -4215,7 +4834,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   Py_XDECREF(__pyx_v_arr->base);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":960
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":960
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)
  *      arr.base = baseptr             # <<<<<<<<<<<<<<
@@ -4229,7 +4848,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_RefNannyFinishContext();
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":962
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":962
  *      arr.base = baseptr
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -4243,7 +4862,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __Pyx_RefNannySetupContext("get_array_base");
   __Pyx_INCREF((PyObject *)__pyx_v_arr);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":963
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":963
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:             # <<<<<<<<<<<<<<
@@ -4253,7 +4872,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_t_1 = (__pyx_v_arr->base == NULL);
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":964
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":964
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:
  *         return None             # <<<<<<<<<<<<<<
@@ -4268,7 +4887,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   }
   /*else*/ {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":966
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":966
  *         return None
  *     else:
  *         return <object>arr.base             # <<<<<<<<<<<<<<
@@ -4290,10 +4909,12 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
 
 static struct PyMethodDef __pyx_methods[] = {
   {__Pyx_NAMESTR("cspline_transform"), (PyCFunction)__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_transform, METH_O, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("cspline_transform_axis"), (PyCFunction)__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_transform_axis, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_5image_6_image_cspline_transform_axis)},
   {__Pyx_NAMESTR("cspline_sample1d"), (PyCFunction)__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample1d, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
   {__Pyx_NAMESTR("cspline_sample2d"), (PyCFunction)__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample2d, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
   {__Pyx_NAMESTR("cspline_sample3d"), (PyCFunction)__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample3d, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
   {__Pyx_NAMESTR("cspline_sample4d"), (PyCFunction)__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_5image_6_image_cspline_sample4d)},
+  {__Pyx_NAMESTR("cspline_sample4d_grad"), (PyCFunction)__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_sample4d_grad, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_5image_6_image_cspline_sample4d_grad)},
   {__Pyx_NAMESTR("cspline_resample3d"), (PyCFunction)__pyx_pf_4nipy_9neurospin_5image_6_image_cspline_resample3d, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_5image_6_image_cspline_resample3d)},
   {0, 0, 0, 0}
 };
@@ -4304,7 +4925,7 @@ static void __pyx_init_filenames(void); /*proto*/
 static struct PyModuleDef __pyx_moduledef = {
     PyModuleDef_HEAD_INIT,
     __Pyx_NAMESTR("_image"),
-    __Pyx_DOCSTR(__pyx_k_7), /* m_doc */
+    __Pyx_DOCSTR(__pyx_k_9), /* m_doc */
     -1, /* m_size */
     __pyx_methods /* m_methods */,
     NULL, /* m_reload */
@@ -4315,16 +4936,26 @@ static struct PyModuleDef __pyx_moduledef = {
 #endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_u_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 1, 0, 0},
-  {&__pyx_kp_u_10, __pyx_k_10, sizeof(__pyx_k_10), 0, 1, 0, 0},
-  {&__pyx_kp_u_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 1, 0, 0},
+  {&__pyx_kp_s_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 0, 1, 0},
+  {&__pyx_kp_s_10, __pyx_k_10, sizeof(__pyx_k_10), 0, 0, 1, 0},
+  {&__pyx_kp_u_11, __pyx_k_11, sizeof(__pyx_k_11), 0, 1, 0, 0},
+  {&__pyx_n_s_12, __pyx_k_12, sizeof(__pyx_k_12), 0, 0, 1, 1},
+  {&__pyx_kp_u_13, __pyx_k_13, sizeof(__pyx_k_13), 0, 1, 0, 0},
+  {&__pyx_kp_u_14, __pyx_k_14, sizeof(__pyx_k_14), 0, 1, 0, 0},
+  {&__pyx_n_s_15, __pyx_k_15, sizeof(__pyx_k_15), 0, 0, 1, 1},
+  {&__pyx_kp_u_16, __pyx_k_16, sizeof(__pyx_k_16), 0, 1, 0, 0},
+  {&__pyx_kp_s_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 0, 1, 0},
   {&__pyx_kp_u_3, __pyx_k_3, sizeof(__pyx_k_3), 0, 1, 0, 0},
   {&__pyx_kp_u_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 1, 0, 0},
   {&__pyx_kp_u_5, __pyx_k_5, sizeof(__pyx_k_5), 0, 1, 0, 0},
   {&__pyx_kp_u_6, __pyx_k_6, sizeof(__pyx_k_6), 0, 1, 0, 0},
-  {&__pyx_kp_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 0},
-  {&__pyx_kp_u_9, __pyx_k_9, sizeof(__pyx_k_9), 0, 1, 0, 0},
+  {&__pyx_kp_u_7, __pyx_k_7, sizeof(__pyx_k_7), 0, 1, 0, 0},
+  {&__pyx_kp_u_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 1, 0, 0},
   {&__pyx_n_s__C, __pyx_k__C, sizeof(__pyx_k__C), 0, 0, 1, 1},
+  {&__pyx_n_s__DT, __pyx_k__DT, sizeof(__pyx_k__DT), 0, 0, 1, 1},
+  {&__pyx_n_s__DX, __pyx_k__DX, sizeof(__pyx_k__DX), 0, 0, 1, 1},
+  {&__pyx_n_s__DY, __pyx_k__DY, sizeof(__pyx_k__DY), 0, 0, 1, 1},
+  {&__pyx_n_s__DZ, __pyx_k__DZ, sizeof(__pyx_k__DZ), 0, 0, 1, 1},
   {&__pyx_n_s__R, __pyx_k__R, sizeof(__pyx_k__R), 0, 0, 1, 1},
   {&__pyx_n_s__RuntimeError, __pyx_k__RuntimeError, sizeof(__pyx_k__RuntimeError), 0, 0, 1, 1},
   {&__pyx_n_s__T, __pyx_k__T, sizeof(__pyx_k__T), 0, 0, 1, 1},
@@ -4338,9 +4969,11 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s____version__, __pyx_k____version__, sizeof(__pyx_k____version__), 0, 0, 1, 1},
   {&__pyx_n_s__asarray, __pyx_k__asarray, sizeof(__pyx_k__asarray), 0, 0, 1, 1},
   {&__pyx_n_s__astype, __pyx_k__astype, sizeof(__pyx_k__astype), 0, 0, 1, 1},
+  {&__pyx_n_s__axis, __pyx_k__axis, sizeof(__pyx_k__axis), 0, 0, 1, 1},
   {&__pyx_n_s__base, __pyx_k__base, sizeof(__pyx_k__base), 0, 0, 1, 1},
   {&__pyx_n_s__buf, __pyx_k__buf, sizeof(__pyx_k__buf), 0, 0, 1, 1},
   {&__pyx_n_s__byteorder, __pyx_k__byteorder, sizeof(__pyx_k__byteorder), 0, 0, 1, 1},
+  {&__pyx_n_s__c, __pyx_k__c, sizeof(__pyx_k__c), 0, 0, 1, 1},
   {&__pyx_n_s__cspline_resample3d, __pyx_k__cspline_resample3d, sizeof(__pyx_k__cspline_resample3d), 0, 0, 1, 1},
   {&__pyx_n_s__cspline_sample4d, __pyx_k__cspline_sample4d, sizeof(__pyx_k__cspline_sample4d), 0, 0, 1, 1},
   {&__pyx_n_s__data, __pyx_k__data, sizeof(__pyx_k__data), 0, 0, 1, 1},
@@ -4374,8 +5007,8 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetName(__pyx_b, __pyx_n_s__range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_range = __Pyx_GetName(__pyx_b, __pyx_n_s__range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_builtin_RuntimeError = __Pyx_GetName(__pyx_b, __pyx_n_s__RuntimeError); if (!__pyx_builtin_RuntimeError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   return 0;
   __pyx_L1_error:;
@@ -4429,7 +5062,7 @@ PyMODINIT_FUNC PyInit__image(void)
   #endif
   /*--- Module creation code ---*/
   #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("_image"), __pyx_methods, __Pyx_DOCSTR(__pyx_k_7), 0, PYTHON_API_VERSION);
+  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("_image"), __pyx_methods, __Pyx_DOCSTR(__pyx_k_9), 0, PYTHON_API_VERSION);
   #else
   __pyx_m = PyModule_Create(&__pyx_moduledef);
   #endif
@@ -4459,16 +5092,16 @@ PyMODINIT_FUNC PyInit__image(void)
   /*--- Function import code ---*/
   /*--- Execution code ---*/
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":8
+  /* "/root/package/nipy/neurospin/image/_image.pyx":8
  * """
  * 
  * __version__ = '0.2'             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____version__, ((PyObject *)__pyx_kp_s_8)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____version__, ((PyObject *)__pyx_kp_s_10)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":28
+  /* "/root/package/nipy/neurospin/image/_image.pyx":31
  * 
  * # Initialize numpy
  * cubic_spline_import_array()             # <<<<<<<<<<<<<<
@@ -4477,7 +5110,7 @@ PyMODINIT_FUNC PyInit__image(void)
  */
   cubic_spline_import_array();
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":29
+  /* "/root/package/nipy/neurospin/image/_image.pyx":32
  * # Initialize numpy
  * cubic_spline_import_array()
  * import_array()             # <<<<<<<<<<<<<<
@@ -4486,43 +5119,57 @@ PyMODINIT_FUNC PyInit__image(void)
  */
   import_array();
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":30
+  /* "/root/package/nipy/neurospin/image/_image.pyx":33
  * cubic_spline_import_array()
  * import_array()
  * import numpy as np             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__numpy), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__numpy), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__np, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__np, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/image/_image.pyx":1
+  /* "/root/package/nipy/neurospin/image/_image.pyx":1
  * # -*- Mode: Python -*-             # <<<<<<<<<<<<<<
  * 
  * """
  */
   __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_2 = PyObject_GetAttr(__pyx_m, __pyx_n_s__cspline_sample4d); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_GetAttr(__pyx_m, __pyx_n_s_12); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = __Pyx_GetAttrString(__pyx_t_2, "__doc__");
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_kp_u_9), __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_kp_u_11), __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_GetAttr(__pyx_m, __pyx_n_s__cspline_resample3d); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_GetAttr(__pyx_m, __pyx_n_s__cspline_sample4d); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_2 = __Pyx_GetAttrString(__pyx_t_3, "__doc__");
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_kp_u_10), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_kp_u_13), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____test__, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_GetAttr(__pyx_m, __pyx_n_s_15); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_GetAttrString(__pyx_t_2, "__doc__");
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_kp_u_14), __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_GetAttr(__pyx_m, __pyx_n_s__cspline_resample3d); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = __Pyx_GetAttrString(__pyx_t_3, "__doc__");
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_kp_u_16), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____test__, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/stdlib.pxd":2
+  /* "/tmp/cy012/Cython/Includes/stdlib.pxd":2
  * 
  * cdef extern from "stdlib.h" nogil:             # <<<<<<<<<<<<<<
  *     void free(void *ptr)
@@ -4823,6 +5470,143 @@ static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_npy_intp(npy_intp val) {
     }
 }
 
+static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyThreadState *tstate = PyThreadState_GET();
+
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+
+static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
+    PyThreadState *tstate = PyThreadState_GET();
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+
+
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
+    Py_XINCREF(type);
+    Py_XINCREF(value);
+    Py_XINCREF(tb);
+    /* First, check the traceback argument, replacing None with NULL. */
+    if (tb == Py_None) {
+        Py_DECREF(tb);
+        tb = 0;
+    }
+    else if (tb != NULL && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto raise_error;
+    }
+    /* Next, replace a missing value with None */
+    if (value == NULL) {
+        value = Py_None;
+        Py_INCREF(value);
+    }
+    #if PY_VERSION_HEX < 0x02050000
+    if (!PyClass_Check(type))
+    #else
+    if (!PyType_Check(type))
+    #endif
+    {
+        /* Raising an instance.  The value should be a dummy. */
+        if (value != Py_None) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        /* Normalize to raise <class>, <instance> */
+        Py_DECREF(value);
+        value = type;
+        #if PY_VERSION_HEX < 0x02050000
+            if (PyInstance_Check(type)) {
+                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
+                Py_INCREF(type);
+            }
+            else {
+                type = 0;
+                PyErr_SetString(PyExc_TypeError,
+                    "raise: exception must be an old-style class or instance");
+                goto raise_error;
+            }
+        #else
+            type = (PyObject*) Py_TYPE(type);
+            Py_INCREF(type);
+            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+                PyErr_SetString(PyExc_TypeError,
+                    "raise: exception class must be a subclass of BaseException");
+                goto raise_error;
+            }
+        #endif
+    }
+
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+
+#else /* Python 3+ */
+
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (!PyExceptionClass_Check(type)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+
+    PyErr_SetObject(type, value);
+
+    if (tb) {
+        PyThreadState *tstate = PyThreadState_GET();
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+    }
+
+bad:
+    return;
+}
+#endif
+
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
@@ -4973,143 +5757,6 @@ static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_npy_intp(npy_intp val) {
 */
 #endif
 
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-}
-
-
-#if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    Py_XINCREF(type);
-    Py_XINCREF(value);
-    Py_XINCREF(tb);
-    /* First, check the traceback argument, replacing None with NULL. */
-    if (tb == Py_None) {
-        Py_DECREF(tb);
-        tb = 0;
-    }
-    else if (tb != NULL && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto raise_error;
-    }
-    /* Next, replace a missing value with None */
-    if (value == NULL) {
-        value = Py_None;
-        Py_INCREF(value);
-    }
-    #if PY_VERSION_HEX < 0x02050000
-    if (!PyClass_Check(type))
-    #else
-    if (!PyType_Check(type))
-    #endif
-    {
-        /* Raising an instance.  The value should be a dummy. */
-        if (value != Py_None) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        /* Normalize to raise <class>, <instance> */
-        Py_DECREF(value);
-        value = type;
-        #if PY_VERSION_HEX < 0x02050000
-            if (PyInstance_Check(type)) {
-                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
-                Py_INCREF(type);
-            }
-            else {
-                type = 0;
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception must be an old-style class or instance");
-                goto raise_error;
-            }
-        #else
-            type = (PyObject*) Py_TYPE(type);
-            Py_INCREF(type);
-            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception class must be a subclass of BaseException");
-                goto raise_error;
-            }
-        #endif
-    }
-
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
-}
-
-#else /* Python 3+ */
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (!PyExceptionClass_Check(type)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-
-    PyErr_SetObject(type, value);
-
-    if (tb) {
-        PyThreadState *tstate = PyThreadState_GET();
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-    }
-
-bad:
-    return;
-}
-#endif
-
 static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
     const unsigned char neg_one = (unsigned char)-1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
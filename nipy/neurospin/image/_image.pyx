@@ -16,10 +16,13 @@ cdef extern from "cubic_spline.h":
     
     void cubic_spline_import_array()
     void cubic_spline_transform(ndarray res, ndarray src)
+    void cubic_spline_transform_axis(ndarray res, int axis)
     double cubic_spline_sample1d(double x, ndarray coef) 
     double cubic_spline_sample2d(double x, double y, ndarray coef) 
     double cubic_spline_sample3d(double x, double y, double z, ndarray coef) 
     double cubic_spline_sample4d(double x, double y, double z, double t, ndarray coef) 
+    double cubic_spline_sample4d_grad(double x, double y, double z, double t, 
+                                      ndarray coef, double* grad) 
     void cubic_spline_resample3d(ndarray im_resampled, ndarray im, 
                                  double* Tvox, int cast_integer)
 
@@ -35,6 +38,21 @@ def cspline_transform(ndarray x):
     cubic_spline_transform(c, x)
     return c
 
+def cspline_transform_axis(ndarray c, int axis):
+    """
+    cspline_transform_axis(c, axis)
+
+    In-place cubic spline transform of the double array c along one
+    axis. Transforming along every axis in turn is equivalent to
+    cspline_transform. 
+    """
+    if not c.dtype == np.double: 
+        raise ValueError('Array dtype must be double')
+    if axis < 0 or axis >= c.ndim: 
+        raise ValueError('Invalid axis')
+    cubic_spline_transform_axis(c, axis)
+    return c
+
 cdef ndarray _reshaped_double(object in_arr, ndarray sh_arr):
     shape = [sh_arr.shape[i] for i in range(sh_arr.ndim)]
     return np.reshape(in_arr, shape).astype(np.double)
@@ -106,6 +124,40 @@ def cspline_sample4d(ndarray R, ndarray C, X=0, Y=0, Z=0, T=0):
     return R
 
 
+def cspline_sample4d_grad(ndarray R, ndarray DX, ndarray DY, ndarray DZ, ndarray DT, 
+                          ndarray C, X=0, Y=0, Z=0, T=0):
+    """
+    cubic_spline_sample4d_grad(R, DX, DY, DZ, DT, C, X=0, Y=0, Z=0, T=0):
+
+    In-place cubic spline sampling, also storing the partial
+    derivatives of the signal with respect to X, Y, Z and T in DX, DY,
+    DZ and DT. R and the derivative arrays must have the same shape and
+    dtype 'double'.
+    """
+    cdef double *r, *x, *y, *z, *t
+    cdef double grad[4]
+    cdef broadcast multi
+    Xa = _reshaped_double(X, R)
+    Ya = _reshaped_double(Y, R)
+    Za = _reshaped_double(Z, R)
+    Ta = _reshaped_double(T, R)
+    multi = PyArray_MultiIterNew(9, <void*>R, <void*>Xa, <void*>Ya, <void*>Za, <void*>Ta, 
+                                 <void*>DX, <void*>DY, <void*>DZ, <void*>DT)
+    while(multi.index < multi.size):
+        r = <double*>PyArray_MultiIter_DATA(multi, 0)
+        x = <double*>PyArray_MultiIter_DATA(multi, 1)
+        y = <double*>PyArray_MultiIter_DATA(multi, 2)
+        z = <double*>PyArray_MultiIter_DATA(multi, 3)
+        t = <double*>PyArray_MultiIter_DATA(multi, 4)
+        r[0] = cubic_spline_sample4d_grad(x[0], y[0], z[0], t[0], C, grad)
+        (<double*>PyArray_MultiIter_DATA(multi, 5))[0] = grad[0]
+        (<double*>PyArray_MultiIter_DATA(multi, 6))[0] = grad[1]
+        (<double*>PyArray_MultiIter_DATA(multi, 7))[0] = grad[2]
+        (<double*>PyArray_MultiIter_DATA(multi, 8))[0] = grad[3]
+        PyArray_MultiIter_NEXT(multi)
+    return R
+
+
 def cspline_resample3d(ndarray im, dims, ndarray Tvox, dtype=None):
     """
     cspline_resample3d(im, dims, Tvox, dtype=None)
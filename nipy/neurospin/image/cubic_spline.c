@@ -73,6 +73,28 @@ double cubic_spline_basis (double x)
 }
 
 
+/* Returns the derivative of the cubic B-spline function at x */
+double cubic_spline_basis_deriv (double x)
+{
+
+  double absx, aux;
+
+  absx = ABS(x);
+
+  if (absx >= 2) 
+    return 0.0;
+
+  if (absx < 1) 
+    return x*(1.5*absx - 2.0);
+
+  aux = 2 - absx;
+  if (x > 0) 
+    return -0.5*aux*aux;
+  else 
+    return 0.5*aux*aux;
+}
+
+
 
 /* 
    Assumes that src and res are same size and both point to DOUBLE buffers. 
@@ -217,6 +239,19 @@ void cubic_spline_transform(PyArrayObject* res, const PyArrayObject* src)
 }
 
 
+/* 
+   In-place cubic spline transform of a double array along a single
+   axis.
+*/
+void cubic_spline_transform_axis(PyArrayObject* res, int axis)
+{
+  double* work = (double*)malloc(sizeof(double)*PyArray_DIM(res, axis)); 
+  _cubic_spline_transform(res, axis, work);
+  free(work); 
+  return; 
+}
+
+
 /* 
 
 Assumes: -(dimX-1) <= x <= 2*(dimX-1) 
@@ -625,6 +660,138 @@ double cubic_spline_sample4d (double x, double y, double z, double t, const PyAr
 }
 
 
+/* 
+   Same as cubic_spline_sample4d, also computing the partial
+   derivatives of the interpolated signal with respect to x, y, z and
+   t, which are stored in the 4-sized array grad (set to zero outside
+   the interpolation domain).
+*/
+double cubic_spline_sample4d_grad (double x, double y, double z, double t, 
+				   const PyArrayObject* Coef, double* grad)
+{
+  unsigned int dimX = PyArray_DIM(Coef, 0);
+  unsigned int dimY = PyArray_DIM(Coef, 1);
+  unsigned int dimZ = PyArray_DIM(Coef, 2);
+  unsigned int dimT = PyArray_DIM(Coef, 3);
+  unsigned int offX = PyArray_STRIDE(Coef, 0)/sizeof(double); 
+  unsigned int offY = PyArray_STRIDE(Coef, 1)/sizeof(double); 
+  unsigned int offZ = PyArray_STRIDE(Coef, 2)/sizeof(double); 
+  unsigned int offT = PyArray_STRIDE(Coef, 3)/sizeof(double); 
+  double *coef = PyArray_DATA(Coef); 
+
+  const unsigned int ddimX = dimX-1;
+  const unsigned int ddimY = dimY-1;
+  const unsigned int ddimZ = dimZ-1;
+  const unsigned int ddimT = dimT-1;
+  const unsigned int two_ddimX = 2*ddimX;
+  const unsigned int two_ddimY = 2*ddimY;
+  const unsigned int two_ddimZ = 2*ddimZ;
+  const unsigned int two_ddimT = 2*ddimT;
+
+  double c;
+  int nx, ny, nz, nt, px, py, pz, pt;
+  int xx, yy, zz, tt, a, b, d, e;
+  double aux, aux_dx; 
+  double aux2, aux2_dx, aux2_dy; 
+  double aux3, aux3_dx, aux3_dy, aux3_dz; 
+  double s, s_dx, s_dy, s_dz, s_dt; 
+  double bspx[4], bspy[4], bspz[4], bspt[4]; 
+  double dbspx[4], dbspy[4], dbspz[4], dbspt[4]; 
+  int posx[4], posy[4], posz[4], post[4];
+  int shftyzt, shftzt, shftt;
+
+  grad[0] = grad[1] = grad[2] = grad[3] = 0.0; 
+
+  /* Right up superior point */
+  aux = x + ddimX; 
+  if ((aux<0) || (aux>3*ddimX)) 
+    return 0.0;
+  px = (int)(aux+2) - ddimX;
+
+  aux = y + ddimY; 
+  if ((aux<0) || (aux>3*ddimY)) 
+    return 0.0;
+  py = (int)(aux+2) - ddimY;
+
+  aux = z + ddimZ; 
+  if ((aux<0) || (aux>3*ddimZ)) 
+    return 0.0;
+  pz = (int)(aux+2) - ddimZ;
+
+  aux = t + ddimT; 
+  if ((aux<0) || (aux>3*ddimT)) 
+    return 0.0;
+  pt = (int)(aux+2) - ddimT;
+
+  /* Left down inferior point */
+  nx = px - 3;
+  ny = py - 3;
+  nz = pz - 3;
+  nt = pt - 3;
+  
+  /* B-spline values and derivatives, and coefficient positions
+     (including mirror conditions) */ 
+  for (xx = nx, a = 0; xx <= px; xx ++, a ++) {
+    bspx[a] = cubic_spline_basis(x-(double)xx);
+    dbspx[a] = cubic_spline_basis_deriv(x-(double)xx);
+    posx[a] = CUBIC_SPLINE_MIRROR(xx, ddimX, two_ddimX);
+  }
+  for (yy = ny, b = 0; yy <= py; yy ++, b ++) {
+    bspy[b] = cubic_spline_basis(y-(double)yy);
+    dbspy[b] = cubic_spline_basis_deriv(y-(double)yy);
+    posy[b] = CUBIC_SPLINE_MIRROR(yy, ddimY, two_ddimY);
+  }
+  for (zz = nz, d = 0; zz <= pz; zz ++, d ++) {
+    bspz[d] = cubic_spline_basis(z-(double)zz);
+    dbspz[d] = cubic_spline_basis_deriv(z-(double)zz);
+    posz[d] = CUBIC_SPLINE_MIRROR(zz, ddimZ, two_ddimZ);
+  }
+  for (tt = nt, e = 0; tt <= pt; tt ++, e ++) {
+    bspt[e] = cubic_spline_basis(t-(double)tt);
+    dbspt[e] = cubic_spline_basis_deriv(t-(double)tt);
+    post[e] = CUBIC_SPLINE_MIRROR(tt, ddimT, two_ddimT);
+  }
+
+  /* Accumulate the signal and its derivatives, one dimension at a time */ 
+  s = s_dx = s_dy = s_dz = s_dt = 0.0;
+  for (e = 0; e < 4; e ++) {
+    aux3 = aux3_dx = aux3_dy = aux3_dz = 0.0; 
+    shftt = offT*post[e];
+    for (d = 0; d < 4; d ++) {
+      aux2 = aux2_dx = aux2_dy = 0.0; 
+      shftzt = offZ*posz[d] + shftt;
+      for (b = 0; b < 4; b ++) {
+	aux = aux_dx = 0.0; 
+	shftyzt = offY*posy[b] + shftzt;
+	for (a = 0; a < 4; a ++) {
+	  c = *(coef + offX*posx[a] + shftyzt); 
+	  aux += c * bspx[a];
+	  aux_dx += c * dbspx[a]; 
+	} /* end loop on x */
+	aux2 += aux * bspy[b]; 
+	aux2_dx += aux_dx * bspy[b]; 
+	aux2_dy += aux * dbspy[b]; 
+      } /* end loop on y */
+      aux3 += aux2 * bspz[d]; 
+      aux3_dx += aux2_dx * bspz[d]; 
+      aux3_dy += aux2_dy * bspz[d]; 
+      aux3_dz += aux2 * dbspz[d]; 
+    } /* end loop on z */
+    s += aux3 * bspt[e]; 
+    s_dx += aux3_dx * bspt[e]; 
+    s_dy += aux3_dy * bspt[e]; 
+    s_dz += aux3_dz * bspt[e]; 
+    s_dt += aux3 * dbspt[e]; 
+  } /* end loop on t */
+
+  grad[0] = s_dx; 
+  grad[1] = s_dy; 
+  grad[2] = s_dz; 
+  grad[3] = s_dt; 
+  return s;
+}
+
+
 /* 
    Resample a 3d image submitted to an affine transformation.
    Tvox is the voxel transformation from the image to the destination grid.  
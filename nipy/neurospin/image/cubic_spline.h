@@ -35,17 +35,30 @@ extern "C" {
     \param x input value 
   */
   extern double cubic_spline_basis(double x); 
+  /*! 
+    \brief Derivative of the cubic spline basis function
+    \param x input value 
+  */
+  extern double cubic_spline_basis_deriv(double x); 
   /*! 
     \brief Cubic spline transform of a one-dimensional signal 
     \param src input signal 
     \param res output signal (same size)
   */
   extern void cubic_spline_transform(PyArrayObject* res, const PyArrayObject* src);
+  /*! 
+    \brief In-place cubic spline transform along one axis
+    \param res double array 
+    \param axis transformed axis
+  */
+  extern void cubic_spline_transform_axis(PyArrayObject* res, int axis);
 
   extern double cubic_spline_sample1d(double x, const PyArrayObject* coef); 
   extern double cubic_spline_sample2d(double x, double y, const PyArrayObject* coef); 
   extern double cubic_spline_sample3d(double x, double y, double z, const PyArrayObject* coef); 
   extern double cubic_spline_sample4d(double x, double y, double z, double t, const PyArrayObject* coef); 
+  extern double cubic_spline_sample4d_grad(double x, double y, double z, double t, 
+					   const PyArrayObject* coef, double* grad); 
 
 
   extern void cubic_spline_resample3d(PyArrayObject* im_resampled, 
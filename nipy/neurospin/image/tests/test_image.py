@@ -4,6 +4,8 @@ import numpy as np
 from nipy.testing import anatfile, assert_equal, assert_almost_equal
 from nipy.io.imageformats import load 
 from nipy.neurospin.image import Image, apply_affine, inverse_affine
+from nipy.neurospin.image._image import cspline_transform, cspline_sample4d, \
+    cspline_sample4d_grad
 
 I = Image(load(anatfile))
 
@@ -46,6 +48,24 @@ def test_set():
     J = I.set(I.values()**2)
     assert_equal(J.shape, I.shape)
 
+def test_cspline_sample4d_grad(): 
+    C = cspline_transform(np.random.rand(8, 9, 7, 6))
+    XYZT = np.random.rand(4, 20)*np.array([[9, 10, 8, 5]]).T - 1
+    R = np.zeros(20)
+    D = [np.zeros(20) for i in range(4)]
+    cspline_sample4d_grad(R, D[0], D[1], D[2], D[3], C, *XYZT)
+    R0 = np.zeros(20)
+    cspline_sample4d(R0, C, *XYZT)
+    assert_almost_equal(R, R0)
+    h = 1e-5
+    for k in range(4): 
+        Rp, Rm = np.zeros(20), np.zeros(20)
+        dXYZT = np.zeros((4, 1))
+        dXYZT[k] = h
+        cspline_sample4d(Rp, C, *(XYZT+dXYZT))
+        cspline_sample4d(Rm, C, *(XYZT-dXYZT))
+        assert_almost_equal(D[k], (Rp-Rm)/(2*h), decimal=5)
+
 
 
 if __name__ == "__main__":
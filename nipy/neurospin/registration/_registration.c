@@ -1,4 +1,4 @@
-/* Generated by Cython 0.12.1 on Mon Jul 19 16:49:50 2010 */
+/* Generated by Cython 0.12.1 on Sun Oct 18 05:58:56 2026 */
 
 #define PY_SSIZE_T_CLEAN
 #include "Python.h"
@@ -377,7 +377,7 @@ typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
 
 typedef npy_cdouble __pyx_t_5numpy_complex_t;
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":62
+/* "/root/package/nipy/neurospin/registration/_registration.pyx":71
  * 
  * # Enumerate texture measures
  * cdef enum texture_measure:             # <<<<<<<<<<<<<<
@@ -397,7 +397,7 @@ enum __pyx_t_4nipy_9neurospin_12registration_13_registration_texture_measure {
   __pyx_e_4nipy_9neurospin_12registration_13_registration_CUSTOM_TEXTURE
 };
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":86
+/* "/root/package/nipy/neurospin/registration/_registration.pyx":95
  * 
  * # Enumerate similarity measures
  * cdef enum similarity_measure:             # <<<<<<<<<<<<<<
@@ -422,7 +422,7 @@ enum __pyx_t_4nipy_9neurospin_12registration_13_registration_similarity_measure
   __pyx_e_4nipy_9neurospin_12registration_13_registration_CUSTOM_SIMILARITY
 };
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":287
+/* "/root/package/nipy/neurospin/registration/_registration.pyx":359
  * 
  * # Enumerate transformation types
  * cdef enum transformation_type:             # <<<<<<<<<<<<<<
@@ -569,6 +569,26 @@ static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
 
 static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
 
+static CYTHON_INLINE long __Pyx_div_long(long, long); /* proto */
+
+#define UNARY_NEG_WOULD_OVERFLOW(x)		(((x) < 0) & ((unsigned long)(x) == 0-(unsigned long)(x)))
+
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
+    if (likely(PyList_CheckExact(L))) {
+        if (PyList_Append(L, x) < 0) return NULL;
+        Py_INCREF(Py_None);
+        return Py_None; /* this is just to have an accurate signature */
+    }
+    else {
+        PyObject *r, *m;
+        m = __Pyx_GetAttrString(L, "append");
+        if (!m) return NULL;
+        r = PyObject_CallFunctionObjArgs(m, x, NULL);
+        Py_DECREF(m);
+        return r;
+    }
+}
+
 static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
 
 static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void);
@@ -589,6 +609,14 @@ static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
 
 static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_npy_intp(npy_intp);
 
+#ifndef __PYX_FORCE_INIT_THREADS
+  #if PY_VERSION_HEX < 0x02040200
+    #define __PYX_FORCE_INIT_THREADS 1
+  #else
+    #define __PYX_FORCE_INIT_THREADS 0
+  #endif
+#endif
+
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     #define __Pyx_CREAL(z) ((z).real())
@@ -745,25 +773,31 @@ int __pyx_module_is_main_nipy__neurospin__registration___registration = 0;
 
 /* Implementation of nipy.neurospin.registration._registration */
 static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_min;
 static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_RuntimeError;
-static char __pyx_k_2[] = "ndarray is not C contiguous";
-static char __pyx_k_3[] = "ndarray is not Fortran contiguous";
-static char __pyx_k_4[] = "Non-native byte order not supported";
-static char __pyx_k_5[] = "unknown dtype code in numpy.pxd (%d)";
-static char __pyx_k_6[] = "Format string allocated too short, see comment in numpy.pxd";
-static char __pyx_k_7[] = "Format string allocated too short.";
-static char __pyx_k_8[] = "\nFast registration routines module: joint histogram computation,\nsimilarity measures, affine transformation parameterization.\n\nAuthor: Alexis Roche, 2008.\n";
-static char __pyx_k_9[] = "0.2";
-static char __pyx_k_10[] = "builtin_similarities";
-static char __pyx_k_11[] = "_histogram (line 180)";
-static char __pyx_k_12[] = "_joint_histogram (line 198)";
-static char __pyx_k_13[] = "_similarity (line 225)";
-static char __pyx_k_14[] = "rotation_vec2mat (line 306)";
-static char __pyx_k_15[] = "param_to_vector12 (line 347)";
-static char __pyx_k_16[] = "matrix44 (line 376)";
+static char __pyx_k_1[] = "_joint_histogram_range";
+static char __pyx_k_3[] = "ndarray is not C contiguous";
+static char __pyx_k_4[] = "ndarray is not Fortran contiguous";
+static char __pyx_k_5[] = "Non-native byte order not supported";
+static char __pyx_k_6[] = "unknown dtype code in numpy.pxd (%d)";
+static char __pyx_k_7[] = "Format string allocated too short, see comment in numpy.pxd";
+static char __pyx_k_8[] = "Format string allocated too short.";
+static char __pyx_k_9[] = "\nFast registration routines module: joint histogram computation,\nsimilarity measures, affine transformation parameterization.\n\nAuthor: Alexis Roche, 2008.\n";
+static char __pyx_k_10[] = "0.2";
+static char __pyx_k_11[] = "builtin_similarities";
+static char __pyx_k_12[] = "_histogram (line 189)";
+static char __pyx_k_13[] = "_joint_histogram (line 207)";
+static char __pyx_k_14[] = "_joint_histogram_range (line 254)";
+static char __pyx_k_15[] = "_joint_histogram_gradient (line 273)";
+static char __pyx_k_16[] = "_joint_histogram_gradient";
+static char __pyx_k_17[] = "_similarity (line 297)";
+static char __pyx_k_18[] = "rotation_vec2mat (line 378)";
+static char __pyx_k_19[] = "param_to_vector12 (line 419)";
+static char __pyx_k_20[] = "matrix44 (line 448)";
 static char __pyx_k__B[] = "B";
 static char __pyx_k__F[] = "F";
+static char __pyx_k__G[] = "G";
 static char __pyx_k__H[] = "H";
 static char __pyx_k__I[] = "I";
 static char __pyx_k__L[] = "L";
@@ -786,6 +820,7 @@ static char __pyx_k__Zg[] = "Zg";
 static char __pyx_k__cc[] = "cc";
 static char __pyx_k__ce[] = "ce";
 static char __pyx_k__cr[] = "cr";
+static char __pyx_k__dH[] = "dH";
 static char __pyx_k__im[] = "im";
 static char __pyx_k__je[] = "je";
 static char __pyx_k__mi[] = "mi";
@@ -796,6 +831,7 @@ static char __pyx_k__cos[] = "cos";
 static char __pyx_k__dot[] = "dot";
 static char __pyx_k__exp[] = "exp";
 static char __pyx_k__eye[] = "eye";
+static char __pyx_k__imI[] = "imI";
 static char __pyx_k__imJ[] = "imJ";
 static char __pyx_k__max[] = "max";
 static char __pyx_k__min[] = "min";
@@ -803,17 +839,21 @@ static char __pyx_k__nmi[] = "nmi";
 static char __pyx_k__obj[] = "obj";
 static char __pyx_k__sin[] = "sin";
 static char __pyx_k__smi[] = "smi";
+static char __pyx_k__sum[] = "sum";
 static char __pyx_k__Size[] = "Size";
 static char __pyx_k__Tvox[] = "Tvox";
+static char __pyx_k__args[] = "args";
 static char __pyx_k__base[] = "base";
 static char __pyx_k__crl1[] = "crl1";
 static char __pyx_k__data[] = "data";
 static char __pyx_k__diag[] = "diag";
 static char __pyx_k__iter[] = "iter";
+static char __pyx_k__join[] = "join";
 static char __pyx_k__mean[] = "mean";
 static char __pyx_k__ndim[] = "ndim";
 static char __pyx_k__norm[] = "norm";
 static char __pyx_k__size[] = "size";
+static char __pyx_k__stop[] = "stop";
 static char __pyx_k__array[] = "array";
 static char __pyx_k__descr[] = "descr";
 static char __pyx_k__dtype[] = "dtype";
@@ -828,7 +868,9 @@ static char __pyx_k__range[] = "range";
 static char __pyx_k__rigid[] = "rigid";
 static char __pyx_k__shape[] = "shape";
 static char __pyx_k__stamp[] = "stamp";
+static char __pyx_k__start[] = "start";
 static char __pyx_k__zeros[] = "zeros";
+static char __pyx_k__Thread[] = "Thread";
 static char __pyx_k__affine[] = "affine";
 static char __pyx_k__custom[] = "custom";
 static char __pyx_k__double[] = "double";
@@ -842,6 +884,7 @@ static char __pyx_k__llr_cr[] = "llr_cr";
 static char __pyx_k__llr_mi[] = "llr_mi";
 static char __pyx_k__median[] = "median";
 static char __pyx_k__method[] = "method";
+static char __pyx_k__target[] = "target";
 static char __pyx_k__affines[] = "affines";
 static char __pyx_k__entropy[] = "entropy";
 static char __pyx_k__llr_smi[] = "llr_smi";
@@ -863,6 +906,8 @@ static char __pyx_k__variance[] = "variance";
 static char __pyx_k___affine2d[] = "_affine2d";
 static char __pyx_k___affine3d[] = "_affine3d";
 static char __pyx_k__byteorder[] = "byteorder";
+static char __pyx_k__n_threads[] = "n_threads";
+static char __pyx_k__threading[] = "threading";
 static char __pyx_k__ValueError[] = "ValueError";
 static char __pyx_k___histogram[] = "_histogram";
 static char __pyx_k__similarity[] = "similarity";
@@ -876,26 +921,32 @@ static char __pyx_k___joint_histogram[] = "_joint_histogram";
 static char __pyx_k__builtin_textures[] = "builtin_textures";
 static char __pyx_k__rotation_vec2mat[] = "rotation_vec2mat";
 static char __pyx_k__param_to_vector12[] = "param_to_vector12";
-static PyObject *__pyx_n_s_10;
-static PyObject *__pyx_kp_u_11;
+static PyObject *__pyx_n_s_1;
+static PyObject *__pyx_kp_s_10;
+static PyObject *__pyx_n_s_11;
 static PyObject *__pyx_kp_u_12;
 static PyObject *__pyx_kp_u_13;
 static PyObject *__pyx_kp_u_14;
 static PyObject *__pyx_kp_u_15;
-static PyObject *__pyx_kp_u_16;
-static PyObject *__pyx_kp_u_2;
+static PyObject *__pyx_n_s_16;
+static PyObject *__pyx_kp_u_17;
+static PyObject *__pyx_kp_u_18;
+static PyObject *__pyx_kp_u_19;
+static PyObject *__pyx_kp_u_20;
 static PyObject *__pyx_kp_u_3;
 static PyObject *__pyx_kp_u_4;
 static PyObject *__pyx_kp_u_5;
 static PyObject *__pyx_kp_u_6;
 static PyObject *__pyx_kp_u_7;
-static PyObject *__pyx_kp_s_9;
+static PyObject *__pyx_kp_u_8;
 static PyObject *__pyx_n_s__F;
+static PyObject *__pyx_n_s__G;
 static PyObject *__pyx_n_s__H;
 static PyObject *__pyx_n_s__HI;
 static PyObject *__pyx_n_s__HJ;
 static PyObject *__pyx_n_s__RuntimeError;
 static PyObject *__pyx_n_s__Size;
+static PyObject *__pyx_n_s__Thread;
 static PyObject *__pyx_n_s__Tvox;
 static PyObject *__pyx_n_s__ValueError;
 static PyObject *__pyx_n_s____main__;
@@ -913,6 +964,7 @@ static PyObject *__pyx_n_s___similarity2d;
 static PyObject *__pyx_n_s___similarity3d;
 static PyObject *__pyx_n_s__affine;
 static PyObject *__pyx_n_s__affines;
+static PyObject *__pyx_n_s__args;
 static PyObject *__pyx_n_s__array;
 static PyObject *__pyx_n_s__base;
 static PyObject *__pyx_n_s__buf;
@@ -924,6 +976,7 @@ static PyObject *__pyx_n_s__cos;
 static PyObject *__pyx_n_s__cr;
 static PyObject *__pyx_n_s__crl1;
 static PyObject *__pyx_n_s__custom;
+static PyObject *__pyx_n_s__dH;
 static PyObject *__pyx_n_s__data;
 static PyObject *__pyx_n_s__descr;
 static PyObject *__pyx_n_s__diag;
@@ -937,6 +990,7 @@ static PyObject *__pyx_n_s__eye;
 static PyObject *__pyx_n_s__fields;
 static PyObject *__pyx_n_s__format;
 static PyObject *__pyx_n_s__im;
+static PyObject *__pyx_n_s__imI;
 static PyObject *__pyx_n_s__imJ;
 static PyObject *__pyx_n_s__index;
 static PyObject *__pyx_n_s__interp;
@@ -945,6 +999,7 @@ static PyObject *__pyx_n_s__iter;
 static PyObject *__pyx_n_s__iterI;
 static PyObject *__pyx_n_s__iters;
 static PyObject *__pyx_n_s__je;
+static PyObject *__pyx_n_s__join;
 static PyObject *__pyx_n_s__l1dev;
 static PyObject *__pyx_n_s__linalg;
 static PyObject *__pyx_n_s__llr_cc;
@@ -959,6 +1014,7 @@ static PyObject *__pyx_n_s__median;
 static PyObject *__pyx_n_s__method;
 static PyObject *__pyx_n_s__mi;
 static PyObject *__pyx_n_s__min;
+static PyObject *__pyx_n_s__n_threads;
 static PyObject *__pyx_n_s__names;
 static PyObject *__pyx_n_s__ndim;
 static PyObject *__pyx_n_s__nmi;
@@ -980,11 +1036,16 @@ static PyObject *__pyx_n_s__sin;
 static PyObject *__pyx_n_s__size;
 static PyObject *__pyx_n_s__smi;
 static PyObject *__pyx_n_s__stamp;
+static PyObject *__pyx_n_s__start;
+static PyObject *__pyx_n_s__stop;
 static PyObject *__pyx_n_s__strides;
 static PyObject *__pyx_n_s__suboffsets;
+static PyObject *__pyx_n_s__sum;
 static PyObject *__pyx_n_s__t;
 static PyObject *__pyx_n_s__t0;
+static PyObject *__pyx_n_s__target;
 static PyObject *__pyx_n_s__texture;
+static PyObject *__pyx_n_s__threading;
 static PyObject *__pyx_n_s__type_num;
 static PyObject *__pyx_n_s__variance;
 static PyObject *__pyx_n_s__zeros;
@@ -1000,9 +1061,9 @@ static PyObject *__pyx_int_9;
 static PyObject *__pyx_int_11;
 static PyObject *__pyx_int_12;
 static PyObject *__pyx_int_15;
-static int __pyx_k_1;
+static int __pyx_k_2;
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":120
+/* "/root/package/nipy/neurospin/registration/_registration.pyx":129
  * 
  * 
  * def _texture(ndarray im, ndarray H, Size, int texture, method=None):             # <<<<<<<<<<<<<<
@@ -1063,19 +1124,19 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__H);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("_texture", 0, 4, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_texture", 0, 4, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Size);
       if (likely(values[2])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("_texture", 0, 4, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_texture", 0, 4, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  3:
       values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__texture);
       if (likely(values[3])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("_texture", 0, 4, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_texture", 0, 4, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  4:
       if (kw_args > 0) {
@@ -1084,12 +1145,12 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_texture") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_texture") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_im = ((PyArrayObject *)values[0]);
     __pyx_v_H = ((PyArrayObject *)values[1]);
     __pyx_v_Size = values[2];
-    __pyx_v_texture = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_texture == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_texture = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_texture == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     __pyx_v_method = values[4];
   } else {
     __pyx_v_method = ((PyObject *)Py_None);
@@ -1097,7 +1158,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
       case  5:
       __pyx_v_method = PyTuple_GET_ITEM(__pyx_args, 4);
       case  4:
-      __pyx_v_texture = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_texture == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_texture = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_texture == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       __pyx_v_Size = PyTuple_GET_ITEM(__pyx_args, 2);
       __pyx_v_H = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
       __pyx_v_im = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
@@ -1107,7 +1168,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("_texture", 0, 4, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("_texture", 0, 4, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nipy.neurospin.registration._registration._texture");
   return NULL;
@@ -1120,10 +1181,10 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
   __pyx_v_im_iter = ((PyArrayIterObject *)Py_None); __Pyx_INCREF(Py_None);
   __pyx_v_imtext = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_im), __pyx_ptype_5numpy_ndarray, 1, "im", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_H), __pyx_ptype_5numpy_ndarray, 1, "H", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_im), __pyx_ptype_5numpy_ndarray, 1, "im", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_H), __pyx_ptype_5numpy_ndarray, 1, "H", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":130
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":139
  * 
  *     # Views
  *     clamp = <unsigned int>H.shape[0]             # <<<<<<<<<<<<<<
@@ -1132,7 +1193,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
  */
   __pyx_v_clamp = ((unsigned int)(__pyx_v_H->dimensions[0]));
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":131
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":140
  *     # Views
  *     clamp = <unsigned int>H.shape[0]
  *     h = <double*>H.data             # <<<<<<<<<<<<<<
@@ -1141,73 +1202,73 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
  */
   __pyx_v_h = ((double *)__pyx_v_H->data);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":134
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":143
  * 
  *     # Copy size parameters
  *     size[0] = <unsigned int>Size[0]             # <<<<<<<<<<<<<<
  *     size[1] = <unsigned int>Size[1]
  *     size[2] = <unsigned int>Size[2]
  */
-  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_Size, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 134; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_Size, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyInt_AsUnsignedInt(__pyx_t_1); if (unlikely((__pyx_t_2 == (unsigned int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 134; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_AsUnsignedInt(__pyx_t_1); if (unlikely((__pyx_t_2 == (unsigned int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   (__pyx_v_size[0]) = ((unsigned int)__pyx_t_2);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":135
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":144
  *     # Copy size parameters
  *     size[0] = <unsigned int>Size[0]
  *     size[1] = <unsigned int>Size[1]             # <<<<<<<<<<<<<<
  *     size[2] = <unsigned int>Size[2]
  * 
  */
-  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_Size, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_Size, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyInt_AsUnsignedInt(__pyx_t_1); if (unlikely((__pyx_t_2 == (unsigned int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_AsUnsignedInt(__pyx_t_1); if (unlikely((__pyx_t_2 == (unsigned int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   (__pyx_v_size[1]) = ((unsigned int)__pyx_t_2);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":136
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":145
  *     size[0] = <unsigned int>Size[0]
  *     size[1] = <unsigned int>Size[1]
  *     size[2] = <unsigned int>Size[2]             # <<<<<<<<<<<<<<
  * 
  *     # Allocate output
  */
-  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_Size, 2, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_Size, 2, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyInt_AsUnsignedInt(__pyx_t_1); if (unlikely((__pyx_t_2 == (unsigned int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_AsUnsignedInt(__pyx_t_1); if (unlikely((__pyx_t_2 == (unsigned int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   (__pyx_v_size[2]) = ((unsigned int)__pyx_t_2);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":139
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":148
  * 
  *     # Allocate output
  *     imtext = np.zeros([im.shape[i] for i in range(im.ndim)], dtype=np.double)             # <<<<<<<<<<<<<<
  * 
  *     # Loop over input and output images
  */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__zeros); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_5 = PyInt_FromLong(__pyx_v_im->nd); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = PyInt_FromLong(__pyx_v_im->nd); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_6);
   PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_5);
   __pyx_t_5 = 0;
-  __pyx_t_5 = PyObject_Call(__pyx_builtin_range, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = PyObject_Call(__pyx_builtin_range, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   if (PyList_CheckExact(__pyx_t_5) || PyTuple_CheckExact(__pyx_t_5)) {
     __pyx_t_4 = 0; __pyx_t_6 = __pyx_t_5; __Pyx_INCREF(__pyx_t_6);
   } else {
-    __pyx_t_4 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
   }
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -1221,7 +1282,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
     } else {
       __pyx_t_5 = PyIter_Next(__pyx_t_6);
       if (!__pyx_t_5) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         break;
       }
       __Pyx_GOTREF(__pyx_t_5);
@@ -1229,29 +1290,29 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
     __Pyx_DECREF(__pyx_v_i);
     __pyx_v_i = __pyx_t_5;
     __pyx_t_5 = 0;
-    __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_5 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_im->dimensions[__pyx_t_7])); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = __Pyx_PyInt_to_py_npy_intp((__pyx_v_im->dimensions[__pyx_t_7])); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_8 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_5); if (unlikely(__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_5); if (unlikely(__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_INCREF(((PyObject *)__pyx_t_1));
   PyTuple_SET_ITEM(__pyx_t_6, 0, ((PyObject *)__pyx_t_1));
   __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_9 = PyObject_GetAttr(__pyx_t_5, __pyx_n_s__double); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_9 = PyObject_GetAttr(__pyx_t_5, __pyx_n_s__double); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__dtype), __pyx_t_9) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__dtype), __pyx_t_9) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_t_9 = PyEval_CallObjectWithKeywords(__pyx_t_3, __pyx_t_6, ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_9 = PyEval_CallObjectWithKeywords(__pyx_t_3, __pyx_t_6, ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
@@ -1260,21 +1321,21 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
   __pyx_v_imtext = __pyx_t_9;
   __pyx_t_9 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":142
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":151
  * 
  *     # Loop over input and output images
  *     multi = PyArray_MultiIterNew(2, <void*>imtext, <void*>im)             # <<<<<<<<<<<<<<
  *     while(multi.index < multi.size):
  *         res = <double*>PyArray_MultiIter_DATA(multi, 0)
  */
-  __pyx_t_9 = PyArray_MultiIterNew(2, ((void *)__pyx_v_imtext), ((void *)__pyx_v_im)); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_9 = PyArray_MultiIterNew(2, ((void *)__pyx_v_imtext), ((void *)__pyx_v_im)); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 151; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_9);
-  if (!(likely(((__pyx_t_9) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_9, __pyx_ptype_5numpy_broadcast))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_t_9) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_9, __pyx_ptype_5numpy_broadcast))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 151; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_v_multi));
   __pyx_v_multi = ((PyArrayMultiIterObject *)__pyx_t_9);
   __pyx_t_9 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":143
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":152
  *     # Loop over input and output images
  *     multi = PyArray_MultiIterNew(2, <void*>imtext, <void*>im)
  *     while(multi.index < multi.size):             # <<<<<<<<<<<<<<
@@ -1282,19 +1343,19 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
  *         im_iter = <flatiter>multi.iters[1]
  */
   while (1) {
-    __pyx_t_9 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__index); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_9 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__index); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_9);
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__size); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__size); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_6 = PyObject_RichCompare(__pyx_t_9, __pyx_t_1, Py_LT); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = PyObject_RichCompare(__pyx_t_9, __pyx_t_1, Py_LT); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_10 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_10 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     if (!__pyx_t_10) break;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":144
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":153
  *     multi = PyArray_MultiIterNew(2, <void*>imtext, <void*>im)
  *     while(multi.index < multi.size):
  *         res = <double*>PyArray_MultiIter_DATA(multi, 0)             # <<<<<<<<<<<<<<
@@ -1303,16 +1364,16 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
  */
     __pyx_v_res = ((double *)PyArray_MultiIter_DATA(__pyx_v_multi, 0));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":145
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":154
  *     while(multi.index < multi.size):
  *         res = <double*>PyArray_MultiIter_DATA(multi, 0)
  *         im_iter = <flatiter>multi.iters[1]             # <<<<<<<<<<<<<<
  *         # Compute local image histogram
  *         local_histogram(h, clamp, im_iter, size)
  */
-    __pyx_t_6 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__iters); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = PyObject_GetAttr(((PyObject *)__pyx_v_multi), __pyx_n_s__iters); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_6, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_6, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_INCREF(((PyObject *)((PyArrayIterObject *)__pyx_t_1)));
@@ -1320,7 +1381,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
     __pyx_v_im_iter = ((PyArrayIterObject *)__pyx_t_1);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":147
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":156
  *         im_iter = <flatiter>multi.iters[1]
  *         # Compute local image histogram
  *         local_histogram(h, clamp, im_iter, size)             # <<<<<<<<<<<<<<
@@ -1329,7 +1390,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
  */
     local_histogram(__pyx_v_h, __pyx_v_clamp, __pyx_v_im_iter, __pyx_v_size);
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":149
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":158
  *         local_histogram(h, clamp, im_iter, size)
  *         # Switch
  *         if texture == MIN:             # <<<<<<<<<<<<<<
@@ -1339,7 +1400,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
     __pyx_t_10 = (__pyx_v_texture == __pyx_e_4nipy_9neurospin_12registration_13_registration_MIN);
     if (__pyx_t_10) {
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":150
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":159
  *         # Switch
  *         if texture == MIN:
  *             drange(h, clamp, moments)             # <<<<<<<<<<<<<<
@@ -1348,7 +1409,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
  */
       drange(__pyx_v_h, __pyx_v_clamp, __pyx_v_moments);
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":151
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":160
  *         if texture == MIN:
  *             drange(h, clamp, moments)
  *             res[0] = moments[0]             # <<<<<<<<<<<<<<
@@ -1359,7 +1420,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
       goto __pyx_L10;
     }
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":152
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":161
  *             drange(h, clamp, moments)
  *             res[0] = moments[0]
  *         elif texture == MAX:             # <<<<<<<<<<<<<<
@@ -1369,7 +1430,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
     __pyx_t_10 = (__pyx_v_texture == __pyx_e_4nipy_9neurospin_12registration_13_registration_MAX);
     if (__pyx_t_10) {
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":153
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":162
  *             res[0] = moments[0]
  *         elif texture == MAX:
  *             drange(h, clamp, moments)             # <<<<<<<<<<<<<<
@@ -1378,7 +1439,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
  */
       drange(__pyx_v_h, __pyx_v_clamp, __pyx_v_moments);
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":154
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":163
  *         elif texture == MAX:
  *             drange(h, clamp, moments)
  *             res[0] = moments[1]             # <<<<<<<<<<<<<<
@@ -1389,7 +1450,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
       goto __pyx_L10;
     }
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":155
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":164
  *             drange(h, clamp, moments)
  *             res[0] = moments[1]
  *         elif texture == DRANGE:             # <<<<<<<<<<<<<<
@@ -1399,7 +1460,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
     __pyx_t_10 = (__pyx_v_texture == __pyx_e_4nipy_9neurospin_12registration_13_registration_DRANGE);
     if (__pyx_t_10) {
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":156
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":165
  *             res[0] = moments[1]
  *         elif texture == DRANGE:
  *             drange(h, clamp, moments)             # <<<<<<<<<<<<<<
@@ -1408,7 +1469,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
  */
       drange(__pyx_v_h, __pyx_v_clamp, __pyx_v_moments);
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":157
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":166
  *         elif texture == DRANGE:
  *             drange(h, clamp, moments)
  *             res[0] = moments[1]-moments[0]             # <<<<<<<<<<<<<<
@@ -1419,7 +1480,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
       goto __pyx_L10;
     }
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":158
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":167
  *             drange(h, clamp, moments)
  *             res[0] = moments[1]-moments[0]
  *         elif texture == MEAN:             # <<<<<<<<<<<<<<
@@ -1429,7 +1490,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
     __pyx_t_10 = (__pyx_v_texture == __pyx_e_4nipy_9neurospin_12registration_13_registration_MEAN);
     if (__pyx_t_10) {
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":159
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":168
  *             res[0] = moments[1]-moments[0]
  *         elif texture == MEAN:
  *             L2_moments(h, clamp, moments)             # <<<<<<<<<<<<<<
@@ -1438,7 +1499,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
  */
       L2_moments(__pyx_v_h, __pyx_v_clamp, __pyx_v_moments);
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":160
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":169
  *         elif texture == MEAN:
  *             L2_moments(h, clamp, moments)
  *             res[0] = moments[1]             # <<<<<<<<<<<<<<
@@ -1449,7 +1510,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
       goto __pyx_L10;
     }
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":161
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":170
  *             L2_moments(h, clamp, moments)
  *             res[0] = moments[1]
  *         elif texture == MEAN:             # <<<<<<<<<<<<<<
@@ -1459,7 +1520,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
     __pyx_t_10 = (__pyx_v_texture == __pyx_e_4nipy_9neurospin_12registration_13_registration_MEAN);
     if (__pyx_t_10) {
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":162
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":171
  *             res[0] = moments[1]
  *         elif texture == MEAN:
  *             L2_moments(h, clamp, moments)             # <<<<<<<<<<<<<<
@@ -1468,7 +1529,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
  */
       L2_moments(__pyx_v_h, __pyx_v_clamp, __pyx_v_moments);
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":163
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":172
  *         elif texture == MEAN:
  *             L2_moments(h, clamp, moments)
  *             res[0] = moments[2]             # <<<<<<<<<<<<<<
@@ -1479,7 +1540,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
       goto __pyx_L10;
     }
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":164
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":173
  *             L2_moments(h, clamp, moments)
  *             res[0] = moments[2]
  *         elif texture == MEDIAN:             # <<<<<<<<<<<<<<
@@ -1489,7 +1550,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
     __pyx_t_10 = (__pyx_v_texture == __pyx_e_4nipy_9neurospin_12registration_13_registration_MEDIAN);
     if (__pyx_t_10) {
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":165
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":174
  *             res[0] = moments[2]
  *         elif texture == MEDIAN:
  *             L1_moments(h, clamp, moments)             # <<<<<<<<<<<<<<
@@ -1498,7 +1559,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
  */
       L1_moments(__pyx_v_h, __pyx_v_clamp, __pyx_v_moments);
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":166
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":175
  *         elif texture == MEDIAN:
  *             L1_moments(h, clamp, moments)
  *             res[0] = moments[1]             # <<<<<<<<<<<<<<
@@ -1509,7 +1570,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
       goto __pyx_L10;
     }
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":167
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":176
  *             L1_moments(h, clamp, moments)
  *             res[0] = moments[1]
  *         elif texture == L1DEV:             # <<<<<<<<<<<<<<
@@ -1519,7 +1580,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
     __pyx_t_10 = (__pyx_v_texture == __pyx_e_4nipy_9neurospin_12registration_13_registration_L1DEV);
     if (__pyx_t_10) {
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":168
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":177
  *             res[0] = moments[1]
  *         elif texture == L1DEV:
  *             L1_moments(h, clamp, moments)             # <<<<<<<<<<<<<<
@@ -1528,7 +1589,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
  */
       L1_moments(__pyx_v_h, __pyx_v_clamp, __pyx_v_moments);
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":169
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":178
  *         elif texture == L1DEV:
  *             L1_moments(h, clamp, moments)
  *             res[0] = moments[2]             # <<<<<<<<<<<<<<
@@ -1539,7 +1600,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
       goto __pyx_L10;
     }
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":170
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":179
  *             L1_moments(h, clamp, moments)
  *             res[0] = moments[2]
  *         elif texture == ENTROPY:             # <<<<<<<<<<<<<<
@@ -1549,7 +1610,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
     __pyx_t_10 = (__pyx_v_texture == __pyx_e_4nipy_9neurospin_12registration_13_registration_ENTROPY);
     if (__pyx_t_10) {
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":171
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":180
  *             res[0] = moments[2]
  *         elif texture == ENTROPY:
  *             res[0] = entropy(h, clamp, moments)             # <<<<<<<<<<<<<<
@@ -1561,28 +1622,28 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
     }
     /*else*/ {
 
-      /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":173
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":182
  *             res[0] = entropy(h, clamp, moments)
  *         else: # CUSTOM
  *             res[0] = method(H)             # <<<<<<<<<<<<<<
  *         # Next voxel please
  *         PyArray_MultiIter_NEXT(multi)
  */
-      __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 173; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_INCREF(((PyObject *)__pyx_v_H));
       PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_v_H));
       __Pyx_GIVEREF(((PyObject *)__pyx_v_H));
-      __pyx_t_6 = PyObject_Call(__pyx_v_method, __pyx_t_1, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 173; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = PyObject_Call(__pyx_v_method, __pyx_t_1, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_11 = __pyx_PyFloat_AsDouble(__pyx_t_6); if (unlikely((__pyx_t_11 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 173; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_11 = __pyx_PyFloat_AsDouble(__pyx_t_6); if (unlikely((__pyx_t_11 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       (__pyx_v_res[0]) = __pyx_t_11;
     }
     __pyx_L10:;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":175
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":184
  *             res[0] = method(H)
  *         # Next voxel please
  *         PyArray_MultiIter_NEXT(multi)             # <<<<<<<<<<<<<<
@@ -1592,7 +1653,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
     PyArray_MultiIter_NEXT(__pyx_v_multi);
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":177
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":186
  *         PyArray_MultiIter_NEXT(multi)
  * 
  *     return imtext             # <<<<<<<<<<<<<<
@@ -1628,7 +1689,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__textu
   return __pyx_r;
 }
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":180
+/* "/root/package/nipy/neurospin/registration/_registration.pyx":189
  * 
  * 
  * def _histogram(ndarray H, flatiter iter):             # <<<<<<<<<<<<<<
@@ -1665,11 +1726,11 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__histo
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__iter);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("_histogram", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_histogram", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_histogram") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_histogram") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_H = ((PyArrayObject *)values[0]);
     __pyx_v_iter = ((PyArrayIterObject *)values[1]);
@@ -1681,15 +1742,15 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__histo
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("_histogram", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("_histogram", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nipy.neurospin.registration._registration._histogram");
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_H), __pyx_ptype_5numpy_ndarray, 1, "H", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_iter), __pyx_ptype_5numpy_flatiter, 1, "iter", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_H), __pyx_ptype_5numpy_ndarray, 1, "H", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_iter), __pyx_ptype_5numpy_flatiter, 1, "iter", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":189
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":198
  * 
  *     # Views
  *     clamp = <unsigned int>H.shape[0]             # <<<<<<<<<<<<<<
@@ -1698,7 +1759,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__histo
  */
   __pyx_v_clamp = ((unsigned int)(__pyx_v_H->dimensions[0]));
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":190
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":199
  *     # Views
  *     clamp = <unsigned int>H.shape[0]
  *     h = <double*>H.data             # <<<<<<<<<<<<<<
@@ -1707,7 +1768,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__histo
  */
   __pyx_v_h = ((double *)__pyx_v_H->data);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":193
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":202
  * 
  *     # Compute image histogram
  *     histogram(h, clamp, iter)             # <<<<<<<<<<<<<<
@@ -1716,7 +1777,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__histo
  */
   histogram(__pyx_v_h, __pyx_v_clamp, __pyx_v_iter);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":195
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":204
  *     histogram(h, clamp, iter)
  * 
  *     return             # <<<<<<<<<<<<<<
@@ -1738,16 +1799,16 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__histo
   return __pyx_r;
 }
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":198
+/* "/root/package/nipy/neurospin/registration/_registration.pyx":207
  * 
  * 
- * def _joint_histogram(ndarray H, flatiter iterI, ndarray imJ, ndarray Tvox, int affine, int interp):             # <<<<<<<<<<<<<<
+ * def _joint_histogram(ndarray H, flatiter iterI, ndarray imJ, ndarray Tvox, int affine, int interp,             # <<<<<<<<<<<<<<
+ *                      int n_threads=1):
  *     """
- *     _joint_histogram(H, iterI, imJ, Tvox, interp)
  */
 
 static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint_histogram(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_4nipy_9neurospin_12registration_13_registration__joint_histogram[] = "\n    _joint_histogram(H, iterI, imJ, Tvox, interp)\n    Comments to follow.\n    ";
+static char __pyx_doc_4nipy_9neurospin_12registration_13_registration__joint_histogram[] = "\n    _joint_histogram(H, iterI, imJ, Tvox, interp, n_threads=1)\n    Comments to follow.\n\n    If n_threads is greater than one, the source voxels are split into\n    ranges of whole chunks, whose partial histograms are computed by\n    parallel threads and summed into H. \n    ";
 static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint_histogram(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_H = 0;
   PyArrayIterObject *__pyx_v_iterI = 0;
@@ -1755,18 +1816,41 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint
   PyArrayObject *__pyx_v_Tvox = 0;
   int __pyx_v_affine;
   int __pyx_v_interp;
+  int __pyx_v_n_threads;
   double *__pyx_v_h;
   double *__pyx_v_tvox;
   unsigned int __pyx_v_clampI;
   unsigned int __pyx_v_clampJ;
+  long __pyx_v_size;
+  long __pyx_v_nchunks;
+  PyObject *__pyx_v_bounds;
+  PyObject *__pyx_v_Hs;
+  PyObject *__pyx_v_threads;
+  PyObject *__pyx_v_i;
+  PyObject *__pyx_v_thread;
   PyObject *__pyx_r = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__H,&__pyx_n_s__iterI,&__pyx_n_s__imJ,&__pyx_n_s__Tvox,&__pyx_n_s__affine,&__pyx_n_s__interp,0};
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  long __pyx_t_3;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_t_11;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__H,&__pyx_n_s__iterI,&__pyx_n_s__imJ,&__pyx_n_s__Tvox,&__pyx_n_s__affine,&__pyx_n_s__interp,&__pyx_n_s__n_threads,0};
   __Pyx_RefNannySetupContext("_joint_histogram");
   __pyx_self = __pyx_self;
   if (unlikely(__pyx_kwds)) {
     Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[6] = {0,0,0,0,0,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
     switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
       case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
       case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
       case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
@@ -1785,65 +1869,90 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__iterI);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("_joint_histogram", 1, 6, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram", 0, 6, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__imJ);
       if (likely(values[2])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("_joint_histogram", 1, 6, 6, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram", 0, 6, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  3:
       values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Tvox);
       if (likely(values[3])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("_joint_histogram", 1, 6, 6, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram", 0, 6, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  4:
       values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__affine);
       if (likely(values[4])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("_joint_histogram", 1, 6, 6, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram", 0, 6, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  5:
       values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__interp);
       if (likely(values[5])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("_joint_histogram", 1, 6, 6, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram", 0, 6, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  6:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__n_threads);
+        if (unlikely(value)) { values[6] = value; kw_args--; }
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_joint_histogram") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_joint_histogram") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_H = ((PyArrayObject *)values[0]);
     __pyx_v_iterI = ((PyArrayIterObject *)values[1]);
     __pyx_v_imJ = ((PyArrayObject *)values[2]);
     __pyx_v_Tvox = ((PyArrayObject *)values[3]);
-    __pyx_v_affine = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_affine == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_interp = __Pyx_PyInt_AsInt(values[5]); if (unlikely((__pyx_v_interp == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
-    goto __pyx_L5_argtuple_error;
+    __pyx_v_affine = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_affine == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_interp = __Pyx_PyInt_AsInt(values[5]); if (unlikely((__pyx_v_interp == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    if (values[6]) {
+      __pyx_v_n_threads = __Pyx_PyInt_AsInt(values[6]); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_n_threads = ((int)1);
+    }
   } else {
-    __pyx_v_H = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-    __pyx_v_iterI = ((PyArrayIterObject *)PyTuple_GET_ITEM(__pyx_args, 1));
-    __pyx_v_imJ = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 2));
-    __pyx_v_Tvox = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 3));
-    __pyx_v_affine = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_affine == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_interp = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely((__pyx_v_interp == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_n_threads = ((int)1);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  7:
+      __pyx_v_n_threads = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 6)); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  6:
+      __pyx_v_interp = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely((__pyx_v_interp == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_affine = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_affine == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_Tvox = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 3));
+      __pyx_v_imJ = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 2));
+      __pyx_v_iterI = ((PyArrayIterObject *)PyTuple_GET_ITEM(__pyx_args, 1));
+      __pyx_v_H = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("_joint_histogram", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("_joint_histogram", 0, 6, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nipy.neurospin.registration._registration._joint_histogram");
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_H), __pyx_ptype_5numpy_ndarray, 1, "H", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_iterI), __pyx_ptype_5numpy_flatiter, 1, "iterI", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_imJ), __pyx_ptype_5numpy_ndarray, 1, "imJ", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Tvox), __pyx_ptype_5numpy_ndarray, 1, "Tvox", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_INCREF((PyObject *)__pyx_v_H);
+  __Pyx_INCREF((PyObject *)__pyx_v_iterI);
+  __Pyx_INCREF((PyObject *)__pyx_v_imJ);
+  __Pyx_INCREF((PyObject *)__pyx_v_Tvox);
+  __pyx_v_bounds = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_Hs = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_threads = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_v_thread = Py_None; __Pyx_INCREF(Py_None);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_H), __pyx_ptype_5numpy_ndarray, 1, "H", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_iterI), __pyx_ptype_5numpy_flatiter, 1, "iterI", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_imJ), __pyx_ptype_5numpy_ndarray, 1, "imJ", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Tvox), __pyx_ptype_5numpy_ndarray, 1, "Tvox", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":207
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":222
  * 
  *     # Views
  *     clampI = <unsigned int>H.shape[0]             # <<<<<<<<<<<<<<
@@ -1852,7 +1961,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint
  */
   __pyx_v_clampI = ((unsigned int)(__pyx_v_H->dimensions[0]));
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":208
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":223
  *     # Views
  *     clampI = <unsigned int>H.shape[0]
  *     clampJ = <unsigned int>H.shape[1]             # <<<<<<<<<<<<<<
@@ -1861,7 +1970,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint
  */
   __pyx_v_clampJ = ((unsigned int)(__pyx_v_H->dimensions[1]));
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":209
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":224
  *     clampI = <unsigned int>H.shape[0]
  *     clampJ = <unsigned int>H.shape[1]
  *     h = <double*>H.data             # <<<<<<<<<<<<<<
@@ -1870,7 +1979,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint
  */
   __pyx_v_h = ((double *)__pyx_v_H->data);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":210
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":225
  *     clampJ = <unsigned int>H.shape[1]
  *     h = <double*>H.data
  *     tvox = <double*>Tvox.data             # <<<<<<<<<<<<<<
@@ -1879,18 +1988,484 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint
  */
   __pyx_v_tvox = ((double *)__pyx_v_Tvox->data);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":213
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":228
  * 
  *     # Compute joint histogram
- *     joint_histogram(h, clampI, clampJ, iterI, imJ, tvox, affine, interp)             # <<<<<<<<<<<<<<
+ *     size = iterI.base.size             # <<<<<<<<<<<<<<
+ *     nchunks = (size + JOINT_HISTOGRAM_CHUNK - 1) / JOINT_HISTOGRAM_CHUNK
+ *     if n_threads > nchunks:
+ */
+  __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_iterI), __pyx_n_s__base); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 228; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__size); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 228; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyInt_AsLong(__pyx_t_2); if (unlikely((__pyx_t_3 == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 228; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_size = __pyx_t_3;
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":229
+ *     # Compute joint histogram
+ *     size = iterI.base.size
+ *     nchunks = (size + JOINT_HISTOGRAM_CHUNK - 1) / JOINT_HISTOGRAM_CHUNK             # <<<<<<<<<<<<<<
+ *     if n_threads > nchunks:
+ *         n_threads = nchunks
+ */
+  __pyx_t_3 = ((__pyx_v_size + JOINT_HISTOGRAM_CHUNK) - 1);
+  if (unlikely(JOINT_HISTOGRAM_CHUNK == 0)) {
+    PyErr_Format(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  else if (sizeof(long) == sizeof(long) && unlikely(JOINT_HISTOGRAM_CHUNK == -1) && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_3))) {
+    PyErr_Format(PyExc_OverflowError, "value too large to perform division");
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_v_nchunks = __Pyx_div_long(__pyx_t_3, JOINT_HISTOGRAM_CHUNK);
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":230
+ *     size = iterI.base.size
+ *     nchunks = (size + JOINT_HISTOGRAM_CHUNK - 1) / JOINT_HISTOGRAM_CHUNK
+ *     if n_threads > nchunks:             # <<<<<<<<<<<<<<
+ *         n_threads = nchunks
+ *     if n_threads <= 1:
+ */
+  __pyx_t_4 = (__pyx_v_n_threads > __pyx_v_nchunks);
+  if (__pyx_t_4) {
+
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":231
+ *     nchunks = (size + JOINT_HISTOGRAM_CHUNK - 1) / JOINT_HISTOGRAM_CHUNK
+ *     if n_threads > nchunks:
+ *         n_threads = nchunks             # <<<<<<<<<<<<<<
+ *     if n_threads <= 1:
+ *         joint_histogram(h, clampI, clampJ, iterI, imJ, tvox, affine, interp)
+ */
+    __pyx_v_n_threads = __pyx_v_nchunks;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":232
+ *     if n_threads > nchunks:
+ *         n_threads = nchunks
+ *     if n_threads <= 1:             # <<<<<<<<<<<<<<
+ *         joint_histogram(h, clampI, clampJ, iterI, imJ, tvox, affine, interp)
+ *         return
+ */
+  __pyx_t_4 = (__pyx_v_n_threads <= 1);
+  if (__pyx_t_4) {
+
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":233
+ *         n_threads = nchunks
+ *     if n_threads <= 1:
+ *         joint_histogram(h, clampI, clampJ, iterI, imJ, tvox, affine, interp)             # <<<<<<<<<<<<<<
+ *         return
+ * 
+ */
+    joint_histogram(__pyx_v_h, __pyx_v_clampI, __pyx_v_clampJ, __pyx_v_iterI, __pyx_v_imJ, __pyx_v_tvox, __pyx_v_affine, __pyx_v_interp);
+
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":234
+ *     if n_threads <= 1:
+ *         joint_histogram(h, clampI, clampJ, iterI, imJ, tvox, affine, interp)
+ *         return             # <<<<<<<<<<<<<<
  * 
+ *     # Threaded computation of partial histograms
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":237
+ * 
+ *     # Threaded computation of partial histograms
+ *     bounds = [min(size, JOINT_HISTOGRAM_CHUNK * (nchunks * i / n_threads))             # <<<<<<<<<<<<<<
+ *               for i in range(n_threads + 1)]
+ *     Hs = np.zeros([n_threads, clampI, clampJ])
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":238
+ *     # Threaded computation of partial histograms
+ *     bounds = [min(size, JOINT_HISTOGRAM_CHUNK * (nchunks * i / n_threads))
+ *               for i in range(n_threads + 1)]             # <<<<<<<<<<<<<<
+ *     Hs = np.zeros([n_threads, clampI, clampJ])
+ *     threads = []
+ */
+  __pyx_t_1 = PyInt_FromLong((__pyx_v_n_threads + 1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_Call(__pyx_builtin_range, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyList_CheckExact(__pyx_t_1) || PyTuple_CheckExact(__pyx_t_1)) {
+    __pyx_t_5 = 0; __pyx_t_6 = __pyx_t_1; __Pyx_INCREF(__pyx_t_6);
+  } else {
+    __pyx_t_5 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_6))) {
+      if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_6)) break;
+      __pyx_t_1 = PyList_GET_ITEM(__pyx_t_6, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_6))) {
+      if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_6)) break;
+      __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++;
+    } else {
+      __pyx_t_1 = PyIter_Next(__pyx_t_6);
+      if (!__pyx_t_1) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_DECREF(__pyx_v_i);
+    __pyx_v_i = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":237
+ * 
+ *     # Threaded computation of partial histograms
+ *     bounds = [min(size, JOINT_HISTOGRAM_CHUNK * (nchunks * i / n_threads))             # <<<<<<<<<<<<<<
+ *               for i in range(n_threads + 1)]
+ *     Hs = np.zeros([n_threads, clampI, clampJ])
+ */
+    __pyx_t_1 = PyInt_FromLong(__pyx_v_size); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_7 = PyInt_FromLong(JOINT_HISTOGRAM_CHUNK); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = PyInt_FromLong(__pyx_v_nchunks); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = PyNumber_Multiply(__pyx_t_8, __pyx_v_i); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = PyInt_FromLong(__pyx_v_n_threads); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_10 = __Pyx_PyNumber_Divide(__pyx_t_9, __pyx_t_8); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = PyNumber_Multiply(__pyx_t_7, __pyx_t_10); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_10 = PyTuple_New(2); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+    PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_8);
+    __pyx_t_1 = 0;
+    __pyx_t_8 = 0;
+    __pyx_t_8 = PyObject_Call(__pyx_builtin_min, __pyx_t_10, NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_11 = PyList_Append(__pyx_t_2, (PyObject*)__pyx_t_8); if (unlikely(__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_INCREF(((PyObject *)__pyx_t_2));
+  __Pyx_DECREF(__pyx_v_bounds);
+  __pyx_v_bounds = ((PyObject *)__pyx_t_2);
+  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":239
+ *     bounds = [min(size, JOINT_HISTOGRAM_CHUNK * (nchunks * i / n_threads))
+ *               for i in range(n_threads + 1)]
+ *     Hs = np.zeros([n_threads, clampI, clampJ])             # <<<<<<<<<<<<<<
+ *     threads = []
+ *     for i in range(n_threads):
+ */
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__zeros); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyInt_FromLong(__pyx_v_n_threads); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_8 = PyLong_FromUnsignedLong(__pyx_v_clampI); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_10 = PyLong_FromUnsignedLong(__pyx_v_clampJ); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_1 = PyList_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_8);
+  PyList_SET_ITEM(__pyx_t_1, 2, __pyx_t_10);
+  __Pyx_GIVEREF(__pyx_t_10);
+  __pyx_t_2 = 0;
+  __pyx_t_8 = 0;
+  __pyx_t_10 = 0;
+  __pyx_t_10 = PyTuple_New(1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_10);
+  PyTuple_SET_ITEM(__pyx_t_10, 0, ((PyObject *)__pyx_t_1));
+  __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_Call(__pyx_t_6, __pyx_t_10, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  __Pyx_DECREF(__pyx_v_Hs);
+  __pyx_v_Hs = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":240
+ *               for i in range(n_threads + 1)]
+ *     Hs = np.zeros([n_threads, clampI, clampJ])
+ *     threads = []             # <<<<<<<<<<<<<<
+ *     for i in range(n_threads):
+ *         thread = threading.Thread(
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+  __Pyx_DECREF(__pyx_v_threads);
+  __pyx_v_threads = ((PyObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":241
+ *     Hs = np.zeros([n_threads, clampI, clampJ])
+ *     threads = []
+ *     for i in range(n_threads):             # <<<<<<<<<<<<<<
+ *         thread = threading.Thread(
+ *             target=_joint_histogram_range,
+ */
+  __pyx_t_1 = PyInt_FromLong(__pyx_v_n_threads); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_10 = PyTuple_New(1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_10);
+  PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_Call(__pyx_builtin_range, __pyx_t_10, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  if (PyList_CheckExact(__pyx_t_1) || PyTuple_CheckExact(__pyx_t_1)) {
+    __pyx_t_5 = 0; __pyx_t_10 = __pyx_t_1; __Pyx_INCREF(__pyx_t_10);
+  } else {
+    __pyx_t_5 = -1; __pyx_t_10 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_10))) {
+      if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_10)) break;
+      __pyx_t_1 = PyList_GET_ITEM(__pyx_t_10, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_10))) {
+      if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_10)) break;
+      __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_10, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++;
+    } else {
+      __pyx_t_1 = PyIter_Next(__pyx_t_10);
+      if (!__pyx_t_1) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_DECREF(__pyx_v_i);
+    __pyx_v_i = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":242
+ *     threads = []
+ *     for i in range(n_threads):
+ *         thread = threading.Thread(             # <<<<<<<<<<<<<<
+ *             target=_joint_histogram_range,
+ *             args=(Hs[i], iterI.base, imJ, Tvox, affine, interp,
+ */
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__threading); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_6 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__Thread); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(((PyObject *)__pyx_t_1));
+
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":243
+ *     for i in range(n_threads):
+ *         thread = threading.Thread(
+ *             target=_joint_histogram_range,             # <<<<<<<<<<<<<<
+ *             args=(Hs[i], iterI.base, imJ, Tvox, affine, interp,
+ *                   bounds[i], bounds[i+1]))
+ */
+    __pyx_t_8 = __Pyx_GetName(__pyx_m, __pyx_n_s_1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 243; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_8);
+    if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__target), __pyx_t_8) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":244
+ *         thread = threading.Thread(
+ *             target=_joint_histogram_range,
+ *             args=(Hs[i], iterI.base, imJ, Tvox, affine, interp,             # <<<<<<<<<<<<<<
+ *                   bounds[i], bounds[i+1]))
+ *         thread.start()
+ */
+    __pyx_t_8 = PyObject_GetItem(__pyx_v_Hs, __pyx_v_i); if (!__pyx_t_8) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_iterI), __pyx_n_s__base); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_7 = PyInt_FromLong(__pyx_v_affine); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_9 = PyInt_FromLong(__pyx_v_interp); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_9);
+
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":245
+ *             target=_joint_histogram_range,
+ *             args=(Hs[i], iterI.base, imJ, Tvox, affine, interp,
+ *                   bounds[i], bounds[i+1]))             # <<<<<<<<<<<<<<
+ *         thread.start()
+ *         threads.append(thread)
+ */
+    __pyx_t_12 = PyObject_GetItem(__pyx_v_bounds, __pyx_v_i); if (!__pyx_t_12) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_12);
+    __pyx_t_13 = PyNumber_Add(__pyx_v_i, __pyx_int_1); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_14 = PyObject_GetItem(__pyx_v_bounds, __pyx_t_13); if (!__pyx_t_14) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_t_13 = PyTuple_New(8); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_13);
+    PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_8);
+    PyTuple_SET_ITEM(__pyx_t_13, 1, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_2);
+    __Pyx_INCREF(((PyObject *)__pyx_v_imJ));
+    PyTuple_SET_ITEM(__pyx_t_13, 2, ((PyObject *)__pyx_v_imJ));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_imJ));
+    __Pyx_INCREF(((PyObject *)__pyx_v_Tvox));
+    PyTuple_SET_ITEM(__pyx_t_13, 3, ((PyObject *)__pyx_v_Tvox));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_Tvox));
+    PyTuple_SET_ITEM(__pyx_t_13, 4, __pyx_t_7);
+    __Pyx_GIVEREF(__pyx_t_7);
+    PyTuple_SET_ITEM(__pyx_t_13, 5, __pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_13, 6, __pyx_t_12);
+    __Pyx_GIVEREF(__pyx_t_12);
+    PyTuple_SET_ITEM(__pyx_t_13, 7, __pyx_t_14);
+    __Pyx_GIVEREF(__pyx_t_14);
+    __pyx_t_8 = 0;
+    __pyx_t_2 = 0;
+    __pyx_t_7 = 0;
+    __pyx_t_9 = 0;
+    __pyx_t_12 = 0;
+    __pyx_t_14 = 0;
+    if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__args), __pyx_t_13) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_t_13 = PyEval_CallObjectWithKeywords(__pyx_t_6, ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_1)); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_v_thread);
+    __pyx_v_thread = __pyx_t_13;
+    __pyx_t_13 = 0;
+
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":246
+ *             args=(Hs[i], iterI.base, imJ, Tvox, affine, interp,
+ *                   bounds[i], bounds[i+1]))
+ *         thread.start()             # <<<<<<<<<<<<<<
+ *         threads.append(thread)
+ *     for thread in threads:
+ */
+    __pyx_t_13 = PyObject_GetAttr(__pyx_v_thread, __pyx_n_s__start); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_1 = PyObject_Call(__pyx_t_13, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":247
+ *                   bounds[i], bounds[i+1]))
+ *         thread.start()
+ *         threads.append(thread)             # <<<<<<<<<<<<<<
+ *     for thread in threads:
+ *         thread.join()
+ */
+    __pyx_t_1 = __Pyx_PyObject_Append(__pyx_v_threads, __pyx_v_thread); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":248
+ *         thread.start()
+ *         threads.append(thread)
+ *     for thread in threads:             # <<<<<<<<<<<<<<
+ *         thread.join()
+ *     H[:] = Hs.sum(0)
+ */
+  if (PyList_CheckExact(__pyx_v_threads) || PyTuple_CheckExact(__pyx_v_threads)) {
+    __pyx_t_5 = 0; __pyx_t_10 = __pyx_v_threads; __Pyx_INCREF(__pyx_t_10);
+  } else {
+    __pyx_t_5 = -1; __pyx_t_10 = PyObject_GetIter(__pyx_v_threads); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_10);
+  }
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_10))) {
+      if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_10)) break;
+      __pyx_t_1 = PyList_GET_ITEM(__pyx_t_10, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_10))) {
+      if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_10)) break;
+      __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_10, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++;
+    } else {
+      __pyx_t_1 = PyIter_Next(__pyx_t_10);
+      if (!__pyx_t_1) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_DECREF(__pyx_v_thread);
+    __pyx_v_thread = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":249
+ *         threads.append(thread)
+ *     for thread in threads:
+ *         thread.join()             # <<<<<<<<<<<<<<
+ *     H[:] = Hs.sum(0)
  *     return
  */
-  joint_histogram(__pyx_v_h, __pyx_v_clampI, __pyx_v_clampJ, __pyx_v_iterI, __pyx_v_imJ, __pyx_v_tvox, __pyx_v_affine, __pyx_v_interp);
+    __pyx_t_1 = PyObject_GetAttr(__pyx_v_thread, __pyx_n_s__join); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_13 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":215
- *     joint_histogram(h, clampI, clampJ, iterI, imJ, tvox, affine, interp)
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":250
+ *     for thread in threads:
+ *         thread.join()
+ *     H[:] = Hs.sum(0)             # <<<<<<<<<<<<<<
+ *     return
  * 
+ */
+  __pyx_t_10 = PyObject_GetAttr(__pyx_v_Hs, __pyx_n_s__sum); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_13 = PyTuple_New(1); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_INCREF(__pyx_int_0);
+  PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_int_0);
+  __Pyx_GIVEREF(__pyx_int_0);
+  __pyx_t_1 = PyObject_Call(__pyx_t_10, __pyx_t_13, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  if (PySequence_SetSlice(((PyObject *)__pyx_v_H), 0, PY_SSIZE_T_MAX, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":251
+ *         thread.join()
+ *     H[:] = Hs.sum(0)
  *     return             # <<<<<<<<<<<<<<
  * 
  * 
@@ -1902,15 +2477,431 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
   __Pyx_AddTraceback("nipy.neurospin.registration._registration._joint_histogram");
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_bounds);
+  __Pyx_DECREF(__pyx_v_Hs);
+  __Pyx_DECREF(__pyx_v_threads);
+  __Pyx_DECREF(__pyx_v_i);
+  __Pyx_DECREF(__pyx_v_thread);
+  __Pyx_DECREF((PyObject *)__pyx_v_H);
+  __Pyx_DECREF((PyObject *)__pyx_v_iterI);
+  __Pyx_DECREF((PyObject *)__pyx_v_imJ);
+  __Pyx_DECREF((PyObject *)__pyx_v_Tvox);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/nipy/neurospin/registration/_registration.pyx":254
+ * 
+ * 
+ * def _joint_histogram_range(ndarray H, ndarray imI, ndarray imJ, ndarray Tvox,             # <<<<<<<<<<<<<<
+ *                            int affine, int interp, size_t start, size_t stop):
+ *     """
+ */
+
+static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint_histogram_range(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_12registration_13_registration__joint_histogram_range[] = "\n    Add the contributions of source voxels start to stop-1 to H,\n    releasing the GIL. \n    ";
+static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint_histogram_range(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_H = 0;
+  PyArrayObject *__pyx_v_imI = 0;
+  PyArrayObject *__pyx_v_imJ = 0;
+  PyArrayObject *__pyx_v_Tvox = 0;
+  int __pyx_v_affine;
+  int __pyx_v_interp;
+  size_t __pyx_v_start;
+  size_t __pyx_v_stop;
+  double *__pyx_v_h;
+  double *__pyx_v_tvox;
+  void *__pyx_v_i;
+  void *__pyx_v_j;
+  unsigned int __pyx_v_clampI;
+  unsigned int __pyx_v_clampJ;
+  size_t __pyx_v_chunk;
+  PyObject *__pyx_r = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__H,&__pyx_n_s__imI,&__pyx_n_s__imJ,&__pyx_n_s__Tvox,&__pyx_n_s__affine,&__pyx_n_s__interp,&__pyx_n_s__start,&__pyx_n_s__stop,0};
+  __Pyx_RefNannySetupContext("_joint_histogram_range");
+  __pyx_self = __pyx_self;
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__H);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__imI);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram_range", 1, 8, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  2:
+      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__imJ);
+      if (likely(values[2])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram_range", 1, 8, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  3:
+      values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Tvox);
+      if (likely(values[3])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram_range", 1, 8, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  4:
+      values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__affine);
+      if (likely(values[4])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram_range", 1, 8, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  5:
+      values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__interp);
+      if (likely(values[5])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram_range", 1, 8, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  6:
+      values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__start);
+      if (likely(values[6])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram_range", 1, 8, 8, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  7:
+      values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__stop);
+      if (likely(values[7])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram_range", 1, 8, 8, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_joint_histogram_range") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_H = ((PyArrayObject *)values[0]);
+    __pyx_v_imI = ((PyArrayObject *)values[1]);
+    __pyx_v_imJ = ((PyArrayObject *)values[2]);
+    __pyx_v_Tvox = ((PyArrayObject *)values[3]);
+    __pyx_v_affine = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_affine == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_interp = __Pyx_PyInt_AsInt(values[5]); if (unlikely((__pyx_v_interp == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_start = __Pyx_PyInt_AsSize_t(values[6]); if (unlikely((__pyx_v_start == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stop = __Pyx_PyInt_AsSize_t(values[7]); if (unlikely((__pyx_v_stop == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 8) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_H = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
+    __pyx_v_imI = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
+    __pyx_v_imJ = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 2));
+    __pyx_v_Tvox = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 3));
+    __pyx_v_affine = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_affine == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_interp = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely((__pyx_v_interp == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_start = __Pyx_PyInt_AsSize_t(PyTuple_GET_ITEM(__pyx_args, 6)); if (unlikely((__pyx_v_start == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stop = __Pyx_PyInt_AsSize_t(PyTuple_GET_ITEM(__pyx_args, 7)); if (unlikely((__pyx_v_stop == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_joint_histogram_range", 1, 8, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nipy.neurospin.registration._registration._joint_histogram_range");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF((PyObject *)__pyx_v_H);
+  __Pyx_INCREF((PyObject *)__pyx_v_imI);
+  __Pyx_INCREF((PyObject *)__pyx_v_imJ);
+  __Pyx_INCREF((PyObject *)__pyx_v_Tvox);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_H), __pyx_ptype_5numpy_ndarray, 1, "H", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_imI), __pyx_ptype_5numpy_ndarray, 1, "imI", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_imJ), __pyx_ptype_5numpy_ndarray, 1, "imJ", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Tvox), __pyx_ptype_5numpy_ndarray, 1, "Tvox", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":260
+ *     releasing the GIL.
+ *     """
+ *     cdef double *h = <double*>H.data             # <<<<<<<<<<<<<<
+ *     cdef double *tvox = <double*>Tvox.data
+ *     cdef void *i = <void*>imI
+ */
+  __pyx_v_h = ((double *)__pyx_v_H->data);
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":261
+ *     """
+ *     cdef double *h = <double*>H.data
+ *     cdef double *tvox = <double*>Tvox.data             # <<<<<<<<<<<<<<
+ *     cdef void *i = <void*>imI
+ *     cdef void *j = <void*>imJ
+ */
+  __pyx_v_tvox = ((double *)__pyx_v_Tvox->data);
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":262
+ *     cdef double *h = <double*>H.data
+ *     cdef double *tvox = <double*>Tvox.data
+ *     cdef void *i = <void*>imI             # <<<<<<<<<<<<<<
+ *     cdef void *j = <void*>imJ
+ *     cdef unsigned int clampI = <unsigned int>H.shape[0]
+ */
+  __pyx_v_i = ((void *)__pyx_v_imI);
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":263
+ *     cdef double *tvox = <double*>Tvox.data
+ *     cdef void *i = <void*>imI
+ *     cdef void *j = <void*>imJ             # <<<<<<<<<<<<<<
+ *     cdef unsigned int clampI = <unsigned int>H.shape[0]
+ *     cdef unsigned int clampJ = <unsigned int>H.shape[1]
+ */
+  __pyx_v_j = ((void *)__pyx_v_imJ);
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":264
+ *     cdef void *i = <void*>imI
+ *     cdef void *j = <void*>imJ
+ *     cdef unsigned int clampI = <unsigned int>H.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef unsigned int clampJ = <unsigned int>H.shape[1]
+ *     cdef size_t chunk = JOINT_HISTOGRAM_CHUNK
+ */
+  __pyx_v_clampI = ((unsigned int)(__pyx_v_H->dimensions[0]));
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":265
+ *     cdef void *j = <void*>imJ
+ *     cdef unsigned int clampI = <unsigned int>H.shape[0]
+ *     cdef unsigned int clampJ = <unsigned int>H.shape[1]             # <<<<<<<<<<<<<<
+ *     cdef size_t chunk = JOINT_HISTOGRAM_CHUNK
+ *     with nogil:
+ */
+  __pyx_v_clampJ = ((unsigned int)(__pyx_v_H->dimensions[1]));
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":266
+ *     cdef unsigned int clampI = <unsigned int>H.shape[0]
+ *     cdef unsigned int clampJ = <unsigned int>H.shape[1]
+ *     cdef size_t chunk = JOINT_HISTOGRAM_CHUNK             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         joint_histogram_range(h, clampI, clampJ, i, start, stop, j, tvox,
+ */
+  __pyx_v_chunk = JOINT_HISTOGRAM_CHUNK;
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":267
+ *     cdef unsigned int clampJ = <unsigned int>H.shape[1]
+ *     cdef size_t chunk = JOINT_HISTOGRAM_CHUNK
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         joint_histogram_range(h, clampI, clampJ, i, start, stop, j, tvox,
+ *                               affine, interp, chunk)
+ */
+  { PyThreadState *_save;
+    Py_UNBLOCK_THREADS
+    /*try:*/ {
+
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":269
+ *     with nogil:
+ *         joint_histogram_range(h, clampI, clampJ, i, start, stop, j, tvox,
+ *                               affine, interp, chunk)             # <<<<<<<<<<<<<<
+ *     return
+ * 
+ */
+      joint_histogram_range(__pyx_v_h, __pyx_v_clampI, __pyx_v_clampJ, __pyx_v_i, __pyx_v_start, __pyx_v_stop, __pyx_v_j, __pyx_v_tvox, __pyx_v_affine, __pyx_v_interp, __pyx_v_chunk);
+    }
+    /*finally:*/ {
+
+      /* "/root/package/nipy/neurospin/registration/_registration.pyx":267
+ *     cdef unsigned int clampJ = <unsigned int>H.shape[1]
+ *     cdef size_t chunk = JOINT_HISTOGRAM_CHUNK
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         joint_histogram_range(h, clampI, clampJ, i, start, stop, j, tvox,
+ *                               affine, interp, chunk)
+ */
+      Py_BLOCK_THREADS
+    }
+  }
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":270
+ *         joint_histogram_range(h, clampI, clampJ, i, start, stop, j, tvox,
+ *                               affine, interp, chunk)
+ *     return             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nipy.neurospin.registration._registration._joint_histogram_range");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_v_H);
+  __Pyx_DECREF((PyObject *)__pyx_v_imI);
+  __Pyx_DECREF((PyObject *)__pyx_v_imJ);
+  __Pyx_DECREF((PyObject *)__pyx_v_Tvox);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":218
+/* "/root/package/nipy/neurospin/registration/_registration.pyx":273
+ * 
+ * 
+ * def _joint_histogram_gradient(ndarray G, ndarray dH, flatiter iterI, ndarray imJ,             # <<<<<<<<<<<<<<
+ *                               ndarray Tvox):
+ *     """
+ */
+
+static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint_histogram_gradient(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4nipy_9neurospin_12registration_13_registration__joint_histogram_gradient[] = "\n    _joint_histogram_gradient(G, dH, iterI, imJ, Tvox)\n\n    Store in the 12-sized array G the derivatives with respect to the\n    affine voxel transformation Tvox of a function of the partial\n    volume joint histogram, given its derivatives dH with respect to\n    the histogram entries.\n    ";
+static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint_histogram_gradient(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_G = 0;
+  PyArrayObject *__pyx_v_dH = 0;
+  PyArrayIterObject *__pyx_v_iterI = 0;
+  PyArrayObject *__pyx_v_imJ = 0;
+  PyArrayObject *__pyx_v_Tvox = 0;
+  unsigned int __pyx_v_clampI;
+  unsigned int __pyx_v_clampJ;
+  PyObject *__pyx_r = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__G,&__pyx_n_s__dH,&__pyx_n_s__iterI,&__pyx_n_s__imJ,&__pyx_n_s__Tvox,0};
+  __Pyx_RefNannySetupContext("_joint_histogram_gradient");
+  __pyx_self = __pyx_self;
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[5] = {0,0,0,0,0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__G);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__dH);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram_gradient", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  2:
+      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__iterI);
+      if (likely(values[2])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram_gradient", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  3:
+      values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__imJ);
+      if (likely(values[3])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram_gradient", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  4:
+      values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Tvox);
+      if (likely(values[4])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_joint_histogram_gradient", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_joint_histogram_gradient") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_G = ((PyArrayObject *)values[0]);
+    __pyx_v_dH = ((PyArrayObject *)values[1]);
+    __pyx_v_iterI = ((PyArrayIterObject *)values[2]);
+    __pyx_v_imJ = ((PyArrayObject *)values[3]);
+    __pyx_v_Tvox = ((PyArrayObject *)values[4]);
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_G = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
+    __pyx_v_dH = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
+    __pyx_v_iterI = ((PyArrayIterObject *)PyTuple_GET_ITEM(__pyx_args, 2));
+    __pyx_v_imJ = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 3));
+    __pyx_v_Tvox = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 4));
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_joint_histogram_gradient", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nipy.neurospin.registration._registration._joint_histogram_gradient");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_G), __pyx_ptype_5numpy_ndarray, 1, "G", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_dH), __pyx_ptype_5numpy_ndarray, 1, "dH", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_iterI), __pyx_ptype_5numpy_flatiter, 1, "iterI", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_imJ), __pyx_ptype_5numpy_ndarray, 1, "imJ", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Tvox), __pyx_ptype_5numpy_ndarray, 1, "Tvox", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":283
+ *     the histogram entries.
+ *     """
+ *     cdef unsigned int clampI = <unsigned int>dH.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef unsigned int clampJ = <unsigned int>dH.shape[1]
+ *     joint_histogram_gradient(<double*>G.data, <double*>dH.data, clampI, clampJ,
+ */
+  __pyx_v_clampI = ((unsigned int)(__pyx_v_dH->dimensions[0]));
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":284
+ *     """
+ *     cdef unsigned int clampI = <unsigned int>dH.shape[0]
+ *     cdef unsigned int clampJ = <unsigned int>dH.shape[1]             # <<<<<<<<<<<<<<
+ *     joint_histogram_gradient(<double*>G.data, <double*>dH.data, clampI, clampJ,
+ *                              iterI, imJ, <double*>Tvox.data)
+ */
+  __pyx_v_clampJ = ((unsigned int)(__pyx_v_dH->dimensions[1]));
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":286
+ *     cdef unsigned int clampJ = <unsigned int>dH.shape[1]
+ *     joint_histogram_gradient(<double*>G.data, <double*>dH.data, clampI, clampJ,
+ *                              iterI, imJ, <double*>Tvox.data)             # <<<<<<<<<<<<<<
+ *     return
+ * 
+ */
+  joint_histogram_gradient(((double *)__pyx_v_G->data), ((double *)__pyx_v_dH->data), __pyx_v_clampI, __pyx_v_clampJ, __pyx_v_iterI, __pyx_v_imJ, ((double *)__pyx_v_Tvox->data));
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":287
+ *     joint_histogram_gradient(<double*>G.data, <double*>dH.data, clampI, clampJ,
+ *                              iterI, imJ, <double*>Tvox.data)
+ *     return             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nipy.neurospin.registration._registration._joint_histogram_gradient");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/nipy/neurospin/registration/_registration.pyx":290
  * 
  * 
  * cdef cc2llr(double x, double n):             # <<<<<<<<<<<<<<
@@ -1925,7 +2916,7 @@ static  PyObject *__pyx_f_4nipy_9neurospin_12registration_13_registration_cc2llr
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("cc2llr");
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":219
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":291
  * 
  * cdef cc2llr(double x, double n):
  *     cdef double y = 1-x             # <<<<<<<<<<<<<<
@@ -1934,7 +2925,7 @@ static  PyObject *__pyx_f_4nipy_9neurospin_12registration_13_registration_cc2llr
  */
   __pyx_v_y = (1 - __pyx_v_x);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":220
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":292
  * cdef cc2llr(double x, double n):
  *     cdef double y = 1-x
  *     if y < 0.0:             # <<<<<<<<<<<<<<
@@ -1944,7 +2935,7 @@ static  PyObject *__pyx_f_4nipy_9neurospin_12registration_13_registration_cc2llr
   __pyx_t_1 = (__pyx_v_y < 0.0);
   if (__pyx_t_1) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":221
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":293
  *     cdef double y = 1-x
  *     if y < 0.0:
  *         y = 0.0             # <<<<<<<<<<<<<<
@@ -1956,7 +2947,7 @@ static  PyObject *__pyx_f_4nipy_9neurospin_12registration_13_registration_cc2llr
   }
   __pyx_L3:;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":222
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":294
  *     if y < 0.0:
  *         y = 0.0
  *     return -.5 * n * log(y)             # <<<<<<<<<<<<<<
@@ -1964,7 +2955,7 @@ static  PyObject *__pyx_f_4nipy_9neurospin_12registration_13_registration_cc2llr
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyFloat_FromDouble((((-0.5) * __pyx_v_n) * log(__pyx_v_y))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 222; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyFloat_FromDouble((((-0.5) * __pyx_v_n) * log(__pyx_v_y))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -1982,7 +2973,7 @@ static  PyObject *__pyx_f_4nipy_9neurospin_12registration_13_registration_cc2llr
   return __pyx_r;
 }
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":225
+/* "/root/package/nipy/neurospin/registration/_registration.pyx":297
  * 
  * 
  * def _similarity(ndarray H, ndarray HI, ndarray HJ, int simitype,             # <<<<<<<<<<<<<<
@@ -2018,7 +3009,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_self = __pyx_self;
   if (unlikely(__pyx_kwds)) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":226
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":298
  * 
  * def _similarity(ndarray H, ndarray HI, ndarray HJ, int simitype,
  *                 ndarray F=None, method=None):             # <<<<<<<<<<<<<<
@@ -2048,19 +3039,19 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__HI);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("_similarity", 0, 4, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_similarity", 0, 4, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__HJ);
       if (likely(values[2])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("_similarity", 0, 4, 6, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_similarity", 0, 4, 6, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  3:
       values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__simitype);
       if (likely(values[3])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("_similarity", 0, 4, 6, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("_similarity", 0, 4, 6, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  4:
       if (kw_args > 0) {
@@ -2074,12 +3065,12 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_similarity") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_similarity") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_H = ((PyArrayObject *)values[0]);
     __pyx_v_HI = ((PyArrayObject *)values[1]);
     __pyx_v_HJ = ((PyArrayObject *)values[2]);
-    __pyx_v_simitype = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_simitype == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_simitype = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_simitype == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     __pyx_v_F = ((PyArrayObject *)values[4]);
     __pyx_v_method = values[5];
   } else {
@@ -2091,7 +3082,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
       case  5:
       __pyx_v_F = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 4));
       case  4:
-      __pyx_v_simitype = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_simitype == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_simitype = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_simitype == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       __pyx_v_HJ = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 2));
       __pyx_v_HI = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
       __pyx_v_H = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
@@ -2101,7 +3092,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("_similarity", 0, 4, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("_similarity", 0, 4, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nipy.neurospin.registration._registration._similarity");
   return NULL;
@@ -2111,12 +3102,12 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __Pyx_INCREF((PyObject *)__pyx_v_HJ);
   __Pyx_INCREF((PyObject *)__pyx_v_F);
   __Pyx_INCREF(__pyx_v_method);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_H), __pyx_ptype_5numpy_ndarray, 1, "H", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_HI), __pyx_ptype_5numpy_ndarray, 1, "HI", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_HJ), __pyx_ptype_5numpy_ndarray, 1, "HJ", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_F), __pyx_ptype_5numpy_ndarray, 1, "F", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_H), __pyx_ptype_5numpy_ndarray, 1, "H", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_HI), __pyx_ptype_5numpy_ndarray, 1, "HI", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_HJ), __pyx_ptype_5numpy_ndarray, 1, "HJ", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_F), __pyx_ptype_5numpy_ndarray, 1, "F", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":231
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":303
  *     Comments to follow
  *     """
  *     cdef int isF = 0             # <<<<<<<<<<<<<<
@@ -2125,7 +3116,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
   __pyx_v_isF = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":232
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":304
  *     """
  *     cdef int isF = 0
  *     cdef double *h, *hI, *hJ, *f=NULL             # <<<<<<<<<<<<<<
@@ -2134,7 +3125,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
   __pyx_v_f = NULL;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":233
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":305
  *     cdef int isF = 0
  *     cdef double *h, *hI, *hJ, *f=NULL
  *     cdef double simi=0.0, n             # <<<<<<<<<<<<<<
@@ -2143,7 +3134,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
   __pyx_v_simi = 0.0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":237
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":309
  * 
  *     # Array views
  *     clampI = <unsigned int>H.shape[0]             # <<<<<<<<<<<<<<
@@ -2152,7 +3143,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
   __pyx_v_clampI = ((unsigned int)(__pyx_v_H->dimensions[0]));
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":238
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":310
  *     # Array views
  *     clampI = <unsigned int>H.shape[0]
  *     clampJ = <unsigned int>H.shape[1]             # <<<<<<<<<<<<<<
@@ -2161,7 +3152,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
   __pyx_v_clampJ = ((unsigned int)(__pyx_v_H->dimensions[1]));
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":239
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":311
  *     clampI = <unsigned int>H.shape[0]
  *     clampJ = <unsigned int>H.shape[1]
  *     h = <double*>H.data             # <<<<<<<<<<<<<<
@@ -2170,7 +3161,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
   __pyx_v_h = ((double *)__pyx_v_H->data);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":240
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":312
  *     clampJ = <unsigned int>H.shape[1]
  *     h = <double*>H.data
  *     hI = <double*>HI.data             # <<<<<<<<<<<<<<
@@ -2179,7 +3170,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
   __pyx_v_hI = ((double *)__pyx_v_HI->data);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":241
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":313
  *     h = <double*>H.data
  *     hI = <double*>HI.data
  *     hJ = <double*>HJ.data             # <<<<<<<<<<<<<<
@@ -2188,20 +3179,20 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
   __pyx_v_hJ = ((double *)__pyx_v_HJ->data);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":242
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":314
  *     hI = <double*>HI.data
  *     hJ = <double*>HJ.data
  *     if F != None:             # <<<<<<<<<<<<<<
  *         f = <double*>F.data
  *         isF = 1
  */
-  __pyx_t_1 = PyObject_RichCompare(((PyObject *)__pyx_v_F), Py_None, Py_NE); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_RichCompare(((PyObject *)__pyx_v_F), Py_None, Py_NE); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":243
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":315
  *     hJ = <double*>HJ.data
  *     if F != None:
  *         f = <double*>F.data             # <<<<<<<<<<<<<<
@@ -2210,7 +3201,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
     __pyx_v_f = ((double *)__pyx_v_F->data);
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":244
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":316
  *     if F != None:
  *         f = <double*>F.data
  *         isF = 1             # <<<<<<<<<<<<<<
@@ -2222,7 +3213,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   }
   __pyx_L6:;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":247
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":319
  * 
  *     # Switch
  *     if simitype == CORRELATION_COEFFICIENT:             # <<<<<<<<<<<<<<
@@ -2232,7 +3223,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_t_2 = (__pyx_v_simitype == __pyx_e_4nipy_9neurospin_12registration_13_registration_CORRELATION_COEFFICIENT);
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":248
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":320
  *     # Switch
  *     if simitype == CORRELATION_COEFFICIENT:
  *         simi = correlation_coefficient(h, clampI, clampJ, &n)             # <<<<<<<<<<<<<<
@@ -2243,7 +3234,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
     goto __pyx_L7;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":249
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":321
  *     if simitype == CORRELATION_COEFFICIENT:
  *         simi = correlation_coefficient(h, clampI, clampJ, &n)
  *     elif simitype == CORRELATION_RATIO:             # <<<<<<<<<<<<<<
@@ -2253,7 +3244,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_t_2 = (__pyx_v_simitype == __pyx_e_4nipy_9neurospin_12registration_13_registration_CORRELATION_RATIO);
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":250
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":322
  *         simi = correlation_coefficient(h, clampI, clampJ, &n)
  *     elif simitype == CORRELATION_RATIO:
  *         simi = correlation_ratio(h, clampI, clampJ, &n)             # <<<<<<<<<<<<<<
@@ -2264,7 +3255,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
     goto __pyx_L7;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":251
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":323
  *     elif simitype == CORRELATION_RATIO:
  *         simi = correlation_ratio(h, clampI, clampJ, &n)
  *     elif simitype == CORRELATION_RATIO_L1:             # <<<<<<<<<<<<<<
@@ -2274,7 +3265,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_t_2 = (__pyx_v_simitype == __pyx_e_4nipy_9neurospin_12registration_13_registration_CORRELATION_RATIO_L1);
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":252
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":324
  *         simi = correlation_ratio(h, clampI, clampJ, &n)
  *     elif simitype == CORRELATION_RATIO_L1:
  *         simi = correlation_ratio_L1(h, hI, clampI, clampJ, &n)             # <<<<<<<<<<<<<<
@@ -2285,7 +3276,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
     goto __pyx_L7;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":253
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":325
  *     elif simitype == CORRELATION_RATIO_L1:
  *         simi = correlation_ratio_L1(h, hI, clampI, clampJ, &n)
  *     elif simitype == MUTUAL_INFORMATION:             # <<<<<<<<<<<<<<
@@ -2295,7 +3286,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_t_2 = (__pyx_v_simitype == __pyx_e_4nipy_9neurospin_12registration_13_registration_MUTUAL_INFORMATION);
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":254
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":326
  *         simi = correlation_ratio_L1(h, hI, clampI, clampJ, &n)
  *     elif simitype == MUTUAL_INFORMATION:
  *         simi = mutual_information(h, hI, clampI, hJ, clampJ, &n)             # <<<<<<<<<<<<<<
@@ -2306,7 +3297,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
     goto __pyx_L7;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":255
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":327
  *     elif simitype == MUTUAL_INFORMATION:
  *         simi = mutual_information(h, hI, clampI, hJ, clampJ, &n)
  *     elif simitype == JOINT_ENTROPY:             # <<<<<<<<<<<<<<
@@ -2316,7 +3307,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_t_2 = (__pyx_v_simitype == __pyx_e_4nipy_9neurospin_12registration_13_registration_JOINT_ENTROPY);
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":256
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":328
  *         simi = mutual_information(h, hI, clampI, hJ, clampJ, &n)
  *     elif simitype == JOINT_ENTROPY:
  *         simi = joint_entropy(h, clampI, clampJ)             # <<<<<<<<<<<<<<
@@ -2327,7 +3318,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
     goto __pyx_L7;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":257
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":329
  *     elif simitype == JOINT_ENTROPY:
  *         simi = joint_entropy(h, clampI, clampJ)
  *     elif simitype == CONDITIONAL_ENTROPY:             # <<<<<<<<<<<<<<
@@ -2337,7 +3328,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_t_2 = (__pyx_v_simitype == __pyx_e_4nipy_9neurospin_12registration_13_registration_CONDITIONAL_ENTROPY);
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":258
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":330
  *         simi = joint_entropy(h, clampI, clampJ)
  *     elif simitype == CONDITIONAL_ENTROPY:
  *         simi = conditional_entropy(h, hJ, clampI, clampJ)             # <<<<<<<<<<<<<<
@@ -2348,7 +3339,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
     goto __pyx_L7;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":259
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":331
  *     elif simitype == CONDITIONAL_ENTROPY:
  *         simi = conditional_entropy(h, hJ, clampI, clampJ)
  *     elif simitype == NORMALIZED_MUTUAL_INFORMATION:             # <<<<<<<<<<<<<<
@@ -2358,7 +3349,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_t_2 = (__pyx_v_simitype == __pyx_e_4nipy_9neurospin_12registration_13_registration_NORMALIZED_MUTUAL_INFORMATION);
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":260
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":332
  *         simi = conditional_entropy(h, hJ, clampI, clampJ)
  *     elif simitype == NORMALIZED_MUTUAL_INFORMATION:
  *         simi = normalized_mutual_information(h, hI, clampI, hJ, clampJ, &n)             # <<<<<<<<<<<<<<
@@ -2369,7 +3360,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
     goto __pyx_L7;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":261
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":333
  *     elif simitype == NORMALIZED_MUTUAL_INFORMATION:
  *         simi = normalized_mutual_information(h, hI, clampI, hJ, clampJ, &n)
  *     elif simitype == SUPERVISED_MUTUAL_INFORMATION:             # <<<<<<<<<<<<<<
@@ -2379,7 +3370,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_t_2 = (__pyx_v_simitype == __pyx_e_4nipy_9neurospin_12registration_13_registration_SUPERVISED_MUTUAL_INFORMATION);
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":262
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":334
  *         simi = normalized_mutual_information(h, hI, clampI, hJ, clampJ, &n)
  *     elif simitype == SUPERVISED_MUTUAL_INFORMATION:
  *         simi = supervised_mutual_information(h, f, hI, clampI, hJ, clampJ, &n)             # <<<<<<<<<<<<<<
@@ -2390,7 +3381,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
     goto __pyx_L7;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":263
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":335
  *     elif simitype == SUPERVISED_MUTUAL_INFORMATION:
  *         simi = supervised_mutual_information(h, f, hI, clampI, hJ, clampJ, &n)
  *     elif simitype == LLR_CORRELATION_COEFFICIENT:             # <<<<<<<<<<<<<<
@@ -2400,7 +3391,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_t_2 = (__pyx_v_simitype == __pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_CORRELATION_COEFFICIENT);
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":264
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":336
  *         simi = supervised_mutual_information(h, f, hI, clampI, hJ, clampJ, &n)
  *     elif simitype == LLR_CORRELATION_COEFFICIENT:
  *         simi = correlation_coefficient(h, clampI, clampJ, &n)             # <<<<<<<<<<<<<<
@@ -2409,22 +3400,22 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
     __pyx_v_simi = correlation_coefficient(__pyx_v_h, __pyx_v_clampI, __pyx_v_clampJ, (&__pyx_v_n));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":265
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":337
  *     elif simitype == LLR_CORRELATION_COEFFICIENT:
  *         simi = correlation_coefficient(h, clampI, clampJ, &n)
  *         simi = cc2llr(simi, n)             # <<<<<<<<<<<<<<
  *     elif simitype == LLR_CORRELATION_RATIO:
  *         simi = correlation_ratio(h, clampI, clampJ, &n)
  */
-    __pyx_t_1 = __pyx_f_4nipy_9neurospin_12registration_13_registration_cc2llr(__pyx_v_simi, __pyx_v_n); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __pyx_f_4nipy_9neurospin_12registration_13_registration_cc2llr(__pyx_v_simi, __pyx_v_n); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_simi = __pyx_t_3;
     goto __pyx_L7;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":266
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":338
  *         simi = correlation_coefficient(h, clampI, clampJ, &n)
  *         simi = cc2llr(simi, n)
  *     elif simitype == LLR_CORRELATION_RATIO:             # <<<<<<<<<<<<<<
@@ -2434,7 +3425,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_t_2 = (__pyx_v_simitype == __pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_CORRELATION_RATIO);
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":267
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":339
  *         simi = cc2llr(simi, n)
  *     elif simitype == LLR_CORRELATION_RATIO:
  *         simi = correlation_ratio(h, clampI, clampJ, &n)             # <<<<<<<<<<<<<<
@@ -2443,22 +3434,22 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
     __pyx_v_simi = correlation_ratio(__pyx_v_h, __pyx_v_clampI, __pyx_v_clampJ, (&__pyx_v_n));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":268
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":340
  *     elif simitype == LLR_CORRELATION_RATIO:
  *         simi = correlation_ratio(h, clampI, clampJ, &n)
  *         simi = cc2llr(simi, n)             # <<<<<<<<<<<<<<
  *     elif simitype == LLR_CORRELATION_RATIO_L1:
  *         simi = correlation_ratio_L1(h, hI, clampI, clampJ, &n)
  */
-    __pyx_t_1 = __pyx_f_4nipy_9neurospin_12registration_13_registration_cc2llr(__pyx_v_simi, __pyx_v_n); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __pyx_f_4nipy_9neurospin_12registration_13_registration_cc2llr(__pyx_v_simi, __pyx_v_n); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_simi = __pyx_t_3;
     goto __pyx_L7;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":269
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":341
  *         simi = correlation_ratio(h, clampI, clampJ, &n)
  *         simi = cc2llr(simi, n)
  *     elif simitype == LLR_CORRELATION_RATIO_L1:             # <<<<<<<<<<<<<<
@@ -2468,7 +3459,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_t_2 = (__pyx_v_simitype == __pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_CORRELATION_RATIO_L1);
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":270
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":342
  *         simi = cc2llr(simi, n)
  *     elif simitype == LLR_CORRELATION_RATIO_L1:
  *         simi = correlation_ratio_L1(h, hI, clampI, clampJ, &n)             # <<<<<<<<<<<<<<
@@ -2477,22 +3468,22 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
     __pyx_v_simi = correlation_ratio_L1(__pyx_v_h, __pyx_v_hI, __pyx_v_clampI, __pyx_v_clampJ, (&__pyx_v_n));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":271
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":343
  *     elif simitype == LLR_CORRELATION_RATIO_L1:
  *         simi = correlation_ratio_L1(h, hI, clampI, clampJ, &n)
  *         simi = cc2llr(simi, n)             # <<<<<<<<<<<<<<
  *     elif simitype == LLR_MUTUAL_INFORMATION:
  *         simi = mutual_information(h, hI, clampI, hJ, clampJ, &n)
  */
-    __pyx_t_1 = __pyx_f_4nipy_9neurospin_12registration_13_registration_cc2llr(__pyx_v_simi, __pyx_v_n); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 271; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __pyx_f_4nipy_9neurospin_12registration_13_registration_cc2llr(__pyx_v_simi, __pyx_v_n); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 271; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_simi = __pyx_t_3;
     goto __pyx_L7;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":272
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":344
  *         simi = correlation_ratio_L1(h, hI, clampI, clampJ, &n)
  *         simi = cc2llr(simi, n)
  *     elif simitype == LLR_MUTUAL_INFORMATION:             # <<<<<<<<<<<<<<
@@ -2502,7 +3493,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_t_2 = (__pyx_v_simitype == __pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_MUTUAL_INFORMATION);
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":273
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":345
  *         simi = cc2llr(simi, n)
  *     elif simitype == LLR_MUTUAL_INFORMATION:
  *         simi = mutual_information(h, hI, clampI, hJ, clampJ, &n)             # <<<<<<<<<<<<<<
@@ -2511,7 +3502,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
     __pyx_v_simi = mutual_information(__pyx_v_h, __pyx_v_hI, __pyx_v_clampI, __pyx_v_hJ, __pyx_v_clampJ, (&__pyx_v_n));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":274
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":346
  *     elif simitype == LLR_MUTUAL_INFORMATION:
  *         simi = mutual_information(h, hI, clampI, hJ, clampJ, &n)
  *         simi = n*simi             # <<<<<<<<<<<<<<
@@ -2522,7 +3513,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
     goto __pyx_L7;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":275
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":347
  *         simi = mutual_information(h, hI, clampI, hJ, clampJ, &n)
  *         simi = n*simi
  *     elif simitype == LLR_SUPERVISED_MUTUAL_INFORMATION:             # <<<<<<<<<<<<<<
@@ -2532,7 +3523,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   __pyx_t_2 = (__pyx_v_simitype == __pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_SUPERVISED_MUTUAL_INFORMATION);
   if (__pyx_t_2) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":276
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":348
  *         simi = n*simi
  *     elif simitype == LLR_SUPERVISED_MUTUAL_INFORMATION:
  *         simi = supervised_mutual_information(h, f, hI, clampI, hJ, clampJ, &n)             # <<<<<<<<<<<<<<
@@ -2541,7 +3532,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  */
     __pyx_v_simi = supervised_mutual_information(__pyx_v_h, __pyx_v_f, __pyx_v_hI, __pyx_v_clampI, __pyx_v_hJ, __pyx_v_clampJ, (&__pyx_v_n));
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":277
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":349
  *     elif simitype == LLR_SUPERVISED_MUTUAL_INFORMATION:
  *         simi = supervised_mutual_information(h, f, hI, clampI, hJ, clampJ, &n)
  *         simi = n*simi             # <<<<<<<<<<<<<<
@@ -2553,28 +3544,28 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   }
   /*else*/ {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":279
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":351
  *         simi = n*simi
  *     else: # CUSTOM
  *         simi = method(H)             # <<<<<<<<<<<<<<
  * 
  *     return simi
  */
-    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 351; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_INCREF(((PyObject *)__pyx_v_H));
     PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_v_H));
     __Pyx_GIVEREF(((PyObject *)__pyx_v_H));
-    __pyx_t_4 = PyObject_Call(__pyx_v_method, __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyObject_Call(__pyx_v_method, __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 351; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_4); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_4); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 351; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __pyx_v_simi = __pyx_t_3;
   }
   __pyx_L7:;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":281
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":353
  *         simi = method(H)
  * 
  *     return simi             # <<<<<<<<<<<<<<
@@ -2582,7 +3573,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_simi); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_simi); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_r = __pyx_t_4;
   __pyx_t_4 = 0;
@@ -2606,7 +3597,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration__simil
   return __pyx_r;
 }
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":306
+/* "/root/package/nipy/neurospin/registration/_registration.pyx":378
  * 
  * 
  * def rotation_vec2mat(r):             # <<<<<<<<<<<<<<
@@ -2640,80 +3631,80 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
   __pyx_v_R = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_Sr = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":333
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":405
  *     """
  *     cdef double theta, theta2
  *     theta = <double> np.linalg.norm(r)             # <<<<<<<<<<<<<<
  *     if theta > 1e-30:
  *         n = r/theta
  */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__linalg); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__linalg); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__norm); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__norm); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_v_r);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_r);
   __Pyx_GIVEREF(__pyx_v_r);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_theta = ((double)__pyx_t_4);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":334
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":406
  *     cdef double theta, theta2
  *     theta = <double> np.linalg.norm(r)
  *     if theta > 1e-30:             # <<<<<<<<<<<<<<
  *         n = r/theta
  *         Sn = np.array([[0,-n[2],n[1]],[n[2],0,-n[0]],[-n[1],n[0],0]])
  */
-  __pyx_t_5 = (__pyx_v_theta > 1.0000000000000001e-30);
+  __pyx_t_5 = (__pyx_v_theta > 1e-30);
   if (__pyx_t_5) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":335
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":407
  *     theta = <double> np.linalg.norm(r)
  *     if theta > 1e-30:
  *         n = r/theta             # <<<<<<<<<<<<<<
  *         Sn = np.array([[0,-n[2],n[1]],[n[2],0,-n[0]],[-n[1],n[0],0]])
  *         R = np.eye(3) + np.sin(theta)*Sn + (1-np.cos(theta))*np.dot(Sn,Sn)
  */
-    __pyx_t_3 = PyFloat_FromDouble(__pyx_v_theta); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 335; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyFloat_FromDouble(__pyx_v_theta); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_v_r, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 335; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_v_r, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_v_n);
     __pyx_v_n = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":336
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":408
  *     if theta > 1e-30:
  *         n = r/theta
  *         Sn = np.array([[0,-n[2],n[1]],[n[2],0,-n[0]],[-n[1],n[0],0]])             # <<<<<<<<<<<<<<
  *         R = np.eye(3) + np.sin(theta)*Sn + (1-np.cos(theta))*np.dot(Sn,Sn)
  *     else:
  */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__array); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__array); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_n, 2, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_n, 2, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = PyNumber_Negative(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyNumber_Negative(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_n, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_n, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_6 = PyList_New(3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = PyList_New(3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_6));
     __Pyx_INCREF(__pyx_int_0);
     PyList_SET_ITEM(__pyx_t_6, 0, __pyx_int_0);
@@ -2724,14 +3715,14 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
     __Pyx_GIVEREF(__pyx_t_2);
     __pyx_t_1 = 0;
     __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_n, 2, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_n, 2, sizeof(long), PyInt_FromLong); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_n, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_n, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_7 = PyNumber_Negative(__pyx_t_1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = PyNumber_Negative(__pyx_t_1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyList_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyList_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_1));
     PyList_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
     __Pyx_GIVEREF(__pyx_t_2);
@@ -2742,14 +3733,14 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
     __Pyx_GIVEREF(__pyx_t_7);
     __pyx_t_2 = 0;
     __pyx_t_7 = 0;
-    __pyx_t_7 = __Pyx_GetItemInt(__pyx_v_n, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_7) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __Pyx_GetItemInt(__pyx_v_n, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_7) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_2 = PyNumber_Negative(__pyx_t_7); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyNumber_Negative(__pyx_t_7); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = __Pyx_GetItemInt(__pyx_v_n, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_7) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __Pyx_GetItemInt(__pyx_v_n, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_7) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_8 = PyList_New(3); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = PyList_New(3); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_8));
     PyList_SET_ITEM(__pyx_t_8, 0, __pyx_t_2);
     __Pyx_GIVEREF(__pyx_t_2);
@@ -2760,7 +3751,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
     __Pyx_GIVEREF(__pyx_int_0);
     __pyx_t_2 = 0;
     __pyx_t_7 = 0;
-    __pyx_t_7 = PyList_New(3); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = PyList_New(3); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_7));
     PyList_SET_ITEM(__pyx_t_7, 0, ((PyObject *)__pyx_t_6));
     __Pyx_GIVEREF(((PyObject *)__pyx_t_6));
@@ -2771,12 +3762,12 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
     __pyx_t_6 = 0;
     __pyx_t_1 = 0;
     __pyx_t_8 = 0;
-    __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_8);
     PyTuple_SET_ITEM(__pyx_t_8, 0, ((PyObject *)__pyx_t_7));
     __Pyx_GIVEREF(((PyObject *)__pyx_t_7));
     __pyx_t_7 = 0;
-    __pyx_t_7 = PyObject_Call(__pyx_t_3, __pyx_t_8, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = PyObject_Call(__pyx_t_3, __pyx_t_8, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -2784,75 +3775,75 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
     __pyx_v_Sn = __pyx_t_7;
     __pyx_t_7 = 0;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":337
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":409
  *         n = r/theta
  *         Sn = np.array([[0,-n[2],n[1]],[n[2],0,-n[0]],[-n[1],n[0],0]])
  *         R = np.eye(3) + np.sin(theta)*Sn + (1-np.cos(theta))*np.dot(Sn,Sn)             # <<<<<<<<<<<<<<
  *     else:
  *         Sr = np.array([[0,-r[2],r[1]],[r[2],0,-r[0]],[-r[1],r[0],0]])
  */
-    __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_8 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__eye); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__eye); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_8);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_INCREF(__pyx_int_3);
     PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_int_3);
     __Pyx_GIVEREF(__pyx_int_3);
-    __pyx_t_3 = PyObject_Call(__pyx_t_8, __pyx_t_7, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_Call(__pyx_t_8, __pyx_t_7, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_8 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__sin); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = PyObject_GetAttr(__pyx_t_7, __pyx_n_s__sin); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_8);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = PyFloat_FromDouble(__pyx_v_theta); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = PyFloat_FromDouble(__pyx_v_theta); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_7);
     __Pyx_GIVEREF(__pyx_t_7);
     __pyx_t_7 = 0;
-    __pyx_t_7 = PyObject_Call(__pyx_t_8, __pyx_t_1, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = PyObject_Call(__pyx_t_8, __pyx_t_1, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyNumber_Multiply(__pyx_t_7, __pyx_v_Sn); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyNumber_Multiply(__pyx_t_7, __pyx_v_Sn); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = PyNumber_Add(__pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = PyNumber_Add(__pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__cos); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__cos); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyFloat_FromDouble(__pyx_v_theta); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyFloat_FromDouble(__pyx_v_theta); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_8);
     PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_1);
     __Pyx_GIVEREF(__pyx_t_1);
     __pyx_t_1 = 0;
-    __pyx_t_1 = PyObject_Call(__pyx_t_3, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_Call(__pyx_t_3, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_t_8 = PyNumber_Subtract(__pyx_int_1, __pyx_t_1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = PyNumber_Subtract(__pyx_int_1, __pyx_t_1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_8);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__dot); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__dot); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_INCREF(__pyx_v_Sn);
     PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_Sn);
@@ -2860,15 +3851,15 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
     __Pyx_INCREF(__pyx_v_Sn);
     PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_Sn);
     __Pyx_GIVEREF(__pyx_v_Sn);
-    __pyx_t_6 = PyObject_Call(__pyx_t_3, __pyx_t_1, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = PyObject_Call(__pyx_t_3, __pyx_t_1, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyNumber_Multiply(__pyx_t_8, __pyx_t_6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyNumber_Multiply(__pyx_t_8, __pyx_t_6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = PyNumber_Add(__pyx_t_7, __pyx_t_1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = PyNumber_Add(__pyx_t_7, __pyx_t_1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -2879,26 +3870,26 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
   }
   /*else*/ {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":339
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":411
  *         R = np.eye(3) + np.sin(theta)*Sn + (1-np.cos(theta))*np.dot(Sn,Sn)
  *     else:
  *         Sr = np.array([[0,-r[2],r[1]],[r[2],0,-r[0]],[-r[1],r[0],0]])             # <<<<<<<<<<<<<<
  *         theta2 = theta*theta
  *         R = np.eye(3) + (1-theta2/6.)*Sr + (.5-theta2/24.)*np.dot(Sr,Sr)
  */
-    __pyx_t_6 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_1 = PyObject_GetAttr(__pyx_t_6, __pyx_n_s__array); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_GetAttr(__pyx_t_6, __pyx_n_s__array); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_r, 2, sizeof(long), PyInt_FromLong); if (!__pyx_t_6) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_r, 2, sizeof(long), PyInt_FromLong); if (!__pyx_t_6) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = PyNumber_Negative(__pyx_t_6); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = PyNumber_Negative(__pyx_t_6); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_r, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_6) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_r, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_6) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_8 = PyList_New(3); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = PyList_New(3); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_8));
     __Pyx_INCREF(__pyx_int_0);
     PyList_SET_ITEM(__pyx_t_8, 0, __pyx_int_0);
@@ -2909,14 +3900,14 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
     __Pyx_GIVEREF(__pyx_t_6);
     __pyx_t_7 = 0;
     __pyx_t_6 = 0;
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_r, 2, sizeof(long), PyInt_FromLong); if (!__pyx_t_6) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_r, 2, sizeof(long), PyInt_FromLong); if (!__pyx_t_6) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = __Pyx_GetItemInt(__pyx_v_r, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_7) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __Pyx_GetItemInt(__pyx_v_r, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_7) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_3 = PyNumber_Negative(__pyx_t_7); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyNumber_Negative(__pyx_t_7); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = PyList_New(3); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = PyList_New(3); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_7));
     PyList_SET_ITEM(__pyx_t_7, 0, __pyx_t_6);
     __Pyx_GIVEREF(__pyx_t_6);
@@ -2927,14 +3918,14 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
     __Pyx_GIVEREF(__pyx_t_3);
     __pyx_t_6 = 0;
     __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_r, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_r, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = PyNumber_Negative(__pyx_t_3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = PyNumber_Negative(__pyx_t_3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_r, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_r, 0, sizeof(long), PyInt_FromLong); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = PyList_New(3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyList_New(3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_2));
     PyList_SET_ITEM(__pyx_t_2, 0, __pyx_t_6);
     __Pyx_GIVEREF(__pyx_t_6);
@@ -2945,7 +3936,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
     __Pyx_GIVEREF(__pyx_int_0);
     __pyx_t_6 = 0;
     __pyx_t_3 = 0;
-    __pyx_t_3 = PyList_New(3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyList_New(3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_3));
     PyList_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_t_8));
     __Pyx_GIVEREF(((PyObject *)__pyx_t_8));
@@ -2956,12 +3947,12 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
     __pyx_t_8 = 0;
     __pyx_t_7 = 0;
     __pyx_t_2 = 0;
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_3));
     __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
     __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -2969,7 +3960,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
     __pyx_v_Sr = __pyx_t_3;
     __pyx_t_3 = 0;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":340
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":412
  *     else:
  *         Sr = np.array([[0,-r[2],r[1]],[r[2],0,-r[0]],[-r[1],r[0],0]])
  *         theta2 = theta*theta             # <<<<<<<<<<<<<<
@@ -2978,44 +3969,44 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
  */
     __pyx_v_theta2 = (__pyx_v_theta * __pyx_v_theta);
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":341
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":413
  *         Sr = np.array([[0,-r[2],r[1]],[r[2],0,-r[0]],[-r[1],r[0],0]])
  *         theta2 = theta*theta
  *         R = np.eye(3) + (1-theta2/6.)*Sr + (.5-theta2/24.)*np.dot(Sr,Sr)             # <<<<<<<<<<<<<<
  *     return R
  * 
  */
-    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__eye); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__eye); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_INCREF(__pyx_int_3);
     PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_int_3);
     __Pyx_GIVEREF(__pyx_int_3);
-    __pyx_t_1 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyFloat_FromDouble((1 - (__pyx_v_theta2 / 6.0))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyFloat_FromDouble((1 - (__pyx_v_theta2 / 6.0))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = PyNumber_Multiply(__pyx_t_3, __pyx_v_Sr); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyNumber_Multiply(__pyx_t_3, __pyx_v_Sr); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyNumber_Add(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyNumber_Add(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyFloat_FromDouble((0.5 - (__pyx_v_theta2 / 24.0))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble((0.5 - (__pyx_v_theta2 / 24.0))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_7 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__dot); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__dot); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_INCREF(__pyx_v_Sr);
     PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_Sr);
@@ -3023,15 +4014,15 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
     __Pyx_INCREF(__pyx_v_Sr);
     PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_Sr);
     __Pyx_GIVEREF(__pyx_v_Sr);
-    __pyx_t_8 = PyObject_Call(__pyx_t_7, __pyx_t_1, NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = PyObject_Call(__pyx_t_7, __pyx_t_1, NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_8);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyNumber_Multiply(__pyx_t_2, __pyx_t_8); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyNumber_Multiply(__pyx_t_2, __pyx_t_8); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_t_8 = PyNumber_Add(__pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = PyNumber_Add(__pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_8);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -3041,7 +4032,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
   }
   __pyx_L5:;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":342
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":414
  *         theta2 = theta*theta
  *         R = np.eye(3) + (1-theta2/6.)*Sr + (.5-theta2/24.)*np.dot(Sr,Sr)
  *     return R             # <<<<<<<<<<<<<<
@@ -3075,7 +4066,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotati
   return __pyx_r;
 }
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":347
+/* "/root/package/nipy/neurospin/registration/_registration.pyx":419
  * 
  * 
  * def param_to_vector12(ndarray param, ndarray t0, ndarray precond, int stamp=AFFINE3D):             # <<<<<<<<<<<<<<
@@ -3119,13 +4110,13 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__t0);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("param_to_vector12", 0, 3, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("param_to_vector12", 0, 3, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__precond);
       if (likely(values[2])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("param_to_vector12", 0, 3, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("param_to_vector12", 0, 3, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  3:
       if (kw_args > 0) {
@@ -3134,21 +4125,21 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "param_to_vector12") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "param_to_vector12") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_param = ((PyArrayObject *)values[0]);
     __pyx_v_t0 = ((PyArrayObject *)values[1]);
     __pyx_v_precond = ((PyArrayObject *)values[2]);
     if (values[3]) {
-      __pyx_v_stamp = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_stamp == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_stamp = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_stamp == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
-      __pyx_v_stamp = __pyx_k_1;
+      __pyx_v_stamp = __pyx_k_2;
     }
   } else {
-    __pyx_v_stamp = __pyx_k_1;
+    __pyx_v_stamp = __pyx_k_2;
     switch (PyTuple_GET_SIZE(__pyx_args)) {
       case  4:
-      __pyx_v_stamp = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_stamp == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_stamp = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_stamp == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case  3:
       __pyx_v_precond = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 2));
       __pyx_v_t0 = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
@@ -3159,7 +4150,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("param_to_vector12", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("param_to_vector12", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nipy.neurospin.registration._registration.param_to_vector12");
   return NULL;
@@ -3168,11 +4159,11 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
   __Pyx_INCREF((PyObject *)__pyx_v_t0);
   __Pyx_INCREF((PyObject *)__pyx_v_precond);
   __pyx_v_t = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_param), __pyx_ptype_5numpy_ndarray, 1, "param", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_t0), __pyx_ptype_5numpy_ndarray, 1, "t0", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_precond), __pyx_ptype_5numpy_ndarray, 1, "precond", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_param), __pyx_ptype_5numpy_ndarray, 1, "param", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_t0), __pyx_ptype_5numpy_ndarray, 1, "t0", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_precond), __pyx_ptype_5numpy_ndarray, 1, "precond", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":357
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":429
  *     integer stamp.
  *     """
  *     t = t0             # <<<<<<<<<<<<<<
@@ -3183,7 +4174,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
   __Pyx_DECREF(__pyx_v_t);
   __pyx_v_t = ((PyObject *)__pyx_v_t0);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":360
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":432
  * 
  *     # Switch on transformation type
  *     if stamp == RIGID3D:             # <<<<<<<<<<<<<<
@@ -3193,30 +4184,30 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
   __pyx_t_1 = (__pyx_v_stamp == __pyx_e_4nipy_9neurospin_12registration_13_registration_RIGID3D);
   if (__pyx_t_1) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":361
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":433
  *     # Switch on transformation type
  *     if stamp == RIGID3D:
  *         t[_rigid3d] = param*precond[_rigid3d]             # <<<<<<<<<<<<<<
  *     elif stamp == SIMILARITY3D:
  *         t[_similarity3d] = param[[0,1,2,3,4,5,6,6,6]]*precond[_similarity3d]
  */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s___rigid3d); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s___rigid3d); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_precond), __pyx_t_2); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_precond), __pyx_t_2); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyNumber_Multiply(((PyObject *)__pyx_v_param), __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyNumber_Multiply(((PyObject *)__pyx_v_param), __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s___rigid3d); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s___rigid3d); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    if (PyObject_SetItem(__pyx_v_t, __pyx_t_3, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (PyObject_SetItem(__pyx_v_t, __pyx_t_3, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     goto __pyx_L6;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":362
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":434
  *     if stamp == RIGID3D:
  *         t[_rigid3d] = param*precond[_rigid3d]
  *     elif stamp == SIMILARITY3D:             # <<<<<<<<<<<<<<
@@ -3226,14 +4217,14 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
   __pyx_t_1 = (__pyx_v_stamp == __pyx_e_4nipy_9neurospin_12registration_13_registration_SIMILARITY3D);
   if (__pyx_t_1) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":363
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":435
  *         t[_rigid3d] = param*precond[_rigid3d]
  *     elif stamp == SIMILARITY3D:
  *         t[_similarity3d] = param[[0,1,2,3,4,5,6,6,6]]*precond[_similarity3d]             # <<<<<<<<<<<<<<
  *     elif stamp == AFFINE3D:
  *         t = param*precond
  */
-    __pyx_t_2 = PyList_New(9); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyList_New(9); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_2));
     __Pyx_INCREF(__pyx_int_0);
     PyList_SET_ITEM(__pyx_t_2, 0, __pyx_int_0);
@@ -3262,27 +4253,27 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
     __Pyx_INCREF(__pyx_int_6);
     PyList_SET_ITEM(__pyx_t_2, 8, __pyx_int_6);
     __Pyx_GIVEREF(__pyx_int_6);
-    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_param), ((PyObject *)__pyx_t_2)); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_param), ((PyObject *)__pyx_t_2)); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s___similarity3d); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s___similarity3d); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = PyObject_GetItem(((PyObject *)__pyx_v_precond), __pyx_t_2); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyObject_GetItem(((PyObject *)__pyx_v_precond), __pyx_t_2); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyNumber_Multiply(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyNumber_Multiply(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s___similarity3d); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s___similarity3d); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    if (PyObject_SetItem(__pyx_v_t, __pyx_t_4, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (PyObject_SetItem(__pyx_v_t, __pyx_t_4, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     goto __pyx_L6;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":364
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":436
  *     elif stamp == SIMILARITY3D:
  *         t[_similarity3d] = param[[0,1,2,3,4,5,6,6,6]]*precond[_similarity3d]
  *     elif stamp == AFFINE3D:             # <<<<<<<<<<<<<<
@@ -3292,14 +4283,14 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
   __pyx_t_1 = (__pyx_v_stamp == __pyx_e_4nipy_9neurospin_12registration_13_registration_AFFINE3D);
   if (__pyx_t_1) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":365
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":437
  *         t[_similarity3d] = param[[0,1,2,3,4,5,6,6,6]]*precond[_similarity3d]
  *     elif stamp == AFFINE3D:
  *         t = param*precond             # <<<<<<<<<<<<<<
  *     elif stamp == RIGID2D:
  *         t[_rigid2d] = param*precond[_rigid2d]
  */
-    __pyx_t_2 = PyNumber_Multiply(((PyObject *)__pyx_v_param), ((PyObject *)__pyx_v_precond)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyNumber_Multiply(((PyObject *)__pyx_v_param), ((PyObject *)__pyx_v_precond)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_v_t);
     __pyx_v_t = __pyx_t_2;
@@ -3307,7 +4298,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
     goto __pyx_L6;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":366
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":438
  *     elif stamp == AFFINE3D:
  *         t = param*precond
  *     elif stamp == RIGID2D:             # <<<<<<<<<<<<<<
@@ -3317,30 +4308,30 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
   __pyx_t_1 = (__pyx_v_stamp == __pyx_e_4nipy_9neurospin_12registration_13_registration_RIGID2D);
   if (__pyx_t_1) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":367
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":439
  *         t = param*precond
  *     elif stamp == RIGID2D:
  *         t[_rigid2d] = param*precond[_rigid2d]             # <<<<<<<<<<<<<<
  *     elif stamp == SIMILARITY2D:
  *         t[_similarity2d] = param[[0,1,2,3,3]]*precond[_similarity2d]
  */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s___rigid2d); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s___rigid2d); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = PyObject_GetItem(((PyObject *)__pyx_v_precond), __pyx_t_2); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyObject_GetItem(((PyObject *)__pyx_v_precond), __pyx_t_2); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyNumber_Multiply(((PyObject *)__pyx_v_param), __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyNumber_Multiply(((PyObject *)__pyx_v_param), __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s___rigid2d); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s___rigid2d); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    if (PyObject_SetItem(__pyx_v_t, __pyx_t_4, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (PyObject_SetItem(__pyx_v_t, __pyx_t_4, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     goto __pyx_L6;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":368
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":440
  *     elif stamp == RIGID2D:
  *         t[_rigid2d] = param*precond[_rigid2d]
  *     elif stamp == SIMILARITY2D:             # <<<<<<<<<<<<<<
@@ -3350,14 +4341,14 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
   __pyx_t_1 = (__pyx_v_stamp == __pyx_e_4nipy_9neurospin_12registration_13_registration_SIMILARITY2D);
   if (__pyx_t_1) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":369
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":441
  *         t[_rigid2d] = param*precond[_rigid2d]
  *     elif stamp == SIMILARITY2D:
  *         t[_similarity2d] = param[[0,1,2,3,3]]*precond[_similarity2d]             # <<<<<<<<<<<<<<
  *     elif stamp == AFFINE2D:
  *         t[_affine2d] = param*precond[_affine2d]
  */
-    __pyx_t_2 = PyList_New(5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyList_New(5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(((PyObject *)__pyx_t_2));
     __Pyx_INCREF(__pyx_int_0);
     PyList_SET_ITEM(__pyx_t_2, 0, __pyx_int_0);
@@ -3374,27 +4365,27 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
     __Pyx_INCREF(__pyx_int_3);
     PyList_SET_ITEM(__pyx_t_2, 4, __pyx_int_3);
     __Pyx_GIVEREF(__pyx_int_3);
-    __pyx_t_4 = PyObject_GetItem(((PyObject *)__pyx_v_param), ((PyObject *)__pyx_t_2)); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyObject_GetItem(((PyObject *)__pyx_v_param), ((PyObject *)__pyx_t_2)); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s___similarity2d); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s___similarity2d); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_precond), __pyx_t_2); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_precond), __pyx_t_2); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyNumber_Multiply(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyNumber_Multiply(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s___similarity2d); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s___similarity2d); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    if (PyObject_SetItem(__pyx_v_t, __pyx_t_3, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (PyObject_SetItem(__pyx_v_t, __pyx_t_3, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     goto __pyx_L6;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":370
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":442
  *     elif stamp == SIMILARITY2D:
  *         t[_similarity2d] = param[[0,1,2,3,3]]*precond[_similarity2d]
  *     elif stamp == AFFINE2D:             # <<<<<<<<<<<<<<
@@ -3404,31 +4395,31 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
   __pyx_t_1 = (__pyx_v_stamp == __pyx_e_4nipy_9neurospin_12registration_13_registration_AFFINE2D);
   if (__pyx_t_1) {
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":371
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":443
  *         t[_similarity2d] = param[[0,1,2,3,3]]*precond[_similarity2d]
  *     elif stamp == AFFINE2D:
  *         t[_affine2d] = param*precond[_affine2d]             # <<<<<<<<<<<<<<
  * 
  *     return t
  */
-    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s___affine2d); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s___affine2d); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_precond), __pyx_t_2); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_precond), __pyx_t_2); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyNumber_Multiply(((PyObject *)__pyx_v_param), __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyNumber_Multiply(((PyObject *)__pyx_v_param), __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s___affine2d); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s___affine2d); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    if (PyObject_SetItem(__pyx_v_t, __pyx_t_3, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (PyObject_SetItem(__pyx_v_t, __pyx_t_3, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     goto __pyx_L6;
   }
   __pyx_L6:;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":373
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":445
  *         t[_affine2d] = param*precond[_affine2d]
  * 
  *     return t             # <<<<<<<<<<<<<<
@@ -3458,7 +4449,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_
   return __pyx_r;
 }
 
-/* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":376
+/* "/root/package/nipy/neurospin/registration/_registration.pyx":448
  * 
  * 
  * def matrix44(ndarray t, dtype):             # <<<<<<<<<<<<<<
@@ -3502,11 +4493,11 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__dtype);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("matrix44", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("matrix44", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 448; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "matrix44") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "matrix44") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 448; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_t = ((PyArrayObject *)values[0]);
     __pyx_v_dtype = values[1];
@@ -3518,7 +4509,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("matrix44", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("matrix44", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 448; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nipy.neurospin.registration._registration.matrix44");
   return NULL;
@@ -3529,9 +4520,9 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
   __pyx_v_R = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_S = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_Q = Py_None; __Pyx_INCREF(Py_None);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_t), __pyx_ptype_5numpy_ndarray, 1, "t", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_t), __pyx_ptype_5numpy_ndarray, 1, "t", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 448; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":390
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":462
  *     """
  *     cdef unsigned int size
  *     size = <unsigned int>PyArray_SIZE(t)             # <<<<<<<<<<<<<<
@@ -3540,27 +4531,27 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
  */
   __pyx_v_size = ((unsigned int)PyArray_SIZE(__pyx_v_t));
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":391
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":463
  *     cdef unsigned int size
  *     size = <unsigned int>PyArray_SIZE(t)
  *     T = np.eye(4, dtype=dtype)             # <<<<<<<<<<<<<<
  *     R = rotation_vec2mat(t[3:6])
  *     if size == 6:
  */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__eye); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__eye); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_int_4);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_int_4);
   __Pyx_GIVEREF(__pyx_int_4);
-  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-  if (PyDict_SetItem(__pyx_t_3, ((PyObject *)__pyx_n_s__dtype), __pyx_v_dtype) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = PyEval_CallObjectWithKeywords(__pyx_t_2, __pyx_t_1, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_3, ((PyObject *)__pyx_n_s__dtype), __pyx_v_dtype) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyEval_CallObjectWithKeywords(__pyx_t_2, __pyx_t_1, ((PyObject *)__pyx_t_3)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -3569,23 +4560,23 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
   __pyx_v_T = __pyx_t_4;
   __pyx_t_4 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":392
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":464
  *     size = <unsigned int>PyArray_SIZE(t)
  *     T = np.eye(4, dtype=dtype)
  *     R = rotation_vec2mat(t[3:6])             # <<<<<<<<<<<<<<
  *     if size == 6:
  *         T[0:3,0:3] = R
  */
-  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__rotation_vec2mat); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__rotation_vec2mat); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 464; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = PySequence_GetSlice(((PyObject *)__pyx_v_t), 3, 6); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PySequence_GetSlice(((PyObject *)__pyx_v_t), 3, 6); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 464; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 464; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_3);
   __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Call(__pyx_t_4, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 464; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -3593,7 +4584,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
   __pyx_v_R = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":393
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":465
  *     T = np.eye(4, dtype=dtype)
  *     R = rotation_vec2mat(t[3:6])
  *     if size == 6:             # <<<<<<<<<<<<<<
@@ -3603,18 +4594,18 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
   switch (__pyx_v_size) {
     case 6:
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":394
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":466
  *     R = rotation_vec2mat(t[3:6])
  *     if size == 6:
  *         T[0:3,0:3] = R             # <<<<<<<<<<<<<<
  *     elif size == 7:
  *         T[0:3,0:3] = t[6]*R
  */
-    __pyx_t_3 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_1 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
     __Pyx_GIVEREF(__pyx_t_3);
@@ -3622,11 +4613,11 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
     __Pyx_GIVEREF(__pyx_t_1);
     __pyx_t_3 = 0;
     __pyx_t_1 = 0;
-    if (PyObject_SetItem(__pyx_v_T, __pyx_t_4, __pyx_v_R) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (PyObject_SetItem(__pyx_v_T, __pyx_t_4, __pyx_v_R) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     break;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":395
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":467
  *     if size == 6:
  *         T[0:3,0:3] = R
  *     elif size == 7:             # <<<<<<<<<<<<<<
@@ -3635,23 +4626,23 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
  */
     case 7:
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":396
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":468
  *         T[0:3,0:3] = R
  *     elif size == 7:
  *         T[0:3,0:3] = t[6]*R             # <<<<<<<<<<<<<<
  *     else:
  *         S = np.diag(np.exp(t[6:9]))
  */
-    __pyx_t_4 = __Pyx_GetItemInt(((PyObject *)__pyx_v_t), 6, sizeof(long), PyInt_FromLong); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_GetItemInt(((PyObject *)__pyx_v_t), 6, sizeof(long), PyInt_FromLong); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_1 = PyNumber_Multiply(__pyx_t_4, __pyx_v_R); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyNumber_Multiply(__pyx_t_4, __pyx_v_R); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
     __Pyx_GIVEREF(__pyx_t_4);
@@ -3659,46 +4650,46 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
     __Pyx_GIVEREF(__pyx_t_3);
     __pyx_t_4 = 0;
     __pyx_t_3 = 0;
-    if (PyObject_SetItem(__pyx_v_T, __pyx_t_2, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (PyObject_SetItem(__pyx_v_T, __pyx_t_2, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     break;
     default:
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":398
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":470
  *         T[0:3,0:3] = t[6]*R
  *     else:
  *         S = np.diag(np.exp(t[6:9]))             # <<<<<<<<<<<<<<
  *         Q = rotation_vec2mat(t[9:12])
  *         # Beware: R*s*Q
  */
-    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__diag); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__diag); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__exp); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__exp); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PySequence_GetSlice(((PyObject *)__pyx_v_t), 6, 9); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PySequence_GetSlice(((PyObject *)__pyx_v_t), 6, 9); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
     __Pyx_GIVEREF(__pyx_t_1);
     __pyx_t_1 = 0;
-    __pyx_t_1 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
     __Pyx_GIVEREF(__pyx_t_1);
     __pyx_t_1 = 0;
-    __pyx_t_1 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -3706,23 +4697,23 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
     __pyx_v_S = __pyx_t_1;
     __pyx_t_1 = 0;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":399
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":471
  *     else:
  *         S = np.diag(np.exp(t[6:9]))
  *         Q = rotation_vec2mat(t[9:12])             # <<<<<<<<<<<<<<
  *         # Beware: R*s*Q
  *         T[0:3,0:3] = np.dot(R,np.dot(S,Q))
  */
-    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__rotation_vec2mat); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__rotation_vec2mat); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = PySequence_GetSlice(((PyObject *)__pyx_v_t), 9, 12); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PySequence_GetSlice(((PyObject *)__pyx_v_t), 9, 12); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
     __Pyx_GIVEREF(__pyx_t_4);
     __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -3730,24 +4721,24 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
     __pyx_v_Q = __pyx_t_4;
     __pyx_t_4 = 0;
 
-    /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":401
+    /* "/root/package/nipy/neurospin/registration/_registration.pyx":473
  *         Q = rotation_vec2mat(t[9:12])
  *         # Beware: R*s*Q
  *         T[0:3,0:3] = np.dot(R,np.dot(S,Q))             # <<<<<<<<<<<<<<
  *     T[0:3,3] = t[0:3]
  *     return T
  */
-    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_2 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__dot); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__dot); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_1 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__dot); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyObject_GetAttr(__pyx_t_4, __pyx_n_s__dot); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(__pyx_v_S);
     PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_S);
@@ -3755,11 +4746,11 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
     __Pyx_INCREF(__pyx_v_Q);
     PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_Q);
     __Pyx_GIVEREF(__pyx_v_Q);
-    __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(__pyx_v_R);
     PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_R);
@@ -3767,15 +4758,15 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
     PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
     __Pyx_GIVEREF(__pyx_t_3);
     __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_2 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4);
     __Pyx_GIVEREF(__pyx_t_4);
@@ -3783,24 +4774,24 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
     __Pyx_GIVEREF(__pyx_t_2);
     __pyx_t_4 = 0;
     __pyx_t_2 = 0;
-    if (PyObject_SetItem(__pyx_v_T, __pyx_t_1, __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (PyObject_SetItem(__pyx_v_T, __pyx_t_1, __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     break;
   }
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":402
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":474
  *         # Beware: R*s*Q
  *         T[0:3,0:3] = np.dot(R,np.dot(S,Q))
  *     T[0:3,3] = t[0:3]             # <<<<<<<<<<<<<<
  *     return T
  * 
  */
-  __pyx_t_3 = PySequence_GetSlice(((PyObject *)__pyx_v_t), 0, 3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 402; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PySequence_GetSlice(((PyObject *)__pyx_v_t), 0, 3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 474; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 402; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PySlice_New(__pyx_int_0, __pyx_int_3, Py_None); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 474; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 402; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 474; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -3808,11 +4799,11 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
   PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_int_3);
   __Pyx_GIVEREF(__pyx_int_3);
   __pyx_t_1 = 0;
-  if (PyObject_SetItem(__pyx_v_T, __pyx_t_2, __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 402; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetItem(__pyx_v_T, __pyx_t_2, __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 474; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":403
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":475
  *         T[0:3,0:3] = np.dot(R,np.dot(S,Q))
  *     T[0:3,3] = t[0:3]
  *     return T             # <<<<<<<<<<<<<<
@@ -3845,7 +4836,7 @@ static PyObject *__pyx_pf_4nipy_9neurospin_12registration_13_registration_matrix
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":187
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":187
  *         # experimental exception made for __getbuffer__ and __releasebuffer__
  *         # -- the details of this may change.
  *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
@@ -3881,7 +4872,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __Pyx_GIVEREF(__pyx_v_info->obj);
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":193
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":193
  *             # of flags
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -3890,7 +4881,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_endian_detector = 1;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":194
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":194
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -3899,7 +4890,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":196
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":196
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
  * 
  *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
@@ -3908,7 +4899,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_ndim = PyArray_NDIM(((PyArrayObject *)__pyx_v_self));
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":198
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":198
  *             ndim = PyArray_NDIM(self)
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -3918,7 +4909,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_1 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":199
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":199
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 copy_shape = 1             # <<<<<<<<<<<<<<
@@ -3930,7 +4921,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":201
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":201
  *                 copy_shape = 1
  *             else:
  *                 copy_shape = 0             # <<<<<<<<<<<<<<
@@ -3941,7 +4932,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L5:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":203
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":203
  *                 copy_shape = 0
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -3951,7 +4942,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_1 = ((__pyx_v_flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS);
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":204
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":204
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -3965,7 +4956,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_t_3) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":205
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":205
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
@@ -3974,9 +4965,9 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_u_2));
-    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_u_2));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_2));
+    __Pyx_INCREF(((PyObject *)__pyx_kp_u_3));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_u_3));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_3));
     __pyx_t_5 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -3987,7 +4978,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L6:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":207
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":207
  *                 raise ValueError(u"ndarray is not C contiguous")
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -3997,7 +4988,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_3 = ((__pyx_v_flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS);
   if (__pyx_t_3) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":208
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":208
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -4011,7 +5002,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_t_2) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":209
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":209
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
@@ -4020,9 +5011,9 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_u_3));
-    PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_u_3));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_3));
+    __Pyx_INCREF(((PyObject *)__pyx_kp_u_4));
+    PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_u_4));
+    __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_4));
     __pyx_t_4 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -4033,7 +5024,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L7:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":211
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":211
  *                 raise ValueError(u"ndarray is not Fortran contiguous")
  * 
  *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
@@ -4042,7 +5033,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->buf = PyArray_DATA(((PyArrayObject *)__pyx_v_self));
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":212
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":212
  * 
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim             # <<<<<<<<<<<<<<
@@ -4051,7 +5042,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->ndim = __pyx_v_ndim;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":213
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":213
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim
  *             if copy_shape:             # <<<<<<<<<<<<<<
@@ -4061,7 +5052,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_6 = __pyx_v_copy_shape;
   if (__pyx_t_6) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":216
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":216
  *                 # Allocate new buffer for strides and shape info. This is allocated
  *                 # as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)             # <<<<<<<<<<<<<<
@@ -4070,7 +5061,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->strides = ((Py_ssize_t *)malloc((((sizeof(Py_ssize_t)) * __pyx_v_ndim) * 2)));
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":217
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":217
  *                 # as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)
  *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
@@ -4079,7 +5070,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":218
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":218
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):             # <<<<<<<<<<<<<<
@@ -4090,7 +5081,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
       __pyx_v_i = __pyx_t_7;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":219
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":219
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
@@ -4099,7 +5090,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
       (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(((PyArrayObject *)__pyx_v_self))[__pyx_v_i]);
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":220
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":220
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]
  *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
@@ -4112,7 +5103,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":222
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":222
  *                     info.shape[i] = PyArray_DIMS(self)[i]
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
@@ -4121,7 +5112,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(((PyArrayObject *)__pyx_v_self)));
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":223
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":223
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
@@ -4132,7 +5123,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L8:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":224
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":224
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
@@ -4141,7 +5132,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->suboffsets = NULL;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":225
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":225
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
@@ -4150,7 +5141,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->itemsize = PyArray_ITEMSIZE(((PyArrayObject *)__pyx_v_self));
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":226
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":226
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)
  *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
@@ -4159,7 +5150,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->readonly = (!PyArray_ISWRITEABLE(((PyArrayObject *)__pyx_v_self)));
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":229
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":229
  * 
  *             cdef int t
  *             cdef char* f = NULL             # <<<<<<<<<<<<<<
@@ -4168,7 +5159,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_f = NULL;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":230
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":230
  *             cdef int t
  *             cdef char* f = NULL
  *             cdef dtype descr = self.descr             # <<<<<<<<<<<<<<
@@ -4178,7 +5169,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __Pyx_INCREF(((PyObject *)((PyArrayObject *)__pyx_v_self)->descr));
   __pyx_v_descr = ((PyArrayObject *)__pyx_v_self)->descr;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":234
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":234
  *             cdef int offset
  * 
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)             # <<<<<<<<<<<<<<
@@ -4187,7 +5178,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_hasfields = PyDataType_HASFIELDS(__pyx_v_descr);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":236
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":236
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)
  * 
  *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
@@ -4203,7 +5194,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":238
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":238
  *             if not hasfields and not copy_shape:
  *                 # do not call releasebuffer
  *                 info.obj = None             # <<<<<<<<<<<<<<
@@ -4219,7 +5210,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":241
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":241
  *             else:
  *                 # need to call releasebuffer
  *                 info.obj = self             # <<<<<<<<<<<<<<
@@ -4234,7 +5225,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L11:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":243
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":243
  *                 info.obj = self
  * 
  *             if not hasfields:             # <<<<<<<<<<<<<<
@@ -4244,7 +5235,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_t_1 = (!__pyx_v_hasfields);
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":244
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":244
  * 
  *             if not hasfields:
  *                 t = descr.type_num             # <<<<<<<<<<<<<<
@@ -4253,7 +5244,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_t = __pyx_v_descr->type_num;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":245
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":245
  *             if not hasfields:
  *                 t = descr.type_num
  *                 if ((descr.byteorder == '>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -4268,7 +5259,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     if (!__pyx_t_2) {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":246
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":246
  *                 t = descr.type_num
  *                 if ((descr.byteorder == '>' and little_endian) or
  *                     (descr.byteorder == '<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -4288,7 +5279,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     if (__pyx_t_1) {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":247
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":247
  *                 if ((descr.byteorder == '>' and little_endian) or
  *                     (descr.byteorder == '<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -4297,9 +5288,9 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
       __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_u_4));
-      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_u_4));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_4));
+      __Pyx_INCREF(((PyObject *)__pyx_kp_u_5));
+      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_u_5));
+      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_5));
       __pyx_t_5 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -4310,7 +5301,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     __pyx_L13:;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":248
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":248
  *                     (descr.byteorder == '<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
@@ -4323,7 +5314,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":249
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":249
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
@@ -4336,7 +5327,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":250
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":250
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
@@ -4349,7 +5340,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":251
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":251
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
@@ -4362,7 +5353,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":252
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":252
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
@@ -4375,7 +5366,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":253
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":253
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
@@ -4388,7 +5379,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":254
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":254
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
@@ -4401,7 +5392,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":255
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":255
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
@@ -4414,7 +5405,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":256
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":256
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
@@ -4427,7 +5418,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":257
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":257
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
@@ -4440,7 +5431,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":258
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":258
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
@@ -4453,7 +5444,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":259
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":259
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
@@ -4466,7 +5457,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":260
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":260
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
@@ -4479,7 +5470,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":261
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":261
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
@@ -4492,7 +5483,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":262
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":262
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
@@ -4505,7 +5496,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":263
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":263
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
@@ -4518,7 +5509,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       goto __pyx_L14;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":264
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":264
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
  *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
@@ -4532,7 +5523,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     /*else*/ {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":266
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":266
  *                 elif t == NPY_OBJECT:      f = "O"
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
@@ -4541,7 +5532,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
       __pyx_t_5 = PyInt_FromLong(__pyx_v_t); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_5), __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_6), __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
@@ -4558,7 +5549,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     }
     __pyx_L14:;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":267
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":267
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f             # <<<<<<<<<<<<<<
@@ -4567,7 +5558,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->format = __pyx_v_f;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":268
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":268
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f
  *                 return             # <<<<<<<<<<<<<<
@@ -4580,7 +5571,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":270
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":270
  *                 return
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)             # <<<<<<<<<<<<<<
@@ -4589,7 +5580,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->format = ((char *)malloc(255));
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":271
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":271
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = '^' # Native data types, manual alignment             # <<<<<<<<<<<<<<
@@ -4598,7 +5589,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     (__pyx_v_info->format[0]) = '^';
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":272
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":272
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = '^' # Native data types, manual alignment
  *                 offset = 0             # <<<<<<<<<<<<<<
@@ -4607,7 +5598,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_offset = 0;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":275
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":275
  *                 f = _util_dtypestring(descr, info.format + 1,
  *                                       info.format + _buffer_format_string_len,
  *                                       &offset)             # <<<<<<<<<<<<<<
@@ -4617,7 +5608,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     __pyx_t_9 = __pyx_f_5numpy__util_dtypestring(__pyx_v_descr, (__pyx_v_info->format + 1), (__pyx_v_info->format + 255), (&__pyx_v_offset)); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_v_f = __pyx_t_9;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":276
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":276
  *                                       info.format + _buffer_format_string_len,
  *                                       &offset)
  *                 f[0] = 0 # Terminate format string             # <<<<<<<<<<<<<<
@@ -4650,7 +5641,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":278
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":278
  *                 f[0] = 0 # Terminate format string
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
@@ -4664,7 +5655,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __Pyx_RefNannySetupContext("__releasebuffer__");
   __Pyx_INCREF((PyObject *)__pyx_v_self);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":279
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":279
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
@@ -4674,7 +5665,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __pyx_t_1 = PyArray_HASFIELDS(((PyArrayObject *)__pyx_v_self));
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":280
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":280
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)             # <<<<<<<<<<<<<<
@@ -4686,7 +5677,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   }
   __pyx_L5:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":281
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":281
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -4696,7 +5687,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __pyx_t_1 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":282
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":282
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 stdlib.free(info.strides)             # <<<<<<<<<<<<<<
@@ -4712,7 +5703,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __Pyx_RefNannyFinishContext();
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":755
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":755
  * ctypedef npy_cdouble     complex_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -4725,7 +5716,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew1");
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":756
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":756
  * 
  * cdef inline object PyArray_MultiIterNew1(a):
  *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
@@ -4751,7 +5742,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":758
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":758
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -4764,7 +5755,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew2");
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":759
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":759
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
@@ -4790,7 +5781,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":761
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":761
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -4803,7 +5794,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew3");
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":762
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":762
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
@@ -4829,7 +5820,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":764
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":764
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -4842,7 +5833,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew4");
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":765
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":765
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
@@ -4868,7 +5859,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":767
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":767
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -4881,7 +5872,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew5");
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":768
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":768
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
@@ -4907,7 +5898,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":770
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":770
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
@@ -4942,7 +5933,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   __pyx_v_new_offset = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_t = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":777
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":777
  *     cdef int delta_offset
  *     cdef tuple i
  *     cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -4951,7 +5942,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_endian_detector = 1;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":778
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":778
  *     cdef tuple i
  *     cdef int endian_detector = 1
  *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -4960,7 +5951,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":781
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":781
  *     cdef tuple fields
  * 
  *     for childname in descr.names:             # <<<<<<<<<<<<<<
@@ -4979,7 +5970,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_v_childname = __pyx_t_3;
     __pyx_t_3 = 0;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":782
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":782
  * 
  *     for childname in descr.names:
  *         fields = descr.fields[childname]             # <<<<<<<<<<<<<<
@@ -4993,7 +5984,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_v_fields = ((PyObject *)__pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":783
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":783
  *     for childname in descr.names:
  *         fields = descr.fields[childname]
  *         child, new_offset = fields             # <<<<<<<<<<<<<<
@@ -5016,7 +6007,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       {__pyx_filename = __pyx_f[1]; __pyx_lineno = 783; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":785
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":785
  *         child, new_offset = fields
  * 
  *         if (end - f) - (new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
@@ -5041,7 +6032,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     if (__pyx_t_6) {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":786
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":786
  * 
  *         if (end - f) - (new_offset - offset[0]) < 15:
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
@@ -5050,9 +6041,9 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_u_6));
-      PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_u_6));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_6));
+      __Pyx_INCREF(((PyObject *)__pyx_kp_u_7));
+      PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_kp_u_7));
+      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_7));
       __pyx_t_3 = PyObject_Call(__pyx_builtin_RuntimeError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -5063,7 +6054,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L5:;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":788
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":788
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == '>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -5078,7 +6069,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     if (!__pyx_t_7) {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":789
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":789
  * 
  *         if ((child.byteorder == '>' and little_endian) or
  *             (child.byteorder == '<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -5098,7 +6089,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     if (__pyx_t_6) {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":790
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":790
  *         if ((child.byteorder == '>' and little_endian) or
  *             (child.byteorder == '<' and not little_endian)):
  *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -5107,9 +6098,9 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 790; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_u_4));
-      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_u_4));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_4));
+      __Pyx_INCREF(((PyObject *)__pyx_kp_u_5));
+      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_u_5));
+      __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_5));
       __pyx_t_5 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 790; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -5120,7 +6111,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L6:;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":800
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":800
  * 
  *         # Output padding bytes
  *         while offset[0] < new_offset:             # <<<<<<<<<<<<<<
@@ -5137,7 +6128,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (!__pyx_t_6) break;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":801
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":801
  *         # Output padding bytes
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte             # <<<<<<<<<<<<<<
@@ -5146,7 +6137,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       (__pyx_v_f[0]) = 120;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":802
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":802
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte
  *             f += 1             # <<<<<<<<<<<<<<
@@ -5155,7 +6146,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_v_f += 1;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":803
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":803
  *             f[0] = 120 # "x"; pad byte
  *             f += 1
  *             offset[0] += 1             # <<<<<<<<<<<<<<
@@ -5165,7 +6156,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       (__pyx_v_offset[0]) += 1;
     }
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":805
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":805
  *             offset[0] += 1
  * 
  *         offset[0] += child.itemsize             # <<<<<<<<<<<<<<
@@ -5174,7 +6165,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     (__pyx_v_offset[0]) += __pyx_v_child->elsize;
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":807
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":807
  *         offset[0] += child.itemsize
  * 
  *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
@@ -5184,7 +6175,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = (!PyDataType_HASFIELDS(__pyx_v_child));
     if (__pyx_t_6) {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":808
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":808
  * 
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num             # <<<<<<<<<<<<<<
@@ -5197,7 +6188,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __pyx_v_t = __pyx_t_3;
       __pyx_t_3 = 0;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":809
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":809
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num
  *             if end - f < 5:             # <<<<<<<<<<<<<<
@@ -5207,7 +6198,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __pyx_t_6 = ((__pyx_v_end - __pyx_v_f) < 5);
       if (__pyx_t_6) {
 
-        /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":810
+        /* "/tmp/cy012/Cython/Includes/numpy.pxd":810
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
@@ -5216,9 +6207,9 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
         __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 810; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_INCREF(((PyObject *)__pyx_kp_u_7));
-        PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_u_7));
-        __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_7));
+        __Pyx_INCREF(((PyObject *)__pyx_kp_u_8));
+        PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_u_8));
+        __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_8));
         __pyx_t_5 = PyObject_Call(__pyx_builtin_RuntimeError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 810; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -5229,7 +6220,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       __pyx_L10:;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":813
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":813
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"             # <<<<<<<<<<<<<<
@@ -5248,7 +6239,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":814
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":814
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"             # <<<<<<<<<<<<<<
@@ -5267,7 +6258,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":815
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":815
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"             # <<<<<<<<<<<<<<
@@ -5286,7 +6277,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":816
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":816
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"             # <<<<<<<<<<<<<<
@@ -5305,7 +6296,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":817
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":817
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"             # <<<<<<<<<<<<<<
@@ -5324,7 +6315,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":818
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":818
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"             # <<<<<<<<<<<<<<
@@ -5343,7 +6334,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":819
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":819
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"             # <<<<<<<<<<<<<<
@@ -5362,7 +6353,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":820
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":820
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"             # <<<<<<<<<<<<<<
@@ -5381,7 +6372,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":821
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":821
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"             # <<<<<<<<<<<<<<
@@ -5400,7 +6391,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":822
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":822
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"             # <<<<<<<<<<<<<<
@@ -5419,7 +6410,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":823
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":823
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"             # <<<<<<<<<<<<<<
@@ -5438,7 +6429,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":824
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":824
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"             # <<<<<<<<<<<<<<
@@ -5457,7 +6448,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":825
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":825
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"             # <<<<<<<<<<<<<<
@@ -5476,7 +6467,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":826
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":826
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf             # <<<<<<<<<<<<<<
@@ -5497,7 +6488,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":827
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":827
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd             # <<<<<<<<<<<<<<
@@ -5518,7 +6509,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":828
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":828
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg             # <<<<<<<<<<<<<<
@@ -5539,7 +6530,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L11;
       }
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":829
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":829
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"             # <<<<<<<<<<<<<<
@@ -5559,14 +6550,14 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       /*else*/ {
 
-        /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":831
+        /* "/tmp/cy012/Cython/Includes/numpy.pxd":831
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
  *             f += 1
  *         else:
  */
-        __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_5), __pyx_v_t); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_6), __pyx_v_t); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_3);
         __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_5);
@@ -5582,7 +6573,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       __pyx_L11:;
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":832
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":832
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *             f += 1             # <<<<<<<<<<<<<<
@@ -5594,7 +6585,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     /*else*/ {
 
-      /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":836
+      /* "/tmp/cy012/Cython/Includes/numpy.pxd":836
  *             # Cython ignores struct boundary information ("T{...}"),
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)             # <<<<<<<<<<<<<<
@@ -5608,7 +6599,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":837
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":837
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)
  *     return f             # <<<<<<<<<<<<<<
@@ -5638,7 +6629,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   return __pyx_r;
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":952
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":952
  * 
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -5653,7 +6644,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_INCREF((PyObject *)__pyx_v_arr);
   __Pyx_INCREF(__pyx_v_base);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":954
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":954
  * cdef inline void set_array_base(ndarray arr, object base):
  *      cdef PyObject* baseptr
  *      if base is None:             # <<<<<<<<<<<<<<
@@ -5663,7 +6654,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __pyx_t_1 = (__pyx_v_base == Py_None);
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":955
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":955
  *      cdef PyObject* baseptr
  *      if base is None:
  *          baseptr = NULL             # <<<<<<<<<<<<<<
@@ -5675,7 +6666,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   }
   /*else*/ {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":957
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":957
  *          baseptr = NULL
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!             # <<<<<<<<<<<<<<
@@ -5684,7 +6675,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
     Py_INCREF(__pyx_v_base);
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":958
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":958
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base             # <<<<<<<<<<<<<<
@@ -5695,7 +6686,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   }
   __pyx_L3:;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":959
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":959
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)             # <<<<<<<<<<<<<<
@@ -5704,7 +6695,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   Py_XDECREF(__pyx_v_arr->base);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":960
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":960
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)
  *      arr.base = baseptr             # <<<<<<<<<<<<<<
@@ -5718,7 +6709,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_RefNannyFinishContext();
 }
 
-/* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":962
+/* "/tmp/cy012/Cython/Includes/numpy.pxd":962
  *      arr.base = baseptr
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -5732,7 +6723,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __Pyx_RefNannySetupContext("get_array_base");
   __Pyx_INCREF((PyObject *)__pyx_v_arr);
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":963
+  /* "/tmp/cy012/Cython/Includes/numpy.pxd":963
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:             # <<<<<<<<<<<<<<
@@ -5742,7 +6733,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_t_1 = (__pyx_v_arr->base == NULL);
   if (__pyx_t_1) {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":964
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":964
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:
  *         return None             # <<<<<<<<<<<<<<
@@ -5757,7 +6748,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   }
   /*else*/ {
 
-    /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/numpy.pxd":966
+    /* "/tmp/cy012/Cython/Includes/numpy.pxd":966
  *         return None
  *     else:
  *         return <object>arr.base             # <<<<<<<<<<<<<<
@@ -5781,6 +6772,8 @@ static struct PyMethodDef __pyx_methods[] = {
   {__Pyx_NAMESTR("_texture"), (PyCFunction)__pyx_pf_4nipy_9neurospin_12registration_13_registration__texture, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
   {__Pyx_NAMESTR("_histogram"), (PyCFunction)__pyx_pf_4nipy_9neurospin_12registration_13_registration__histogram, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_12registration_13_registration__histogram)},
   {__Pyx_NAMESTR("_joint_histogram"), (PyCFunction)__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint_histogram, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_12registration_13_registration__joint_histogram)},
+  {__Pyx_NAMESTR("_joint_histogram_range"), (PyCFunction)__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint_histogram_range, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_12registration_13_registration__joint_histogram_range)},
+  {__Pyx_NAMESTR("_joint_histogram_gradient"), (PyCFunction)__pyx_pf_4nipy_9neurospin_12registration_13_registration__joint_histogram_gradient, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_12registration_13_registration__joint_histogram_gradient)},
   {__Pyx_NAMESTR("_similarity"), (PyCFunction)__pyx_pf_4nipy_9neurospin_12registration_13_registration__similarity, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_12registration_13_registration__similarity)},
   {__Pyx_NAMESTR("rotation_vec2mat"), (PyCFunction)__pyx_pf_4nipy_9neurospin_12registration_13_registration_rotation_vec2mat, METH_O, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_12registration_13_registration_rotation_vec2mat)},
   {__Pyx_NAMESTR("param_to_vector12"), (PyCFunction)__pyx_pf_4nipy_9neurospin_12registration_13_registration_param_to_vector12, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_4nipy_9neurospin_12registration_13_registration_param_to_vector12)},
@@ -5794,7 +6787,7 @@ static void __pyx_init_filenames(void); /*proto*/
 static struct PyModuleDef __pyx_moduledef = {
     PyModuleDef_HEAD_INIT,
     __Pyx_NAMESTR("_registration"),
-    __Pyx_DOCSTR(__pyx_k_8), /* m_doc */
+    __Pyx_DOCSTR(__pyx_k_9), /* m_doc */
     -1, /* m_size */
     __pyx_methods /* m_methods */,
     NULL, /* m_reload */
@@ -5805,26 +6798,32 @@ static struct PyModuleDef __pyx_moduledef = {
 #endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_n_s_10, __pyx_k_10, sizeof(__pyx_k_10), 0, 0, 1, 1},
-  {&__pyx_kp_u_11, __pyx_k_11, sizeof(__pyx_k_11), 0, 1, 0, 0},
+  {&__pyx_n_s_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 0, 1, 1},
+  {&__pyx_kp_s_10, __pyx_k_10, sizeof(__pyx_k_10), 0, 0, 1, 0},
+  {&__pyx_n_s_11, __pyx_k_11, sizeof(__pyx_k_11), 0, 0, 1, 1},
   {&__pyx_kp_u_12, __pyx_k_12, sizeof(__pyx_k_12), 0, 1, 0, 0},
   {&__pyx_kp_u_13, __pyx_k_13, sizeof(__pyx_k_13), 0, 1, 0, 0},
   {&__pyx_kp_u_14, __pyx_k_14, sizeof(__pyx_k_14), 0, 1, 0, 0},
   {&__pyx_kp_u_15, __pyx_k_15, sizeof(__pyx_k_15), 0, 1, 0, 0},
-  {&__pyx_kp_u_16, __pyx_k_16, sizeof(__pyx_k_16), 0, 1, 0, 0},
-  {&__pyx_kp_u_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 1, 0, 0},
+  {&__pyx_n_s_16, __pyx_k_16, sizeof(__pyx_k_16), 0, 0, 1, 1},
+  {&__pyx_kp_u_17, __pyx_k_17, sizeof(__pyx_k_17), 0, 1, 0, 0},
+  {&__pyx_kp_u_18, __pyx_k_18, sizeof(__pyx_k_18), 0, 1, 0, 0},
+  {&__pyx_kp_u_19, __pyx_k_19, sizeof(__pyx_k_19), 0, 1, 0, 0},
+  {&__pyx_kp_u_20, __pyx_k_20, sizeof(__pyx_k_20), 0, 1, 0, 0},
   {&__pyx_kp_u_3, __pyx_k_3, sizeof(__pyx_k_3), 0, 1, 0, 0},
   {&__pyx_kp_u_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 1, 0, 0},
   {&__pyx_kp_u_5, __pyx_k_5, sizeof(__pyx_k_5), 0, 1, 0, 0},
   {&__pyx_kp_u_6, __pyx_k_6, sizeof(__pyx_k_6), 0, 1, 0, 0},
   {&__pyx_kp_u_7, __pyx_k_7, sizeof(__pyx_k_7), 0, 1, 0, 0},
-  {&__pyx_kp_s_9, __pyx_k_9, sizeof(__pyx_k_9), 0, 0, 1, 0},
+  {&__pyx_kp_u_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 1, 0, 0},
   {&__pyx_n_s__F, __pyx_k__F, sizeof(__pyx_k__F), 0, 0, 1, 1},
+  {&__pyx_n_s__G, __pyx_k__G, sizeof(__pyx_k__G), 0, 0, 1, 1},
   {&__pyx_n_s__H, __pyx_k__H, sizeof(__pyx_k__H), 0, 0, 1, 1},
   {&__pyx_n_s__HI, __pyx_k__HI, sizeof(__pyx_k__HI), 0, 0, 1, 1},
   {&__pyx_n_s__HJ, __pyx_k__HJ, sizeof(__pyx_k__HJ), 0, 0, 1, 1},
   {&__pyx_n_s__RuntimeError, __pyx_k__RuntimeError, sizeof(__pyx_k__RuntimeError), 0, 0, 1, 1},
   {&__pyx_n_s__Size, __pyx_k__Size, sizeof(__pyx_k__Size), 0, 0, 1, 1},
+  {&__pyx_n_s__Thread, __pyx_k__Thread, sizeof(__pyx_k__Thread), 0, 0, 1, 1},
   {&__pyx_n_s__Tvox, __pyx_k__Tvox, sizeof(__pyx_k__Tvox), 0, 0, 1, 1},
   {&__pyx_n_s__ValueError, __pyx_k__ValueError, sizeof(__pyx_k__ValueError), 0, 0, 1, 1},
   {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
@@ -5842,6 +6841,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s___similarity3d, __pyx_k___similarity3d, sizeof(__pyx_k___similarity3d), 0, 0, 1, 1},
   {&__pyx_n_s__affine, __pyx_k__affine, sizeof(__pyx_k__affine), 0, 0, 1, 1},
   {&__pyx_n_s__affines, __pyx_k__affines, sizeof(__pyx_k__affines), 0, 0, 1, 1},
+  {&__pyx_n_s__args, __pyx_k__args, sizeof(__pyx_k__args), 0, 0, 1, 1},
   {&__pyx_n_s__array, __pyx_k__array, sizeof(__pyx_k__array), 0, 0, 1, 1},
   {&__pyx_n_s__base, __pyx_k__base, sizeof(__pyx_k__base), 0, 0, 1, 1},
   {&__pyx_n_s__buf, __pyx_k__buf, sizeof(__pyx_k__buf), 0, 0, 1, 1},
@@ -5853,6 +6853,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s__cr, __pyx_k__cr, sizeof(__pyx_k__cr), 0, 0, 1, 1},
   {&__pyx_n_s__crl1, __pyx_k__crl1, sizeof(__pyx_k__crl1), 0, 0, 1, 1},
   {&__pyx_n_s__custom, __pyx_k__custom, sizeof(__pyx_k__custom), 0, 0, 1, 1},
+  {&__pyx_n_s__dH, __pyx_k__dH, sizeof(__pyx_k__dH), 0, 0, 1, 1},
   {&__pyx_n_s__data, __pyx_k__data, sizeof(__pyx_k__data), 0, 0, 1, 1},
   {&__pyx_n_s__descr, __pyx_k__descr, sizeof(__pyx_k__descr), 0, 0, 1, 1},
   {&__pyx_n_s__diag, __pyx_k__diag, sizeof(__pyx_k__diag), 0, 0, 1, 1},
@@ -5866,6 +6867,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s__fields, __pyx_k__fields, sizeof(__pyx_k__fields), 0, 0, 1, 1},
   {&__pyx_n_s__format, __pyx_k__format, sizeof(__pyx_k__format), 0, 0, 1, 1},
   {&__pyx_n_s__im, __pyx_k__im, sizeof(__pyx_k__im), 0, 0, 1, 1},
+  {&__pyx_n_s__imI, __pyx_k__imI, sizeof(__pyx_k__imI), 0, 0, 1, 1},
   {&__pyx_n_s__imJ, __pyx_k__imJ, sizeof(__pyx_k__imJ), 0, 0, 1, 1},
   {&__pyx_n_s__index, __pyx_k__index, sizeof(__pyx_k__index), 0, 0, 1, 1},
   {&__pyx_n_s__interp, __pyx_k__interp, sizeof(__pyx_k__interp), 0, 0, 1, 1},
@@ -5874,6 +6876,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s__iterI, __pyx_k__iterI, sizeof(__pyx_k__iterI), 0, 0, 1, 1},
   {&__pyx_n_s__iters, __pyx_k__iters, sizeof(__pyx_k__iters), 0, 0, 1, 1},
   {&__pyx_n_s__je, __pyx_k__je, sizeof(__pyx_k__je), 0, 0, 1, 1},
+  {&__pyx_n_s__join, __pyx_k__join, sizeof(__pyx_k__join), 0, 0, 1, 1},
   {&__pyx_n_s__l1dev, __pyx_k__l1dev, sizeof(__pyx_k__l1dev), 0, 0, 1, 1},
   {&__pyx_n_s__linalg, __pyx_k__linalg, sizeof(__pyx_k__linalg), 0, 0, 1, 1},
   {&__pyx_n_s__llr_cc, __pyx_k__llr_cc, sizeof(__pyx_k__llr_cc), 0, 0, 1, 1},
@@ -5888,6 +6891,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s__method, __pyx_k__method, sizeof(__pyx_k__method), 0, 0, 1, 1},
   {&__pyx_n_s__mi, __pyx_k__mi, sizeof(__pyx_k__mi), 0, 0, 1, 1},
   {&__pyx_n_s__min, __pyx_k__min, sizeof(__pyx_k__min), 0, 0, 1, 1},
+  {&__pyx_n_s__n_threads, __pyx_k__n_threads, sizeof(__pyx_k__n_threads), 0, 0, 1, 1},
   {&__pyx_n_s__names, __pyx_k__names, sizeof(__pyx_k__names), 0, 0, 1, 1},
   {&__pyx_n_s__ndim, __pyx_k__ndim, sizeof(__pyx_k__ndim), 0, 0, 1, 1},
   {&__pyx_n_s__nmi, __pyx_k__nmi, sizeof(__pyx_k__nmi), 0, 0, 1, 1},
@@ -5909,18 +6913,24 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s__size, __pyx_k__size, sizeof(__pyx_k__size), 0, 0, 1, 1},
   {&__pyx_n_s__smi, __pyx_k__smi, sizeof(__pyx_k__smi), 0, 0, 1, 1},
   {&__pyx_n_s__stamp, __pyx_k__stamp, sizeof(__pyx_k__stamp), 0, 0, 1, 1},
+  {&__pyx_n_s__start, __pyx_k__start, sizeof(__pyx_k__start), 0, 0, 1, 1},
+  {&__pyx_n_s__stop, __pyx_k__stop, sizeof(__pyx_k__stop), 0, 0, 1, 1},
   {&__pyx_n_s__strides, __pyx_k__strides, sizeof(__pyx_k__strides), 0, 0, 1, 1},
   {&__pyx_n_s__suboffsets, __pyx_k__suboffsets, sizeof(__pyx_k__suboffsets), 0, 0, 1, 1},
+  {&__pyx_n_s__sum, __pyx_k__sum, sizeof(__pyx_k__sum), 0, 0, 1, 1},
   {&__pyx_n_s__t, __pyx_k__t, sizeof(__pyx_k__t), 0, 0, 1, 1},
   {&__pyx_n_s__t0, __pyx_k__t0, sizeof(__pyx_k__t0), 0, 0, 1, 1},
+  {&__pyx_n_s__target, __pyx_k__target, sizeof(__pyx_k__target), 0, 0, 1, 1},
   {&__pyx_n_s__texture, __pyx_k__texture, sizeof(__pyx_k__texture), 0, 0, 1, 1},
+  {&__pyx_n_s__threading, __pyx_k__threading, sizeof(__pyx_k__threading), 0, 0, 1, 1},
   {&__pyx_n_s__type_num, __pyx_k__type_num, sizeof(__pyx_k__type_num), 0, 0, 1, 1},
   {&__pyx_n_s__variance, __pyx_k__variance, sizeof(__pyx_k__variance), 0, 0, 1, 1},
   {&__pyx_n_s__zeros, __pyx_k__zeros, sizeof(__pyx_k__zeros), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetName(__pyx_b, __pyx_n_s__range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_range = __Pyx_GetName(__pyx_b, __pyx_n_s__range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_min = __Pyx_GetName(__pyx_b, __pyx_n_s__min); if (!__pyx_builtin_min) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_builtin_RuntimeError = __Pyx_GetName(__pyx_b, __pyx_n_s__RuntimeError); if (!__pyx_builtin_RuntimeError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   return 0;
@@ -5989,7 +6999,7 @@ PyMODINIT_FUNC PyInit__registration(void)
   #endif
   /*--- Module creation code ---*/
   #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("_registration"), __pyx_methods, __Pyx_DOCSTR(__pyx_k_8), 0, PYTHON_API_VERSION);
+  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("_registration"), __pyx_methods, __Pyx_DOCSTR(__pyx_k_9), 0, PYTHON_API_VERSION);
   #else
   __pyx_m = PyModule_Create(&__pyx_moduledef);
   #endif
@@ -6019,16 +7029,16 @@ PyMODINIT_FUNC PyInit__registration(void)
   /*--- Function import code ---*/
   /*--- Execution code ---*/
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":10
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":10
  * """
  * 
  * __version__ = '0.2'             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____version__, ((PyObject *)__pyx_kp_s_9)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 10; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____version__, ((PyObject *)__pyx_kp_s_10)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 10; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":57
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":65
  * 
  * # Initialize numpy
  * iconic_import_array()             # <<<<<<<<<<<<<<
@@ -6037,335 +7047,347 @@ PyMODINIT_FUNC PyInit__registration(void)
  */
   iconic_import_array();
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":58
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":66
  * # Initialize numpy
  * iconic_import_array()
  * import_array()             # <<<<<<<<<<<<<<
  * import numpy as np
- * 
+ * import threading
  */
   import_array();
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":59
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":67
  * iconic_import_array()
  * import_array()
  * import numpy as np             # <<<<<<<<<<<<<<
+ * import threading
+ * 
+ */
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__numpy), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__np, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":68
+ * import_array()
+ * import numpy as np
+ * import threading             # <<<<<<<<<<<<<<
  * 
  * # Enumerate texture measures
  */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__numpy), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__threading), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__np, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__threading, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":74
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":83
  * 
  * # Corresponding Python dictionary
  * builtin_textures = {             # <<<<<<<<<<<<<<
  *     'min': MIN,
  *     'max': MAX,
  */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":75
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":84
  * # Corresponding Python dictionary
  * builtin_textures = {
  *     'min': MIN,             # <<<<<<<<<<<<<<
  *     'max': MAX,
  *     'drange': DRANGE,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_MIN); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_MIN); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__min), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__min), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":76
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":85
  * builtin_textures = {
  *     'min': MIN,
  *     'max': MAX,             # <<<<<<<<<<<<<<
  *     'drange': DRANGE,
  *     'mean': MEAN,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_MAX); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_MAX); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 85; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__max), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__max), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":77
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":86
  *     'min': MIN,
  *     'max': MAX,
  *     'drange': DRANGE,             # <<<<<<<<<<<<<<
  *     'mean': MEAN,
  *     'variance': VARIANCE,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_DRANGE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_DRANGE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__drange), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__drange), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":78
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":87
  *     'max': MAX,
  *     'drange': DRANGE,
  *     'mean': MEAN,             # <<<<<<<<<<<<<<
  *     'variance': VARIANCE,
  *     'median': MEDIAN,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_MEAN); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_MEAN); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__mean), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__mean), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":79
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":88
  *     'drange': DRANGE,
  *     'mean': MEAN,
  *     'variance': VARIANCE,             # <<<<<<<<<<<<<<
  *     'median': MEDIAN,
  *     'l1dev': L1DEV,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_VARIANCE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 79; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_VARIANCE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 88; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__variance), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__variance), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":80
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":89
  *     'mean': MEAN,
  *     'variance': VARIANCE,
  *     'median': MEDIAN,             # <<<<<<<<<<<<<<
  *     'l1dev': L1DEV,
  *     'entropy': ENTROPY,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_MEDIAN); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_MEDIAN); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__median), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__median), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":81
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":90
  *     'variance': VARIANCE,
  *     'median': MEDIAN,
  *     'l1dev': L1DEV,             # <<<<<<<<<<<<<<
  *     'entropy': ENTROPY,
  *     'custom': CUSTOM_TEXTURE}
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_L1DEV); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_L1DEV); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__l1dev), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__l1dev), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":82
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":91
  *     'median': MEDIAN,
  *     'l1dev': L1DEV,
  *     'entropy': ENTROPY,             # <<<<<<<<<<<<<<
  *     'custom': CUSTOM_TEXTURE}
  * 
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_ENTROPY); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 82; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_ENTROPY); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__entropy), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__entropy), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":83
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":92
  *     'l1dev': L1DEV,
  *     'entropy': ENTROPY,
  *     'custom': CUSTOM_TEXTURE}             # <<<<<<<<<<<<<<
  * 
  * # Enumerate similarity measures
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_CUSTOM_TEXTURE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_CUSTOM_TEXTURE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__custom), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__custom), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__builtin_textures, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__builtin_textures, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":103
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":112
  * 
  * # Corresponding Python dictionary
  * builtin_similarities = {             # <<<<<<<<<<<<<<
  *     'cc': CORRELATION_COEFFICIENT,
  *     'cr': CORRELATION_RATIO,
  */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":104
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":113
  * # Corresponding Python dictionary
  * builtin_similarities = {
  *     'cc': CORRELATION_COEFFICIENT,             # <<<<<<<<<<<<<<
  *     'cr': CORRELATION_RATIO,
  *     'crl1': CORRELATION_RATIO_L1,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_CORRELATION_COEFFICIENT); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_CORRELATION_COEFFICIENT); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__cc), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__cc), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":105
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":114
  * builtin_similarities = {
  *     'cc': CORRELATION_COEFFICIENT,
  *     'cr': CORRELATION_RATIO,             # <<<<<<<<<<<<<<
  *     'crl1': CORRELATION_RATIO_L1,
  *     'mi': MUTUAL_INFORMATION,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_CORRELATION_RATIO); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_CORRELATION_RATIO); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__cr), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__cr), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":106
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":115
  *     'cc': CORRELATION_COEFFICIENT,
  *     'cr': CORRELATION_RATIO,
  *     'crl1': CORRELATION_RATIO_L1,             # <<<<<<<<<<<<<<
  *     'mi': MUTUAL_INFORMATION,
  *     'je': JOINT_ENTROPY,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_CORRELATION_RATIO_L1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_CORRELATION_RATIO_L1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__crl1), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__crl1), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":107
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":116
  *     'cr': CORRELATION_RATIO,
  *     'crl1': CORRELATION_RATIO_L1,
  *     'mi': MUTUAL_INFORMATION,             # <<<<<<<<<<<<<<
  *     'je': JOINT_ENTROPY,
  *     'ce': CONDITIONAL_ENTROPY,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_MUTUAL_INFORMATION); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_MUTUAL_INFORMATION); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__mi), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__mi), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":108
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":117
  *     'crl1': CORRELATION_RATIO_L1,
  *     'mi': MUTUAL_INFORMATION,
  *     'je': JOINT_ENTROPY,             # <<<<<<<<<<<<<<
  *     'ce': CONDITIONAL_ENTROPY,
  *     'nmi': NORMALIZED_MUTUAL_INFORMATION,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_JOINT_ENTROPY); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_JOINT_ENTROPY); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__je), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__je), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":109
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":118
  *     'mi': MUTUAL_INFORMATION,
  *     'je': JOINT_ENTROPY,
  *     'ce': CONDITIONAL_ENTROPY,             # <<<<<<<<<<<<<<
  *     'nmi': NORMALIZED_MUTUAL_INFORMATION,
  *     'smi': SUPERVISED_MUTUAL_INFORMATION,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_CONDITIONAL_ENTROPY); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_CONDITIONAL_ENTROPY); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__ce), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__ce), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":110
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":119
  *     'je': JOINT_ENTROPY,
  *     'ce': CONDITIONAL_ENTROPY,
  *     'nmi': NORMALIZED_MUTUAL_INFORMATION,             # <<<<<<<<<<<<<<
  *     'smi': SUPERVISED_MUTUAL_INFORMATION,
  *     'llr_cc': LLR_CORRELATION_COEFFICIENT,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_NORMALIZED_MUTUAL_INFORMATION); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_NORMALIZED_MUTUAL_INFORMATION); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__nmi), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__nmi), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":111
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":120
  *     'ce': CONDITIONAL_ENTROPY,
  *     'nmi': NORMALIZED_MUTUAL_INFORMATION,
  *     'smi': SUPERVISED_MUTUAL_INFORMATION,             # <<<<<<<<<<<<<<
  *     'llr_cc': LLR_CORRELATION_COEFFICIENT,
  *     'llr_cr': LLR_CORRELATION_RATIO,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_SUPERVISED_MUTUAL_INFORMATION); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_SUPERVISED_MUTUAL_INFORMATION); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__smi), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__smi), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":112
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":121
  *     'nmi': NORMALIZED_MUTUAL_INFORMATION,
  *     'smi': SUPERVISED_MUTUAL_INFORMATION,
  *     'llr_cc': LLR_CORRELATION_COEFFICIENT,             # <<<<<<<<<<<<<<
  *     'llr_cr': LLR_CORRELATION_RATIO,
  *     'llr_crl1': LLR_CORRELATION_RATIO_L1,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_CORRELATION_COEFFICIENT); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_CORRELATION_COEFFICIENT); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__llr_cc), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__llr_cc), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":113
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":122
  *     'smi': SUPERVISED_MUTUAL_INFORMATION,
  *     'llr_cc': LLR_CORRELATION_COEFFICIENT,
  *     'llr_cr': LLR_CORRELATION_RATIO,             # <<<<<<<<<<<<<<
  *     'llr_crl1': LLR_CORRELATION_RATIO_L1,
  *     'llr_mi': LLR_MUTUAL_INFORMATION,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_CORRELATION_RATIO); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_CORRELATION_RATIO); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__llr_cr), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__llr_cr), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":114
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":123
  *     'llr_cc': LLR_CORRELATION_COEFFICIENT,
  *     'llr_cr': LLR_CORRELATION_RATIO,
  *     'llr_crl1': LLR_CORRELATION_RATIO_L1,             # <<<<<<<<<<<<<<
  *     'llr_mi': LLR_MUTUAL_INFORMATION,
  *     'llr_smi': LLR_SUPERVISED_MUTUAL_INFORMATION,
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_CORRELATION_RATIO_L1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_CORRELATION_RATIO_L1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__llr_crl1), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__llr_crl1), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":115
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":124
  *     'llr_cr': LLR_CORRELATION_RATIO,
  *     'llr_crl1': LLR_CORRELATION_RATIO_L1,
  *     'llr_mi': LLR_MUTUAL_INFORMATION,             # <<<<<<<<<<<<<<
  *     'llr_smi': LLR_SUPERVISED_MUTUAL_INFORMATION,
  *     'custom': CUSTOM_SIMILARITY}
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_MUTUAL_INFORMATION); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_MUTUAL_INFORMATION); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__llr_mi), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__llr_mi), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":116
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":125
  *     'llr_crl1': LLR_CORRELATION_RATIO_L1,
  *     'llr_mi': LLR_MUTUAL_INFORMATION,
  *     'llr_smi': LLR_SUPERVISED_MUTUAL_INFORMATION,             # <<<<<<<<<<<<<<
  *     'custom': CUSTOM_SIMILARITY}
  * 
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_SUPERVISED_MUTUAL_INFORMATION); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_LLR_SUPERVISED_MUTUAL_INFORMATION); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__llr_smi), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__llr_smi), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":117
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":126
  *     'llr_mi': LLR_MUTUAL_INFORMATION,
  *     'llr_smi': LLR_SUPERVISED_MUTUAL_INFORMATION,
  *     'custom': CUSTOM_SIMILARITY}             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_CUSTOM_SIMILARITY); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyInt_FromLong(__pyx_e_4nipy_9neurospin_12registration_13_registration_CUSTOM_SIMILARITY); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__custom), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, ((PyObject *)__pyx_n_s__custom), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_10, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_11, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":292
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":364
  * 
  * # Corresponding Python constants
  * affines = ['rigid', 'similarity', 'affine']             # <<<<<<<<<<<<<<
  * 
  * _rigid2d = [0,1,5]
  */
-  __pyx_t_1 = PyList_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyList_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 364; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
   __Pyx_INCREF(((PyObject *)__pyx_n_s__rigid));
   PyList_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_n_s__rigid));
@@ -6376,17 +7398,17 @@ PyMODINIT_FUNC PyInit__registration(void)
   __Pyx_INCREF(((PyObject *)__pyx_n_s__affine));
   PyList_SET_ITEM(__pyx_t_1, 2, ((PyObject *)__pyx_n_s__affine));
   __Pyx_GIVEREF(((PyObject *)__pyx_n_s__affine));
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__affines, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__affines, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 364; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":294
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":366
  * affines = ['rigid', 'similarity', 'affine']
  * 
  * _rigid2d = [0,1,5]             # <<<<<<<<<<<<<<
  * _similarity2d = [0,1,5,6,7]
  * _affine2d = [0,1,5,6,7,11]
  */
-  __pyx_t_1 = PyList_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyList_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 366; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
   __Pyx_INCREF(__pyx_int_0);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_0);
@@ -6397,17 +7419,17 @@ PyMODINIT_FUNC PyInit__registration(void)
   __Pyx_INCREF(__pyx_int_5);
   PyList_SET_ITEM(__pyx_t_1, 2, __pyx_int_5);
   __Pyx_GIVEREF(__pyx_int_5);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___rigid2d, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___rigid2d, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 366; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":295
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":367
  * 
  * _rigid2d = [0,1,5]
  * _similarity2d = [0,1,5,6,7]             # <<<<<<<<<<<<<<
  * _affine2d = [0,1,5,6,7,11]
  * _rigid3d = range(6)
  */
-  __pyx_t_1 = PyList_New(5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyList_New(5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
   __Pyx_INCREF(__pyx_int_0);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_0);
@@ -6424,17 +7446,17 @@ PyMODINIT_FUNC PyInit__registration(void)
   __Pyx_INCREF(__pyx_int_7);
   PyList_SET_ITEM(__pyx_t_1, 4, __pyx_int_7);
   __Pyx_GIVEREF(__pyx_int_7);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___similarity2d, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___similarity2d, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":296
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":368
  * _rigid2d = [0,1,5]
  * _similarity2d = [0,1,5,6,7]
  * _affine2d = [0,1,5,6,7,11]             # <<<<<<<<<<<<<<
  * _rigid3d = range(6)
  * _similarity3d = range(9)
  */
-  __pyx_t_1 = PyList_New(6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 296; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyList_New(6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 368; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
   __Pyx_INCREF(__pyx_int_0);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_0);
@@ -6454,97 +7476,97 @@ PyMODINIT_FUNC PyInit__registration(void)
   __Pyx_INCREF(__pyx_int_11);
   PyList_SET_ITEM(__pyx_t_1, 5, __pyx_int_11);
   __Pyx_GIVEREF(__pyx_int_11);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___affine2d, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 296; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___affine2d, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 368; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":297
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":369
  * _similarity2d = [0,1,5,6,7]
  * _affine2d = [0,1,5,6,7,11]
  * _rigid3d = range(6)             # <<<<<<<<<<<<<<
  * _similarity3d = range(9)
  * _affine3d = range(12)
  */
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_int_6);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_int_6);
   __Pyx_GIVEREF(__pyx_int_6);
-  __pyx_t_2 = PyObject_Call(__pyx_builtin_range, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_Call(__pyx_builtin_range, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___rigid3d, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___rigid3d, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":298
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":370
  * _affine2d = [0,1,5,6,7,11]
  * _rigid3d = range(6)
  * _similarity3d = range(9)             # <<<<<<<<<<<<<<
  * _affine3d = range(12)
  * 
  */
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 370; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_int_9);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_int_9);
   __Pyx_GIVEREF(__pyx_int_9);
-  __pyx_t_1 = PyObject_Call(__pyx_builtin_range, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_Call(__pyx_builtin_range, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 370; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___similarity3d, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___similarity3d, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 370; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":299
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":371
  * _rigid3d = range(6)
  * _similarity3d = range(9)
  * _affine3d = range(12)             # <<<<<<<<<<<<<<
  * 
  * _affines = [_rigid2d, _similarity2d[0:4], _affine2d,
  */
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_int_12);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_int_12);
   __Pyx_GIVEREF(__pyx_int_12);
-  __pyx_t_2 = PyObject_Call(__pyx_builtin_range, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_Call(__pyx_builtin_range, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___affine3d, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___affine3d, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":301
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":373
  * _affine3d = range(12)
  * 
  * _affines = [_rigid2d, _similarity2d[0:4], _affine2d,             # <<<<<<<<<<<<<<
  *             _rigid3d, _similarity3d[0:7], _affine3d]
  * 
  */
-  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s___rigid2d); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s___rigid2d); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s___similarity2d); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s___similarity2d); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PySequence_GetSlice(__pyx_t_1, 0, 4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PySequence_GetSlice(__pyx_t_1, 0, 4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s___affine2d); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s___affine2d); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":302
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":374
  * 
  * _affines = [_rigid2d, _similarity2d[0:4], _affine2d,
  *             _rigid3d, _similarity3d[0:7], _affine3d]             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s___rigid3d); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s___rigid3d); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s___similarity3d); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s___similarity3d); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PySequence_GetSlice(__pyx_t_5, 0, 7); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = PySequence_GetSlice(__pyx_t_5, 0, 7); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s___affine3d); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_GetName(__pyx_m, __pyx_n_s___affine3d); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_7 = PyList_New(6); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = PyList_New(6); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_7));
   PyList_SET_ITEM(__pyx_t_7, 0, __pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -6564,19 +7586,19 @@ PyMODINIT_FUNC PyInit__registration(void)
   __pyx_t_4 = 0;
   __pyx_t_6 = 0;
   __pyx_t_5 = 0;
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___affines, ((PyObject *)__pyx_t_7)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___affines, ((PyObject *)__pyx_t_7)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_t_7)); __pyx_t_7 = 0;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":347
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":419
  * 
  * 
  * def param_to_vector12(ndarray param, ndarray t0, ndarray precond, int stamp=AFFINE3D):             # <<<<<<<<<<<<<<
  *     """
  *     t = param_to_vector12(p, t, precond, stamp=AFFINE3D).
  */
-  __pyx_k_1 = __pyx_e_4nipy_9neurospin_12registration_13_registration_AFFINE3D;
+  __pyx_k_2 = __pyx_e_4nipy_9neurospin_12registration_13_registration_AFFINE3D;
 
-  /* "/volatile/thirion/mygit/nipy-clone/nipy/neurospin/registration/_registration.pyx":1
+  /* "/root/package/nipy/neurospin/registration/_registration.pyx":1
  * # -*- Mode: Python -*-             # <<<<<<<<<<<<<<
  * 
  * """
@@ -6588,47 +7610,61 @@ PyMODINIT_FUNC PyInit__registration(void)
   __pyx_t_6 = __Pyx_GetAttrString(__pyx_t_5, "__doc__");
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_11), __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_12), __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __pyx_t_6 = PyObject_GetAttr(__pyx_m, __pyx_n_s___joint_histogram); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_6);
   __pyx_t_5 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_12), __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_13), __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyObject_GetAttr(__pyx_m, __pyx_n_s_1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_GetAttrString(__pyx_t_5, "__doc__");
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_14), __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = PyObject_GetAttr(__pyx_m, __pyx_n_s_16); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_15), __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_5 = PyObject_GetAttr(__pyx_m, __pyx_n_s___similarity); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __pyx_t_6 = __Pyx_GetAttrString(__pyx_t_5, "__doc__");
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_13), __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_17), __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __pyx_t_6 = PyObject_GetAttr(__pyx_m, __pyx_n_s__rotation_vec2mat); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_6);
   __pyx_t_5 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_14), __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_18), __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_5 = PyObject_GetAttr(__pyx_m, __pyx_n_s__param_to_vector12); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __pyx_t_6 = __Pyx_GetAttrString(__pyx_t_5, "__doc__");
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_15), __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_19), __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __pyx_t_6 = PyObject_GetAttr(__pyx_m, __pyx_n_s__matrix44); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_6);
   __pyx_t_5 = __Pyx_GetAttrString(__pyx_t_6, "__doc__");
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_16), __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_7, ((PyObject *)__pyx_kp_u_20), __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   if (PyObject_SetAttr(__pyx_m, __pyx_n_s____test__, ((PyObject *)__pyx_t_7)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(((PyObject *)__pyx_t_7)); __pyx_t_7 = 0;
 
-  /* "/home/bt206016/usr/lib/python2.5/site-packages/Cython/Includes/stdlib.pxd":2
+  /* "/tmp/cy012/Cython/Includes/stdlib.pxd":2
  * 
  * cdef extern from "stdlib.h" nogil:             # <<<<<<<<<<<<<<
  *     void free(void *ptr)
@@ -6804,6 +7840,13 @@ static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
     return 0;
 }
 
+static CYTHON_INLINE long __Pyx_div_long(long a, long b) {
+    long q = a / b;
+    long r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
+}
+
 static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
     PyErr_Format(PyExc_ValueError,
         #if PY_VERSION_HEX < 0x02050000
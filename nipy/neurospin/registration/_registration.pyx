@@ -33,6 +33,14 @@ cdef extern from "iconic.h":
     void joint_histogram(double* H, unsigned int clampI, unsigned int clampJ,  
                          flatiter iterI, ndarray imJ_padded, 
                          double* Tvox, int affine, int interp)
+    void joint_histogram_range(double* H, unsigned int clampI, unsigned int clampJ, 
+                               void* imI, size_t start, size_t stop, 
+                               void* imJ_padded, double* Tvox, int affine, 
+                               int interp, size_t chunk) nogil
+    int JOINT_HISTOGRAM_CHUNK
+    void joint_histogram_gradient(double* G, double* dH, unsigned int clampI, 
+                                  unsigned int clampJ, flatiter iterI, ndarray imJ_padded, 
+                                  double* Tvox)
     double correlation_coefficient(double* H, unsigned int clampI, unsigned int clampJ, double* n)
     double correlation_ratio(double* H, unsigned int clampI, unsigned int clampJ, double* n) 
     double correlation_ratio_L1(double* H, double* hI, unsigned int clampI, unsigned int clampJ, double* n) 
@@ -57,6 +65,7 @@ cdef extern from "iconic.h":
 iconic_import_array()
 import_array()
 import numpy as np
+import threading
 
 # Enumerate texture measures
 cdef enum texture_measure: 
@@ -195,13 +204,19 @@ def _histogram(ndarray H, flatiter iter):
     return 
 
 
-def _joint_histogram(ndarray H, flatiter iterI, ndarray imJ, ndarray Tvox, int affine, int interp):
+def _joint_histogram(ndarray H, flatiter iterI, ndarray imJ, ndarray Tvox, int affine, int interp, 
+                     int n_threads=1):
     """
-    _joint_histogram(H, iterI, imJ, Tvox, interp)
+    _joint_histogram(H, iterI, imJ, Tvox, interp, n_threads=1)
     Comments to follow.
+
+    If n_threads is greater than one, the source voxels are split into
+    ranges of whole chunks, whose partial histograms are computed by
+    parallel threads and summed into H. 
     """
     cdef double *h, *tvox
     cdef unsigned int clampI, clampJ
+    cdef long size, nchunks 
 
     # Views
     clampI = <unsigned int>H.shape[0]
@@ -210,8 +225,65 @@ def _joint_histogram(ndarray H, flatiter iterI, ndarray imJ, ndarray Tvox, int a
     tvox = <double*>Tvox.data
 
     # Compute joint histogram 
-    joint_histogram(h, clampI, clampJ, iterI, imJ, tvox, affine, interp)
+    size = iterI.base.size
+    nchunks = (size + JOINT_HISTOGRAM_CHUNK - 1) / JOINT_HISTOGRAM_CHUNK
+    if n_threads > nchunks:
+        n_threads = nchunks
+    if n_threads <= 1: 
+        joint_histogram(h, clampI, clampJ, iterI, imJ, tvox, affine, interp)
+        return 
+
+    # Threaded computation of partial histograms 
+    bounds = [min(size, JOINT_HISTOGRAM_CHUNK * (nchunks * i / n_threads))
+              for i in range(n_threads + 1)]
+    Hs = np.zeros([n_threads, clampI, clampJ])
+    threads = []
+    for i in range(n_threads):
+        thread = threading.Thread(
+            target=_joint_histogram_range, 
+            args=(Hs[i], iterI.base, imJ, Tvox, affine, interp, 
+                  bounds[i], bounds[i+1]))
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    H[:] = Hs.sum(0)
+    return 
+
 
+def _joint_histogram_range(ndarray H, ndarray imI, ndarray imJ, ndarray Tvox, 
+                           int affine, int interp, size_t start, size_t stop):
+    """
+    Add the contributions of source voxels start to stop-1 to H,
+    releasing the GIL. 
+    """
+    cdef double *h = <double*>H.data
+    cdef double *tvox = <double*>Tvox.data
+    cdef void *i = <void*>imI
+    cdef void *j = <void*>imJ
+    cdef unsigned int clampI = <unsigned int>H.shape[0]
+    cdef unsigned int clampJ = <unsigned int>H.shape[1]    
+    cdef size_t chunk = JOINT_HISTOGRAM_CHUNK
+    with nogil: 
+        joint_histogram_range(h, clampI, clampJ, i, start, stop, j, tvox, 
+                              affine, interp, chunk)
+    return 
+
+
+def _joint_histogram_gradient(ndarray G, ndarray dH, flatiter iterI, ndarray imJ, 
+                              ndarray Tvox):
+    """
+    _joint_histogram_gradient(G, dH, iterI, imJ, Tvox)
+
+    Store in the 12-sized array G the derivatives with respect to the
+    affine voxel transformation Tvox of a function of the partial
+    volume joint histogram, given its derivatives dH with respect to
+    the histogram entries.
+    """
+    cdef unsigned int clampI = <unsigned int>dH.shape[0]
+    cdef unsigned int clampJ = <unsigned int>dH.shape[1]
+    joint_histogram_gradient(<double*>G.data, <double*>dH.data, clampI, clampJ, 
+                             iterI, imJ, <double*>Tvox.data)
     return 
 
 
@@ -186,6 +186,25 @@ class Affine(object):
     def __array__(self, dtype='double'): 
         return matrix44(self._vec12, dtype=dtype)
 
+    def matrix_gradient(self, delta=1e-6): 
+        """
+        Derivatives of the 4x4 matrix with respect to the parameters,
+        as an array of shape (nparams, 4, 4), computed by central
+        differences.
+        """
+        vec12 = self._vec12.copy()
+        p0 = self.param
+        G = np.zeros([p0.size, 4, 4])
+        for k in range(p0.size): 
+            dp = np.zeros(p0.size)
+            dp[k] = delta
+            self.param = p0 + dp
+            G[k] = self.__array__()
+            self.param = p0 - dp
+            G[k] -= self.__array__()
+        self._vec12 = vec12
+        return G/(2*delta)
+
     def __str__(self): 
         string  = 'translation : %s\n' % self._vec12[0:3].__str__()
         string += 'rotation    : %s\n' % self._vec12[3:6].__str__()
@@ -220,6 +220,31 @@ void joint_histogram(double* H,
 		     const double* Tvox, 
 		     int affine, 
 		     int interp)
+{
+  /* Re-initialize joint histogram */ 
+  memset((void*)H, 0, clampI*clampJ*sizeof(double));
+
+  /* Loop over all source voxels */ 
+  joint_histogram_range(H, clampI, clampJ, 
+			(const PyArrayObject*)iterI->ao, 0, iterI->size, 
+			imJ_padded, Tvox, affine, interp, 
+			JOINT_HISTOGRAM_CHUNK); 
+
+  return; 
+}
+
+
+void joint_histogram_range(double* H, 
+			   unsigned int clampI, 
+			   unsigned int clampJ,  
+			   const PyArrayObject* imI,
+			   size_t start, 
+			   size_t stop, 
+			   const PyArrayObject* imJ_padded, 
+			   const double* Tvox, 
+			   int affine, 
+			   int interp, 
+			   size_t chunk)
 {
   const signed short* J=(signed short*)imJ_padded->data; 
   size_t dimJX=imJ_padded->dimensions[0]-2;
@@ -239,7 +264,13 @@ void joint_histogram(double* H,
   size_t u7 = u6+1; 
   double wx, wy, wz, wxwy, wxwz, wywz; 
   double W0, W2, W3, W4; 
-  size_t x, y, z; 
+  const char* dataI = imI->data; 
+  size_t dimIY = imI->dimensions[1]; 
+  size_t dimIZ = imI->dimensions[2]; 
+  npy_intp strideIX = imI->strides[0]; 
+  npy_intp strideIY = imI->strides[1]; 
+  npy_intp strideIZ = imI->strides[2]; 
+  size_t k, x, y, z; 
   int nn, nx, ny, nz;
   double Tx, Ty, Tz; 
   double *bufTvox = (double*)Tvox; 
@@ -247,12 +278,6 @@ void joint_histogram(double* H,
   void* interp_params = NULL; 
   rk_state rng; 
 
-  /* Reset the source image iterator */
-  PyArray_ITER_RESET(iterI);
-
-  /* Make sure the iterator the iterator will update coordinate values */ 
-  UPDATE_ITERATOR_COORDS(iterI); 
-
   /* Set interpolation method */ 
   if (interp==0) 
     interpolate = &_pv_interpolation;
@@ -260,28 +285,32 @@ void joint_histogram(double* H,
     interpolate = &_tri_interpolation; 
   else { /* interp < 0 */ 
     interpolate = &_rand_interpolation;
-    rk_seed(-interp, &rng); 
     interp_params = (void*)(&rng); 
   }
 
-  /* Re-initialize joint histogram */ 
-  memset((void*)H, 0, clampI*clampJ*sizeof(double));
+  /* Grid coordinates of the first source voxel, in C order */ 
+  x = start / (dimIY*dimIZ); 
+  y = (start / dimIZ) % dimIY; 
+  z = start % dimIZ; 
+  if (!affine) 
+    bufTvox += 3*start; 
 
-  /* Looop over source voxels */
-  while(iterI->index < iterI->size) {
+  /* Loop over source voxels */
+  for (k=start; k<stop; k++) {
+
+    /* Each chunk of source voxels has its own random generator,
+       seeded from -interp and the chunk index */
+    if ((interp<0) && ((k==start) || (k%chunk==0))) 
+      rk_seed((unsigned long)(-interp) + k/chunk, &rng); 
   
     /* Source voxel intensity */
-    bufI = (signed short*)PyArray_ITER_DATA(iterI); 
+    bufI = (signed short*)(dataI + x*strideIX + y*strideIY + z*strideIZ); 
     i = bufI[0];
 
     /* Compute the transformed grid coordinates of current voxel */ 
-    if (affine) {
-      /* Get voxel coordinates and apply transformation on-the-fly*/
-      x = iterI->coordinates[0];
-      y = iterI->coordinates[1];
-      z = iterI->coordinates[2];
+    if (affine) 
+      /* Apply transformation on-the-fly*/
       _affine_transform(&Tx, &Ty, &Tz, Tvox, x, y, z); 
-    }
     else 
       /* Use precomputed transformed coordinates */ 
       bufTvox = _precomputed_transform(&Tx, &Ty, &Tz, (const double*)bufTvox);
@@ -368,8 +397,16 @@ void joint_histogram(double* H,
       
     } /* End of IF TRANSFORMS INSIDE */
     
-    /* Update source index */ 
-    PyArray_ITER_NEXT(iterI); 
+    /* Update source coordinates */ 
+    z ++; 
+    if (z == dimIZ) {
+      z = 0; 
+      y ++; 
+      if (y == dimIY) {
+	y = 0; 
+	x ++; 
+      }
+    }
     
   } /* End of loop over voxels */ 
   
@@ -378,6 +415,112 @@ void joint_histogram(double* H,
 }
 
 
+/* 
+   Each of the 8 neighbors of a transformed point has partial volume
+   weight fx*fy*fz, where fx is wx for the floor neighbors along x
+   and 1-wx for the ceil neighbors, so that its derivative with
+   respect to Tx is -fy*fz for the floor neighbors, and fy*fz for the
+   ceil neighbors. Neighbors with negative intensity do not
+   contribute to the histogram.
+*/ 
+
+#define ADD_NEIGHBOR_GRADIENT(q, sx, sy, sz, fx, fy, fz)	\
+  j = J[q];							\
+  if (j>=0) {							\
+    d = dH[clampJ_i+j];						\
+    gx += (sx)*d*(fy)*(fz);					\
+    gy += (sy)*d*(fx)*(fz);					\
+    gz += (sz)*d*(fx)*(fy); }
+
+
+void joint_histogram_gradient(double* G, 
+			      const double* dH, 
+			      unsigned int clampI, 
+			      unsigned int clampJ,  
+			      PyArrayIterObject* iterI,
+			      const PyArrayObject* imJ_padded, 
+			      const double* Tvox)
+{
+  const PyArrayObject* imI = (const PyArrayObject*)iterI->ao; 
+  const signed short* J=(signed short*)imJ_padded->data; 
+  size_t dimJX=imJ_padded->dimensions[0]-2;
+  size_t dimJY=imJ_padded->dimensions[1]-2; 
+  size_t dimJZ=imJ_padded->dimensions[2]-2;  
+  size_t u2 = imJ_padded->dimensions[2]; 
+  size_t u3 = u2+1; 
+  size_t u4 = imJ_padded->dimensions[1]*u2;
+  size_t u5 = u4+1; 
+  size_t u6 = u4+u2; 
+  size_t u7 = u6+1; 
+  const char* dataI = imI->data; 
+  size_t dimIY = imI->dimensions[1]; 
+  size_t dimIZ = imI->dimensions[2]; 
+  npy_intp strideIX = imI->strides[0]; 
+  npy_intp strideIY = imI->strides[1]; 
+  npy_intp strideIZ = imI->strides[2]; 
+  size_t k, x, y, z, off, clampJ_i; 
+  signed short i, j;
+  int nx, ny, nz;
+  double Tx, Ty, Tz, wx, wy, wz, vx, vy, vz, d, gx, gy, gz; 
+
+  memset((void*)G, 0, 12*sizeof(double));
+  x = y = z = 0; 
+
+  for (k=0; k<iterI->size; k++) {
+
+    i = *((signed short*)(dataI + x*strideIX + y*strideIY + z*strideIZ)); 
+    _affine_transform(&Tx, &Ty, &Tz, Tvox, x, y, z); 
+
+    if ((i>=0) && 
+	(Tx>-1) && (Tx<dimJX) && 
+	(Ty>-1) && (Ty<dimJY) && 
+	(Tz>-1) && (Tz<dimJZ)) {
+
+      /* Same neighbors and weights as in joint_histogram_range */ 
+      nx = FLOOR(Tx) + 1;
+      ny = FLOOR(Ty) + 1;
+      nz = FLOOR(Tz) + 1;
+      wx = nx - Tx; 
+      wy = ny - Ty;
+      wz = nz - Tz;
+      vx = 1 - wx; 
+      vy = 1 - wy; 
+      vz = 1 - wz; 
+      off = nx*u4 + ny*u2 + nz; 
+      clampJ_i = clampJ*i; 
+      gx = gy = gz = 0.0; 
+
+      ADD_NEIGHBOR_GRADIENT(off, -1, -1, -1, wx, wy, wz); 
+      ADD_NEIGHBOR_GRADIENT(off+1, -1, -1, 1, wx, wy, vz); 
+      ADD_NEIGHBOR_GRADIENT(off+u2, -1, 1, -1, wx, vy, wz); 
+      ADD_NEIGHBOR_GRADIENT(off+u3, -1, 1, 1, wx, vy, vz); 
+      ADD_NEIGHBOR_GRADIENT(off+u4, 1, -1, -1, vx, wy, wz); 
+      ADD_NEIGHBOR_GRADIENT(off+u5, 1, -1, 1, vx, wy, vz); 
+      ADD_NEIGHBOR_GRADIENT(off+u6, 1, 1, -1, vx, vy, wz); 
+      ADD_NEIGHBOR_GRADIENT(off+u7, 1, 1, 1, vx, vy, vz); 
+
+      /* Chain rule: T = Tvox (x, y, z, 1) */ 
+      G[0] += gx*x; G[1] += gx*y; G[2] += gx*z; G[3] += gx; 
+      G[4] += gy*x; G[5] += gy*y; G[6] += gy*z; G[7] += gy; 
+      G[8] += gz*x; G[9] += gz*y; G[10] += gz*z; G[11] += gz; 
+    }
+
+    /* Update source coordinates */ 
+    z ++; 
+    if (z == dimIZ) {
+      z = 0; 
+      y ++; 
+      if (y == dimIY) {
+	y = 0; 
+	x ++; 
+      }
+    }
+  }
+
+  return; 
+}
+
+
 /* Partial Volume interpolation. See Maes et al, IEEE TMI, 2007. */ 
 static inline void _pv_interpolation(unsigned int i, 
 				     double* H, unsigned int clampJ, 
@@ -64,6 +64,42 @@ extern "C" {
 			      int affine, 
 			      int interp); 
 
+  /* 
+     Add the contributions of the source voxels with flat (C order)
+     indices start to stop-1 of the 3d array imI to a joint histogram,
+     without the Python API, so that it can run with the GIL released
+     on separate partial histograms. Random interpolation reseeds its
+     generator at each chunk of `chunk` source voxels, with seed
+     -interp plus the chunk index, so that ranges aligned on chunks
+     give the same histogram counts whatever the split.
+  */ 
+#define JOINT_HISTOGRAM_CHUNK 16384
+  extern void joint_histogram_range(double* H, 
+				    unsigned int clampI, 
+				    unsigned int clampJ,  
+				    const PyArrayObject* imI,
+				    size_t start, 
+				    size_t stop, 
+				    const PyArrayObject* imJ_padded, 
+				    const double* Tvox, 
+				    int affine, 
+				    int interp, 
+				    size_t chunk); 
+
+  /*
+    Gradient of a function of the partial volume joint histogram with
+    respect to the 3x4 affine voxel transformation Tvox: dH holds the
+    derivatives of the function with respect to the histogram entries
+    (clampI x clampJ), and the 12 derivatives are stored in G.
+  */ 
+  extern void joint_histogram_gradient(double* G, 
+				       const double* dH, 
+				       unsigned int clampI, 
+				       unsigned int clampJ,  
+				       PyArrayIterObject* iterI,
+				       const PyArrayObject* imJ_padded, 
+				       const double* Tvox); 
+
 
   extern double entropy(const double* h, unsigned int size, double* n); 
   extern void drange(const double* h, unsigned int size, double* res);
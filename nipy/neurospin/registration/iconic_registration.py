@@ -8,7 +8,8 @@ Questions: alexis.roche@gmail.com
 
 from constants import _OPTIMIZER, _XTOL, _FTOL, _GTOL, _STEP
 
-from _registration import _joint_histogram, _similarity, builtin_similarities
+from _registration import _joint_histogram, _joint_histogram_gradient, \
+    _similarity, builtin_similarities
 from affine import Affine
 from grid_transform import GridTransform
 
@@ -16,13 +17,17 @@ from nipy.neurospin.image import Image, apply_affine
 from nipy.neurospin.utils.optimize import fmin_steepest
 
 import numpy as np  
+from scipy.ndimage import gaussian_filter
 from scipy.optimize import fmin as fmin_simplex, fmin_powell, fmin_cg, fmin_bfgs
-from sys import maxint
 
 
 _CLAMP_DTYPE = 'short' # do not edit
 _INTERP = 'pv'
+_MAX_SEED = 2**31 - 1 # random interpolation seeds fit a C int
+_TINY = 1e-30 # as in iconic.c
 _OPTIMIZER = 'powell'
+_PYRAMID = (4, 2, 1) # decimation factors, coarse to fine
+_PYRAMID_SIGMA = .5 # Gaussian smoothing, in decimation factor units
 
 # Dictionary of interpolation methods
 # pv: Partial volume 
@@ -33,17 +38,28 @@ interp_methods = {'pv': 0, 'tri': 1, 'rand': -1}
 
 class IconicRegistration(object):
 
-    def __init__(self, source, target, bins = 256):
+    def __init__(self, source, target, bins = 256, n_threads = 1):
 
         """
         A class to reprensent a generic intensity-based image
         registration algorithm.
+
+        The joint histogram is computed by n_threads parallel threads,
+        each accumulating a partial histogram over a range of source
+        voxels.
         """
 
         # Binning size  
         if isinstance (bins, (int, long, float)): 
             bins = [int(bins), int(bins)]
 
+        # Keep the input images for the pyramid levels
+        self._source_input = source
+        self._target_input = target
+        self._bins = bins
+        self._levels = {}
+        self.n_threads = n_threads
+
         # Source image binning
         values, s_bins = clamp(source.values(), bins=bins[0])
         self._source_image = source.set(values)
@@ -134,13 +150,14 @@ class IconicRegistration(object):
             Tv = np.dot(self._target_fromworld, np.dot(T, self._source_toworld)) 
         seed = self._interp
         if self._interp < 0:
-            seed = - np.random.randint(maxint)
+            seed = - np.random.randint(1, _MAX_SEED)
         _joint_histogram(self._joint_hist, 
                          self._source.flat, ## array iterator
                          self._target, 
                          Tv,
                          affine,
-                         seed)
+                         seed, 
+                         self.n_threads)
         #self.source_hist = np.sum(self._joint_hist, 1)
         #self.target_hist = np.sum(self._joint_hist, 0)
         return _similarity(self._joint_hist, 
@@ -151,6 +168,42 @@ class IconicRegistration(object):
                            self._similarity_func)
 
 
+    def eval_gradient(self, T):
+        """
+        Gradient of the similarity with respect to the parameters of
+        the affine transformation T, from the derivatives of the
+        partial volume joint histogram. 
+
+        Returns None where the gradient is not available, see
+        `has_gradient`.
+        """
+        if not self.has_gradient(T): 
+            return None
+        Tv = self.voxel_transform(T)
+        _joint_histogram(self._joint_hist, 
+                         self._source.flat, 
+                         self._target, 
+                         Tv,
+                         1,
+                         self._interp, 
+                         self.n_threads)
+        dH = similarity_gradient(self._joint_hist, self.similarity)[1]
+        G = np.zeros(12)
+        _joint_histogram_gradient(G, dH, self._source.flat, self._target, Tv)
+        G = G.reshape(3, 4)
+        return np.array([(G*self.voxel_transform(dTk)[0:3]).sum() 
+                         for dTk in T.matrix_gradient()])
+
+    def has_gradient(self, T): 
+        """
+        Whether `eval_gradient` is available: for affine
+        transformations, partial volume interpolation and the
+        similarity measures handled by `similarity_gradient`.
+        """
+        return not isinstance(T, GridTransform) \
+            and self._interp == interp_methods['pv'] \
+            and self.similarity in _GRADIENT_SIMILARITIES 
+
     def optimize(self, start, method=_OPTIMIZER, **kwargs):
 
         T = start
@@ -160,6 +213,10 @@ class IconicRegistration(object):
         def loss(tc):
             T.param = tc
             return -self.eval(T) 
+
+        def fprime(tc):
+            T.param = tc
+            return -self.eval_gradient(T) 
     
         def callback(tc):
             T.param = tc
@@ -171,25 +228,11 @@ class IconicRegistration(object):
         # Switching to the appropriate optimizer
         print('Initial guess...')
         print(T)
-        if method=='powell':
-            fmin = fmin_powell
-            kwargs.setdefault('xtol', _XTOL)
-            kwargs.setdefault('ftol', _FTOL)
-        elif method=='steepest':
-            fmin = fmin_steepest
-            kwargs.setdefault('xtol', _XTOL)
-            kwargs.setdefault('ftol', _FTOL)
-            kwargs.setdefault('step', _STEP)
-        elif method=='cg':
-            fmin = fmin_cg
-            kwargs.setdefault('gtol', _GTOL)
-        elif method=='bfgs':
-            fmin = fmin_bfgs
-            kwargs.setdefault('gtol', _GTOL)
-        else: # simplex method 
-            fmin = fmin_simplex 
-            kwargs.setdefault('xtol', _XTOL)
-            kwargs.setdefault('ftol', _FTOL)
+        fmin, defaults = optimizer_function(method)
+        for key in defaults: 
+            kwargs.setdefault(key, defaults[key])
+        if fmin in (fmin_steepest, fmin_cg, fmin_bfgs) and self.has_gradient(T): 
+            kwargs.setdefault('fprime', fprime)
         
         # Output
         print ('Optimizing using %s' % fmin.__name__)
@@ -197,6 +240,107 @@ class IconicRegistration(object):
         return T 
 
 
+    def level(self, factor, bins=None):
+        """
+        Registration of Gaussian-smoothed versions of the source and
+        target images, decimated by `factor` in each direction. The
+        smoothing kernel has standard deviation _PYRAMID_SIGMA*factor
+        voxels. Levels are kept for later calls, and level 1 with
+        default bins is the registration itself.
+
+        Parameters
+        ----------
+        factor : int
+          Decimation factor
+        bins : None, number or sequence of 2 numbers
+          Source and target bins, by default those of the registration.
+        """
+        if bins == None: 
+            bins = self._bins
+        if isinstance (bins, (int, long, float)): 
+            bins = [int(bins), int(bins)]
+        key = (int(factor), tuple(bins))
+        if factor == 1 and list(bins) == list(self._bins): 
+            return self
+        if not self._levels.has_key(key):
+            self._levels[key] = IconicRegistration(
+                decimate(self._source_input, factor), 
+                decimate(self._target_input, factor), 
+                bins=bins, n_threads=self.n_threads)
+        # Settings may have changed since the level was made 
+        R = self._levels[key]
+        R._interp = self._interp
+        R._similarity = self._similarity
+        R._similarity_func = self._similarity_func
+        R._pdf = self._pdf
+        R.n_threads = self.n_threads
+        return R
+
+
+    def optimize_pyramid(self, start, factors=_PYRAMID, method=_OPTIMIZER, 
+                         bins=None, spacing=None, npoints=None, **kwargs):
+        """
+        Coarse-to-fine registration: optimize the transformation on
+        each level of a pyramid of smoothed and decimated images (see
+        `level`), starting each level from the result of the previous
+        one.
+
+        Parameters
+        ----------
+        start : transformation 
+          Initial transformation, updated in place 
+        factors : sequence of int
+          Decimation factors of the levels, from coarse to fine 
+        method : str
+          Optimizer, as in `optimize`
+        bins : None or sequence 
+          Bins of each level (see `level`)
+        spacing : None or sequence 
+          Source subsampling of each level. A None spacing subsamples
+          the source of a level to `npoints` / factor**3 points. 
+        npoints : None or number
+          Number of source points at the finest resolution, by default
+          that of the registration's source field of view. 
+        kwargs : 
+          Extra optimizer arguments. The default tolerances ('xtol',
+          'ftol', 'gtol') of the optimizer are multiplied by the
+          decimation factor. Tolerances may be given as sequences of
+          per-level values.
+
+        Returns
+        -------
+        T : transformation 
+        """
+        if npoints == None: 
+            npoints = self._source_npoints
+        nlevels = len(factors)
+        if bins == None: 
+            bins = [None] * nlevels
+        if spacing == None: 
+            spacing = [None] * nlevels 
+        defaults = optimizer_function(method)[1]
+        T = start 
+        for i in range(nlevels): 
+            f = factors[i]
+            R = self.level(f, bins[i])
+            if not spacing[i] == None: 
+                R.set_source_fov(spacing=spacing[i])
+            elif not R is self: 
+                R.set_source_fov(fixed_npoints=npoints/float(f**3))
+            level_kwargs = {}
+            for key in kwargs: 
+                level_kwargs[key] = kwargs[key]
+                if key in ('xtol', 'ftol', 'gtol') \
+                        and isinstance(kwargs[key], (list, tuple)): 
+                    level_kwargs[key] = kwargs[key][i]
+            for key in ('xtol', 'ftol', 'gtol'): 
+                if defaults.has_key(key): 
+                    level_kwargs.setdefault(key, f*defaults[key])
+            print('Pyramid level %d: decimation factor %d' % (i, f))
+            T = R.optimize(T, method=method, **level_kwargs)
+        return T
+
+
     def explore(self, T0, *args): 
     
         """
@@ -230,6 +374,149 @@ class IconicRegistration(object):
 
 
 
+def optimizer_function(method=_OPTIMIZER): 
+    """
+    Return the minimization function for an optimizer name, and a
+    dictionary of its default arguments. 
+    """
+    if method=='powell':
+        return fmin_powell, {'xtol': _XTOL, 'ftol': _FTOL}
+    elif method=='steepest':
+        return fmin_steepest, {'xtol': _XTOL, 'ftol': _FTOL, 'step': _STEP}
+    elif method=='cg':
+        return fmin_cg, {'gtol': _GTOL}
+    elif method=='bfgs':
+        return fmin_bfgs, {'gtol': _GTOL}
+    else: # simplex method 
+        return fmin_simplex, {'xtol': _XTOL, 'ftol': _FTOL}
+
+
+def _entropy_gradient(h): 
+    """
+    Entropy of the histogram h and its derivatives with respect to
+    the entries of h
+    """
+    n = h.sum()
+    if n <= 0: 
+        return 0.0, np.zeros(h.shape)
+    logq = np.log(np.maximum(h/n, _TINY))
+    E = -(h*logq).sum()/n
+    return E, -(logq+E)/n
+
+
+def _correlation_gradient(H, ratio=False): 
+    """
+    Correlation coefficient, or correlation ratio of the source given
+    the target, of the joint histogram H and its derivatives with
+    respect to the entries of H
+    """
+    zero = 0.0, np.zeros(H.shape)
+    n = H.sum()
+    if n <= 0: 
+        return zero 
+    i = np.arange(H.shape[0])[:, np.newaxis]
+    j = np.arange(H.shape[1])
+    di = i - (H*i).sum()/n
+    vi = (H*di**2).sum()/n
+    if ratio: 
+        # Conditional variance, from the deviations to the mean of
+        # each target bin (a voxel entering an empty bin is its mean)
+        nJ = H.sum(0)
+        mJ = (H*i).sum(0)/np.maximum(nJ, _TINY)
+        dw = (i-mJ)**2 * (nJ > 0)
+        cvar = (H*dw).sum()/n
+        if vi <= 0: 
+            return zero 
+        S = 1 - cvar/vi
+        dS = -((dw-cvar)*vi - cvar*(di**2-vi))/(n*vi**2)
+    else: 
+        dj = j - (H*j).sum()/n
+        vj = (H*dj**2).sum()/n
+        cov = (H*di*dj).sum()/n
+        if vi*vj <= 0: 
+            return zero
+        S = cov**2/(vi*vj)
+        dS = (2*cov*(di*dj-cov)/(vi*vj) - S*((di**2-vi)/vi + (dj**2-vj)/vj))/n
+    return S, dS
+
+
+def similarity_gradient(H, similarity): 
+    """
+    Value of a built-in similarity measure of the joint histogram H,
+    and its derivatives with respect to the entries of H. 
+
+    Parameters
+    ----------
+    H : ndarray 
+      Joint histogram, source bins along the first axis 
+    similarity : str
+      One of 'cc', 'cr', 'mi', 'nmi', 'je', 'ce', 'llr_cc', 'llr_cr',
+      'llr_mi' 
+
+    Returns
+    -------
+    S : float 
+    dS : ndarray, same shape as H
+    """
+    n = H.sum()
+    if similarity in ('cc', 'cr', 'llr_cc', 'llr_cr'): 
+        S, dS = _correlation_gradient(H, ratio=similarity.endswith('cr'))
+        if similarity.startswith('llr'): 
+            y = max(1-S, _TINY)
+            return -.5*n*np.log(y), -.5*np.log(y) + .5*n*dS/y
+        return S, dS
+    EIJ, dEIJ = _entropy_gradient(H)
+    if similarity == 'je': 
+        return EIJ, dEIJ
+    EJ, dEJ = _entropy_gradient(H.sum(0))
+    if similarity == 'ce': 
+        return EIJ-EJ, dEIJ-dEJ 
+    EI, dEI = _entropy_gradient(H.sum(1))
+    dEI = dEI[:, np.newaxis]
+    if similarity == 'nmi': 
+        aux = EI + EJ 
+        if aux <= 0: 
+            return 0.0, np.zeros(H.shape)
+        return 2*(1-EIJ/aux), -2*(dEIJ*aux - EIJ*(dEI+dEJ))/aux**2
+    MI, dMI = EI+EJ-EIJ, dEI+dEJ-dEIJ
+    if similarity == 'llr_mi': 
+        return n*MI, MI+n*dMI
+    if similarity == 'mi': 
+        return MI, dMI
+    raise ValueError('No gradient for similarity %s' % similarity)
+
+
+_GRADIENT_SIMILARITIES = ('cc', 'cr', 'mi', 'nmi', 'je', 'ce', 
+                          'llr_cc', 'llr_cr', 'llr_mi')
+
+
+def decimate(image, factor, sigma=_PYRAMID_SIGMA): 
+    """
+    Smooth an image with a Gaussian kernel of standard deviation
+    sigma*factor voxels, and keep every factor-th voxel in each
+    direction.
+
+    Parameters
+    ----------
+    image : Image 
+    factor : int
+      Decimation factor
+    sigma : float 
+      Kernel standard deviation, in decimation factor units
+
+    Returns
+    -------
+    decimated : Image 
+      The decimated image, with the corresponding affine 
+    """
+    factor = int(factor)
+    if factor == 1: 
+        return image
+    data = gaussian_filter(np.asarray(image.data, dtype='double'), 
+                           sigma*factor)
+    return Image(data, image.affine, world=image.world)[(slice(0, None, factor),)*3]
+
+
 def clamp(x, bins=256):
     """ 
     Clamp array values that fall within a given mask in the range
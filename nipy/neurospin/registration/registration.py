@@ -20,7 +20,9 @@ def register(source,
              subsampling=None,
              search='affine',
              graduate_search=False,
-             optimizer='powell'):
+             optimizer='powell',
+             pyramid=None,
+             n_threads=1):
     
     """
     Three-dimensional affine image registration. 
@@ -56,6 +58,13 @@ def register(source,
        run several optimizers sequentially. If bot `search` and
        `optimizer` are sequences, then the shorter is filled with its
        last value to match the longer. 
+    pyramid : None or sequence of int
+       Decimation factors of a coarse-to-fine registration, e.g. (4,
+       2, 1): each search is first optimized on Gaussian-smoothed and
+       decimated images, then refined at the next level. None
+       (default) registers at a single resolution. 
+    n_threads : int
+       Number of threads computing the joint histogram of the images. 
 
     Returns
     -------
@@ -63,7 +72,7 @@ def register(source,
         Object that can be casted to a numpy array. 
 
     """
-    R = IconicRegistration(Image(source), Image(target))
+    R = IconicRegistration(Image(source), Image(target), n_threads=n_threads)
     if subsampling == None: 
         R.set_source_fov(fixed_npoints=64**3)
     else:
@@ -84,7 +93,10 @@ def register(source,
             T = transform_classes[search_]()
         else: 
             T = transform_classes[search_](T.vec12)
-        T = R.optimize(T, method=optimizer_)
+        if pyramid == None: 
+            T = R.optimize(T, method=optimizer_)
+        else:
+            T = R.optimize_pyramid(T, factors=pyramid, method=optimizer_)
     return T
 
 
@@ -112,12 +124,26 @@ class FmriRealign4d(object):
                               interleaved=interleaved) for im in images]
         self._transforms = [None for run in self._runs]
                       
-    def correct_motion(self, iterations=2, between_loops=None, align_runs=True): 
+    def correct_motion(self, iterations=2, between_loops=None, align_runs=True, 
+                       n_jobs=1, dtype='double', block_size=None): 
+        """
+        Estimate the motion of each scan. If n_jobs is greater than
+        one, the scans of a run are corrected concurrently by n_jobs
+        processes at each iteration, against a reference that is fixed
+        during the iteration. None means as many processes as CPUs.
+        The processes are forked, so where fork is not available
+        (Windows) the scans are corrected in turn in this process.
+
+        The cubic spline coefficients of the runs are stored with the
+        given dtype, and, if block_size is not None, only for blocks of
+        block_size scans at a time, to save memory on long runs.
+        """
         within_loops = iterations 
         if between_loops == None: 
             between_loops = 3*within_loops 
         t = realign4d(self._runs, within_loops=within_loops, 
-                      between_loops=between_loops, align_runs=align_runs)
+                      between_loops=between_loops, align_runs=align_runs, 
+                      n_jobs=n_jobs, dtype=dtype, block_size=block_size)
         self._transforms, self._within_run_transforms, self._mean_transforms = t
 
     def resample(self, align_runs=True): 
@@ -4,9 +4,12 @@ from constants import _OPTIMIZER, _XTOL, _FTOL, _GTOL, _STEP
 from affine import Rigid
 
 from nipy.neurospin.image import apply_affine
-from nipy.neurospin.image._image import cspline_transform, cspline_sample4d
+from nipy.neurospin.image._image import cspline_transform, cspline_transform_axis, \
+    cspline_sample4d, cspline_sample4d_grad
 from nipy.neurospin.utils.optimize import fmin_steepest
 
+import os
+
 import numpy as np
 from scipy.optimize import fmin as fmin_simplex, fmin_powell, fmin_cg, fmin_bfgs
 
@@ -17,6 +20,8 @@ _SLICE_AXIS = 2
 _SPEEDUP = 4
 _WITHIN_LOOPS = 2
 _BETWEEN_LOOPS = 5 
+_SPLINE_DTYPE = 'double'
+_SPLINE_MARGIN = 16 
 
 
 def interp_slice_order(Z, slice_order): 
@@ -117,13 +122,102 @@ class Image4d(object):
 
 
 
+class CSpline4d(object):
+    """
+    Cubic spline coefficients of a 4d array, for sampling along the
+    last (time) axis one window of time points at a time. 
+
+    The coefficients are stored with the given dtype, either for the
+    whole array, or for blocks of block_size time points at a
+    time. The coefficients of a block are computed from the block
+    extended by `margin` time points on each side, which approximates
+    those of the whole array to a relative precision of about
+    0.27**margin (the magnitude of the pole of the spline filter).
+
+    The array is prefiltered one volume and one slab of time series
+    at a time, so the only double precision copies of the data are
+    those of the windows handed to the sampling functions.
+    """
+    def __init__(self, array, dtype=_SPLINE_DTYPE, block_size=None, 
+                 margin=_SPLINE_MARGIN): 
+        self.array = array 
+        self.shape = array.shape
+        self.dtype = np.dtype(dtype)
+        self.block_size = block_size
+        self.margin = margin
+        self._window = None 
+        if block_size == None: 
+            if self.dtype == np.double: 
+                coef = cspline_transform(array)
+            else: 
+                coef = self._coefficients(0, self.shape[3])
+            self._block = (0, self.shape[3], coef)
+        else: 
+            self._block = None 
+
+    def _coefficients(self, t0, t1): 
+        """
+        Coefficients of time points t0 to t1-1
+        """
+        nt = self.shape[3]
+        e0 = max(t0 - self.margin, 0)
+        e1 = min(t1 + self.margin, nt)
+        coef = np.zeros(self.shape[0:3] + (t1-t0,), dtype=self.dtype)
+        # Temporal filter, one slab at a time 
+        for x in range(self.shape[0]): 
+            slab = np.array(self.array[x, :, :, e0:e1], dtype='double')
+            cspline_transform_axis(slab, 2)
+            coef[x] = slab[:, :, t0-e0:t1-e0]
+        # Spatial filter, one volume at a time 
+        for t in range(t1-t0): 
+            vol = np.array(coef[:, :, :, t], dtype='double')
+            for axis in range(3): 
+                cspline_transform_axis(vol, axis)
+            coef[:, :, :, t] = vol
+        return coef 
+
+    def window(self, tmin, tmax): 
+        """
+        t0, coef = window(tmin, tmax)
+
+        Double coefficients of time points t0, t0+1, ..., from which
+        cspline_sample4d yields the same values at times T - t0 as
+        the coefficients of the whole array at times T, for any T in
+        [tmin, tmax].
+        """
+        nt = self.shape[3]
+        # Spline support, with mirror conditions at both ends 
+        lo = int(np.floor(tmin)) - 1
+        hi = int(np.floor(tmax)) + 2
+        a = max(lo, 0)
+        b = min(hi, nt-1)
+        if lo < 0: 
+            b = max(b, min(-lo, nt-1))
+        if hi > nt-1: 
+            a = min(a, max(2*(nt-1)-hi, 0))
+        if not self._window == None: 
+            w0, w1, coef = self._window
+            if w0 <= a and b < w1: 
+                return w0, coef
+        # Coefficients of the current block 
+        if self._block == None or a < self._block[0] or b >= self._block[1]: 
+            t1 = min(max(b+1, a+self.block_size), nt)
+            self._block = (a, t1, self._coefficients(a, t1))
+        c0, c1, coef = self._block
+        coef = np.asarray(coef[:, :, :, a-c0:b+1-c0], dtype='double')
+        self._window = (a, b+1, coef)
+        return a, coef 
+
+
 class Realign4d(object):
 
     def __init__(self, 
                  im4d, 
                  speedup=_SPEEDUP,
                  optimizer=_OPTIMIZER, 
-                 transforms=None):
+                 transforms=None, 
+                 dtype=_SPLINE_DTYPE, 
+                 block_size=None):
         self.optimizer = optimizer
         dims = im4d.array.shape
         self.dims = dims 
@@ -145,20 +239,25 @@ class Realign4d(object):
         self.from_time = im4d.from_time
         self.timestamps = im4d.tr*np.arange(self.nscans)
         # Compute the 4d cubic spline transform
-        self.cbspline = cspline_transform(im4d.array)
+        self.cbspline = CSpline4d(im4d.array, dtype=dtype, block_size=block_size)
+        # Running sums of the resampled scans (see init_motion_detection)
+        self._sum = None
+        self._sum2 = None
+        self._moving = None
               
     def resample_inmask(self, t):
         X, Y, Z = grid_coords(self.xyz, self.transforms[t], 
                               self.from_world, self.to_world)
         T = self.from_time(Z, self.timestamps[t])
-        cspline_sample4d(self.data[:,t], self.cbspline, X, Y, Z, T)
+        t0, C = self.cbspline.window(T.min(), T.max())
+        cspline_sample4d(self.data[:,t], C, X, Y, Z, T-t0)
 
     def resample_all_inmask(self):
         for t in range(self.nscans):
             print('Resampling scan %d/%d' % (t+1, self.nscans))
             self.resample_inmask(t)
 
-    def init_motion_detection(self, t):
+    def init_motion_detection(self, t, fixed_reference=False):
         """
         The idea is to compute the global variance using the following
         decomposition:
@@ -170,15 +269,42 @@ class Realign4d(object):
         
         Only the second term is variable when one image moves while
         all other images are fixed.
+
+        m1 and V1 are obtained from running sums of the scans and
+        of their squares, in O(1) operations per voxel rather than
+        O(nscans). Unless fixed_reference is True, the sums are first
+        updated with the scan that was moving previously, so that each
+        scan is registered to the others as corrected so far. With
+        fixed_reference, the other scans are taken as resampled by
+        `init_sums`, so that scans may be corrected in any order.
         """
+        if self._sum is None: 
+            self.init_sums()
+        if not fixed_reference and self._moving is not None: 
+            x = self.data[:, self._moving]
+            self._sum += x
+            self._sum2 += x**2
+        x = self.data[:, t]
+        s = self._sum - x
+        s2 = self._sum2 - x**2
+        if not fixed_reference: 
+            self._sum, self._sum2, self._moving = s, s2, t
+        n1 = self.nscans - 1.0
+        self.m1 = s/n1
+        var = s2/n1 - self.m1**2
         self.resample_inmask(t)
-        fixed = range(self.nscans)
-        fixed.remove(t)
-        aux = self.data[:, fixed]
-        self.m1 = aux.mean(1)
         self.d2 = np.zeros(np.shape(self.m1))
-        self.alpha = ((self.nscans-1.0)/self.nscans)*aux.var(1).mean()
-        self.beta = (self.nscans-1.0)/self.nscans**2
+        self.alpha = (n1/self.nscans)*var.mean()
+        self.beta = n1/self.nscans**2
+
+    def init_sums(self):
+        """
+        Reset the running sums to the sums over all scans of the
+        resampled data and of its square.
+        """
+        self._sum = self.data.sum(1)
+        self._sum2 = (self.data**2).sum(1)
+        self._moving = None
             
     def msid(self, t):
         """
@@ -190,6 +316,34 @@ class Realign4d(object):
         self.d2 **= 2
         return self.d2.mean()
 
+    def msid_gradient(self, t):
+        """
+        Gradient of the mean square intensity difference with respect
+        to the motion parameters of scan t, obtained from the
+        derivatives of the cubic spline signal. Resamples scan t as
+        msid does.
+        """
+        T = self.transforms[t]
+        X, Y, Z = grid_coords(self.xyz, T, self.from_world, self.to_world)
+        ts = self.timestamps[t]
+        Tt = self.from_time(Z, ts)
+        x = self.data[:,t]
+        DX, DY, DZ, DT = [np.zeros(x.shape) for i in range(4)]
+        t0, C = self.cbspline.window(Tt.min(), Tt.max())
+        cspline_sample4d_grad(x, DX, DY, DZ, DT, C, X, Y, Z, Tt-t0)
+        # Acquisition time varies with z (slice timing) 
+        dz = 1e-3
+        DZ += DT*(self.from_time(Z+dz, ts) - self.from_time(Z-dz, ts))/(2*dz)
+        # Gradient with respect to the voxel transformation 
+        u = (2./x.size)*(x - self.m1)
+        xyz1 = np.ones([x.size, 4])
+        xyz1[:,0:3] = self.xyz
+        G = np.dot(np.array([u*DX, u*DY, u*DZ]), xyz1)
+        dT = T.matrix_gradient()
+        return np.array([(G*np.dot(self.from_world, 
+                                   np.dot(dTk, self.to_world))[0:3]).sum() 
+                         for dTk in dT])
+
     def variance(self, t): 
         return self.alpha + self.beta*self.msid(t)
 
@@ -204,13 +358,23 @@ class Realign4d(object):
         self.m2 -= self.m
         return self.m2.mean()
 
-    def correct_motion(self):
+    def correct_motion(self, n_jobs=1):
+        """
+        Optimize the motion parameters of each scan in turn. 
+
+        Parameters
+        ----------
+        n_jobs : int or None
+          Number of processes. If greater than one, the scans are
+          corrected concurrently, each against the other scans as
+          resampled at the beginning of the call (see
+          `init_motion_detection`). None means as many processes as
+          CPUs. The processes are forked, so where fork is not
+          available (Windows) the scans are corrected in turn in this
+          process.
+        """
         optimizer = self.optimizer
 
-        def callback(pc):
-            self.transforms[t].param = pc
-            print(self.transforms[t])
-
         if optimizer=='powell':
             tols = {'xtol': _XTOL, 'ftol': _FTOL}
             fmin = fmin_powell
@@ -229,16 +393,29 @@ class Realign4d(object):
 
         # Resample data according to the current space/time transformation 
         self.resample_all_inmask()
+        self.init_sums()
 
         # Optimize motion parameters 
-        for t in range(self.nscans):
-            print('Correcting motion of scan %d/%d...' % (t+1, self.nscans))
-            def loss(pc):
-                self.transforms[t].param = pc
-                return self.msid(t)
-            self.init_motion_detection(t)
-            self.transforms[t].param = fmin(loss, self.transforms[t].param,
-                                            callback=callback, **tols)
+        if n_jobs == None: 
+            import multiprocessing
+            n_jobs = multiprocessing.cpu_count()
+        n_jobs = min(n_jobs, self.nscans)
+        if not hasattr(os, 'fork'):
+            n_jobs = 1
+        if n_jobs <= 1: 
+            for t in range(self.nscans):
+                self.transforms[t].param = self.correct_scan(t, fmin, tols)
+        else:
+            import multiprocessing
+            pool = multiprocessing.Pool(n_jobs, _realign_init,
+                                        (self, fmin, tols))
+            try:
+                params = pool.map(_correct_scan_worker, range(self.nscans))
+            finally:
+                pool.terminate()
+                pool.join()
+            for t in range(self.nscans):
+                self.transforms[t].param = params[t]
 
         # At this stage, transforms map an implicit 'ideal' grid to
         # the 'acquisition' grid. We redefine the ideal grid as being
@@ -249,49 +426,141 @@ class Realign4d(object):
         
 
 
-    def resample(self):
+    def correct_scan(self, t, fmin, tols, fixed_reference=False):
+        """
+        Return the motion parameters of scan t minimizing the mean
+        square difference with the other scans, using the optimizer
+        fmin with keyword arguments tols.
+        """
+        print('Correcting motion of scan %d/%d...' % (t+1, self.nscans))
+
+        def callback(pc):
+            self.transforms[t].param = pc
+            print(self.transforms[t])
+
+        def loss(pc):
+            self.transforms[t].param = pc
+            return self.msid(t)
+
+        def fprime(pc):
+            self.transforms[t].param = pc
+            return self.msid_gradient(t)
+
+        kwargs = dict(tols)
+        if fmin in (fmin_steepest, fmin_cg, fmin_bfgs): 
+            kwargs['fprime'] = fprime
+        self.init_motion_detection(t, fixed_reference)
+        return fmin(loss, self.transforms[t].param, callback=callback, **kwargs)
+
+    def resample(self, out=None):
+        """
+        Resample the 4d image, one scan at a time. 
+
+        Parameters
+        ----------
+        out : None or array-like
+          4d output, written one scan at a time as out[:,:,:,t], for
+          instance a numpy memmap, or a
+          nipy.io.imageformats.memmapwriter.Nifti1MemmapWriter to
+          stream the scans to an image file. By default, a double
+          array is allocated.
+
+        Returns
+        -------
+        out : the resampled 4d image
+        """
+        if out is None: 
+            out = np.zeros(self.dims)
+        for t, vol in self._resampled_scans(): 
+            out[:,:,:,t] = vol
+        return out
+
+    def resample_mean(self): 
+        """
+        Mean of the resampled scans, accumulated one scan at a time 
+        """
+        mean = np.zeros(self.dims[0:3])
+        for t, vol in self._resampled_scans(): 
+            mean += vol
+        return mean/self.nscans 
+
+    def _resampled_scans(self): 
+        """
+        Generate t, vol for each resampled scan, vol being a buffer
+        reused from one scan to the next
+        """
         print('Gridding...')
         dims = self.dims
         XYZ = np.mgrid[0:dims[0], 0:dims[1], 0:dims[2]]
         XYZ = np.rollaxis(XYZ, 0, 4)
         XYZ = np.reshape(XYZ, [np.prod(XYZ.shape[0:-1]), 3])
-        res = np.zeros(dims)
+        vol = np.zeros(dims[0:3])
         for t in range(self.nscans):
             print('Fully resampling scan %d/%d' % (t+1, self.nscans))
             X, Y, Z = grid_coords(XYZ, self.transforms[t], 
                                   self.from_world, self.to_world)
             T = self.from_time(Z, self.timestamps[t])
-            cspline_sample4d(res[:,:,:,t], self.cbspline, X, Y, Z, T)
-        return res
+            t0, C = self.cbspline.window(T.min(), T.max())
+            cspline_sample4d(vol, C, X, Y, Z, T-t0)
+            yield t, vol
     
 
 
 
+# (realignment, fmin, tols) of the motion correction in progress, set in
+# each worker process of `Realign4d.correct_motion` by _realign_init
+_realign_state = None
+
+
+def _realign_init(r, fmin, tols):
+    """
+    Worker process initializer: keep the realignment in progress
+    """
+    global _realign_state
+    _realign_state = (r, fmin, tols)
 
-def resample4d(im4d, transforms=None): 
+
+def _correct_scan_worker(t):
     """
-    corr_im4d_array = resample4d(im4d, transforms=None)
+    Correct the motion of scan t in the realignment in progress
     """
-    r = Realign4d(im4d, transforms=transforms)
-    return r.resample()
+    r, fmin, tols = _realign_state
+    return r.correct_scan(t, fmin, tols, fixed_reference=True)
+
+
+def resample4d(im4d, transforms=None, out=None, dtype=_SPLINE_DTYPE, 
+               block_size=None): 
+    """
+    corr_im4d_array = resample4d(im4d, transforms=None, out=None)
+
+    See `Realign4d.resample` for `out` and `CSpline4d` for `dtype` and
+    `block_size`. 
+    """
+    r = Realign4d(im4d, transforms=transforms, dtype=dtype, 
+                  block_size=block_size)
+    return r.resample(out=out)
 
 
 
 def _realign4d(im4d, 
                loops=_WITHIN_LOOPS, 
                speedup=_SPEEDUP, 
-               optimizer=_OPTIMIZER): 
+               optimizer=_OPTIMIZER, 
+               n_jobs=1, 
+               dtype=_SPLINE_DTYPE, 
+               block_size=None): 
     """
-    transforms = _realign4d(im4d, loops=2, speedup=4, optimizer='powell')
+    transforms = _realign4d(im4d, loops=2, speedup=4, optimizer='powell', n_jobs=1)
 
     Parameters
     ----------
     im4d : Image4d instance
 
     """ 
-    r = Realign4d(im4d, speedup=speedup, optimizer=optimizer)
+    r = Realign4d(im4d, speedup=speedup, optimizer=optimizer, 
+                  dtype=dtype, block_size=block_size)
     for loop in range(loops): 
-        r.correct_motion()
+        r.correct_motion(n_jobs=n_jobs)
     return r.transforms
 
 def realign4d(runs, 
@@ -299,13 +568,26 @@ def realign4d(runs,
               between_loops=_BETWEEN_LOOPS, 
               speedup=_SPEEDUP, 
               optimizer=_OPTIMIZER, 
-              align_runs=True): 
+              align_runs=True, 
+              n_jobs=1, 
+              dtype=_SPLINE_DTYPE, 
+              block_size=None): 
     """
 
     Parameters
     ----------
 
     runs : list of Image4d objects
+
+    n_jobs : int or None
+             number of processes correcting the motion of the scans of
+             a run concurrently (see `Realign4d.correct_motion`)
+
+    dtype : dtype of the cubic spline coefficients (see `CSpline4d`)
+
+    block_size : None or int 
+                 if not None, the cubic spline coefficients are only
+                 stored for blocks of block_size scans (see `CSpline4d`)
     
     Returns
     -------
@@ -326,19 +608,24 @@ def realign4d(runs,
         align_runs = False
 
     # Correct motion and slice timing in each sequence separately
-    transforms = [_realign4d(run, loops=within_loops, 
-                             speedup=speedup, optimizer=optimizer) for run in runs]
+    transforms = [_realign4d(run, loops=within_loops, speedup=speedup, 
+                             optimizer=optimizer, n_jobs=n_jobs, dtype=dtype, 
+                             block_size=block_size) for run in runs]
     if not align_runs: 
         return transforms, transforms, None
 
     # Correct between-session motion using the mean image of each corrected run 
-    corr_runs = [resample4d(runs[i], transforms=transforms[i]) for i in range(nruns)]
-    aux = np.rollaxis(np.asarray([c.mean(3) for c in corr_runs]), 0, 4)
+    aux = np.zeros(runs[0].array.shape[0:3] + (nruns,))
+    for i in range(nruns): 
+        r = Realign4d(runs[i], transforms=transforms[i], dtype=dtype, 
+                      block_size=block_size)
+        aux[:,:,:,i] = r.resample_mean()
     ## Fake time series with zero inter-slice time 
     ## FIXME: check that all runs have the same to-world transform
     mean_img = Image4d(aux, to_world=runs[0].to_world, tr=1.0, tr_slices=0.0) 
     transfo_mean = _realign4d(mean_img, loops=between_loops, speedup=speedup, 
-                              optimizer=optimizer)
+                              optimizer=optimizer, n_jobs=n_jobs, dtype=dtype, 
+                              block_size=block_size)
 
     # Compose transformations for each run
     ctransforms = [None for i in range(nruns)]
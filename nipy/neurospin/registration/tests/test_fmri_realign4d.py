@@ -3,11 +3,14 @@
 
 from nose.tools import assert_equal
 
-from numpy.testing import assert_array_almost_equal
+import numpy as np
+from numpy.testing import assert_array_almost_equal, assert_almost_equal
 
 from nipy.io.imageformats import load
 from nipy.testing import funcfile
 from nipy.neurospin.registration import Image4d, resample4d
+from nipy.neurospin.registration.spacetime_registration import Realign4d, CSpline4d
+from nipy.neurospin.image._image import cspline_transform, cspline_sample4d
 
 
 im = load(funcfile) 
@@ -35,3 +38,80 @@ def test_slice_timing():
     im4d = Image4d(im.get_data(), im.get_affine(), tr=2., tr_slices=0.0)
     x = resample4d(im4d)
     assert_array_almost_equal(im4d.array, x)
+
+
+def test_running_sums():
+    im4d = Image4d(im.get_data(), im.get_affine(), tr=2.)
+    r = Realign4d(im4d, speedup=4)
+    r.resample_all_inmask()
+    for t in (0, 3, 7): 
+        r.init_motion_detection(t)
+        # move the scan, as during its correction 
+        r.transforms[t].param = r.transforms[t].param + .1
+        r.msid(t)
+        fixed = range(r.nscans)
+        fixed.remove(t)
+        aux = r.data[:, fixed]
+        assert_array_almost_equal(r.m1, aux.mean(1))
+        assert_almost_equal(r.alpha, (r.nscans-1.)/r.nscans*aux.var(1).mean())
+
+
+def test_msid_gradient():
+    im4d = Image4d(im.get_data(), im.get_affine(), tr=2., interleaved=True)
+    r = Realign4d(im4d, speedup=4)
+    r.resample_all_inmask()
+    t = 5
+    r.init_motion_detection(t)
+    T = r.transforms[t]
+    T.param = np.array([.3, -.2, .5, 1., -.5, .7])
+    p0 = T.param
+    g = r.msid_gradient(t)
+    h = 1e-4
+    for k in range(p0.size): 
+        dp = np.zeros(p0.size)
+        dp[k] = h
+        T.param = p0 + dp
+        fp = r.msid(t)
+        T.param = p0 - dp
+        fm = r.msid(t)
+        assert_almost_equal(g[k]/abs(g).max(), (fp-fm)/(2*h)/abs(g).max())
+
+
+def test_correct_motion_n_jobs():
+    im4d = Image4d(im.get_data(), im.get_affine(), tr=2.)
+    params = []
+    for n_jobs in (2, 3): 
+        r = Realign4d(im4d, speedup=5)
+        r.correct_motion(n_jobs=n_jobs)
+        params.append(np.array([T.param for T in r.transforms]))
+    assert_array_almost_equal(params[0], params[1])
+
+
+def test_cspline_blocks():
+    im4d = Image4d(im.get_data(), im.get_affine(), tr=2., interleaved=True)
+    nt = im4d.array.shape[3]
+    C = cspline_transform(im4d.array)
+    scale = abs(C).max()
+    for dtype, block_size in (('double', None), ('double', 4), ('float32', None), 
+                              ('float32', 5)): 
+        c = CSpline4d(im4d.array, dtype=dtype, block_size=block_size)
+        for tmin, tmax in ((-.5, .3), (2.2, 4.9), (nt-1.5, nt-.2), (0, nt-1)): 
+            t0, C0 = c.window(tmin, tmax)
+            T = np.linspace(tmin, tmax, 7)
+            X = np.ones(7)
+            x, x0 = np.zeros(7), np.zeros(7)
+            cspline_sample4d(x, C, X, X, X, T)
+            cspline_sample4d(x0, C0, X, X, X, T-t0)
+            assert_array_almost_equal(x/scale, x0/scale)
+
+
+def test_resample_out():
+    im4d = Image4d(im.get_data(), im.get_affine(), tr=2., interleaved=True)
+    r = Realign4d(im4d, dtype='float32', block_size=6)
+    for t in range(r.nscans): 
+        r.transforms[t].param = .1*t*np.ones(6)
+    x = r.resample()
+    out = np.zeros(x.shape, dtype='float32')
+    assert r.resample(out=out) is out
+    assert_array_almost_equal(out/abs(x).max(), x/abs(x).max())
+    assert_array_almost_equal(r.resample_mean(), x.mean(3))
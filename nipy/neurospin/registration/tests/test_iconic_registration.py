@@ -2,9 +2,12 @@
 
 from nipy.testing import assert_equal, assert_almost_equal, assert_raises
 import numpy as np
+from scipy.ndimage import gaussian_filter
 
 from nipy.neurospin.image import Image 
 from nipy.neurospin.registration import IconicRegistration, Affine
+from nipy.neurospin.registration.iconic_registration import decimate, \
+    similarity_gradient
 
 dummy_affine = np.eye(4)
 
@@ -85,6 +88,95 @@ def test_iconic():
     regie = IconicRegistration(I, J)
     assert_raises(ValueError, regie.set_source_fov, spacing=[0,1,3])
 
+def test_decimate():
+    I = Image(make_data_float64(20, 21, 22), np.diag([2, 3, 4, 1]))
+    D = decimate(I, 4)
+    assert_equal(D.shape, (5, 6, 6))
+    assert_equal(D.affine, np.diag([8, 12, 16, 1]))
+    assert_equal(decimate(I, 1) is I, True)
+
+def test_pyramid():
+    I = Image(make_data_int16(40, 40, 40), dummy_affine)
+    J = Image(I.data.copy(), dummy_affine)
+    regie = IconicRegistration(I, J)
+    assert_equal(regie.level(1) is regie, True)
+    R2 = regie.level(2)
+    assert_equal(R2._source.shape, (20, 20, 20))
+    assert_equal(regie.level(2) is R2, True)
+    assert_equal(regie.level(2, bins=64)._joint_hist.shape, (64, 64))
+    T = regie.optimize_pyramid(Affine(), factors=(4, 2, 1), 
+                               xtol=[.5, .2, .1], maxiter=2)
+    assert_almost_equal(np.asarray(T), np.eye(4), decimal=1)
+
+def test_pyramid_settings():
+    # levels follow changes of the registration settings
+    I = Image(make_data_int16(20, 20, 20), dummy_affine)
+    J = Image(I.data.copy(), dummy_affine)
+    regie = IconicRegistration(I, J)
+    regie.similarity = 'cc'
+    regie.interp = 'pv'
+    R2 = regie.level(2)
+    assert_equal((R2.similarity, R2.interp), ('cc', 'pv'))
+    regie.similarity = 'mi'
+    regie.interp = 'tri'
+    regie.n_threads = 2
+    assert_equal(regie.level(2) is R2, True)
+    assert_equal((R2.similarity, R2.interp, R2.n_threads), ('mi', 'tri', 2))
+
+def _joint_hist(I, J, interp, n_threads, spacing=[1,1,1]):
+    regie = IconicRegistration(I, J, n_threads=n_threads)
+    regie.set_source_fov(spacing=spacing)
+    regie.interp = interp
+    T = Affine(np.array([1, 2, -1, .1, -.2, .1, 0, 0, 0, 0, 0, 0]))
+    np.random.seed(0)
+    regie.eval(T)
+    return regie._joint_hist
+
+def test_joint_histogram_threads():
+    I = Image(make_data_int16(60, 70, 50), dummy_affine)
+    J = Image(make_data_int16(60, 70, 50), dummy_affine)
+    for spacing in ([1,1,1], [2,1,3]):
+        for interp in ('tri', 'rand', 'pv'):
+            H1 = _joint_hist(I, J, interp, 1, spacing)
+            H3 = _joint_hist(I, J, interp, 3, spacing)
+            assert_almost_equal(H3.sum(), H1.sum())
+            if interp == 'pv': 
+                assert_almost_equal(H3, H1)
+            else:
+                assert_equal(H3, H1)
+
+def test_similarity_gradient():
+    H = 10*np.random.rand(20, 15)
+    for s in ('cc', 'cr', 'mi', 'nmi', 'je', 'ce', 'llr_cc', 'llr_cr', 'llr_mi'):
+        dS = similarity_gradient(H, s)[1]
+        e = np.zeros(H.shape)
+        e[5, 7] = 1e-6
+        num = similarity_gradient(H+e, s)[0] - similarity_gradient(H-e, s)[0]
+        assert_almost_equal(dS[5, 7]/abs(dS).max(), num/2e-6/abs(dS).max(), 5)
+
+def test_eval_gradient():
+    I = Image(gaussian_filter(make_data_float64(20, 22, 18), 2), dummy_affine)
+    J = Image(I.data**2, dummy_affine)
+    regie = IconicRegistration(I, J, bins=32)
+    T = Affine()
+    T.param = np.array([1.3, -.7, 2.1, 3, -5, 2, 1, -2, 3, 1, 2, -1])
+    p0 = T.param
+    for s in ('cr', 'mi'): 
+        regie.similarity = s
+        g = regie.eval_gradient(T)
+        h = 1e-4
+        for k in range(p0.size): 
+            dp = np.zeros(p0.size)
+            dp[k] = h
+            T.param = p0 + dp
+            fp = regie.eval(T)
+            T.param = p0 - dp
+            fm = regie.eval(T)
+            assert_almost_equal(g[k]/abs(g).max(), (fp-fm)/(2*h)/abs(g).max(), 3)
+        T.param = p0
+    regie.interp = 'tri'
+    assert_equal(regie.eval_gradient(T), None)
+
 if __name__ == "__main__":
         import nose
         nose.run(argv=['', __file__])
@@ -4,6 +4,7 @@ import numpy as np
 import scipy.stats as sp_stats
 
 from nipy.neurospin.graph.field import Field
+from nipy.neurospin.graph.clusters import CSRGraph
 from nipy.neurospin.image import apply_affine
 from nipy.neurospin.utils import emp_null
 from nipy.neurospin.glm import glm
@@ -83,11 +84,12 @@ def cluster_stats(zimg, mask, height_th, height_control='fpr',
     ff = Field(np.size(zmap_th), field=zmap_th)
     ff.from_3d_grid(xyz_th, k=18)
     maxima, depth = ff.get_local_maxima(th=zth)
-    labels = ff.cc()
+    labels = CSRGraph.from_3d_grid(xyz_th, k=18).threshold_labels(zmap_th, -np.inf)
+    sizes = np.bincount(labels)
     ## Make list of clusters, each cluster being a dictionary 
     clusters = []
     for k in range(labels.max() + 1):
-        s = np.sum(labels == k)
+        s = sizes[k]
         if s >= cluster_th:
             in_cluster = labels[maxima] == k
             m = maxima[in_cluster]
@@ -383,7 +385,8 @@ class LinearModel(object):
     def_niter = 2
 
     def __init__(self, data, design_matrix, mask=None, formula=None, 
-                 model=def_model, method=None, niter=def_niter):
+                 model=def_model, method=None, niter=def_niter,
+                 n_threads=None):
 
         # Convert input data and design into sequences
         if not hasattr(data, '__iter__'): 
@@ -418,7 +421,8 @@ class LinearModel(object):
                 
             self.glm.append(glm(Y, X, axis=self.axis, 
                                 formula=formula, model=model, 
-                                method=method, niter=niter))
+                                method=method, niter=niter,
+                                n_threads=n_threads))
                 
 
     def dump(self, filename):
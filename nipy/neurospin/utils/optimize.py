@@ -41,7 +41,7 @@ def fmin_steepest(f, x0, fprime=None, xtol=1e-4, ftol=1e-4,
     if fprime == None:
         grad_calls, myfprime = _wrap(approx_fprime, (f, step))
     else:
-        grad_calls, myfprime = _wrap(fprime, args)
+        grad_calls, myfprime = _wrap(fprime, ())
 
     while it < maxiter:
         it = it + 1